@@ -9,6 +9,21 @@
 #include <stdint.h>
 #include <stddef.h>
 
+/// \brief Smallest implementation, processes a nibble at a time using a 16-entry table (64 bytes).
+#define CRC32_IMPLEMENTATION_NIBBLE 1
+/// \brief Processes a byte at a time using a 256-entry table (1 KB).
+#define CRC32_IMPLEMENTATION_TABLE 2
+/// \brief Processes 4 bytes at a time using four 256-entry tables (4 KB).
+#define CRC32_IMPLEMENTATION_SLICING_BY_4 3
+/// \brief Processes 8 bytes at a time using eight 256-entry tables (8 KB).
+#define CRC32_IMPLEMENTATION_SLICING_BY_8 4
+
+/// \brief The implementation used by crc32_update, selected at compile time (e.g. -DCRC32_IMPLEMENTATION=CRC32_IMPLEMENTATION_SLICING_BY_8).
+/// Selecting an implementation also compiles the smaller table-driven ones, which share its tables.
+#ifndef CRC32_IMPLEMENTATION
+#define CRC32_IMPLEMENTATION CRC32_IMPLEMENTATION_NIBBLE
+#endif
+
 #ifdef __cplusplus
 extern "C" {
 #endif
@@ -29,6 +44,36 @@ void crc32_init(crc32_context_t *ctx);
 /// \param data_length The length of the data block.
 void crc32_update(crc32_context_t *ctx, const uint8_t *data, size_t data_length);
 
+/// \brief Update the CRC32 context with a block of data, a nibble at a time.
+/// \param ctx The CRC32 context to update.
+/// \param data A pointer to the data block.
+/// \param data_length The length of the data block.
+void crc32_update_nibble(crc32_context_t *ctx, const uint8_t *data, size_t data_length);
+
+#if CRC32_IMPLEMENTATION >= CRC32_IMPLEMENTATION_TABLE
+/// \brief Update the CRC32 context with a block of data, a byte at a time.
+/// \param ctx The CRC32 context to update.
+/// \param data A pointer to the data block.
+/// \param data_length The length of the data block.
+void crc32_update_table(crc32_context_t *ctx, const uint8_t *data, size_t data_length);
+#endif
+
+#if CRC32_IMPLEMENTATION >= CRC32_IMPLEMENTATION_SLICING_BY_4
+/// \brief Update the CRC32 context with a block of data, 4 bytes at a time.
+/// \param ctx The CRC32 context to update.
+/// \param data A pointer to the data block.
+/// \param data_length The length of the data block.
+void crc32_update_slicing_by_4(crc32_context_t *ctx, const uint8_t *data, size_t data_length);
+#endif
+
+#if CRC32_IMPLEMENTATION >= CRC32_IMPLEMENTATION_SLICING_BY_8
+/// \brief Update the CRC32 context with a block of data, 8 bytes at a time.
+/// \param ctx The CRC32 context to update.
+/// \param data A pointer to the data block.
+/// \param data_length The length of the data block.
+void crc32_update_slicing_by_8(crc32_context_t *ctx, const uint8_t *data, size_t data_length);
+#endif
+
 
 /// \brief Get the current CRC32 value from the context.
 /// \param ctx The CRC32 context.
@@ -18,6 +18,17 @@
 #define OVERALL_CRC32_BYTES 4
 #define FILE_METADATA_SIZE (HEADER_BYTES + OVERALL_CRC32_BYTES)
 
+// Path index section constants
+#define PATH_INDEX_OFFSET_BYTES 4
+#define PATH_INDEX_SLOT_COUNT_BYTES 4
+#define PATH_INDEX_FLAGS_BYTES 4
+#define PATH_INDEX_SLOT_BYTES 8
+#define PATH_INDEX_EMPTY_SLOT 0xFFFFFFFFu
+#define PATH_INDEX_FLAG_COMPLETE (1u << 0)
+
+// Merkle digest constants
+#define DIGEST_BYTES 4
+
 #define CONCATENATE_INTERNAL(A, B) A ## B
 #define CONCATENATE(A, B) CONCATENATE_INTERNAL(A, B)
 
@@ -53,23 +64,54 @@ void drofs_print_entry(struct drofs_entry_t entry){
 }
 
 bool drofs_verify(const uint8_t * data, size_t data_length){
-    char * header_signature = (char*) &data[0];
+    struct drofs_verify_context_t ctx;
+    if (drofs_verify_begin(&ctx, data, data_length)){
+        drofs_verify_step(&ctx, data_length);
+    }
+    return drofs_verify_end(&ctx);
+}
+
+bool drofs_verify_begin(struct drofs_verify_context_t * ctx, const uint8_t * data, size_t data_length){
+    ctx->data = data;
+    ctx->data_length = data_length;
+    ctx->position = data_length;
+    ctx->expected_crc32 = 0;
+    crc32_init(&ctx->crc32_ctx);
+
     const char * expected_header_signature = "DROFS";
-    if (strncmp(expected_header_signature, header_signature, HEADER_BYTES)!= 0){
+    ctx->valid_header = data_length >= FILE_METADATA_SIZE && strncmp(expected_header_signature, (const char*) &data[0], HEADER_BYTES) == 0;
+    if (!ctx->valid_header){
         //print warning
         printf("different signature\n");
         return false;
     }
 
-    uint32_t expected_crc32 = (uint32_t)(*((uint32_t*)&data[HEADER_BYTES]));
+    memcpy(&ctx->expected_crc32, &data[HEADER_BYTES], OVERALL_CRC32_BYTES);
+    ctx->position = FILE_METADATA_SIZE;
+    return true;
+}
 
-    crc32_context_t crc32_ctx;
-    crc32_init(&crc32_ctx);
-    crc32_update(&crc32_ctx,data + FILE_METADATA_SIZE, data_length - FILE_METADATA_SIZE);
-    uint32_t data_crc = crc32_get(&crc32_ctx);
-    if (data_crc != expected_crc32){
+bool drofs_verify_step(struct drofs_verify_context_t * ctx, size_t max_bytes){
+    size_t remaining = ctx->data_length - ctx->position;
+    size_t length = remaining < max_bytes ? remaining : max_bytes;
+    crc32_update(&ctx->crc32_ctx, ctx->data + ctx->position, length);
+    ctx->position += length;
+    return ctx->position == ctx->data_length;
+}
+
+bool drofs_verify_end(struct drofs_verify_context_t * ctx){
+    if (!ctx->valid_header){
+        return false;
+    }
+    if (ctx->position != ctx->data_length){
+        printf("verification incomplete, checksummed %zu of %zu\n", ctx->position - FILE_METADATA_SIZE, ctx->data_length - FILE_METADATA_SIZE);
+        return false;
+    }
+
+    uint32_t data_crc = crc32_get(&ctx->crc32_ctx);
+    if (data_crc != ctx->expected_crc32){
         //print warning
-        printf("different crc, expected %" PRIx32" actual %" PRIx32" of %d\n", expected_crc32, data_crc,data_length - FILE_METADATA_SIZE);
+        printf("different crc, expected %" PRIx32" actual %" PRIx32" of %zu\n", ctx->expected_crc32, data_crc, ctx->data_length - FILE_METADATA_SIZE);
         return false;
     }
 
@@ -130,9 +172,22 @@ void _read_entry_at_offset(const uint8_t * data, size_t data_length, size_t offs
 
     // Skip metadata data to get to children offsets
     for (size_t i = 0; i < entry->metadata_length; i++) {
+        uint8_t metadata_type = data[offset];
         offset += 1; // Skip metadata type (8-bit)
         uint16_t metadata_length = *(UINT_TYPE(2)*)(&data[offset]); // Metadata length (16-bit)
         offset += 2;
+        if (metadata_type == METADATA_TYPE_PAYLOAD_LOCATION && metadata_length == 8){
+            // Split layout, the data is in the payload region
+            size_t payload_offset = *(UINT_TYPE(4)*)(&data[offset]);
+            size_t payload_length = *(UINT_TYPE(4)*)(&data[offset + 4]);
+            if (payload_offset <= data_length && payload_length <= data_length - payload_offset){
+                entry->data = &data[payload_offset];
+                entry->data_length = payload_length;
+            }else{
+                entry->data = NULL;
+                entry->data_length = 0;
+            }
+        }
         offset += metadata_length; // Skip metadata data
     }
 
@@ -165,6 +220,15 @@ bool drofs_get_type_metadata(struct drofs_entry_t * entry, uint8_t type, struct
     return false;
 }
 
+bool drofs_get_uint32_metadata(struct drofs_entry_t * entry, uint8_t type, uint32_t * value){
+    struct drofs_metadata_t metadata;
+    if (!drofs_get_type_metadata(entry, type, &metadata) || metadata.length != sizeof(uint32_t)){
+        return false;
+    }
+    memcpy(value, metadata.data, sizeof(uint32_t));
+    return true;
+}
+
 bool drofs_get_nth_child(const uint8_t * data, size_t data_length, size_t nth_child, struct drofs_entry_t * entry, struct drofs_entry_t * child){
     assert(entry != NULL);
     assert(entry->children_length > nth_child);
@@ -187,57 +251,588 @@ bool drofs_verify_entry(struct drofs_entry_t * entry){
     return true;
 }
 
-bool drofs_get_entry(const uint8_t * data, size_t data_length, const char * path,struct drofs_entry_t * entry ){
-    //  # Reset file pointer to the beginning of the linked list data (after header and CRC)
-//             f.seek(FILE_METADATA_SIZE)
+const uint8_t * drofs_get_entry_range(struct drofs_entry_t * entry, size_t offset, size_t * length){
+    if (entry->flags & COMPRESSED){
+        *length = 0;
+        return NULL;
+    }
+    if (offset > entry->data_length){
+        offset = entry->data_length;
+    }
+    if (*length > entry->data_length - offset){
+        *length = entry->data_length - offset;
+    }
+    return entry->data + offset;
+}
+
+enum path_index_result{
+    PATH_INDEX_FOUND,
+    PATH_INDEX_NOT_FOUND,
+    PATH_INDEX_UNRESOLVED /**< No usable index or the index is incomplete, the tree must be walked. */
+};
+
+// FNV-1a constants for path hashing
+#define PATH_HASH_OFFSET_BASIS 0x811c9dc5u
+#define PATH_HASH_PRIME 0x01000193u
+// djb2 basis for the lookup cache's check hash, independent of FNV-1a
+#define PATH_CHECK_HASH_BASIS 5381u
+#define PATH_SEPARATOR '/'
+
+static bool _is_valid_entry_type(const struct drofs_entry_t * entry){
+    return entry->type == ENTRY_TYPE_FILE || entry->type == ENTRY_TYPE_DIRECTORY;
+}
+
+static bool _next_path_component(const char ** cursor, const char ** component, size_t * component_length){
+    const char * current = *cursor;
+    while (*current == PATH_SEPARATOR){
+        current++;
+    }
+    if (*current == '\0'){
+        *cursor = current;
+        return false;
+    }
+
+    *component = current;
+    while (*current != '\0' && *current != PATH_SEPARATOR){
+        current++;
+    }
+    *component_length = (size_t)(current - *component);
+    *cursor = current;
+    return true;
+}
+
+static uint32_t _path_hash_component(uint32_t hash, bool is_first, const char * component, size_t component_length){
+    if (!is_first){
+        hash = (hash ^ (uint8_t)PATH_SEPARATOR) * PATH_HASH_PRIME;
+    }
+    for (size_t i = 0; i < component_length; i++){
+        hash = (hash ^ (uint8_t)component[i]) * PATH_HASH_PRIME;
+    }
+    return hash;
+}
+
+// Identifies a normalized path in the lookup cache, beyond its FNV-1a hash
+struct _path_key_t{
+    uint32_t hash;
+    uint32_t check_hash;
+    uint32_t length;
+};
+
+static void _path_key_init(struct _path_key_t * key){
+    key->hash = PATH_HASH_OFFSET_BASIS;
+    key->check_hash = PATH_CHECK_HASH_BASIS;
+    key->length = 0;
+}
+
+static void _path_key_component(struct _path_key_t * key, bool is_first, const char * component, size_t component_length){
+    key->hash = _path_hash_component(key->hash, is_first, component, component_length);
+    if (!is_first){
+        key->check_hash = key->check_hash * 33 + (uint8_t)PATH_SEPARATOR;
+        key->length++;
+    }
+    for (size_t i = 0; i < component_length; i++){
+        key->check_hash = key->check_hash * 33 + (uint8_t)component[i];
+    }
+    key->length += (uint32_t)component_length;
+}
+
+uint32_t drofs_path_hash(const char * path){
+    uint32_t hash = PATH_HASH_OFFSET_BASIS;
+    const char * cursor = path;
+    const char * component;
+    size_t component_length;
+    bool is_first = true;
+    while (_next_path_component(&cursor, &component, &component_length)){
+        hash = _path_hash_component(hash, is_first, component, component_length);
+        is_first = false;
+    }
+    return hash;
+}
+
+static bool _entry_name_equals(const struct drofs_entry_t * entry, const char * name, size_t name_length){
+    // stored names include their null terminator in name_length
+    return strnlen(entry->name, entry->name_length) == name_length && memcmp(entry->name, name, name_length) == 0;
+}
+
+static bool _find_child(const uint8_t * data, size_t data_length, const struct drofs_entry_t * parent, const char * name, size_t name_length, struct drofs_entry_t * child){
+    size_t index = FILE_METADATA_SIZE;
+    for (size_t i = 0; i < parent->children_length; i++){
+        _read_entry_at_offset(data + index, data_length - index, parent->children_offsets[i], child);
+        if (!_is_valid_entry_type(child)){
+            return false;
+        }
+        if (_entry_name_equals(child, name, name_length)){
+            return true;
+        }
+    }
+    return false;
+}
+
+static enum path_index_result _lookup_path_index(const uint8_t * data, size_t data_length, struct drofs_entry_t * root, const char * path, struct drofs_entry_t * entry){
+    size_t index = FILE_METADATA_SIZE;
+
+    struct drofs_metadata_t index_metadata;
+    if (!drofs_get_type_metadata(root, METADATA_TYPE_PATH_INDEX, &index_metadata) || index_metadata.length != PATH_INDEX_OFFSET_BYTES){
+        return PATH_INDEX_UNRESOLVED;
+    }
+
+    // find the last path component, the root itself is never indexed
+    const char * cursor = path;
+    const char * component;
+    size_t component_length;
+    const char * name = NULL;
+    size_t name_length = 0;
+    while (_next_path_component(&cursor, &component, &component_length)){
+        name = component;
+        name_length = component_length;
+    }
+    if (name == NULL){
+        return PATH_INDEX_UNRESOLVED;
+    }
+
+    size_t section_offset = *(UINT_TYPE(PATH_INDEX_OFFSET_BYTES)*)(index_metadata.data);
+    size_t header_length = PATH_INDEX_SLOT_COUNT_BYTES + PATH_INDEX_FLAGS_BYTES;
+    if (section_offset + header_length > data_length - index){
+        return PATH_INDEX_UNRESOLVED;
+    }
+    const uint8_t * section = data + index + section_offset;
+    uint32_t slot_count = *(UINT_TYPE(PATH_INDEX_SLOT_COUNT_BYTES)*)(section);
+    uint32_t flags = *(UINT_TYPE(PATH_INDEX_FLAGS_BYTES)*)(section + PATH_INDEX_SLOT_COUNT_BYTES);
+    if (slot_count == 0 || (slot_count & (slot_count - 1)) != 0 ||
+        section_offset + header_length + (size_t)slot_count * PATH_INDEX_SLOT_BYTES > data_length - index){
+        return PATH_INDEX_UNRESOLVED;
+    }
+    const uint8_t * slots = section + header_length;
+
+    uint32_t hash = drofs_path_hash(path);
+    for (uint32_t probe = 0; probe < slot_count; probe++){
+        const uint8_t * slot = slots + (size_t)((hash + probe) & (slot_count - 1)) * PATH_INDEX_SLOT_BYTES;
+        uint32_t slot_hash = *(UINT_TYPE(4)*)(slot);
+        uint32_t slot_offset = *(UINT_TYPE(4)*)(slot + 4);
+        if (slot_offset == PATH_INDEX_EMPTY_SLOT){
+            break;
+        }
+        if (slot_hash == hash && slot_offset < data_length - index){
+            struct drofs_entry_t candidate;
+            _read_entry_at_offset(data + index, data_length - index, slot_offset, &candidate);
+            if (_is_valid_entry_type(&candidate) && _entry_name_equals(&candidate, name, name_length)){
+                *entry = candidate;
+                return PATH_INDEX_FOUND;
+            }
+        }
+    }
+
+    return (flags & PATH_INDEX_FLAG_COMPLETE) ? PATH_INDEX_NOT_FOUND : PATH_INDEX_UNRESOLVED;
+}
+
+// Walks the path components before end (NULL for the whole path) down from current, leaving current at the deepest entry resolved
+static bool _walk_path(const uint8_t * data, size_t data_length, const char * path, const char * end, struct drofs_entry_t * current){
+    const char * cursor = path;
+    const char * component;
+    size_t component_length;
+    while (_next_path_component(&cursor, &component, &component_length) && (end == NULL || component < end)){
+        struct drofs_entry_t child;
+        if (!_find_child(data, data_length, current, component, component_length, &child)){
+            return false;
+        }
+        *current = child;
+    }
+    return true;
+}
+
+bool drofs_get_entry(const uint8_t * data, size_t data_length, const char * path, struct drofs_entry_t * entry){
     size_t index = FILE_METADATA_SIZE;
-            
-//             root_entry_from_file = self._read_entry_at_offset(f, f.tell())
 
-    struct drofs_entry_t entry_part;
-    _read_entry_at_offset(data + index, data_length - index, 0, &entry_part);
-    if (entry_part.type < 1 || entry_part.type > 2){
+    struct drofs_entry_t root;
+    _read_entry_at_offset(data + index, data_length - index, 0, &root);
+    if (!_is_valid_entry_type(&root)){
         return false;
     }
-    // drofs_print_entry(entry_part);
 
-    // printf("done printing\n");
+    enum path_index_result index_result = _lookup_path_index(data, data_length, &root, path, entry);
+    if (index_result != PATH_INDEX_UNRESOLVED){
+        if (index_result == PATH_INDEX_NOT_FOUND){
+            *entry = root;
+        }
+        return index_result == PATH_INDEX_FOUND;
+    }
 
-    char pathCopy[256]; // Adjust size as necessary
-    strncpy(pathCopy, path, sizeof(pathCopy));
-    pathCopy[sizeof(pathCopy) - 1] = '\0'; // Ensure null-termination
+    // the path is walked in place, so it may be of any length and nothing is kept between calls
+    *entry = root;
+    return _walk_path(data, data_length, path, NULL, entry);
+}
 
-    // Tokenize the path using '/' as the delimiter
-    char *part = strtok(pathCopy, "/");
-    int partNumber = 1;
+size_t drofs_get_entries(const uint8_t * data, size_t data_length, const char * const * paths, size_t paths_length, struct drofs_entry_t * entries, bool * found){
+    size_t index = FILE_METADATA_SIZE;
+    size_t found_count = 0;
+
+    struct drofs_entry_t root;
+    _read_entry_at_offset(data + index, data_length - index, 0, &root);
+    bool valid_root = _is_valid_entry_type(&root);
+
+    // the directory of the previous path, reused while consecutive paths share it
+    const char * directory_path = NULL;
+    size_t directory_path_length = 0;
+    struct drofs_entry_t directory;
+    bool directory_found = false;
+
+    for (size_t i = 0; i < paths_length; i++){
+        bool entry_found = false;
+        if (valid_root){
+            enum path_index_result index_result = _lookup_path_index(data, data_length, &root, paths[i], &entries[i]);
+            if (index_result != PATH_INDEX_UNRESOLVED){
+                entry_found = index_result == PATH_INDEX_FOUND;
+                if (!entry_found){
+                    entries[i] = root;
+                }
+            }else{
+                // split off the last component, the root has none
+                const char * cursor = paths[i];
+                const char * component;
+                size_t component_length;
+                const char * name = NULL;
+                size_t name_length = 0;
+                while (_next_path_component(&cursor, &component, &component_length)){
+                    name = component;
+                    name_length = component_length;
+                }
+
+                if (name == NULL){
+                    entries[i] = root;
+                    entry_found = true;
+                }else{
+                    size_t path_length = (size_t)(name - paths[i]);
+                    if (directory_path == NULL || directory_path_length != path_length || memcmp(directory_path, paths[i], path_length) != 0){
+                        directory = root;
+                        directory_found = _walk_path(data, data_length, paths[i], name, &directory);
+                        directory_path = paths[i];
+                        directory_path_length = path_length;
+                    }
+                    entry_found = directory_found && _find_child(data, data_length, &directory, name, name_length, &entries[i]);
+                    if (!entry_found){
+                        entries[i] = directory;
+                    }
+                }
+            }
+        }
+        if (found != NULL){
+            found[i] = entry_found;
+        }
+        found_count += entry_found ? 1 : 0;
+    }
+    return found_count;
+}
 
-    bool found = true;
+void drofs_lookup_cache_init(struct drofs_lookup_cache_t * cache, struct drofs_lookup_cache_slot_t * slots, size_t slots_length){
+    assert(cache != NULL);
+    assert(slots != NULL || slots_length == 0);
+    cache->slots = slots;
+    cache->slots_length = slots_length;
+    drofs_lookup_cache_clear(cache);
+}
 
-    while (part != NULL) {
-        // printf("Part %d: %s\n", partNumber++, part);
-        
-        struct drofs_entry_t possible_part;
-        for (size_t i = 0; i < entry_part.children_length;i++){
-            // printf("Checking child %d\n", i);
-            _read_entry_at_offset(data + index , data_length - index, entry_part.children_offsets[i], &possible_part);
-            if (possible_part.type < 1 || possible_part.type > 2){
+void drofs_lookup_cache_clear(struct drofs_lookup_cache_t * cache){
+    cache->data = NULL;
+    cache->tick = 0;
+    cache->hits = 0;
+    cache->misses = 0;
+    for (size_t i = 0; i < cache->slots_length; i++){
+        cache->slots[i].path_hash = 0;
+        cache->slots[i].path_check_hash = 0;
+        cache->slots[i].path_length = 0;
+        cache->slots[i].offset = 0;
+        cache->slots[i].last_used = 0;
+    }
+}
+
+static void _lookup_cache_touch(struct drofs_lookup_cache_t * cache, struct drofs_lookup_cache_slot_t * slot){
+    cache->tick++;
+    if (cache->tick == 0){
+        // tick wrapped around, restart the LRU ordering keeping the occupied slots
+        for (size_t i = 0; i < cache->slots_length; i++){
+            if (cache->slots[i].last_used != 0){
+                cache->slots[i].last_used = 1;
+            }
+        }
+        cache->tick = 2;
+    }
+    slot->last_used = cache->tick;
+}
+
+static struct drofs_lookup_cache_slot_t * _lookup_cache_find(struct drofs_lookup_cache_t * cache, const struct _path_key_t * key){
+    for (size_t i = 0; i < cache->slots_length; i++){
+        struct drofs_lookup_cache_slot_t * slot = &cache->slots[i];
+        if (slot->last_used != 0 && slot->path_hash == key->hash && slot->path_check_hash == key->check_hash && slot->path_length == key->length){
+            return slot;
+        }
+    }
+    return NULL;
+}
+
+static void _lookup_cache_insert(struct drofs_lookup_cache_t * cache, const struct _path_key_t * key, uint32_t offset){
+    if (cache->slots_length == 0){
+        return;
+    }
+
+    struct drofs_lookup_cache_slot_t * slot = _lookup_cache_find(cache, key);
+    if (slot == NULL){
+        // pick an empty slot, or evict the least recently used one
+        slot = &cache->slots[0];
+        for (size_t i = 0; i < cache->slots_length && slot->last_used != 0; i++){
+            if (cache->slots[i].last_used < slot->last_used){
+                slot = &cache->slots[i];
+            }
+        }
+    }
+    slot->path_hash = key->hash;
+    slot->path_check_hash = key->check_hash;
+    slot->path_length = key->length;
+    slot->offset = offset;
+    _lookup_cache_touch(cache, slot);
+}
+
+bool drofs_get_entry_cached(const uint8_t * data, size_t data_length, const char * path, struct drofs_entry_t * entry, struct drofs_lookup_cache_t * cache){
+    assert(cache != NULL);
+    if (cache->data != data){
+        drofs_lookup_cache_clear(cache);
+        cache->data = data;
+    }
+
+    size_t index = FILE_METADATA_SIZE;
+
+    // hash every path prefix, remembering the deepest one which is already cached
+    const char * cursor = path;
+    const char * component;
+    size_t component_length;
+    struct _path_key_t key;
+    _path_key_init(&key);
+    size_t depth = 0;
+
+    struct drofs_lookup_cache_slot_t * cached_slot = NULL;
+    const char * cached_name = NULL;
+    size_t cached_name_length = 0;
+    const char * resume_cursor = path;
+    struct _path_key_t resume_key = key;
+    size_t resume_depth = 0;
+
+    while (_next_path_component(&cursor, &component, &component_length)){
+        _path_key_component(&key, depth == 0, component, component_length);
+        depth++;
+        struct drofs_lookup_cache_slot_t * slot = _lookup_cache_find(cache, &key);
+        if (slot != NULL){
+            cached_slot = slot;
+            cached_name = component;
+            cached_name_length = component_length;
+            resume_cursor = cursor;
+            resume_key = key;
+            resume_depth = depth;
+        }
+    }
+
+    struct drofs_entry_t current;
+    bool resolved_from_cache = false;
+    if (cached_slot != NULL && cached_slot->offset < data_length - index){
+        _read_entry_at_offset(data + index, data_length - index, cached_slot->offset, &current);
+        // the name check guards against hash collisions
+        resolved_from_cache = _is_valid_entry_type(&current) && _entry_name_equals(&current, cached_name, cached_name_length);
+    }
+
+    if (resolved_from_cache){
+        _lookup_cache_touch(cache, cached_slot);
+    }else{
+        if (cached_slot != NULL){
+            cached_slot->last_used = 0;
+        }
+        resume_cursor = path;
+        _path_key_init(&resume_key);
+        resume_depth = 0;
+
+        _read_entry_at_offset(data + index, data_length - index, 0, &current);
+        if (!_is_valid_entry_type(&current)){
+            return false;
+        }
+    }
+
+    if (resume_depth == depth){
+        if (depth > 0){
+            cache->hits++;
+        }
+        *entry = current;
+        return true;
+    }
+    cache->misses++;
+
+    if (resume_depth == 0){
+        struct drofs_entry_t indexed;
+        enum path_index_result index_result = _lookup_path_index(data, data_length, &current, path, &indexed);
+        if (index_result == PATH_INDEX_FOUND){
+            _lookup_cache_insert(cache, &key, indexed.offset);
+            *entry = indexed;
+            return true;
+        }
+        if (index_result == PATH_INDEX_NOT_FOUND){
+            *entry = current;
+            return false;
+        }
+    }
+
+    // walk the remaining components, caching every prefix resolved on the way
+    cursor = resume_cursor;
+    key = resume_key;
+    while (_next_path_component(&cursor, &component, &component_length)){
+        struct drofs_entry_t child;
+        if (!_find_child(data, data_length, &current, component, component_length, &child)){
+            *entry = current;
+            return false;
+        }
+        _path_key_component(&key, resume_depth == 0, component, component_length);
+        resume_depth++;
+        _lookup_cache_insert(cache, &key, child.offset);
+        current = child;
+    }
+
+    *entry = current;
+    return true;
+}
+
+uint8_t drofs_get_window_bits(const uint8_t * data, size_t data_length){
+    struct drofs_entry_t root;
+    _read_entry_at_offset(data + FILE_METADATA_SIZE, data_length - FILE_METADATA_SIZE, 0, &root);
+
+    struct drofs_metadata_t window_bits_metadata;
+    if (!drofs_get_type_metadata(&root, METADATA_TYPE_WINDOW_BITS, &window_bits_metadata) || window_bits_metadata.length != 1){
+        return DROFS_MAX_WINDOW_BITS;
+    }
+
+    uint8_t window_bits = window_bits_metadata.data[0];
+    if (window_bits < DROFS_MIN_WINDOW_BITS || window_bits > DROFS_MAX_WINDOW_BITS){
+        return DROFS_MAX_WINDOW_BITS;
+    }
+    return window_bits;
+}
+
+bool drofs_get_payload_region(const uint8_t * data, size_t data_length, size_t * payload_offset, size_t * payload_length){
+    struct drofs_entry_t root;
+    _read_entry_at_offset(data + FILE_METADATA_SIZE, data_length - FILE_METADATA_SIZE, 0, &root);
+
+    struct drofs_metadata_t payload_region_metadata;
+    if (!drofs_get_type_metadata(&root, METADATA_TYPE_PAYLOAD_REGION, &payload_region_metadata) || payload_region_metadata.length != 8){
+        return false;
+    }
+
+    *payload_offset = *(UINT_TYPE(4)*)(payload_region_metadata.data);
+    *payload_length = *(UINT_TYPE(4)*)(payload_region_metadata.data + 4);
+    return true;
+}
+
+static bool _entry_digest(const uint8_t * data, size_t data_length, size_t offset, uint32_t * digest){
+    // the CRC32 of the record without its inline data and without the ROOT_DIGEST metadata item
+    size_t position = offset + ENTRY_TYPE_BYTES;
+    if (position + NAME_LENGTH_BYTES > data_length){
+        return false;
+    }
+    position += NAME_LENGTH_BYTES + data[position];
+    if (position + DATA_LENGTH_BYTES + DATA_CRC32_BYTES > data_length){
+        return false;
+    }
+    size_t entry_data_length = *(UINT_TYPE(DATA_LENGTH_BYTES)*)(&data[position]);
+    position += DATA_LENGTH_BYTES + DATA_CRC32_BYTES;
+
+    crc32_context_t crc32_ctx;
+    crc32_init(&crc32_ctx);
+    crc32_update(&crc32_ctx, data + offset, position - offset);
+
+    if (entry_data_length > data_length - position){
+        return false;
+    }
+    position += entry_data_length;
+    size_t start = position;
+    if (position + FLAGS_BYTES + 1 > data_length){
+        return false;
+    }
+    size_t metadata_count = data[position + FLAGS_BYTES];
+    position += FLAGS_BYTES + 1;
+    for (size_t i = 0; i < metadata_count; i++){
+        if (position + 3 > data_length){
+            return false;
+        }
+        uint16_t metadata_length = *(UINT_TYPE(2)*)(&data[position + 1]);
+        if (data[position] == METADATA_TYPE_ROOT_DIGEST){
+            crc32_update(&crc32_ctx, data + start, position - start);
+            start = position + 3 + metadata_length;
+        }
+        position += 3 + metadata_length;
+    }
+
+    if (position + NUM_CHILDREN_BYTES > data_length){
+        return false;
+    }
+    size_t children_length = *(UINT_TYPE(NUM_CHILDREN_BYTES)*)(&data[position]);
+    position += NUM_CHILDREN_BYTES;
+    if (children_length > (data_length - position) / CHILD_OFFSET_BYTES){
+        return false;
+    }
+    position += children_length * CHILD_OFFSET_BYTES;
+    crc32_update(&crc32_ctx, data + start, position - start);
+    *digest = crc32_get(&crc32_ctx);
+    return true;
+}
+
+static bool _digest_matches(const uint8_t * data, size_t data_length, size_t offset, const uint8_t * expected_digest){
+    uint32_t digest;
+    return _entry_digest(data, data_length, offset, &digest) && digest == *(UINT_TYPE(DIGEST_BYTES)*)(expected_digest);
+}
+
+bool drofs_get_entry_verified(const uint8_t * data, size_t data_length, const char * path, struct drofs_entry_t * entry){
+    size_t index = FILE_METADATA_SIZE;
+    if (data_length < index){
+        return false;
+    }
+    const uint8_t * linked_list = data + index;
+    size_t linked_list_length = data_length - index;
+
+    struct drofs_entry_t current;
+    _read_entry_at_offset(linked_list, linked_list_length, 0, &current);
+    if (!_is_valid_entry_type(&current)){
+        return false;
+    }
+    struct drofs_metadata_t root_digest;
+    if (!drofs_get_type_metadata(&current, METADATA_TYPE_ROOT_DIGEST, &root_digest) || root_digest.length != DIGEST_BYTES ||
+        !_digest_matches(linked_list, linked_list_length, 0, root_digest.data)){
+        return false;
+    }
+
+    const char * cursor = path;
+    const char * component;
+    size_t component_length;
+    while (_next_path_component(&cursor, &component, &component_length)){
+        struct drofs_metadata_t child_digests;
+        if (!drofs_get_type_metadata(&current, METADATA_TYPE_CHILD_DIGESTS, &child_digests) ||
+            child_digests.length != DIGEST_BYTES * current.children_length){
+            return false;
+        }
+
+        struct drofs_entry_t child;
+        size_t i = 0;
+        for (; i < current.children_length; i++){
+            if (current.children_offsets[i] >= linked_list_length){
                 return false;
             }
-            // drofs_print_entry(possible_part);
-            // printf("comparing\n");
-            // printf("comparing %s with %s\n", possible_part.name, part);
-            if (strcmp(possible_part.name, part) == 0){//, MAX(possible_part.name_length, strnlen(part,255))) == 0){
-                // printf("next part found\n");
-                entry_part = possible_part;
-                found = true;
+            _read_entry_at_offset(linked_list, linked_list_length, current.children_offsets[i], &child);
+            if (_is_valid_entry_type(&child) && _entry_name_equals(&child, component, component_length)){
                 break;
             }
-            found = false;
         }
-        part = strtok(NULL, "/");
+        if (i == current.children_length ||
+            !_digest_matches(linked_list, linked_list_length, child.offset, child_digests.data + DIGEST_BYTES * i)){
+            return false;
+        }
+        current = child;
     }
 
-    // printf("found?\n");
-    *entry = entry_part;
-    return found;
+    if (!drofs_verify_entry(&current)){
+        return false;
+    }
+    *entry = current;
+    return true;
 }
@@ -24,7 +24,8 @@ enum drofs_entry_type{
  * @brief Enumeration for flags associated with a DROFS entry.
  */
 enum drofs_entry_flags{
-    COMPRESSED = 1 << 0 /**< Flag indicating if the entry data is compressed. */
+    COMPRESSED = 1 << 0, /**< Flag indicating if the entry data is compressed. */
+    LZ4 = 1 << 1 /**< With COMPRESSED, the entry data is an LZ4 block instead of a zlib stream. */
 };
 
 /**
@@ -33,9 +34,20 @@ enum drofs_entry_flags{
 enum drofs_entry_metadata_type{
     METADATA_TYPE_ORIGINAL_SIZE = 1, /**< Metadata type for the original size of a file. */
     METADATA_TYPE_TIMESTAMP = 2, /**< Metadata type for the timestamp of an entry. */
-    METADATA_TYPE_ORIGINAL_CRC32 = 3 /**< Metadata type for the original crc32 of a file. */
+    METADATA_TYPE_ORIGINAL_CRC32 = 3, /**< Metadata type for the original crc32 of a file. */
+    METADATA_TYPE_PATH_INDEX = 4, /**< Metadata type for the offset of the path index section (root entry only). */
+    METADATA_TYPE_WINDOW_BITS = 5, /**< Metadata type for the largest compression window (log2) used by the image, or on LZ4 entries the window of the entry. */
+    METADATA_TYPE_PAYLOAD_LOCATION = 6, /**< Metadata type for the offset and length of an entry's data in the payload region (split layout). */
+    METADATA_TYPE_PAYLOAD_REGION = 7, /**< Metadata type for the offset and length of the payload region (split layout, root entry only). */
+    METADATA_TYPE_CHILD_DIGESTS = 8, /**< Metadata type for the Merkle digest of each child record, in children order. */
+    METADATA_TYPE_ROOT_DIGEST = 9 /**< Metadata type for the Merkle digest of the root record (root entry only). */
 };
 
+/** @brief Largest compression window (log2) of a zlib stream, used when an image does not record its window. */
+#define DROFS_MAX_WINDOW_BITS 15
+/** @brief Smallest compression window (log2) of a zlib stream. */
+#define DROFS_MIN_WINDOW_BITS 9
+
 /**
  * @brief Structure to represent a DROFS metadata item.
  */
@@ -63,6 +75,47 @@ struct drofs_entry_t{
     size_t children_length; /**< The number of child entries (for directories). */
 };
 
+/**
+ * @brief A single slot of a path lookup cache.
+ */
+struct drofs_lookup_cache_slot_t{
+    uint32_t path_hash; /**< Hash of the normalized path or path prefix (see drofs_path_hash). */
+    uint32_t path_check_hash; /**< Second, independent hash (djb2) of the normalized path, guards against path_hash collisions. */
+    uint32_t path_length; /**< Length of the normalized path, guards against path_hash collisions. */
+    uint32_t offset; /**< The offset of the entry the path resolves to. */
+    uint32_t last_used; /**< Access tick used for LRU eviction, 0 marks an empty slot. */
+};
+
+/**
+ * @brief Fixed-size, caller-provided cache mapping path hashes to entry offsets.
+ *
+ * The cache is bound to a single DROFS image, it is cleared automatically when used with a different image.
+ * It is not thread safe, each task should use its own cache or guard it with a lock.
+ */
+struct drofs_lookup_cache_t{
+    const uint8_t * data; /**< The DROFS image the cached offsets belong to. */
+    struct drofs_lookup_cache_slot_t * slots; /**< Caller-provided slot storage. */
+    size_t slots_length; /**< The number of slots in the slot storage. */
+    uint32_t tick; /**< Monotonic access counter for LRU eviction. */
+    uint32_t hits; /**< Number of lookups resolved directly from the cache. */
+    uint32_t misses; /**< Number of lookups that had to walk the directory tree. */
+};
+
+/**
+ * @brief State of a resumable image verification (see drofs_verify_begin).
+ *
+ * Holds the running CRC32 over the image, so the image can be verified in bounded slices,
+ * e.g. from an idle task, while other work continues.
+ */
+struct drofs_verify_context_t{
+    const uint8_t * data; /**< The DROFS image being verified. */
+    size_t data_length; /**< The total length of the DROFS image data. */
+    size_t position; /**< Offset of the next byte to checksum, equals data_length once every byte was checksummed. */
+    uint32_t expected_crc32; /**< The overall CRC32 stored in the image header. */
+    crc32_context_t crc32_ctx; /**< The running CRC32 of the bytes checksummed so far. */
+    bool valid_header; /**< Whether the image signature was valid. */
+};
+
 /**
  * @brief Prints the details of a DROFS entry to standard output.
  * @param entry The drofs_entry_t structure to print.
@@ -77,6 +130,33 @@ void drofs_print_entry(struct drofs_entry_t entry);
  */
 bool drofs_verify(const uint8_t * data, size_t data_length);
 
+/**
+ * @brief Starts a resumable verification of a DROFS image.
+ *
+ * drofs_verify checks the whole image in one blocking call, drofs_verify_begin, drofs_verify_step and
+ * drofs_verify_end check it in slices of a bounded number of bytes and give the same result.
+ * @param ctx Pointer to the verification context to initialize.
+ * @param data Pointer to the raw DROFS image data, must stay valid until drofs_verify_end.
+ * @param data_length The total length of the DROFS image data.
+ * @return True if the image signature is valid, false otherwise (drofs_verify_end then returns false).
+ */
+bool drofs_verify_begin(struct drofs_verify_context_t * ctx, const uint8_t * data, size_t data_length);
+
+/**
+ * @brief Checksums the next slice of the image.
+ * @param ctx Pointer to a context started with drofs_verify_begin.
+ * @param max_bytes The largest number of bytes to checksum in this call.
+ * @return True once every byte of the image has been checksummed, false while bytes remain.
+ */
+bool drofs_verify_step(struct drofs_verify_context_t * ctx, size_t max_bytes);
+
+/**
+ * @brief Finishes a resumable verification.
+ * @param ctx Pointer to a context started with drofs_verify_begin.
+ * @return True if the whole image has been checksummed and it is valid, false otherwise.
+ */
+bool drofs_verify_end(struct drofs_verify_context_t * ctx);
+
 /**
  * @brief Retrieves the Nth metadata item of a specific type from a DROFS entry.
  * @param entry Pointer to the drofs_entry_t structure.
@@ -86,6 +166,15 @@ bool drofs_verify(const uint8_t * data, size_t data_length);
  */
 bool drofs_get_type_metadata(struct drofs_entry_t * entry, uint8_t type, struct drofs_metadata_t * metadata);
 
+/**
+ * @brief Retrieves a 32 bit metadata value of a specific type, such as METADATA_TYPE_ORIGINAL_SIZE or METADATA_TYPE_ORIGINAL_CRC32.
+ * @param entry Pointer to the drofs_entry_t structure.
+ * @param type The type of metadata to retrieve.
+ * @param value OUT: The value of the metadata item.
+ * @return True if the metadata item was found and is 4 bytes long, false otherwise.
+ */
+bool drofs_get_uint32_metadata(struct drofs_entry_t * entry, uint8_t type, uint32_t * value);
+
 /**
  * @brief Retrieves the Nth child entry of a directory entry.
  * @param data Pointer to the raw DROFS image data.
@@ -104,8 +193,26 @@ bool drofs_get_nth_child(const uint8_t * data, size_t data_length, size_t nth_ch
  */
 bool drofs_verify_entry(struct drofs_entry_t * entry);
 
+/**
+ * @brief Retrieves a byte range of an entry's data in place, without copying it.
+ *
+ * Only entries which are not compressed can be read in place, compressed entries are read with
+ * `drofs_decompress_entry_range`. The range is not checked against the entry's data CRC32.
+ * @param entry Pointer to the entry.
+ * @param offset The offset of the range within the data.
+ * @param length IN: The length of the range.
+ *               OUT: The length of the range within the data, shorter when it reaches past its end.
+ * @return Pointer to the range in the image, or NULL if the entry is compressed.
+ */
+const uint8_t * drofs_get_entry_range(struct drofs_entry_t * entry, size_t offset, size_t * length);
+
 /**
  * @brief Retrieves a DROFS entry by its path.
+ *
+ * When the image contains a path index section (METADATA_TYPE_PATH_INDEX on the root entry) the path is
+ * resolved with a single hash probe and name verification, otherwise the directory tree is walked.
+ * The path is read in place, so it may be of any length, and no state is kept between calls, so any number
+ * of tasks may look up entries of the same image concurrently without locking.
  * @param data Pointer to the raw DROFS image data.
  * @param data_length The total length of the DROFS image data.
  * @param path The path to the desired entry (e.g., "dir1/file.txt").
@@ -114,6 +221,99 @@ bool drofs_verify_entry(struct drofs_entry_t * entry);
  */
 bool drofs_get_entry(const uint8_t * data, size_t data_length, const char * path,struct drofs_entry_t * entry );
 
+/**
+ * @brief Retrieves several DROFS entries by their paths.
+ *
+ * Resolves every path as drofs_get_entry does, except that consecutive paths in the same directory reuse the
+ * lookup of that directory, so passing paths grouped by directory walks each directory once. It is re-entrant
+ * like drofs_get_entry, tasks may resolve batches of the same image in parallel without locking.
+ * @param data Pointer to the raw DROFS image data.
+ * @param data_length The total length of the DROFS image data.
+ * @param paths The paths to the desired entries.
+ * @param paths_length The number of paths.
+ * @param entries Pointer to paths_length drofs_entry_t structures, populated with the found entries.
+ * @param found Pointer to paths_length flags set to whether each entry was found, or NULL.
+ * @return The number of entries found.
+ */
+size_t drofs_get_entries(const uint8_t * data, size_t data_length, const char * const * paths, size_t paths_length, struct drofs_entry_t * entries, bool * found);
+
+/**
+ * @brief Calculates the hash of a path as used by the lookup cache.
+ *
+ * The hash is a 32 bit FNV-1a over the path components joined by a single '/',
+ * leading, trailing and repeated separators are ignored, so "/dir//file.txt" and "dir/file.txt" hash the same.
+ * @param path The path to hash.
+ * @return The path hash.
+ */
+uint32_t drofs_path_hash(const char * path);
+
+/**
+ * @brief Initializes a path lookup cache over caller-provided slot storage.
+ * @param cache Pointer to the cache to initialize.
+ * @param slots Pointer to the slot storage, no heap allocation is performed.
+ * @param slots_length The number of slots in the slot storage.
+ */
+void drofs_lookup_cache_init(struct drofs_lookup_cache_t * cache, struct drofs_lookup_cache_slot_t * slots, size_t slots_length);
+
+/**
+ * @brief Removes all cached paths and resets the hit/miss counters.
+ * @param cache Pointer to the cache to clear.
+ */
+void drofs_lookup_cache_clear(struct drofs_lookup_cache_t * cache);
+
+/**
+ * @brief Retrieves a DROFS entry by its path, consulting and updating a lookup cache.
+ *
+ * A cached path resolves with a single entry read, otherwise the lookup resumes from the deepest cached
+ * directory prefix and caches every prefix it resolves, evicting the least recently used slots.
+ * Slots are matched on the FNV-1a path hash, a second independent hash and the path length, and the cached
+ * entry's name is checked against the last component, so two paths sharing a path hash do not resolve to each other.
+ * @param data Pointer to the raw DROFS image data.
+ * @param data_length The total length of the DROFS image data.
+ * @param path The path to the desired entry (e.g., "dir1/file.txt").
+ * @param entry Pointer to a drofs_entry_t structure to populate with the found entry's details.
+ * @param cache Pointer to an initialized lookup cache.
+ * @return True if the entry was found, false otherwise.
+ */
+bool drofs_get_entry_cached(const uint8_t * data, size_t data_length, const char * path, struct drofs_entry_t * entry, struct drofs_lookup_cache_t * cache);
+
+/**
+ * @brief Retrieves the largest compression window used by the image's compressed entries.
+ *
+ * Use it to size decompression contexts once for the whole image (see drofs_decompress_create_with_window).
+ * @param data Pointer to the raw DROFS image data.
+ * @param data_length The total length of the DROFS image data.
+ * @return The window size as log2, from METADATA_TYPE_WINDOW_BITS on the root entry, or DROFS_MAX_WINDOW_BITS if the image does not record it.
+ */
+uint8_t drofs_get_window_bits(const uint8_t * data, size_t data_length);
+
+/**
+ * @brief Retrieves the payload region of an image written with the split layout.
+ *
+ * In the split layout every entry header, name, metadata and child table is in one compact region at the
+ * start of the image, and walks and lookups touch only that region. Entry data is read from the payload region.
+ * @param data Pointer to the raw DROFS image data.
+ * @param data_length The total length of the DROFS image data.
+ * @param payload_offset Pointer to store the offset of the payload region, relative to the first entry.
+ * @param payload_length Pointer to store the length of the payload region.
+ * @return True if the image uses the split layout, false otherwise.
+ */
+bool drofs_get_payload_region(const uint8_t * data, size_t data_length, size_t * payload_offset, size_t * payload_length);
+
+/**
+ * @brief Retrieves an entry by its path, verifying only the entries on the path instead of the whole image.
+ *
+ * The root record is checked against METADATA_TYPE_ROOT_DIGEST, every record on the path against its parent's
+ * METADATA_TYPE_CHILD_DIGESTS and the entry's data against its data CRC32, so verification scales with
+ * what is accessed rather than with the image size. The overall CRC32 (drofs_verify) is not checked.
+ * @param data Pointer to the raw DROFS image data.
+ * @param data_length The total length of the DROFS image data.
+ * @param path The path to the entry (e.g., "/dir/file.txt").
+ * @param entry Pointer to a drofs_entry_t structure to store the found entry.
+ * @return True if the entry was found and verified, false if it does not exist, the image has no Merkle digests or verification failed.
+ */
+bool drofs_get_entry_verified(const uint8_t * data, size_t data_length, const char * path, struct drofs_entry_t * entry);
+
 #ifdef __cplusplus
 }
 #endif
\ No newline at end of file
@@ -0,0 +1,192 @@
+#include "drofs_cache_helper.h"
+
+#include <assert.h>
+#include <string.h>
+
+void drofs_payload_cache_init(struct drofs_payload_cache_t * cache, struct drofs_payload_cache_slot_t * slots, size_t slots_length, uint8_t * arena, size_t arena_length){
+    assert(cache != NULL);
+    assert(slots != NULL || slots_length == 0);
+    assert(arena != NULL || arena_length == 0);
+    cache->slots = slots;
+    cache->slots_length = slots_length;
+    cache->arena = arena;
+    cache->arena_length = arena_length;
+    drofs_payload_cache_clear(cache);
+}
+
+void drofs_payload_cache_clear(struct drofs_payload_cache_t * cache){
+    cache->used = 0;
+    cache->tick = 0;
+    cache->hits = 0;
+    cache->misses = 0;
+    cache->evictions = 0;
+    for (size_t i = 0; i < cache->slots_length; i++){
+        cache->slots[i].offset = 0;
+        cache->slots[i].source = NULL;
+        cache->slots[i].arena_offset = 0;
+        cache->slots[i].length = 0;
+        cache->slots[i].last_used = 0;
+    }
+}
+
+static void _payload_cache_touch(struct drofs_payload_cache_t * cache, struct drofs_payload_cache_slot_t * slot){
+    cache->tick++;
+    if (cache->tick == 0){
+        // tick wrapped around, restart the LRU ordering keeping the occupied slots
+        for (size_t i = 0; i < cache->slots_length; i++){
+            if (cache->slots[i].last_used != 0){
+                cache->slots[i].last_used = 1;
+            }
+        }
+        cache->tick = 2;
+    }
+    slot->last_used = cache->tick;
+}
+
+static struct drofs_payload_cache_slot_t * _payload_cache_find(struct drofs_payload_cache_t * cache, struct drofs_entry_t * entry){
+    for (size_t i = 0; i < cache->slots_length; i++){
+        struct drofs_payload_cache_slot_t * slot = &cache->slots[i];
+        if (slot->last_used != 0 && slot->offset == entry->offset && slot->source == entry->data){
+            return slot;
+        }
+    }
+    return NULL;
+}
+
+// Returns the least recently used occupied slot, or NULL if the cache is empty
+static struct drofs_payload_cache_slot_t * _payload_cache_least_recently_used(struct drofs_payload_cache_t * cache){
+    struct drofs_payload_cache_slot_t * lru = NULL;
+    for (size_t i = 0; i < cache->slots_length; i++){
+        if (cache->slots[i].last_used != 0 && (lru == NULL || cache->slots[i].last_used < lru->last_used)){
+            lru = &cache->slots[i];
+        }
+    }
+    return lru;
+}
+
+static void _payload_cache_evict(struct drofs_payload_cache_t * cache, struct drofs_payload_cache_slot_t * slot){
+    cache->used -= slot->length;
+    cache->evictions++;
+    slot->last_used = 0;
+}
+
+// Moves the cached data to the start of the arena, keeping its order, so the free space is a single block at the end
+static void _payload_cache_compact(struct drofs_payload_cache_t * cache){
+    size_t cursor = 0;
+    struct drofs_payload_cache_slot_t * previous = NULL;
+    size_t previous_offset = 0;
+    while (true){
+        // the next slot in arena order, ties broken by slot order so empty entries are moved once
+        struct drofs_payload_cache_slot_t * next = NULL;
+        for (size_t i = 0; i < cache->slots_length; i++){
+            struct drofs_payload_cache_slot_t * slot = &cache->slots[i];
+            if (slot->last_used == 0){
+                continue;
+            }
+            bool after_previous = previous == NULL || slot->arena_offset > previous_offset || (slot->arena_offset == previous_offset && slot > previous);
+            if (after_previous && (next == NULL || slot->arena_offset < next->arena_offset)){
+                next = slot;
+            }
+        }
+        if (next == NULL){
+            return;
+        }
+        previous = next;
+        previous_offset = next->arena_offset;
+        if (next->arena_offset != cursor){
+            memmove(cache->arena + cursor, cache->arena + next->arena_offset, next->length);
+            next->arena_offset = cursor;
+        }
+        cursor += next->length;
+    }
+}
+
+const uint8_t * drofs_payload_cache_get(struct drofs_payload_cache_t * cache, struct drofs_entry_t * entry, size_t * length){
+    struct drofs_payload_cache_slot_t * slot = _payload_cache_find(cache, entry);
+    if (slot == NULL){
+        cache->misses++;
+        return NULL;
+    }
+    cache->hits++;
+    _payload_cache_touch(cache, slot);
+    *length = slot->length;
+    return cache->arena + slot->arena_offset;
+}
+
+const uint8_t * drofs_payload_cache_peek(struct drofs_payload_cache_t * cache, struct drofs_entry_t * entry, size_t * length){
+    struct drofs_payload_cache_slot_t * slot = _payload_cache_find(cache, entry);
+    if (slot == NULL){
+        return NULL;
+    }
+    *length = slot->length;
+    return cache->arena + slot->arena_offset;
+}
+
+tinfl_status drofs_payload_cache_load(struct drofs_payload_cache_t * cache, drofs_decompression_context_t * ctx, struct drofs_entry_t * entry, const uint8_t ** data, size_t * length){
+    if (!(entry->flags & COMPRESSED)){
+        *data = entry->data;
+        *length = entry->data_length;
+        return TINFL_STATUS_DONE;
+    }
+
+    *data = drofs_payload_cache_get(cache, entry, length);
+    if (*data != NULL){
+        return TINFL_STATUS_DONE;
+    }
+
+    uint32_t original_size;
+    if (!drofs_get_uint32_metadata(entry, METADATA_TYPE_ORIGINAL_SIZE, &original_size)){
+        return TINFL_STATUS_BAD_PARAM;
+    }
+    if (original_size > cache->arena_length || cache->slots_length == 0){
+        return TINFL_STATUS_HAS_MORE_OUTPUT;
+    }
+
+    // take an empty slot, or the least recently used one, then evict until the data fits
+    struct drofs_payload_cache_slot_t * slot = NULL;
+    for (size_t i = 0; i < cache->slots_length && slot == NULL; i++){
+        if (cache->slots[i].last_used == 0){
+            slot = &cache->slots[i];
+        }
+    }
+    if (slot == NULL){
+        slot = _payload_cache_least_recently_used(cache);
+        _payload_cache_evict(cache, slot);
+    }
+    while (cache->arena_length - cache->used < original_size){
+        _payload_cache_evict(cache, _payload_cache_least_recently_used(cache));
+    }
+    _payload_cache_compact(cache);
+
+    uint8_t * output = cache->arena + cache->used;
+    size_t output_length = original_size;
+    tinfl_status status = drofs_decompress_entry_to_buffer(ctx, entry, output, &output_length);
+    if (ctx != NULL){
+        drofs_decompress_reset_entry(ctx, entry);
+    }
+    if (status != TINFL_STATUS_DONE || output_length != original_size){
+        // data longer than its original size, or shorter
+        return status < 0 ? status : TINFL_STATUS_FAILED;
+    }
+
+    uint32_t original_crc32;
+    if (drofs_get_uint32_metadata(entry, METADATA_TYPE_ORIGINAL_CRC32, &original_crc32)){
+        crc32_context_t crc32_ctx;
+        crc32_init(&crc32_ctx);
+        crc32_update(&crc32_ctx, output, output_length);
+        if (crc32_get(&crc32_ctx) != original_crc32){
+            return TINFL_STATUS_FAILED;
+        }
+    }
+
+    slot->offset = entry->offset;
+    slot->source = entry->data;
+    slot->arena_offset = cache->used;
+    slot->length = output_length;
+    cache->used += output_length;
+    _payload_cache_touch(cache, slot);
+
+    *data = output;
+    *length = output_length;
+    return TINFL_STATUS_DONE;
+}
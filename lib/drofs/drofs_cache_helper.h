@@ -0,0 +1,107 @@
+/**
+ * @file drofs_cache_helper.h
+ * @brief LRU cache of decompressed DROFS entries in a caller-provided arena.
+ *
+ * Compressed entries read repeatedly, such as fonts, icons and configuration, are inflated once into the
+ * arena and served from it afterwards. The arena size is the byte budget of the cache, the least recently
+ * used entries are evicted to make room for new ones, and no heap allocation is performed.
+ */
+#pragma once
+#include "drofs.h"
+#include "drofs_compression_helper.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/**
+ * @brief A single slot of a payload cache, one cached entry.
+ */
+struct drofs_payload_cache_slot_t{
+    uint32_t offset; /**< The offset of the cached entry within the DROFS image. */
+    const uint8_t * source; /**< The compressed data of the cached entry, tells apart entries of different images at the same offset. */
+    size_t arena_offset; /**< Where the decompressed data starts in the arena. */
+    size_t length; /**< The length of the decompressed data. */
+    uint32_t last_used; /**< Access tick used for LRU eviction, 0 marks an empty slot. */
+};
+
+/**
+ * @brief Caller-provided cache of decompressed entries, keyed by entry offset.
+ *
+ * The arena (internal RAM or PSRAM) holds the decompressed data of at most slots_length entries.
+ * Entries larger than the arena are never cached. It is not thread safe, each task should use its
+ * own cache or guard it with a lock.
+ */
+struct drofs_payload_cache_t{
+    struct drofs_payload_cache_slot_t * slots; /**< Caller-provided slot storage. */
+    size_t slots_length; /**< The number of slots in the slot storage. */
+    uint8_t * arena; /**< Caller-provided storage for the decompressed data. */
+    size_t arena_length; /**< The size of the arena, the byte budget of the cache. */
+    size_t used; /**< Number of arena bytes holding cached data. */
+    uint32_t tick; /**< Monotonic access counter for LRU eviction. */
+    uint32_t hits; /**< Number of entry lookups and loads served from the cache. */
+    uint32_t misses; /**< Number of entry lookups and loads of entries which were not cached. */
+    uint32_t evictions; /**< Number of entries evicted to make room for others. */
+};
+
+/**
+ * @brief Initializes a payload cache over caller-provided slot and arena storage.
+ * @param cache Pointer to the cache to initialize.
+ * @param slots Pointer to the slot storage, the most entries cached at once.
+ * @param slots_length The number of slots in the slot storage.
+ * @param arena Pointer to the arena the decompressed data is kept in.
+ * @param arena_length The size of the arena in bytes.
+ */
+void drofs_payload_cache_init(struct drofs_payload_cache_t * cache, struct drofs_payload_cache_slot_t * slots, size_t slots_length, uint8_t * arena, size_t arena_length);
+
+/**
+ * @brief Removes all cached entries and resets the counters.
+ * @param cache Pointer to the cache to clear.
+ */
+void drofs_payload_cache_clear(struct drofs_payload_cache_t * cache);
+
+/**
+ * @brief Retrieves the decompressed data of a cached entry, counting a hit or a miss.
+ *
+ * The returned data stays valid until the next `drofs_payload_cache_load` on the same cache, which may
+ * evict it or move it within the arena.
+ * @param cache Pointer to an initialized payload cache.
+ * @param entry Pointer to the entry.
+ * @param length OUT: The length of the decompressed data.
+ * @return Pointer to the decompressed data in the arena, or NULL if the entry is not cached.
+ */
+const uint8_t * drofs_payload_cache_get(struct drofs_payload_cache_t * cache, struct drofs_entry_t * entry, size_t * length);
+
+/**
+ * @brief Retrieves the decompressed data of a cached entry without counting it or updating the LRU order.
+ *
+ * File handles use it on each read of an entry their open already loaded, so the counters count entry loads,
+ * not read chunks. The returned data stays valid until the next `drofs_payload_cache_load` on the same cache.
+ * @param cache Pointer to an initialized payload cache.
+ * @param entry Pointer to the entry.
+ * @param length OUT: The length of the decompressed data.
+ * @return Pointer to the decompressed data in the arena, or NULL if the entry is not cached.
+ */
+const uint8_t * drofs_payload_cache_peek(struct drofs_payload_cache_t * cache, struct drofs_entry_t * entry, size_t * length);
+
+/**
+ * @brief Retrieves the original data of an entry, decompressing it into the cache on a miss.
+ *
+ * Entries which are not compressed are returned in place and never cached. Compressed entries are inflated
+ * straight into the arena after evicting the least recently used entries until they fit, and checked against
+ * their METADATA_TYPE_ORIGINAL_CRC32, if any, so corrupted data is never cached.
+ * The returned data stays valid until the next `drofs_payload_cache_load` on the same cache.
+ * @param cache Pointer to an initialized payload cache.
+ * @param ctx Pointer to a decompression context whose decompressor is reused, as with `drofs_decompress_entry_to_buffer`.
+ *            It may be NULL for LZ4 entries, it is left reset to the entry.
+ * @param entry Pointer to the entry.
+ * @param data OUT: Pointer to the original data.
+ * @param length OUT: The length of the original data.
+ * @return TINFL_STATUS_DONE on success, TINFL_STATUS_HAS_MORE_OUTPUT if the entry does not fit the arena or the cache
+ *         has no slots, TINFL_STATUS_BAD_PARAM if the entry has no METADATA_TYPE_ORIGINAL_SIZE, or an error code.
+ */
+tinfl_status drofs_payload_cache_load(struct drofs_payload_cache_t * cache, drofs_decompression_context_t * ctx, struct drofs_entry_t * entry, const uint8_t ** data, size_t * length);
+
+#ifdef __cplusplus
+}
+#endif
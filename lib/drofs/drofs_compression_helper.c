@@ -5,54 +5,420 @@
 #include <string.h>
 #include <stdio.h>
 
+#include <stddef.h>
+
+// The LZ4 block format, see https://github.com/lz4/lz4/blob/dev/doc/lz4_Block_format.md
+#define LZ4_MIN_MATCH 4
+
 typedef struct drofs_decompression_context
 {
-    tinfl_decompressor decompressor;
-    uint8_t dict[TINFL_LZ_DICT_SIZE];
+    tinfl_decompressor *decompressor; // In memory, NULL in contexts which only decode LZ4 blocks
 
     // --- Input Tracking ---
     const uint8_t *input_ptr; // Pointer to the start of the current input chunk
     size_t input_available;   // Total bytes in the current input chunk
+    tinfl_status status;      // Status of the last tinfl call, tinfl is called again only while it has more output
 
     // --- Output Tracking ---
-    size_t opos;  // Next byte to read from the dictionary (0 to TINFL_LZ_DICT_SIZE - 1)
+    size_t opos;  // Next byte to read from the dictionary (0 to dict_size - 1)
     size_t osize; // Bytes available for user to read from the dictionary
+
+    bool owns_memory; // Allocated by drofs_decompress_create, released by drofs_decompress_free
+
+    // --- LZ4 ---
+    bool lz4;              // The input is an LZ4 block rather than a zlib stream
+    bool lz4_match_header; // The literals of the current sequence are decoded, its match follows
+    uint8_t lz4_token;     // Token of the current sequence, the match length is in its low nibble
+    size_t lz4_literals;   // Literal bytes of the current sequence not yet decoded
+    size_t lz4_match;      // Match bytes of the current sequence not yet decoded
+    size_t lz4_offset;     // Distance of the current match
+    size_t lz4_position;   // Next dictionary position decoded into, the dictionary wraps
+    size_t lz4_decoded;    // Bytes decoded so far, matches never reach before the first
+
+    // --- Dictionary ---
+    size_t dict_size; // Window size, a power of 2, streams with a larger window are rejected
+    uint8_t *dict;    // In memory, after the decompressor
+    uint64_t memory[]; // The zlib decompressor, unless only LZ4 blocks are decoded, followed by the dictionary
 } drofs_decompression_context_t;
 
-drofs_decompression_context_t *drofs_decompress_create(
+static uint8_t _clamp_window_bits(uint8_t window_bits)
+{
+    if (window_bits < DROFS_MIN_WINDOW_BITS)
+        return DROFS_MIN_WINDOW_BITS;
+    if (window_bits > DROFS_MAX_WINDOW_BITS)
+        return DROFS_MAX_WINDOW_BITS;
+    return window_bits;
+}
+
+uint8_t drofs_decompress_window_bits(
     const uint8_t *input_buf,
     size_t input_buf_len)
 {
-    drofs_decompression_context_t *ctx = malloc(sizeof(drofs_decompression_context_t));
+    // zlib header: CMF (method and window as CINFO = log2(window) - 8), FLG, with CMF * 256 + FLG a multiple of 31
+    if (input_buf == NULL || input_buf_len < 2 || (input_buf[0] & 0x0F) != 8 || ((input_buf[0] << 8) | input_buf[1]) % 31 != 0)
+    {
+        return DROFS_MAX_WINDOW_BITS;
+    }
+    return _clamp_window_bits((uint8_t)((input_buf[0] >> 4) + 8));
+}
+
+uint8_t drofs_decompress_entry_window_bits(struct drofs_entry_t *entry)
+{
+    if (!(entry->flags & LZ4))
+    {
+        return drofs_decompress_window_bits(entry->data, entry->data_length);
+    }
+    // LZ4 blocks have no header, the window is recorded in the entry's metadata
+    struct drofs_metadata_t window_bits_metadata;
+    if (!drofs_get_type_metadata(entry, METADATA_TYPE_WINDOW_BITS, &window_bits_metadata) || window_bits_metadata.length != 1)
+    {
+        return DROFS_MAX_WINDOW_BITS;
+    }
+    return _clamp_window_bits(window_bits_metadata.data[0]);
+}
+
+size_t drofs_decompress_context_size_for_window(uint8_t window_bits)
+{
+    return offsetof(drofs_decompression_context_t, memory) + sizeof(tinfl_decompressor) + ((size_t)1 << _clamp_window_bits(window_bits));
+}
+
+size_t drofs_decompress_lz4_context_size_for_window(uint8_t window_bits)
+{
+    return offsetof(drofs_decompression_context_t, memory) + ((size_t)1 << _clamp_window_bits(window_bits));
+}
+
+// Lays out the decompressor, if any, and a dictionary of the given window in the context memory
+static void _layout(drofs_decompression_context_t *ctx, bool zlib, uint8_t window_bits)
+{
+    ctx->decompressor = zlib ? (tinfl_decompressor *)ctx->memory : NULL;
+    ctx->dict = (uint8_t *)ctx->memory + (zlib ? sizeof(tinfl_decompressor) : 0);
+    ctx->dict_size = (size_t)1 << window_bits;
+}
+
+size_t drofs_decompress_context_size(void)
+{
+    return drofs_decompress_context_size_for_window(DROFS_MAX_WINDOW_BITS);
+}
+
+drofs_decompression_context_t *drofs_decompress_create_with_window(
+    uint8_t window_bits,
+    const uint8_t *input_buf,
+    size_t input_buf_len)
+{
+    drofs_decompression_context_t *ctx = malloc(drofs_decompress_context_size_for_window(window_bits));
     if (ctx == NULL)
     {
-        // error allocating decompression context (about 32KB)
+        // error allocating decompression context (about 11KB plus the window)
         printf("error allocating decompression context\n");
         return NULL;
     }
-    tinfl_init(&ctx->decompressor);
+    ctx->owns_memory = true;
+    _layout(ctx, true, _clamp_window_bits(window_bits));
+    drofs_decompress_reset(ctx, input_buf, input_buf_len);
+
+    return ctx;
+}
+
+drofs_decompression_context_t *drofs_decompress_create(
+    const uint8_t *input_buf,
+    size_t input_buf_len)
+{
+    return drofs_decompress_create_with_window(drofs_decompress_window_bits(input_buf, input_buf_len), input_buf, input_buf_len);
+}
+
+drofs_decompression_context_t *drofs_decompress_init(
+    void *buffer,
+    size_t buffer_len,
+    const uint8_t *input_buf,
+    size_t input_buf_len)
+{
+    if (buffer == NULL || buffer_len < drofs_decompress_context_size_for_window(DROFS_MIN_WINDOW_BITS))
+    {
+        return NULL;
+    }
+    drofs_decompression_context_t *ctx = (drofs_decompression_context_t *)buffer;
+    ctx->owns_memory = false;
+
+    // The largest window that fits the buffer
+    uint8_t window_bits = DROFS_MAX_WINDOW_BITS;
+    while (drofs_decompress_context_size_for_window(window_bits) > buffer_len)
+    {
+        window_bits--;
+    }
+    _layout(ctx, true, window_bits);
+    drofs_decompress_reset(ctx, input_buf, input_buf_len);
+
+    return ctx;
+}
+
+drofs_decompression_context_t *drofs_decompress_init_entry(
+    void *buffer,
+    size_t buffer_len,
+    struct drofs_entry_t *entry)
+{
+    bool zlib = !(entry->flags & LZ4);
+    size_t (*context_size)(uint8_t) = zlib ? drofs_decompress_context_size_for_window : drofs_decompress_lz4_context_size_for_window;
+    if (buffer == NULL || buffer_len < context_size(DROFS_MIN_WINDOW_BITS))
+    {
+        return NULL;
+    }
+    drofs_decompression_context_t *ctx = (drofs_decompression_context_t *)buffer;
+    ctx->owns_memory = false;
+
+    // The largest window that fits the buffer
+    uint8_t window_bits = DROFS_MAX_WINDOW_BITS;
+    while (context_size(window_bits) > buffer_len)
+    {
+        window_bits--;
+    }
+    _layout(ctx, zlib, window_bits);
+    drofs_decompress_reset_entry(ctx, entry);
+
+    return ctx;
+}
+
+void drofs_decompress_reset(
+    drofs_decompression_context_t *ctx,
+    const uint8_t *input_buf,
+    size_t input_buf_len)
+{
     ctx->input_ptr = input_buf;
     ctx->input_available = input_buf_len;
-
     ctx->opos = 0;
     ctx->osize = 0;
 
-    return ctx;
+    ctx->lz4 = false;
+    if (ctx->decompressor == NULL)
+    {
+        ctx->status = TINFL_STATUS_BAD_PARAM; // No room for the zlib decompressor
+        return;
+    }
+    tinfl_init(ctx->decompressor);
+    ctx->status = TINFL_STATUS_HAS_MORE_OUTPUT;
+}
+
+void drofs_decompress_reset_entry(
+    drofs_decompression_context_t *ctx,
+    struct drofs_entry_t *entry)
+{
+    drofs_decompress_reset(ctx, entry->data, entry->data_length);
+    if (!(entry->flags & LZ4))
+    {
+        return;
+    }
+    ctx->lz4 = true;
+    ctx->lz4_match_header = false;
+    ctx->lz4_literals = 0;
+    ctx->lz4_match = 0;
+    ctx->lz4_position = 0;
+    ctx->lz4_decoded = 0;
+    ctx->status = TINFL_STATUS_HAS_MORE_OUTPUT;
 }
 
 void drofs_decompress_free(drofs_decompression_context_t *ctx)
 {
-    free(ctx);
+    if (ctx != NULL && ctx->owns_memory)
+    {
+        free(ctx);
+    }
 }
 
-tinfl_status drofs_decompress_chunk(
+// Reads an LZ4 length, extended by the following bytes while they are 255, false if the input ends first
+static bool _lz4_read_length(const uint8_t **input, const uint8_t *input_end, size_t *length)
+{
+    if (*length != 15)
+    {
+        return true;
+    }
+    uint8_t byte;
+    do
+    {
+        if (*input == input_end)
+        {
+            return false;
+        }
+        byte = *(*input)++;
+        *length += byte;
+    } while (byte == 255);
+    return true;
+}
+
+// Decodes the LZ4 block into the dictionary from lz4_position up to the dictionary end, sequences may span calls
+static tinfl_status _lz4_decompress(drofs_decompression_context_t *ctx, size_t *decoded)
+{
+    const uint8_t *input = ctx->input_ptr;
+    const uint8_t *input_end = input + ctx->input_available;
+    uint8_t *output = ctx->dict + ctx->lz4_position;
+    uint8_t *output_end = ctx->dict + ctx->dict_size;
+    tinfl_status status = TINFL_STATUS_HAS_MORE_OUTPUT;
+
+    while (output < output_end)
+    {
+        size_t space = (size_t)(output_end - output);
+        if (ctx->lz4_literals > 0)
+        {
+            size_t copy_len = ctx->lz4_literals < space ? ctx->lz4_literals : space;
+            memcpy(output, input, copy_len);
+            input += copy_len;
+            output += copy_len;
+            ctx->lz4_literals -= copy_len;
+        }
+        else if (ctx->lz4_match > 0)
+        {
+            // Copy in runs which neither wrap the dictionary nor overlap their own output
+            size_t position = (size_t)(output - ctx->dict);
+            size_t from = (position + ctx->dict_size - ctx->lz4_offset) & (ctx->dict_size - 1);
+            size_t copy_len = ctx->lz4_match < space ? ctx->lz4_match : space;
+            if (copy_len > ctx->dict_size - from)
+                copy_len = ctx->dict_size - from;
+            if (copy_len > ctx->lz4_offset)
+                copy_len = ctx->lz4_offset;
+            memmove(output, ctx->dict + from, copy_len);
+            output += copy_len;
+            ctx->lz4_match -= copy_len;
+        }
+        else if (ctx->lz4_match_header)
+        {
+            if (input == input_end)
+            {
+                status = TINFL_STATUS_DONE; // The last sequence holds only literals
+                break;
+            }
+            size_t match_length = ctx->lz4_token & 0x0F;
+            if (input_end - input < 2)
+            {
+                status = TINFL_STATUS_FAILED;
+                break;
+            }
+            size_t offset = input[0] | (input[1] << 8);
+            input += 2;
+            size_t decoded_so_far = ctx->lz4_decoded + (size_t)(output - (ctx->dict + ctx->lz4_position));
+            if (!_lz4_read_length(&input, input_end, &match_length) || offset == 0 || offset > ctx->dict_size || offset > decoded_so_far)
+            {
+                status = TINFL_STATUS_FAILED; // Truncated, or reaching before the start or beyond the window
+                break;
+            }
+            ctx->lz4_offset = offset;
+            ctx->lz4_match = match_length + LZ4_MIN_MATCH;
+            ctx->lz4_match_header = false;
+        }
+        else
+        {
+            if (input == input_end)
+            {
+                status = TINFL_STATUS_FAILED; // Truncated, the block ends with literals
+                break;
+            }
+            ctx->lz4_token = *input++;
+            size_t literals = ctx->lz4_token >> 4;
+            if (!_lz4_read_length(&input, input_end, &literals) || literals > (size_t)(input_end - input))
+            {
+                status = TINFL_STATUS_FAILED;
+                break;
+            }
+            ctx->lz4_literals = literals;
+            ctx->lz4_match_header = true;
+        }
+    }
+
+    *decoded = (size_t)(output - (ctx->dict + ctx->lz4_position));
+    ctx->lz4_decoded += *decoded;
+    ctx->lz4_position = (ctx->lz4_position + *decoded) & (ctx->dict_size - 1);
+    ctx->input_available -= (size_t)(input - ctx->input_ptr);
+    ctx->input_ptr = input;
+    if (status == TINFL_STATUS_HAS_MORE_OUTPUT && ctx->lz4_match_header && ctx->lz4_literals == 0 && input == input_end)
+    {
+        status = TINFL_STATUS_DONE; // The block ended exactly at the end of the dictionary
+    }
+    return status;
+}
+
+// Decodes a whole LZ4 block into a buffer, matches are copied from the output itself
+static tinfl_status _lz4_decompress_to_buffer(
+    const uint8_t *input,
+    size_t input_len,
+    uint8_t *output_buffer,
+    size_t *output_buffer_len) // IN: Capacity, OUT: Bytes written
+{
+    const uint8_t *input_end = input + input_len;
+    uint8_t *output = output_buffer;
+    uint8_t *output_end = output_buffer + *output_buffer_len;
+    tinfl_status status = TINFL_STATUS_FAILED;
+
+    while (input < input_end)
+    {
+        uint8_t token = *input++;
+        size_t literals = token >> 4;
+        if (!_lz4_read_length(&input, input_end, &literals) || literals > (size_t)(input_end - input))
+        {
+            break;
+        }
+        if (literals > (size_t)(output_end - output))
+        {
+            memcpy(output, input, (size_t)(output_end - output));
+            output = output_end;
+            status = TINFL_STATUS_HAS_MORE_OUTPUT;
+            break;
+        }
+        memcpy(output, input, literals);
+        input += literals;
+        output += literals;
+        if (input == input_end)
+        {
+            status = TINFL_STATUS_DONE; // The last sequence holds only literals
+            break;
+        }
+
+        if (input_end - input < 2)
+        {
+            break;
+        }
+        size_t offset = input[0] | (input[1] << 8);
+        input += 2;
+        size_t match_length = token & 0x0F;
+        if (!_lz4_read_length(&input, input_end, &match_length) || offset == 0 || offset > (size_t)(output - output_buffer))
+        {
+            break;
+        }
+        match_length += LZ4_MIN_MATCH;
+        if (match_length > (size_t)(output_end - output))
+        {
+            match_length = (size_t)(output_end - output);
+            status = TINFL_STATUS_HAS_MORE_OUTPUT;
+        }
+        const uint8_t *match = output - offset;
+        if (offset >= match_length)
+        {
+            memcpy(output, match, match_length);
+            output += match_length;
+        }
+        else
+        {
+            // Overlapping match, repeats the last offset bytes
+            uint8_t *match_end = output + match_length;
+            while (output < match_end)
+            {
+                *output++ = *match++;
+            }
+        }
+        if (status == TINFL_STATUS_HAS_MORE_OUTPUT)
+        {
+            break;
+        }
+    }
+
+    *output_buffer_len = (size_t)(output - output_buffer);
+    return status;
+}
+
+// Decompresses into output_buffer, or discards the output when output_buffer is NULL
+static tinfl_status _decompress(
     drofs_decompression_context_t *ctx,
     uint8_t *output_buffer,
     size_t *output_buffer_len) // IN: Capacity, OUT: Bytes written
 {
     size_t out_capacity = *output_buffer_len;
     size_t out_bytes_written = 0;
-    tinfl_status status = TINFL_STATUS_HAS_MORE_OUTPUT;
 
     while (out_bytes_written < out_capacity)
     {
@@ -63,7 +429,10 @@ tinfl_status drofs_decompress_chunk(
             if (copy_len > ctx->osize)
                 copy_len = ctx->osize;
 
-            memcpy(output_buffer + out_bytes_written, ctx->dict + ctx->opos, copy_len);
+            if (output_buffer != NULL)
+            {
+                memcpy(output_buffer + out_bytes_written, ctx->dict + ctx->opos, copy_len);
+            }
 
             ctx->opos += copy_len;
             ctx->osize -= copy_len;
@@ -72,74 +441,173 @@ tinfl_status drofs_decompress_chunk(
             // If the user's buffer is now full, we exit
             if (out_bytes_written == out_capacity)
             {
-                printf("output buffer is full, breaking\n");
                 break;
             }
         }
 
-        // 2. Decompress new data (only if input is still available)
-        if (ctx->input_available > 0)
+        // 2. Decompress new data, tinfl may hold pending output even after consuming all the input
+        if (ctx->status != TINFL_STATUS_HAS_MORE_OUTPUT)
         {
-            // Set the pointers/sizes for tinfl_decompress based on context state
-            const uint8_t *pIn_buf_next = ctx->input_ptr;
-            size_t current_in_size = ctx->input_available; // Passed by reference
-
-            mz_uint8 *pOut_buf_next = ctx->dict;
-            size_t current_out_size = TINFL_LZ_DICT_SIZE; // The full dictionary size
-
-            status = tinfl_decompress(
-                &ctx->decompressor,
-                pIn_buf_next, &current_in_size,
-                ctx->dict,
-                pOut_buf_next, &current_out_size,
-                TINFL_FLAG_PARSE_ZLIB_HEADER | TINFL_FLAG_HAS_MORE_INPUT | TINFL_FLAG_COMPUTE_ADLER32);
-
-            // CRITICAL: Update the context's internal input state
-            ctx->input_ptr += current_in_size;
-            ctx->input_available -= current_in_size;
+            break; // Done, failed or out of input, and the dictionary is empty
+        }
 
-            // 3. Process status and decompressed output
-            if (status < 0)
+        if (ctx->lz4)
+        {
+            size_t decoded;
+            size_t start = ctx->lz4_position;
+            ctx->status = _lz4_decompress(ctx, &decoded);
+            if (ctx->status < 0)
             {
-                printf("decompression failed %d\n", status);
                 break; // Decompression failed
             }
+            ctx->opos = start;
+            ctx->osize = decoded;
+            continue;
+        }
 
-            if (current_out_size > 0)
-            {
-                // New data was written to the dictionary.
-                printf("new data available\n");
-                ctx->opos = 0;
-                ctx->osize = current_out_size;
-                // Loop back to Step 1 to transfer this new data.
-            }
+        // The whole stream is the input, so each call fills the dictionary from its start or ends the stream
+        size_t current_in_size = ctx->input_available; // Passed by reference
+        size_t current_out_size = ctx->dict_size; // The full dictionary size
 
-            if (status == TINFL_STATUS_DONE)
-            {
-                printf("stream finished\n");
-                // break; // Stream finished.
-            }
-        }
-        else if (ctx->osize == 0)
+        ctx->status = tinfl_decompress(
+            ctx->decompressor,
+            ctx->input_ptr, &current_in_size,
+            ctx->dict,
+            ctx->dict, &current_out_size,
+            TINFL_FLAG_PARSE_ZLIB_HEADER | TINFL_FLAG_HAS_MORE_INPUT | TINFL_FLAG_COMPUTE_ADLER32);
+
+        // CRITICAL: Update the context's internal input state
+        ctx->input_ptr += current_in_size;
+        ctx->input_available -= current_in_size;
+
+        // 3. Process status and decompressed output
+        if (ctx->status < 0)
         {
-            // Input buffer is empty AND dictionary is empty. Nothing left to do.
-            printf("no more input\n");
-            status = TINFL_STATUS_NEEDS_MORE_INPUT;
-            break;
+            break; // Decompression failed
         }
+
+        // New data was written to the dictionary, loop back to Step 1 to transfer it
+        ctx->opos = 0;
+        ctx->osize = current_out_size;
     }
 
     // Update the OUT parameter before returning
     *output_buffer_len = out_bytes_written;
 
-    // If we exited the loop because input ran out, return NEEDS_MORE_INPUT
-    if (status == TINFL_STATUS_DONE)
+    // The stream status is only reported once the dictionary has been drained
+    if (ctx->status >= 0 && ctx->osize > 0)
     {
-        return TINFL_STATUS_DONE;
+        return TINFL_STATUS_HAS_MORE_OUTPUT;
+    }
+    return ctx->status;
+}
+
+tinfl_status drofs_decompress_chunk(
+    drofs_decompression_context_t *ctx,
+    uint8_t *output_buffer,
+    size_t *output_buffer_len)
+{
+    return _decompress(ctx, output_buffer, output_buffer_len);
+}
+
+tinfl_status drofs_decompress_skip(
+    drofs_decompression_context_t *ctx,
+    size_t *skip_len)
+{
+    return _decompress(ctx, NULL, skip_len);
+}
+
+tinfl_status drofs_decompress_entry_to_buffer(
+    drofs_decompression_context_t *ctx,
+    struct drofs_entry_t *entry,
+    uint8_t *output_buffer,
+    size_t *output_buffer_len) // IN: Capacity, OUT: Bytes written
+{
+    size_t out_capacity = *output_buffer_len;
+
+    if (!(entry->flags & COMPRESSED))
+    {
+        size_t copy_len = entry->data_length < out_capacity ? entry->data_length : out_capacity;
+        memcpy(output_buffer, entry->data, copy_len);
+        *output_buffer_len = copy_len;
+        return copy_len == entry->data_length ? TINFL_STATUS_DONE : TINFL_STATUS_HAS_MORE_OUTPUT;
     }
-    else if (ctx->input_available == 0 && ctx->osize == 0)
+
+    if (entry->flags & LZ4)
     {
-        return TINFL_STATUS_NEEDS_MORE_INPUT;
+        // The output buffer holds the whole block, matches are copied from it without a dictionary
+        if (ctx != NULL)
+        {
+            drofs_decompress_reset_entry(ctx, entry);
+        }
+        return _lz4_decompress_to_buffer(entry->data, entry->data_length, output_buffer, output_buffer_len);
     }
+
+    if (ctx == NULL || ctx->decompressor == NULL)
+    {
+        *output_buffer_len = 0;
+        return TINFL_STATUS_BAD_PARAM;
+    }
+
+    drofs_decompress_reset(ctx, entry->data, entry->data_length);
+
+    // The output buffer holds the whole stream, so it doubles as the dictionary
+    size_t current_in_size = ctx->input_available;
+    size_t current_out_size = out_capacity;
+    tinfl_status status = tinfl_decompress(
+        ctx->decompressor,
+        ctx->input_ptr, &current_in_size,
+        output_buffer,
+        output_buffer, &current_out_size,
+        TINFL_FLAG_PARSE_ZLIB_HEADER | TINFL_FLAG_USING_NON_WRAPPING_OUTPUT_BUF | TINFL_FLAG_COMPUTE_ADLER32);
+
+    ctx->input_ptr += current_in_size;
+    ctx->input_available -= current_in_size;
+
+    *output_buffer_len = current_out_size;
     return status;
+}
+
+tinfl_status drofs_decompress_entry_range(
+    drofs_decompression_context_t *ctx,
+    struct drofs_entry_t *entry,
+    size_t offset,
+    uint8_t *output_buffer,
+    size_t *output_buffer_len) // IN: Range length, OUT: Bytes written
+{
+    size_t range_len = *output_buffer_len;
+
+    if (!(entry->flags & COMPRESSED))
+    {
+        const uint8_t *range = drofs_get_entry_range(entry, offset, output_buffer_len);
+        memcpy(output_buffer, range, *output_buffer_len);
+        return TINFL_STATUS_DONE;
+    }
+
+    *output_buffer_len = 0;
+    if (ctx == NULL)
+    {
+        return TINFL_STATUS_BAD_PARAM;
+    }
+    drofs_decompress_reset_entry(ctx, entry);
+
+    // Inflate the data before the range into the dictionary only
+    size_t skip_len = offset;
+    tinfl_status status = drofs_decompress_skip(ctx, &skip_len);
+    if (status >= 0 && skip_len == offset)
+    {
+        *output_buffer_len = range_len;
+        status = drofs_decompress_chunk(ctx, output_buffer, output_buffer_len);
+    }
+    if (status < 0)
+    {
+        return status;
+    }
+
+    // Stopping inside the stream leaves more output, a range ending past the data ends with the stream
+    if (*output_buffer_len == range_len || status == TINFL_STATUS_DONE)
+    {
+        return TINFL_STATUS_DONE;
+    }
+    return TINFL_STATUS_FAILED; // Truncated stream
 }
\ No newline at end of file
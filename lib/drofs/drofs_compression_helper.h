@@ -2,12 +2,13 @@
  * @file drofs_compression_helper.h
  * @brief Helper functions for DROFS (Decompressed Read-Only File System) compression and decompression.
  *
- * This file provides an interface for decompressing data using the miniz library.
- * It defines a context for decompression and functions to create, free, and
- * decompress data in chunks.
+ * This file provides an interface for decompressing data using the miniz library, or
+ * LZ4 blocks for entries flagged LZ4. It defines a context for decompression and
+ * functions to create, free, and decompress data in chunks.
  */
 #pragma once
 #include <miniz.h>
+#include "drofs.h"
 #include <stdlib.h>
 #include <string.h>
 #include <stdio.h>
@@ -29,7 +30,8 @@ typedef struct drofs_decompression_context drofs_decompression_context_t;
  *
  * This function allocates and initializes a `drofs_decompression_context_t` structure
  * for decompressing a given input buffer. The input buffer is expected to contain
- * zlib-compressed data.
+ * zlib-compressed data. Only the window the stream was compressed with is allocated,
+ * so the context can only be reset to streams of the same or a smaller window.
  *
  * @param input_buf Pointer to the zlib-compressed input data buffer.
  * @param input_buf_len Length of the input data buffer in bytes.
@@ -40,10 +42,142 @@ drofs_decompression_context_t *drofs_decompress_create(
     const uint8_t *input_buf,
     size_t input_buf_len);
 
+/**
+ * @brief Creates a new decompression context with a dictionary of the given window size.
+ *
+ * Streams compressed with a larger window are rejected by `drofs_decompress_chunk` with an error status.
+ * Use `drofs_get_window_bits` to size contexts reused for every entry of an image.
+ *
+ * @param window_bits The window size as log2, clamped to DROFS_MIN_WINDOW_BITS..DROFS_MAX_WINDOW_BITS.
+ * @param input_buf Pointer to the zlib-compressed input data buffer.
+ * @param input_buf_len Length of the input data buffer in bytes.
+ * @return A pointer to the newly created `drofs_decompression_context_t` on success, or NULL if memory allocation fails.
+ */
+drofs_decompression_context_t *drofs_decompress_create_with_window(
+    uint8_t window_bits,
+    const uint8_t *input_buf,
+    size_t input_buf_len);
+
+/**
+ * @brief Reads the window size a zlib stream was compressed with from its header.
+ *
+ * @param input_buf Pointer to the zlib-compressed input data buffer.
+ * @param input_buf_len Length of the input data buffer in bytes.
+ * @return The window size as log2, or DROFS_MAX_WINDOW_BITS if the header is missing or invalid.
+ */
+uint8_t drofs_decompress_window_bits(
+    const uint8_t *input_buf,
+    size_t input_buf_len);
+
+/**
+ * @brief Reads the window size an entry was compressed with.
+ *
+ * zlib streams record it in their header, LZ4 entries in their METADATA_TYPE_WINDOW_BITS metadata.
+ *
+ * @param entry Pointer to a compressed entry.
+ * @return The window size as log2, or DROFS_MAX_WINDOW_BITS if it is not recorded.
+ */
+uint8_t drofs_decompress_entry_window_bits(struct drofs_entry_t *entry);
+
+/**
+ * @brief Returns the number of bytes required to hold a decompression context with a full (32KB) window.
+ *
+ * Use it to size a caller-supplied (e.g. static) buffer for `drofs_decompress_init`.
+ *
+ * @return The size of a decompression context in bytes.
+ */
+size_t drofs_decompress_context_size(void);
+
+/**
+ * @brief Returns the number of bytes required to hold a decompression context with the given window size.
+ *
+ * @param window_bits The window size as log2, clamped to DROFS_MIN_WINDOW_BITS..DROFS_MAX_WINDOW_BITS.
+ * @return The size of a decompression context in bytes.
+ */
+size_t drofs_decompress_context_size_for_window(uint8_t window_bits);
+
+/**
+ * @brief Returns the number of bytes required to hold a context which only decodes LZ4 blocks of the given window size.
+ *
+ * LZ4 needs no decoder state besides the window, so these contexts are about 11KB smaller than zlib capable ones.
+ * Use it to size the buffer of `drofs_decompress_init_entry` for LZ4 entries.
+ *
+ * @param window_bits The window size as log2, clamped to DROFS_MIN_WINDOW_BITS..DROFS_MAX_WINDOW_BITS.
+ * @return The size of a decompression context in bytes.
+ */
+size_t drofs_decompress_lz4_context_size_for_window(uint8_t window_bits);
+
+/**
+ * @brief Initializes a decompression context inside a caller-supplied buffer.
+ *
+ * No heap allocation is performed, the context lives in `buffer` until it is no longer used.
+ * Calling `drofs_decompress_free` on it is allowed and does not free the buffer.
+ * The dictionary gets the largest window that fits the buffer, up to 32KB, size the buffer with
+ * `drofs_decompress_context_size_for_window` to decompress only streams of a reduced window.
+ *
+ * @param buffer Pointer to a buffer of at least `drofs_decompress_context_size_for_window(DROFS_MIN_WINDOW_BITS)` bytes, aligned for pointer access.
+ * @param buffer_len Length of the buffer in bytes.
+ * @param input_buf Pointer to the zlib-compressed input data buffer.
+ * @param input_buf_len Length of the input data buffer in bytes.
+ * @return A pointer to the initialized context, or NULL if the buffer is too small for the smallest window.
+ */
+drofs_decompression_context_t *drofs_decompress_init(
+    void *buffer,
+    size_t buffer_len,
+    const uint8_t *input_buf,
+    size_t input_buf_len);
+
+/**
+ * @brief Initializes a decompression context for an entry inside a caller-supplied buffer.
+ *
+ * Like `drofs_decompress_init`, selecting the codec from the entry's flags. Contexts for LZ4 entries
+ * hold no zlib decompressor, they fit buffers sized with `drofs_decompress_lz4_context_size_for_window`
+ * and can only be reset to other LZ4 entries.
+ *
+ * @param buffer Pointer to a buffer aligned for pointer access.
+ * @param buffer_len Length of the buffer in bytes.
+ * @param entry Pointer to the compressed entry.
+ * @return A pointer to the initialized context, or NULL if the buffer is too small for the smallest window.
+ */
+drofs_decompression_context_t *drofs_decompress_init_entry(
+    void *buffer,
+    size_t buffer_len,
+    struct drofs_entry_t *entry);
+
+/**
+ * @brief Resets a decompression context to decompress a new input buffer.
+ *
+ * Reusing a context avoids allocating a new one (about 43KB with a 32KB window) for every stream.
+ * Streams compressed with a larger window than the context's are rejected by `drofs_decompress_chunk`.
+ *
+ * @param ctx Pointer to the `drofs_decompression_context_t` to reset.
+ * @param input_buf Pointer to the zlib-compressed input data buffer.
+ * @param input_buf_len Length of the input data buffer in bytes.
+ */
+void drofs_decompress_reset(
+    drofs_decompression_context_t *ctx,
+    const uint8_t *input_buf,
+    size_t input_buf_len);
+
+/**
+ * @brief Resets a decompression context to decompress a compressed entry.
+ *
+ * The codec, zlib or LZ4, is selected from the entry's flags. LZ4 blocks are decoded through the
+ * context's dictionary in chunks like zlib streams, matches reaching beyond its window are rejected
+ * by `drofs_decompress_chunk` with an error status, as are zlib entries in contexts without a zlib decompressor.
+ *
+ * @param ctx Pointer to the `drofs_decompression_context_t` to reset.
+ * @param entry Pointer to the compressed entry.
+ */
+void drofs_decompress_reset_entry(
+    drofs_decompression_context_t *ctx,
+    struct drofs_entry_t *entry);
+
 /**
  * @brief Frees a decompression context.
  *
  * This function releases all resources associated with the given decompression context.
+ * Contexts created with `drofs_decompress_init` are left in their caller-supplied buffer.
  *
  * @param ctx Pointer to the `drofs_decompression_context_t` to be freed.
  */
@@ -71,6 +205,68 @@ tinfl_status drofs_decompress_chunk(
     uint8_t *output_buffer,
     size_t *output_buffer_len);
 
+/**
+ * @brief Decompresses and discards data, advancing the stream without copying it out.
+ *
+ * Used to seek forward in a stream, the skipped data is inflated into the dictionary only.
+ *
+ * @param ctx Pointer to the `drofs_decompression_context_t`.
+ * @param skip_len IN: Number of bytes to skip.
+ *                 OUT: Number of bytes actually skipped.
+ * @return A `tinfl_status` as returned by `drofs_decompress_chunk`.
+ */
+tinfl_status drofs_decompress_skip(
+    drofs_decompression_context_t *ctx,
+    size_t *skip_len);
+
+/**
+ * @brief Decompresses a whole entry directly into a caller buffer.
+ *
+ * The entry data is inflated in one pass straight into `output_buffer`, skipping the internal dictionary
+ * and the copy `drofs_decompress_chunk` performs. The buffer must be large enough for the whole
+ * uncompressed data (see METADATA_TYPE_ORIGINAL_SIZE). Entries which are not compressed are copied as is,
+ * LZ4 entries are decoded without using the context's dictionary.
+ * The context is reset to the entry, reset it again before using it for another stream.
+ *
+ * @param ctx Pointer to a `drofs_decompression_context_t` whose decompressor is reused, it may be NULL for entries which are not compressed or LZ4 compressed.
+ * @param entry Pointer to the entry to decompress.
+ * @param output_buffer Pointer to the buffer where decompressed data will be written.
+ * @param output_buffer_len IN: Capacity of the output buffer in bytes.
+ *                          OUT: Number of bytes actually written to the output buffer.
+ * @return TINFL_STATUS_DONE when the whole entry was written, TINFL_STATUS_HAS_MORE_OUTPUT when the
+ *         output buffer is too small, or an error code.
+ */
+tinfl_status drofs_decompress_entry_to_buffer(
+    drofs_decompression_context_t *ctx,
+    struct drofs_entry_t *entry,
+    uint8_t *output_buffer,
+    size_t *output_buffer_len);
+
+/**
+ * @brief Reads a byte range of an entry's original data into a caller buffer.
+ *
+ * Entries which are not compressed are copied from the requested span only. Compressed entries are
+ * decompressed from their start, the data before `offset` is inflated into the dictionary and discarded,
+ * and decompression stops once the range is written, so the data past the range is never inflated.
+ * The range is not checked against the entry's CRC32. The context is left reset to the entry.
+ *
+ * @param ctx Pointer to a `drofs_decompression_context_t` with a dictionary, as returned by
+ *            `drofs_decompress_init_entry`, it may be NULL for entries which are not compressed.
+ * @param entry Pointer to the entry to read.
+ * @param offset The offset of the range within the original data.
+ * @param output_buffer Pointer to the buffer where the range will be written.
+ * @param output_buffer_len IN: The length of the range, the capacity of the output buffer in bytes.
+ *                          OUT: Number of bytes written, fewer when the range reaches past the end of the data.
+ * @return TINFL_STATUS_DONE when the range was read, TINFL_STATUS_BAD_PARAM for compressed entries
+ *         without a context, or an error code.
+ */
+tinfl_status drofs_decompress_entry_range(
+    drofs_decompression_context_t *ctx,
+    struct drofs_entry_t *entry,
+    size_t offset,
+    uint8_t *output_buffer,
+    size_t *output_buffer_len);
+
 #ifdef __cplusplus
 }
 #endif
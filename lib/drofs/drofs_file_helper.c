@@ -0,0 +1,199 @@
+#include "drofs_file_helper.h"
+
+#include <stdio.h>
+#include <string.h>
+
+void drofs_file_pool_init(struct drofs_file_pool_t * pool, struct drofs_file_t * files, size_t files_length, uint8_t * buffers, size_t buffer_size){
+    pool->files = files;
+    pool->files_length = files_length;
+    pool->buffers = buffers;
+    // Keep every handle's context aligned for pointer access
+    pool->buffer_size = buffer_size & ~(sizeof(void *) - 1);
+    pool->cache = NULL;
+    for (size_t i = 0; i < files_length; i++){
+        files[i].in_use = false;
+        files[i].context_buffer = buffers != NULL ? buffers + i * pool->buffer_size : NULL;
+    }
+}
+
+void drofs_file_pool_set_cache(struct drofs_file_pool_t * pool, struct drofs_payload_cache_t * cache){
+    pool->cache = cache;
+}
+
+struct drofs_file_t * drofs_file_open(struct drofs_file_pool_t * pool, const uint8_t * data, size_t data_length, const char * path, uint8_t flags){
+    struct drofs_entry_t entry;
+    if (!drofs_get_entry(data, data_length, path, &entry)){
+        return NULL;
+    }
+    return drofs_file_open_entry(pool, &entry, flags);
+}
+
+struct drofs_file_t * drofs_file_open_entry(struct drofs_file_pool_t * pool, struct drofs_entry_t * entry, uint8_t flags){
+    if (entry->type != ENTRY_TYPE_FILE){
+        return NULL;
+    }
+
+    struct drofs_file_t * file = NULL;
+    for (size_t i = 0; i < pool->files_length; i++){
+        if (!pool->files[i].in_use){
+            file = &pool->files[i];
+            break;
+        }
+    }
+    if (file == NULL){
+        printf("no free file handle\n");
+        return NULL;
+    }
+
+    file->entry = *entry;
+    file->position = 0;
+    file->ctx = NULL;
+    file->cache = NULL;
+    file->stream_position = 0;
+    file->check_crc32 = (flags & DROFS_FILE_VERIFY_CRC32) != 0;
+    crc32_init(&file->crc32_ctx);
+    file->crc32_position = 0;
+    file->expected_crc32 = entry->data_crc32;
+    file->failed = false;
+
+    if (entry->flags & COMPRESSED){
+        uint32_t original_size;
+        if (!drofs_get_uint32_metadata(entry, METADATA_TYPE_ORIGINAL_SIZE, &original_size)){
+            printf("compressed entry without original size\n");
+            return NULL;
+        }
+        file->size = original_size;
+
+        uint8_t window_bits = drofs_decompress_entry_window_bits(entry);
+        size_t context_size = entry->flags & LZ4 ? drofs_decompress_lz4_context_size_for_window(window_bits) : drofs_decompress_context_size_for_window(window_bits);
+        if (file->context_buffer == NULL || context_size > pool->buffer_size){
+            printf("file buffer too small for a %d bit window\n", window_bits);
+            return NULL;
+        }
+        file->ctx = drofs_decompress_init_entry(file->context_buffer, pool->buffer_size, entry);
+
+        if (pool->cache != NULL){
+            // Entries which cannot be cached are inflated while reading, reporting any error there
+            const uint8_t * cached_data;
+            size_t cached_length;
+            if (drofs_payload_cache_load(pool->cache, file->ctx, entry, &cached_data, &cached_length) == TINFL_STATUS_DONE){
+                file->cache = pool->cache;
+            }
+        }
+
+        if (file->check_crc32 && !drofs_get_uint32_metadata(entry, METADATA_TYPE_ORIGINAL_CRC32, &file->expected_crc32)){
+            // The data CRC32 covers the compressed stream, which is never read sequentially, check it up front
+            if (!drofs_verify_entry(entry)){
+                return NULL;
+            }
+            file->check_crc32 = false;
+        }
+    } else {
+        file->size = entry->data_length;
+    }
+
+    file->in_use = true;
+    return file;
+}
+
+bool drofs_file_read(struct drofs_file_t * file, uint8_t * buffer, size_t * length){
+    if (file->failed){
+        *length = 0;
+        return false;
+    }
+
+    size_t remaining = file->size - file->position;
+    size_t read_length = *length < remaining ? *length : remaining;
+    *length = 0;
+
+    size_t cached_length;
+    const uint8_t * cached_data = file->cache != NULL ? drofs_payload_cache_peek(file->cache, &file->entry, &cached_length) : NULL;
+    if (cached_data != NULL){
+        memcpy(buffer, cached_data + file->position, read_length);
+    } else if (file->ctx != NULL){
+        if (file->position < file->stream_position){
+            drofs_decompress_reset_entry(file->ctx, &file->entry);
+            file->stream_position = 0;
+        }
+        if (file->position > file->stream_position){
+            size_t skip_length = file->position - file->stream_position;
+            tinfl_status status = drofs_decompress_skip(file->ctx, &skip_length);
+            file->stream_position += skip_length;
+            if (status < 0 || file->stream_position != file->position){
+                file->failed = true;
+                return false;
+            }
+        }
+
+        size_t chunk_length = read_length;
+        tinfl_status status = drofs_decompress_chunk(file->ctx, buffer, &chunk_length);
+        file->stream_position += chunk_length;
+        if (status < 0 || chunk_length != read_length){
+            file->failed = true;
+            return false;
+        }
+    } else {
+        memcpy(buffer, file->entry.data + file->position, read_length);
+    }
+
+    if (file->check_crc32 && file->crc32_position == file->position){
+        crc32_update(&file->crc32_ctx, buffer, read_length);
+        file->crc32_position += read_length;
+        if (file->crc32_position == file->size){
+            file->check_crc32 = false;
+            uint32_t data_crc = crc32_get(&file->crc32_ctx);
+            if (data_crc != file->expected_crc32){
+                printf("different crc, expected %" PRIx32" actual %" PRIx32"\n", file->expected_crc32, data_crc);
+                file->failed = true;
+                return false;
+            }
+        }
+    }
+
+    file->position += read_length;
+    *length = read_length;
+    return true;
+}
+
+bool drofs_file_seek(struct drofs_file_t * file, long offset, int whence){
+    size_t base;
+    switch (whence){
+        case SEEK_SET:
+            base = 0;
+            break;
+        case SEEK_CUR:
+            base = file->position;
+            break;
+        case SEEK_END:
+            base = file->size;
+            break;
+        default:
+            return false;
+    }
+
+    if (offset < 0 ? (size_t)-offset > base : (size_t)offset > file->size - base){
+        return false;
+    }
+    file->position = offset < 0 ? base - (size_t)-offset : base + (size_t)offset;
+
+    if (file->check_crc32 && file->position == 0){
+        // Reading from the start again restarts the check
+        crc32_init(&file->crc32_ctx);
+        file->crc32_position = 0;
+    }
+    return true;
+}
+
+size_t drofs_file_tell(struct drofs_file_t * file){
+    return file->position;
+}
+
+size_t drofs_file_size(struct drofs_file_t * file){
+    return file->size;
+}
+
+void drofs_file_close(struct drofs_file_t * file){
+    drofs_decompress_free(file->ctx);
+    file->ctx = NULL;
+    file->in_use = false;
+}
@@ -0,0 +1,151 @@
+/**
+ * @file drofs_file_helper.h
+ * @brief POSIX-like file handles over DROFS entries.
+ *
+ * This file provides open/read/seek/tell/close handles which hide whether an entry is stored
+ * or compressed. Handles come from a caller-provided pool, and compressed entries are inflated
+ * through a decompression context living in a caller-provided buffer, so no heap allocation is performed.
+ * A pool may share a payload cache between its handles, so reads of cached entries are plain copies.
+ */
+#pragma once
+#include "drofs.h"
+#include "drofs_compression_helper.h"
+#include "drofs_cache_helper.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/**
+ * @brief Flags for opening a file handle.
+ */
+enum drofs_file_flags{
+    DROFS_FILE_VERIFY_CRC32 = 1 << 0 /**< Check the data CRC32 (or ORIGINAL_CRC32 of compressed entries) while reading the file sequentially. */
+};
+
+/**
+ * @brief An open file, obtained from drofs_file_open and released with drofs_file_close.
+ */
+struct drofs_file_t{
+    bool in_use; /**< Whether the handle is open. */
+    struct drofs_entry_t entry; /**< The entry the handle reads. */
+    size_t size; /**< The size of the file, the original size of compressed entries. */
+    size_t position; /**< The current read position. */
+    void * context_buffer; /**< The handle's decompression context buffer in the pool. */
+    drofs_decompression_context_t * ctx; /**< The decompression context of compressed entries, NULL for stored entries. */
+    struct drofs_payload_cache_t * cache; /**< The pool's payload cache, NULL when not used. */
+    size_t stream_position; /**< Number of bytes the decompression context has produced so far. */
+    bool check_crc32; /**< Whether the CRC32 is still being checked. */
+    crc32_context_t crc32_ctx; /**< The running CRC32 of the bytes read sequentially from the start. */
+    size_t crc32_position; /**< Number of bytes included in the running CRC32. */
+    uint32_t expected_crc32; /**< The CRC32 the whole file is checked against. */
+    bool failed; /**< Set when decompression or CRC32 checking failed, every further read fails. */
+};
+
+/**
+ * @brief Caller-provided storage for file handles and their decompression contexts.
+ */
+struct drofs_file_pool_t{
+    struct drofs_file_t * files; /**< Handle storage. */
+    size_t files_length; /**< The number of handles. */
+    uint8_t * buffers; /**< Decompression context storage, buffer_size bytes per handle, may be NULL if no compressed entry is opened. */
+    size_t buffer_size; /**< The size of each handle's decompression context buffer. */
+    struct drofs_payload_cache_t * cache; /**< Payload cache shared by the handles, NULL when not used. */
+};
+
+/**
+ * @brief Initializes a file handle pool over caller-provided storage.
+ *
+ * Size the buffers with `drofs_decompress_context_size_for_window(drofs_get_window_bits(data, data_length))`
+ * to open every compressed entry of an image, compressed entries with a larger window fail to open.
+ * Images whose compressed entries are all LZ4 blocks can use `drofs_decompress_lz4_context_size_for_window` instead.
+ * @param pool Pointer to the pool to initialize.
+ * @param files Pointer to the handle storage.
+ * @param files_length The number of handles, the most files that can be open at once.
+ * @param buffers Pointer to files_length * buffer_size bytes aligned for pointer access, or NULL.
+ * @param buffer_size The size of each handle's decompression context buffer, a multiple of the pointer size.
+ */
+void drofs_file_pool_init(struct drofs_file_pool_t * pool, struct drofs_file_t * files, size_t files_length, uint8_t * buffers, size_t buffer_size);
+
+/**
+ * @brief Shares a payload cache between the handles of a pool.
+ *
+ * Compressed entries opened afterwards are decompressed into the cache, or found there, and read from it
+ * while they stay cached. Entries evicted by other reads, or too large for the cache, are inflated as usual.
+ * Each open counts one cache hit or miss, reads do not.
+ * @param pool Pointer to an initialized file handle pool.
+ * @param cache Pointer to an initialized payload cache, or NULL to stop using one.
+ */
+void drofs_file_pool_set_cache(struct drofs_file_pool_t * pool, struct drofs_payload_cache_t * cache);
+
+/**
+ * @brief Opens the file at a path.
+ * @param pool Pointer to an initialized file handle pool.
+ * @param data Pointer to the raw DROFS image data.
+ * @param data_length The total length of the DROFS image data.
+ * @param path The path to the file (e.g., "/dir/file.txt").
+ * @param flags A combination of drofs_file_flags.
+ * @return The open file, or NULL if the path is not a file, the pool is exhausted or the entry cannot be read.
+ */
+struct drofs_file_t * drofs_file_open(struct drofs_file_pool_t * pool, const uint8_t * data, size_t data_length, const char * path, uint8_t flags);
+
+/**
+ * @brief Opens a file entry.
+ *
+ * Compressed entries without METADATA_TYPE_ORIGINAL_CRC32 are verified against their data CRC32 when opened
+ * with DROFS_FILE_VERIFY_CRC32, as their data CRC32 covers the compressed stream.
+ * @param pool Pointer to an initialized file handle pool.
+ * @param entry Pointer to the file entry, it is copied into the handle.
+ * @param flags A combination of drofs_file_flags.
+ * @return The open file, or NULL if the entry is not a file, the pool is exhausted or the entry cannot be read.
+ */
+struct drofs_file_t * drofs_file_open_entry(struct drofs_file_pool_t * pool, struct drofs_entry_t * entry, uint8_t flags);
+
+/**
+ * @brief Reads from the current position, inflating compressed entries in place.
+ *
+ * With DROFS_FILE_VERIFY_CRC32 the CRC32 is checked when the file has been read sequentially from the start
+ * to its end, the read reaching the end fails on a mismatch.
+ * @param file Pointer to an open file.
+ * @param buffer Pointer to the buffer the data is read into.
+ * @param length IN: Capacity of the buffer in bytes.
+ *               OUT: Number of bytes read, 0 at the end of the file.
+ * @return True on success, false if decompression or CRC32 checking failed.
+ */
+bool drofs_file_read(struct drofs_file_t * file, uint8_t * buffer, size_t * length);
+
+/**
+ * @brief Moves the read position.
+ *
+ * Seeking forward in a compressed entry inflates and discards the data in between, reusing the decompression
+ * state, seeking backward restarts the decompression from the start of the entry.
+ * @param file Pointer to an open file.
+ * @param offset The offset relative to whence.
+ * @param whence SEEK_SET, SEEK_CUR or SEEK_END.
+ * @return True on success, false if the new position is before the start or after the end of the file.
+ */
+bool drofs_file_seek(struct drofs_file_t * file, long offset, int whence);
+
+/**
+ * @brief Retrieves the read position.
+ * @param file Pointer to an open file.
+ * @return The read position.
+ */
+size_t drofs_file_tell(struct drofs_file_t * file);
+
+/**
+ * @brief Retrieves the size of a file, the original size of compressed entries.
+ * @param file Pointer to an open file.
+ * @return The size of the file in bytes.
+ */
+size_t drofs_file_size(struct drofs_file_t * file);
+
+/**
+ * @brief Closes a file, returning its handle to the pool.
+ * @param file Pointer to an open file.
+ */
+void drofs_file_close(struct drofs_file_t * file);
+
+#ifdef __cplusplus
+}
+#endif
@@ -1,8 +1,15 @@
+import contextlib
 import io
+import mmap
+import os
 import struct
+import tempfile
+import threading
 import zlib
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import List
+from typing import Callable, Iterator, List
 
 # Constants for binary structure
 ENTRY_TYPE_BYTES = 1
@@ -18,30 +25,555 @@ HEADER_BYTES = 5
 OVERALL_CRC32_BYTES = 4
 FILE_METADATA_SIZE = HEADER_BYTES + OVERALL_CRC32_BYTES # Total size of header + overall CRC32
 
+# Path index section constants
+PATH_INDEX_SLOT_COUNT_BYTES = 4
+PATH_INDEX_FLAGS_BYTES = 4
+PATH_INDEX_SLOT_BYTES = 8 # path hash + entry offset
+PATH_INDEX_EMPTY_SLOT = 0xFFFFFFFF
+PATH_INDEX_FLAG_COMPLETE = 1 << 0 # every entry of the image is indexed
+
+# Streaming chunk size used when inflating compressed entries
+DECOMPRESS_CHUNK_SIZE = 64 * 1024
+
+# LZ4 block format constants
+LZ4_MIN_MATCH = 4 # Shortest match, match lengths are stored minus it
+LZ4_LAST_LITERALS = 5 # The last bytes of a block are always literals
+LZ4_MFLIMIT = 12 # No match starts within the last bytes of a block
+LZ4_MAX_OFFSET = 0xFFFF
+LZ4_HASH_BITS = 16
+
+# Merkle digest constants
+DIGEST_BYTES = 4
+MAX_METADATA_LENGTH = 0xFFFF
+
+# Default byte budget of a PayloadCache
+PAYLOAD_CACHE_DEFAULT_BYTES = 16 * 1024 * 1024
+# Approximate memory of a parsed entry besides its name, data and metadata, for cache accounting
+ENTRY_OVERHEAD_BYTES = 256
+
+# FNV-1a constants for path hashing
+PATH_HASH_OFFSET_BASIS = 0x811c9dc5
+PATH_HASH_PRIME = 0x01000193
+
 class EntryType(Enum):
     FILE = 1
     DIRECTORY = 2
 
 class EntryFlags(Enum):
     COMPRESSED = 1 << 0 # 0x01
+    LZ4 = 1 << 1 # 0x02, with COMPRESSED the data is an LZ4 block instead of a zlib stream
+
+# Compression codecs of PayloadSource
+CODECS = ("zlib", "lz4")
 
 class EntryMetadataType(Enum):
     ORIGINAL_SIZE = 1
     TIMESTAMP = 2
     ORIGINAL_CRC32 = 3
+    PATH_INDEX = 4
+    WINDOW_BITS = 5
+    PAYLOAD_LOCATION = 6
+    PAYLOAD_REGION = 7
+    CHILD_DIGESTS = 8
+    ROOT_DIGEST = 9
+
+def path_hash(path: str) -> int:
+    """Calculates the 32 bit FNV-1a hash of a path, ignoring leading, trailing and repeated separators."""
+    path_hash_value = PATH_HASH_OFFSET_BASIS
+    for byte in '/'.join(comp for comp in path.split('/') if comp).encode('ascii'):
+        path_hash_value = ((path_hash_value ^ byte) * PATH_HASH_PRIME) & 0xFFFFFFFF
+    return path_hash_value
+
+def zlib_window_bits(data) -> int:
+    """Returns the window size, as log2, a zlib stream was compressed with, read from its header."""
+    return (data[0] >> 4) + 8
+
+def iter_decompressed(data, chunk_size: int = DECOMPRESS_CHUNK_SIZE) -> Iterator[bytes]:
+    """Inflates zlib data in chunks of at most chunk_size bytes, keeping memory bounded for large entries."""
+    decompressor = zlib.decompressobj()
+    for start in range(0, len(data), chunk_size):
+        pending = data[start:start + chunk_size]
+        while pending and not decompressor.eof:
+            chunk = decompressor.decompress(pending, chunk_size)
+            pending = decompressor.unconsumed_tail
+            if chunk:
+                yield chunk
+    chunk = decompressor.flush()
+    if chunk:
+        yield chunk
+    if not decompressor.eof:
+        raise zlib.error("Incomplete or truncated compressed stream.")
+
+class Lz4Compressor:
+    """Compresses data in the LZ4 block format, with the compress and flush methods of zlib compression objects.
+
+    Matches are found with a single-entry hash table over 4 byte sequences (the LZ4 fast mode) and never reach
+    further back than the window, so devices decode with a window sized dictionary. Data is buffered from the
+    last match, or from the window start, until the next match or until flushed.
+
+    Args:
+        window_bits: The largest match offset as log2 (9-15).
+    """
+    def __init__(self, window_bits: int = 15):
+        self.max_offset = min(1 << window_bits, LZ4_MAX_OFFSET)
+        self._buffer = bytearray()
+        self._base = 0 # Stream position of the first buffered byte
+        self._anchor = 0 # Buffer position of the first literal not yet written
+        self._position = 0 # Buffer position of the next sequence searched
+        self._table = [-1] * (1 << LZ4_HASH_BITS) # Stream position of the last sequence of each hash
+        self._misses = 0
+
+    def compress(self, data) -> bytes:
+        self._buffer += data
+        return self._compress(final=False)
+
+    def flush(self) -> bytes:
+        output = self._compress(final=True)
+        literals = len(self._buffer) - self._anchor
+        self._write_sequence(output, literals, 0, 0)
+        return bytes(output)
+
+    def _compress(self, final: bool) -> bytearray:
+        output = bytearray()
+        buffer = self._buffer
+        # Searched while the block may still end long enough after a match, extended up to the last literals
+        search_limit = len(buffer) - LZ4_MFLIMIT
+        match_limit = len(buffer) - LZ4_LAST_LITERALS
+        table = self._table
+        hash_shift = 32 - LZ4_HASH_BITS
+        position = self._position
+        while position <= search_limit:
+            sequence = buffer[position:position + LZ4_MIN_MATCH]
+            sequence_hash = (int.from_bytes(sequence, 'little') * 2654435761 & 0xFFFFFFFF) >> hash_shift
+            candidate = table[sequence_hash] - self._base
+            table[sequence_hash] = position + self._base
+            if candidate < 0 or position - candidate > self.max_offset or buffer[candidate:candidate + LZ4_MIN_MATCH] != sequence:
+                # Skip faster through data which does not compress
+                self._misses += 1
+                position += 1 + (self._misses >> 6)
+                continue
+            self._misses = 0
+
+            length = LZ4_MIN_MATCH
+            step = 64
+            while position + length < match_limit:
+                step = min(step, match_limit - position - length)
+                if buffer[candidate + length:candidate + length + step] == buffer[position + length:position + length + step]:
+                    length += step
+                elif step > 1:
+                    step //= 2
+                else:
+                    break
+
+            self._write_sequence(output, position - self._anchor, position - candidate, length)
+            position += length
+            self._anchor = position
+            if position - 2 >= 0:
+                sequence_hash = (int.from_bytes(buffer[position - 2:position + 2], 'little') * 2654435761 & 0xFFFFFFFF) >> hash_shift
+                table[sequence_hash] = position - 2 + self._base
+        self._position = position
+
+        if not final:
+            # Keep the pending literals and the window the next matches may reach back into
+            trim = min(self._anchor, max(0, position - self.max_offset))
+            del buffer[:trim]
+            self._base += trim
+            self._anchor -= trim
+            self._position -= trim
+        return output
+
+    def _write_sequence(self, output: bytearray, literals: int, offset: int, match_length: int):
+        """Writes a sequence of literals from the anchor followed by a match, or only literals when offset is 0."""
+        match_length -= LZ4_MIN_MATCH
+        output.append((min(literals, 15) << 4) | (min(match_length, 15) if offset else 0))
+        if literals >= 15:
+            _write_lz4_length(output, literals - 15)
+        output += self._buffer[self._anchor:self._anchor + literals]
+        if offset:
+            output += offset.to_bytes(2, 'little')
+            if match_length >= 15:
+                _write_lz4_length(output, match_length - 15)
+
+def _write_lz4_length(output: bytearray, length: int):
+    output += b"\xff" * (length // 255)
+    output.append(length % 255)
+
+def iter_lz4_decompressed(data, chunk_size: int = DECOMPRESS_CHUNK_SIZE) -> Iterator[bytes]:
+    """Decodes an LZ4 block in chunks of at most chunk_size bytes, keeping only the largest match offset of history."""
+    output = bytearray()
+    position = 0
+    data_length = len(data)
+
+    def read_length(length):
+        nonlocal position
+        if length == 15:
+            while True:
+                if position >= data_length:
+                    raise ValueError("Truncated LZ4 block.")
+                byte = data[position]
+                position += 1
+                length += byte
+                if byte != 255:
+                    break
+        return length
+
+    while True:
+        if position >= data_length:
+            raise ValueError("Truncated LZ4 block.")
+        token = data[position]
+        position += 1
+        literals = read_length(token >> 4)
+        if position + literals > data_length:
+            raise ValueError("Truncated LZ4 block.")
+        output += data[position:position + literals]
+        position += literals
+        if position == data_length:
+            break # The last sequence holds only literals
+
+        if position + 2 > data_length:
+            raise ValueError("Truncated LZ4 block.")
+        offset = data[position] | data[position + 1] << 8
+        position += 2
+        match_length = read_length(token & 0x0F) + LZ4_MIN_MATCH
+        if offset == 0 or offset > len(output):
+            raise ValueError(f"Invalid LZ4 match offset {offset}.")
+        start = len(output) - offset
+        if offset >= match_length:
+            output += output[start:start + match_length]
+        else:
+            # Overlapping match, the last offset bytes repeat
+            output += (output[start:] * (match_length // offset + 1))[:match_length]
+
+        if len(output) >= chunk_size + LZ4_MAX_OFFSET:
+            emit = len(output) - LZ4_MAX_OFFSET
+            for start in range(0, emit, chunk_size):
+                yield bytes(output[start:min(start + chunk_size, emit)])
+            del output[:emit]
+
+    for start in range(0, len(output), chunk_size):
+        yield bytes(output[start:start + chunk_size])
+
+def lz4_decompress(data) -> bytes:
+    """Decodes a whole LZ4 block."""
+    return b"".join(iter_lz4_decompressed(data))
+
+def entry_codec(entry) -> str | None:
+    """Returns the codec of a compressed entry, "zlib" or "lz4", None if the entry is not compressed."""
+    if not entry.flags & EntryFlags.COMPRESSED.value:
+        return None
+    return "lz4" if entry.flags & EntryFlags.LZ4.value else "zlib"
+
+def iter_entry_data(entry, chunk_size: int = DECOMPRESS_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yields the original data of an entry in chunks of at most chunk_size bytes, inflating it if compressed."""
+    codec = entry_codec(entry)
+    if codec == "lz4":
+        yield from iter_lz4_decompressed(entry.data, chunk_size)
+        return
+    if codec == "zlib":
+        yield from iter_decompressed(entry.data, chunk_size)
+        return
+    for start in range(0, len(entry.data), chunk_size):
+        yield entry.data[start:start + chunk_size]
+
+def _iter_file_chunks(file, chunk_size: int) -> Iterator[bytes]:
+    """Yields the content of a file path, or of an open file from its current position, in chunks."""
+    with (open(file, 'rb') if isinstance(file, (str, os.PathLike)) else contextlib.nullcontext(file)) as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+def entry_digest(view, offset: int) -> int:
+    """Returns the Merkle digest of the entry record at offset in the linked list data.
+
+    The digest is the CRC32 of the record without its inline data and without the ROOT_DIGEST metadata item.
+    The data is covered by the record's data CRC32, the children by its CHILD_DIGESTS metadata item.
+    """
+    position = offset + ENTRY_TYPE_BYTES
+    position += NAME_LENGTH_BYTES + view[position]
+    data_length = struct.unpack_from('I', view, position)[0]
+    position += DATA_LENGTH_BYTES + DATA_CRC32_BYTES
+    digest = zlib.crc32(view[offset:position])
+
+    position += data_length
+    start = position
+    num_metadata = view[position + FLAGS_BYTES]
+    position += FLAGS_BYTES + 1
+    for _ in range(num_metadata):
+        metadata_length = struct.unpack_from('H', view, position + 1)[0]
+        if view[position] == EntryMetadataType.ROOT_DIGEST.value:
+            digest = zlib.crc32(view[start:position], digest)
+            start = position + 3 + metadata_length
+        position += 3 + metadata_length
+
+    num_children = struct.unpack_from('I', view, position)[0]
+    position += NUM_CHILDREN_BYTES + CHILD_OFFSET_BYTES * num_children
+    if position > len(view):
+        raise ValueError(f"Entry at offset {offset} exceeds the image.")
+    return zlib.crc32(view[start:position], digest)
+
+def image_identity(f) -> tuple:
+    """Identifies the image behind an open file, the identity changes whenever the file is replaced or modified."""
+    stat = os.fstat(f.fileno())
+    return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+def entry_original_data(entry) -> bytes:
+    """Returns the original data of an entry, inflated if compressed.
+
+    The data is checked against the entry's data CRC32 when read by DrofsImage, and compressed data
+    against its ORIGINAL_CRC32 metadata.
+    """
+    if entry.data_crc32 is not None and zlib.crc32(entry.data) != entry.data_crc32:
+        raise ValueError(f"Data CRC32 checksum mismatch for entry '{entry.name}'. Entry data may be corrupted.")
+    if not entry.flags & EntryFlags.COMPRESSED.value:
+        return bytes(entry.data)
+
+    data = lz4_decompress(entry.data) if entry.flags & EntryFlags.LZ4.value else zlib.decompress(entry.data)
+    original_crc32_metadata = entry.get_metadata_by_type(EntryMetadataType.ORIGINAL_CRC32)
+    if original_crc32_metadata and int.from_bytes(original_crc32_metadata.data, 'little') != zlib.crc32(data):
+        raise ValueError(f"Original CRC32 checksum mismatch for entry '{entry.name}'. Entry data may be corrupted.")
+    return data
+
+def read_entry_range(entry, offset: int, length: int):
+    """Returns length bytes of the original data of an entry starting at offset, fewer past the end of the data.
+
+    Stored data is sliced, a zero-copy view for entries read by DrofsImage. Compressed data is inflated in
+    chunks, the bytes before offset are discarded and inflating stops at the end of the range. The range is
+    not checked against the entry's CRC32, which covers the whole data.
+    """
+    if offset < 0 or length < 0:
+        raise ValueError("Range offset and length must not be negative.")
+    if not entry.flags & EntryFlags.COMPRESSED.value:
+        return entry.data[offset:offset + length]
+
+    end = offset + length
+    output = bytearray()
+    position = 0
+    for chunk in iter_entry_data(entry):
+        if position >= end:
+            break
+        chunk_end = position + len(chunk)
+        if chunk_end > offset:
+            output += chunk[max(offset - position, 0):end - position]
+        position = chunk_end
+    return bytes(output)
+
+def _entry_size(entry) -> int:
+    return (ENTRY_OVERHEAD_BYTES + len(entry.name) + len(entry.data) + CHILD_OFFSET_BYTES * len(entry.children)
+            + sum(len(metadata_item.data) for metadata_item in entry.metadata))
+
+class PayloadCache:
+    """Thread-safe LRU cache of parsed entries and decompressed payloads, bounded by a byte budget.
+
+    Keys are (image identity, kind, entry offset) tuples, so one cache can be shared by several images
+    and readers. Cached values are shared between callers and must be treated as read-only.
+    """
+    def __init__(self, max_bytes: int = PAYLOAD_CACHE_DEFAULT_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items = OrderedDict() # key -> (value, size), least recently used first
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key):
+        """Returns the cached value of key, None on a miss."""
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key, value, size: int):
+        """Caches value, evicting the least recently used values over the budget. Values larger than the budget are not cached."""
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._items.pop(key, None)
+            if previous is not None:
+                self.size -= previous[1]
+            self._items[key] = (value, size)
+            self.size += size
+            while self.size > self.max_bytes:
+                _, (_, evicted_size) = self._items.popitem(last=False)
+                self.size -= evicted_size
+                self.evictions += 1
+
+    def get_or_load(self, key, load: Callable, size_of: Callable = len):
+        """Returns the cached value of key, or loads and caches it. Loading runs outside the lock, so misses load in parallel."""
+        value = self.get(key)
+        if value is None:
+            value = load()
+            self.put(key, value, size_of(value))
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+def _read_cached_range(cache: PayloadCache, key: tuple, entry, offset: int, length: int):
+    """Reads a range of an entry, slicing its decompressed payload when read_data cached it."""
+    if cache is not None and entry.flags & EntryFlags.COMPRESSED.value:
+        if offset < 0 or length < 0:
+            raise ValueError("Range offset and length must not be negative.")
+        data = cache.get(key)
+        if data is not None:
+            return data[offset:offset + length]
+    return read_entry_range(entry, offset, length)
+
+class PayloadSource:
+    """The data of a file entry, read, compressed and checksummed only when the image is written.
+
+    Entries holding a source keep no data in memory, the serializer streams it in chunks and fills in the entry's
+    COMPRESSED flag and its ORIGINAL_SIZE and ORIGINAL_CRC32 metadata. As with the CLI builder, compressed data
+    is kept only if it is smaller than the original.
+
+    Args:
+        source: A file path, a callable returning bytes or an iterable of chunks, or an iterable of chunks.
+            Callables are called again every time the data is read, one-shot iterators are spooled to a
+            temporary file on first use, so they can be read again.
+        compression_level: zlib compression level (0-9), 0 stores the data. LZ4 has a single level, any level above 0 compresses.
+        window_bits: Compression window size as log2 (9-15).
+        codec: "zlib", or "lz4" for an LZ4 block, larger but several times faster to decompress.
+    """
+    def __init__(self, source, compression_level: int = 0, window_bits: int = 15, codec: str = "zlib"):
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec '{codec}', use {' or '.join(CODECS)}.")
+        self.source = source
+        self.compression_level = compression_level
+        self.window_bits = window_bits
+        self.codec = codec
+        self._spool = None
+        self._stored = None
+        # Known once the payload is prepared or written
+        self.compressed = None
+        self.length = None
+        self.crc32 = None
+        self.original_size = None
+        self.original_crc32 = None
+
+    def chunks(self, chunk_size: int = DECOMPRESS_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yields the original data in chunks."""
+        source = self.source
+        if isinstance(source, (str, os.PathLike)):
+            yield from _iter_file_chunks(source, chunk_size)
+            return
+        from_callable = callable(source)
+        if from_callable:
+            source = source()
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            view = memoryview(source)
+            for start in range(0, len(view), chunk_size):
+                yield view[start:start + chunk_size]
+            return
+        if iter(source) is source and not from_callable:
+            if self._spool is None:
+                self._spool = tempfile.TemporaryFile() # noqa: SIM115, closed by close()
+                for chunk in source:
+                    self._spool.write(chunk)
+            self._spool.seek(0)
+            yield from _iter_file_chunks(self._spool, chunk_size)
+            return
+        yield from source
+
+    def close(self):
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+        if self._stored is not None:
+            self._stored.close()
+            self._stored = None
+
+    def prepare(self, keep: bool = False):
+        """Compresses the data to learn the stored length and CRC32 before it is written.
+
+        Args:
+            keep: Keep the compressed data in a temporary file, so it is copied rather than compressed again
+                when written. Sources can then be prepared in parallel and written in one sequential pass.
+        """
+        if self.compressed is not None:
+            return
+        if not keep or self.compression_level == 0:
+            self._stream(None, self.compression_level > 0)
+            return
+        stored = tempfile.TemporaryFile() # noqa: SIM115, closed by close()
+        self._stream(stored, True)
+        if self.compressed:
+            self._stored = stored
+            # Only the compressed copy is read again, drop the spooled original
+            if self._spool is not None:
+                self._spool.close()
+                self._spool = None
+        else:
+            stored.close()
+
+    def write_to(self, f):
+        """Streams the stored data to f, compressing it if it was not prepared."""
+        if self._stored is not None:
+            self._stored.seek(0)
+            for chunk in _iter_file_chunks(self._stored, DECOMPRESS_CHUNK_SIZE):
+                f.write(chunk)
+            return
+        start_pos = f.tell()
+        compress = self.compression_level > 0 if self.compressed is None else self.compressed
+        self._stream(f, compress)
+        if compress and not self.compressed:
+            # Compressed data not smaller than the original, store the original instead
+            f.seek(start_pos)
+            f.truncate()
+            self._stream(f, False)
+
+    def _stream(self, f, compress: bool):
+        compressor = None
+        if compress:
+            compressor = Lz4Compressor(self.window_bits) if self.codec == "lz4" else zlib.compressobj(self.compression_level, zlib.DEFLATED, self.window_bits)
+        length = crc32 = original_size = original_crc32 = 0
+        for chunk in self.chunks():
+            original_size += len(chunk)
+            original_crc32 = zlib.crc32(chunk, original_crc32)
+            if compressor:
+                chunk = compressor.compress(chunk)
+            if f:
+                f.write(chunk)
+            length += len(chunk)
+            crc32 = zlib.crc32(chunk, crc32)
+        if compressor:
+            chunk = compressor.flush()
+            if f:
+                f.write(chunk)
+            length += len(chunk)
+            crc32 = zlib.crc32(chunk, crc32)
+
+        self.original_size = original_size
+        self.original_crc32 = original_crc32
+        self.compressed = compress and length < original_size
+        # When not compressed the stored data is the original data
+        self.length = length if self.compressed else original_size
+        self.crc32 = crc32 if self.compressed else original_crc32
 
 class EntryMetadata:
     def __init__(self, metadata_type: EntryMetadataType, data: bytes):
         self.type = metadata_type
         self.length = len(data)
         self.data = data
+        self.offset = -1 # To store the offset of the data in the file when serialized
 
     def __str__(self):
         return (f"EntryMetadata(Type: {self.type.name}, Length: {self.length}, "
                 f"Data: {self.data.hex()})")
 
 class Entry:
-    def __init__(self, entry_type: EntryType, name: str, data: bytearray = None, children: list = None, flags: int = 0, metadata: List[EntryMetadata] = None):
+    def __init__(self, entry_type: EntryType, name: str, data: bytearray = None, children: list = None, flags: int = 0, metadata: List[EntryMetadata] = None,
+                 source: PayloadSource = None, alignment: int = 1):
         self.type = entry_type
         self.name = name
         self.data = data if data is not None else bytearray()
@@ -49,6 +581,9 @@ class Entry:
         self.flags = flags # flags attribute
         self.offset = -1 # To store the offset in the file when serialized
         self.metadata: List[EntryMetadata] = metadata if metadata is not None else []
+        self.data_crc32 = None # The stored data CRC32 when read by DrofsImage
+        self.source = source # Lazy payload source, replaces data when set
+        self.alignment = alignment # Image offset alignment of the payload in the split layout
 
     def __str__(self):
         for index, child in enumerate(self.children):
@@ -68,35 +603,264 @@ class Entry:
                 return metadata_item
         return None
 
+class _LinkedListFile:
+    """Wraps the image file so positions are relative to the start of the linked list, like entry offsets."""
+    def __init__(self, f, base: int):
+        self.f = f
+        self.base = base
+
+    def write(self, data) -> int:
+        return self.f.write(data)
+
+    def tell(self) -> int:
+        return self.f.tell() - self.base
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self.f.seek(offset + self.base if whence == io.SEEK_SET else offset, whence) - self.base
+
+    def truncate(self) -> int:
+        return self.f.truncate() - self.base
+
 class Drofs:
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, cache: PayloadCache = None):
         self.file_path = file_path
         self.root = None # The root entry of the linked list
+        self.cache = cache # Optional cache of parsed entries and decompressed payloads
+        self._verified_identity = None # Identity of the image whose overall CRC32 was last verified, with a cache
+
+    def serialize(self, path_index: bool = False, access_order: List[str] = None, split_layout: bool = False,
+                  merkle: bool = False):
+        """Serializes the linked list to the binary file.
+
+        The root's WINDOW_BITS metadata is set to the largest compression window of the compressed
+        entries, so readers can size their decompression buffers once for the whole image.
+
+        Args:
+            path_index: Append a path hash index section, referenced by the root's PATH_INDEX metadata,
+                allowing readers to resolve any path with a single hash probe.
+            access_order: Paths in the order they are accessed, e.g. recorded at boot. The accessed entries,
+                and the directories needed to reach them, are placed contiguously at the start of the image.
+                The tree, including the order of children, is unchanged.
+            split_layout: Write every entry header, name, metadata and child table in one compact region
+                at the start of the image, followed by the path index and then the payloads, each entry
+                addressing its payload with PAYLOAD_LOCATION metadata. The root's PAYLOAD_REGION metadata
+                holds the offset and length of the payload region. Payloads of entries with an alignment
+                start at an image offset that is a multiple of it, the padding is part of the payload region.
+            merkle: Write Merkle digests, every directory's CHILD_DIGESTS metadata holds the digest of each child
+                record (see entry_digest) and the root's ROOT_DIGEST metadata holds the digest of the root record,
+                so readers can verify only the entries on the path they access.
+
+        Entries with a PayloadSource are streamed in chunks, the image is written directly to the file and its
+        CRC32 is computed by reading it back, so memory stays bounded by the tree rather than by the data.
+        With split_layout each source is compressed once, into a temporary file kept until the source is closed.
+        """
+        order = self._placement_order(access_order)
+        if split_layout:
+            # Headers are written before the payloads, their stored lengths and CRC32 must be known first,
+            # the compressed data is kept so it is copied rather than compressed again
+            for entry in order:
+                if entry.source is not None:
+                    entry.source.prepare(keep=True)
+                    self._apply_payload_source(entry)
+
+        self._update_window_bits()
+
+        self.root.metadata = [m for m in self.root.metadata if m.type != EntryMetadataType.PAYLOAD_REGION]
+        if split_layout:
+            self.root.metadata.append(EntryMetadata(EntryMetadataType.PAYLOAD_REGION, struct.pack('II', 0, 0)))
+
+        if path_index:
+            self.root.metadata = [m for m in self.root.metadata if m.type != EntryMetadataType.PATH_INDEX]
+            self.root.metadata.append(EntryMetadata(EntryMetadataType.PATH_INDEX, struct.pack('I', 0)))
+
+        self.root.metadata = [m for m in self.root.metadata if m.type != EntryMetadataType.ROOT_DIGEST]
+        if merkle:
+            self.root.metadata.append(EntryMetadata(EntryMetadataType.ROOT_DIGEST, struct.pack('I', 0)))
+
+        with open(self.file_path, 'w+b') as f:
+            # Write the file header and a placeholder CRC32
+            f.write(b"DROFS")
+            f.write(struct.pack('I', 0))
+
+            # Write the linked list data, offsets are relative to its start
+            linked_list = _LinkedListFile(f, FILE_METADATA_SIZE)
+            positions = self._write_entries(linked_list, order, split_layout, merkle)
+            self._patch_window_bits(linked_list)
+            if path_index:
+                self._write_path_index(linked_list)
+            if split_layout:
+                self._write_payloads(linked_list, order, positions)
+            if merkle:
+                self._write_digests(f, order, positions)
+
+            # Calculate CRC32 of the linked list data once every offset is patched
+            f.seek(FILE_METADATA_SIZE)
+            crc32_value = 0
+            for chunk in _iter_file_chunks(f, DECOMPRESS_CHUNK_SIZE):
+                crc32_value = zlib.crc32(chunk, crc32_value)
+            f.seek(HEADER_BYTES)
+            f.write(struct.pack('I', crc32_value))
 
-    def serialize(self):
-        """Serializes the linked list to the binary file."""
-        # Serialize the linked list into a BytesIO buffer first to calculate CRC32
-        buffer = io.BytesIO()
-        self._write_recursive(buffer, self.root)
-        linked_list_bytes = buffer.getvalue()
+    @staticmethod
+    def _apply_payload_source(entry: Entry):
+        """Sets the entry's COMPRESSED and LZ4 flags and ORIGINAL_CRC32 and ORIGINAL_SIZE metadata from its written or prepared source.
+
+        LZ4 blocks have no header, so LZ4 entries also carry the window they were compressed with as WINDOW_BITS metadata.
+        """
+        source = entry.source
+        original_metadata = []
+        entry.flags &= ~(EntryFlags.COMPRESSED.value | EntryFlags.LZ4.value)
+        if source.compressed:
+            entry.flags |= EntryFlags.COMPRESSED.value
+            original_metadata.append(EntryMetadata(EntryMetadataType.ORIGINAL_CRC32, struct.pack('I', source.original_crc32)))
+            if source.codec == "lz4":
+                entry.flags |= EntryFlags.LZ4.value
+                original_metadata.append(EntryMetadata(EntryMetadataType.WINDOW_BITS, bytes([source.window_bits])))
+        original_metadata.append(EntryMetadata(EntryMetadataType.ORIGINAL_SIZE, struct.pack('I', source.original_size)))
+        entry.metadata = original_metadata + [m for m in entry.metadata if m.type not in (
+            EntryMetadataType.ORIGINAL_CRC32, EntryMetadataType.ORIGINAL_SIZE, EntryMetadataType.WINDOW_BITS)]
+
+    def _update_window_bits(self):
+        window_bits = self._window_bits()
+        self.root.metadata = [m for m in self.root.metadata if m.type != EntryMetadataType.WINDOW_BITS]
+        if window_bits:
+            self.root.metadata.append(EntryMetadata(EntryMetadataType.WINDOW_BITS, bytes([window_bits])))
+
+    def _patch_window_bits(self, f):
+        """Rewrites the root's WINDOW_BITS once every payload source is written and known to be compressed or not."""
+        window_bits_metadata = self.root.get_metadata_by_type(EntryMetadataType.WINDOW_BITS)
+        window_bits = self._window_bits()
+        if window_bits_metadata and window_bits:
+            window_bits_metadata.data = bytes([window_bits])
+            current_pos = f.tell()
+            f.seek(window_bits_metadata.offset)
+            f.write(window_bits_metadata.data)
+            f.seek(current_pos)
+
+    def _window_bits(self) -> int:
+        """Returns the largest compression window of the compressed entries, 0 if none is compressed."""
+        window_bits = 0
+        pending = [self.root]
+        while pending:
+            entry = pending.pop()
+            if entry.source is not None:
+                # Unless prepared, whether the source ends up compressed is only known once it is written
+                if entry.source.compression_level > 0 and entry.source.compressed is not False:
+                    window_bits = max(window_bits, entry.source.window_bits)
+            elif entry.flags & EntryFlags.COMPRESSED.value and entry.flags & EntryFlags.LZ4.value:
+                window_bits_metadata = entry.get_metadata_by_type(EntryMetadataType.WINDOW_BITS)
+                window_bits = max(window_bits, window_bits_metadata.data[0] if window_bits_metadata else 15)
+            elif entry.flags & EntryFlags.COMPRESSED.value and entry.data:
+                window_bits = max(window_bits, zlib_window_bits(entry.data))
+            pending.extend(entry.children)
+        return window_bits
+
+    def _placement_order(self, access_order: List[str] = None) -> List[Entry]:
+        """Returns every entry in the order it is written to the image.
+
+        Entries are written in depth-first order, unless an access order is given: the accessed entries,
+        each preceded by the directories needed to reach it, are then placed first in order of first access,
+        followed by the remaining entries in depth-first order. The root always comes first.
+        """
+        depth_first = []
+        pending = [self.root]
+        while pending:
+            entry = pending.pop()
+            depth_first.append(entry)
+            pending.extend(reversed(entry.children))
+
+        placed = set()
+        order = []
+        for path in access_order or []:
+            entry = self.root
+            chain = [entry]
+            for component in [part for part in path.split('/') if part]:
+                entry = next((child for child in entry.children if child.name == component), None)
+                if entry is None:
+                    break
+                chain.append(entry)
+            if entry is None:
+                continue # paths missing from the tree are ignored
+            for chain_entry in chain:
+                if id(chain_entry) not in placed:
+                    placed.add(id(chain_entry))
+                    order.append(chain_entry)
+
+        order.extend(entry for entry in depth_first if id(entry) not in placed)
+        return order
+
+    def _write_entries(self, f : io.BytesIO, order: List[Entry], split_layout: bool = False, merkle: bool = False) -> List[tuple]:
+        """Writes the entry records in order, returning the placeholder positions of each entry (see _write_entry)."""
+        # Child offsets are only known once every entry is written, write placeholders and patch them after
+        positions = [self._write_entry(f, entry, split_layout, merkle) for entry in order]
+
+        current_pos = f.tell()
+        for entry, (children_offsets_start_pos, _, _) in zip(order, positions):
+            f.seek(children_offsets_start_pos)
+            for child in entry.children:
+                f.write(struct.pack('I', child.offset))
+        f.seek(current_pos) # Return to current position
+        return positions
+
+    def _write_digests(self, f, order: List[Entry], positions: List[tuple]):
+        """Patches the CHILD_DIGESTS and ROOT_DIGEST metadata once every other byte of the records is final."""
+        f.flush()
+        with mmap.mmap(f.fileno(), 0) as image, memoryview(image) as view:
+            linked_list = view[FILE_METADATA_SIZE:]
+            child_digests_positions = {id(entry): child_digests_pos for entry, (_, _, child_digests_pos) in zip(order, positions)}
+            digests = {}
+            # Children before their parents, a parent's digest covers its children's digests
+            pending = [self.root]
+            parents_first = []
+            while pending:
+                entry = pending.pop()
+                parents_first.append(entry)
+                pending.extend(entry.children)
+            for entry in reversed(parents_first):
+                child_digests_pos = child_digests_positions[id(entry)]
+                if child_digests_pos is not None:
+                    child_digests = struct.pack(f'{len(entry.children)}I', *(digests[id(child)] for child in entry.children))
+                    linked_list[child_digests_pos:child_digests_pos + len(child_digests)] = child_digests
+                digests[id(entry)] = entry_digest(linked_list, entry.offset)
+
+            root_digest_metadata = self.root.get_metadata_by_type(EntryMetadataType.ROOT_DIGEST)
+            struct.pack_into('I', linked_list, root_digest_metadata.offset, digests[id(self.root)])
+            linked_list.release()
+
+    def _write_payloads(self, f : io.BytesIO, order: List[Entry], positions: List[tuple]):
+        payload_region_offset = f.tell()
+        locations = []
+        for entry, (_, payload_location_pos, _) in zip(order, positions):
+            if payload_location_pos is not None:
+                # Pad so the payload starts at an image offset that is a multiple of the entry's alignment
+                f.write(bytes(-(f.tell() + FILE_METADATA_SIZE) % entry.alignment))
+                if entry.source is not None:
+                    locations.append((payload_location_pos, f.tell(), entry.source.length))
+                    entry.source.write_to(f)
+                else:
+                    locations.append((payload_location_pos, f.tell(), len(entry.data)))
+                    f.write(entry.data)
+        payload_region_length = f.tell() - payload_region_offset
 
-        # Calculate CRC32
-        # print(F'scanning crc of {len(linked_list_bytes)}')
-        crc32_value = zlib.crc32(linked_list_bytes)
-        # print(F"crc {crc32_value:#010x}")
+        for payload_location_pos, payload_offset, payload_length in locations:
+            f.seek(payload_location_pos)
+            f.write(struct.pack('II', payload_offset, payload_length))
 
-        with open(self.file_path, 'wb') as f:
-            # Write the file header
-            f.write(b"DROFS")
-            # Write CRC32
-            f.write(struct.pack('I', crc32_value))
-            # Write the actual linked list data
-            f.write(linked_list_bytes)
+        payload_region_metadata = self.root.get_metadata_by_type(EntryMetadataType.PAYLOAD_REGION)
+        f.seek(payload_region_metadata.offset)
+        f.write(struct.pack('II', payload_region_offset, payload_region_length))
+        f.seek(0, io.SEEK_END)
 
-    def _write_recursive(self, f : io.BytesIO, entry: Entry):
-        if not entry:
-            return
+    def _write_entry(self, f : io.BytesIO, entry: Entry, split_layout: bool = False, merkle: bool = False) -> tuple:
+        """Writes the entry record with placeholder child offsets.
 
+        In the split layout the data is left out and a placeholder PAYLOAD_LOCATION metadata is written instead.
+        With Merkle digests, entries with children get a placeholder CHILD_DIGESTS metadata.
+
+        Returns:
+            The position of the child offsets, of the PAYLOAD_LOCATION data (None if the data is inline)
+            and of the CHILD_DIGESTS data (None without one).
+        """
         # Store current position as the entry's offset
         entry.offset = f.tell()
         # print(f"Writing {entry} at {entry.offset}")
@@ -110,78 +874,174 @@ class Drofs:
         f.write(name_bytes)
 
         # Write data length, data CRC32, and data
-        data_bytes = entry.data
-        data_length = len(data_bytes)
-        data_crc32_value = zlib.crc32(data_bytes)
+        source = entry.source
+        if source is not None and source.length is None:
+            # Stream the payload in place, its length and CRC32 are patched once it is written
+            split_payload = False
+            lengths_pos = f.tell()
+            f.write(bytes(DATA_LENGTH_BYTES + DATA_CRC32_BYTES))
+            source.write_to(f)
+            data_end_pos = f.tell()
+            f.seek(lengths_pos)
+            f.write(struct.pack('II', source.length, source.crc32))
+            f.seek(data_end_pos)
+        else:
+            data_length = source.length if source is not None else len(entry.data)
+            data_crc32_value = source.crc32 if source is not None else zlib.crc32(entry.data)
+            split_payload = split_layout and data_length > 0
+
+            f.write(struct.pack('I', 0 if split_payload else data_length))
+            f.write(struct.pack('I', data_crc32_value))
+            if not split_payload:
+                if source is not None:
+                    source.write_to(f)
+                else:
+                    f.write(entry.data)
+        if source is not None:
+            self._apply_payload_source(entry)
 
-        f.write(struct.pack('I', data_length))
-        f.write(struct.pack('I', data_crc32_value))
-        f.write(data_bytes)
+        # Payload locations and digests are owned by the writer, never copy ones read from another image
+        metadata = [m for m in entry.metadata if m.type not in (EntryMetadataType.PAYLOAD_LOCATION, EntryMetadataType.CHILD_DIGESTS)
+                    and (m.type != EntryMetadataType.ROOT_DIGEST or entry is self.root)]
+        child_digests = merkle and len(entry.children) > 0
+        if child_digests and DIGEST_BYTES * len(entry.children) > MAX_METADATA_LENGTH:
+            raise ValueError(f"Entry '{entry.name}' has too many children for Merkle digests.")
 
         # Write flags
         f.write(struct.pack('B', entry.flags))
 
         # Write metadata
-        f.write(struct.pack('B', len(entry.metadata))) # Number of metadata items
-        for metadata_item in entry.metadata:
+        f.write(struct.pack('B', len(metadata) + split_payload + child_digests)) # Number of metadata items
+        for metadata_item in metadata:
             f.write(struct.pack('B', metadata_item.type.value)) # Metadata type (8-bit)
             f.write(struct.pack('H', metadata_item.length)) # Metadata length (16-bit)
+            metadata_item.offset = f.tell()
             f.write(metadata_item.data) # Metadata data
-
-        # Placeholder for number of children and children offsets
-        # We will come back and fill this after all children are written
-        num_children_pos = f.tell()
-        f.write(struct.pack('I', 0)) # Placeholder for num_children
-
-        # Store current children offsets for later update
+        payload_location_pos = None
+        if split_payload:
+            f.write(struct.pack('B', EntryMetadataType.PAYLOAD_LOCATION.value))
+            f.write(struct.pack('H', 8))
+            payload_location_pos = f.tell()
+            f.write(struct.pack('II', 0, 0)) # Placeholder for payload offset and length
+        child_digests_pos = None
+        if child_digests:
+            f.write(struct.pack('B', EntryMetadataType.CHILD_DIGESTS.value))
+            f.write(struct.pack('H', DIGEST_BYTES * len(entry.children)))
+            child_digests_pos = f.tell()
+            f.write(bytes(DIGEST_BYTES * len(entry.children))) # Placeholder for the children digests
+
+        # Write number of children and placeholders for the children offsets
+        f.write(struct.pack('I', len(entry.children)))
         children_offsets_start_pos = f.tell()
-        # Placeholder for children offsets
-        for _ in entry.children:
-            f.write(struct.pack('I', 0)) # Placeholder for child offset
-
-        # Recursively write children
-        actual_children_offsets = []
-        for child in entry.children:
-            self._write_recursive(f, child)
-            actual_children_offsets.append(child.offset)
-
-        # Go back and update num_children and children_offsets
-        current_pos = f.tell()
-        f.seek(num_children_pos)
-        f.write(struct.pack('I', len(actual_children_offsets)))
-
-        f.seek(children_offsets_start_pos)
-        for offset in actual_children_offsets:
-            f.write(struct.pack('I', offset))
-
-        f.seek(current_pos) # Return to current position
+        f.write(bytes(CHILD_OFFSET_BYTES * len(entry.children)))
+        return children_offsets_start_pos, payload_location_pos, child_digests_pos
+
+    def _write_path_index(self, f: io.BytesIO):
+        """Appends the path hash index section and points the root's PATH_INDEX metadata at it."""
+        # Collect every entry below the root by its full path
+        indexed_entries = []
+        pending = [(child, child.name) for child in self.root.children]
+        while pending:
+            entry, entry_path = pending.pop()
+            indexed_entries.append((path_hash(entry_path), entry))
+            pending.extend((child, f"{entry_path}/{child.name}") for child in entry.children)
+
+        # Entries sharing both the hash and the name cannot be told apart by readers, leave them out
+        # of the index and clear the complete flag so readers fall back to walking the tree
+        key_counts = Counter((hash_value, entry.name) for hash_value, entry in indexed_entries)
+        ambiguous = {key for key, count in key_counts.items() if count > 1}
+        flags = 0 if ambiguous else PATH_INDEX_FLAG_COMPLETE
+
+        slot_count = 1
+        while slot_count < 2 * len(indexed_entries):
+            slot_count <<= 1
+
+        slots = [(0, PATH_INDEX_EMPTY_SLOT)] * slot_count
+        for hash_value, entry in indexed_entries:
+            if (hash_value, entry.name) in ambiguous:
+                continue
+            slot = hash_value & (slot_count - 1)
+            while slots[slot][1] != PATH_INDEX_EMPTY_SLOT:
+                slot = (slot + 1) & (slot_count - 1)
+            slots[slot] = (hash_value, entry.offset)
+
+        index_offset = f.tell()
+        f.write(struct.pack('I', slot_count))
+        f.write(struct.pack('I', flags))
+        for hash_value, offset in slots:
+            f.write(struct.pack('II', hash_value, offset))
+
+        path_index_metadata = self.root.get_metadata_by_type(EntryMetadataType.PATH_INDEX)
+        f.seek(path_index_metadata.offset)
+        f.write(struct.pack('I', index_offset))
+        f.seek(0, io.SEEK_END)
 
     def deserialize(self, path: str):
-        """Deserializes the linked list from the binary file and retrieves an entry by path."""
+        """Deserializes the linked list from the binary file and retrieves an entry by path.
+
+        With a cache, parsed entries are cached and the overall CRC32 is only verified again once the
+        image file changes. Returned entries are then shared and must be treated as read-only.
+        """
+        return self._deserialize(path)[1]
+
+    def read_data(self, path: str) -> bytes | None:
+        """Returns the original data of the entry at path, inflated if compressed, None if it does not exist.
+
+        With a cache, the decompressed data is cached, repeated reads skip inflating and checking it.
+        """
+        identity, entry = self._deserialize(path)
+        if entry is None:
+            return None
+        if self.cache is None:
+            return entry_original_data(entry)
+        # Keyed by the offset relative to the linked list, like DrofsImage, so both readers share cached data
+        return self.cache.get_or_load((identity, "data", entry.offset - FILE_METADATA_SIZE), lambda: entry_original_data(entry))
+
+    def read_range(self, path: str, offset: int, length: int) -> bytes | None:
+        """Returns length bytes of the original data of the entry at path starting at offset, None if it does not exist.
+
+        Compressed data is inflated only up to the end of the range, or sliced from the payload read_data cached.
+        """
+        identity, entry = self._deserialize(path)
+        if entry is None:
+            return None
+        return bytes(_read_cached_range(self.cache, (identity, "data", entry.offset - FILE_METADATA_SIZE), entry, offset, length))
+
+    def _deserialize(self, path: str):
+        """Returns the identity of the image (None without a cache) and the entry at path."""
         with open(self.file_path, 'rb') as f:
-            # Read and verify the file header
-            header = f.read(HEADER_BYTES)
-            if header != b"DROFS":
-                raise ValueError("Invalid DROFS file header.")
+            identity = image_identity(f) if self.cache is not None else None
+            if identity is None or identity != self._verified_identity:
+                # Read and verify the file header
+                header = f.read(HEADER_BYTES)
+                if header != b"DROFS":
+                    raise ValueError("Invalid DROFS file header.")
 
-            # Read stored CRC32
-            stored_crc32 = struct.unpack('I', f.read(OVERALL_CRC32_BYTES))[0]
+                # Read stored CRC32
+                stored_crc32 = struct.unpack('I', f.read(OVERALL_CRC32_BYTES))[0]
 
-            # Read the rest of the file content for CRC32 calculation
-            linked_list_bytes = f.read()
-            calculated_crc32 = zlib.crc32(linked_list_bytes)
+                # Read the rest of the file content for CRC32 calculation
+                linked_list_bytes = f.read()
+                calculated_crc32 = zlib.crc32(linked_list_bytes)
 
-            if stored_crc32 != calculated_crc32:
-                raise ValueError("CRC32 checksum mismatch. File may be corrupted.")
+                if stored_crc32 != calculated_crc32:
+                    raise ValueError("CRC32 checksum mismatch. File may be corrupted.")
+                self._verified_identity = identity
 
             # Reset file pointer to the beginning of the linked list data (after header and CRC)
             f.seek(FILE_METADATA_SIZE)
 
-            root_entry_from_file = self._read_entry_at_offset(f, f.tell())
+            root_entry_from_file = self._read_entry_cached(f, identity, f.tell())
 
             path_components = [comp for comp in path.split('/') if comp]
             current_entry = root_entry_from_file
 
+            path_index_metadata = root_entry_from_file.get_metadata_by_type(EntryMetadataType.PATH_INDEX)
+            if path_components and path_index_metadata:
+                resolved, indexed_entry = self._lookup_path_index(f, path_index_metadata, path_components, identity)
+                if resolved:
+                    return identity, indexed_entry
+
             for component in path_components:
                 found_child = None
                 # Base offset for linked list data in the file (after header and CRC)
@@ -191,15 +1051,46 @@ class Drofs:
                     f.seek(absolute_child_offset)
                     child_entry = self._read_entry_metadata(f) # Read only metadata to check name
                     if child_entry.name == component:
-                        found_child = self._read_entry_at_offset(f, absolute_child_offset) # Read full entry
+                        found_child = self._read_entry_cached(f, identity, absolute_child_offset) # Read full entry
                         break
 
                 if found_child:
                     current_entry = found_child
                 else:
-                    return None # Path component not found
-
-                return current_entry
+                    return identity, None # Path component not found
+
+            return identity, current_entry
+
+    def _read_entry_cached(self, f, identity: tuple, offset: int):
+        if self.cache is None:
+            return self._read_entry_at_offset(f, offset)
+        return self.cache.get_or_load((identity, "entry", offset), lambda: self._read_entry_at_offset(f, offset), _entry_size)
+
+    def _lookup_path_index(self, f, path_index_metadata: EntryMetadata, path_components: List[str], identity: tuple = None):
+        """Resolves a path through the path index section.
+
+        Returns:
+            A (resolved, entry) tuple, resolved is False when the index cannot answer and the tree must be walked.
+        """
+        index_offset = FILE_METADATA_SIZE + struct.unpack('I', path_index_metadata.data)[0]
+        f.seek(index_offset)
+        slot_count = struct.unpack('I', f.read(PATH_INDEX_SLOT_COUNT_BYTES))[0]
+        flags = struct.unpack('I', f.read(PATH_INDEX_FLAGS_BYTES))[0]
+        slots_offset = index_offset + PATH_INDEX_SLOT_COUNT_BYTES + PATH_INDEX_FLAGS_BYTES
+
+        hash_value = path_hash('/'.join(path_components))
+        for probe in range(slot_count):
+            slot = (hash_value + probe) & (slot_count - 1)
+            f.seek(slots_offset + slot * PATH_INDEX_SLOT_BYTES)
+            slot_hash, slot_offset = struct.unpack('II', f.read(PATH_INDEX_SLOT_BYTES))
+            if slot_offset == PATH_INDEX_EMPTY_SLOT:
+                break
+            if slot_hash == hash_value:
+                f.seek(FILE_METADATA_SIZE + slot_offset)
+                if self._read_entry_metadata(f).name == path_components[-1]:
+                    return True, self._read_entry_cached(f, identity, FILE_METADATA_SIZE + slot_offset)
+
+        return bool(flags & PATH_INDEX_FLAG_COMPLETE), None
 
     def deserialize_root(self):
         """Deserializes the root entry from the binary file."""
@@ -290,10 +1181,6 @@ class Drofs:
         stored_data_crc32 = struct.unpack('I', f.read(DATA_CRC32_BYTES))[0]
         data = bytearray(f.read(data_length))
 
-        calculated_data_crc32 = zlib.crc32(data)
-        if stored_data_crc32 != calculated_data_crc32:
-            raise ValueError(f"Data CRC32 checksum mismatch for entry '{name}'. Entry data may be corrupted.")
-
         flags = struct.unpack('B', f.read(FLAGS_BYTES))[0]
 
         # Read metadata
@@ -311,6 +1198,276 @@ class Drofs:
         for _ in range(num_children):
             children_offsets.append(struct.unpack('I', f.read(CHILD_OFFSET_BYTES))[0])
 
+        # Split layout, the data is in the payload region
+        for metadata_item in metadata_list:
+            if metadata_item.type == EntryMetadataType.PAYLOAD_LOCATION:
+                payload_offset, payload_length = struct.unpack('II', metadata_item.data)
+                f.seek(FILE_METADATA_SIZE + payload_offset)
+                data = bytearray(f.read(payload_length))
+                if len(data) != payload_length:
+                    raise ValueError(f"Data of entry '{name}' exceeds the image.")
+
+        calculated_data_crc32 = zlib.crc32(data)
+        if stored_data_crc32 != calculated_data_crc32:
+            raise ValueError(f"Data CRC32 checksum mismatch for entry '{name}'. Entry data may be corrupted.")
+
+        entry = Entry(entry_type, name, data, children_offsets, flags, metadata_list)
+        entry.offset = offset
+        return entry
+
+class DrofsImage:
+    """Read-only, memory mapped access to a DROFS image.
+
+    Entries are parsed straight from the mapping and their data is a zero-copy memoryview into it,
+    so walking or verifying an image never loads it into memory as a whole. Offsets are relative
+    to the linked list data, like the children offsets stored in the image.
+
+    With a cache, decompressed payloads read by read_data are cached.
+    """
+
+    def __init__(self, file_path: str, cache: PayloadCache = None):
+        self.file_path = file_path
+        self.cache = cache
+        self._file = open(file_path, 'rb') # noqa: SIM115 - closed by close()
+        self.identity = image_identity(self._file)
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("Invalid DROFS file header.") from None
+        self.view = memoryview(self._mmap)
+        self.linked_list = self.view[FILE_METADATA_SIZE:]
+        if len(self.view) < FILE_METADATA_SIZE or bytes(self.view[:HEADER_BYTES]) != b"DROFS":
+            self.close()
+            raise ValueError("Invalid DROFS file header.")
+        self.stored_crc32 = struct.unpack_from('I', self.view, HEADER_BYTES)[0]
+
+    def close(self):
+        self.linked_list.release()
+        self.view.release()
+        # entry data views may still be alive, the mapping is then released with them
+        with contextlib.suppress(BufferError):
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def check_crc32(self) -> bool:
+        """Checks the overall CRC32 of the image."""
+        return zlib.crc32(self.linked_list) == self.stored_crc32
+
+    def read_entry(self, offset: int) -> Entry:
+        """Parses the entry at offset, its children are offsets and its data a view into the image."""
+        view = self.linked_list
+        position = offset
+        entry_type = EntryType(view[position])
+        position += ENTRY_TYPE_BYTES
+
+        name_length = view[position]
+        position += NAME_LENGTH_BYTES
+        name = bytes(view[position:position + name_length]).rstrip(b'\0').decode('ascii')
+        position += name_length
+
+        data_length, data_crc32 = struct.unpack_from('II', view, position)
+        position += DATA_LENGTH_BYTES + DATA_CRC32_BYTES
+        if position + data_length > len(view):
+            raise ValueError(f"Data of entry '{name}' exceeds the image.")
+        data = view[position:position + data_length]
+        position += data_length
+
+        flags = view[position]
+        position += FLAGS_BYTES
+
+        metadata_list = []
+        num_metadata = view[position]
+        position += 1
+        for _ in range(num_metadata):
+            metadata_type = EntryMetadataType(view[position])
+            metadata_length = struct.unpack_from('H', view, position + 1)[0]
+            position += 3
+            metadata_list.append(EntryMetadata(metadata_type, bytes(view[position:position + metadata_length])))
+            position += metadata_length
+
+        num_children = struct.unpack_from('I', view, position)[0]
+        position += NUM_CHILDREN_BYTES
+        children_offsets = list(struct.unpack_from(f'{num_children}I', view, position))
+
+        # Split layout, the data is in the payload region
+        for metadata_item in metadata_list:
+            if metadata_item.type == EntryMetadataType.PAYLOAD_LOCATION:
+                payload_offset, payload_length = struct.unpack('II', metadata_item.data)
+                if payload_offset + payload_length > len(view):
+                    raise ValueError(f"Data of entry '{name}' exceeds the image.")
+                data = view[payload_offset:payload_offset + payload_length]
+
         entry = Entry(entry_type, name, data, children_offsets, flags, metadata_list)
         entry.offset = offset
+        entry.data_crc32 = data_crc32
         return entry
+
+    def read_data(self, entry: Entry) -> bytes:
+        """Returns the original data of an entry, checked against its CRC32 and inflated if compressed."""
+        if self.cache is None:
+            return entry_original_data(entry)
+        return self.cache.get_or_load((self.identity, "data", entry.offset), lambda: entry_original_data(entry))
+
+    def read_range(self, path: str, offset: int, length: int):
+        """Returns length bytes of the original data of the file at path starting at offset, None if it does not exist.
+
+        Stored data is returned as a view into the image, compressed data is inflated only up to the end of the
+        range, or sliced from the payload read_data cached. See read_entry_range.
+        """
+        entry = self.find_entry(path)
+        if entry is None:
+            return None
+        return _read_cached_range(self.cache, (self.identity, "data", entry.offset), entry, offset, length)
+
+    def find_entry(self, path: str) -> Entry | None:
+        """Finds the entry at path by walking the tree from the root, returns None if it does not exist."""
+        entry = self.read_entry(0)
+        for component in [part for part in path.split('/') if part]:
+            for child_offset in entry.children:
+                child = self.read_entry(child_offset)
+                if child.name == component:
+                    entry = child
+                    break
+            else:
+                return None
+        return entry
+
+    def find_verified_entry(self, path: str) -> Entry | None:
+        """Finds the entry at path, verifying only the Merkle digests of the entries on the path and the entry's data CRC32.
+
+        Returns None if the entry does not exist, raises ValueError if the image has no Merkle digests or
+        an entry on the path is corrupted.
+        """
+        entry = self.read_entry(0)
+        root_digest_metadata = entry.get_metadata_by_type(EntryMetadataType.ROOT_DIGEST)
+        if root_digest_metadata is None:
+            raise ValueError("Image has no Merkle digests.")
+        if entry_digest(self.linked_list, 0) != struct.unpack('I', root_digest_metadata.data)[0]:
+            raise ValueError("/: digest mismatch.")
+
+        entry_path = ""
+        for component in [part for part in path.split('/') if part]:
+            entry_path += f"/{component}"
+            index, child = self._find_child(entry, component)
+            if child is None:
+                return None
+            child_digests_metadata = entry.get_metadata_by_type(EntryMetadataType.CHILD_DIGESTS)
+            if child_digests_metadata is None or len(child_digests_metadata.data) != DIGEST_BYTES * len(entry.children):
+                raise ValueError(f"{entry_path}: parent has no child digests.")
+            if entry_digest(self.linked_list, child.offset) != struct.unpack_from('I', child_digests_metadata.data, DIGEST_BYTES * index)[0]:
+                raise ValueError(f"{entry_path}: digest mismatch.")
+            entry = child
+
+        if zlib.crc32(entry.data) != entry.data_crc32:
+            raise ValueError(f"{entry_path or '/'}: data CRC32 checksum mismatch.")
+        return entry
+
+    def _find_child(self, entry: Entry, name: str) -> tuple:
+        """Returns the index and the entry of the child named name, (None, None) if there is none."""
+        for index, child_offset in enumerate(entry.children):
+            child = self.read_entry(child_offset)
+            if child.name == name:
+                return index, child
+        return None, None
+
+    def walk(self, problems: List[str] = None) -> Iterator[tuple]:
+        """Yields (path, entry) for every entry in depth-first order, starting with the root as '/'.
+
+        When a problems list is given, unreadable entries are recorded in it and skipped instead of raising.
+        Entries reached a second time, through a child offset pointing back at an ancestor or at another
+        entry, are reported as a cycle and not walked again, so a damaged image never loops forever.
+        """
+        pending = [("", 0)]
+        seen = set()
+        while pending:
+            parent_path, offset = pending.pop()
+            if offset in seen:
+                if problems is None:
+                    raise ValueError(f"{parent_path or '/'}: cycle at offset {offset}.")
+                problems.append(f"{parent_path or '/'}: cycle at offset {offset}.")
+                continue
+            seen.add(offset)
+            try:
+                entry = self.read_entry(offset)
+            except (ValueError, IndexError, struct.error) as e:
+                if problems is None:
+                    raise
+                problems.append(f"{parent_path or '/'}: unreadable entry at offset {offset}: {e}")
+                continue
+            entry_path = f"{parent_path}/{entry.name}" if offset != 0 else "/"
+            yield entry_path, entry
+            child_parent_path = "" if offset == 0 else entry_path
+            pending.extend((child_parent_path, child_offset) for child_offset in reversed(entry.children))
+
+    def verify(self, jobs: int = 1) -> List[str]:
+        """Verifies the overall CRC32 and every entry, in parallel over jobs threads.
+
+        Each entry's data CRC32 is checked, compressed entries are inflated and checked against their
+        ORIGINAL_CRC32 and ORIGINAL_SIZE metadata, and Merkle digests are checked when present. zlib releases the GIL while hashing and inflating,
+        so the threads run on multiple cores.
+
+        Returns:
+            A description of every problem found, empty when the image is valid.
+        """
+        problems = []
+        entries = list(self.walk(problems))
+
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            image_crc32_ok = executor.submit(self.check_crc32)
+            for entry_problems in executor.map(lambda item: self._verify_entry(*item) + self._verify_digests(*item), entries):
+                problems.extend(entry_problems)
+            if not image_crc32_ok.result():
+                problems.insert(0, "CRC32 checksum mismatch. File may be corrupted.")
+
+        return problems
+
+    def _verify_digests(self, entry_path: str, entry: Entry) -> List[str]:
+        problems = []
+        root_digest_metadata = entry.get_metadata_by_type(EntryMetadataType.ROOT_DIGEST) if entry.offset == 0 else None
+        if root_digest_metadata and entry_digest(self.linked_list, 0) != struct.unpack('I', root_digest_metadata.data)[0]:
+            problems.append("/: digest mismatch.")
+
+        child_digests_metadata = entry.get_metadata_by_type(EntryMetadataType.CHILD_DIGESTS)
+        if child_digests_metadata is None:
+            return problems
+        if len(child_digests_metadata.data) != DIGEST_BYTES * len(entry.children):
+            return problems + [f"{entry_path}: child digests do not match the children."]
+        child_digests = struct.unpack(f'{len(entry.children)}I', child_digests_metadata.data)
+        for child_offset, child_digest in zip(entry.children, child_digests):
+            try:
+                if entry_digest(self.linked_list, child_offset) != child_digest:
+                    problems.append(f"{entry_path}: digest mismatch of the child at offset {child_offset}.")
+            except (ValueError, IndexError, struct.error):
+                pass # reported by walk as an unreadable entry
+        return problems
+
+    def _verify_entry(self, entry_path: str, entry: Entry) -> List[str]:
+        if zlib.crc32(entry.data) != entry.data_crc32:
+            return [f"{entry_path}: data CRC32 checksum mismatch."]
+        if not entry.flags & EntryFlags.COMPRESSED.value:
+            return []
+
+        original_crc32 = 0
+        original_size = 0
+        try:
+            for chunk in iter_entry_data(entry):
+                original_crc32 = zlib.crc32(chunk, original_crc32)
+                original_size += len(chunk)
+        except (zlib.error, ValueError) as e:
+            return [f"{entry_path}: decompression failed: {e}"]
+
+        problems = []
+        original_crc32_metadata = entry.get_metadata_by_type(EntryMetadataType.ORIGINAL_CRC32)
+        if original_crc32_metadata and int.from_bytes(original_crc32_metadata.data, 'little') != original_crc32:
+            problems.append(f"{entry_path}: original CRC32 checksum mismatch.")
+        original_size_metadata = entry.get_metadata_by_type(EntryMetadataType.ORIGINAL_SIZE)
+        if original_size_metadata and int.from_bytes(original_size_metadata.data, 'little') != original_size:
+            problems.append(f"{entry_path}: original size mismatch.")
+        return problems
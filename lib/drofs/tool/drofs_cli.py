@@ -1,27 +1,100 @@
 import argparse
+import contextlib
+import json
 import os
-import zlib
-
-from drofs import Drofs, Entry, EntryFlags, EntryMetadata, EntryMetadataType, EntryType
-
-
-def create_archive(image_path, source_path, compression_level, verbose):
+import re
+import struct
+import sys
+import tarfile
+import time
+import zipfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from drofs import (
+    CHILD_OFFSET_BYTES,
+    CODECS,
+    DATA_CRC32_BYTES,
+    DATA_LENGTH_BYTES,
+    DECOMPRESS_CHUNK_SIZE,
+    ENTRY_TYPE_BYTES,
+    FILE_METADATA_SIZE,
+    FLAGS_BYTES,
+    NAME_LENGTH_BYTES,
+    NUM_CHILDREN_BYTES,
+    PATH_INDEX_FLAGS_BYTES,
+    PATH_INDEX_SLOT_BYTES,
+    PATH_INDEX_SLOT_COUNT_BYTES,
+    Drofs,
+    DrofsImage,
+    Entry,
+    EntryFlags,
+    EntryMetadata,
+    EntryMetadataType,
+    EntryType,
+    PayloadSource,
+    entry_codec,
+    iter_entry_data,
+)
+
+# Marks of the entry codecs in listings
+CODEC_MARKS = {"zlib": "z", "lz4": "l"}
+
+
+def read_access_trace(trace_path):
+    """Reads an access trace, the first field of every line is a path, empty lines and lines starting with '#' are skipped."""
+    access_order = []
+    with open(trace_path) as f:
+        for line in f:
+            fields = line.split()
+            if fields and not fields[0].startswith('#'):
+                access_order.append(fields[0])
+    return access_order
+
+def create_archive(image_path, source_path, compression_level, verbose, path_index=False, window_bits=15, access_order=None,
+                   split_layout=False, merkle=False, codec="zlib"):
     if verbose:
         print(f"Creating archive at: {image_path}")
         print(f"Source path: {source_path}")
         print(f"Compression level: {compression_level}")
+        print(f"Codec: {codec}")
+        print(f"Window bits: {window_bits}")
+        print(f"Access trace paths: {len(access_order) if access_order else 0}")
+        print(f"Path index: {path_index}")
+        print(f"Split layout: {split_layout}")
+        print(f"Merkle digests: {merkle}")
+
+    with contextlib.ExitStack() as stack:
+        if is_archive_source(source_path):
+            # Archive members are read while the image is written, the archive stays open until then
+            archive, streaming = open_source_archive(source_path)
+            stack.enter_context(archive)
+            root_entry = build_archive_tree(archive, streaming, compression_level, verbose, window_bits, codec)
+            for source in tree_sources(root_entry):
+                stack.callback(source.close)
+        else:
+            # Build the Drofs linked list recursively
+            root_entry = build_drofs_tree(source_path, compression_level, verbose, window_bits, codec)
 
-    # Build the Drofs linked list recursively
-    root_entry = build_drofs_tree(source_path, compression_level, verbose)
-
-    drofs_instance = Drofs(image_path)
-    drofs_instance.root = root_entry
-    drofs_instance.serialize()
+        drofs_instance = Drofs(image_path)
+        drofs_instance.root = root_entry
+        drofs_instance.serialize(path_index=path_index, access_order=access_order, split_layout=split_layout, merkle=merkle)
 
     if verbose:
         print("Archive created successfully.")
 
-def build_drofs_tree(current_path, compression_level, verbose):
+def tree_sources(root):
+    """Returns the payload sources of the file entries of a tree."""
+    sources = []
+    pending = [root]
+    while pending:
+        entry = pending.pop()
+        pending.extend(entry.children)
+        if entry.source is not None:
+            sources.append(entry.source)
+    return sources
+
+def build_drofs_tree(current_path, compression_level, verbose, window_bits=15, codec="zlib"):
     name = os.path.basename(current_path)
     metadata_list = []
 
@@ -37,40 +110,22 @@ def build_drofs_tree(current_path, compression_level, verbose):
 
         for item in os.listdir(current_path):
             item_path = os.path.join(current_path, item)
-            child_entry = build_drofs_tree(item_path, compression_level, verbose)
+            child_entry = build_drofs_tree(item_path, compression_level, verbose, window_bits, codec)
             if child_entry:
                 entry.children.append(child_entry)
         return entry
     elif os.path.isfile(current_path):
-        with open(current_path, 'rb') as f:
-            data = f.read()
-
-        original_crc32 = zlib.crc32(data)
-        flags = 0
-        if compression_level > 0:
-            original_size = len(data)
-            compressed_data = zlib.compress(data, compression_level)
-            if (len(compressed_data) < len(data)):
-                print(f"{current_path}: compressed {len(compressed_data)} is smaller than original {len(data)}")
-                flags |= EntryFlags.COMPRESSED.value
-                data = compressed_data
-                print(f"adding original crc32 {original_crc32:#010x}")
-                metadata_list.append(EntryMetadata(EntryMetadataType.ORIGINAL_CRC32, original_crc32.to_bytes(4, 'little')))
-            else:
-                print(f"{current_path}: compressed {len(compressed_data)} is larger than original {len(data)}")
-        else:
-            original_size = len(data)
-
-        # Add original size metadata for file
-        print("adding original size ", original_size)
-        metadata_list.append(EntryMetadata(EntryMetadataType.ORIGINAL_SIZE, original_size.to_bytes(4, 'little')))
+        # The file is read and compressed in chunks when the image is written, ORIGINAL_SIZE and
+        # ORIGINAL_CRC32 metadata are added by the serializer
+        source = PayloadSource(current_path, compression_level, window_bits, codec)
 
         # Add timestamp metadata for file (modification time)
         modification_time = int(os.path.getmtime(current_path))
-        print("adding timestamp ", modification_time)
+        if verbose:
+            print("adding timestamp ", modification_time)
         metadata_list.append(EntryMetadata(EntryMetadataType.TIMESTAMP, modification_time.to_bytes(4, 'little')))
 
-        entry = Entry(EntryType.FILE, name, bytearray(data), flags=flags, metadata=metadata_list)
+        entry = Entry(EntryType.FILE, name, metadata=metadata_list, source=source)
         if verbose:
             print(f"Adding file: {current_path}")
         return entry
@@ -79,6 +134,311 @@ def build_drofs_tree(current_path, compression_level, verbose):
             print(f"Skipping unknown item: {current_path}")
         return None
 
+# Sources read as archives instead of walked as a folder, "-" reads a tar stream from stdin
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+ZIP_SUFFIXES = (".zip",)
+
+def is_archive_source(source_path):
+    return source_path == "-" or source_path.lower().endswith(TAR_SUFFIXES + ZIP_SUFFIXES)
+
+def open_source_archive(source_path):
+    """Opens a tar or zip source archive.
+
+    Returns:
+        The open TarFile or ZipFile, and whether it is read as a stream. Zip files and uncompressed tar files
+        are read member by member when the image is written. Compressed tar files and stdin are read in a single
+        pass instead, as seeking back in a compressed stream restarts its decompression.
+    """
+    if source_path == "-":
+        return tarfile.open(fileobj=sys.stdin.buffer, mode="r|*"), True
+    if source_path.lower().endswith(ZIP_SUFFIXES):
+        return zipfile.ZipFile(source_path), False
+    if source_path.lower().endswith(".tar"):
+        return tarfile.open(source_path, "r:"), False
+    return tarfile.open(source_path, "r|*"), True
+
+def iter_member_chunks(open_member):
+    """Yields the data of an archive member in chunks, open_member returns its file object."""
+    with open_member() as f:
+        while True:
+            chunk = f.read(DECOMPRESS_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+def iter_archive_members(archive, streaming):
+    """Yields (name, is directory, modification time, data) for the files and directories of a source archive.
+
+    data is None for directories, a callable streaming the member when the archive is read member by member,
+    or an iterator of the member's chunks when it is read as a stream, which must be consumed before the next
+    member is reached, since a stream member cannot be read again. Links and special files are skipped.
+    """
+    if isinstance(archive, zipfile.ZipFile):
+        for info in archive.infolist():
+            # Zip timestamps are local times
+            modification_time = int(time.mktime(info.date_time + (0, 0, -1)))
+            if info.is_dir():
+                yield info.filename, True, modification_time, None
+            else:
+                yield info.filename, False, modification_time, lambda info=info: iter_member_chunks(lambda: archive.open(info))
+        return
+    for member in archive:
+        if member.isdir():
+            yield member.name, True, int(member.mtime), None
+        elif member.isfile() and streaming:
+            yield member.name, False, int(member.mtime), iter_member_chunks(lambda member=member: archive.extractfile(member))
+        elif member.isfile():
+            yield member.name, False, int(member.mtime), lambda member=member: iter_member_chunks(lambda: archive.extractfile(member))
+
+def build_archive_tree(archive, streaming, compression_level, verbose, window_bits=15, codec="zlib"):
+    """Builds the entry tree of a source archive, children are sorted by name.
+
+    Directories implied by member paths but not archived themselves get no timestamp. Members with '..'
+    in their path are skipped, a later member replaces an earlier one of the same path.
+    Members of a streamed archive are compressed as they are read, keeping only their payload in a temporary
+    file, the sources must be closed once the image is written.
+    """
+    directories = {"/": Entry(EntryType.DIRECTORY, "")}
+    files = {}
+    for name, is_directory, modification_time, data in iter_archive_members(archive, streaming):
+        parts = [part for part in name.split("/") if part not in ("", ".")]
+        if ".." in parts:
+            if verbose:
+                print(f"Skipping unsafe member: {name}")
+            continue
+        image_path = "/" + "/".join(parts)
+        if image_path in (files if is_directory else directories):
+            raise ValueError(f"{image_path}: both a file and a directory in the archive.")
+        timestamp = EntryMetadata(EntryMetadataType.TIMESTAMP, modification_time.to_bytes(4, 'little'))
+        if is_directory:
+            if verbose:
+                print(f"Adding directory: {image_path}")
+            directories.setdefault(image_path, Entry(EntryType.DIRECTORY, parts[-1] if parts else "")).metadata = [timestamp]
+            continue
+        if verbose:
+            print(f"Adding file: {image_path}")
+        source = PayloadSource(data, compression_level, window_bits, codec)
+        if not callable(data):
+            # The stream moves on to the next member, read this one now
+            source.prepare(keep=True)
+        if image_path in files:
+            files[image_path].source.close()
+        files[image_path] = Entry(EntryType.FILE, parts[-1], metadata=[timestamp], source=source)
+
+    for image_path in list(files) + list(directories):
+        # Add the directories implied by member paths
+        parent = image_path.rsplit("/", 1)[0] or "/"
+        while parent not in directories:
+            if parent in files:
+                raise ValueError(f"{parent}: both a file and a directory in the archive.")
+            directories[parent] = Entry(EntryType.DIRECTORY, parent.rsplit("/", 1)[1])
+            parent = parent.rsplit("/", 1)[0] or "/"
+    entries = {**directories, **files}
+    for image_path in sorted(entries):
+        if image_path != "/":
+            entries[image_path.rsplit("/", 1)[0] or "/"].children.append(entries[image_path])
+    return directories["/"]
+
+# Policy applied to every file before the manifest's defaults and rules, stores the data like the default --level 0
+DEFAULT_POLICY = {"compress": False, "codec": "zlib", "level": 9, "window_bits": 15, "alignment": 1}
+MANIFEST_KEYS = ("path_index", "split_layout", "merkle", "access_trace", "defaults", "sources", "rules")
+
+def load_manifest(manifest_path):
+    """Reads a build manifest, TOML if its extension is .toml, JSON otherwise."""
+    if manifest_path.endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ValueError("TOML manifests need Python 3.11 or the tomli package, use a JSON manifest instead.") from None
+        with open(manifest_path, 'rb') as f:
+            return tomllib.load(f)
+    with open(manifest_path) as f:
+        return json.load(f)
+
+def glob_to_regex(pattern):
+    """Translates a glob, '*' and '?' match within a path component, '**' matches across components.
+
+    Patterns without a '/' match the file name only, others the whole image path.
+    """
+    if "/" not in pattern:
+        pattern = "**/" + pattern
+    regex = ""
+    index = 0
+    pattern = pattern.lstrip("/")
+    while index < len(pattern):
+        if pattern.startswith("**/", index):
+            regex += "(?:.*/)?"
+            index += 3
+        elif pattern.startswith("**", index):
+            regex += ".*"
+            index += 2
+        elif pattern[index] == "*":
+            regex += "[^/]*"
+            index += 1
+        elif pattern[index] == "?":
+            regex += "[^/]"
+            index += 1
+        else:
+            regex += re.escape(pattern[index])
+            index += 1
+    return re.compile("/" + regex + r"\Z")
+
+def validate_policy(policy, where):
+    unknown = set(policy) - set(DEFAULT_POLICY) - {"match"}
+    if unknown:
+        raise ValueError(f"{where}: unknown keys {', '.join(sorted(unknown))}.")
+    if "codec" in policy and policy["codec"] not in CODECS:
+        raise ValueError(f"{where}: codec must be {' or '.join(CODECS)}.")
+    if "level" in policy and policy["level"] not in range(0, 10):
+        raise ValueError(f"{where}: level must be 0-9.")
+    if "window_bits" in policy and policy["window_bits"] not in range(9, 16):
+        raise ValueError(f"{where}: window_bits must be 9-15.")
+    if "alignment" in policy and (not isinstance(policy["alignment"], int) or policy["alignment"] < 1):
+        raise ValueError(f"{where}: alignment must be a positive integer.")
+
+def join_image_path(directory, name):
+    return directory.rstrip("/") + "/" + name
+
+def plan_manifest(manifest, base_path):
+    """Resolves a manifest into the directories and files of the image, before anything is read or compressed.
+
+    Args:
+        manifest: The parsed manifest.
+        base_path: The folder relative source paths are resolved from, usually the manifest's folder.
+
+    Returns:
+        A dict of directory image paths to their source folder (None for directories only implied by a target),
+        and a list of (image path, source file, policy) for every file, sorted by image path.
+    """
+    unknown = set(manifest) - set(MANIFEST_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown manifest keys {', '.join(sorted(unknown))}.")
+    defaults = dict(DEFAULT_POLICY)
+    defaults.update(manifest.get("defaults", {}))
+    validate_policy(defaults, "defaults")
+    rules = manifest.get("rules", [])
+    for index, rule in enumerate(rules):
+        if "match" not in rule:
+            raise ValueError(f"rules[{index}]: missing match.")
+        validate_policy(rule, f"rules[{index}]")
+    rule_patterns = [glob_to_regex(rule["match"]) for rule in rules]
+    if not manifest.get("sources"):
+        raise ValueError("The manifest has no sources.")
+
+    directories = {"/": None}
+    files = {}
+    def add_directory(image_path, source_dir):
+        parent = image_path.rsplit("/", 1)[0] or "/"
+        if image_path != "/" and parent not in directories:
+            add_directory(parent, None)
+        if image_path in files:
+            raise ValueError(f"{image_path}: both a file ({files[image_path][0]}) and a directory.")
+        if directories.get(image_path) is None:
+            directories[image_path] = source_dir
+
+    def add_file(image_path, source_file):
+        if image_path in directories:
+            raise ValueError(f"{image_path}: both a directory and a file ({source_file}).")
+        if image_path in files:
+            raise ValueError(f"{image_path}: provided by both {files[image_path][0]} and {source_file}.")
+        add_directory(image_path.rsplit("/", 1)[0] or "/", None)
+        policy = dict(defaults)
+        for rule, rule_pattern in zip(rules, rule_patterns):
+            if rule_pattern.match(image_path):
+                policy.update({key: value for key, value in rule.items() if key != "match"})
+        files[image_path] = (source_file, policy)
+
+    for index, source in enumerate(manifest["sources"]):
+        if "path" not in source:
+            raise ValueError(f"sources[{index}]: missing path.")
+        source_path = os.path.join(base_path, source["path"])
+        target = "/" + "/".join(part for part in source.get("target", "/").split("/") if part)
+        excludes = [glob_to_regex(pattern) for pattern in source.get("exclude", [])]
+        if os.path.isfile(source_path):
+            # A file maps to the target path, or into it when the target ends with '/'
+            add_file(join_image_path(target, os.path.basename(source_path)) if source.get("target", "/").endswith("/") else target,
+                     source_path)
+            continue
+        if not os.path.isdir(source_path):
+            raise ValueError(f"sources[{index}]: {source_path} does not exist.")
+        for dir_path, dir_names, file_names in os.walk(source_path):
+            # Excludes match paths relative to the source folder
+            relative = os.path.relpath(dir_path, source_path)
+            relative_dir = "/" if relative == "." else "/" + "/".join(relative.split(os.sep))
+            image_dir = target if relative == "." else join_image_path(target, relative_dir.lstrip("/"))
+            dir_names[:] = sorted(name for name in dir_names
+                                  if not any(exclude.match(join_image_path(relative_dir, name)) for exclude in excludes))
+            add_directory(image_dir, dir_path)
+            for name in sorted(file_names):
+                if not any(exclude.match(join_image_path(relative_dir, name)) for exclude in excludes):
+                    add_file(join_image_path(image_dir, name), os.path.join(dir_path, name))
+
+    if not manifest.get("split_layout") and any(policy["alignment"] > 1 for _, policy in files.values()):
+        raise ValueError("Payload alignment needs split_layout, inline payloads follow their entry header.")
+    return directories, [(image_path, source_file, policy) for image_path, (source_file, policy) in sorted(files.items())]
+
+def build_manifest_tree(directories, files):
+    """Builds the entry tree of a plan, children are sorted by name."""
+    entries = {}
+    for image_path in sorted(directories):
+        entry = Entry(EntryType.DIRECTORY, "" if image_path == "/" else image_path.rsplit("/", 1)[1])
+        if directories[image_path] is not None:
+            creation_time = int(os.path.getctime(directories[image_path]))
+            entry.metadata.append(EntryMetadata(EntryMetadataType.TIMESTAMP, creation_time.to_bytes(4, 'little')))
+        entries[image_path] = entry
+    for image_path, source_file, policy in files:
+        level = policy["level"] if policy["compress"] else 0
+        modification_time = int(os.path.getmtime(source_file))
+        entries[image_path] = Entry(EntryType.FILE, image_path.rsplit("/", 1)[1],
+                                    metadata=[EntryMetadata(EntryMetadataType.TIMESTAMP, modification_time.to_bytes(4, 'little'))],
+                                    source=PayloadSource(source_file, level, policy["window_bits"], policy["codec"]), alignment=policy["alignment"])
+    for image_path in sorted(entries):
+        if image_path != "/":
+            entries[image_path.rsplit("/", 1)[0] or "/"].children.append(entries[image_path])
+    return entries["/"]
+
+def build_archive(manifest_path, image_path, jobs, verbose, dry_run=False):
+    """Builds an image from a manifest: plans every file's policy, compresses the files in parallel, then writes the image."""
+    try:
+        manifest = load_manifest(manifest_path)
+        directories, files = plan_manifest(manifest, os.path.dirname(os.path.abspath(manifest_path)))
+    except (OSError, ValueError) as e:
+        print(f"Invalid manifest {manifest_path}: {e}", file=sys.stderr)
+        return False
+
+    if verbose or dry_run:
+        print(f"{len(directories)} directories, {len(files)} files")
+        for file_path, source_file, policy in files:
+            codec = policy["codec"] if policy["compress"] else "-"
+            level = policy["level"] if policy["compress"] else 0
+            print(f"{codec:<4} level {level} window {policy['window_bits']:>2} align {policy['alignment']:>5} {file_path} <- {source_file}")
+    if dry_run:
+        return True
+
+    root = build_manifest_tree(directories, files)
+    sources = tree_sources(root)
+    try:
+        # zlib releases the GIL (the LZ4 compressor runs in Python and does not), the compressed payloads are kept in temporary files until written
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            list(executor.map(lambda source: source.prepare(keep=True), sources))
+
+        access_trace = manifest.get("access_trace")
+        access_order = read_access_trace(os.path.join(os.path.dirname(manifest_path), access_trace)) if access_trace else None
+        drofs_instance = Drofs(image_path)
+        drofs_instance.root = root
+        drofs_instance.serialize(path_index=manifest.get("path_index", False), access_order=access_order,
+                                 split_layout=manifest.get("split_layout", False), merkle=manifest.get("merkle", False))
+    finally:
+        for source in sources:
+            source.close()
+
+    if verbose:
+        print(f"Archive created at: {image_path}")
+    return True
+
 def compare_archive(image_path, source_path, verbose):
     if verbose:
         print(f"Comparing archive: {image_path} with source path: {source_path}")
@@ -146,10 +506,8 @@ def compare_recursive(archive_entry : Entry, current_source_path, verbose):
         with open(current_source_path, 'rb') as f:
             source_data = f.read()
 
-        archive_data = archive_entry.data
         # If compressed, decompress before comparison
-        if archive_entry.flags & EntryFlags.COMPRESSED.value:
-            archive_data = zlib.decompress(archive_data)
+        archive_data = b"".join(iter_entry_data(archive_entry))
 
         if archive_data != source_data:
             print(f"Content mismatch: '{current_source_path}'")
@@ -171,23 +529,354 @@ def compare_recursive(archive_entry : Entry, current_source_path, verbose):
                 print(f"No ORIGINAL_SIZE metadata found for '{current_source_path}'")
 
 
+def verify_archive(image_path, jobs, verbose, paths=None):
+    if verbose:
+        print(f"Verifying archive: {image_path} with {jobs} jobs")
+
+    with DrofsImage(image_path) as image:
+        if paths:
+            # Only the entries on the paths, through the Merkle digests
+            problems = []
+            for path in paths:
+                try:
+                    if image.find_verified_entry(path) is None:
+                        problems.append(f"{path}: not found.")
+                except (ValueError, IndexError, struct.error) as e:
+                    problems.append(f"{path}: {e}")
+        else:
+            problems = image.verify(jobs)
+
+    for problem in problems:
+        print(problem)
+
+    if verbose:
+        print(f"Found {len(problems)} problems." if problems else "Archive verified successfully.")
+    return not problems
+
+def entry_timestamp(entry: Entry):
+    timestamp_metadata = entry.get_metadata_by_type(EntryMetadataType.TIMESTAMP)
+    return int.from_bytes(timestamp_metadata.data, 'little') if timestamp_metadata else None
+
+def entry_original_size(entry: Entry):
+    original_size_metadata = entry.get_metadata_by_type(EntryMetadataType.ORIGINAL_SIZE)
+    return int.from_bytes(original_size_metadata.data, 'little') if original_size_metadata else len(entry.data)
+
+def is_safe_entry_name(name):
+    return name not in ("", ".", "..") and "/" not in name and os.sep not in name
+
+def is_within_directory(path, directory):
+    """Whether path resolves, following symlinks, to directory or a path under it."""
+    real_path = os.path.realpath(path)
+    return real_path == directory or real_path.startswith(directory.rstrip(os.sep) + os.sep)
+
+def extract_file(entry: Entry, target_path):
+    # Only one chunk per worker is held in memory while inflating
+    with open(target_path, 'wb') as f:
+        for chunk in iter_entry_data(entry):
+            f.write(chunk)
+    timestamp = entry_timestamp(entry)
+    if timestamp is not None:
+        os.utime(target_path, (timestamp, timestamp))
+
+def extract_archive(image_path, output_path, jobs, verbose):
+    if verbose:
+        print(f"Extracting archive: {image_path} to {output_path} with {jobs} jobs")
+
+    output_root = os.path.realpath(output_path)
+    with DrofsImage(image_path) as image, ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        directories = []
+        files = []
+        skipped_prefixes = []
+        for entry_path, entry in image.walk():
+            # The children of a skipped entry are walked as well, skip its whole subtree
+            if any(entry_path.startswith(prefix) for prefix in skipped_prefixes):
+                continue
+            target_path = os.path.join(output_path, *[part for part in entry_path.split('/') if part])
+            if entry_path != "/" and (not is_safe_entry_name(entry.name) or not is_within_directory(target_path, output_root)):
+                print(f"Skipping unsafe entry name: '{entry_path}'")
+                skipped_prefixes.append(entry_path + "/")
+                continue
+            if entry.type == EntryType.DIRECTORY:
+                os.makedirs(target_path, exist_ok=True)
+                directories.append((entry, target_path))
+            else:
+                if verbose:
+                    print(f"Extracting file: {entry_path}")
+                files.append(executor.submit(extract_file, entry, target_path))
+
+        for future in files:
+            future.result()
+
+    # Directory timestamps are restored last, writing their children updates them
+    for entry, target_path in reversed(directories):
+        timestamp = entry_timestamp(entry)
+        if timestamp is not None:
+            os.utime(target_path, (timestamp, timestamp))
+
+    if verbose:
+        print(f"Extracted {len(files)} files and {len(directories)} directories.")
+    return True
+
+def list_archive(image_path, path, long_format):
+    with DrofsImage(image_path) as image:
+        prefix = "/" + "/".join(part for part in path.split('/') if part)
+        listed = False
+        for entry_path, entry in image.walk():
+            if entry_path != prefix and not entry_path.startswith(prefix.rstrip('/') + "/"):
+                continue
+            listed = True
+            if long_format:
+                kind = "d" if entry.type == EntryType.DIRECTORY else "-"
+                compressed = CODEC_MARKS.get(entry_codec(entry), "-")
+                timestamp = entry_timestamp(entry)
+                timestamp = '-' if timestamp is None else timestamp
+                print(f"{kind}{compressed} {entry_original_size(entry):>10} {len(entry.data):>10} {timestamp:>10} {entry_path}")
+            else:
+                print(entry_path)
+    if not listed:
+        print(f"Path not found: {path}", file=sys.stderr)
+    return listed
+
+def cat_entry(image_path, path):
+    with DrofsImage(image_path) as image:
+        entry = image.find_entry(path)
+        if entry is None or entry.type != EntryType.FILE:
+            print(f"File not found: {path}", file=sys.stderr)
+            return False
+        for chunk in iter_entry_data(entry):
+            sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
+    return True
+
+def entry_record_sizes(entry: Entry):
+    """Returns the bytes of an entry record spent on its fixed fields and name, on each metadata type and on its children table."""
+    fixed_bytes = (ENTRY_TYPE_BYTES + NAME_LENGTH_BYTES + len(entry.name) + 1 + DATA_LENGTH_BYTES + DATA_CRC32_BYTES
+                   + FLAGS_BYTES + 1)
+    metadata_bytes = Counter()
+    for metadata_item in entry.metadata:
+        metadata_bytes[metadata_item.type.name] += 3 + len(metadata_item.data) # type, length and data
+    children_table_bytes = NUM_CHILDREN_BYTES + CHILD_OFFSET_BYTES * len(entry.children)
+    return fixed_bytes, metadata_bytes, children_table_bytes
+
+def analyze_image(image: DrofsImage):
+    """Scans the image once and reports where its bytes go, its compression, duplicates and lookup costs."""
+    header_bytes = 0
+    metadata_bytes = Counter()
+    children_table_bytes = 0
+    payload_bytes = 0
+    files = []
+    directories = []
+    payloads = {}
+    lookup = {"max_depth": 0, "max_depth_path": "/", "max_sibling_scan": 0, "max_sibling_scan_path": "/",
+              "max_entries_read": 1, "max_entries_read_path": "/"}
+
+    # (parent path, offset, depth, position among its siblings, entries read by drofs_get_entry to reach it)
+    pending = [("", 0, 0, 0, 1)]
+    seen = set()
+    while pending:
+        parent_path, offset, depth, sibling_scan, entries_read = pending.pop()
+        if offset in seen:
+            raise ValueError(f"{parent_path or '/'}: cycle at offset {offset}.")
+        seen.add(offset)
+        entry = image.read_entry(offset)
+        entry_path = f"{parent_path}/{entry.name}" if offset != 0 else "/"
+        fixed_bytes, entry_metadata_bytes, entry_children_table_bytes = entry_record_sizes(entry)
+        header_bytes += fixed_bytes + sum(entry_metadata_bytes.values()) + entry_children_table_bytes
+        metadata_bytes.update(entry_metadata_bytes)
+        children_table_bytes += entry_children_table_bytes
+        payload_bytes += len(entry.data)
+
+        for key, value in (("max_depth", depth), ("max_sibling_scan", sibling_scan), ("max_entries_read", entries_read)):
+            if value > lookup[key]:
+                lookup[key] = value
+                lookup[f"{key}_path"] = entry_path
+
+        if entry.type == EntryType.DIRECTORY:
+            directories.append({"path": entry_path, "children": len(entry.children)})
+        else:
+            original_size = entry_original_size(entry)
+            files.append({"path": entry_path, "stored": len(entry.data), "original": original_size,
+                          "ratio": round(len(entry.data) / original_size, 4) if original_size else 1.0,
+                          "compressed": bool(entry.flags & EntryFlags.COMPRESSED.value), "codec": entry_codec(entry)})
+            if entry.data:
+                payloads.setdefault((entry.data_crc32, len(entry.data)), []).append(entry_path)
+
+        child_parent_path = "" if offset == 0 else entry_path
+        for index, child_offset in reversed(list(enumerate(entry.children))):
+            # drofs_get_entry reads every sibling before the child while scanning the children
+            pending.append((child_parent_path, child_offset, depth + 1, index + 1, entries_read + index + 1))
+
+    duplicates = [{"crc32": f"{crc32:#010x}", "size": size, "paths": paths, "wasted": size * (len(paths) - 1)}
+                  for (crc32, size), paths in payloads.items() if len(paths) > 1]
+    duplicates.sort(key=lambda duplicate: duplicate["wasted"], reverse=True)
+    directories.sort(key=lambda directory: directory["children"], reverse=True)
+    files.sort(key=lambda file: file["stored"], reverse=True)
+
+    root = image.read_entry(0)
+    path_index_bytes = 0
+    path_index_metadata = root.get_metadata_by_type(EntryMetadataType.PATH_INDEX)
+    if path_index_metadata:
+        slot_count = struct.unpack_from('I', image.linked_list, struct.unpack('I', path_index_metadata.data)[0])[0]
+        path_index_bytes = PATH_INDEX_SLOT_COUNT_BYTES + PATH_INDEX_FLAGS_BYTES + PATH_INDEX_SLOT_BYTES * slot_count
+    lookup["path_index"] = path_index_metadata is not None
+
+    image_bytes = len(image.view)
+    return {
+        "image_bytes": image_bytes,
+        "file_header_bytes": FILE_METADATA_SIZE,
+        "entry_header_bytes": header_bytes,
+        "payload_bytes": payload_bytes,
+        "path_index_bytes": path_index_bytes,
+        "other_bytes": image_bytes - FILE_METADATA_SIZE - header_bytes - payload_bytes - path_index_bytes,
+        "metadata_bytes": dict(metadata_bytes.most_common()),
+        "children_table_bytes": children_table_bytes,
+        "original_bytes": sum(file["original"] for file in files),
+        "files": files,
+        "directories": directories,
+        "duplicates": duplicates,
+        "lookup": lookup,
+    }
+
+def print_analysis(analysis, top):
+    image_bytes = analysis["image_bytes"]
+    def share(value):
+        return f"{value:>12,} {100 * value / image_bytes if image_bytes else 0:6.2f}%"
+
+    print(f"{'Image':<28}{image_bytes:>12,}")
+    print(f"{'  file header':<28}{share(analysis['file_header_bytes'])}")
+    print(f"{'  entry headers':<28}{share(analysis['entry_header_bytes'])}")
+    for metadata_type, size in analysis["metadata_bytes"].items():
+        print(f"{'    metadata ' + metadata_type:<28}{share(size)}")
+    print(f"{'    children tables':<28}{share(analysis['children_table_bytes'])}")
+    print(f"{'  payloads':<28}{share(analysis['payload_bytes'])}")
+    print(f"{'  path index':<28}{share(analysis['path_index_bytes'])}")
+    print(f"{'  other':<28}{share(analysis['other_bytes'])}")
+    original_bytes = analysis["original_bytes"]
+    ratio = analysis["payload_bytes"] / original_bytes if original_bytes else 1.0
+    print(f"{'Original data':<28}{original_bytes:>12,} ratio {ratio:.4f}")
+
+    print(f"\nLargest files (of {len(analysis['files'])})")
+    print(f"{'stored':>12} {'original':>12} {'ratio':>7}  path")
+    for file in analysis["files"][:top]:
+        print(f"{file['stored']:>12,} {file['original']:>12,} {file['ratio']:>7.4f}{CODEC_MARKS.get(file['codec'], ' ')} {file['path']}")
+
+    print(f"\nDuplicate payloads ({len(analysis['duplicates'])})")
+    for duplicate in analysis["duplicates"][:top]:
+        print(f"{duplicate['wasted']:>12,} wasted, {duplicate['size']:,} bytes x {len(duplicate['paths'])} crc32 {duplicate['crc32']}: "
+              + ", ".join(duplicate["paths"]))
+
+    print(f"\nLargest directories (of {len(analysis['directories'])})")
+    for directory in analysis["directories"][:top]:
+        print(f"{directory['children']:>12,} {directory['path']}")
+
+    lookup = analysis["lookup"]
+    print("\nLookup (drofs_get_entry without path index)" if not lookup["path_index"] else "\nLookup (tree walk, the path index resolves paths in one probe)")
+    print(f"{'  max depth':<28}{lookup['max_depth']:>12,} {lookup['max_depth_path']}")
+    print(f"{'  max sibling scan':<28}{lookup['max_sibling_scan']:>12,} {lookup['max_sibling_scan_path']}")
+    print(f"{'  max entries read':<28}{lookup['max_entries_read']:>12,} {lookup['max_entries_read_path']}")
+
+def analyze_archive(image_path, json_output, top):
+    with DrofsImage(image_path) as image:
+        analysis = analyze_image(image)
+    if json_output:
+        print(json.dumps(analysis, indent=2))
+    else:
+        print_analysis(analysis, top)
+    return True
+
+def build_command_parser():
+    parser = argparse.ArgumentParser(description="DROFS CLI tool for inspecting archives.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="Build an image from a manifest of sources and per-glob policies.")
+    build_parser.add_argument("manifestpath", help="Path to the JSON or TOML manifest.")
+    build_parser.add_argument("imagepath", help="Path to the DROFS archive file.")
+    build_parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                              help="Number of files compressed in parallel. Defaults to the number of CPUs.")
+    build_parser.add_argument("-v", "--verbose", action="store_true",
+                              help="Display what the CLI is doing.")
+    build_parser.add_argument("-n", "--dry-run", action="store_true",
+                              help="Print the plan, every file with its policy and source, without writing the image.")
+    build_parser.set_defaults(func=lambda args: build_archive(args.manifestpath, args.imagepath, args.jobs, args.verbose, args.dry_run))
+
+    verify_parser = subparsers.add_parser("verify", help="Verify every checksum in the image and report all corrupt entries.")
+    verify_parser.add_argument("imagepath", help="Path to the DROFS archive file.")
+    verify_parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                               help="Number of entries verified in parallel. Defaults to the number of CPUs.")
+    verify_parser.add_argument("-v", "--verbose", action="store_true",
+                               help="Display what the CLI is doing.")
+    verify_parser.add_argument("-p", "--path", action="append", dest="paths",
+                               help="Verify only the entries on this path through the Merkle digests, may be repeated.")
+    verify_parser.set_defaults(func=lambda args: verify_archive(args.imagepath, args.jobs, args.verbose, args.paths))
+
+    extract_parser = subparsers.add_parser("extract", help="Extract the image into a folder, restoring timestamps.")
+    extract_parser.add_argument("imagepath", help="Path to the DROFS archive file.")
+    extract_parser.add_argument("outputpath", help="Folder the image root is extracted to.")
+    extract_parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                                help="Number of files written in parallel. Defaults to the number of CPUs.")
+    extract_parser.add_argument("-v", "--verbose", action="store_true",
+                                help="Display what the CLI is doing.")
+    extract_parser.set_defaults(func=lambda args: extract_archive(args.imagepath, args.outputpath, args.jobs, args.verbose))
+
+    ls_parser = subparsers.add_parser("ls", help="List the entries of the image.")
+    ls_parser.add_argument("imagepath", help="Path to the DROFS archive file.")
+    ls_parser.add_argument("path", nargs="?", default="/", help="Directory or file to list. Defaults to the root.")
+    ls_parser.add_argument("-l", "--long", action="store_true",
+                           help="Show type, compression, original size, stored size and timestamp.")
+    ls_parser.set_defaults(func=lambda args: list_archive(args.imagepath, args.path, args.long))
+
+    cat_parser = subparsers.add_parser("cat", help="Write the content of a file in the image to stdout.")
+    cat_parser.add_argument("imagepath", help="Path to the DROFS archive file.")
+    cat_parser.add_argument("path", help="Path of the file in the image.")
+    cat_parser.set_defaults(func=lambda args: cat_entry(args.imagepath, args.path))
+
+    analyze_parser = subparsers.add_parser("analyze", help="Report where the image's bytes go, compression, duplicates and lookup costs.")
+    analyze_parser.add_argument("imagepath", help="Path to the DROFS archive file.")
+    analyze_parser.add_argument("--json", action="store_true", help="Output the full report as JSON.")
+    analyze_parser.add_argument("-n", "--top", type=int, default=10, help="Number of files, duplicates and directories listed in the table.")
+    analyze_parser.set_defaults(func=lambda args: analyze_archive(args.imagepath, args.json, args.top))
+
+    return parser
+
+COMMANDS = ("build", "verify", "extract", "ls", "cat", "analyze")
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] in COMMANDS:
+        args = build_command_parser().parse_args()
+        sys.exit(0 if args.func(args) else 1)
+
     parser = argparse.ArgumentParser(description="DROFS CLI tool for creating and comparing archives.")
     parser.add_argument("imagepath", help="Path to the DROFS archive file.")
-    parser.add_argument("sourcepath", help="Path to the source directory or file.")
+    parser.add_argument("sourcepath", help="Path to the source directory or file, a .tar, .tar.gz or .zip archive, or - for a tar stream on stdin.")
     parser.add_argument("-l", "--level", type=int, default=0, choices=range(0, 10),
                         help="Compression level (0-9). 0 means no compression. Compatible with miniz (zlib).")
+    parser.add_argument("-c", "--codec", type=str, default="zlib", choices=CODECS,
+                        help="Compression codec, lz4 decompresses several times faster than zlib at some cost in compression ratio.")
+    parser.add_argument("-w", "--window-bits", type=int, default=15, choices=range(9, 16),
+                        help="Compression window size as log2 (9-15), smaller windows need smaller decompression buffers on the device.")
+    parser.add_argument("-a", "--access-trace", type=str, default=None,
+                        help="File listing paths in access order, one per line. Accessed entries are placed first in the image.")
     parser.add_argument("-t", "--test", action="store_true",
                         help="Compare the image with the folder, reading file by file and comparing contents.")
     parser.add_argument("-v", "--verbose", action="store_true",
                         help="Display what the CLI is doing.")
+    parser.add_argument("-i", "--path-index", action="store_true",
+                        help="Add a path hash index section for constant-time path lookups.")
+    parser.add_argument("-s", "--split-layout", action="store_true",
+                        help="Place all entry headers in a compact region at the start of the image, followed by the payloads.")
+    parser.add_argument("-m", "--merkle", action="store_true",
+                        help="Add Merkle digests so readers can verify only the entries on the paths they access.")
 
     args = parser.parse_args()
 
+    if args.test and is_archive_source(args.sourcepath):
+        parser.error("-t compares the image with a folder, not an archive")
     if args.test:
         compare_archive(args.imagepath, args.sourcepath, args.verbose)
     else:
-        create_archive(args.imagepath, args.sourcepath, args.level, args.verbose)
+        access_order = read_access_trace(args.access_trace) if args.access_trace else None
+        create_archive(args.imagepath, args.sourcepath, args.level, args.verbose, args.path_index, args.window_bits, access_order,
+                       args.split_layout, args.merkle, args.codec)
 
 if __name__ == "__main__":
     main()
@@ -2,12 +2,31 @@ import io  # Required for BytesIO in test_corrupted_entry_data_fails
 import os
 import struct
 import zlib  # Required for zlib.crc32 in test_corrupted_entry_data_fails
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 # Add the path to the drofs library to sys.path
 # sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'lib', 'drofs', 'tool')))
-from drofs import NAME_LENGTH_BYTES, Drofs, Entry, EntryType
+from drofs import (
+    DATA_LENGTH_BYTES,
+    ENTRY_TYPE_BYTES,
+    FILE_METADATA_SIZE,
+    NAME_LENGTH_BYTES,
+    Drofs,
+    DrofsImage,
+    Entry,
+    EntryFlags,
+    EntryMetadataType,
+    EntryType,
+    Lz4Compressor,
+    PayloadCache,
+    PayloadSource,
+    iter_lz4_decompressed,
+    lz4_decompress,
+    read_entry_range,
+    zlib_window_bits,
+)
 
 
 @pytest.fixture
@@ -132,7 +151,7 @@ def test_corrupted_entry_data_fails(drofs_setup_teardown):
 
     # Read the entire file content
     with open(file_system_path, 'rb') as f:
-        f.read(5) # Skip header
+        f.read(base_offset_for_linked_list) # Skip header and overall CRC32
         # original_overall_crc32 = struct.unpack('I', f.read(4))[0]
         linked_list_bytes = bytearray(f.read())
 
@@ -219,3 +238,349 @@ def test_entry_flags(drofs_setup_teardown):
     # Clean up the test file
     if os.path.exists(file_system_path):
         os.remove(file_system_path)
+
+def test_path_hash_ignores_redundant_separators():
+    from drofs import path_hash
+    assert path_hash("/") == 0x811c9dc5
+    assert path_hash("/dir2//subdir1/file3.log/") == path_hash("dir2/subdir1/file3.log")
+    assert path_hash("dir2/file2.txt") != path_hash("dir2file2.txt")
+
+def test_path_index_resolves_every_path(drofs_setup_teardown):
+    drofs_instance = drofs_setup_teardown
+    drofs_instance.serialize(path_index=True)
+
+    from drofs import EntryMetadataType
+    root = drofs_instance.deserialize("/")
+    path_index_metadata = root.get_metadata_by_type(EntryMetadataType.PATH_INDEX)
+    assert path_index_metadata is not None
+
+    with open(drofs_instance.file_path, 'rb') as f:
+        for path, name in [("/dir1", "dir1"), ("/dir1/file1.txt", "file1.txt"), ("/dir2/subdir1/file3.log", "file3.log")]:
+            resolved, entry = drofs_instance._lookup_path_index(f, path_index_metadata, [comp for comp in path.split('/') if comp])
+            assert resolved is True
+            assert entry.name == name
+        resolved, entry = drofs_instance._lookup_path_index(f, path_index_metadata, ["dir1", "missing.txt"])
+        assert resolved is True
+        assert entry is None
+
+    assert drofs_instance.deserialize("/dir2/subdir1/file3.log").data == bytearray(b"Log data")
+    assert drofs_instance.deserialize("/dir2/missing.txt") is None
+
+def test_path_index_with_ambiguous_hashes_falls_back_to_tree_walk(drofs_setup_teardown, monkeypatch):
+    import drofs
+    monkeypatch.setattr(drofs, "path_hash", lambda path: 0)
+
+    drofs_instance = drofs_setup_teardown
+    drofs_instance.root.children[0].children.append(Entry(EntryType.FILE, "file2.txt", data=bytearray(b"Other file2")))
+    drofs_instance.serialize(path_index=True)
+
+    assert drofs_instance.deserialize("/dir1/file2.txt").data == bytearray(b"Other file2")
+    assert drofs_instance.deserialize("/dir2/file2.txt").data == bytearray(b"Content of file2")
+    assert drofs_instance.deserialize("/dir2/subdir1/file3.log").data == bytearray(b"Log data")
+    assert drofs_instance.deserialize("/dir2/missing.txt") is None
+
+def test_access_order_places_accessed_entries_first(drofs_setup_teardown):
+    drofs_instance = drofs_setup_teardown
+    root = drofs_instance.root
+    dir1, dir2 = root.children
+    file1 = dir1.children[0]
+    file2, subdir1 = dir2.children
+    file3 = subdir1.children[0]
+
+    # Depth-first order by default
+    assert [entry.offset for entry in (root, dir1, file1, dir2, file2, subdir1, file3)] == sorted(
+        entry.offset for entry in (root, dir1, file1, dir2, file2, subdir1, file3))
+
+    drofs_instance.serialize(access_order=["/dir2/subdir1/file3.log", "/missing.txt", "/dir1/file1.txt", "/dir2/subdir1/file3.log"])
+    assert [entry.offset for entry in (root, dir2, subdir1, file3, dir1, file1, file2)] == sorted(
+        entry.offset for entry in (root, dir2, subdir1, file3, dir1, file1, file2))
+
+    # The tree, including the order of children, is unchanged
+    retrieved_root = drofs_instance.deserialize_root()
+    assert [child.name for child in retrieved_root.children] == ["dir1", "dir2"]
+    assert [child.name for child in retrieved_root.children[1].children] == ["file2.txt", "subdir1"]
+    assert drofs_instance.deserialize("/dir2/subdir1/file3.log").data == b"Log data"
+    assert drofs_instance.deserialize("/dir1/file1.txt").data == b"Hello from file1"
+
+def test_split_layout_places_headers_before_payloads(drofs_setup_teardown):
+    drofs_instance = drofs_setup_teardown
+    drofs_instance.serialize(path_index=True, split_layout=True)
+
+    payload_region = drofs_instance.deserialize_root().get_metadata_by_type(EntryMetadataType.PAYLOAD_REGION)
+    payload_offset, payload_length = struct.unpack('II', payload_region.data)
+    assert payload_length == len(b"Hello from file1" b"Content of file2" b"Log data")
+
+    assert drofs_instance.deserialize("/dir2/subdir1/file3.log").data == b"Log data"
+    with DrofsImage(drofs_instance.file_path) as image:
+        assert all(entry.offset < payload_offset for _, entry in image.walk())
+        assert image.verify() == []
+        assert bytes(image.find_entry("/dir1/file1.txt").data) == b"Hello from file1"
+
+    # Payload locations read back from a split image are not carried into a regular image
+    split_file = drofs_instance.deserialize("/dir2/file2.txt")
+    assert split_file.get_metadata_by_type(EntryMetadataType.PAYLOAD_LOCATION) is not None
+    drofs_instance.serialize()
+    assert drofs_instance.deserialize_root().get_metadata_by_type(EntryMetadataType.PAYLOAD_REGION) is None
+
+    drofs_instance.root = Entry(EntryType.DIRECTORY, "root")
+    drofs_instance.root.children.append(split_file)
+    drofs_instance.serialize()
+    retrieved_file = drofs_instance.deserialize("/file2.txt")
+    assert retrieved_file.get_metadata_by_type(EntryMetadataType.PAYLOAD_LOCATION) is None
+    assert retrieved_file.data == b"Content of file2"
+
+@pytest.mark.parametrize("split_layout", [False, True])
+@pytest.mark.parametrize("prepare_kept", [False, True])
+def test_payload_sources_are_streamed_at_write_time(tmp_path, split_layout, prepare_kept):
+    text = b"streamed text payload " * 2000
+    text_path = tmp_path / "text.txt"
+    text_path.write_bytes(text)
+    random_data = os.urandom(5000)
+
+    root = Entry(EntryType.DIRECTORY, "root")
+    path_entry = Entry(EntryType.FILE, "path.txt", source=PayloadSource(str(text_path), compression_level=9, window_bits=10))
+    callable_entry = Entry(EntryType.FILE, "callable.bin", source=PayloadSource(lambda: random_data, compression_level=9))
+    iterator_entry = Entry(EntryType.FILE, "iterator.txt", source=PayloadSource(iter([b"chunk1 ", b"chunk2"])))
+    root.children.extend([path_entry, callable_entry, iterator_entry])
+    if prepare_kept:
+        # Compressed ahead of time, e.g. in parallel, and copied when written
+        for entry in root.children:
+            entry.source.prepare(keep=True)
+
+    drofs_instance = Drofs(str(tmp_path / "image.bin"))
+    drofs_instance.root = root
+    drofs_instance.serialize(split_layout=split_layout)
+
+    # Compressed only when smaller, the serializer fills in the flags and original metadata
+    retrieved_path_entry = drofs_instance.deserialize("/path.txt")
+    assert retrieved_path_entry.flags & EntryFlags.COMPRESSED.value
+    assert zlib_window_bits(retrieved_path_entry.data) == 10
+    assert zlib.decompress(retrieved_path_entry.data) == text
+    assert retrieved_path_entry.get_metadata_by_type(EntryMetadataType.ORIGINAL_CRC32).data == struct.pack('I', zlib.crc32(text))
+    assert retrieved_path_entry.get_metadata_by_type(EntryMetadataType.ORIGINAL_SIZE).data == struct.pack('I', len(text))
+
+    retrieved_callable_entry = drofs_instance.deserialize("/callable.bin")
+    assert not retrieved_callable_entry.flags & EntryFlags.COMPRESSED.value
+    assert retrieved_callable_entry.data == random_data
+    assert retrieved_callable_entry.get_metadata_by_type(EntryMetadataType.ORIGINAL_CRC32) is None
+
+    assert drofs_instance.deserialize("/iterator.txt").data == b"chunk1 chunk2"
+    assert drofs_instance.deserialize_root().get_metadata_by_type(EntryMetadataType.WINDOW_BITS).data == bytes([10])
+
+    # One-shot iterators are spooled, so the image can be written again
+    drofs_instance.serialize(split_layout=split_layout)
+    assert drofs_instance.deserialize("/iterator.txt").data == b"chunk1 chunk2"
+    for entry in root.children:
+        entry.source.close()
+
+    with DrofsImage(drofs_instance.file_path) as image:
+        assert image.verify() == []
+
+@pytest.mark.parametrize("codec", ["zlib", "lz4"])
+def test_payload_sources_compressing_to_their_original_size_are_stored(tmp_path, codec):
+    def compress(data):
+        compressor = Lz4Compressor() if codec == "lz4" else zlib.compressobj(9)
+        return compressor.compress(data) + compressor.flush()
+
+    # Grow a zero run in front of incompressible bytes until the compressed data is exactly as long
+    tail = bytes(range(7, 256, 3))
+    data = next(b"\0" * length + tail for length in range(256) if len(compress(b"\0" * length + tail)) == length + len(tail))
+
+    root = Entry(EntryType.DIRECTORY, "root")
+    root.children.append(Entry(EntryType.FILE, "boundary.bin", source=PayloadSource(lambda: data, compression_level=9, codec=codec)))
+    drofs_instance = Drofs(str(tmp_path / "image.bin"))
+    drofs_instance.root = root
+    drofs_instance.serialize()
+
+    with DrofsImage(drofs_instance.file_path) as image:
+        assert image.verify() == []
+        entry = image.find_entry("/boundary.bin")
+        assert entry.flags == 0
+        assert bytes(entry.data) == data
+
+def test_split_layout_compresses_payload_sources_once(tmp_path):
+    text = b"split layout payload " * 2000
+    reads = []
+    def read():
+        reads.append(1)
+        return text
+
+    root = Entry(EntryType.DIRECTORY, "root")
+    root.children.append(Entry(EntryType.FILE, "text.txt", source=PayloadSource(read, compression_level=9)))
+    drofs_instance = Drofs(str(tmp_path / "image.bin"))
+    drofs_instance.root = root
+    drofs_instance.serialize(split_layout=True)
+    root.children[0].source.close()
+
+    assert len(reads) == 1
+    with DrofsImage(drofs_instance.file_path) as image:
+        assert image.verify() == []
+        assert image.read_data(image.find_entry("/text.txt")) == text
+
+def lz4_match_offsets(block):
+    """Parses an LZ4 block and returns the offset of every match."""
+    def read_length(length, position):
+        while length >= 15:
+            byte = block[position]
+            position += 1
+            length += byte
+            if byte != 255:
+                break
+        return length, position
+
+    offsets = []
+    position = 0
+    while True:
+        token = block[position]
+        literals, position = read_length(token >> 4, position + 1)
+        position += literals
+        if position == len(block):
+            return offsets
+        offsets.append(block[position] | block[position + 1] << 8)
+        _, position = read_length(token & 0x0F, position + 2)
+
+@pytest.mark.parametrize("window_bits", [9, 12, 15])
+@pytest.mark.parametrize("data", [b"", b"a", b"abcabcabcabcabcabcabcabc", bytes(100000), os.urandom(20000),
+                                  b"text payload with repeats " * 3000 + os.urandom(3000) + bytes(5000)],
+                         ids=["empty", "byte", "short", "zeros", "random", "mixed"])
+def test_lz4_blocks_round_trip_within_window(data, window_bits):
+    for chunk_size in (7, 4096, len(data) + 1):
+        compressor = Lz4Compressor(window_bits)
+        block = b"".join(compressor.compress(data[start:start + chunk_size]) for start in range(0, len(data), chunk_size)) + compressor.flush()
+        assert lz4_decompress(block) == data
+        assert b"".join(iter_lz4_decompressed(block, 1000)) == data
+        # Devices decode with a window sized dictionary
+        assert all(0 < offset <= 1 << window_bits for offset in lz4_match_offsets(block))
+
+    with pytest.raises(ValueError):
+        lz4_decompress(block[:-1] if len(block) > 1 else b"")
+
+@pytest.mark.parametrize("split_layout", [False, True])
+def test_lz4_entries_are_flagged_and_verified(tmp_path, split_layout):
+    text = b"lz4 text payload " * 2000
+    random_data = os.urandom(1000)
+    root = Entry(EntryType.DIRECTORY, "root")
+    root.children.extend([
+        Entry(EntryType.FILE, "lz4.txt", source=PayloadSource(lambda: text, compression_level=9, window_bits=12, codec="lz4")),
+        Entry(EntryType.FILE, "zlib.txt", source=PayloadSource(lambda: text, compression_level=9, window_bits=10)),
+        Entry(EntryType.FILE, "random.bin", source=PayloadSource(lambda: random_data, compression_level=9, codec="lz4")),
+    ])
+    drofs_instance = Drofs(str(tmp_path / "image.bin"))
+    drofs_instance.root = root
+    drofs_instance.serialize(split_layout=split_layout)
+
+    with DrofsImage(drofs_instance.file_path) as image:
+        assert image.verify() == []
+        entries = dict(image.walk())
+        assert entries["/lz4.txt"].flags == EntryFlags.COMPRESSED.value | EntryFlags.LZ4.value
+        assert entries["/lz4.txt"].get_metadata_by_type(EntryMetadataType.WINDOW_BITS).data == bytes([12])
+        assert len(entries["/lz4.txt"].data) < len(text)
+        assert image.read_data(entries["/lz4.txt"]) == text
+        assert entries["/zlib.txt"].flags == EntryFlags.COMPRESSED.value
+        assert entries["/zlib.txt"].get_metadata_by_type(EntryMetadataType.WINDOW_BITS) is None
+        # Incompressible data is stored, without the LZ4 flag
+        assert entries["/random.bin"].flags == 0
+        # The largest window of any codec
+        assert entries["/"].get_metadata_by_type(EntryMetadataType.WINDOW_BITS).data == bytes([12])
+
+def test_payload_cache_evicts_least_recently_used_over_budget():
+    cache = PayloadCache(max_bytes=10)
+    cache.put("a", b"aaaa", 4)
+    cache.put("b", b"bbbb", 4)
+    assert cache.get("a") == b"aaaa"
+    cache.put("c", b"cccc", 4)
+
+    assert cache.get("b") is None
+    assert cache.get("c") == b"cccc"
+    assert (cache.hits, cache.misses, cache.evictions, cache.size, len(cache)) == (2, 1, 1, 8, 2)
+
+    # Values over the budget are never cached
+    cache.put("d", b"d" * 11, 11)
+    assert cache.get("d") is None
+    assert len(cache) == 2
+
+def test_cached_reads_share_decompressed_payloads(tmp_path):
+    text = b"cached text payload " * 1000
+    root = Entry(EntryType.DIRECTORY, "root")
+    root.children.append(Entry(EntryType.FILE, "text.txt", source=PayloadSource(lambda: text, compression_level=9)))
+    drofs_instance = Drofs(str(tmp_path / "image.bin"), cache=PayloadCache())
+    drofs_instance.root = root
+    drofs_instance.serialize()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(data == text for data in executor.map(lambda _: drofs_instance.read_data("/text.txt"), range(64)))
+    assert drofs_instance.cache.hits > drofs_instance.cache.misses
+    assert drofs_instance.read_data("/missing.txt") is None
+
+    # The memory mapped reader shares the decompressed payload
+    hits = drofs_instance.cache.hits
+    with DrofsImage(drofs_instance.file_path, cache=drofs_instance.cache) as image:
+        assert image.read_data(image.find_entry("/text.txt")) == text
+    assert drofs_instance.cache.hits == hits + 1
+
+    # A rewritten image has a new identity, nothing stale is returned
+    root.children[0].source = PayloadSource(lambda: b"new content", compression_level=9)
+    drofs_instance.serialize()
+    assert drofs_instance.read_data("/text.txt") == b"new content"
+
+@pytest.mark.parametrize("split_layout", [False, True])
+def test_read_range_returns_spans_of_original_data(tmp_path, split_layout):
+    text = bytes(range(256)) * 1000 + os.urandom(50000)
+    root = Entry(EntryType.DIRECTORY, "root")
+    root.children.extend([
+        Entry(EntryType.FILE, "stored.bin", source=PayloadSource(lambda: text)),
+        Entry(EntryType.FILE, "zlib.bin", source=PayloadSource(lambda: text, compression_level=9)),
+        Entry(EntryType.FILE, "lz4.bin", source=PayloadSource(lambda: text, compression_level=9, codec="lz4")),
+    ])
+    drofs_instance = Drofs(str(tmp_path / "image.bin"), cache=PayloadCache())
+    drofs_instance.root = root
+    drofs_instance.serialize(split_layout=split_layout)
+
+    ranges = [(0, 0), (0, 10), (65530, 20), (200000, 100000), (len(text) - 5, 10), (len(text) + 5, 10)]
+    with DrofsImage(drofs_instance.file_path) as image:
+        assert isinstance(image.read_range("/stored.bin", 100, 10), memoryview)
+        for path in ["/stored.bin", "/zlib.bin", "/lz4.bin"]:
+            for offset, length in ranges:
+                assert bytes(image.read_range(path, offset, length)) == text[offset:offset + length]
+                assert drofs_instance.read_range(path, offset, length) == text[offset:offset + length]
+        assert image.read_range("/missing.bin", 0, 10) is None
+        with pytest.raises(ValueError):
+            read_entry_range(image.find_entry("/zlib.bin"), -1, 10)
+
+    # Ranges of a cached payload are sliced from it
+    drofs_instance.read_data("/zlib.bin")
+    hits = drofs_instance.cache.hits
+    assert drofs_instance.read_range("/zlib.bin", 1000, 50) == text[1000:1050]
+    assert drofs_instance.cache.hits > hits
+    assert drofs_instance.read_range("/missing.bin", 0, 10) is None
+
+@pytest.mark.parametrize("split_layout", [False, True])
+def test_merkle_digests_verify_only_the_accessed_path(drofs_setup_teardown, split_layout):
+    drofs_instance = drofs_setup_teardown
+    drofs_instance.serialize(path_index=True, split_layout=split_layout, merkle=True)
+    file1 = drofs_instance.root.children[0].children[0]
+
+    with DrofsImage(drofs_instance.file_path) as image:
+        assert image.verify() == []
+        assert image.find_verified_entry("/dir2/subdir1/file3.log").name == "file3.log"
+        assert image.find_verified_entry("/dir2/missing.txt") is None
+
+    # Corrupt the data CRC32 field of file1
+    with open(drofs_instance.file_path, 'r+b') as f:
+        f.seek(FILE_METADATA_SIZE + file1.offset + ENTRY_TYPE_BYTES + NAME_LENGTH_BYTES + len("file1.txt\0") + DATA_LENGTH_BYTES)
+        f.write(b"\xff")
+
+    with DrofsImage(drofs_instance.file_path) as image:
+        assert not image.check_crc32()
+        # Paths not going through the corrupted entry still verify
+        assert bytes(image.find_verified_entry("/dir2/file2.txt").data) == b"Content of file2"
+        with pytest.raises(ValueError, match="/dir1/file1.txt: digest mismatch"):
+            image.find_verified_entry("/dir1/file1.txt")
+        assert "/dir1: digest mismatch of the child at offset" in "\n".join(image.verify())
+
+    # Digests are not carried into an image written without them
+    drofs_instance.serialize()
+    with DrofsImage(drofs_instance.file_path) as image:
+        assert image.read_entry(0).get_metadata_by_type(EntryMetadataType.ROOT_DIGEST) is None
+        with pytest.raises(ValueError, match="no Merkle digests"):
+            image.find_verified_entry("/dir1/file1.txt")
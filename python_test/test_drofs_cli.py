@@ -0,0 +1,381 @@
+import io
+import json
+import os
+import struct
+import sys
+import tarfile
+import zipfile
+import zlib
+
+import pytest
+
+from drofs import (
+    FILE_METADATA_SIZE,
+    HEADER_BYTES,
+    NUM_CHILDREN_BYTES,
+    Drofs,
+    DrofsImage,
+    Entry,
+    EntryFlags,
+    EntryMetadataType,
+    EntryType,
+    zlib_window_bits,
+)
+from drofs_cli import (
+    analyze_image,
+    build_archive,
+    build_archive_tree,
+    cat_entry,
+    create_archive,
+    entry_record_sizes,
+    extract_archive,
+    list_archive,
+    open_source_archive,
+    plan_manifest,
+    tree_sources,
+    verify_archive,
+)
+
+
+@pytest.fixture
+def compressed_image(tmp_path):
+    source_path = tmp_path / "source"
+    (source_path / "subdir").mkdir(parents=True)
+    (source_path / "file1.txt").write_bytes(b"Hello from file1 " * 64)
+    (source_path / "file2.bin").write_bytes(bytes(range(256)) * 32)
+    (source_path / "subdir" / "file3.txt").write_bytes(b"Nested content " * 128)
+
+    image_path = str(tmp_path / "image.bin")
+    create_archive(image_path, str(source_path), 9, False)
+    return image_path
+
+def entry_data_offsets(image_path):
+    with DrofsImage(image_path) as image:
+        offsets = {}
+        for entry_path, entry in image.walk():
+            if entry.type == EntryType.FILE:
+                # data starts after type, name length, name, data length and data crc32
+                offsets[entry_path] = FILE_METADATA_SIZE + entry.offset + 2 + len(entry.name) + 1 + 8
+            entry.data.release()
+        return offsets
+
+def corrupt_bytes(image_path, offsets):
+    with open(image_path, 'r+b') as f:
+        for offset in offsets:
+            f.seek(offset)
+            value = f.read(1)[0]
+            f.seek(offset)
+            f.write(bytes([value ^ 0xFF]))
+
+        # Fix the overall checksum so only the entries are reported
+        f.seek(FILE_METADATA_SIZE)
+        crc32 = zlib.crc32(f.read())
+        f.seek(HEADER_BYTES)
+        f.write(struct.pack('I', crc32))
+
+def test_walk_lists_every_entry(compressed_image):
+    with DrofsImage(compressed_image) as image:
+        paths = [entry_path for entry_path, _ in image.walk()]
+    assert sorted(paths) == ["/", "/file1.txt", "/file2.bin", "/subdir", "/subdir/file3.txt"]
+
+def test_verify_valid_image(compressed_image):
+    with DrofsImage(compressed_image) as image:
+        assert image.verify(jobs=4) == []
+    assert verify_archive(compressed_image, 2, False)
+
+def test_verify_reports_every_corrupt_entry(compressed_image):
+    offsets = entry_data_offsets(compressed_image)
+    corrupt_bytes(compressed_image, [offsets["/file1.txt"], offsets["/subdir/file3.txt"]])
+
+    with DrofsImage(compressed_image) as image:
+        problems = image.verify(jobs=4)
+
+    assert sorted(problems) == [
+        "/file1.txt: data CRC32 checksum mismatch.",
+        "/subdir/file3.txt: data CRC32 checksum mismatch.",
+    ]
+    assert not verify_archive(compressed_image, 1, False)
+
+def test_verify_reports_overall_crc32_mismatch(compressed_image):
+    with open(compressed_image, 'r+b') as f:
+        f.seek(HEADER_BYTES)
+        f.write(b"\0\0\0\0")
+
+    with DrofsImage(compressed_image) as image:
+        assert image.verify() == ["CRC32 checksum mismatch. File may be corrupted."]
+
+def point_first_child_at_root(image_path, entry_path):
+    """Rewrites the first child offset of a directory to 0, the root, and fixes the overall checksum."""
+    with DrofsImage(image_path) as image:
+        entry = image.find_entry(entry_path)
+        fixed_bytes, metadata_bytes, _ = entry_record_sizes(entry)
+        children_offset = FILE_METADATA_SIZE + entry.offset + fixed_bytes + len(entry.data) + sum(metadata_bytes.values()) + NUM_CHILDREN_BYTES
+        entry.data.release()
+    with open(image_path, 'r+b') as f:
+        f.seek(children_offset)
+        f.write(struct.pack('I', 0))
+        f.seek(FILE_METADATA_SIZE)
+        crc32 = zlib.crc32(f.read())
+        f.seek(HEADER_BYTES)
+        f.write(struct.pack('I', crc32))
+
+@pytest.mark.parametrize("entry_path", ["/", "/subdir"])
+def test_verify_reports_cycles_instead_of_looping(compressed_image, entry_path):
+    point_first_child_at_root(compressed_image, entry_path)
+
+    with DrofsImage(compressed_image) as image:
+        problems = image.verify()
+        assert f"{entry_path}: cycle at offset 0." in problems
+        with pytest.raises(ValueError, match="cycle at offset 0"):
+            list(image.walk())
+        with pytest.raises(ValueError, match="cycle at offset 0"):
+            analyze_image(image)
+    assert not verify_archive(compressed_image, 1, False)
+
+def test_image_rejects_invalid_header(tmp_path):
+    image_path = tmp_path / "invalid.bin"
+    image_path.write_bytes(b"NOTDROFS0000")
+    with pytest.raises(ValueError, match="Invalid DROFS file header."):
+        DrofsImage(str(image_path))
+    os.remove(image_path)
+
+def test_extract_restores_files_and_timestamps(compressed_image, tmp_path):
+    output_path = tmp_path / "extracted"
+    assert extract_archive(compressed_image, str(output_path), 4, False)
+
+    for relative_path in ("file1.txt", "file2.bin", os.path.join("subdir", "file3.txt")):
+        source_file = tmp_path / "source" / relative_path
+        extracted_file = output_path / relative_path
+        assert extracted_file.read_bytes() == source_file.read_bytes()
+        assert int(extracted_file.stat().st_mtime) == int(source_file.stat().st_mtime)
+
+def test_extract_skips_subtrees_of_unsafe_entries(tmp_path):
+    escaping_dir = Entry(EntryType.DIRECTORY, "..")
+    escaping_dir.children.append(Entry(EntryType.FILE, "x", data=bytearray(b"escaped")))
+    nested_dir = Entry(EntryType.DIRECTORY, "..")
+    nested_dir.children.append(Entry(EntryType.FILE, "y", data=bytearray(b"escaped")))
+    safe_dir = Entry(EntryType.DIRECTORY, "safe")
+    safe_dir.children.extend([nested_dir, Entry(EntryType.FILE, "kept.txt", data=bytearray(b"kept"))])
+    root = Entry(EntryType.DIRECTORY, "root")
+    root.children.extend([escaping_dir, safe_dir])
+    drofs_instance = Drofs(str(tmp_path / "crafted.bin"))
+    drofs_instance.root = root
+    drofs_instance.serialize()
+
+    output_path = tmp_path / "out" / "extracted"
+    assert extract_archive(drofs_instance.file_path, str(output_path), 2, False)
+
+    assert (output_path / "safe" / "kept.txt").read_bytes() == b"kept"
+    assert not (tmp_path / "out" / "x").exists()
+    assert not (output_path / "y").exists()
+    assert sorted(os.listdir(tmp_path / "out")) == ["extracted"]
+
+def test_extract_skips_entries_resolving_outside_output(compressed_image, tmp_path):
+    output_path = tmp_path / "extracted"
+    outside_path = tmp_path / "outside"
+    outside_path.mkdir()
+    output_path.mkdir()
+    # A symlink left in the output directory must not redirect extracted files
+    os.symlink(outside_path, output_path / "subdir")
+    assert extract_archive(compressed_image, str(output_path), 2, False)
+
+    assert (output_path / "file1.txt").exists()
+    assert os.listdir(outside_path) == []
+
+def test_ls_lists_subtree(compressed_image, capsys):
+    assert list_archive(compressed_image, "/subdir", False)
+    assert capsys.readouterr().out.splitlines() == ["/subdir", "/subdir/file3.txt"]
+
+    assert not list_archive(compressed_image, "/missing", False)
+
+def test_cat_streams_file(compressed_image, tmp_path, capfdbinary):
+    assert cat_entry(compressed_image, "/subdir/file3.txt")
+    assert capfdbinary.readouterr().out == (tmp_path / "source" / "subdir" / "file3.txt").read_bytes()
+
+    assert not cat_entry(compressed_image, "/subdir")
+
+def test_reduced_window_records_window_bits(tmp_path):
+    source_path = tmp_path / "source"
+    source_path.mkdir()
+    (source_path / "text.txt").write_bytes(b"Reduced window content " * 512)
+    (source_path / "stored.bin").write_bytes(b"\x01")
+
+    image_path = str(tmp_path / "image.bin")
+    create_archive(image_path, str(source_path), 9, False, window_bits=10)
+
+    with DrofsImage(image_path) as image:
+        root = image.read_entry(0)
+        assert root.get_metadata_by_type(EntryMetadataType.WINDOW_BITS).data == bytes([10])
+        entry = image.find_entry("/text.txt")
+        assert entry.flags & EntryFlags.COMPRESSED.value
+        assert zlib_window_bits(entry.data) == 10
+        assert image.verify() == []
+
+    # images without compressed entries do not record a window
+    create_archive(image_path, str(source_path), 0, False)
+    with DrofsImage(image_path) as image:
+        assert image.read_entry(0).get_metadata_by_type(EntryMetadataType.WINDOW_BITS) is None
+
+@pytest.mark.parametrize("source_name", ["source.tar", "source.tar.gz", "source.zip", "-"])
+def test_create_archive_from_source_archive(tmp_path, monkeypatch, source_name):
+    source_path = tmp_path / "source"
+    (source_path / "subdir").mkdir(parents=True)
+    contents = {"/file1.txt": b"Hello from file1 " * 64, "/subdir/file2.txt": b"Nested content " * 128, "/empty.bin": b""}
+    for image_path, content in contents.items():
+        (source_path / image_path.lstrip("/")).write_bytes(content)
+        # Zip timestamps have a 2 second resolution
+        os.utime(source_path / image_path.lstrip("/"), (1600000000, 1600000000))
+
+    archive_path = tmp_path / ("stdin.tar.gz" if source_name == "-" else source_name)
+    if archive_path.suffix == ".zip":
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.write(source_path / "subdir", "subdir")
+            for image_path in contents:
+                archive.write(source_path / image_path.lstrip("/"), image_path.lstrip("/"))
+            archive.writestr("../escaped.txt", b"outside")
+    else:
+        with tarfile.open(archive_path, "w:gz" if archive_path.name.endswith(".gz") else "w") as archive:
+            archive.add(source_path, ".")
+            escaped = tarfile.TarInfo("../escaped.txt")
+            escaped.size = 7
+            archive.addfile(escaped, io.BytesIO(b"outside"))
+            link = tarfile.TarInfo("./link.txt")
+            link.type = tarfile.SYMTYPE
+            link.linkname = "file1.txt"
+            archive.addfile(link)
+    if source_name == "-":
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(archive_path.read_bytes())))
+
+    image_path = str(tmp_path / "image.bin")
+    create_archive(image_path, "-" if source_name == "-" else str(archive_path), 9, False)
+
+    with DrofsImage(image_path) as image:
+        assert image.verify() == []
+        paths = [entry_path for entry_path, _ in image.walk()]
+        assert sorted(paths) == ["/", "/empty.bin", "/file1.txt", "/subdir", "/subdir/file2.txt"]
+        for entry_path, content in contents.items():
+            entry = image.find_entry(entry_path)
+            assert image.read_data(entry) == content
+            timestamp = entry.get_metadata_by_type(EntryMetadataType.TIMESTAMP).data
+            assert int.from_bytes(timestamp, 'little') == 1600000000
+        assert image.find_entry("/file1.txt").flags & EntryFlags.COMPRESSED.value
+
+@pytest.mark.parametrize("compression_level", [0, 9])
+def test_streamed_archive_members_are_not_held_in_memory(tmp_path, compression_level):
+    contents = {"/text.txt": b"Streamed member content " * 4096, "/random.bin": os.urandom(50000)}
+    archive_path = tmp_path / "source.tar.gz"
+    with tarfile.open(archive_path, "w:gz") as archive:
+        for image_path, content in contents.items():
+            member = tarfile.TarInfo(image_path.lstrip("/"))
+            member.size = len(content)
+            archive.addfile(member, io.BytesIO(content))
+
+    archive, streaming = open_source_archive(str(archive_path))
+    assert streaming
+    with archive:
+        root = build_archive_tree(archive, streaming, compression_level, False)
+    sources = tree_sources(root)
+    try:
+        for source in sources:
+            # Read and compressed while the stream was at the member, the data itself is not kept
+            assert source.compressed is not None
+            assert not isinstance(source.source, (bytes, bytearray)) and not callable(source.source)
+            if source.compressed:
+                assert source._spool is None
+
+        drofs_instance = Drofs(str(tmp_path / "image.bin"))
+        drofs_instance.root = root
+        drofs_instance.serialize()
+    finally:
+        for source in sources:
+            source.close()
+
+    with DrofsImage(drofs_instance.file_path) as image:
+        assert image.verify() == []
+        for image_path, content in contents.items():
+            assert image.read_data(image.find_entry(image_path)) == content
+        assert bool(image.find_entry("/text.txt").flags & EntryFlags.COMPRESSED.value) == (compression_level > 0)
+
+@pytest.mark.parametrize("path_index", [False, True])
+def test_analyze_accounts_for_every_byte(tmp_path, path_index):
+    source_path = tmp_path / "source"
+    (source_path / "a" / "b").mkdir(parents=True)
+    (source_path / "copy1.txt").write_bytes(b"Duplicated " * 100)
+    (source_path / "a" / "copy2.txt").write_bytes(b"Duplicated " * 100)
+    (source_path / "a" / "b" / "unique.bin").write_bytes(bytes(range(256)))
+    image_path = str(tmp_path / "image.bin")
+    create_archive(image_path, str(source_path), 9, False, path_index)
+
+    with DrofsImage(image_path) as image:
+        analysis = analyze_image(image)
+
+    assert analysis["image_bytes"] == os.path.getsize(image_path)
+    assert analysis["other_bytes"] == 0
+    assert analysis["original_bytes"] == 1100 * 2 + 256
+    assert (analysis["path_index_bytes"] > 0) == path_index
+    assert "TIMESTAMP" in analysis["metadata_bytes"]
+    assert [sorted(duplicate["paths"]) for duplicate in analysis["duplicates"]] == [["/a/copy2.txt", "/copy1.txt"]]
+    files = {file["path"]: file for file in analysis["files"]}
+    assert files["/copy1.txt"]["compressed"] and files["/copy1.txt"]["ratio"] < 1
+    assert analysis["lookup"]["max_depth"] == 3
+    assert analysis["lookup"]["max_depth_path"] == "/a/b/unique.bin"
+
+@pytest.fixture
+def manifest_sources(tmp_path):
+    (tmp_path / "web" / "img").mkdir(parents=True)
+    (tmp_path / "web" / "index.html").write_bytes(b"<html>hello</html>" * 100)
+    (tmp_path / "web" / "img" / "logo.png").write_bytes(bytes(range(256)) * 8)
+    (tmp_path / "web" / "app.js.map").write_bytes(b"{}")
+    (tmp_path / "config.txt").write_bytes(b"key=value\n" * 50)
+    return tmp_path
+
+def test_build_applies_manifest_policies(manifest_sources):
+    manifest = {
+        "split_layout": True,
+        "merkle": True,
+        "defaults": {"compress": True, "level": 9},
+        "sources": [
+            {"path": "web", "target": "/www", "exclude": ["*.map"]},
+            {"path": "config.txt", "target": "/etc/app.conf"},
+        ],
+        "rules": [
+            {"match": "*.png", "compress": False, "alignment": 64},
+            {"match": "/etc/**", "window_bits": 10},
+            {"match": "*.html", "codec": "lz4"},
+        ],
+    }
+    manifest_path = manifest_sources / "manifest.json"
+    manifest_path.write_text(json.dumps(manifest))
+    image_path = str(manifest_sources / "image.bin")
+
+    assert build_archive(str(manifest_path), image_path, 4, False)
+
+    with DrofsImage(image_path) as image:
+        assert image.verify() == []
+        entries = dict(image.walk())
+        assert sorted(entries) == ["/", "/etc", "/etc/app.conf", "/www", "/www/img", "/www/img/logo.png", "/www/index.html"]
+
+        logo = entries["/www/img/logo.png"]
+        assert not logo.flags & EntryFlags.COMPRESSED.value
+        payload_offset, _ = struct.unpack('II', logo.get_metadata_by_type(EntryMetadataType.PAYLOAD_LOCATION).data)
+        assert (FILE_METADATA_SIZE + payload_offset) % 64 == 0
+        assert bytes(image.read_data(logo)) == bytes(range(256)) * 8
+
+        config = entries["/etc/app.conf"]
+        assert config.flags & EntryFlags.COMPRESSED.value
+        assert zlib_window_bits(config.data) == 10
+        assert bytes(image.read_data(config)) == b"key=value\n" * 50
+        index = entries["/www/index.html"]
+        assert index.flags == EntryFlags.COMPRESSED.value | EntryFlags.LZ4.value
+        assert bytes(image.read_data(index)) == b"<html>hello</html>" * 100
+
+def test_plan_rejects_conflicting_manifests(manifest_sources):
+    with pytest.raises(ValueError, match="provided by both"):
+        plan_manifest({"sources": [{"path": "config.txt", "target": "/a"}, {"path": "web/index.html", "target": "/a"}]}, str(manifest_sources))
+    with pytest.raises(ValueError, match="needs split_layout"):
+        plan_manifest({"sources": [{"path": "web"}], "rules": [{"match": "*.png", "alignment": 16}]}, str(manifest_sources))
+    with pytest.raises(ValueError, match="unknown keys"):
+        plan_manifest({"sources": [{"path": "web"}], "rules": [{"match": "*.png", "levle": 1}]}, str(manifest_sources))
+    with pytest.raises(ValueError, match="codec must be"):
+        plan_manifest({"sources": [{"path": "web"}], "defaults": {"codec": "lzma"}}, str(manifest_sources))
+    assert not build_archive(str(manifest_sources / "missing.json"), str(manifest_sources / "image.bin"), 1, False)
@@ -1,7 +1,70 @@
 import argparse
-import binascii  # Import zlib for CRC32 calculation
 import datetime
 import os
+import struct
+import zlib  # Import zlib for CRC32 calculation
+
+# Bytes read from the binary at a time, a multiple of the 16 bytes per C line
+READ_CHUNK_SIZE = 1024 * 1024
+BYTES_PER_LINE = 16
+
+# Maps every byte to itself when printable ASCII, otherwise to '.'
+ASCII_TABLE = bytes(byte if 32 <= byte <= 126 else ord('.') for byte in range(256))
+
+# ELF targets for the object output: (e_machine, 64 bit, default e_flags)
+ELF_MACHINES = {
+    "x86_64": (62, True, 0),
+    "i386": (3, False, 0),
+    "arm": (40, False, 0x05000000), # EABI version 5
+    "aarch64": (183, True, 0),
+    "xtensa": (94, False, 0x00000300), # ESP32 toolchain default
+    "riscv32": (243, False, 0x00000001), # RVC, soft float ABI
+    "riscv64": (243, True, 0x00000005), # RVC, double float ABI
+}
+
+
+def read_chunks(bin_file_path):
+    """Yields the binary file in READ_CHUNK_SIZE chunks."""
+    with open(bin_file_path, "rb") as f_bin:
+        while True:
+            chunk = f_bin.read(READ_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+def write_header(h_file_path, array_name, include_dates=True):
+    """Generates the header file (.h) declaring the data, its length, CRC32 and optionally its dates."""
+    with open(h_file_path, "w") as f_h:
+        f_h.write(f"#ifndef {array_name.upper()}_H\n")
+        f_h.write(f"#define {array_name.upper()}_H\n\n")
+        f_h.write("#include <stddef.h>\n")
+        f_h.write("#include <stdint.h>\n\n")
+
+        # Use 'extern' to declare the variables, all with the prefix
+        f_h.write(f"extern const unsigned char {array_name}[];\n")
+        f_h.write(f"extern const size_t {array_name}_len;\n")
+        f_h.write(f"extern const uint32_t {array_name}_crc32;\n\n") # Add CRC32 declaration
+
+        if include_dates:
+            f_h.write(f'extern const char {array_name}_binary_modified_date[];\n')
+            f_h.write(f'extern const char {array_name}_c_generated_date[];\n')
+            f_h.write(f'extern const char {array_name}_c_compiled_date[];\n\n')
+
+        f_h.write(f"#endif // {array_name.upper()}_H\n")
+
+    print(f"Generated header file: '{h_file_path}'")
+
+
+def format_c_lines(chunk, offset):
+    """Formats a chunk as C array lines with offset and ASCII comments, using bulk hex conversion."""
+    lines = []
+    for i in range(0, len(chunk), BYTES_PER_LINE):
+        line_data = chunk[i:i + BYTES_PER_LINE]
+        hex_string = "0x" + line_data.hex(",").replace(",", ", 0x")
+        ascii_string = line_data.translate(ASCII_TABLE).decode("ascii")
+        lines.append(f"    /* 0x{offset + i:08x} */ {hex_string}, //* {ascii_string} */ \n")
+    return "".join(lines)
 
 
 def bin_to_c_files(bin_file_path, base_name, output_folder, array_name="binary_data"):
@@ -10,6 +73,9 @@ def bin_to_c_files(bin_file_path, base_name, output_folder, array_name="binary_d
     prefixed by the given array name and adds a C-style comment with ASCII
     representation for each line of binary data.
 
+    The binary is streamed in chunks and each chunk is formatted in bulk, so large
+    binaries are neither held in memory nor formatted byte by byte.
+
     Args:
         bin_file_path (str): Path to the input binary file.
         base_name (str): The base name for the output files (e.g., 'data' will
@@ -30,61 +96,27 @@ def bin_to_c_files(bin_file_path, base_name, output_folder, array_name="binary_d
         h_file_path = os.path.join(output_folder, f"{base_name}.h")
         c_file_path = os.path.join(output_folder, f"{base_name}.c")
 
-        # 4. Read the binary file
-        with open(bin_file_path, "rb") as f_bin:
-            binary_data = f_bin.read()
+        # 4. Generate the header file (.h)
+        write_header(h_file_path, array_name)
 
-        # 5. Generate the header file (.h)
-        with open(h_file_path, "w") as f_h:
-            f_h.write(f"#ifndef {array_name.upper()}_H\n")
-            f_h.write(f"#define {array_name.upper()}_H\n\n")
-            f_h.write("#include <stddef.h>\n")
-            f_h.write("#include <stdint.h>\n\n")
-
-            # Use 'extern' to declare the variables, all with the prefix
-            f_h.write(f"extern const unsigned char {array_name}[];\n")
-            f_h.write(f"extern const size_t {array_name}_len;\n")
-            f_h.write(f"extern const uint32_t {array_name}_crc32;\n\n") # Add CRC32 declaration
-
-            f_h.write(f'extern const char {array_name}_binary_modified_date[];\n')
-            f_h.write(f'extern const char {array_name}_c_generated_date[];\n')
-            f_h.write(f'extern const char {array_name}_c_compiled_date[];\n\n')
-
-            f_h.write(f"#endif // {array_name.upper()}_H\n")
-
-        print(f"Generated header file: '{h_file_path}'")
-
-        # Calculate CRC32
-        # crc32_value = binascii.crc32(binary_data) & 0xFFFFFFFF # Ensure it's a 32-bit unsigned int
-
-        # 6. Generate the implementation file (.c)
-        with open(c_file_path, "w") as f_c:
+        # 5. Generate the implementation file (.c), streaming the binary
+        binary_length = 0
+        crc32_value = 0
+        with open(c_file_path, "w", buffering=READ_CHUNK_SIZE) as f_c:
             f_c.write(f'#include "{base_name}.h"\n\n')
-            # f_c.write("#include <stdint.h>\n\n") # Include stdint.h for uint32_t
 
             # The actual binary data definition
             f_c.write(f"const unsigned char {array_name}[] = {{\n")
 
-            # ASCII representation for each line
-            for i in range(0, len(binary_data), 16):
-                line_data = binary_data[i:i+16]
-                hex_string = ", ".join([f"0x{byte:02x}" for byte in line_data])
-
-                # Create the ASCII representation for the comment
-                ascii_string = ""
-                for byte in line_data:
-                    if 32 <= byte <= 126: # Check for printable ASCII
-                        ascii_string += chr(byte)
-                    else:
-                        ascii_string += "."
-
-                # Write the line with hex values and the comment
-                f_c.write(f"    /* 0x{i:08x} */ {hex_string}, //* {ascii_string} */ \n")
+            for chunk in read_chunks(bin_file_path):
+                f_c.write(format_c_lines(chunk, binary_length))
+                binary_length += len(chunk)
+                crc32_value = zlib.crc32(chunk, crc32_value)
 
             f_c.write("};\n\n")
-            f_c.write(f"const size_t {array_name}_len = {len(binary_data)};\n")
+            f_c.write(f"const size_t {array_name}_len = {binary_length};\n")
             # Add CRC32 definition
-            f_c.write(f"const uint32_t {array_name}_crc32 = {binascii.crc32(binary_data):#010x};\n\n")
+            f_c.write(f"const uint32_t {array_name}_crc32 = {crc32_value:#010x};\n\n")
 
             # Date/time string definitions, all with the prefix
             f_c.write(f'const char {array_name}_binary_modified_date[] = "{binary_modified_date}";\n')
@@ -99,6 +131,194 @@ def bin_to_c_files(bin_file_path, base_name, output_folder, array_name="binary_d
         print(f"An unexpected error occurred: {e}")
 
 
+def bin_to_asm_files(bin_file_path, base_name, output_folder, array_name="binary_data", incbin_path=None):
+    """
+    Converts a binary file to a C header and an assembler source (.S) that embeds
+    the binary with .incbin, so the compiler never parses the data.
+
+    Args:
+        bin_file_path (str): Path to the input binary file.
+        base_name (str): The base name for the output files ('data' creates 'data.h' and 'data.S').
+        output_folder (str): The path to the folder where the files will be saved.
+        array_name (str): The name for the data symbol, also used as prefix for _len and _crc32.
+        incbin_path (str): The path written in the .incbin directive, defaults to the absolute
+                           path of the binary since the assembler resolves it from its working directory.
+    """
+    try:
+        os.makedirs(output_folder, exist_ok=True)
+
+        h_file_path = os.path.join(output_folder, f"{base_name}.h")
+        s_file_path = os.path.join(output_folder, f"{base_name}.S")
+        if incbin_path is None:
+            incbin_path = os.path.abspath(bin_file_path)
+
+        binary_length = 0
+        crc32_value = 0
+        for chunk in read_chunks(bin_file_path):
+            binary_length += len(chunk)
+            crc32_value = zlib.crc32(chunk, crc32_value)
+
+        write_header(h_file_path, array_name, include_dates=False)
+
+        incbin_path = incbin_path.replace("\\", "/")
+        with open(s_file_path, "w") as f_s:
+            f_s.write(f"/* Generated by binheader.py from {os.path.basename(bin_file_path)}, do not edit. */\n\n")
+            f_s.write("#if defined(__APPLE__)\n")
+            f_s.write("#define SYMBOL(name) _##name\n")
+            f_s.write("    .section __TEXT,__const\n")
+            f_s.write("#else\n")
+            f_s.write("#define SYMBOL(name) name\n")
+            f_s.write("    .section .rodata\n")
+            f_s.write("#endif\n\n")
+
+            f_s.write("#if defined(__ELF__)\n")
+            f_s.write(f"    .type SYMBOL({array_name}), %object\n")
+            f_s.write(f"    .type SYMBOL({array_name}_len), %object\n")
+            f_s.write(f"    .type SYMBOL({array_name}_crc32), %object\n")
+            f_s.write("#endif\n\n")
+
+            f_s.write(f"    .global SYMBOL({array_name})\n")
+            f_s.write("    .balign 4\n")
+            f_s.write(f"SYMBOL({array_name}):\n")
+            f_s.write(f'    .incbin "{incbin_path}"\n\n')
+
+            f_s.write(f"    .global SYMBOL({array_name}_len)\n")
+            f_s.write("#if __SIZEOF_SIZE_T__ == 8\n")
+            f_s.write("    .balign 8\n")
+            f_s.write(f"SYMBOL({array_name}_len):\n")
+            f_s.write(f"    .quad {binary_length}\n")
+            f_s.write("#else\n")
+            f_s.write("    .balign 4\n")
+            f_s.write(f"SYMBOL({array_name}_len):\n")
+            f_s.write(f"    .long {binary_length}\n")
+            f_s.write("#endif\n\n")
+
+            f_s.write(f"    .global SYMBOL({array_name}_crc32)\n")
+            f_s.write("    .balign 4\n")
+            f_s.write(f"SYMBOL({array_name}_crc32):\n")
+            f_s.write(f"    .long {crc32_value:#010x}\n\n")
+
+            f_s.write("#if defined(__ELF__)\n")
+            f_s.write(f"    .size SYMBOL({array_name}), {binary_length}\n")
+            f_s.write(f"    .size SYMBOL({array_name}_len), __SIZEOF_SIZE_T__\n")
+            f_s.write(f"    .size SYMBOL({array_name}_crc32), 4\n")
+            f_s.write('    .section .note.GNU-stack,"",%progbits\n')
+            f_s.write("#endif\n")
+
+        print(f"Generated assembler file: '{s_file_path}'")
+
+    except FileNotFoundError:
+        print(f"Error: The file '{bin_file_path}' was not found.")
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+
+
+def align(value, alignment):
+    return (value + alignment - 1) & ~(alignment - 1)
+
+
+def bin_to_object_files(bin_file_path, base_name, output_folder, array_name="binary_data", machine="x86_64", elf_flags=None):
+    """
+    Converts a binary file to a C header and a relocatable ELF object (.o) defining
+    the data, _len and _crc32 symbols in .rodata, ready to be linked without any
+    compiler or assembler pass.
+
+    Layout: ELF header, .rodata (data, length, CRC32), .symtab, .strtab, .shstrtab, section headers.
+    An empty .note.GNU-stack section marks the object as not needing an executable stack.
+
+    Args:
+        bin_file_path (str): Path to the input binary file.
+        base_name (str): The base name for the output files ('data' creates 'data.h' and 'data.o').
+        output_folder (str): The path to the folder where the files will be saved.
+        array_name (str): The name for the data symbol, also used as prefix for _len and _crc32.
+        machine (str): The target, one of ELF_MACHINES.
+        elf_flags (int): Overrides the target's default e_flags, which linkers check for ABI compatibility.
+    """
+    try:
+        os.makedirs(output_folder, exist_ok=True)
+
+        h_file_path = os.path.join(output_folder, f"{base_name}.h")
+        o_file_path = os.path.join(output_folder, f"{base_name}.o")
+
+        e_machine, is_64, default_flags = ELF_MACHINES[machine]
+        e_flags = default_flags if elf_flags is None else elf_flags
+        word = "Q" if is_64 else "I"
+        word_size = 8 if is_64 else 4
+        header_size, section_header_size, symbol_size = (64, 64, 24) if is_64 else (52, 40, 16)
+
+        binary_length = os.path.getsize(bin_file_path)
+
+        # .rodata: data, then the length as size_t and the CRC32
+        length_offset = align(binary_length, word_size)
+        crc32_offset = length_offset + word_size
+        rodata_size = crc32_offset + 4
+        rodata_offset = align(header_size, 16)
+
+        symbols = [
+            (array_name, 0, binary_length),
+            (f"{array_name}_len", length_offset, word_size),
+            (f"{array_name}_crc32", crc32_offset, 4),
+        ]
+        strtab = b"\0"
+        symbol_names = []
+        for name, _, _ in symbols:
+            symbol_names.append(len(strtab))
+            strtab += name.encode("ascii") + b"\0"
+        shstrtab = b"\0.rodata\0.symtab\0.strtab\0.shstrtab\0.note.GNU-stack\0"
+
+        symtab_offset = align(rodata_offset + rodata_size, word_size)
+        symtab_size = (len(symbols) + 1) * symbol_size
+        strtab_offset = symtab_offset + symtab_size
+        shstrtab_offset = strtab_offset + len(strtab)
+        section_headers_offset = align(shstrtab_offset + len(shstrtab), word_size)
+
+        write_header(h_file_path, array_name, include_dates=False)
+
+        with open(o_file_path, "wb") as f_o:
+            # ELF header: class, little endian, current version, relocatable
+            ident = b"\x7fELF" + bytes([2 if is_64 else 1, 1, 1]) + bytes(9)
+            f_o.write(ident + struct.pack(f"<HHI{word}{word}{word}IHHHHHH",
+                1, e_machine, 1, 0, 0, section_headers_offset, e_flags,
+                header_size, 0, 0, section_header_size, 6, 4))
+            f_o.write(bytes(rodata_offset - header_size))
+
+            crc32_value = 0
+            for chunk in read_chunks(bin_file_path):
+                f_o.write(chunk)
+                crc32_value = zlib.crc32(chunk, crc32_value)
+            f_o.write(bytes(length_offset - binary_length))
+            f_o.write(struct.pack(f"<{word}I", binary_length, crc32_value))
+            f_o.write(bytes(symtab_offset - rodata_offset - rodata_size))
+
+            # Symbols: null, then the globals defined in .rodata (section 1)
+            f_o.write(bytes(symbol_size))
+            for name_offset, (_, value, size) in zip(symbol_names, symbols):
+                info = (1 << 4) | 1 # STB_GLOBAL, STT_OBJECT
+                if is_64:
+                    f_o.write(struct.pack("<IBBHQQ", name_offset, info, 0, 1, value, size))
+                else:
+                    f_o.write(struct.pack("<IIIBBH", name_offset, value, size, info, 0, 1))
+            f_o.write(strtab)
+            f_o.write(shstrtab)
+            f_o.write(bytes(section_headers_offset - shstrtab_offset - len(shstrtab)))
+
+            # Section headers: name, type, flags, addr, offset, size, link, info, addralign, entsize
+            section_header = f"<II{word}{word}{word}{word}II{word}{word}"
+            f_o.write(bytes(section_header_size))
+            f_o.write(struct.pack(section_header, 1, 1, 0x2, 0, rodata_offset, rodata_size, 0, 0, 16, 0))
+            f_o.write(struct.pack(section_header, 9, 2, 0, 0, symtab_offset, symtab_size, 3, 1, word_size, symbol_size))
+            f_o.write(struct.pack(section_header, 17, 3, 0, 0, strtab_offset, len(strtab), 0, 0, 1, 0))
+            f_o.write(struct.pack(section_header, 25, 3, 0, 0, shstrtab_offset, len(shstrtab), 0, 0, 1, 0))
+            f_o.write(struct.pack(section_header, 35, 1, 0, 0, shstrtab_offset, 0, 0, 0, 1, 0))
+
+        print(f"Generated object file: '{o_file_path}'")
+
+    except FileNotFoundError:
+        print(f"Error: The file '{bin_file_path}' was not found.")
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+
+
 def main():
     parser = argparse.ArgumentParser(description="binheader CLI tool for generating headers")
     parser.add_argument("binpath", help="Path to the binary")
@@ -107,6 +327,14 @@ def main():
                         help="file name")
     parser.add_argument("-c", "--constantname", type=str, default=None,
                         help="constant name")
+    parser.add_argument("-m", "--mode", choices=("c", "asm", "obj"), default="c",
+                        help="output a C array (c), an assembler file using .incbin (asm) or a linkable ELF object (obj)")
+    parser.add_argument("--incbin-path", type=str, default=None,
+                        help="path written in the .incbin directive (asm), defaults to the absolute binary path")
+    parser.add_argument("--machine", choices=sorted(ELF_MACHINES), default="x86_64",
+                        help="ELF target machine (obj)")
+    parser.add_argument("--elf-flags", type=lambda value: int(value, 0), default=None,
+                        help="ELF e_flags overriding the machine default (obj)")
 
     args = parser.parse_args()
 
@@ -116,7 +344,12 @@ def main():
     if args.constantname is None:
         args.constantname = os.path.basename(args.binpath) + "_data" # Changed from imagepath to binpath
 
-    bin_to_c_files(args.binpath,args.filename, args.sourcepath, args.constantname)
+    if args.mode == "asm":
+        bin_to_asm_files(args.binpath, args.filename, args.sourcepath, args.constantname, args.incbin_path)
+    elif args.mode == "obj":
+        bin_to_object_files(args.binpath, args.filename, args.sourcepath, args.constantname, args.machine, args.elf_flags)
+    else:
+        bin_to_c_files(args.binpath, args.filename, args.sourcepath, args.constantname)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,185 @@
+import argparse
+import os
+import random
+import string
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'lib', 'drofs', 'tool')))
+
+from binheader import bin_to_c_files  # noqa: E402
+from drofs_cli import create_archive  # noqa: E402
+
+# Names may be up to 254 characters, the name length byte includes the null terminator
+MAX_NAME_LENGTH = 254
+NAME_CHARACTERS = string.ascii_lowercase + string.digits
+
+# Vocabulary for text-like content, compresses roughly like source code or logs
+TEXT_WORDS = (
+    "the", "of", "and", "to", "in", "is", "for", "on", "with", "as", "by", "at", "from", "this", "that",
+    "be", "are", "it", "or", "an", "drofs", "entry", "file", "directory", "image", "data", "offset",
+    "length", "crc32", "metadata", "compressed", "original", "timestamp", "root", "child", "read", "write",
+    "buffer", "error", "return", "value", "index", "path", "name", "size", "flags", "type", "void", "int",
+    "uint32_t", "const", "static", "struct", "if", "else", "for", "while", "{", "}", "(", ")", ";", "=",
+    "==", "!=", "+", "-", "*", "/", "0", "1", "2", "16", "32", "256", "4096",
+)
+
+
+def parse_distribution(spec):
+    """
+    Parses a size or name length distribution.
+
+    Supported forms: 'fixed:N', 'uniform:MIN:MAX' and 'lognormal:MEDIAN:SIGMA[:MAX]'.
+    """
+    kind, *values = spec.split(':')
+    try:
+        numbers = [float(value) for value in values]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid distribution '{spec}'.") from None
+    if (kind == "fixed" and len(numbers) == 1) or (kind == "uniform" and len(numbers) == 2) \
+            or (kind == "lognormal" and len(numbers) in (2, 3)):
+        return (kind, numbers)
+    raise argparse.ArgumentTypeError(f"Invalid distribution '{spec}', use fixed:N, uniform:MIN:MAX or lognormal:MEDIAN:SIGMA[:MAX].")
+
+
+def parse_mix(spec):
+    """Parses content mix weights, e.g. 'random=1,text=2,zeros=1'."""
+    weights = {}
+    for item in spec.split(','):
+        kind, _, weight = item.partition('=')
+        if kind not in ("random", "text", "zeros"):
+            raise argparse.ArgumentTypeError(f"Unknown content kind '{kind}', use random, text or zeros.")
+        try:
+            weights[kind] = float(weight) if weight else 1.0
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid weight '{weight}' for '{kind}'.") from None
+    if sum(weights.values()) <= 0:
+        raise argparse.ArgumentTypeError("At least one content kind needs a positive weight.")
+    return weights
+
+
+def sample(rng, distribution):
+    kind, numbers = distribution
+    if kind == "fixed":
+        value = numbers[0]
+    elif kind == "uniform":
+        value = rng.uniform(numbers[0], numbers[1])
+    else:
+        value = rng.lognormvariate(0, numbers[1]) * numbers[0]
+        if len(numbers) == 3:
+            value = min(value, numbers[2])
+    return max(0, int(value))
+
+
+def generate_content(rng, kind, size):
+    """Generates size bytes of content in bulk, never byte by byte."""
+    if kind == "zeros":
+        return bytes(size)
+    if kind == "random":
+        # getrandbits produces the whole buffer in one call, seeded and reproducible
+        return rng.getrandbits(size * 8).to_bytes(size, 'little') if size else b""
+    # Every word takes at least 2 bytes with its separator, so size // 2 + 1 words always fill size
+    words = rng.choices(TEXT_WORDS, k=size // 2 + 1)
+    return " ".join(words).encode('ascii')[:size]
+
+
+def generate_name(rng, distribution, used_names):
+    while True:
+        length = min(MAX_NAME_LENGTH, max(1, sample(rng, distribution)))
+        name = "".join(rng.choices(NAME_CHARACTERS, k=length))
+        if name not in used_names:
+            used_names.add(name)
+            return name
+
+
+def generate_corpus(output_path, seed, files, fanout, depth, sizes, names, mix, duplicates, verbose):
+    """
+    Generates a reproducible directory tree of synthetic files.
+
+    The directories form a full tree of the given fan-out and depth, and the files are
+    spread over all of them at random. Everything, including names, is derived from seed.
+
+    Returns:
+        The number of directories and the total number of bytes written.
+    """
+    rng = random.Random(seed)
+
+    os.makedirs(output_path, exist_ok=True)
+    directories = [(output_path, set())]
+    level = [directories[0]]
+    for _ in range(depth):
+        next_level = []
+        for parent_path, used_names in level:
+            for _ in range(fanout):
+                directory = (os.path.join(parent_path, generate_name(rng, names, used_names)), set())
+                os.makedirs(directory[0], exist_ok=True)
+                next_level.append(directory)
+        directories.extend(next_level)
+        level = next_level
+
+    kinds = list(mix)
+    weights = [mix[kind] for kind in kinds]
+    # Earlier contents duplicated files are copied from, kept as sizes and seeds to bound memory
+    previous_contents = []
+    total_bytes = 0
+    for _ in range(files):
+        directory_path, used_names = rng.choice(directories)
+        file_path = os.path.join(directory_path, generate_name(rng, names, used_names))
+
+        if previous_contents and rng.random() < duplicates:
+            kind, size, content_seed = rng.choice(previous_contents)
+        else:
+            kind, size, content_seed = rng.choices(kinds, weights)[0], sample(rng, sizes), rng.getrandbits(64)
+            previous_contents.append((kind, size, content_seed))
+
+        content = generate_content(random.Random(content_seed), kind, size)
+        with open(file_path, 'wb') as f:
+            f.write(memoryview(content))
+        total_bytes += len(content)
+        if verbose:
+            print(f"{file_path}: {kind} {len(content)} bytes")
+
+    return len(directories), total_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a reproducible synthetic corpus tree, its DROFS image and C headers.")
+    parser.add_argument("outputpath", help="Folder the corpus tree is generated in.")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="Random seed, the same seed generates the same corpus.")
+    parser.add_argument("-n", "--files", type=int, default=100, help="Number of files.")
+    parser.add_argument("--fanout", type=int, default=4, help="Subdirectories per directory.")
+    parser.add_argument("--depth", type=int, default=2, help="Directory depth, 0 puts every file in the root.")
+    parser.add_argument("--sizes", type=parse_distribution, default="lognormal:4096:1.5:1048576",
+                        help="File size distribution: fixed:N, uniform:MIN:MAX or lognormal:MEDIAN:SIGMA[:MAX].")
+    parser.add_argument("--names", type=parse_distribution, default="uniform:4:16",
+                        help="Name length distribution, same forms as --sizes, capped at 254.")
+    parser.add_argument("--mix", type=parse_mix, default="random=1,text=1,zeros=1",
+                        help="Content kind weights, e.g. random=1,text=2,zeros=1.")
+    parser.add_argument("--duplicates", type=float, default=0.0,
+                        help="Ratio (0-1) of files duplicating the content of an earlier file.")
+    parser.add_argument("-i", "--image", type=str, default=None, help="Also build a DROFS image of the corpus at this path.")
+    parser.add_argument("-l", "--level", type=int, default=0, choices=range(0, 10), help="Compression level of the image.")
+    parser.add_argument("--path-index", action="store_true", help="Add a path index section to the image.")
+    parser.add_argument("--header", type=str, default=None,
+                        help="Also convert the image to C files in this folder, as used by the native tests.")
+    parser.add_argument("-c", "--constantname", type=str, default="mock_test_corpus_data",
+                        help="File and constant name of the C files.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="List every generated file.")
+
+    args = parser.parse_args()
+
+    if args.header and not args.image:
+        parser.error("--header requires --image")
+
+    directories, total_bytes = generate_corpus(args.outputpath, args.seed, args.files, args.fanout, args.depth,
+                                               args.sizes, args.names, args.mix, args.duplicates, args.verbose)
+    print(f"Generated {args.files} files in {directories} directories, {total_bytes:,} bytes")
+
+    if args.image:
+        create_archive(args.image, args.outputpath, args.level, args.verbose, args.path_index)
+        print(f"Generated image: '{args.image}', {os.path.getsize(args.image):,} bytes")
+
+    if args.header:
+        bin_to_c_files(args.image, args.constantname, args.header, args.constantname)
+
+if __name__ == "__main__":
+    main()
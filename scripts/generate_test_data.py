@@ -1,13 +1,14 @@
 import argparse
 import os
-import struct
+import sys
+from array import array
 
 # Configuration
-# '<I' means:
-# < : Little-endian byte order
-# I : Unsigned integer (4 bytes, which is uint32_t)
-STRUCT_FORMAT = '<I'
+# 'I' is an unsigned integer of 4 bytes (uint32_t), written little-endian
+ARRAY_TYPECODE = 'I' if array('I').itemsize == 4 else 'L'
 BYTES_PER_VALUE = 4
+# Values packed and written per bulk write
+VALUES_PER_CHUNK = 256 * 1024
 
 def generate_binary_sequence_file(output_filename, start_value, end_value):
     """
@@ -25,14 +26,14 @@ def generate_binary_sequence_file(output_filename, start_value, end_value):
     try:
         # Open the file in binary write mode ('wb')
         with open(output_filename, 'wb') as f:
-            for value in range(start_value, end_value + 1):
-                # Pack the integer into 4 bytes using the specified format
-                packed_data = struct.pack(STRUCT_FORMAT, value)
-                f.write(packed_data)
+            for chunk_start in range(start_value, end_value + 1, VALUES_PER_CHUNK):
+                # Pack a whole chunk of values at once
+                values = array(ARRAY_TYPECODE, range(chunk_start, min(chunk_start + VALUES_PER_CHUNK, end_value + 1)))
+                if sys.byteorder != 'little':
+                    values.byteswap()
+                f.write(memoryview(values))
 
-                # Optional progress update (every 100,000 values)
-                if value > start_value and value % 100000 == 0:
-                    print(f"  Processed {value:,} values...")
+                print(f"  Processed {chunk_start - start_value + len(values):,} values...")
 
         # Final check and success message
         final_size = os.path.getsize(output_filename)
@@ -45,7 +46,7 @@ def generate_binary_sequence_file(output_filename, start_value, end_value):
 
     except OSError as e:
         print(f"Error writing to file: {e}")
-    except struct.error as e:
+    except OverflowError as e:
         print(f"Error packing data: {e}. Check if values exceed uint32_t capacity (4,294,967,295).")
 
 def main():
@@ -1,7 +1,17 @@
 import argparse
+import csv
+import json
 import os
+import time
 import zlib
 
+# Chunk size files are streamed through the compressor with
+STREAM_CHUNK_SIZE = 64 * 1024
+# TINFL_LZ_DICT_SIZE in miniz.h, the window the device decompressor is built with
+DEFAULT_DICT_SIZE = 32768
+SWEEP_FIELDS = ("level", "wbits", "window_size", "fits_dict", "original_size", "compressed_size", "stored_size",
+                "ratio", "compress_mb_per_s", "decompress_mb_per_s")
+
 
 def compress_file_with_zlib(input_filename, output_filename, compression_level):
     """
@@ -56,13 +66,138 @@ def compress_file_with_zlib(input_filename, output_filename, compression_level):
     print(f"Compression Ratio: {ratio:.2f}% ({(input_size - output_size):,} bytes saved)")
 
 
+def collect_files(input_path):
+    """Returns the input file, or every file below the input directory."""
+    if os.path.isfile(input_path):
+        return [input_path]
+    files = []
+    for directory_path, _, file_names in os.walk(input_path):
+        files.extend(os.path.join(directory_path, file_name) for file_name in sorted(file_names))
+    return files
+
+
+def measure_setting(files, level, wbits):
+    """
+    Compresses every file as its own zlib stream, the way drofs_cli.py compresses entries,
+    and inflates it back, streaming both in chunks.
+
+    Returns:
+        Original, compressed and stored sizes (files that do not shrink are stored as is),
+        and the compression and decompression times in seconds.
+    """
+    original_size = compressed_size = stored_size = 0
+    compress_time = decompress_time = 0.0
+    for file_path in files:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, wbits)
+        compressed_chunks = []
+        file_size = 0
+        with open(file_path, 'rb') as f:
+            while True:
+                chunk = f.read(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                file_size += len(chunk)
+                start = time.perf_counter()
+                compressed_chunks.append(compressor.compress(chunk))
+                compress_time += time.perf_counter() - start
+        start = time.perf_counter()
+        compressed_chunks.append(compressor.flush())
+        compress_time += time.perf_counter() - start
+
+        decompressor = zlib.decompressobj(wbits)
+        start = time.perf_counter()
+        for chunk in compressed_chunks:
+            decompressor.decompress(chunk)
+        decompressor.flush()
+        decompress_time += time.perf_counter() - start
+
+        file_compressed_size = sum(len(chunk) for chunk in compressed_chunks)
+        original_size += file_size
+        compressed_size += file_compressed_size
+        stored_size += min(file_size, file_compressed_size)
+
+    return original_size, compressed_size, stored_size, compress_time, decompress_time
+
+
+def sweep_compression(input_path, report_filename, levels, wbits_values, dict_size, report_format):
+    """
+    Measures every compression level and window size on a file or a whole source tree,
+    reporting sizes and throughputs as CSV or JSON, and whether the window fits the
+    device decompression buffer of dict_size bytes.
+    """
+    files = collect_files(input_path)
+    if not files:
+        print(f"Error: No input files found at '{input_path}'.")
+        return
+
+    print(f"Sweeping {len(files)} files, levels {levels[0]}-{levels[-1]}, wbits {wbits_values[0]}-{wbits_values[-1]}")
+    print(f"{'level':>5} {'wbits':>5} {'fits':>4} {'compressed':>12} {'stored':>12} {'ratio':>7} {'comp MB/s':>10} {'decomp MB/s':>11}")
+
+    results = []
+    for level in levels:
+        for wbits in wbits_values:
+            original_size, compressed_size, stored_size, compress_time, decompress_time = measure_setting(files, level, wbits)
+            megabytes = original_size / (1024 * 1024)
+            result = {
+                "level": level,
+                "wbits": wbits,
+                "window_size": 1 << wbits,
+                "fits_dict": (1 << wbits) <= dict_size,
+                "original_size": original_size,
+                "compressed_size": compressed_size,
+                "stored_size": stored_size,
+                "ratio": round(stored_size / original_size * 100, 2) if original_size else 100.0,
+                "compress_mb_per_s": round(megabytes / compress_time, 2) if compress_time else 0.0,
+                "decompress_mb_per_s": round(megabytes / decompress_time, 2) if decompress_time else 0.0,
+            }
+            results.append(result)
+            print(f"{level:>5} {wbits:>5} {'yes' if result['fits_dict'] else 'no':>4} {compressed_size:>12,} {stored_size:>12,} "
+                  f"{result['ratio']:>6.2f}% {result['compress_mb_per_s']:>10.2f} {result['decompress_mb_per_s']:>11.2f}")
+
+    if report_format is None:
+        report_format = "json" if report_filename.lower().endswith(".json") else "csv"
+
+    try:
+        with open(report_filename, 'w', newline='') as f:
+            if report_format == "json":
+                json.dump({"input": input_path, "files": len(files), "dict_size": dict_size, "results": results}, f, indent=2)
+            else:
+                writer = csv.DictWriter(f, fieldnames=SWEEP_FIELDS)
+                writer.writeheader()
+                writer.writerows(results)
+        print(f"Wrote {report_format.upper()} report: {report_filename}")
+    except OSError as e:
+        print(f"Error writing report file: {e}")
+
+
+def parse_range(value):
+    """Parses '9' or '0-9' into a list of integers."""
+    start, _, end = value.partition('-')
+    return list(range(int(start), int(end or start) + 1))
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Compress a binary file using zlib.")
-    parser.add_argument("input_filename", help="Path to the input file to be compressed.")
-    parser.add_argument("output_filename", help="Path for the compressed output file.")
+    parser.add_argument("input_filename", help="Path to the input file to be compressed, or file or directory to sweep.")
+    parser.add_argument("output_filename", help="Path for the compressed output file, or the sweep report (.csv or .json).")
     parser.add_argument("-l", "--level", type=int, default=9,
                         help="Compression level (0-9, 9 is highest). Default is 9.")
+    parser.add_argument("--sweep", action="store_true",
+                        help="Measure every level and window size instead of compressing, writing a CSV or JSON report.")
+    parser.add_argument("--levels", type=parse_range, default="0-9",
+                        help="Levels swept, e.g. 6 or 1-9. Default is 0-9.")
+    parser.add_argument("--wbits", type=parse_range, default="9-15",
+                        help="Window sizes swept as log2, within 9-15. Default is 9-15.")
+    parser.add_argument("--dict-size", type=int, default=DEFAULT_DICT_SIZE,
+                        help=f"Device decompression buffer (TINFL_LZ_DICT_SIZE) in bytes. Default is {DEFAULT_DICT_SIZE}.")
+    parser.add_argument("--format", choices=("csv", "json"), default=None,
+                        help="Report format, defaults to the report file extension.")
 
     args = parser.parse_args()
 
-    compress_file_with_zlib(args.input_filename, args.output_filename, args.level)
+    if args.sweep:
+        if not all(9 <= wbits <= 15 for wbits in args.wbits) or not all(0 <= level <= 9 for level in args.levels):
+            parser.error("levels must be within 0-9 and wbits within 9-15")
+        sweep_compression(args.input_filename, args.output_filename, args.levels, args.wbits, args.dict_size, args.format)
+    else:
+        compress_file_with_zlib(args.input_filename, args.output_filename, args.level)
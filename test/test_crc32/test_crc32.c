@@ -133,6 +133,76 @@ void test_crc_iscsi_pdu(){
     TEST_ASSERT_EQUAL_HEX32(ISCSI_PDU_CHECKSUM, crc32_get(&ctx));
 }
 
+typedef void (*crc32_update_function_t)(crc32_context_t *ctx, const uint8_t *data, size_t data_length);
+
+static const crc32_update_function_t crc32_implementations[] = {
+    crc32_update,
+    crc32_update_nibble,
+#if CRC32_IMPLEMENTATION >= CRC32_IMPLEMENTATION_TABLE
+    crc32_update_table,
+#endif
+#if CRC32_IMPLEMENTATION >= CRC32_IMPLEMENTATION_SLICING_BY_4
+    crc32_update_slicing_by_4,
+#endif
+#if CRC32_IMPLEMENTATION >= CRC32_IMPLEMENTATION_SLICING_BY_8
+    crc32_update_slicing_by_8,
+#endif
+};
+
+#define PATTERN_LENGTH 1000
+// zlib.crc32(bytes((i * 31 + 7) & 0xff for i in range(1000)))
+const uint32_t PATTERN_CHECKSUM = 0x8902161E;
+
+static void fill_pattern(uint8_t * buffer, size_t length){
+    for (size_t i = 0; i < length; i++){
+        buffer[i] = (uint8_t)(i * 31 + 7);
+    }
+}
+
+static uint32_t crc32_with(crc32_update_function_t update, const uint8_t * data, size_t data_length){
+    crc32_context_t ctx;
+    crc32_init(&ctx);
+    update(&ctx, data, data_length);
+    return crc32_get(&ctx);
+}
+
+void test_crc_implementations_match_zlib(){
+    uint8_t pattern[PATTERN_LENGTH];
+    fill_pattern(pattern, sizeof(pattern));
+    for (size_t i = 0; i < sizeof(crc32_implementations) / sizeof(crc32_implementations[0]); i++){
+        TEST_ASSERT_EQUAL_HEX32(PATTERN_CHECKSUM, crc32_with(crc32_implementations[i], pattern, sizeof(pattern)));
+        TEST_ASSERT_EQUAL_HEX32(ISCSI_PDU_CHECKSUM, crc32_with(crc32_implementations[i], ISCSI_PDU, sizeof(ISCSI_PDU)));
+        TEST_ASSERT_EQUAL_HEX32(ALL_ONES_CHECKSUM, crc32_with(crc32_implementations[i], ALL_ONES, sizeof(ALL_ONES)));
+    }
+}
+
+void test_crc_implementations_match_for_all_lengths_and_alignments(){
+    uint8_t pattern[PATTERN_LENGTH];
+    fill_pattern(pattern, sizeof(pattern));
+    for (size_t offset = 0; offset < 8; offset++){
+        for (size_t length = 0; length <= 64; length++){
+            uint32_t expected = crc32_with(crc32_update_nibble, pattern + offset, length);
+            for (size_t i = 0; i < sizeof(crc32_implementations) / sizeof(crc32_implementations[0]); i++){
+                TEST_ASSERT_EQUAL_HEX32(expected, crc32_with(crc32_implementations[i], pattern + offset, length));
+            }
+        }
+    }
+}
+
+void test_crc_implementations_match_when_updated_in_parts(){
+    uint8_t pattern[PATTERN_LENGTH];
+    fill_pattern(pattern, sizeof(pattern));
+    for (size_t i = 0; i < sizeof(crc32_implementations) / sizeof(crc32_implementations[0]); i++){
+        for (size_t split = 0; split < 20; split++){
+            crc32_context_t ctx;
+            crc32_init(&ctx);
+            crc32_implementations[i](&ctx, pattern, split);
+            crc32_implementations[i](&ctx, pattern + split, sizeof(pattern) - split);
+            TEST_ASSERT_EQUAL_HEX32(PATTERN_CHECKSUM, crc32_get(&ctx));
+        }
+    }
+}
+
 int main(void) {
     UNITY_BEGIN();
     RUN_TEST(test_crc32_init);
@@ -144,6 +214,9 @@ int main(void) {
     RUN_TEST(test_crc_increasing);
     RUN_TEST(test_crc_decreasing);
     RUN_TEST(test_crc_iscsi_pdu);
+    RUN_TEST(test_crc_implementations_match_zlib);
+    RUN_TEST(test_crc_implementations_match_for_all_lengths_and_alignments);
+    RUN_TEST(test_crc_implementations_match_when_updated_in_parts);
     return UNITY_END();
 }
 
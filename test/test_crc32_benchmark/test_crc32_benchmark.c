@@ -0,0 +1,78 @@
+#include "unity.h"
+#include <crc32.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+// 64KB buffer hashed repeatedly, small enough for targets without PSRAM
+#define BENCHMARK_BUFFER_LENGTH (64 * 1024)
+#define BENCHMARK_ITERATIONS 64
+
+typedef void (*crc32_update_function_t)(crc32_context_t *ctx, const uint8_t *data, size_t data_length);
+
+struct crc32_benchmark_t {
+    const char * name;
+    crc32_update_function_t update;
+};
+
+static const struct crc32_benchmark_t benchmarks[] = {
+    {"nibble", crc32_update_nibble},
+#if CRC32_IMPLEMENTATION >= CRC32_IMPLEMENTATION_TABLE
+    {"table", crc32_update_table},
+#endif
+#if CRC32_IMPLEMENTATION >= CRC32_IMPLEMENTATION_SLICING_BY_4
+    {"slicing_by_4", crc32_update_slicing_by_4},
+#endif
+#if CRC32_IMPLEMENTATION >= CRC32_IMPLEMENTATION_SLICING_BY_8
+    {"slicing_by_8", crc32_update_slicing_by_8},
+#endif
+};
+
+static uint8_t * buffer = NULL;
+
+void setUp(void) {
+    buffer = malloc(BENCHMARK_BUFFER_LENGTH);
+    TEST_ASSERT_NOT_NULL(buffer);
+    for (size_t i = 0; i < BENCHMARK_BUFFER_LENGTH; i++){
+        buffer[i] = (uint8_t)(i * 31 + 7);
+    }
+}
+
+void tearDown(void) {
+    free(buffer);
+    buffer = NULL;
+}
+
+void benchmark_crc32_implementations(){
+    uint32_t expected_crc = 0;
+    for (size_t i = 0; i < sizeof(benchmarks) / sizeof(benchmarks[0]); i++){
+        crc32_context_t ctx;
+        crc32_init(&ctx);
+
+        clock_t start = clock();
+        for (size_t iteration = 0; iteration < BENCHMARK_ITERATIONS; iteration++){
+            benchmarks[i].update(&ctx, buffer, BENCHMARK_BUFFER_LENGTH);
+        }
+        clock_t elapsed = clock() - start;
+
+        uint32_t crc = crc32_get(&ctx);
+        if (i == 0){
+            expected_crc = crc;
+        }
+        TEST_ASSERT_EQUAL_HEX32(expected_crc, crc);
+
+        double seconds = (double)elapsed / CLOCKS_PER_SEC;
+        double megabytes = (double)BENCHMARK_BUFFER_LENGTH * BENCHMARK_ITERATIONS / (1024.0 * 1024.0);
+        printf("crc32 %-12s %8.2f MB in %8.4f s, %8.2f MB/s\n", benchmarks[i].name, megabytes, seconds, seconds > 0 ? megabytes / seconds : 0.0);
+    }
+}
+
+int main(void) {
+    UNITY_BEGIN();
+    RUN_TEST(benchmark_crc32_implementations);
+    return UNITY_END();
+}
+
+void app_main() {
+    main();
+}
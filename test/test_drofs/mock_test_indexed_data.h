@@ -0,0 +1,15 @@
+#ifndef MOCK_TEST_INDEXED_DATA_H
+#define MOCK_TEST_INDEXED_DATA_H
+
+#include <stddef.h>
+#include <stdint.h>
+
+extern const unsigned char mock_test_indexed_data[];
+extern const size_t mock_test_indexed_data_len;
+extern const uint32_t mock_test_indexed_data_crc32;
+
+extern const char mock_test_indexed_data_binary_modified_date[];
+extern const char mock_test_indexed_data_c_generated_date[];
+extern const char mock_test_indexed_data_c_compiled_date[];
+
+#endif // MOCK_TEST_INDEXED_DATA_H
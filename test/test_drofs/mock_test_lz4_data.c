@@ -0,0 +1,700 @@
+#include "mock_test_lz4_data.h"
+
+const unsigned char mock_test_lz4_data[] = {
+    /* 0x00000000 */ 0x44, 0x52, 0x4f, 0x46, 0x53, 0xa3, 0x2d, 0x5b, 0x7b, 0x02, 0x0a, 0x74, 0x65, 0x73, 0x74, 0x5f, //* DROFS.-[{..test_ */ 
+    /* 0x00000010 */ 0x64, 0x61, 0x74, 0x61, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x02, //* data............ */ 
+    /* 0x00000020 */ 0x04, 0x00, 0x6c, 0x5b, 0xd5, 0x6a, 0x05, 0x01, 0x00, 0x0c, 0x04, 0x00, 0x00, 0x00, 0x35, 0x00, //* ..l[.j........5. */ 
+    /* 0x00000030 */ 0x00, 0x00, 0x9f, 0x00, 0x00, 0x00, 0xb7, 0x04, 0x00, 0x00, 0xc3, 0x2a, 0x00, 0x00, 0x02, 0x0a, //* ...........*.... */ 
+    /* 0x00000040 */ 0x73, 0x75, 0x62, 0x66, 0x6f, 0x6c, 0x64, 0x65, 0x72, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, //* subfolder....... */ 
+    /* 0x00000050 */ 0x00, 0x00, 0x00, 0x01, 0x02, 0x04, 0x00, 0x6c, 0x5b, 0xd5, 0x6a, 0x01, 0x00, 0x00, 0x00, 0x5a, //* .......l[.j....Z */ 
+    /* 0x00000060 */ 0x00, 0x00, 0x00, 0x01, 0x0a, 0x66, 0x69, 0x6c, 0x65, 0x32, 0x2e, 0x74, 0x78, 0x74, 0x00, 0x1d, //* .....file2.txt.. */ 
+    /* 0x00000070 */ 0x00, 0x00, 0x00, 0x93, 0x23, 0x7a, 0x1e, 0x54, 0x68, 0x69, 0x73, 0x20, 0x69, 0x73, 0x20, 0x66, //* ....#z.This is f */ 
+    /* 0x00000080 */ 0x69, 0x6c, 0x65, 0x32, 0x20, 0x69, 0x6e, 0x20, 0x61, 0x20, 0x73, 0x75, 0x62, 0x66, 0x6f, 0x6c, //* ile2 in a subfol */ 
+    /* 0x00000090 */ 0x64, 0x65, 0x72, 0x2e, 0x00, 0x02, 0x01, 0x04, 0x00, 0x1d, 0x00, 0x00, 0x00, 0x02, 0x04, 0x00, //* der............. */ 
+    /* 0x000000a0 */ 0x32, 0xc9, 0x18, 0x69, 0x00, 0x00, 0x00, 0x00, 0x01, 0x0e, 0x6c, 0x6f, 0x6e, 0x67, 0x5f, 0x66, //* 2..i......long_f */ 
+    /* 0x000000b0 */ 0x69, 0x6c, 0x65, 0x2e, 0x74, 0x78, 0x74, 0x00, 0xe1, 0x03, 0x00, 0x00, 0x3d, 0x59, 0xe6, 0xb9, //* ile.txt.....=Y.. */ 
+    /* 0x000000c0 */ 0xf1, 0x58, 0x4c, 0x6f, 0x72, 0x65, 0x6d, 0x20, 0x69, 0x70, 0x73, 0x75, 0x6d, 0x20, 0x64, 0x6f, //* .XLorem ipsum do */ 
+    /* 0x000000d0 */ 0x6c, 0x6f, 0x72, 0x20, 0x73, 0x69, 0x74, 0x20, 0x61, 0x6d, 0x65, 0x74, 0x2c, 0x20, 0x63, 0x6f, //* lor sit amet, co */ 
+    /* 0x000000e0 */ 0x6e, 0x73, 0x65, 0x63, 0x74, 0x65, 0x74, 0x75, 0x72, 0x20, 0x61, 0x64, 0x69, 0x70, 0x69, 0x73, //* nsectetur adipis */ 
+    /* 0x000000f0 */ 0x63, 0x69, 0x6e, 0x67, 0x20, 0x65, 0x6c, 0x69, 0x74, 0x2c, 0x20, 0x73, 0x65, 0x64, 0x20, 0x64, //* cing elit, sed d */ 
+    /* 0x00000100 */ 0x6f, 0x20, 0x65, 0x69, 0x75, 0x73, 0x6d, 0x6f, 0x64, 0x20, 0x74, 0x65, 0x6d, 0x70, 0x6f, 0x72, //* o eiusmod tempor */ 
+    /* 0x00000110 */ 0x20, 0x69, 0x6e, 0x63, 0x69, 0x64, 0x69, 0x64, 0x75, 0x6e, 0x74, 0x20, 0x75, 0x74, 0x20, 0x6c, //*  incididunt ut l */ 
+    /* 0x00000120 */ 0x61, 0x62, 0x6f, 0x72, 0x65, 0x20, 0x65, 0x74, 0x20, 0x5b, 0x00, 0xf0, 0x10, 0x65, 0x20, 0x6d, //* abore et [...e m */ 
+    /* 0x00000130 */ 0x61, 0x67, 0x6e, 0x61, 0x20, 0x61, 0x6c, 0x69, 0x71, 0x75, 0x61, 0x2e, 0x20, 0x0d, 0x0a, 0x55, //* agna aliqua. ..U */ 
+    /* 0x00000140 */ 0x74, 0x20, 0x65, 0x6e, 0x69, 0x6d, 0x20, 0x61, 0x64, 0x20, 0x6d, 0x69, 0x09, 0x00, 0xf1, 0x1b, //* t enim ad mi.... */ 
+    /* 0x00000150 */ 0x76, 0x65, 0x6e, 0x69, 0x61, 0x6d, 0x2c, 0x20, 0x71, 0x75, 0x69, 0x73, 0x20, 0x6e, 0x6f, 0x73, //* veniam, quis nos */ 
+    /* 0x00000160 */ 0x74, 0x72, 0x75, 0x64, 0x20, 0x65, 0x78, 0x65, 0x72, 0x63, 0x69, 0x74, 0x61, 0x74, 0x69, 0x6f, //* trud exercitatio */ 
+    /* 0x00000170 */ 0x6e, 0x20, 0x75, 0x6c, 0x6c, 0x61, 0x6d, 0x63, 0x6f, 0x20, 0x5c, 0x00, 0x00, 0x25, 0x00, 0x30, //* n ullamco \..%.0 */ 
+    /* 0x00000180 */ 0x69, 0x73, 0x69, 0x6c, 0x00, 0x01, 0x55, 0x00, 0xf2, 0x01, 0x69, 0x70, 0x20, 0x65, 0x78, 0x20, //* isil..U...ip ex  */ 
+    /* 0x00000190 */ 0x65, 0x61, 0x20, 0x63, 0x6f, 0x6d, 0x6d, 0x6f, 0x64, 0x6f, 0xc3, 0x00, 0x40, 0x71, 0x75, 0x61, //* ea commodo..@qua */ 
+    /* 0x000001a0 */ 0x74, 0x6e, 0x00, 0x10, 0x44, 0x55, 0x00, 0xa3, 0x61, 0x75, 0x74, 0x65, 0x20, 0x69, 0x72, 0x75, //* tn..DU..aute iru */ 
+    /* 0x000001b0 */ 0x72, 0x65, 0xf0, 0x00, 0xf0, 0x10, 0x69, 0x6e, 0x20, 0x72, 0x65, 0x70, 0x72, 0x65, 0x68, 0x65, //* re....in reprehe */ 
+    /* 0x000001c0 */ 0x6e, 0x64, 0x65, 0x72, 0x69, 0x74, 0x20, 0x69, 0x6e, 0x20, 0x76, 0x6f, 0x6c, 0x75, 0x70, 0x74, //* nderit in volupt */ 
+    /* 0x000001d0 */ 0x61, 0x74, 0x65, 0x20, 0x76, 0xee, 0x00, 0xa4, 0x20, 0x65, 0x73, 0x73, 0x65, 0x20, 0x63, 0x69, //* ate v... esse ci */ 
+    /* 0x000001e0 */ 0x6c, 0x6c, 0x26, 0x01, 0xd0, 0x65, 0x20, 0x65, 0x75, 0x20, 0x66, 0x75, 0x67, 0x69, 0x61, 0x74, //* ll&..e eu fugiat */ 
+    /* 0x000001f0 */ 0x20, 0x6e, 0x93, 0x00, 0x90, 0x20, 0x70, 0x61, 0x72, 0x69, 0x61, 0x74, 0x75, 0x72, 0x69, 0x00, //*  n... pariaturi. */ 
+    /* 0x00000200 */ 0x80, 0x45, 0x78, 0x63, 0x65, 0x70, 0x74, 0x65, 0x75, 0x4d, 0x01, 0xf0, 0x04, 0x6e, 0x74, 0x20, //* .ExcepteuM...nt  */ 
+    /* 0x00000210 */ 0x6f, 0x63, 0x63, 0x61, 0x65, 0x63, 0x61, 0x74, 0x20, 0x63, 0x75, 0x70, 0x69, 0x64, 0x61, 0x74, //* occaecat cupidat */ 
+    /* 0x00000220 */ 0x34, 0x00, 0xa0, 0x6f, 0x6e, 0x20, 0x70, 0x72, 0x6f, 0x69, 0x64, 0x65, 0x6e, 0x4c, 0x01, 0x21, //* 4..on proidenL.! */ 
+    /* 0x00000230 */ 0x75, 0x6e, 0x77, 0x00, 0x50, 0x63, 0x75, 0x6c, 0x70, 0x61, 0xfc, 0x00, 0xe0, 0x20, 0x6f, 0x66, //* unw.Pculpa... of */ 
+    /* 0x00000240 */ 0x66, 0x69, 0x63, 0x69, 0x61, 0x20, 0x64, 0x65, 0x73, 0x65, 0x72, 0x1e, 0x00, 0x40, 0x6d, 0x6f, //* ficia deser..@mo */ 
+    /* 0x00000250 */ 0x6c, 0x6c, 0x99, 0x01, 0x00, 0x25, 0x01, 0x53, 0x69, 0x64, 0x20, 0x65, 0x73, 0x5e, 0x01, 0xa0, //* ll...%.Sid es^.. */ 
+    /* 0x00000260 */ 0x75, 0x6d, 0x2e, 0x0d, 0x0a, 0x0d, 0x0a, 0x53, 0x65, 0x64, 0x05, 0x01, 0x50, 0x70, 0x65, 0x72, //* um.....Sed..Pper */ 
+    /* 0x00000270 */ 0x73, 0x70, 0x39, 0x00, 0xf3, 0x0e, 0x74, 0x69, 0x73, 0x20, 0x75, 0x6e, 0x64, 0x65, 0x20, 0x6f, //* sp9...tis unde o */ 
+    /* 0x00000280 */ 0x6d, 0x6e, 0x69, 0x73, 0x20, 0x69, 0x73, 0x74, 0x65, 0x20, 0x6e, 0x61, 0x74, 0x75, 0x73, 0x20, //* mnis iste natus  */ 
+    /* 0x00000290 */ 0x65, 0x72, 0x72, 0xe5, 0x01, 0x05, 0xe5, 0x00, 0xb5, 0x6d, 0x20, 0x61, 0x63, 0x63, 0x75, 0x73, //* err......m accus */ 
+    /* 0x000002a0 */ 0x61, 0x6e, 0x74, 0x69, 0xe0, 0x00, 0x92, 0x6d, 0x71, 0x75, 0x65, 0x20, 0x6c, 0x61, 0x75, 0x64, //* anti...mque laud */ 
+    /* 0x000002b0 */ 0x16, 0x00, 0x80, 0x2c, 0x20, 0x74, 0x6f, 0x74, 0x61, 0x6d, 0x20, 0x2d, 0x02, 0x61, 0x0d, 0x0a, //* ..., totam -.a.. */ 
+    /* 0x000002c0 */ 0x61, 0x70, 0x65, 0x72, 0xa7, 0x01, 0x20, 0x65, 0x61, 0x27, 0x00, 0x30, 0x69, 0x70, 0x73, 0xb6, //* aper.. ea'.0ips. */ 
+    /* 0x000002d0 */ 0x00, 0xf0, 0x02, 0x61, 0x65, 0x20, 0x61, 0x62, 0x20, 0x69, 0x6c, 0x6c, 0x6f, 0x20, 0x69, 0x6e, //* ...ae ab illo in */ 
+    /* 0x000002e0 */ 0x76, 0x65, 0x6e, 0x74, 0x27, 0x01, 0x10, 0x76, 0x53, 0x01, 0x10, 0x61, 0x8f, 0x00, 0xf0, 0x0e, //* vent'..vS..a.... */ 
+    /* 0x000002f0 */ 0x65, 0x74, 0x20, 0x71, 0x75, 0x61, 0x73, 0x69, 0x20, 0x61, 0x72, 0x63, 0x68, 0x69, 0x74, 0x65, //* et quasi archite */ 
+    /* 0x00000300 */ 0x63, 0x74, 0x6f, 0x20, 0x62, 0x65, 0x61, 0x74, 0x61, 0x65, 0x20, 0x76, 0x69, 0x06, 0x00, 0x52, //* cto beatae vi..R */ 
+    /* 0x00000310 */ 0x64, 0x69, 0x63, 0x74, 0x61, 0x0c, 0x01, 0x90, 0x65, 0x78, 0x70, 0x6c, 0x69, 0x63, 0x61, 0x62, //* dicta...explicab */ 
+    /* 0x00000320 */ 0x6f, 0x4e, 0x01, 0x42, 0x4e, 0x65, 0x6d, 0x6f, 0x27, 0x02, 0x00, 0x69, 0x00, 0x16, 0x6d, 0x9d, //* oN.BNemo'..i..m. */ 
+    /* 0x00000330 */ 0x01, 0x10, 0x6d, 0x2b, 0x01, 0x14, 0x61, 0x10, 0x00, 0x12, 0x73, 0xba, 0x02, 0x40, 0x73, 0x70, //* ..m+..a...s..@sp */ 
+    /* 0x00000340 */ 0x65, 0x72, 0xea, 0x00, 0x80, 0x72, 0x20, 0x61, 0x75, 0x74, 0x20, 0x6f, 0x64, 0x35, 0x01, 0x21, //* er...r aut od5.! */ 
+    /* 0x00000350 */ 0x75, 0x74, 0xac, 0x01, 0x00, 0x6a, 0x01, 0x22, 0x65, 0x64, 0x35, 0x00, 0x01, 0xdc, 0x02, 0x40, //* ut...j."ed5....@ */ 
+    /* 0x00000360 */ 0x71, 0x75, 0x75, 0x6e, 0x2a, 0x00, 0x00, 0x97, 0x02, 0x12, 0x69, 0x0f, 0x02, 0x80, 0x65, 0x73, //* quun*.....i...es */ 
+    /* 0x00000370 */ 0x20, 0x0d, 0x0a, 0x65, 0x6f, 0x73, 0x26, 0x00, 0x21, 0x20, 0x72, 0x73, 0x02, 0x14, 0x65, 0x62, //*  ..eos&.! rs..eb */ 
+    /* 0x00000380 */ 0x00, 0x00, 0x72, 0x00, 0x00, 0x35, 0x00, 0xe0, 0x69, 0x20, 0x6e, 0x65, 0x73, 0x63, 0x69, 0x75, //* ..r..5..i nesciu */ 
+    /* 0x00000390 */ 0x6e, 0x74, 0x2e, 0x20, 0x4e, 0x65, 0x02, 0x01, 0x50, 0x70, 0x6f, 0x72, 0x72, 0x6f, 0x33, 0x00, //* nt. Ne..Pporro3. */ 
+    /* 0x000003a0 */ 0x50, 0x73, 0x71, 0x75, 0x61, 0x6d, 0x9e, 0x01, 0x01, 0xc3, 0x02, 0x03, 0x53, 0x00, 0x01, 0xb9, //* Psquam......S... */ 
+    /* 0x000003b0 */ 0x00, 0x13, 0x75, 0xae, 0x00, 0x01, 0x0a, 0x03, 0x01, 0xab, 0x00, 0x2d, 0x0d, 0x0a, 0x67, 0x03, //* ..u........-..g. */ 
+    /* 0x000003c0 */ 0x15, 0x2c, 0x68, 0x03, 0x02, 0x79, 0x02, 0x02, 0x67, 0x03, 0x10, 0x71, 0xe6, 0x00, 0x72, 0x6e, //* .,h..y..g..q..rn */ 
+    /* 0x000003d0 */ 0x6f, 0x6e, 0x20, 0x6e, 0x75, 0x6d, 0x60, 0x00, 0x83, 0x69, 0x75, 0x73, 0x20, 0x6d, 0x6f, 0x64, //* on num`..ius mod */ 
+    /* 0x000003e0 */ 0x69, 0x77, 0x03, 0x21, 0x61, 0x20, 0x78, 0x03, 0x00, 0x28, 0x02, 0x13, 0x75, 0x18, 0x02, 0x1c, //* iw.!a x..(..u... */ 
+    /* 0x000003f0 */ 0x65, 0x76, 0x03, 0x01, 0xb8, 0x01, 0x01, 0x79, 0x03, 0x00, 0x89, 0x00, 0x48, 0x61, 0x65, 0x72, //* ev.....y....Haer */ 
+    /* 0x00000400 */ 0x61, 0x02, 0x02, 0x2c, 0x2e, 0x20, 0x8b, 0x03, 0x2f, 0x61, 0x20, 0x8c, 0x03, 0x00, 0x19, 0x6d, //* a..,. ../a ....m */ 
+    /* 0x00000410 */ 0x8c, 0x03, 0x22, 0x65, 0x6d, 0x8e, 0x03, 0x51, 0x20, 0x63, 0x6f, 0x72, 0x70, 0x8d, 0x03, 0x70, //* .."em..Q corp..p */ 
+    /* 0x00000420 */ 0x73, 0x75, 0x73, 0x63, 0x69, 0x70, 0x69, 0xdc, 0x00, 0x02, 0xa0, 0x03, 0x20, 0x6f, 0x73, 0xce, //* suscipi..... os. */ 
+    /* 0x00000430 */ 0x03, 0x19, 0x6e, 0xa4, 0x03, 0x00, 0xd1, 0x03, 0x06, 0xa4, 0x03, 0x16, 0x69, 0xa4, 0x03, 0x54, //* ..n.........i..T */ 
+    /* 0x00000440 */ 0x75, 0x72, 0x3f, 0x20, 0x51, 0xa4, 0x03, 0x00, 0x0c, 0x04, 0x70, 0x6c, 0x20, 0x65, 0x75, 0x6d, //* ur? Q.....pl eum */ 
+    /* 0x00000450 */ 0x20, 0x69, 0xac, 0x03, 0x0a, 0xa3, 0x03, 0x00, 0x84, 0x01, 0x20, 0x69, 0x6e, 0x45, 0x00, 0x05, //*  i........ inE.. */ 
+    /* 0x00000460 */ 0xc5, 0x02, 0x37, 0x20, 0x0d, 0x0a, 0xac, 0x03, 0x01, 0x27, 0x01, 0xf8, 0x00, 0x6e, 0x69, 0x68, //* ..7 .....'...nih */ 
+    /* 0x00000470 */ 0x69, 0x6c, 0x20, 0x6d, 0x6f, 0x6c, 0x65, 0x73, 0x74, 0x69, 0x61, 0x65, 0x69, 0x00, 0x10, 0x2c, //* il molestiaei.., */ 
+    /* 0x00000480 */ 0x60, 0x01, 0x00, 0xac, 0x02, 0x02, 0x97, 0x01, 0x05, 0xa9, 0x01, 0x00, 0x70, 0x00, 0x03, 0xd7, //* `...........p... */ 
+    /* 0x00000490 */ 0x03, 0x34, 0x71, 0x75, 0x6f, 0xf9, 0x01, 0x19, 0x73, 0xe4, 0x03, 0x50, 0x75, 0x72, 0x3f, 0x0d, //* .4quo...s..Pur?. */ 
+    /* 0x000004a0 */ 0x0a, 0x03, 0x04, 0x03, 0x04, 0x00, 0x59, 0x01, 0x89, 0x71, 0x05, 0x01, 0x00, 0x0c, 0x01, 0x04, //* ......Y..q...... */ 
+    /* 0x000004b0 */ 0x00, 0x38, 0x05, 0x00, 0x00, 0x02, 0x04, 0x00, 0x32, 0xc9, 0x18, 0x69, 0x00, 0x00, 0x00, 0x00, //* .8......2..i.... */ 
+    /* 0x000004c0 */ 0x01, 0x0c, 0x64, 0x72, 0x6f, 0x66, 0x73, 0x32, 0x73, 0x2e, 0x70, 0x6e, 0x67, 0x00, 0xd7, 0x25, //* ..drofs2s.png..% */ 
+    /* 0x000004d0 */ 0x00, 0x00, 0xe6, 0x5b, 0x23, 0x06, 0xf0, 0x05, 0x89, 0x50, 0x4e, 0x47, 0x0d, 0x0a, 0x1a, 0x0a, //* ...[#....PNG.... */ 
+    /* 0x000004e0 */ 0x00, 0x00, 0x00, 0x0d, 0x49, 0x48, 0x44, 0x52, 0x00, 0x00, 0x00, 0x64, 0x04, 0x00, 0xf0, 0x23, //* ....IHDR...d...# */ 
+    /* 0x000004f0 */ 0x08, 0x06, 0x00, 0x00, 0x00, 0x70, 0xe2, 0x95, 0x54, 0x00, 0x00, 0x00, 0x01, 0x73, 0x52, 0x47, //* .....p..T....sRG */ 
+    /* 0x00000500 */ 0x42, 0x00, 0xae, 0xce, 0x1c, 0xe9, 0x00, 0x00, 0x00, 0x04, 0x67, 0x41, 0x4d, 0x41, 0x00, 0x00, //* B.........gAMA.. */ 
+    /* 0x00000510 */ 0xb1, 0x8f, 0x0b, 0xfc, 0x61, 0x05, 0x00, 0x00, 0x00, 0x09, 0x70, 0x48, 0x59, 0x73, 0x00, 0x00, //* ....a.....pHYs.. */ 
+    /* 0x00000520 */ 0x0e, 0xc2, 0x04, 0x00, 0xf2, 0x3a, 0x01, 0x15, 0x28, 0x4a, 0x80, 0x00, 0x00, 0x00, 0x18, 0x74, //* .....:..(J.....t */ 
+    /* 0x00000530 */ 0x45, 0x58, 0x74, 0x53, 0x6f, 0x66, 0x74, 0x77, 0x61, 0x72, 0x65, 0x00, 0x50, 0x61, 0x69, 0x6e, //* EXtSoftware.Pain */ 
+    /* 0x00000540 */ 0x74, 0x2e, 0x4e, 0x45, 0x54, 0x20, 0x35, 0x2e, 0x31, 0x2e, 0x38, 0x1b, 0x69, 0xea, 0xa8, 0x00, //* t.NET 5.1.8.i... */ 
+    /* 0x00000550 */ 0x00, 0x00, 0xb6, 0x65, 0x58, 0x49, 0x66, 0x49, 0x49, 0x2a, 0x00, 0x08, 0x00, 0x00, 0x00, 0x05, //* ...eXIfII*...... */ 
+    /* 0x00000560 */ 0x00, 0x1a, 0x01, 0x05, 0x00, 0x01, 0x00, 0x00, 0x00, 0x4a, 0x00, 0x00, 0x00, 0x1b, 0x01, 0x0c, //* .........J...... */ 
+    /* 0x00000570 */ 0x00, 0x00, 0x8e, 0x00, 0x31, 0x28, 0x01, 0x03, 0x18, 0x00, 0xf1, 0x04, 0x02, 0x00, 0x00, 0x00, //* ....1(.......... */ 
+    /* 0x00000580 */ 0x31, 0x01, 0x02, 0x00, 0x10, 0x00, 0x00, 0x00, 0x5a, 0x00, 0x00, 0x00, 0x69, 0x87, 0x04, 0x18, //* 1.......Z...i... */ 
+    /* 0x00000590 */ 0x00, 0x22, 0x6a, 0x00, 0x01, 0x00, 0x66, 0xf2, 0x76, 0x01, 0x00, 0xe8, 0x03, 0x08, 0x00, 0x0b, //* ."j...f.v....... */ 
+    /* 0x000005a0 */ 0x75, 0x00, 0xf2, 0x02, 0x00, 0x03, 0x00, 0x00, 0x90, 0x07, 0x00, 0x04, 0x00, 0x00, 0x00, 0x30, //* u..............0 */ 
+    /* 0x000005b0 */ 0x32, 0x33, 0x30, 0x01, 0xa0, 0x56, 0x00, 0x00, 0x72, 0x00, 0x22, 0x05, 0xa0, 0x4a, 0x00, 0x12, //* 230..V..r."..J.. */ 
+    /* 0x000005c0 */ 0x94, 0x49, 0x00, 0x61, 0x00, 0x02, 0x00, 0x01, 0x00, 0x02, 0x2a, 0x00, 0x63, 0x52, 0x39, 0x38, //* .I.a......*.cR98 */ 
+    /* 0x000005d0 */ 0x00, 0x02, 0x00, 0x36, 0x00, 0x30, 0x31, 0x30, 0x30, 0x21, 0x00, 0xf0, 0xff, 0xff, 0xff, 0xff, //* ...6.0100!...... */ 
+    /* 0x000005e0 */ 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, //* ................ */ 
+    /* 0x000005f0 */ 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, //* ................ */ 
+    /* 0x00000600 */ 0xc1, 0xcc, 0x6e, 0x16, 0x7c, 0x4a, 0x53, 0xe8, 0x1c, 0x00, 0x00, 0x24, 0x8c, 0x49, 0x44, 0x41, //* ..n.|JS....$.IDA */ 
+    /* 0x00000610 */ 0x54, 0x78, 0x5e, 0xed, 0x9d, 0x77, 0x58, 0x54, 0xd7, 0xf6, 0xf7, 0xbf, 0x33, 0x74, 0x95, 0xa2, //* Tx^..wXT....3t.. */ 
+    /* 0x00000620 */ 0x82, 0x0d, 0xc1, 0x04, 0x63, 0xef, 0xb1, 0x45, 0x8d, 0xc1, 0x12, 0xb0, 0xc6, 0x1e, 0xa3, 0x46, //* ....c..E.......F */ 
+    /* 0x00000630 */ 0x89, 0x25, 0x9a, 0x18, 0x4b, 0x12, 0x5b, 0x62, 0x03, 0x45, 0x44, 0x8d, 0x25, 0x96, 0x24, 0x16, //* .%..K.[b.ED.%.$. */ 
+    /* 0x00000640 */ 0xc4, 0x02, 0x1a, 0x45, 0x2c, 0x88, 0x8a, 0x0a, 0x16, 0x8a, 0x82, 0x02, 0x2a, 0x2a, 0x82, 0x58, //* ...E,.......**.X */ 
+    /* 0x00000650 */ 0x40, 0xa9, 0xc2, 0xc0, 0xd0, 0x86, 0x32, 0x30, 0x73, 0xbe, 0xef, 0x1f, 0x33, 0x1c, 0x61, 0x92, //* @.....20s...3.a. */ 
+    /* 0x00000660 */ 0xfb, 0xde, 0xdf, 0x73, 0xaf, 0x1a, 0xf1, 0xf2, 0x79, 0x9e, 0xf3, 0x3c, 0x33, 0x67, 0xef, 0xb3, //* ...s....y..<3g.. */ 
+    /* 0x00000670 */ 0xe7, 0xcc, 0x5e, 0x67, 0xef, 0xbd, 0xf6, 0xde, 0x6b, 0xad, 0x03, 0xd4, 0x50, 0x43, 0x0d, 0x35, //* ..^g....k...PC.5 */ 
+    /* 0x00000680 */ 0xd4, 0xf0, 0xa6, 0x18, 0x32, 0xc4, 0x51, 0x62, 0x6e, 0x6e, 0x66, 0x65, 0x63, 0x63, 0x63, 0xa8, //* ....2.Qbnnfeccc. */ 
+    /* 0x00000690 */ 0x9b, 0x56, 0xc3, 0x1b, 0xe4, 0x7d, 0xbb, 0xe6, 0x16, 0x00, 0x7e, 0x06, 0x10, 0x05, 0x20, 0x07, //* .V...}....~... . */ 
+    /* 0x000006a0 */ 0x40, 0xac, 0xa5, 0xa5, 0x65, 0x2f, 0xdd, 0x7c, 0x35, 0xbc, 0x19, 0x06, 0x03, 0x78, 0x32, 0x70, //* @...e/.|5....x2p */ 
+    /* 0x000006b0 */ 0xa0, 0x03, 0x3d, 0x3d, 0xf7, 0xf1, 0xc2, 0x85, 0x40, 0xce, 0x9b, 0x37, 0x9f, 0x00, 0x72, 0xea, //* ..==....@..7..r. */ 
+    /* 0x000006c0 */ 0xd6, 0xad, 0xfb, 0x91, 0x6e, 0xe6, 0x1a, 0x5e, 0x2f, 0x93, 0x00, 0x08, 0xbb, 0x76, 0xed, 0x62, //* ....n..^/....v.b */ 
+    /* 0x000006d0 */ 0x76, 0x76, 0x0e, 0x2b, 0x28, 0x2c, 0x2c, 0xa4, 0x8b, 0x8b, 0x0b, 0x01, 0xc8, 0xac, 0xad, 0xad, //* vv.+(,,......... */ 
+    /* 0x000006e0 */ 0xed, 0x74, 0x2f, 0xaa, 0xe1, 0xf5, 0xd0, 0x15, 0x80, 0xd2, 0xcf, 0xef, 0x34, 0xd5, 0x6a, 0x81, //* .t/.........4.j. */ 
+    /* 0x000006f0 */ 0x24, 0xa9, 0x12, 0xd4, 0x2c, 0x57, 0xab, 0x49, 0x92, 0x79, 0x79, 0x79, 0x9c, 0x34, 0x71, 0x22, //* $...,W.I.yyy.4q" */ 
+    /* 0x00000700 */ 0x01, 0xf8, 0xeb, 0x5e, 0x58, 0xc3, 0xeb, 0x21, 0xf4, 0xe0, 0xc1, 0x83, 0x14, 0x04, 0x81, 0x6a, //* ...^X..!.......j */ 
+    /* 0x00000710 */ 0xb5, 0x9a, 0x82, 0x20, 0x30, 0x27, 0x27, 0x87, 0x99, 0x59, 0x59, 0x14, 0x04, 0x8d, 0x80, 0x6e, //* ... 0''..YY....n */ 
+    /* 0x00000720 */ 0xde, 0xbc, 0x49, 0x00, 0x04, 0x30, 0x54, 0xf7, 0xe2, 0x1a, 0x5e, 0x2d, 0x23, 0x86, 0x7f, 0x36, //* ..I..0T...^-#..6 */ 
+    /* 0x00000730 */ 0x82, 0x79, 0x79, 0xf9, 0x24, 0x49, 0xb5, 0xb6, 0x55, 0xdc, 0xbe, 0x7d, 0x9b, 0xc9, 0x29, 0x29, //* .yy.$I..U..}..)) */ 
+    /* 0x00000740 */ 0x24, 0x49, 0x41, 0x10, 0x58, 0x54, 0x54, 0xc4, 0xf1, 0xe3, 0xc7, 0x13, 0xc0, 0x8d, 0xe6, 0xcd, //* $IA.XTT......... */ 
+    /* 0x00000750 */ 0x9b, 0xeb, 0xeb, 0x16, 0xf2, 0xb6, 0x23, 0xd5, 0x3d, 0xf1, 0x4f, 0xd3, 0xb2, 0x65, 0x4b, 0x43, //* ......#.=.O..eKC */ 
+    /* 0x00000760 */ 0x00, 0x23, 0x01, 0x4c, 0xd7, 0xd7, 0xd7, 0xff, 0xb0, 0x49, 0x93, 0xc6, 0xb5, 0x2c, 0x2c, 0x2c, //* .#.L.....I...,,, */ 
+    /* 0x00000770 */ 0x2c, 0x00, 0x2c, 0xeb, 0x67, 0x6f, 0x0f, 0x73, 0x73, 0x33, 0x08, 0x82, 0x20, 0xe6, 0x4f, 0x49, //* ,.,.go.ss3.. .OI */ 
+    /* 0x00000780 */ 0x49, 0x81, 0xb1, 0xb1, 0xb1, 0xf8, 0xdd, 0xd8, 0xd8, 0x18, 0xed, 0xda, 0xb5, 0x03, 0x80, 0x9e, //* I............... */ 
+    /* 0x00000790 */ 0xe9, 0xe9, 0xe9, 0x3d, 0xc5, 0x84, 0x6a, 0xc2, 0x5b, 0x25, 0x90, 0xe6, 0xcd, 0x3f, 0xb0, 0x7e, //* ...=..j.[%...?.~ */ 
+    /* 0x000007a0 */ 0xf4, 0xe8, 0xd1, 0x05, 0x00, 0x7e, 0x6d, 0xdb, 0xb6, 0xf3, 0x54, 0xa9, 0x54, 0x51, 0xe9, 0xe9, //* .....~m...T.TQ.. */ 
+    /* 0x000007b0 */ 0x19, 0x71, 0x25, 0x25, 0x25, 0xf1, 0x00, 0x7a, 0x9a, 0x9b, 0x9b, 0x55, 0xc9, 0xaf, 0x56, 0xab, //* .q%%%..z...U..V. */ 
+    /* 0x000007c0 */ 0x91, 0x9b, 0x9b, 0x0b, 0x13, 0x63, 0x63, 0x10, 0x00, 0x24, 0x00, 0x49, 0x94, 0x97, 0x97, 0x03, //* .....cc..$.I.... */ 
+    /* 0x000007d0 */ 0x00, 0xca, 0xca, 0xca, 0x0c, 0x01, 0xc0, 0xc2, 0xc2, 0xa2, 0xa9, 0xbe, 0xbe, 0xfe, 0x60, 0x00, //* ..............`. */ 
+    /* 0x000007e0 */ 0x5f, 0x01, 0x70, 0xb2, 0xb0, 0xb0, 0x68, 0x5e, 0xa5, 0xa0, 0x1a, 0xfe, 0x25, 0x81, 0x23, 0x47, //* _.p...h^....%.#G */ 
+    /* 0x000007f0 */ 0x8e, 0xe4, 0x83, 0x07, 0x0f, 0x98, 0x99, 0x95, 0xc5, 0xcb, 0x57, 0xae, 0x70, 0xc0, 0xc0, 0x01, //* ..........W.p... */ 
+    /* 0x00000800 */ 0x15, 0x63, 0x02, 0xd7, 0xae, 0x5d, 0x4b, 0x41, 0x10, 0xc4, 0xa3, 0xb8, 0xb8, 0x98, 0x7f, 0xfc, //* .c...]KA........ */ 
+    /* 0x00000810 */ 0xf1, 0x07, 0x95, 0x4a, 0x25, 0x35, 0x23, 0x08, 0xa9, 0x50, 0x28, 0x38, 0x6e, 0xdc, 0x38, 0x02, //* ...J%5#..P(8n.8. */ 
+    /* 0x00000820 */ 0xa0, 0x54, 0x2a, 0xf5, 0x05, 0x70, 0x01, 0x40, 0x2e, 0x00, 0x36, 0x6e, 0xd4, 0x84, 0xd6, 0x4d, //* .T*..p.@..6n...M */ 
+    /* 0x00000830 */ 0x9a, 0x12, 0x40, 0x5e, 0xbd, 0xfa, 0xf5, 0x7a, 0xeb, 0xfe, 0x78, 0x0d, 0x55, 0x71, 0x32, 0x34, //* ..@^...z..x.Uq24 */ 
+    /* 0x00000840 */ 0x34, 0x62, 0x5c, 0x5c, 0xbc, 0x66, 0x3c, 0xd0, 0x56, 0xf0, 0xb3, 0xe7, 0xcf, 0x38, 0x74, 0xc8, //* 4b\\.f<.V....8t. */ 
+    /* 0x00000850 */ 0x10, 0x02, 0xe0, 0x90, 0x21, 0x43, 0x98, 0x9f, 0x9f, 0x2f, 0xa6, 0xe5, 0xe4, 0xe4, 0x70, 0xd7, //* ....!C.../....p. */ 
+    /* 0x00000860 */ 0xee, 0xdd, 0x54, 0xab, 0xd5, 0x54, 0x0b, 0x9a, 0x31, 0xe5, 0xc1, 0x83, 0x07, 0xa2, 0x00, 0x01, //* ..T..T..1....... */ 
+    /* 0x00000870 */ 0x70, 0xf4, 0xe8, 0x31, 0xf4, 0xf4, 0xf4, 0xe4, 0xad, 0x5b, 0xb7, 0x99, 0x9e, 0xf1, 0x82, 0x89, //* p..1.....[...... */ 
+    /* 0x00000880 */ 0x49, 0xcf, 0x38, 0x68, 0xf0, 0x60, 0x02, 0x38, 0xac, 0x7b, 0x03, 0x35, 0x68, 0x69, 0xdb, 0xb6, //* I.8h.`.8.{.5hi.. */ 
+    /* 0x00000890 */ 0xad, 0x14, 0xc0, 0xed, 0x0d, 0x1b, 0x36, 0x50, 0x10, 0x04, 0xaa, 0xd4, 0x6a, 0x2a, 0xcb, 0xca, //* ......6P....j*.. */ 
+    /* 0x000008a0 */ 0xa8, 0xd6, 0x6a, 0x4e, 0xb7, 0xa2, 0xa3, 0xc5, 0x0a, 0xbe, 0x76, 0xfd, 0x9a, 0x56, 0x1c, 0x64, //* ..jN......v..V.d */ 
+    /* 0x000008b0 */ 0x4a, 0x4a, 0x0a, 0xbd, 0x0f, 0x1d, 0x22, 0xb5, 0x03, 0xba, 0x5a, 0xad, 0xa6, 0xab, 0xab, 0xab, //* JJ...."...Z..... */ 
+    /* 0x000008c0 */ 0xd8, 0x9a, 0xa2, 0xa3, 0x6f, 0xb1, 0xa0, 0xa0, 0x40, 0xcc, 0x4f, 0x92, 0x6a, 0x41, 0xe0, 0x8f, //* ....o...@.O.jA.. */ 
+    /* 0x000008d0 */ 0x3f, 0xfe, 0x48, 0x00, 0x81, 0xba, 0xf7, 0x51, 0x83, 0x96, 0x5a, 0xb5, 0x6a, 0xb5, 0x00, 0x50, //* ?.H....Q..Z.j..P */ 
+    /* 0x000008e0 */ 0x1a, 0x18, 0x18, 0x28, 0x56, 0xdc, 0xad, 0xdb, 0xb7, 0x58, 0x52, 0x5a, 0x4a, 0x81, 0xa4, 0x52, //* ...(V....XRZJ..R */ 
+    /* 0x000008f0 */ 0xa9, 0xe4, 0xbc, 0x79, 0xf3, 0x08, 0x80, 0x13, 0x26, 0x4c, 0x60, 0x4e, 0x76, 0x36, 0xa9, 0x6d, //* ...y....&L`Nv6.m */ 
+    /* 0x00000900 */ 0x0d, 0x67, 0xcf, 0x9d, 0x23, 0xb5, 0x02, 0xf1, 0xf5, 0xf5, 0xa5, 0xa3, 0xa3, 0x03, 0xef, 0xdd, //* .g..#........... */ 
+    /* 0x00000910 */ 0xbb, 0x47, 0x95, 0xaa, 0xfc, 0xa5, 0x10, 0xd4, 0x6a, 0x51, 0x4d, 0x56, 0x96, 0x96, 0x72, 0xe6, //* .G......jQMV..r. */ 
+    /* 0x00000920 */ 0xd7, 0x5f, 0x53, 0xdb, 0x95, 0xbd, 0x75, 0xbc, 0x15, 0x83, 0xba, 0x20, 0x08, 0x2d, 0x01, 0x18, //* ._S...u.... .-.. */ 
+    /* 0x00000930 */ 0x99, 0x9a, 0x9a, 0x8a, 0xe7, 0x32, 0x33, 0xb3, 0x50, 0x50, 0x50, 0x00, 0x09, 0x00, 0x43, 0x43, //* .....23.PPP...CC */ 
+    /* 0x00000940 */ 0x43, 0xb4, 0x6d, 0xdb, 0x16, 0x00, 0x70, 0xf4, 0xe8, 0x51, 0x6c, 0xde, 0xb2, 0x05, 0x85, 0x85, //* C.m...p..Ql..... */ 
+    /* 0x00000950 */ 0x85, 0x28, 0x29, 0x2d, 0x45, 0xc3, 0x86, 0x0d, 0x90, 0x23, 0xcf, 0xc1, 0x6f, 0xbf, 0xff, 0x86, //* .()-E....#..o... */ 
+    /* 0x00000960 */ 0x95, 0xce, 0x2e, 0xd8, 0xbb, 0x77, 0x1f, 0x3a, 0x74, 0xe8, 0x00, 0xa9, 0x54, 0x82, 0xf2, 0xf2, //* .....w.:t...T... */ 
+    /* 0x00000970 */ 0x32, 0x14, 0x14, 0x14, 0x88, 0x65, 0x4a, 0x24, 0x12, 0x28, 0x8a, 0x8a, 0x10, 0xfb, 0xe0, 0x01, //* 2....eJ$.(...... */ 
+    /* 0x00000980 */ 0x00, 0x24, 0x8a, 0x09, 0x6f, 0x11, 0xff, 0xa4, 0x40, 0x3a, 0x01, 0x68, 0xd3, 0xb4, 0x69, 0xd3, //* .$..o...@:.h..i. */ 
+    /* 0x00000990 */ 0x3a, 0x5a, 0x35, 0x57, 0xd4, 0x8e, 0x00, 0x80, 0x82, 0x00, 0x45, 0x61, 0xa1, 0xf8, 0x5d, 0xa9, //* :Z5W......Ea..]. */ 
+    /* 0x000009a0 */ 0x54, 0x02, 0x00, 0xf4, 0xf5, 0xf5, 0xe1, 0xee, 0xee, 0x8e, 0xa5, 0xcb, 0x96, 0x22, 0x5b, 0x26, //* T............"[& */ 
+    /* 0x000009b0 */ 0xc3, 0xc9, 0x93, 0x27, 0xf1, 0xc5, 0x17, 0x5f, 0x60, 0xfe, 0xbc, 0xf9, 0xf8, 0x75, 0xcb, 0x16, //* ...'..._`....u.. */ 
+    /* 0x000009c0 */ 0xd8, 0xd8, 0x34, 0x05, 0x49, 0x48, 0x24, 0x7a, 0xb8, 0x7c, 0xf9, 0x0a, 0x32, 0x33, 0x33, 0x21, //* ..4.IH$z.|..233! */ 
+    /* 0x000009d0 */ 0x91, 0x48, 0xc4, 0x72, 0xd2, 0xd3, 0xd3, 0x11, 0x11, 0x11, 0x01, 0x00, 0x77, 0xc5, 0x93, 0x6f, //* .H.r........w..o */ 
+    /* 0x000009e0 */ 0x11, 0xff, 0x94, 0x40, 0x36, 0x03, 0x88, 0x01, 0x70, 0x27, 0x35, 0x35, 0x35, 0xa9, 0xb4, 0xb4, //* ...@6...p'555... */ 
+    /* 0x000009f0 */ 0x74, 0x26, 0xb4, 0x73, 0x8a, 0x0a, 0x04, 0x41, 0x10, 0x85, 0x50, 0x58, 0x58, 0x88, 0x90, 0x90, //* t&.s...A..PXX... */ 
+    /* 0x00000a00 */ 0x10, 0x40, 0xab, 0xea, 0x02, 0xc0, 0x9d, 0xdb, 0x77, 0xa0, 0x50, 0x28, 0xb0, 0xce, 0x7d, 0x1d, //* .@......w.P(..}. */ 
+    /* 0x00000a10 */ 0x2e, 0x5f, 0xba, 0x8c, 0x0f, 0x3f, 0xec, 0x82, 0x2e, 0x5d, 0xba, 0x00, 0xda, 0x96, 0x70, 0xe5, //* ._...?...]....p. */ 
+    /* 0x00000a20 */ 0xca, 0x15, 0x28, 0x14, 0x0a, 0x34, 0x6f, 0xde, 0x1c, 0x24, 0xc5, 0x72, 0x6f, 0xde, 0xbc, 0x09, //* ..(..4o..$.ro... */ 
+    /* 0x00000a30 */ 0x00, 0xa5, 0x66, 0x66, 0x66, 0xc1, 0xe2, 0xc9, 0xb7, 0x88, 0x7f, 0x42, 0x20, 0xdd, 0x01, 0x2c, //* ..fff......B .., */ 
+    /* 0x00000a40 */ 0x38, 0x1b, 0x70, 0x0e, 0x4f, 0x12, 0x9f, 0x1a, 0xf9, 0xf8, 0xf8, 0x58, 0x7e, 0xfc, 0x71, 0x5f, //* 8.p.O......X~.q_ */ 
+    /* 0x00000a50 */ 0x00, 0xc0, 0xc9, 0x53, 0xa7, 0xc4, 0x2e, 0xa6, 0xac, 0xac, 0x0c, 0x2a, 0x95, 0x0a, 0x00, 0x70, //* ...S.......*...p */ 
+    /* 0x00000a60 */ 0xed, 0xda, 0x35, 0x9c, 0x3a, 0x75, 0x0a, 0x80, 0x66, 0x9e, 0x01, 0x00, 0x46, 0x46, 0x86, 0x30, //* ..5.:u..f...FF.0 */ 
+    /* 0x00000a70 */ 0x32, 0x32, 0x12, 0x0b, 0xfd, 0xe4, 0x13, 0x7b, 0x58, 0x58, 0x98, 0x03, 0x00, 0xee, 0xde, 0xbd, //* 22.....{XX...... */ 
+    /* 0x00000a80 */ 0x87, 0xa8, 0xa8, 0x68, 0x7c, 0xf6, 0xd9, 0x67, 0x62, 0xeb, 0x90, 0x4a, 0xa5, 0x90, 0xc9, 0x64, //* ...h|..gb..J...d */ 
+    /* 0x00000a90 */ 0xd8, 0xbb, 0x77, 0x2f, 0x00, 0xa4, 0x14, 0x14, 0x14, 0x24, 0x00, 0x40, 0xe3, 0xc6, 0x8d, 0xeb, //* ..w/.....$.@.... */ 
+    /* 0x00000aa0 */ 0x00, 0x68, 0x0b, 0x60, 0x14, 0x80, 0x29, 0xa6, 0xa6, 0xa6, 0xef, 0x8b, 0x85, 0xfe, 0x8f, 0xe0, //* .h.`..)......... */ 
+    /* 0x00000ab0 */ 0xbe, 0x60, 0xc1, 0x02, 0x96, 0xab, 0x54, 0xe2, 0xa0, 0x9b, 0x95, 0x25, 0xe3, 0x86, 0xf5, 0xbf, //* .`....T....%.... */ 
+    /* 0x00000ac0 */ 0x10, 0x00, 0xf7, 0xed, 0xdb, 0x27, 0x0e, 0xd0, 0x4f, 0x9e, 0x3c, 0x61, 0x6c, 0x6c, 0x6c, 0x15, //* .....'..O.<alll. */ 
+    /* 0x00000ad0 */ 0x35, 0x56, 0x22, 0x91, 0x10, 0x00, 0xed, 0xed, 0xed, 0x19, 0x1a, 0x1a, 0xc2, 0xc6, 0x8d, 0x1b, //* 5V"............. */ 
+    /* 0x00000ae0 */ 0x13, 0x00, 0x37, 0x6c, 0xd8, 0x40, 0x92, 0xcc, 0xcc, 0xcc, 0xe4, 0xe2, 0xc5, 0x4b, 0x98, 0x95, //* ..7l.@.......K.. */ 
+    /* 0x00000af0 */ 0x95, 0x25, 0x0e, 0xe8, 0x15, 0xeb, 0x5c, 0x07, 0x0e, 0x1c, 0x20, 0x00, 0xea, 0xeb, 0xeb, 0x97, //* .%....\... ..... */ 
+    /* 0x00000b00 */ 0x19, 0x18, 0x18, 0x1c, 0xd7, 0xd3, 0xd3, 0x3b, 0x09, 0xe0, 0x19, 0x80, 0xb2, 0xce, 0x9d, 0x3b, //* .......;.......; */ 
+    /* 0x00000b10 */ 0xb3, 0x59, 0xb3, 0x66, 0x04, 0x90, 0xd1, 0xb8, 0x71, 0xe3, 0xf7, 0x74, 0x6f, 0xfa, 0x5d, 0xe6, //* .Y.f....q..to.]. */ 
+    /* 0x00000b20 */ 0xe4, 0xbe, 0x7d, 0xfb, 0xfe, 0x52, 0x59, 0x65, 0x65, 0x65, 0xdc, 0xb6, 0x75, 0x1b, 0x01, 0x70, //* ..}..RYeee..u..p */ 
+    /* 0x00000b30 */ 0xe3, 0xa6, 0x4d, 0x74, 0x71, 0x71, 0xe1, 0x8e, 0x1d, 0x3b, 0x38, 0xe3, 0xeb, 0x19, 0xf4, 0x39, //* ..Mtqq...;8....9 */ 
+    /* 0x00000b40 */ 0xe6, 0xc3, 0xe9, 0x33, 0x66, 0x54, 0x11, 0xcc, 0xc0, 0x81, 0x03, 0x78, 0xef, 0xde, 0x3d, 0x7e, //* ...3fT.....x..=~ */ 
+    /* 0x00000b50 */ 0xf4, 0xd1, 0x47, 0x04, 0x40, 0x37, 0x37, 0x37, 0x4d, 0x19, 0xdb, 0xb6, 0x31, 0x2e, 0x2e, 0x8e, //* ..G.@777M...1... */ 
+    /* 0x00000b60 */ 0x24, 0xa9, 0x52, 0x69, 0xe6, 0x26, 0x24, 0x19, 0x5d, 0x49, 0x75, 0x96, 0x4a, 0xa5, 0xe2, 0x67, //* $.Ri.&$.]Iu.J..g */ 
+    /* 0x00000b70 */ 0x37, 0x37, 0x37, 0xc6, 0xc6, 0xc6, 0x52, 0x26, 0x93, 0x31, 0x31, 0x31, 0x91, 0xc3, 0x86, 0x0d, //* 777...R&.111.... */ 
+    /* 0x00000b80 */ 0x23, 0x80, 0xd5, 0xba, 0x37, 0xfd, 0x2e, 0x13, 0x7e, 0x48, 0x3b, 0x77, 0x50, 0xab, 0xd5, 0xcc, //* #...7...~H;wP... */ 
+    /* 0x00000b90 */ 0xcd, 0xcd, 0xa3, 0xb2, 0xac, 0x8c, 0x24, 0x99, 0x9f, 0x9f, 0xcf, 0x09, 0x13, 0x26, 0x88, 0x95, //* ......$......&.. */ 
+    /* 0x00000ba0 */ 0xb5, 0x74, 0xd9, 0x32, 0x66, 0x64, 0x66, 0xf2, 0xd9, 0xf3, 0x67, 0x0c, 0xbb, 0x76, 0x8d, 0x11, //* .t.2fdf...g..v.. */ 
+    /* 0x00000bb0 */ 0x37, 0x22, 0x38, 0xe7, 0xbb, 0xef, 0x08, 0x80, 0x8e, 0x8e, 0x8e, 0x7c, 0xfa, 0xf4, 0x09, 0x47, //* 7"8........|...G */ 
+    /* 0x00000bc0 */ 0x8d, 0x1a, 0x45, 0x00, 0x1c, 0x3c, 0x78, 0x30, 0x8f, 0x1d, 0x3b, 0xc6, 0x3b, 0x77, 0x62, 0x48, //* ..E..<x0..;.;wbH */ 
+    /* 0x00000bd0 */ 0x92, 0x5a, 0x39, 0xb3, 0xa4, 0xa4, 0x98, 0x97, 0x2e, 0x5d, 0xa2, 0xb5, 0xb5, 0x35, 0x01, 0x50, //* .Z9......]...5.P */ 
+    /* 0x00000be0 */ 0x4f, 0x4f, 0x4f, 0x2c, 0xff, 0xcf, 0x3f, 0xff, 0x64, 0x79, 0xf9, 0x4b, 0xf5, 0x98, 0x24, 0x57, //* OOO,..?.dy.K..$W */ 
+    /* 0x00000bf0 */ 0xae, 0x5c, 0x49, 0x00, 0xd7, 0x75, 0x6f, 0xfa, 0x4d, 0xf1, 0x4f, 0x8c, 0x21, 0x8f, 0xf2, 0xf3, //* .\I..uo.M.O.!... */ 
+    /* 0x00000c00 */ 0xf3, 0x01, 0x6d, 0xbf, 0x9e, 0x93, 0x93, 0x8d, 0xe3, 0xc7, 0x8f, 0x23, 0xbf, 0x20, 0x1f, 0x66, //* ..m........#. .f */ 
+    /* 0x00000c10 */ 0x66, 0x66, 0x98, 0x36, 0x6d, 0x9a, 0x98, 0x71, 0xc4, 0x67, 0x23, 0x40, 0x81, 0x48, 0x7e, 0x9e, //* ff.6m..q.g#@.H~. */ 
+    /* 0x00000c20 */ 0x8c, 0x46, 0x0d, 0x1b, 0xc0, 0xca, 0xca, 0x0a, 0x6b, 0xd6, 0xae, 0xc5, 0xf8, 0x09, 0x5f, 0x20, //* .F......k....._  */ 
+    /* 0x00000c30 */ 0x3f, 0x3f, 0x1f, 0xfa, 0xfa, 0x7a, 0x30, 0x33, 0xd3, 0xa8, 0xca, 0xe6, 0xe6, 0xe6, 0xa8, 0x55, //* ??...z03.......U */ 
+    /* 0x00000c40 */ 0xab, 0x16, 0xea, 0xd6, 0xb5, 0x80, 0x4c, 0x26, 0xc3, 0xb3, 0x67, 0x49, 0x38, 0x73, 0xe6, 0x0c, //* ......L&..gI8s.. */ 
+    /* 0x00000c50 */ 0xe6, 0xcf, 0xff, 0x1e, 0x9f, 0x7e, 0xfa, 0x29, 0xd2, 0xd2, 0xd2, 0xa0, 0xa7, 0xa7, 0x27, 0x2e, //* .....~.)......'. */ 
+    /* 0x00000c60 */ 0x4c, 0xae, 0x5c, 0xb9, 0x12, 0x63, 0xc6, 0x8c, 0x81, 0xbe, 0xbe, 0x3e, 0xf2, 0xf3, 0xf3, 0xa1, //* L.\..c.....>.... */ 
+    /* 0x00000c70 */ 0x50, 0x28, 0x00, 0xa0, 0x62, 0x5c, 0x7a, 0x39, 0x38, 0xbd, 0x8b, 0x98, 0x99, 0x99, 0x59, 0x02, //* P(..b\z98.....Y. */ 
+    /* 0x00000c80 */ 0xb0, 0x07, 0x30, 0x05, 0xc0, 0x03, 0x27, 0x27, 0x27, 0x16, 0x17, 0x17, 0x8b, 0x4f, 0xe5, 0xd3, //* ..0...'''....O.. */ 
+    /* 0x00000c90 */ 0xa7, 0x4f, 0xb9, 0x6d, 0xdb, 0x36, 0xe6, 0xe7, 0xe7, 0x33, 0x23, 0x23, 0x43, 0x7c, 0x9a, 0x63, //* .O.m.6...3##C|.c */ 
+    /* 0x00000ca0 */ 0x1f, 0xc4, 0xf2, 0x6a, 0x70, 0x30, 0xef, 0xdd, 0x8b, 0x61, 0x4a, 0xf2, 0x33, 0xde, 0xbe, 0x73, //* ...jp0...aJ.3..s */ 
+    /* 0x00000cb0 */ 0x87, 0x24, 0x19, 0x13, 0x13, 0xc3, 0x2e, 0x5d, 0x3e, 0xe4, 0xb3, 0xe7, 0x49, 0x1c, 0xff, 0xc5, //* .$.....]>...I... */ 
+    /* 0x00000cc0 */ 0x78, 0xce, 0x9b, 0x37, 0x97, 0x77, 0xee, 0xdc, 0xe6, 0x0c, 0x6d, 0xb7, 0xd6, 0xa9, 0x53, 0x27, //* x..7.w....m...S' */ 
+    /* 0x00000cd0 */ 0xb1, 0x15, 0xfc, 0xab, 0x23, 0x2a, 0x2a, 0x8a, 0xd4, 0x76, 0x95, 0x67, 0xcf, 0x9e, 0x65, 0x51, //* ....#**..v.g..eQ */ 
+    /* 0x00000ce0 */ 0x51, 0x11, 0x55, 0x2a, 0x15, 0x97, 0x2c, 0x59, 0x42, 0xed, 0x3e, 0xfd, 0x3f, 0xc2, 0x6b, 0x6f, //* Q.U*..,YB.>.?.ko */ 
+    /* 0x00000cf0 */ 0x21, 0x96, 0x96, 0x96, 0x0e, 0x05, 0x05, 0x05, 0x0f, 0x20, 0x91, 0x06, 0xd7, 0xa9, 0x63, 0xea, //* !........ ....c. */ 
+    /* 0x00000d00 */ 0x05, 0xa0, 0xad, 0x97, 0x97, 0x17, 0x2e, 0x5d, 0xba, 0x04, 0x40, 0xa3, 0x35, 0xd9, 0xd9, 0xd9, //* .......]..@.5... */ 
+    /* 0x00000d10 */ 0xc1, 0xd1, 0xd1, 0xb1, 0x42, 0x03, 0x42, 0xe7, 0xce, 0x9d, 0x01, 0x00, 0xb2, 0xac, 0x2c, 0x64, //* ....B.B.......,d */ 
+    /* 0x00000d20 */ 0xa4, 0xa7, 0xc3, 0xca, 0xca, 0x0a, 0x05, 0x85, 0x85, 0x78, 0xfc, 0xe8, 0x31, 0x00, 0xa0, 0x75, //* .........x..1..u */ 
+    /* 0x00000d30 */ 0x9b, 0xd6, 0xf8, 0xd4, 0xe1, 0x53, 0x28, 0x95, 0x65, 0xe8, 0xd3, 0xbb, 0x17, 0xe6, 0xcc, 0x9d, //* .....S(.e....... */ 
+    /* 0x00000d40 */ 0x03, 0x6f, 0xef, 0x43, 0xf0, 0xf4, 0xf4, 0x04, 0x00, 0xdc, 0xbd, 0xab, 0x99, 0x62, 0x48, 0xa5, //* .o.C.........bH. */ 
+    /* 0x00000d50 */ 0x2f, 0xe7, 0x1f, 0x95, 0xe9, 0xde, 0xbd, 0x3b, 0x6c, 0x9b, 0x35, 0x03, 0x00, 0xdc, 0x8c, 0xbc, //* /......;l.5..... */ 
+    /* 0x00000d60 */ 0x09, 0x0b, 0x0b, 0x0b, 0xd4, 0xaa, 0x55, 0x0b, 0x05, 0x05, 0x05, 0x88, 0x8a, 0x8a, 0x02, 0x80, //* ......U......... */ 
+    /* 0x00000d70 */ 0x97, 0xeb, 0xfb, 0x6f, 0x98, 0xd7, 0x2e, 0x90, 0xec, 0xec, 0xec, 0x15, 0x2b, 0x56, 0xac, 0x68, //* ...o........+V.h */ 
+    /* 0x00000d80 */ 0x90, 0x9c, 0xfc, 0x1c, 0xf1, 0xf1, 0x71, 0xb8, 0x73, 0xe7, 0x0e, 0x3c, 0x3d, 0x3d, 0xb1, 0x74, //* ......q.s..<==.t */ 
+    /* 0x00000d90 */ 0xe9, 0x52, 0xf8, 0xf8, 0xf8, 0xa0, 0xa4, 0xa4, 0x04, 0x00, 0xd0, 0xba, 0x75, 0x6b, 0x7c, 0xf2, //* .R..........uk|. */ 
+    /* 0x00000da0 */ 0xc9, 0x27, 0xf0, 0xf6, 0xf6, 0x46, 0x66, 0x66, 0x26, 0x00, 0xe0, 0xc2, 0x85, 0x8b, 0x48, 0x49, //* .'...Fff&.....HI */ 
+    /* 0x00000db0 */ 0x49, 0x01, 0x09, 0xdc, 0xb8, 0x11, 0x89, 0x47, 0x8f, 0x13, 0x10, 0x19, 0x15, 0x09, 0x23, 0x43, //* I......G......#C */ 
+    /* 0x00000dc0 */ 0x23, 0xb4, 0x6d, 0xd3, 0x06, 0x86, 0x06, 0x86, 0x98, 0x31, 0xe3, 0x6b, 0x04, 0x5f, 0x0d, 0xc6, //* #.m......1.k._.. */ 
+    /* 0x00000dd0 */ 0x96, 0x2d, 0x5b, 0xa0, 0xa7, 0xa7, 0x27, 0xfe, 0xae, 0x54, 0x2a, 0x85, 0x20, 0x10, 0x00, 0xb0, //* .-[...'..T*. ... */ 
+    /* 0x00000de0 */ 0x68, 0xd1, 0x22, 0x5c, 0xb9, 0x72, 0x05, 0xde, 0xde, 0xde, 0x00, 0x80, 0x66, 0xcd, 0x9a, 0xa1, //* h."\.r......f... */ 
+    /* 0x00000df0 */ 0x76, 0xed, 0xda, 0x28, 0x2a, 0x2a, 0x42, 0x74, 0xf4, 0x2d, 0xf1, 0x01, 0xb8, 0x77, 0xef, 0x1e, //* v..(**Bt.-...w.. */ 
+    /* 0x00000e00 */ 0xae, 0x5e, 0xbd, 0x0a, 0xa9, 0x54, 0xda, 0x44, 0x22, 0x91, 0x8c, 0x06, 0x30, 0xc8, 0xd4, 0xd4, //* .^...T.D"...0... */ 
+    /* 0x00000e10 */ 0xf4, 0x9d, 0x5b, 0xaa, 0xbf, 0x75, 0xe1, 0xc2, 0x05, 0xb1, 0x7b, 0xaa, 0x20, 0x35, 0x35, 0x95, //* ..[..u....{. 55. */ 
+    /* 0x00000e20 */ 0x3f, 0xfe, 0xf8, 0x23, 0x27, 0x4e, 0x9c, 0xc8, 0xf3, 0xe7, 0xcf, 0x33, 0x21, 0x21, 0x81, 0x89, //* ?..#'N.....3!!.. */ 
+    /* 0x00000e30 */ 0x89, 0x4f, 0xb8, 0x70, 0xe1, 0x82, 0x0a, 0xf5, 0x93, 0x00, 0xd8, 0xa5, 0x4b, 0x17, 0xce, 0x9e, //* .O.p........K... */ 
+    /* 0x00000e40 */ 0x3d, 0x9b, 0x41, 0x41, 0x81, 0x2c, 0x2e, 0x29, 0xa6, 0x9b, 0xdb, 0x1a, 0x66, 0x66, 0x65, 0xf2, //* =.AA.,.)....ffe. */ 
+    /* 0x00000e50 */ 0xc0, 0xc1, 0x83, 0x94, 0xc9, 0x64, 0x7c, 0xf6, 0xec, 0x59, 0x95, 0xae, 0x48, 0x2a, 0x95, 0x8a, //* .....d|..Y..H*.. */ 
+    /* 0x00000e60 */ 0xaa, 0x31, 0x00, 0x9e, 0x3f, 0x7f, 0x9e, 0xe5, 0xe5, 0xe5, 0x94, 0x65, 0xc9, 0x98, 0x93, 0x93, //* .1..?......e.... */ 
+    /* 0x00000e70 */ 0xc3, 0x01, 0x03, 0x06, 0xd0, 0xd1, 0xd1, 0x91, 0x45, 0xc5, 0x45, 0x0c, 0x0b, 0x0b, 0x63, 0xd8, //* ........E.E...c. */ 
+    /* 0x00000e80 */ 0x35, 0xcd, 0x62, 0x65, 0x41, 0x41, 0x01, 0xbf, 0xfc, 0xf2, 0xcb, 0xbf, 0x74, 0x6d, 0x00, 0x4a, //* 5.beAA......tm.J */ 
+    /* 0x00000e90 */ 0xcc, 0xcc, 0xcc, 0x0e, 0x58, 0x5b, 0x5b, 0x57, 0xbb, 0xdd, 0xc7, 0x7f, 0x45, 0xd4, 0xb9, 0x73, //* ....X[[W....E..s */ 
+    /* 0x00000ea0 */ 0x01, 0xa4, 0xd6, 0x32, 0x24, 0x25, 0x25, 0x95, 0x2a, 0xed, 0xf6, 0x6b, 0x61, 0x61, 0x21, 0x67, //* ...2$%%.*..kaa!g */ 
+    /* 0x00000eb0 */ 0x7d, 0x33, 0x4b, 0xb7, 0x02, 0xf8, 0xfd, 0xf7, 0xdf, 0xd3, 0xde, 0xfe, 0x13, 0x02, 0xa0, 0xb9, //* }3K............. */ 
+    /* 0x00000ec0 */ 0x85, 0x39, 0x67, 0xce, 0xfa, 0x86, 0x4f, 0x13, 0x93, 0x98, 0x97, 0x5f, 0xc0, 0xa4, 0xa4, 0x24, //* .9g...O...._...$ */ 
+    /* 0x00000ed0 */ 0xba, 0xaf, 0x5b, 0xc7, 0xa5, 0xcb, 0x96, 0x51, 0xa1, 0x50, 0x88, 0x73, 0x0b, 0xa9, 0x44, 0x42, //* ..[....Q.P.s..DB */ 
+    /* 0x00000ee0 */ 0x43, 0x43, 0xc3, 0x7b, 0xf5, 0xea, 0xd5, 0xb3, 0xd7, 0xd7, 0xd7, 0x8f, 0x03, 0xc0, 0x53, 0xa7, //* CC.{..........S. */ 
+    /* 0x00000ef0 */ 0xfc, 0x48, 0x92, 0xb9, 0xb9, 0xb9, 0xf4, 0x3f, 0xe3, 0x4f, 0x95, 0x4a, 0xc5, 0xe5, 0xcb, 0x97, //* .H.....?.O.J.... */ 
+    /* 0x00000f00 */ 0x13, 0x00, 0x6f, 0xdf, 0xb9, 0xc3, 0xfd, 0x07, 0xf6, 0x53, 0xa9, 0x54, 0xb2, 0xa4, 0xa4, 0x84, //* ..o......S.T.... */ 
+    /* 0x00000f10 */ 0x9b, 0x37, 0x6f, 0x26, 0x00, 0xf6, 0xee, 0xd3, 0x9b, 0x5e, 0x5e, 0xde, 0xbc, 0x7d, 0xfb, 0x36, //* .7o&.....^^..}.6 */ 
+    /* 0x00000f20 */ 0xef, 0xdf, 0xbf, 0x4f, 0x17, 0x97, 0x55, 0x04, 0x40, 0x63, 0x63, 0x63, 0x4d, 0x33, 0x7a, 0xcd, //* ...O..U.@cccM3z. */ 
+    /* 0x00000f30 */ 0xbc, 0xf6, 0x2e, 0x0b, 0x40, 0xdc, 0xa3, 0x47, 0x8f, 0x00, 0xed, 0xf6, 0x6a, 0x6a, 0x6a, 0x0a, //* ....@..G....jjj. */ 
+    /* 0x00000f40 */ 0x0e, 0x79, 0x7b, 0xe3, 0xe9, 0xd3, 0xa7, 0xa8, 0x53, 0xa7, 0x0e, 0x7e, 0xf8, 0xfe, 0x07, 0xdd, //* .y{.....S..~.... */ 
+    /* 0x00000f50 */ 0xfc, 0xb8, 0x7b, 0x37, 0x06, 0x5f, 0x7c, 0xf1, 0x05, 0x00, 0x60, 0xf4, 0xa8, 0xd1, 0xe8, 0xf5, //* ..{7._|...`..... */ 
+    /* 0x00000f60 */ 0x51, 0x4f, 0x34, 0x69, 0xdc, 0x04, 0xf7, 0xee, 0xc6, 0xe0, 0x62, 0x60, 0x20, 0x76, 0xed, 0xdc, //* QO4i......b` v.. */ 
+    /* 0x00000f70 */ 0x89, 0xd2, 0xd2, 0x52, 0x08, 0x82, 0x20, 0x2e, 0xa9, 0x48, 0xa4, 0xd2, 0x2c, 0x23, 0x23, 0xa3, //* ...R.. ..H..,##. */ 
+    /* 0x00000f80 */ 0xe1, 0x72, 0xb9, 0x3c, 0x44, 0xa5, 0x52, 0xe9, 0x0d, 0x19, 0x32, 0x04, 0xfd, 0xfa, 0xf5, 0x03, //* .r.<D.R...2..... */ 
+    /* 0x00000f90 */ 0x00, 0x44, 0x46, 0x46, 0xa2, 0x51, 0xa3, 0x46, 0xd0, 0xd3, 0xd3, 0x13, 0x67, 0xf7, 0x3f, 0xfe, //* .DFF.Q.F....g.?. */ 
+    /* 0x00000fa0 */ 0xf0, 0x03, 0x0c, 0xf4, 0x0d, 0xf1, 0xf4, 0xe9, 0x53, 0xac, 0x58, 0xb1, 0x02, 0x0b, 0x17, 0x2e, //* ........S.X..... */ 
+    /* 0x00000fb0 */ 0xc4, 0xe2, 0x25, 0x4b, 0x70, 0xe4, 0xc8, 0x11, 0xf4, 0xeb, 0xd7, 0x0f, 0xc6, 0xc6, 0xc6, 0x68, //* ..%Kp..........h */ 
+    /* 0x00000fc0 */ 0xdf, 0xbe, 0x3d, 0x1a, 0x35, 0x6a, 0x08, 0x00, 0x25, 0xfa, 0xfa, 0xfa, 0x2f, 0x57, 0x29, 0xab, //* ..=.5j..%.../W). */ 
+    /* 0x00000fd0 */ 0x39, 0x63, 0xdb, 0xb7, 0xef, 0xc8, 0xd4, 0xd4, 0xd4, 0x2a, 0xdd, 0x95, 0x87, 0x87, 0x07, 0x8f, //* 9c.......*...... */ 
+    /* 0x00000fe0 */ 0x1e, 0x3d, 0xca, 0xf4, 0xf4, 0x74, 0x7e, 0xad, 0x59, 0x0e, 0xa7, 0x44, 0x22, 0x11, 0x27, 0x6d, //* .=...t~.Y..D".'m */ 
+    /* 0x00000ff0 */ 0x1b, 0x37, 0x6e, 0xa4, 0xb3, 0xb3, 0x33, 0x97, 0x2d, 0xfb, 0x99, 0x87, 0x0f, 0x1f, 0xa2, 0x4a, //* .7n...3.-......J */ 
+    /* 0x00001000 */ 0xa5, 0xa2, 0x5a, 0xad, 0x66, 0x56, 0x56, 0x16, 0x0f, 0x1c, 0x38, 0xc0, 0x8d, 0x9b, 0x36, 0x31, //* ..Z.fVV...8...61 */ 
+    /* 0x00001010 */ 0x23, 0x23, 0x83, 0xb6, 0xb6, 0xb6, 0x15, 0x4f, 0xf0, 0x6c, 0x00, 0xa8, 0x5d, 0xbb, 0xb6, 0x09, //* ##.....O.l..]... */ 
+    /* 0x00001020 */ 0x80, 0x44, 0x57, 0x57, 0x57, 0x0a, 0x24, 0x15, 0xc5, 0x45, 0x74, 0x75, 0x5d, 0xc3, 0xfc, 0xc2, //* .DWWW.$..Etu]... */ 
+    /* 0x00001030 */ 0x42, 0x16, 0x14, 0x14, 0x70, 0xe4, 0xc8, 0x91, 0x62, 0x4b, 0x6c, 0xdf, 0xbe, 0x43, 0x95, 0x96, //* B...p...bKl..C.. */ 
+    /* 0x00001040 */ 0xb9, 0x6f, 0xff, 0x7e, 0xee, 0x3f, 0x70, 0x80, 0xc7, 0x7c, 0x7c, 0x29, 0x97, 0xe7, 0x32, 0x21, //* .o.~.?p..||)..2! */ 
+    /* 0x00001050 */ 0x21, 0x81, 0x8d, 0x1b, 0x37, 0x21, 0x80, 0x23, 0xba, 0x7f, 0xaa, 0xda, 0xd2, 0xa6, 0x4d, 0x1b, //* !...7!.#......M. */ 
+    /* 0x00001060 */ 0x13, 0x00, 0x0f, 0x97, 0x2f, 0x5f, 0xce, 0xa2, 0xa2, 0x22, 0x51, 0x28, 0x82, 0x20, 0x30, 0x3e, //* ..../_..."Q(. 0> */ 
+    /* 0x00001070 */ 0x3e, 0x9e, 0x3b, 0x76, 0xec, 0xe0, 0xd0, 0xa1, 0x43, 0xab, 0x54, 0x0c, 0x00, 0x1a, 0x19, 0x19, //* >.;v....C.T..... */ 
+    /* 0x00001080 */ 0x31, 0x30, 0xf0, 0x22, 0x43, 0x43, 0x83, 0x39, 0x6c, 0xd8, 0x30, 0x9e, 0x39, 0xe3, 0x4f, 0x85, //* 10."CC.9l.0.9.O. */ 
+    /* 0x00001090 */ 0x42, 0x41, 0x92, 0xbc, 0x78, 0xf1, 0x22, 0x0f, 0x7a, 0x7b, 0xf1, 0xe1, 0xc3, 0x87, 0x15, 0x82, //* BA..x.".z{...... */ 
+    /* 0x000010a0 */ 0xcc, 0xa8, 0x5f, 0xbf, 0xbe, 0x05, 0x00, 0x34, 0x68, 0xd0, 0xc0, 0x10, 0xc0, 0xc3, 0x9f, 0x97, //* .._....4h....... */ 
+    /* 0x000010b0 */ 0x2e, 0x25, 0x49, 0x5e, 0xbf, 0x7e, 0x9d, 0x67, 0xb5, 0x5d, 0xe6, 0x31, 0xdf, 0x63, 0x62, 0xf9, //* .%I^.~.g.].1.cb. */ 
+    /* 0x000010c0 */ 0xce, 0xce, 0xce, 0x1c, 0x38, 0x70, 0xa0, 0xf8, 0x7d, 0xf2, 0x94, 0x29, 0x3c, 0x73, 0xe6, 0x0c, //* ....8p..}..)<s.. */ 
+    /* 0x000010d0 */ 0xd3, 0xd3, 0xd3, 0xb4, 0x0f, 0x4d, 0x5a, 0xc5, 0x56, 0x70, 0x99, 0xa5, 0xa5, 0xe5, 0x1b, 0xe9, //* .....MZ.Vp...... */ 
+    /* 0x000010e0 */ 0xae, 0xde, 0x18, 0x16, 0x16, 0x16, 0xa3, 0x00, 0x70, 0xd5, 0xaa, 0x55, 0x4c, 0x4d, 0x4b, 0x15, //* ........p..ULMK. */ 
+    /* 0x000010f0 */ 0x77, 0x02, 0xd5, 0x82, 0x40, 0x7f, 0x7f, 0x7f, 0x02, 0xa0, 0x87, 0x87, 0x07, 0x83, 0x43, 0x82, //* w...@.........C. */ 
+    /* 0x00001100 */ 0xb9, 0x73, 0xe7, 0x4e, 0x71, 0x1e, 0xb2, 0x6f, 0xff, 0x3e, 0x9e, 0xd6, 0xa6, 0x03, 0xe0, 0xd4, //* .s.Nq..o.>...... */ 
+    /* 0x00001110 */ 0xa9, 0x53, 0xe9, 0xe6, 0xe6, 0xc6, 0x36, 0xad, 0xdb, 0xf0, 0xd2, 0xe5, 0xcb, 0xbc, 0x71, 0xe3, //* .S....6.......q. */ 
+    /* 0x00001120 */ 0x06, 0x01, 0xd0, 0xc0, 0xc0, 0x40, 0x77, 0xde, 0x70, 0xc0, 0xae, 0xb9, 0x1d, 0xc3, 0x23, 0x22, //* .....@w.p.....#" */ 
+    /* 0x00001130 */ 0xe8, 0xe1, 0xe1, 0xc1, 0x17, 0x99, 0x99, 0x3c, 0xed, 0x7f, 0x46, 0x2c, 0xa7, 0x65, 0xcb, 0x96, //* .......<..F,.e.. */ 
+    /* 0x00001140 */ 0xfc, 0xf3, 0xcf, 0x3f, 0x09, 0x80, 0xe3, 0xc7, 0x7f, 0xc1, 0xd6, 0xad, 0xdb, 0x70, 0xeb, 0xb6, //* ...?.........p.. */ 
+    /* 0x00001150 */ 0xed, 0x94, 0xcb, 0x73, 0x29, 0x97, 0xcb, 0x19, 0x1e, 0x1e, 0xce, 0x21, 0xda, 0x6d, 0x63, 0x73, //* ...s)......!.mcs */ 
+    /* 0x00001160 */ 0x73, 0xf3, 0x35, 0x3a, 0x65, 0xbf, 0x56, 0xfe, 0x5e, 0x51, 0x7f, 0x0d, 0x58, 0x58, 0x58, 0x4c, //* s.5:e.V.^Q..XXXL */ 
+    /* 0x00001170 */ 0xca, 0xcb, 0xcb, 0xf3, 0xee, 0xda, 0xb5, 0xab, 0x74, 0xd2, 0xa4, 0x49, 0x30, 0x35, 0x35, 0x45, //* ........t..I055E */ 
+    /* 0x00001180 */ 0xfc, 0xc3, 0x78, 0xfc, 0xba, 0xe5, 0x57, 0x9c, 0x38, 0x71, 0x02, 0x26, 0x26, 0x26, 0x30, 0x32, //* ..x...W.8q.&&&02 */ 
+    /* 0x00001190 */ 0x32, 0x42, 0x9f, 0x3e, 0x7d, 0x90, 0x98, 0x98, 0x88, 0xb6, 0x6d, 0xdb, 0x62, 0xb5, 0xeb, 0x6a, //* 2B.>}.....m.b..j */ 
+    /* 0x000011a0 */ 0xdc, 0xbf, 0x1f, 0x8b, 0xe3, 0xbe, 0xbe, 0xba, 0xc5, 0x21, 0xe6, 0x6e, 0x0c, 0xb2, 0xb2, 0x64, //* .........!.n...d */ 
+    /* 0x000011b0 */ 0x70, 0x74, 0x70, 0x80, 0x91, 0x91, 0x51, 0xb4, 0x52, 0xa9, 0xec, 0x5e, 0x91, 0x56, 0xbf, 0x7e, //* ptp...Q.R..^.V.~ */ 
+    /* 0x000011c0 */ 0xfd, 0x8e, 0x39, 0x39, 0x39, 0x37, 0x00, 0x98, 0x4c, 0x9c, 0x38, 0x11, 0x26, 0x26, 0xc6, 0x08, //* ..9997..L.8.&&.. */ 
+    /* 0x000011d0 */ 0x0b, 0xbb, 0x8e, 0xd6, 0xad, 0x5b, 0xe1, 0xcc, 0x99, 0x33, 0xf8, 0xfe, 0xfb, 0xef, 0x61, 0x67, //* .....[...3....ag */ 
+    /* 0x000011e0 */ 0x67, 0x87, 0xfc, 0xbc, 0x7c, 0x94, 0x94, 0x2a, 0xb1, 0x6e, 0xdd, 0x5a, 0x00, 0x80, 0x9d, 0xdd, //* g...|..*.n.Z.... */ 
+    /* 0x000011f0 */ 0x07, 0x68, 0xd2, 0xa4, 0x11, 0xae, 0x5d, 0xbb, 0x06, 0x00, 0x30, 0x31, 0x31, 0x89, 0xac, 0x5b, //* .h....]...011..[ */ 
+    /* 0x00001200 */ 0xb7, 0xee, 0x27, 0xe9, 0xe9, 0xe9, 0x9a, 0x7d, 0x80, 0x77, 0x0d, 0x0b, 0x0b, 0x8b, 0xa9, 0x15, //* ..'....}.w...... */ 
+    /* 0x00001210 */ 0x4f, 0x69, 0xe5, 0xc3, 0xdb, 0xdb, 0x9b, 0x6a, 0xb5, 0x9a, 0xd7, 0xae, 0x85, 0x71, 0xe3, 0xc6, //* Oi.....j.....q.. */ 
+    /* 0x00001220 */ 0x8d, 0x4c, 0x4d, 0x4b, 0xe5, 0x95, 0x2b, 0x57, 0xb8, 0x65, 0xf3, 0x16, 0x51, 0x85, 0x95, 0x48, //* .LMK..+W.e..Q..H */ 
+    /* 0x00001230 */ 0x24, 0x55, 0xd4, 0xd9, 0x67, 0xcf, 0x9e, 0x89, 0xad, 0xcb, 0xd8, 0xd8, 0x58, 0xb7, 0x85, 0xa0, //* $U..g.......X... */ 
+    /* 0x00001240 */ 0x76, 0xed, 0xda, 0xdf, 0x56, 0xe4, 0x6d, 0xd8, 0xb0, 0x21, 0xcf, 0x9d, 0x3b, 0xc7, 0xb1, 0x63, //* v...V.m..!..;..c */ 
+    /* 0x00001250 */ 0xc7, 0x12, 0x00, 0x8f, 0x1e, 0x3d, 0xca, 0x90, 0xd0, 0x10, 0xfe, 0xfc, 0xf3, 0xcf, 0x04, 0xc0, //* .....=.......... */ 
+    /* 0x00001260 */ 0x89, 0x13, 0x27, 0x71, 0xf3, 0xe6, 0xcd, 0x74, 0x73, 0x73, 0xe3, 0x60, 0x8d, 0x01, 0x04, 0x01, //* ..'q...tss.`.... */ 
+    /* 0x00001270 */ 0xd0, 0xc2, 0xc2, 0x62, 0x81, 0x6e, 0xb9, 0xef, 0x14, 0x96, 0x96, 0x96, 0x4d, 0xf4, 0xf4, 0xa4, //* ...b.n......M... */ 
+    /* 0x00001280 */ 0x0a, 0x5d, 0x81, 0xbc, 0xff, 0xbe, 0x1d, 0xe3, 0xe2, 0x35, 0x2b, 0xb4, 0x32, 0x59, 0x16, 0xf7, //* .].......5+.2Y.. */ 
+    /* 0x00001290 */ 0xed, 0xdb, 0xc7, 0xe8, 0xe8, 0x68, 0x9e, 0x3a, 0x75, 0xaa, 0x8a, 0x30, 0x2a, 0x04, 0xd2, 0xae, //* .....h.:u..0*... */ 
+    /* 0x000012a0 */ 0x5d, 0x3b, 0xca, 0xe5, 0x72, 0x9e, 0x3c, 0x79, 0x92, 0x00, 0x68, 0x62, 0x62, 0xf2, 0x17, 0x81, //* ];..r.<y..hbb... */ 
+    /* 0x000012b0 */ 0x58, 0x37, 0x69, 0x62, 0xa1, 0x75, 0x53, 0x60, 0x68, 0x68, 0x28, 0xf7, 0xec, 0xd9, 0x43, 0x00, //* X7ib.uS`hh(...C. */ 
+    /* 0x000012c0 */ 0x9c, 0x35, 0x6b, 0x16, 0x63, 0x63, 0x63, 0xb9, 0xe4, 0xe7, 0x9f, 0x08, 0x80, 0x17, 0x2f, 0x5e, //* .5k.ccc......./^ */ 
+    /* 0x000012d0 */ 0x14, 0xc7, 0x36, 0x41, 0x10, 0x98, 0x9f, 0x97, 0xc7, 0xe0, 0xe0, 0x60, 0x0e, 0x18, 0x30, 0x80, //* ..6A.......`..0. */ 
+    /* 0x000012e0 */ 0x00, 0x9e, 0x58, 0x5a, 0x5a, 0x36, 0xd2, 0x2d, 0xfb, 0x9d, 0x41, 0x4f, 0x4f, 0xba, 0x0d, 0x00, //* ..XZZ6.-..AOO... */ 
+    /* 0x000012f0 */ 0xe7, 0xcd, 0x9b, 0xcf, 0x73, 0xe7, 0xce, 0x31, 0x24, 0x24, 0x84, 0x3b, 0x77, 0xed, 0xe2, 0x7b, //* ....s..1$$.;w..{ */ 
+    /* 0x00001300 */ 0xef, 0xbf, 0x4f, 0xe3, 0xda, 0xb5, 0x79, 0xe0, 0xc0, 0x3e, 0xde, 0xbd, 0x1b, 0xc3, 0xa8, 0xa8, //* ..O...y..>...... */ 
+    /* 0x00001310 */ 0x48, 0xba, 0xbb, 0xbb, 0xf3, 0xec, 0xd9, 0xb3, 0xa2, 0x40, 0xa4, 0x52, 0xa9, 0x4c, 0x4f, 0x4f, //* H........@.R.LOO */ 
+    /* 0x00001320 */ 0x2f, 0x17, 0x00, 0x47, 0x8c, 0x18, 0xc1, 0x92, 0x92, 0x12, 0x1e, 0x3b, 0xa6, 0x19, 0xa4, 0xff, //* /..G.......;.... */ 
+    /* 0x00001330 */ 0xae, 0x85, 0x00, 0x98, 0x06, 0x80, 0xfe, 0xfe, 0xfe, 0xa2, 0xbd, 0xaf, 0xab, 0xab, 0x2b, 0x83, //* ..............+. */ 
+    /* 0x00001340 */ 0x82, 0x82, 0xc4, 0x96, 0x72, 0x47, 0xbb, 0x36, 0x26, 0x08, 0x64, 0x71, 0x71, 0x31, 0x15, 0x0a, //* ....rG.6&.dqq1.. */ 
+    /* 0x00001350 */ 0x85, 0xb8, 0x1d, 0x70, 0xff, 0xfe, 0xfd, 0x8a, 0x07, 0x66, 0x8a, 0x6e, 0xc1, 0xef, 0x04, 0x86, //* ...p.....f.n.... */ 
+    /* 0x00001360 */ 0x86, 0x86, 0xbd, 0x01, 0xd0, 0xcb, 0xcb, 0x9b, 0x25, 0xa5, 0xa5, 0xac, 0x4c, 0x6a, 0x6a, 0x0a, //* ........%...Ljj. */ 
+    /* 0x00001370 */ 0x7f, 0xfa, 0x49, 0xf3, 0xc4, 0x56, 0x1c, 0x83, 0x07, 0x0f, 0xe2, 0x8d, 0x1b, 0x11, 0x04, 0xa4, //* ..I..V.......... */ 
+    /* 0x00001380 */ 0x04, 0x50, 0x56, 0xbb, 0x76, 0xed, 0x8e, 0xe6, 0xe6, 0xe6, 0x1d, 0x01, 0x14, 0x4f, 0x99, 0x32, //* .PV.v........O.2 */ 
+    /* 0x00001390 */ 0x85, 0x65, 0x65, 0x65, 0xf4, 0xf5, 0xf5, 0x25, 0x00, 0x1a, 0x1a, 0x1a, 0x56, 0x11, 0x48, 0x1d, //* .eee...%....V.H. */ 
+    /* 0x000013a0 */ 0x53, 0xf3, 0x8f, 0x00, 0xe4, 0xee, 0xd9, 0xb3, 0x87, 0x45, 0x25, 0xc5, 0xdc, 0xeb, 0xb9, 0x8f, //* S........E%..... */ 
+    /* 0x000013b0 */ 0xa7, 0x4e, 0xf9, 0xd1, 0xd7, 0xd7, 0x97, 0xad, 0x5a, 0xb5, 0x22, 0x00, 0xba, 0xad, 0x75, 0x67, //* .N......Z."...ug */ 
+    /* 0x000013c0 */ 0x54, 0xf4, 0x6d, 0x1e, 0x3f, 0x7e, 0x82, 0x5e, 0x5e, 0x87, 0x78, 0xfa, 0xf4, 0x19, 0x3e, 0x79, //* T.m.?~.^^.x...>y */ 
+    /* 0x000013d0 */ 0x92, 0x28, 0x2a, 0x1c, 0x29, 0x29, 0x29, 0x15, 0xf7, 0xa2, 0x99, 0x10, 0xbd, 0x83, 0xec, 0x98, //* .(*.)))......... */ 
+    /* 0x000013e0 */ 0x30, 0x61, 0x22, 0x0b, 0xb5, 0xaa, 0x6b, 0xe5, 0xcd, 0x29, 0x92, 0x54, 0x2a, 0xcb, 0xb8, 0x7e, //* 0a"...k..).T*..~ */ 
+    /* 0x000013f0 */ 0xfd, 0x86, 0x2a, 0x42, 0x09, 0x09, 0x09, 0xe1, 0xba, 0x75, 0xeb, 0x08, 0x80, 0xa6, 0xa6, 0xa6, //* ..*B.....u...... */ 
+    /* 0x00001400 */ 0x4b, 0xac, 0xac, 0xac, 0xda, 0x01, 0xc8, 0xfe, 0xf6, 0xdb, 0x6f, 0xa9, 0x56, 0xab, 0x79, 0xfe, //* K.........o.V.y. */ 
+    /* 0x00001410 */ 0xfc, 0x79, 0x42, 0xb3, 0x03, 0x28, 0x0a, 0xa4, 0x71, 0xe3, 0x26, 0x9d, 0x00, 0x64, 0xae, 0x5f, //* .yB..(..q.&..d._ */ 
+    /* 0x00001420 */ 0xbf, 0x81, 0x65, 0xda, 0x7d, 0x16, 0xb9, 0x3c, 0x97, 0x89, 0x89, 0x49, 0x3c, 0x73, 0xe6, 0x2c, //* ..e.}..<...I<s., */ 
+    /* 0x00001430 */ 0x0f, 0x1f, 0xfe, 0x93, 0xf3, 0xe7, 0xcf, 0xa7, 0x9b, 0x9b, 0x1b, 0x03, 0x02, 0x02, 0xf8, 0x20, //* ...............  */ 
+    /* 0x00001440 */ 0x2e, 0x8e, 0xf2, 0xdc, 0x5c, 0x71, 0x07, 0xb3, 0xc2, 0x88, 0x3b, 0x20, 0x20, 0x80, 0x00, 0xb2, //* ....\q....;  ... */ 
+    /* 0x00001450 */ 0x8d, 0x8d, 0x8d, 0x9b, 0x54, 0xfd, 0x1b, 0xef, 0x0e, 0xc1, 0xf3, 0xe6, 0xcd, 0xa7, 0x52, 0x59, //* ....T.........RY */ 
+    /* 0x00001460 */ 0xa6, 0xb1, 0x8f, 0x2a, 0x2b, 0x63, 0xf4, 0xad, 0xdb, 0xbc, 0x74, 0xe9, 0x32, 0x6f, 0xdc, 0xb8, //* ...*+c....t.2o.. */ 
+    /* 0x00001470 */ 0xc9, 0x84, 0x84, 0x47, 0x0c, 0xbb, 0x76, 0x9d, 0x2d, 0x5b, 0xb5, 0xe4, 0xea, 0xd5, 0xab, 0x79, //* ...G..v.-[.....y */ 
+    /* 0x00001480 */ 0xf2, 0xe4, 0x29, 0xc6, 0xc4, 0xdc, 0x61, 0x76, 0xb6, 0xac, 0xf2, 0x6e, 0x61, 0x29, 0x00, 0x61, //* ..)...av...na).a */ 
+    /* 0x00001490 */ 0xc1, 0x82, 0x05, 0x24, 0xc9, 0xc8, 0xc8, 0x48, 0x42, 0xb3, 0x7e, 0xa5, 0x30, 0x35, 0x35, 0x75, //* ...$...HB.~.055u */ 
+    /* 0x000014a0 */ 0xb0, 0xb4, 0xb4, 0xec, 0x07, 0xe0, 0xc5, 0x9c, 0x39, 0x73, 0x59, 0x54, 0x54, 0x4c, 0xb9, 0x5c, //* ........9sYTTL.\ */ 
+    /* 0x000014b0 */ 0xce, 0x5d, 0xbb, 0x76, 0x71, 0xc0, 0x80, 0x81, 0x6c, 0xf6, 0xde, 0x7b, 0xec, 0xd1, 0xa3, 0x07, //* .].vq...l..{.... */ 
+    /* 0x000014c0 */ 0xfb, 0xf6, 0xfd, 0x84, 0x4e, 0x4e, 0x4e, 0xcc, 0xcf, 0xd7, 0x58, 0xd1, 0x0b, 0x24, 0xd5, 0x14, //* ....NNN...X..$.. */ 
+    /* 0x000014d0 */ 0xa8, 0x12, 0x34, 0xb6, 0x5b, 0x24, 0x99, 0x91, 0x91, 0x41, 0x07, 0x07, 0x07, 0x02, 0x78, 0xa3, //* ..4.[$...A....x. */ 
+    /* 0x000014e0 */ 0x2a, 0xef, 0x9b, 0xc6, 0x03, 0x00, 0x63, 0x62, 0xee, 0x89, 0x15, 0x51, 0x5a, 0xaa, 0xe4, 0xc3, //* *.....cb...QZ... */ 
+    /* 0x000014f0 */ 0x87, 0x09, 0x3c, 0x77, 0x2e, 0x80, 0x47, 0x8e, 0x1c, 0xa1, 0xbf, 0xbf, 0x3f, 0xdd, 0xdc, 0xdc, //* ..<w..G.....?... */ 
+    /* 0x00001500 */ 0xb8, 0x64, 0xc9, 0x12, 0xae, 0x5a, 0xb5, 0x8a, 0xee, 0xee, 0xee, 0x0c, 0x0f, 0x0f, 0x67, 0x5e, //* .d...Z........g^ */ 
+    /* 0x00001510 */ 0x5e, 0x2e, 0xb7, 0x6e, 0xdd, 0x2a, 0xb6, 0x9c, 0x85, 0x0b, 0x17, 0x52, 0x10, 0x04, 0x26, 0x24, //* ^..n.*.....R..&$ */ 
+    /* 0x00001520 */ 0x24, 0x88, 0xe7, 0x0c, 0x0c, 0x0c, 0x54, 0x00, 0x54, 0xe3, 0xc6, 0x8d, 0x63, 0x56, 0x56, 0x16, //* $.....T.T...cVV. */ 
+    /* 0x00001530 */ 0xd3, 0xd2, 0xd2, 0x38, 0x46, 0x3b, 0x56, 0x68, 0x05, 0x59, 0xa5, 0xf5, 0x85, 0x87, 0x87, 0x6b, //* ...8F;Vh.Y.....k */ 
+    /* 0x00001540 */ 0xee, 0x43, 0xd0, 0x0c, 0xe6, 0x15, 0xa4, 0xa7, 0xa7, 0x73, 0xfa, 0xf4, 0xe9, 0x04, 0x10, 0xd1, //* .C.......s...... */ 
+    /* 0x00001550 */ 0xb9, 0x73, 0xe7, 0x5a, 0xba, 0x7f, 0xe2, 0x9d, 0xa1, 0x51, 0xa3, 0x46, 0x36, 0x00, 0x1e, 0xf4, //* .s.Z.....Q.F6... */ 
+    /* 0x00001560 */ 0xee, 0xdd, 0x87, 0xf1, 0x0f, 0x1f, 0x8a, 0x15, 0x50, 0x19, 0x41, 0x10, 0xc4, 0xc5, 0x3f, 0x00, //* ........P.A...?. */ 
+    /* 0x00001570 */ 0x2a, 0x00, 0xb7, 0x01, 0x14, 0x9e, 0x39, 0xe3, 0x4f, 0x95, 0xaa, 0x9c, 0x41, 0x41, 0x41, 0x04, //* *.....9.O...AAA. */ 
+    /* 0x00001580 */ 0xc0, 0xf1, 0xe3, 0xc7, 0x53, 0xa9, 0x54, 0x52, 0x26, 0x93, 0xb1, 0x63, 0xc7, 0x8e, 0x62, 0x25, //* ....S.TR&..c..b% */ 
+    /* 0x00001590 */ 0x77, 0xef, 0xde, 0x8d, 0xc9, 0xc9, 0xcf, 0x99, 0x9d, 0x9d, 0x5d, 0x31, 0xcb, 0x8e, 0xb1, 0xb0, //* w.........]1.... */ 
+    /* 0x000015a0 */ 0xb0, 0x18, 0x6f, 0x52, 0xab, 0x56, 0xf3, 0xda, 0xb5, 0x6b, 0x7f, 0x62, 0x60, 0x60, 0x10, 0x59, //* ..oR.V...k.b``.Y */ 
+    /* 0x000015b0 */ 0xb1, 0x34, 0xd3, 0xa9, 0x53, 0x27, 0x5e, 0xb9, 0x72, 0x85, 0x72, 0xb9, 0x9c, 0x0a, 0x85, 0x82, //* .4..S'^.r.r..... */ 
+    /* 0x000015c0 */ 0x2f, 0x5e, 0xbc, 0x60, 0x40, 0xc0, 0x79, 0xda, 0xdb, 0xf7, 0x27, 0x80, 0xe7, 0xcd, 0x9a, 0x35, //* /^.`@.y...'....5 */ 
+    /* 0x000015d0 */ 0x7b, 0xf7, 0xdd, 0xe2, 0x6c, 0x6d, 0x6d, 0x6d, 0x00, 0x44, 0xd8, 0xd8, 0xd8, 0x32, 0xe8, 0x52, //* {...lmmm.D...2.R */ 
+    /* 0x000015e0 */ 0x10, 0x4b, 0x4a, 0x5e, 0x0e, 0xee, 0x4a, 0xa5, 0x92, 0xc7, 0x8f, 0x1f, 0x27, 0x00, 0x4a, 0x24, //* .KJ^..J.....'.J$ */ 
+    /* 0x000015f0 */ 0x7a, 0x8f, 0xea, 0xd4, 0xa9, 0x63, 0xaf, 0xbd, 0xac, 0x07, 0x80, 0x8c, 0xc3, 0x7f, 0x1e, 0xa2, //* z....c.......... */ 
+    /* 0x00001600 */ 0x20, 0xa8, 0x19, 0x17, 0x17, 0xc7, 0x69, 0xd3, 0xa6, 0x32, 0x3d, 0x3d, 0x9d, 0x6a, 0xb5, 0x9a, //*  .....i..2==.j.. */ 
+    /* 0x00001610 */ 0x3f, 0xfc, 0xf0, 0x83, 0x28, 0x90, 0xbb, 0x77, 0xef, 0xb1, 0xb8, 0xb8, 0xb8, 0xc2, 0x76, 0x37, //* ?...(..w......v7 */ 
+    /* 0x00001620 */ 0xb6, 0x65, 0xcb, 0x96, 0x96, 0x95, 0x7f, 0xdf, 0xca, 0xd2, 0xaa, 0x96, 0xa1, 0xa1, 0xe1, 0x41, //* .e.............A */ 
+    /* 0x00001630 */ 0x03, 0x03, 0x03, 0xf1, 0x9a, 0x4f, 0x3e, 0xf9, 0x84, 0x23, 0x47, 0x8e, 0x64, 0x8b, 0x16, 0x2d, //* .....O>..#G.d..- */ 
+    /* 0x00001640 */ 0x2b, 0xce, 0x5d, 0xb0, 0xb5, 0x6d, 0x66, 0x53, 0xf9, 0xba, 0x77, 0x9a, 0xee, 0xdd, 0xbb, 0x1b, //* +.]..mfS..w..... */ 
+    /* 0x00001650 */ 0x03, 0x58, 0x0f, 0xa0, 0x70, 0xe6, 0xcc, 0x6f, 0xe8, 0xeb, 0x7b, 0x9c, 0xa7, 0x4f, 0xfb, 0x73, //* .X..p..o..{..O.s */ 
+    /* 0x00001660 */ 0xc1, 0x82, 0x85, 0x15, 0x15, 0xf2, 0xa0, 0x6e, 0xdd, 0xfa, 0xba, 0x15, 0xd2, 0x17, 0x40, 0xf1, //* .......n......@. */ 
+    /* 0x00001670 */ 0x8e, 0x1d, 0x3b, 0xa8, 0x56, 0xab, 0x29, 0x97, 0xcb, 0x29, 0x97, 0x6b, 0x1c, 0x3e, 0x0f, 0x1e, //* ..;.V.)..).k.>.. */ 
+    /* 0x00001680 */ 0x3c, 0x48, 0x00, 0xbc, 0x75, 0xeb, 0x16, 0x49, 0x72, 0xaf, 0xa7, 0x27, 0x01, 0xa8, 0xeb, 0xd5, //* <H..u..Ir..'.... */ 
+    /* 0x00001690 */ 0xab, 0xf7, 0xb1, 0x4e, 0x19, 0x22, 0xc6, 0xb5, 0x4c, 0xa6, 0x18, 0x18, 0x1a, 0x5c, 0x01, 0x90, //* ...N."..L....\.. */ 
+    /* 0x000016a0 */ 0xa0, 0x9d, 0xab, 0xc4, 0x01, 0xd8, 0x6f, 0x5c, 0xcb, 0x64, 0x58, 0xef, 0xbe, 0xbd, 0xdf, 0xc4, //* ......o\.dX..... */ 
+    /* 0x000016b0 */ 0x0a, 0xf8, 0x5b, 0xc9, 0xfb, 0x00, 0xb6, 0x00, 0xb8, 0x07, 0x20, 0x09, 0x40, 0xac, 0xa1, 0xa1, //* ..[....... .@... */ 
+    /* 0x000016c0 */ 0xe1, 0xd6, 0xfa, 0x56, 0xf5, 0xff, 0x95, 0x56, 0x33, 0x02, 0x00, 0x7f, 0xff, 0xfd, 0x77, 0xaa, //* ...V...V3.....w. */ 
+    /* 0x000016d0 */ 0xd5, 0x2a, 0xd1, 0x61, 0xe1, 0xc5, 0x8b, 0x17, 0x7c, 0x9e, 0x9c, 0x4c, 0x92, 0x0c, 0x8f, 0x88, //* .*.a....|..L.... */ 
+    /* 0x000016e0 */ 0xa8, 0x10, 0xea, 0x0e, 0xdd, 0x8b, 0xff, 0x8e, 0x86, 0x0d, 0x1a, 0x1a, 0x5b, 0x59, 0x59, 0x59, //* ............[YYY */ 
+    /* 0x000016f0 */ 0xbd, 0x67, 0xdb, 0xac, 0x26, 0xe8, 0x40, 0x05, 0xef, 0x35, 0x7f, 0x5f, 0xcf, 0xa4, 0x96, 0x49, //* .g..&.@..5._...I */ 
+    /* 0x00001700 */ 0x2d, 0x5b, 0x5b, 0x5b, 0x03, 0xdd, 0x34, 0x5d, 0x24, 0x12, 0xc9, 0x02, 0x00, 0x3c, 0x75, 0xea, //* -[[[..4]$....<u. */ 
+    /* 0x00001710 */ 0x24, 0xa9, 0xd5, 0x86, 0x94, 0x4a, 0x25, 0x49, 0xf2, 0x69, 0xe2, 0x53, 0x76, 0xe8, 0xd0, 0x81, //* $....J%I.i.Sv... */ 
+    /* 0x00001720 */ 0x00, 0xd2, 0x1a, 0x35, 0x6a, 0xd4, 0x58, 0xf7, 0xda, 0x1a, 0x5e, 0x1f, 0x67, 0x01, 0x30, 0x31, //* ...5j.X...^.g.01 */ 
+    /* 0x00001730 */ 0x31, 0x51, 0xdc, 0x23, 0x51, 0x28, 0x14, 0xfc, 0xe6, 0x9b, 0x6f, 0x08, 0xcd, 0x7c, 0xe5, 0x6b, //* 1Q.#Q(....o..|.k */ 
+    /* 0x00001740 */ 0xdd, 0x0b, 0x6a, 0x78, 0x8d, 0xd4, 0xad, 0x5b, 0xb7, 0x0f, 0x00, 0x1e, 0x3b, 0xee, 0xab, 0x55, //* ..jx...[....;..U */ 
+    /* 0x00001750 */ 0x07, 0xc4, 0x49, 0x1c, 0x0d, 0x0c, 0x0c, 0x9e, 0x5a, 0x5a, 0x5a, 0x56, 0x6b, 0x55, 0xb5, 0xda, //* ..I.....ZZZVkU.. */ 
+    /* 0x00001760 */ 0x0d, 0x60, 0x4d, 0x9b, 0x36, 0x8d, 0x00, 0x70, 0xe7, 0x5e, 0xcc, 0x3d, 0xd1, 0x42, 0xde, 0xcf, //* .`M.6..p.^.=.B.. */ 
+    /* 0x00001770 */ 0xcf, 0xaf, 0x22, 0xf9, 0x7a, 0x76, 0x76, 0x76, 0x71, 0xd5, 0x2b, 0x6a, 0x78, 0x13, 0xfc, 0x31, //* ..".zvvvq.+jx..1 */ 
+    /* 0x00001780 */ 0x79, 0xf2, 0x14, 0x2a, 0x95, 0x65, 0x4c, 0x4e, 0x4e, 0x16, 0x55, 0x58, 0xa9, 0x54, 0x5a, 0xed, //* y..*.eLNN.UX.TZ. */ 
+    /* 0x00001790 */ 0x97, 0xcb, 0xab, 0x5d, 0x0b, 0xd1, 0x72, 0xa7, 0xb0, 0xb0, 0x10, 0x6a, 0xb5, 0x0a, 0x4a, 0x65, //* ...]..r....j..Je */ 
+    /* 0x000017a0 */ 0xa9, 0x78, 0x52, 0x5f, 0x5f, 0xdf, 0xaa, 0x4a, 0xae, 0x6a, 0x48, 0x75, 0x15, 0x48, 0xb1, 0x20, //* .xR__..J.jHu.H.  */ 
+    /* 0x000017b0 */ 0xa8, 0x41, 0x12, 0x06, 0x86, 0x2f, 0x35, 0x56, 0x92, 0xed, 0xaa, 0xe4, 0xaa, 0x86, 0x54, 0x57, //* .A.../5V......TW */ 
+    /* 0x000017c0 */ 0x81, 0x18, 0x1b, 0x19, 0x19, 0x41, 0x22, 0x95, 0xa0, 0x4e, 0x1d, 0x53, 0x74, 0xee, 0xd4, 0x09, //* .....A"..N.St... */ 
+    /* 0x000017d0 */ 0xd0, 0x08, 0xa4, 0xa3, 0x95, 0x95, 0x55, 0x1d, 0xdd, 0xcc, 0xd5, 0x89, 0xea, 0x2a, 0x90, 0x56, //* ......U......*.V */ 
+    /* 0x000017e0 */ 0x66, 0x66, 0x66, 0x90, 0x6a, 0xed, 0xac, 0xac, 0xad, 0xad, 0x01, 0x8d, 0x40, 0xac, 0x8b, 0x8b, //* fff.j.......@... */ 
+    /* 0x000017f0 */ 0x8b, 0xab, 0xb5, 0xb3, 0x4d, 0x75, 0x15, 0x08, 0xea, 0xd5, 0xab, 0x07, 0x7d, 0x3d, 0x7d, 0x18, //* ....Mu......}=}. */ 
+    /* 0x00001800 */ 0xe8, 0xeb, 0xa3, 0xbe, 0xa5, 0x66, 0xc9, 0x8a, 0xa4, 0xbe, 0x20, 0x08, 0xad, 0x75, 0xf3, 0x56, //* .....f.... ..u.V */ 
+    /* 0x00001810 */ 0x27, 0xaa, 0xab, 0x40, 0x6a, 0x59, 0x5a, 0x5a, 0x42, 0x4f, 0x2a, 0x85, 0x44, 0x22, 0x11, 0xad, //* '..@jYZZBO*.D".. */ 
+    /* 0x00001820 */ 0x11, 0x49, 0x82, 0x64, 0xb5, 0x5e, 0xa5, 0xad, 0xae, 0x02, 0x69, 0xde, 0xa0, 0x41, 0x03, 0x40, //* .I.d.^....i..A.@ */ 
+    /* 0x00001830 */ 0xeb, 0x71, 0x5b, 0xd9, 0xea, 0xbd, 0xac, 0xac, 0x4c, 0x77, 0x61, 0xb2, 0x5a, 0x51, 0x5d, 0x05, //* .q[.....Lwa.ZQ]. */ 
+    /* 0x00001840 */ 0x42, 0x4b, 0x2b, 0xb1, 0x9b, 0x12, 0xfd, 0xdb, 0x25, 0x12, 0x09, 0x04, 0x41, 0x98, 0x0a, 0xe0, //* BK+.....%...A... */ 
+    /* 0x00001850 */ 0xa7, 0xea, 0xea, 0x05, 0x55, 0x1d, 0x05, 0x32, 0x00, 0xc0, 0x87, 0xe6, 0x16, 0x16, 0x00, 0x00, //* ....U..2........ */ 
+    /* 0x00001860 */ 0x95, 0x4a, 0x85, 0x0a, 0x17, 0x39, 0x41, 0x10, 0xe0, 0xe2, 0xe2, 0x5c, 0xe7, 0xf8, 0x71, 0xdf, //* .J...9A....\..q. */ 
+    /* 0x00001870 */ 0xf5, 0xcd, 0x9a, 0x35, 0x8d, 0x04, 0x30, 0x44, 0xe7, 0xda, 0xbf, 0xe3, 0xad, 0x72, 0x33, 0x78, //* ...5..0D.....r3x */ 
+    /* 0x00001880 */ 0x9b, 0x04, 0xd2, 0xa0, 0x53, 0xa7, 0x4e, 0x7f, 0x02, 0x98, 0xa8, 0x9b, 0xa0, 0xc5, 0x0c, 0xc0, //* ....S.N......... */ 
+    /* 0x00001890 */ 0xe6, 0xcf, 0x3f, 0xff, 0x3c, 0xc8, 0xdc, 0xd4, 0xac, 0xa1, 0x85, 0xb9, 0x46, 0x20, 0xe5, 0xe5, //* ..?.<.......F .. */ 
+    /* 0x000018a0 */ 0xe5, 0x90, 0xc9, 0x64, 0x62, 0xa6, 0x82, 0x82, 0x42, 0x0c, 0x1f, 0x3e, 0x1c, 0xa1, 0xa1, 0xd7, //* ...db...B..>.... */ 
+    /* 0x000018b0 */ 0x3a, 0xae, 0x58, 0xb1, 0x32, 0x00, 0xc0, 0x71, 0xed, 0x52, 0xbf, 0x2e, 0x36, 0x63, 0xc7, 0x7d, //* :.X.2..q.R..6c.} */ 
+    /* 0x000018c0 */ 0xee, 0xe3, 0xe0, 0xe0, 0x78, 0x0b, 0x40, 0xb5, 0x9f, 0x50, 0xbe, 0x0e, 0x3a, 0xcf, 0x9e, 0x3d, //* ....x.@..P..:..= */ 
+    /* 0x000018d0 */ 0x9b, 0xbb, 0x77, 0xef, 0xe6, 0x97, 0x5f, 0x7e, 0x79, 0x10, 0x40, 0x65, 0x03, 0xb5, 0x71, 0x1d, //* ..w..._~y.@e..q. */ 
+    /* 0x000018e0 */ 0x3a, 0x74, 0x78, 0x74, 0xee, 0xdc, 0x39, 0xa6, 0xa4, 0xa4, 0xd0, 0xd1, 0xd1, 0x91, 0x8f, 0x1e, //* :txt..9......... */ 
+    /* 0x000018f0 */ 0x3f, 0x22, 0xb5, 0x7e, 0xe9, 0x2d, 0x5a, 0xb4, 0xa8, 0x58, 0x3a, 0x21, 0x00, 0xce, 0x9b, 0x37, //* ?".~.-Z..X:!...7 */ 
+    /* 0x00001900 */ 0x97, 0x49, 0x49, 0x89, 0x54, 0x2a, 0x95, 0xbc, 0x7a, 0xf5, 0x2a, 0x87, 0x0d, 0x1b, 0x9e, 0x07, //* .II.T*..z.*..... */ 
+    /* 0x00001910 */ 0xe0, 0x7b, 0x00, 0x86, 0xd0, 0x18, 0xec, 0x4d, 0x73, 0x73, 0x73, 0xcf, 0xd8, 0xba, 0x75, 0x3b, //* .{.....Msss...u; */ 
+    /* 0x00001920 */ 0x87, 0x0f, 0x1f, 0x7e, 0x15, 0x40, 0xdd, 0x4a, 0xbf, 0x55, 0x43, 0x25, 0x86, 0x7e, 0xfb, 0xcd, //* ...~.@.J.UC%.~.. */ 
+    /* 0x00001930 */ 0x37, 0x09, 0xbb, 0x76, 0xed, 0xe2, 0xfa, 0x0d, 0x1b, 0x32, 0xb5, 0x81, 0x92, 0x4f, 0xae, 0x5f, //* 7..v.....2...O._ */ 
+    /* 0x00001940 */ 0xbf, 0x9e, 0xa9, 0xa9, 0xa9, 0xcc, 0xca, 0x92, 0x71, 0xed, 0xda, 0xb5, 0xd4, 0x37, 0x34, 0x60, //* ........q....74` */ 
+    /* 0x00001950 */ 0xaa, 0xd6, 0x4a, 0x5d, 0xd7, 0x83, 0x6a, 0xc0, 0x80, 0x01, 0xe2, 0xb6, 0xee, 0x5e, 0x4f, 0x4f, //* ..J]..j......^OO */ 
+    /* 0x00001960 */ 0xe6, 0xe7, 0xe7, 0x33, 0x3b, 0x3b, 0x9b, 0x7b, 0x76, 0xef, 0x26, 0x80, 0x07, 0xd6, 0x36, 0xcd, //* ...3;;.{v.&...6. */ 
+    /* 0x00001970 */ 0xc2, 0x7e, 0xfb, 0xed, 0x0f, 0x3a, 0xaf, 0x74, 0x51, 0x6a, 0x85, 0x54, 0xc3, 0xff, 0x81, 0xf5, //* .~...:.tQj.T.... */ 
+    /* 0x00001980 */ 0xd3, 0x67, 0x4c, 0xe7, 0xf8, 0xf1, 0xe3, 0x79, 0xfd, 0xda, 0x75, 0x2a, 0x14, 0x0a, 0x5e, 0xbc, //* .gL....y..u*..^. */ 
+    /* 0x00001990 */ 0x18, 0xc8, 0x6e, 0xdd, 0xba, 0x73, 0xcc, 0x98, 0x31, 0x74, 0x74, 0x74, 0x64, 0x6e, 0x5e, 0x1e, //* ..n..s..1tttdn^. */ 
+    /* 0x000019a0 */ 0x49, 0x56, 0xb1, 0x3c, 0x01, 0xc0, 0x3e, 0x7d, 0xfa, 0xf0, 0xf9, 0xf3, 0x67, 0xbc, 0x15, 0x1d, //* IV.<..>}....g... */ 
+    /* 0x000019b0 */ 0xc5, 0x3e, 0x7d, 0x3e, 0x66, 0x9f, 0x3e, 0x1f, 0x33, 0x22, 0x22, 0x82, 0xe5, 0x65, 0x4a, 0xc6, //* .>}>f.>.3""..eJ. */ 
+    /* 0x000019c0 */ 0xc7, 0xc7, 0x71, 0xf1, 0xe2, 0xc5, 0xb4, 0xb5, 0x7d, 0x9f, 0x00, 0xa6, 0xea, 0xfe, 0x68, 0x0d, //* ..q.....}.....h. */ 
+    /* 0x000019d0 */ 0x7f, 0xcf, 0x60, 0x00, 0xb1, 0x9e, 0x9e, 0x9e, 0x94, 0xe7, 0xca, 0x19, 0xff, 0xf0, 0x21, 0x9d, //* ..`...........!. */ 
+    /* 0x000019e0 */ 0x9c, 0xa6, 0xf2, 0xcb, 0x2f, 0xbf, 0xe4, 0x83, 0xb8, 0x07, 0x0c, 0x0d, 0x09, 0xa1, 0x93, 0x93, //* ..../........... */ 
+    /* 0x000019f0 */ 0x93, 0x68, 0xfd, 0x58, 0x39, 0xf4, 0x46, 0x85, 0xed, 0xef, 0x8c, 0x19, 0xd3, 0x19, 0x7b, 0xff, //* .h.X9.F.......{. */ 
+    /* 0x00001a00 */ 0x3e, 0xb3, 0xb3, 0x65, 0xdc, 0xe7, 0xe9, 0x41, 0x00, 0x74, 0x76, 0x71, 0x66, 0x4a, 0x4a, 0x0a, //* >..e...A.tvqfJJ. */ 
+    /* 0x00001a10 */ 0x4b, 0x8a, 0x8b, 0x18, 0x18, 0x78, 0x81, 0x0e, 0x0e, 0x8e, 0x99, 0xd5, 0x59, 0x1b, 0x7b, 0x13, //* K....x......Y.{. */ 
+    /* 0x00001a20 */ 0x58, 0x02, 0xd8, 0x3e, 0x7f, 0xde, 0x7c, 0xc6, 0x3d, 0x88, 0x63, 0xae, 0x3c, 0x97, 0x7b, 0x3c, //* X..>..|.=.c.<.{< */ 
+    /* 0x00001a30 */ 0x3c, 0xd8, 0xd8, 0xba, 0x31, 0xfd, 0xfd, 0x4f, 0x33, 0x37, 0x37, 0x97, 0xe1, 0xe1, 0xe1, 0xec, //* <...1..O377..... */ 
+    /* 0x00001a40 */ 0xdd, 0xbb, 0x37, 0xb7, 0x6c, 0xd9, 0x22, 0x9a, 0x7c, 0xea, 0x86, 0xf4, 0xd3, 0xd7, 0xd7, 0x17, //* ..7.l.".|....... */ 
+    /* 0x00001a50 */ 0x3f, 0xef, 0xde, 0xbd, 0x8b, 0x99, 0x99, 0xe9, 0x8c, 0x8f, 0x8f, 0xa5, 0x93, 0x93, 0x13, 0x01, //* ?............... */ 
+    /* 0x00001a60 */ 0xf0, 0xf4, 0x69, 0x3f, 0x96, 0x96, 0x16, 0x53, 0x26, 0xcb, 0xe2, 0x8e, 0xed, 0x3b, 0xa8, 0xdd, //* ..i?...S&....;.. */ 
+    /* 0x00001a70 */ 0xd3, 0x1f, 0xac, 0x7b, 0x33, 0xff, 0xeb, 0x7c, 0xdb, 0xa1, 0x43, 0xfb, 0x8c, 0x73, 0x67, 0xcf, //* ...{3..|..C..sg. */ 
+    /* 0x00001a80 */ 0xb2, 0xa8, 0x50, 0xc1, 0xc8, 0x9b, 0x91, 0xec, 0xd1, 0xe3, 0x23, 0x2e, 0x5e, 0xfc, 0x13, 0x93, //* ..P.......#.^... */ 
+    /* 0x00001a90 */ 0x92, 0x9e, 0x31, 0x25, 0x25, 0x55, 0x0c, 0xdd, 0x07, 0x80, 0x41, 0x41, 0x41, 0xe2, 0x6e, 0xa1, //* ..1%%U....AAA.n. */ 
+    /* 0x00001aa0 */ 0xee, 0x18, 0x52, 0x39, 0x74, 0x06, 0x00, 0x0e, 0x1e, 0xec, 0xc8, 0xeb, 0xd7, 0x42, 0x99, 0x93, //* ..R9t........B.. */ 
+    /* 0x00001ab0 */ 0x93, 0xc5, 0x80, 0x80, 0x73, 0xac, 0x5f, 0xb7, 0x1e, 0x27, 0x4e, 0x9a, 0xc8, 0xd8, 0x07, 0xf7, //* ....s._..'N..... */ 
+    /* 0x00001ac0 */ 0x49, 0xad, 0x51, 0xf5, 0xcc, 0x99, 0x5f, 0xab, 0x01, 0xec, 0x02, 0xf0, 0x32, 0x82, 0xda, 0x5f, //* I.Q..._.....2.._ */ 
+    /* 0x00001ad0 */ 0xe9, 0xa6, 0x35, 0xb4, 0xa8, 0xd6, 0xd8, 0xd8, 0xdb, 0xdb, 0x87, 0x77, 0xed, 0xda, 0xd5, 0x05, //* ..5........w.... */ 
+    /* 0x00001ae0 */ 0x80, 0x89, 0x6e, 0x22, 0x80, 0x0f, 0x01, 0xf8, 0x6d, 0xd8, 0xb0, 0x81, 0xc9, 0xcf, 0x9f, 0x33, //* ..n"....m......3 */ 
+    /* 0x00001af0 */ 0x25, 0x25, 0x85, 0xab, 0x57, 0xaf, 0x66, 0x8f, 0x1e, 0x3d, 0x18, 0x12, 0x1a, 0x42, 0x79, 0x5e, //* %%..W.f..=...By^ */ 
+    /* 0x00001b00 */ 0x1e, 0xcf, 0x9c, 0x39, 0xcb, 0x0f, 0x3e, 0xd0, 0x68, 0x51, 0x00, 0x38, 0x6a, 0xd4, 0x28, 0xca, //* ...9..>.hQ.8j.(. */ 
+    /* 0x00001b10 */ 0xe5, 0x72, 0x51, 0x20, 0x05, 0x05, 0x05, 0x55, 0x7c, 0x3a, 0x00, 0x70, 0xe8, 0xd0, 0xa1, 0x95, //* .rQ ...U|:.p.... */ 
+    /* 0x00001b20 */ 0x0d, 0xee, 0x08, 0x80, 0x8b, 0x16, 0x2d, 0xe0, 0x93, 0xc7, 0x09, 0xcc, 0x96, 0xc9, 0xf8, 0xfb, //* ......-......... */ 
+    /* 0x00001b30 */ 0xef, 0xbf, 0x13, 0x00, 0x37, 0x6d, 0xde, 0xc4, 0xec, 0xec, 0x6c, 0x16, 0x17, 0x17, 0xd1, 0xdf, //* ....7m....l..... */ 
+    /* 0x00001b40 */ 0xdf, 0x9f, 0xdd, 0xba, 0x75, 0x7f, 0xfc, 0x37, 0xd6, 0xee, 0x46, 0xf6, 0xfd, 0xfa, 0x2f, 0xd9, //* ....u..7..F.../. */ 
+    /* 0x00001b50 */ 0xb0, 0xe1, 0x17, 0xc1, 0xde, 0xbe, 0x5f, 0xde, 0xbf, 0x11, 0xda, 0x5b, 0x8f, 0xd5, 0x57, 0x5f, //* ......_....[..W_ */ 
+    /* 0x00001b60 */ 0x7d, 0x95, 0xbc, 0x67, 0xcf, 0x1e, 0xce, 0x9d, 0x3b, 0x37, 0xae, 0x52, 0xd7, 0x50, 0x07, 0x80, //* }..g....;7.R.P.. */ 
+    /* 0x00001b70 */ 0xcb, 0xa4, 0x2f, 0x27, 0x96, 0xdc, 0xbc, 0x79, 0x93, 0x0a, 0x85, 0x82, 0x01, 0x01, 0x01, 0xb4, //* ../'...y........ */ 
+    /* 0x00001b80 */ 0xb4, 0xb2, 0xe4, 0xa6, 0x4d, 0xbf, 0x30, 0x33, 0x33, 0x83, 0xf1, 0x0f, 0x1f, 0x72, 0xf6, 0x1c, //* ....M.033....r.. */ 
+    /* 0x00001b90 */ 0x4d, 0xa0, 0x99, 0x8a, 0x63, 0xc1, 0x82, 0x05, 0x4c, 0x4a, 0x4a, 0x62, 0x61, 0x61, 0x21, 0xd3, //* M...c...LJJbaa!. */ 
+    /* 0x00001ba0 */ 0xd3, 0xd3, 0x45, 0xa1, 0xec, 0xd6, 0x68, 0x50, 0x62, 0xeb, 0x68, 0xd7, 0xae, 0x1d, 0x13, 0x12, //* ..E...hPb.h..... */ 
+    /* 0x00001bb0 */ 0x1e, 0x32, 0x2e, 0x2e, 0x8e, 0xab, 0x56, 0x69, 0xdc, 0x9a, 0x2b, 0x8e, 0x83, 0x5e, 0x5e, 0x94, //* .2....Vi..+..^^. */ 
+    /* 0x00001bc0 */ 0xc9, 0xb2, 0x18, 0x17, 0x17, 0xcb, 0xef, 0x66, 0xcf, 0xa6, 0xa5, 0x65, 0x43, 0x5e, 0xbe, 0x7c, //* .......f...eC^.| */ 
+    /* 0x00001bd0 */ 0x99, 0x2a, 0xb5, 0x8a, 0x19, 0x19, 0x19, 0xdc, 0xb8, 0x71, 0x23, 0x01, 0x84, 0x00, 0xe8, 0x05, //* .*.......q#..... */ 
+    /* 0x00001be0 */ 0x60, 0xe8, 0xd2, 0xa5, 0xcb, 0xef, 0x7a, 0xee, 0xdb, 0xcf, 0x15, 0x2b, 0x9c, 0x33, 0xcc, 0x4c, //* `.....z....+.3.L */ 
+    /* 0x00001bf0 */ 0xcd, 0x67, 0xe8, 0xfc, 0xbf, 0x6a, 0x89, 0xed, 0xf0, 0xe1, 0xc3, 0x0f, 0xef, 0xdc, 0xb9, 0x53, //* .g...j.........S */ 
+    /* 0x00001c00 */ 0xd8, 0xbc, 0x79, 0xb3, 0x0a, 0x80, 0x9f, 0xb1, 0x89, 0x51, 0x82, 0x97, 0x97, 0x37, 0x73, 0x73, //* ..y......Q...7ss */ 
+    /* 0x00001c10 */ 0xf3, 0xf8, 0xe8, 0x51, 0x02, 0x67, 0xce, 0x9c, 0xc9, 0x31, 0x63, 0x46, 0xf3, 0xee, 0xbd, 0x18, //* ...Q.g...1cF.... */ 
+    /* 0x00001c20 */ 0xca, 0x64, 0x59, 0x3c, 0x7c, 0xe8, 0x90, 0x58, 0x81, 0x4b, 0x7e, 0x5a, 0xc2, 0xc0, 0xc0, 0x40, //* .dY<|..X.K~Z...@ */ 
+    /* 0x00001c30 */ 0x3e, 0x7d, 0x9a, 0xc8, 0xb2, 0xb2, 0x72, 0x96, 0x96, 0x29, 0xb9, 0xc7, 0x63, 0x0f, 0x9f, 0x3c, //* >}....r..)..c..< */ 
+    /* 0x00001c40 */ 0x79, 0x22, 0x0a, 0x24, 0x3d, 0x3d, 0x9d, 0x7d, 0xfb, 0xf6, 0xad, 0x52, 0xf1, 0xf3, 0xe7, 0xcf, //* y".$==.}...R.... */ 
+    /* 0x00001c50 */ 0xa7, 0x5c, 0x9e, 0x43, 0x41, 0x50, 0x33, 0x36, 0xf6, 0x1e, 0xe7, 0xcc, 0x9d, 0x23, 0xa6, 0x8d, //* .\.CAP36.....#.. */ 
+    /* 0x00001c60 */ 0x19, 0x33, 0x86, 0x11, 0x11, 0xe1, 0x2c, 0x52, 0x14, 0xf2, 0xf2, 0xa5, 0x4b, 0x04, 0xf4, 0x39, //* .3....,R....K..9 */ 
+    /* 0x00001c70 */ 0x67, 0xee, 0x5c, 0x3e, 0x7e, 0xf2, 0x98, 0x82, 0x20, 0xf0, 0xd6, 0xed, 0xdb, 0x9c, 0x3c, 0x79, //* g.\>~... .....<y */ 
+    /* 0x00001c80 */ 0x8a, 0xba, 0x6d, 0xfb, 0x0e, 0x5c, 0xb7, 0xfe, 0x17, 0x0e, 0x19, 0x3a, 0x6c, 0xbf, 0x76, 0x8c, //* ..m..\.....:l.v. */ 
+    /* 0x00001c90 */ 0x7b, 0xa7, 0xf8, 0xb9, 0xef, 0x27, 0x7d, 0xe9, 0xea, 0xba, 0x86, 0x4f, 0x9e, 0x24, 0x31, 0x33, //* {....'}....O.$13 */ 
+    /* 0x00001ca0 */ 0x53, 0xc6, 0x3f, 0xfe, 0xd8, 0x49, 0x00, 0x3c, 0x72, 0xc4, 0x87, 0x79, 0x79, 0x79, 0x8c, 0x8c, //* S.?..I.<r..yyy.. */ 
+    /* 0x00001cb0 */ 0x8c, 0xe4, 0xd8, 0xb1, 0x9a, 0x20, 0xc8, 0xef, 0xbd, 0xf7, 0x3e, 0x2f, 0x5f, 0xb9, 0xc2, 0x7b, //* ..... ....>/_..{ */ 
+    /* 0x00001cc0 */ 0xf7, 0xef, 0xd3, 0xd3, 0x73, 0x1f, 0xf3, 0xf3, 0x0b, 0x98, 0x9c, 0x9c, 0xc2, 0x1f, 0x17, 0x2e, //* ....s........... */ 
+    /* 0x00001cd0 */ 0xa4, 0xef, 0xf1, 0x13, 0x1a, 0xab, 0x75, 0x41, 0x10, 0xe3, 0xf5, 0xa6, 0xa5, 0xa5, 0x55, 0x84, //* ......uA......U. */ 
+    /* 0x00001ce0 */ 0x56, 0x12, 0x8f, 0xe1, 0xc3, 0x87, 0xd3, 0xc3, 0xc3, 0x83, 0x21, 0x21, 0x21, 0x8c, 0xbe, 0x15, //* V.........!!!... */ 
+    /* 0x00001cf0 */ 0xcd, 0x13, 0x27, 0x4f, 0xf0, 0x8b, 0x2f, 0xbe, 0x10, 0xd3, 0x57, 0xae, 0x5c, 0xc1, 0xd4, 0xd4, //* ..'O../...W.\... */ 
+    /* 0x00001d00 */ 0x14, 0x66, 0x65, 0x65, 0x89, 0x6e, 0x0f, 0x1e, 0x7b, 0xf7, 0x32, 0x3b, 0x27, 0x87, 0x25, 0xc5, //* .fee.n..{.2;'.%. */ 
+    /* 0x00001d10 */ 0x25, 0xf4, 0x3f, 0xed, 0xcf, 0xa6, 0x36, 0xb6, 0xb9, 0xef, 0xa2, 0x8f, 0xc8, 0xbc, 0x81, 0x9f, //* %.?...6......... */ 
+    /* 0x00001d20 */ 0x7e, 0x9a, 0x73, 0xe5, 0xea, 0x15, 0x96, 0x94, 0x94, 0x32, 0x24, 0x38, 0x8c, 0x9d, 0x3b, 0x77, //* ~.s......2$8..;w */ 
+    /* 0x00001d30 */ 0xe1, 0xf4, 0xe9, 0xd3, 0xf8, 0x2c, 0xe9, 0x19, 0xb3, 0xb2, 0x64, 0xdc, 0xb2, 0xe5, 0xa5, 0x75, //* .....,....d....u */ 
+    /* 0x00001d40 */ 0xbb, 0x85, 0x85, 0x05, 0x4f, 0x9c, 0x38, 0x41, 0x3f, 0x3f, 0x7f, 0x8e, 0x19, 0x33, 0x8e, 0xa1, //* ....O.8A??...3.. */ 
+    /* 0x00001d50 */ 0xa1, 0xa1, 0x0c, 0x0e, 0x0e, 0x66, 0x97, 0xce, 0x5d, 0x18, 0x1a, 0x1a, 0xca, 0xfc, 0xfc, 0x02, //* .....f..]....... */ 
+    /* 0x00001d60 */ 0x86, 0x5f, 0x0f, 0x67, 0xb9, 0x36, 0x14, 0x6c, 0x54, 0x54, 0x14, 0x53, 0x52, 0x52, 0x28, 0x08, //* ._.g.6.lTT.SRR(. */ 
+    /* 0x00001d70 */ 0x02, 0x1f, 0xc4, 0xc5, 0x71, 0xcb, 0xe6, 0x2d, 0xec, 0xd1, 0xbd, 0x47, 0x15, 0xe1, 0x40, 0x1b, //* ....q..-...G..@. */ 
+    /* 0x00001d80 */ 0x53, 0x4b, 0xeb, 0x66, 0x50, 0xe5, 0xb8, 0x74, 0x29, 0x88, 0xa4, 0xc0, 0xa0, 0xa0, 0x8b, 0x04, //* SK.fP..t)....... */ 
+    /* 0x00001d90 */ 0xc0, 0x0f, 0x3f, 0xfc, 0x90, 0xe1, 0xd7, 0x35, 0xd6, 0xf1, 0x29, 0xa9, 0xa9, 0xdc, 0xb8, 0x71, //* ..?....5..)....q */ 
+    /* 0x00001da0 */ 0x33, 0x01, 0x5c, 0xd6, 0x76, 0x63, 0xd5, 0x9a, 0x5e, 0x00, 0x82, 0xb6, 0x6d, 0xdf, 0xce, 0x17, //* 3.\.vc..^...m... */ 
+    /* 0x00001db0 */ 0x2f, 0x32, 0x49, 0x92, 0x57, 0xaf, 0x06, 0x8b, 0x15, 0xe1, 0xe6, 0xe6, 0xc6, 0x82, 0xfc, 0x3c, //* /2I.W..........< */ 
+    /* 0x00001dc0 */ 0xc6, 0xc7, 0x3f, 0x60, 0xff, 0x7e, 0x9a, 0x50, 0x1a, 0x00, 0x68, 0x63, 0x63, 0xc3, 0xee, 0xdd, //* ..?`.~.P..hcc... */ 
+    /* 0x00001dd0 */ 0xbb, 0x13, 0x00, 0xd7, 0xb8, 0xb9, 0x71, 0xc9, 0x12, 0x8d, 0x77, 0xd5, 0xd5, 0xe0, 0xab, 0xcc, //* ......q...w..... */ 
+    /* 0x00001de0 */ 0xca, 0xca, 0xe4, 0xc2, 0x85, 0x8b, 0x38, 0x73, 0xe6, 0x4c, 0x51, 0x20, 0x8f, 0x9f, 0x3c, 0xa1, //* ......8s.LQ ..<. */ 
+    /* 0x00001df0 */ 0x83, 0x83, 0x03, 0x2f, 0x06, 0x5e, 0x64, 0x76, 0x76, 0x36, 0x4b, 0x4b, 0x4b, 0x99, 0x25, 0xcb, //* .../.^dvv6KKK.%. */ 
+    /* 0x00001e00 */ 0x62, 0x58, 0x58, 0x28, 0xd7, 0xaf, 0x5f, 0xcf, 0x2e, 0x5d, 0xba, 0x54, 0x11, 0x40, 0x65, 0xd5, //* bXX(.._..].T.@e. */ 
+    /* 0x00001e10 */ 0xd8, 0xc9, 0x69, 0x0a, 0xef, 0xc6, 0xdc, 0x65, 0x4a, 0x72, 0x32, 0x57, 0xad, 0x72, 0x11, 0xcf, //* ..i....eJr2W.r.. */ 
+    /* 0x00001e20 */ 0xf7, 0xed, 0xdb, 0x97, 0x85, 0x85, 0x85, 0x24, 0x49, 0x95, 0x5a, 0xcd, 0xc8, 0xc8, 0x28, 0x4e, //* .......$I.Z...(N */ 
+    /* 0x00001e30 */ 0x9b, 0x36, 0x4d, 0x0d, 0x60, 0x5b, 0x75, 0x1c, 0xd8, 0x9b, 0x00, 0xd8, 0xf7, 0xdd, 0x77, 0x73, //* .6M.`[u.......ws */ 
+    /* 0x00001e40 */ 0x78, 0xe7, 0x4e, 0x8c, 0x38, 0x67, 0x20, 0xc9, 0xb3, 0x67, 0xcf, 0x55, 0xa9, 0x9c, 0x91, 0xa3, //* x.N.8g ..g.U.... */ 
+    /* 0x00001e50 */ 0x46, 0x32, 0x2a, 0xf2, 0x26, 0xb3, 0xb3, 0x34, 0xce, 0x9e, 0x95, 0xd3, 0x8c, 0x8c, 0x8c, 0x08, //* F2*.&..4........ */ 
+    /* 0x00001e60 */ 0x80, 0x63, 0xc7, 0x7d, 0xce, 0x1b, 0x91, 0x51, 0x8c, 0xb8, 0x79, 0x83, 0x03, 0x06, 0x68, 0x9c, //* .c.}...Q..y...h. */ 
+    /* 0x00001e70 */ 0xfd, 0x7d, 0x7d, 0x7d, 0x59, 0x5e, 0x5e, 0xce, 0x42, 0xad, 0x5f, 0xa0, 0xbb, 0xbb, 0x3b, 0x01, //* .}}}Y^^.B._...;. */ 
+    /* 0x00001e80 */ 0xb0, 0x5d, 0xfb, 0x76, 0xfc, 0xe6, 0xdb, 0x6f, 0xb8, 0x75, 0xfb, 0x36, 0xfa, 0x1c, 0xf3, 0xa1, //* .].v...o.u.6.... */ 
+    /* 0x00001e90 */ 0xbf, 0xbf, 0xbf, 0xd8, 0x1d, 0xa1, 0xd2, 0xe4, 0xb1, 0xa2, 0x8c, 0xcc, 0xcc, 0x0c, 0x9e, 0x3f, //* ...............? */ 
+    /* 0x00001ea0 */ 0x7f, 0x9e, 0xb6, 0x36, 0x2f, 0x03, 0xde, 0x00, 0xe0, 0x81, 0x03, 0x07, 0x58, 0x5e, 0x5e, 0x4e, //* ...6/.......X^^N */ 
+    /* 0x00001eb0 */ 0x55, 0xa5, 0x30, 0xe6, 0x05, 0x05, 0x05, 0x3c, 0x7c, 0xf8, 0x30, 0xad, 0xad, 0xad, 0x1f, 0x03, //* U.0....<|.0..... */ 
+    /* 0x00001ec0 */ 0x98, 0x1c, 0x1c, 0x1c, 0xfc, 0xc6, 0xdc, 0xca, 0xff, 0x23, 0x7a, 0xf6, 0xec, 0xa1, 0x0f, 0x60, //* .........#z....` */ 
+    /* 0x00001ed0 */ 0x4a, 0xb7, 0x6e, 0x5d, 0xd3, 0x4e, 0x9c, 0x38, 0x21, 0x46, 0x5e, 0xa8, 0x1c, 0x59, 0xba, 0xa4, //* J.n].N.8!F^..Y.. */ 
+    /* 0x00001ee0 */ 0xa4, 0x84, 0x3e, 0x3e, 0x3e, 0x34, 0x35, 0x35, 0xaf, 0x52, 0x01, 0x5b, 0x36, 0x6f, 0x66, 0x5a, //* ..>>>455.R.[6ofZ */ 
+    /* 0x00001ef0 */ 0x5a, 0x2a, 0x1f, 0x3e, 0x8c, 0xe7, 0x82, 0x05, 0x0b, 0xc4, 0xf3, 0x63, 0xc7, 0x8d, 0xa5, 0xc7, //* Z*.>.......c.... */ 
+    /* 0x00001f00 */ 0x5e, 0x4f, 0xae, 0x5c, 0xe9, 0x2c, 0x9e, 0x73, 0x70, 0x70, 0x60, 0x7a, 0x7a, 0x3a, 0x8f, 0x1e, //* ^O.\.,.spp`zz:.. */ 
+    /* 0x00001f10 */ 0x3d, 0xca, 0xd5, 0x6b, 0x5c, 0xa9, 0x52, 0xab, 0x45, 0x17, 0xe9, 0x7f, 0x75, 0x54, 0x76, 0x41, //* =..k\.R.E...uTvA */ 
+    /* 0x00001f20 */ 0x58, 0xba, 0x74, 0x29, 0x13, 0x13, 0x13, 0xf9, 0xf8, 0xf1, 0xe3, 0x2a, 0xee, 0x0c, 0x00, 0x38, //* X.t).......*...8 */ 
+    /* 0x00001f30 */ 0x71, 0xe2, 0x44, 0x86, 0x87, 0x87, 0xb3, 0xbc, 0xbc, 0x9c, 0x6a, 0xb5, 0x9a, 0x2a, 0xb5, 0x4a, //* q.D.......j..*.J */ 
+    /* 0x00001f40 */ 0x23, 0x14, 0xad, 0x77, 0x15, 0x49, 0x26, 0x26, 0x26, 0x72, 0xf2, 0xe4, 0xc9, 0x04, 0xb0, 0x5f, //* #..w.I&&&r....._ */ 
+    /* 0x00001f50 */ 0xb7, 0x0e, 0xde, 0x36, 0x16, 0xd9, 0xdb, 0xf7, 0x7b, 0x19, 0x50, 0x5f, 0x1b, 0x8f, 0xbd, 0xf2, //* ...6....{.P_.... */ 
+    /* 0x00001f60 */ 0x21, 0x08, 0x1a, 0xc1, 0x24, 0x25, 0x25, 0xf1, 0x3b, 0x6d, 0xfc, 0xc4, 0x8a, 0xa3, 0x47, 0x8f, //* !...$%%.;m....G. */ 
+    /* 0x00001f70 */ 0x1e, 0x0c, 0x0c, 0x0c, 0x64, 0x4e, 0x4e, 0x0e, 0xcf, 0x9e, 0x3d, 0x5b, 0x61, 0x3c, 0x5d, 0xe5, //* ....dNN...=[a<]. */ 
+    /* 0x00001f80 */ 0x18, 0x33, 0x76, 0x2c, 0xfd, 0xfc, 0x4e, 0x71, 0xdb, 0x36, 0x4d, 0xc0, 0x4c, 0x00, 0xbc, 0x77, //* .3v,..Nq.6M.L..w */ 
+    /* 0x00001f90 */ 0xff, 0x3e, 0x5d, 0xd7, 0xac, 0xf9, 0x4b, 0x5e, 0xe8, 0x04, 0xbc, 0xec, 0xdc, 0xb9, 0x33, 0x2f, //* .>]...K^......3/ */ 
+    /* 0x00001fa0 */ 0x5e, 0xbc, 0xc8, 0xcc, 0xcc, 0x4c, 0x1e, 0x3f, 0x7e, 0xfc, 0x2f, 0x93, 0xc8, 0x35, 0x6b, 0xd6, //* ^....L.?~./..5k. */ 
+    /* 0x00001fb0 */ 0xf0, 0xfe, 0x7d, 0xcd, 0x84, 0x51, 0xad, 0x56, 0x53, 0xad, 0xd2, 0xdc, 0xb3, 0x46, 0x20, 0x1a, //* ..}..Q.VS....F . */ 
+    /* 0x00001fc0 */ 0x8b, 0x7b, 0x85, 0xa2, 0x80, 0x67, 0xcf, 0x9e, 0xa5, 0x93, 0x93, 0x13, 0xdb, 0xb4, 0x69, 0x13, //* .{...g........i. */ 
+    /* 0x00001fd0 */ 0xa3, 0x5b, 0x01, 0xff, 0x2d, 0x2f, 0xf7, 0x3e, 0x5f, 0x0d, 0xe3, 0xec, 0xec, 0xec, 0x7a, 0xe5, //* .[..-/.>_.....z. */ 
+    /* 0x00001fe0 */ 0xe7, 0xe7, 0xc3, 0xda, 0xda, 0x1a, 0xf5, 0xeb, 0x5b, 0x42, 0x2a, 0x95, 0x54, 0x09, 0x64, 0xac, //* ........[B*.T.d. */ 
+    /* 0x00001ff0 */ 0x89, 0x3a, 0x4d, 0x14, 0x16, 0x16, 0x20, 0x2e, 0x2e, 0x1e, 0xad, 0x5a, 0xb5, 0xc2, 0xed, 0xdb, //* .:M... ....Z.... */ 
+    /* 0x00002000 */ 0xb7, 0x01, 0x00, 0x69, 0x69, 0x69, 0xf0, 0xf6, 0xf6, 0x86, 0x42, 0x51, 0x84, 0xa1, 0x43, 0x87, //* ...iii....BQ..C. */ 
+    /* 0x00002010 */ 0x62, 0xc6, 0x8c, 0xe9, 0x68, 0xd0, 0xa0, 0xa1, 0x18, 0x7d, 0x0e, 0x00, 0xea, 0xd5, 0xaf, 0x87, //* b...h....}...... */ 
+    /* 0x00002020 */ 0x4b, 0x41, 0x97, 0xb0, 0x7f, 0xbf, 0xe6, 0xe1, 0x74, 0x73, 0x5b, 0x83, 0xa2, 0x22, 0x05, 0xbe, //* KA......ts[..".. */ 
+    /* 0x00002030 */ 0xff, 0xfe, 0xfb, 0x2a, 0x11, 0xac, 0x01, 0x54, 0x89, 0xb1, 0xf8, 0xcb, 0x2f, 0xbf, 0xc0, 0xdd, //* ...*...T..../... */ 
+    /* 0x00002040 */ 0xdd, 0x1d, 0x00, 0xe0, 0xec, 0xec, 0x0c, 0x67, 0x67, 0x67, 0xf1, 0xbe, 0xc6, 0x8f, 0x1f, 0x8f, //* .......ggg...... */ 
+    /* 0x00002050 */ 0xce, 0x9d, 0x3b, 0x43, 0xa9, 0x54, 0x82, 0x14, 0xd0, 0xa5, 0x8b, 0x36, 0xb4, 0x89, 0x84, 0x20, //* ..;C.T.....6...  */ 
+    /* 0x00002060 */ 0x00, 0xa9, 0x44, 0x0a, 0xa9, 0x44, 0x82, 0xd8, 0x07, 0xf7, 0xe1, 0xec, 0xe2, 0x8c, 0x5a, 0x26, //* ..D..D........Z& */ 
+    /* 0x00002070 */ 0xa6, 0x98, 0x3e, 0x7d, 0x3a, 0x62, 0x62, 0x62, 0x52, 0xe3, 0xe3, 0xe3, 0x3d, 0x5e, 0xfe, 0xe2, //* ..>}:bbbR...=^.. */ 
+    /* 0x00002080 */ 0xdb, 0xc7, 0x46, 0x8d, 0x13, 0xe7, 0x0d, 0x8e, 0x1d, 0x3b, 0x96, 0x1e, 0x1e, 0x7b, 0x98, 0x9b, //* ..F......;...{.. */ 
+    /* 0x00002090 */ 0x9b, 0x5b, 0xa5, 0xb5, 0x68, 0xbe, 0xa8, 0x79, 0x23, 0x22, 0x9c, 0xdf, 0xcd, 0xfe, 0x8e, 0x23, //* .[..h..y#".....# */ 
+    /* 0x000020a0 */ 0x47, 0x8e, 0xe4, 0xc1, 0x83, 0x07, 0xf9, 0xed, 0xb7, 0xdf, 0xfe, 0xe5, 0xe9, 0x3e, 0x78, 0xf0, //* G............>x. */ 
+    /* 0x000020b0 */ 0x20, 0x65, 0xb2, 0x2c, 0xde, 0xb8, 0x11, 0xc1, 0xe1, 0xc3, 0xfe, 0x1a, 0xa0, 0xc6, 0xc2, 0xc2, //*  e.,............ */ 
+    /* 0x000020c0 */ 0x82, 0x3e, 0x3e, 0x3e, 0xec, 0xd9, 0xb3, 0x67, 0x95, 0xf3, 0x95, 0x5b, 0xc5, 0x88, 0x11, 0x23, //* .>>>...g...[...# */ 
+    /* 0x000020d0 */ 0x18, 0x11, 0x11, 0xc1, 0x94, 0x94, 0x14, 0xee, 0xd8, 0xb1, 0xe3, 0x2f, 0x65, 0xb8, 0xb8, 0xb8, //* .........../e... */ 
+    /* 0x000020e0 */ 0xf0, 0xab, 0xaf, 0xa6, 0xd2, 0xcf, 0xcf, 0x8f, 0xbf, 0xff, 0xfe, 0x3b, 0xc7, 0x7f, 0xfe, 0x39, //* ...........;...9 */ 
+    /* 0x000020f0 */ 0x83, 0x82, 0x02, 0x59, 0x52, 0xfa, 0x32, 0x26, 0x64, 0x4e, 0x4e, 0x0e, 0x77, 0xee, 0xdc, 0xc9, //* ...YR.2&dNN.w... */ 
+    /* 0x00002100 */ 0xaf, 0xa6, 0x4e, 0xe3, 0xad, 0x68, 0x8d, 0x6f, 0x7b, 0x4e, 0x8e, 0x9c, 0xf6, 0xf6, 0xf6, 0xaf, //* ..N..h.o{N...... */ 
+    /* 0x00002110 */ 0xbc, 0x85, 0xbc, 0x6a, 0xb6, 0x06, 0x04, 0x68, 0xde, 0x56, 0x90, 0x9b, 0x9b, 0xcb, 0x3f, 0xfe, //* ...j...h.V....?. */ 
+    /* 0x00002120 */ 0xd8, 0xc5, 0xcf, 0x3f, 0x1f, 0xcf, 0xeb, 0xd7, 0xc3, 0x59, 0x56, 0xa6, 0xd1, 0x88, 0x92, 0x93, //* ...?.....YV..... */ 
+    /* 0x00002130 */ 0x93, 0xb9, 0x63, 0xfb, 0x76, 0x7e, 0x3a, 0x70, 0x20, 0x97, 0x2f, 0x5f, 0xc1, 0x9b, 0x37, 0x23, //* ..c.v~:p ./_..7# */ 
+    /* 0x00002140 */ 0x79, 0xee, 0x5c, 0x00, 0x7b, 0xf4, 0xe8, 0xc9, 0x8d, 0x1b, 0x36, 0xd0, 0xd1, 0xe1, 0xd3, 0x2a, //* y.\.{.....6....* */ 
+    /* 0x00002150 */ 0x15, 0x36, 0x66, 0xcc, 0x18, 0x46, 0x46, 0xde, 0x64, 0xc6, 0x8b, 0x74, 0x7a, 0x78, 0x68, 0xa2, //* .6f..FF.d..tzxh. */ 
+    /* 0x00002160 */ 0x31, 0x54, 0x1c, 0xcd, 0x9a, 0x35, 0x13, 0x83, 0xc4, 0x54, 0x08, 0xa1, 0xb2, 0x30, 0xf6, 0xef, //* 1T...5...T...0.. */ 
+    /* 0x00002170 */ 0xdf, 0xcf, 0xf4, 0xf4, 0x74, 0x86, 0x85, 0x85, 0xfd, 0x65, 0xe2, 0x38, 0x6e, 0xdc, 0x58, 0x2e, //* ....t....e.8n.X. */ 
+    /* 0x00002180 */ 0x5e, 0xbc, 0x88, 0x5e, 0x5e, 0x07, 0x19, 0x1a, 0x1a, 0xc2, 0x1f, 0x7f, 0x5c, 0xc0, 0x15, 0x2b, //* ^..^^.......\..+ */ 
+    /* 0x00002190 */ 0x56, 0xf2, 0x98, 0x8f, 0x0f, 0x5d, 0x5c, 0x5c, 0xb8, 0x74, 0xf9, 0x32, 0x3e, 0x88, 0x8b, 0xe3, //* V....]\\.t.2>... */ 
+    /* 0x000021a0 */ 0xf5, 0xeb, 0xe1, 0x1c, 0x3b, 0x66, 0x2c, 0xbd, 0xbc, 0xbd, 0x99, 0xa7, 0x7d, 0xf5, 0x45, 0x7a, //* ....;f,.....}.Ez */ 
+    /* 0x000021b0 */ 0x5a, 0x1a, 0x37, 0x6e, 0xda, 0xc8, 0xd7, 0x11, 0xb6, 0xe9, 0x55, 0x6b, 0x09, 0xc3, 0x06, 0x0e, //* Z.7n......Uk.... */ 
+    /* 0x000021c0 */ 0xec, 0x7f, 0xf8, 0xc7, 0x1f, 0x17, 0x98, 0x0f, 0x18, 0x30, 0x10, 0x26, 0x26, 0x26, 0x88, 0x8f, //* .........0.&&&.. */ 
+    /* 0x000021d0 */ 0x8f, 0xc3, 0xaf, 0xbf, 0x6e, 0x45, 0xd3, 0xa6, 0x4d, 0xd1, 0xac, 0x99, 0x2d, 0x22, 0x23, 0xa3, //* ....nE..M...-"#. */ 
+    /* 0x000021e0 */ 0xd0, 0xa0, 0x41, 0x03, 0xb4, 0x6a, 0xd5, 0x0a, 0x7a, 0x7a, 0xfa, 0xf0, 0xf3, 0xf3, 0x43, 0x71, //* ..A..j..zz....Cq */ 
+    /* 0x000021f0 */ 0x69, 0x31, 0x16, 0x2f, 0x5a, 0x84, 0x92, 0xa2, 0x62, 0xec, 0xf1, 0xf0, 0x40, 0xbb, 0xf6, 0xed, //* i1./Z...b...@... */ 
+    /* 0x00002200 */ 0xe1, 0xe2, 0xec, 0x5c, 0xa5, 0xe0, 0x8d, 0x9b, 0x36, 0x61, 0xc2, 0x84, 0xf1, 0x28, 0xc8, 0xcf, //* ...\....6a...(.. */ 
+    /* 0x00002210 */ 0xc7, 0xaf, 0xbf, 0x6e, 0xc5, 0xde, 0xbd, 0x9a, 0x80, 0x97, 0xd0, 0x1a, 0x37, 0x68, 0x0d, 0x1c, //* ...n........7h.. */ 
+    /* 0x00002220 */ 0x00, 0x00, 0xb3, 0x67, 0xcf, 0xc6, 0xdc, 0xb9, 0xf3, 0x60, 0x6c, 0x6c, 0x84, 0x03, 0x07, 0x0e, //* ...g.....`ll.... */ 
+    /* 0x00002230 */ 0x60, 0xcd, 0x9a, 0xaa, 0xde, 0xcd, 0x1e, 0x7b, 0x3d, 0x10, 0x73, 0xe7, 0x0e, 0xec, 0xec, 0xec, //* `......{=.s..... */ 
+    /* 0x00002240 */ 0x20, 0x93, 0x65, 0x23, 0x3f, 0x3f, 0x0f, 0x9f, 0x7d, 0xf6, 0x19, 0x4a, 0x4a, 0x8a, 0x71, 0xfa, //*  .e#??..}..JJ.q. */ 
+    /* 0x00002250 */ 0xb4, 0x3f, 0x3a, 0x74, 0xec, 0x84, 0x56, 0xda, 0x40, 0x35, 0x2f, 0xd2, 0xb3, 0xb0, 0x79, 0xd3, //* .?:t..V.@5/...y. */ 
+    /* 0x00002260 */ 0x46, 0xb4, 0x68, 0xf9, 0x01, 0xca, 0xca, 0xca, 0x10, 0x1c, 0x1c, 0x0c, 0xf7, 0x75, 0xee, 0xb9, //* F.h..........u.. */ 
+    /* 0x00002270 */ 0x21, 0xc1, 0x21, 0x6e, 0x75, 0xeb, 0xd5, 0xdb, 0x9e, 0x2b, 0x97, 0x6b, 0xe2, 0xa1, 0xbf, 0x22, //* !.!nu....+.k..." */ 
+    /* 0x00002280 */ 0x5e, 0xb5, 0x40, 0x00, 0xc0, 0x16, 0xc0, 0xfa, 0x39, 0x73, 0xe6, 0x4c, 0x9c, 0x35, 0x6b, 0x26, //* ^.@.....9s.L.5k& */ 
+    /* 0x00002290 */ 0x3a, 0x76, 0xec, 0x84, 0xf2, 0xf2, 0x32, 0xac, 0x5b, 0xb7, 0x1e, 0x61, 0x61, 0x61, 0xe8, 0xda, //* :v....2.[..aaa.. */ 
+    /* 0x000022a0 */ 0xb5, 0x2b, 0x14, 0x85, 0x0a, 0x04, 0x06, 0x05, 0xe2, 0xf1, 0xe3, 0xc7, 0xd8, 0xbf, 0x6f, 0x1f, //* .+............o. */ 
+    /* 0x000022b0 */ 0xda, 0xb6, 0x6f, 0x8b, 0xc0, 0x8b, 0x41, 0x48, 0x49, 0x4e, 0xc6, 0xd4, 0x19, 0xd3, 0x91, 0x90, //* ..o...AHIN...... */ 
+    /* 0x000022c0 */ 0xf0, 0x08, 0x57, 0x2e, 0x5d, 0x82, 0xa9, 0xa9, 0x19, 0xfe, 0xf8, 0xe3, 0x77, 0xb1, 0xe0, 0xf6, //* ..W.].......w... */ 
+    /* 0x000022d0 */ 0xed, 0xdb, 0x61, 0xd3, 0xa6, 0x4d, 0xe8, 0xde, 0xbd, 0x07, 0x22, 0x23, 0x23, 0x31, 0x75, 0xea, //* ..a..M...."##1u. */ 
+    /* 0x000022e0 */ 0x54, 0x31, 0x60, 0x26, 0x00, 0xd4, 0xaa, 0x55, 0x07, 0x3e, 0x3e, 0x47, 0xd0, 0xb3, 0x67, 0x4f, //* T1`&...U.>>G..gO */ 
+    /* 0x000022f0 */ 0x44, 0x44, 0x44, 0x60, 0xfa, 0xf4, 0xe9, 0xc8, 0xc9, 0xc9, 0x11, 0xd3, 0x57, 0xad, 0x5a, 0x05, //* DDD`........W.Z. */ 
+    /* 0x00002300 */ 0x99, 0x2c, 0x1b, 0x0d, 0x1b, 0x36, 0xc0, 0xa0, 0xc1, 0x83, 0x10, 0x7b, 0x3f, 0x16, 0x41, 0x41, //* .,...6.....{?.AA */ 
+    /* 0x00002310 */ 0x41, 0x90, 0xc9, 0x64, 0xb8, 0x7c, 0xf9, 0x32, 0xd6, 0xac, 0x59, 0x85, 0x3e, 0x1f, 0xf7, 0xc5, //* A..d.|.2..Y.>... */ 
+    /* 0x00002320 */ 0x6f, 0xbf, 0xed, 0x84, 0x99, 0x99, 0x29, 0x46, 0x8e, 0x1c, 0x01, 0x65, 0xa9, 0x12, 0x3d, 0x7a, //* o.....)F...e..=z */ 
+    /* 0x00002330 */ 0x74, 0x43, 0x79, 0x79, 0x39, 0x0e, 0x1c, 0xf0, 0xc2, 0xba, 0x75, 0xeb, 0xce, 0x00, 0xf8, 0x11, //* tCyy9.....u..... */ 
+    /* 0x00002340 */ 0xc0, 0x53, 0xb1, 0xe0, 0x57, 0xc8, 0xab, 0x1e, 0xd4, 0x01, 0x20, 0x1f, 0xc0, 0x89, 0xa8, 0xa8, //* .S..W..... ..... */ 
+    /* 0x00002350 */ 0xa8, 0xf0, 0x5d, 0xbb, 0x76, 0xb5, 0x6d, 0xd8, 0xa0, 0x41, 0x93, 0xd2, 0xd2, 0x12, 0x34, 0xb1, //* ..].v.m..A....4. */ 
+    /* 0x00002360 */ 0xb6, 0x86, 0xb9, 0xb9, 0x39, 0x52, 0x52, 0x52, 0x11, 0x15, 0x15, 0x85, 0xa6, 0x4d, 0xad, 0xe1, //* ....9RRR.....M.. */ 
+    /* 0x00002370 */ 0xed, 0xed, 0x85, 0xb2, 0xb2, 0x72, 0x4c, 0x99, 0x3c, 0x09, 0xf6, 0xfd, 0x06, 0xa2, 0x77, 0xaf, //* .....rL.<.....w. */ 
+    /* 0x00002380 */ 0xde, 0xf0, 0x39, 0x7a, 0x14, 0xca, 0xd2, 0x52, 0x0c, 0x1d, 0x3a, 0x0c, 0x49, 0x49, 0x49, 0x18, //* ..9z...R..:.III. */ 
+    /* 0x00002390 */ 0x35, 0x72, 0x04, 0x94, 0x4a, 0x25, 0x92, 0x93, 0x93, 0x91, 0x95, 0x25, 0xc3, 0xa1, 0x43, 0x87, //* 5r..J%.....%..C. */ 
+    /* 0x000023a0 */ 0x51, 0x5a, 0x5a, 0x8a, 0xc1, 0x83, 0x07, 0x61, 0xf6, 0xec, 0x6f, 0x61, 0x6a, 0x6a, 0x86, 0xd0, //* QZZ....a..oajj.. */ 
+    /* 0x000023b0 */ 0xd0, 0x10, 0x2c, 0x5e, 0xbc, 0x08, 0xfb, 0xf6, 0xed, 0x85, 0xa9, 0xa9, 0x29, 0x36, 0x6e, 0xfc, //* ..,^........)6n. */ 
+    /* 0x000023c0 */ 0x05, 0x0b, 0x17, 0x2e, 0x14, 0x23, 0x9e, 0xf6, 0x1f, 0x30, 0x10, 0x8b, 0x16, 0x2e, 0xc4, 0xb3, //* .....#...0...... */ 
+    /* 0x000023d0 */ 0x67, 0xcf, 0x31, 0x7c, 0xf8, 0x08, 0xa8, 0x05, 0x01, 0x3b, 0x77, 0xee, 0x44, 0x9b, 0x56, 0xad, //* g.1|.....;w.D.V. */ 
+    /* 0x000023e0 */ 0xd0, 0xf7, 0xe3, 0x8f, 0x51, 0xab, 0x4e, 0x6d, 0x58, 0xd6, 0xb7, 0xc2, 0x8e, 0x1d, 0xbf, 0xe1, //* ....Q.NmX....... */ 
+    /* 0x000023f0 */ 0xe1, 0xc3, 0x47, 0xe8, 0xd6, 0xb5, 0x1b, 0x66, 0xcd, 0x9a, 0x89, 0xb4, 0xd4, 0x34, 0x64, 0xa4, //* ..G....f.....4d. */ 
+    /* 0x00002400 */ 0xa7, 0xa1, 0xbc, 0xac, 0x1c, 0xbe, 0xbe, 0x27, 0x84, 0x4d, 0x9b, 0x36, 0xcd, 0xd7, 0x0a, 0x23, //* .......'.M.6...# */ 
+    /* 0x00002410 */ 0x57, 0xf7, 0x4f, 0xbf, 0x2a, 0x5e, 0x47, 0x0b, 0xa9, 0xcc, 0xf8, 0x39, 0x73, 0xe6, 0xfa, 0xf4, //* W.O.*^G....9s... */ 
+    /* 0x00002420 */ 0xed, 0xfb, 0x31, 0x12, 0x93, 0x12, 0xd1, 0xa1, 0x43, 0x07, 0xb4, 0x6e, 0xd5, 0x1a, 0xee, 0xee, //* ..1.....C..n.... */ 
+    /* 0x00002430 */ 0xee, 0xa8, 0x5b, 0xb7, 0x2e, 0xe2, 0xe2, 0xe2, 0x40, 0x12, 0xb6, 0xb6, 0xb6, 0x88, 0x8b, 0x8b, //* ..[.....@....... */ 
+    /* 0x00002440 */ 0x87, 0x81, 0x81, 0x01, 0x26, 0x4d, 0x9a, 0x88, 0xac, 0xac, 0x2c, 0x28, 0x0a, 0x15, 0xf8, 0x7c, //* ....&M....,(...| */ 
+    /* 0x00002450 */ 0xfc, 0xe7, 0xc8, 0xcb, 0xcd, 0xc5, 0xac, 0x6f, 0x66, 0x61, 0xc4, 0x88, 0x91, 0x08, 0x08, 0x08, //* .......ofa...... */ 
+    /* 0x00002460 */ 0x40, 0x42, 0x42, 0x82, 0x58, 0xf8, 0xb1, 0x63, 0xc7, 0xd0, 0xbf, 0x7f, 0x7f, 0xc8, 0x73, 0x73, //* @BB.X..c......ss */ 
+    /* 0x00002470 */ 0x61, 0x62, 0x62, 0x82, 0x90, 0xe0, 0xab, 0x98, 0x32, 0xc5, 0xa9, 0xca, 0x0d, 0xb8, 0xad, 0x71, //* abb.....2......q */ 
+    /* 0x00002480 */ 0x45, 0xc2, 0xa3, 0x47, 0x18, 0xf1, 0xd9, 0x48, 0xd8, 0xd8, 0xd8, 0xe0, 0xc4, 0x89, 0xe3, 0x68, //* E..G...H.......h */ 
+    /* 0x00002490 */ 0x6a, 0x6b, 0x8b, 0x4e, 0x1d, 0x3b, 0xe2, 0xf2, 0xe5, 0x4b, 0xb8, 0x7d, 0xfb, 0x36, 0x26, 0x4f, //* jk.N.;...K.}.6&O */ 
+    /* 0x000024a0 */ 0x9e, 0x82, 0x84, 0x84, 0x04, 0x14, 0xe4, 0x17, 0xa0, 0xbc, 0xbc, 0x0c, 0x6d, 0xda, 0xb6, 0xc3, //* ............m... */ 
+    /* 0x000024b0 */ 0xa7, 0x0e, 0x03, 0x91, 0x98, 0x98, 0x88, 0xc1, 0x83, 0x06, 0xe7, 0x8c, 0x1d, 0x3b, 0x36, 0x69, //* .............;6i */ 
+    /* 0x000024c0 */ 0xd4, 0xa8, 0x51, 0xdd, 0x04, 0x35, 0xf3, 0x7c, 0x8e, 0xf9, 0x1c, 0x08, 0x08, 0x38, 0xb7, 0x1e, //* ..Q..5.|.....8.. */ 
+    /* 0x000024d0 */ 0xc0, 0xcb, 0xa6, 0xf9, 0x0a, 0x79, 0x5d, 0x02, 0x69, 0x3a, 0x62, 0xe4, 0xc8, 0xd5, 0x63, 0x46, //* .....y].i:b...cF */ 
+    /* 0x000024e0 */ 0x8f, 0x99, 0x0e, 0x00, 0xa7, 0x4e, 0x9e, 0xf0, 0x3c, 0xed, 0xef, 0x5f, 0xef, 0xe7, 0x9f, 0x7f, //* .....N..<.._.... */ 
+    /* 0x000024f0 */ 0x1e, 0xdd, 0xa6, 0x4d, 0x1b, 0x98, 0x98, 0x98, 0xa0, 0x71, 0x93, 0x26, 0x38, 0x78, 0x60, 0x3f, //* ...M.....q.&8x`? */ 
+    /* 0x00002500 */ 0xcc, 0xcc, 0xcc, 0xf0, 0xe0, 0xc1, 0x03, 0xf4, 0xee, 0xdd, 0x07, 0x2d, 0x5b, 0xb6, 0x42, 0xe0, //* ...........-[.B. */ 
+    /* 0x00002510 */ 0xc5, 0x0b, 0x18, 0x37, 0x6e, 0x1c, 0x6c, 0x6d, 0x6d, 0xe0, 0xe3, 0x73, 0x0c, 0x37, 0x6e, 0x46, //* ...7n.lmm..s.7nF */ 
+    /* 0x00002520 */ 0x61, 0xe5, 0xca, 0x95, 0x50, 0xab, 0xcb, 0xf1, 0xd3, 0x4f, 0x3f, 0xc1, 0xce, 0xae, 0x39, 0x7c, //* a...P....O?...9| */ 
+    /* 0x00002530 */ 0x7c, 0x8e, 0x8a, 0x3f, 0xe4, 0xe4, 0x34, 0x05, 0xa3, 0x46, 0x8f, 0xc6, 0x89, 0x13, 0x27, 0x71, //* |..?..4..F....'q */ 
+    /* 0x00002540 */ 0xf8, 0xd0, 0x21, 0xf1, 0x7c, 0x9f, 0x3e, 0x7d, 0x30, 0x71, 0xe2, 0x44, 0xa4, 0xa5, 0xa6, 0xa0, //* ..!.|.>}0q.D.... */ 
+    /* 0x00002550 */ 0x7b, 0xf7, 0x1e, 0x88, 0x8e, 0xbe, 0x05, 0x95, 0xaa, 0x1c, 0x23, 0x47, 0x8c, 0x44, 0x6a, 0x7a, //* {.........#G.Djz */ 
+    /* 0x00002560 */ 0x1a, 0x82, 0x83, 0xaf, 0xe2, 0xb3, 0xcf, 0x86, 0xe3, 0x6e, 0x4c, 0x0c, 0x96, 0x2e, 0x5b, 0x81, //* .........nL...[. */ 
+    /* 0x00002570 */ 0x0b, 0x17, 0xce, 0xa3, 0x4f, 0xef, 0x3e, 0xd8, 0xbe, 0x7d, 0x3b, 0x4a, 0x95, 0x4a, 0xc4, 0x3f, //* ....O.>..};J.J.? */ 
+    /* 0x00002580 */ 0x7c, 0x88, 0xe3, 0xbe, 0xbe, 0xc7, 0x01, 0x2c, 0x05, 0xf0, 0x04, 0xc0, 0x84, 0xe5, 0xcb, 0x56, //* |......,.......V */ 
+    /* 0x00002590 */ 0x2c, 0x6b, 0xd1, 0xb2, 0x65, 0x87, 0xa4, 0x67, 0x89, 0xb2, 0xd5, 0xab, 0x56, 0x7d, 0xff, 0x3a, //* ,k..e..g....V}.: */ 
+    /* 0x000025a0 */ 0x06, 0xf5, 0xd7, 0xd1, 0x65, 0x4d, 0x76, 0x71, 0x59, 0x75, 0xa6, 0xd7, 0x47, 0xbd, 0x7a, 0x3d, //* ....eMvqYu..G.z= */ 
+    /* 0x000025b0 */ 0x79, 0xf2, 0x24, 0x72, 0xe1, 0xc2, 0x05, 0xb3, 0x12, 0x12, 0x12, 0x36, 0x03, 0xf0, 0xb9, 0x76, //* y.$r.......6...v */ 
+    /* 0x000025c0 */ 0xed, 0xda, 0x53, 0x3f, 0x3f, 0xbf, 0x6e, 0x9d, 0x3a, 0x77, 0x36, 0x87, 0x04, 0xe8, 0xdb, 0xa7, //* ..S??.n.:w6..... */ 
+    /* 0x000025d0 */ 0x37, 0xea, 0xd5, 0xab, 0x87, 0xac, 0xac, 0x6c, 0xa8, 0x54, 0x2a, 0x58, 0x98, 0x5b, 0x60, 0xf2, //* 7......l.T*X.[`. */ 
+    /* 0x000025e0 */ 0xe4, 0xc9, 0x90, 0xcb, 0x73, 0x31, 0x6d, 0xda, 0x54, 0x0c, 0x74, 0x70, 0xc0, 0x97, 0x93, 0xbe, //* ....s1m.T.tp.... */ 
+    /* 0x000025f0 */ 0xc4, 0xf5, 0xeb, 0xd7, 0x71, 0xfa, 0xb4, 0x1f, 0xe6, 0xcc, 0x9d, 0x0f, 0x63, 0x63, 0x63, 0xe4, //* ....q.......ccc. */ 
+    /* 0x00002600 */ 0xe7, 0xe7, 0x23, 0x2d, 0x2d, 0x0d, 0xd0, 0xbe, 0x2b, 0xc4, 0xc7, 0xc7, 0x07, 0xf7, 0xef, 0xdd, //* ..#--...+....... */ 
+    /* 0x00002610 */ 0x13, 0x6f, 0x60, 0xe7, 0xce, 0x9d, 0x68, 0xd1, 0xa2, 0x05, 0x0a, 0x15, 0x45, 0xf8, 0xe0, 0x83, //* .o`...h.....E... */ 
+    /* 0x00002620 */ 0x16, 0x08, 0x8f, 0x88, 0x80, 0x44, 0x22, 0x41, 0xb9, 0xaa, 0x0c, 0x8b, 0x16, 0x2f, 0x44, 0xaf, //* .....D"A...../D. */ 
+    /* 0x00002630 */ 0x5e, 0xbd, 0xd1, 0xbb, 0x77, 0x2f, 0x0c, 0x19, 0x32, 0x0c, 0x76, 0x76, 0xcd, 0xe1, 0x77, 0xf2, //* ^...w/..2.vv..w. */ 
+    /* 0x00002640 */ 0x24, 0x3e, 0xec, 0xda, 0x0d, 0xc5, 0x25, 0x25, 0x38, 0xfc, 0xe7, 0x11, 0x6c, 0xdf, 0xbe, 0x3d, //* $>....%%8...l..= */ 
+    /* 0x00002650 */ 0x31, 0x2e, 0x2e, 0xce, 0x09, 0xc0, 0x5a, 0x00, 0x72, 0x6d, 0xb1, 0xb1, 0x61, 0x61, 0xa1, 0x9e, //* 1.....Z.rm..aa.. */ 
+    /* 0x00002660 */ 0x72, 0xb9, 0x5c, 0x62, 0x6d, 0x6d, 0x3d, 0x44, 0x2e, 0xcf, 0x11, 0x64, 0x32, 0xd9, 0x5f, 0x43, //* r.\bmm=D...d2._C */ 
+    /* 0x00002670 */ 0xdd, 0xfd, 0x97, 0xbc, 0xf2, 0x16, 0xd2, 0xa5, 0x4b, 0x17, 0xbf, 0x41, 0x83, 0x06, 0x8f, 0x0c, //* ........K..A.... */ 
+    /* 0x00002680 */ 0x0e, 0x0e, 0xfe, 0xe9, 0xc6, 0x8d, 0x88, 0x8d, 0x5a, 0x35, 0x53, 0xc4, 0xda, 0xda, 0xba, 0x41, //* ........Z5S....A */ 
+    /* 0x00002690 */ 0x5a, 0x5a, 0xda, 0x72, 0x00, 0x73, 0x0e, 0x1e, 0x3c, 0xa0, 0x57, 0xa6, 0x2c, 0x43, 0x9f, 0x8f, //* ZZ.r.s..<.W.,C.. */ 
+    /* 0x000026a0 */ 0x3f, 0x86, 0x44, 0x22, 0xc1, 0x9e, 0xbd, 0x1e, 0x90, 0x65, 0x66, 0x23, 0x29, 0x29, 0x11, 0xab, //* ?.D".....ef#)).. */ 
+    /* 0x000026b0 */ 0x57, 0xaf, 0x42, 0x7a, 0x7a, 0x3a, 0x3c, 0xf6, 0x7a, 0x62, 0xf4, 0xe8, 0x51, 0x68, 0xdc, 0xb8, //* W.Bzz:<.zb..Qh.. */ 
+    /* 0x000026c0 */ 0x11, 0x2e, 0x5f, 0xba, 0x0a, 0x07, 0x07, 0x07, 0x38, 0x3a, 0x3a, 0x20, 0x32, 0xf2, 0x26, 0x96, //* .._.....8:: 2.&. */ 
+    /* 0x000026d0 */ 0x2d, 0x5b, 0x8e, 0x5b, 0xb7, 0xa2, 0xc5, 0xb2, 0x47, 0x8f, 0x1e, 0x8d, 0xa5, 0x4b, 0x97, 0xa2, //* -[.[....G....K.. */ 
+    /* 0x000026e0 */ 0x7b, 0xf7, 0xee, 0x50, 0xab, 0xd5, 0x08, 0x0b, 0x0b, 0x83, 0xb7, 0xf7, 0x21, 0xb4, 0x6e, 0xdd, //* {..P........!.n. */ 
+    /* 0x000026f0 */ 0x1a, 0x12, 0x09, 0xe0, 0xe5, 0x75, 0x00, 0x83, 0x06, 0x0d, 0x41, 0x7a, 0x7a, 0x1a, 0xe2, 0x1f, //* .....u....Azz... */ 
+    /* 0x00002700 */ 0xc6, 0x63, 0xe6, 0xd7, 0x5f, 0xc3, 0xc8, 0xc8, 0x18, 0xd3, 0xa7, 0xcf, 0x40, 0x74, 0x74, 0x34, //* .c.._.......@tt4 */ 
+    /* 0x00002710 */ 0x76, 0xee, 0xdc, 0xa5, 0xdc, 0xb7, 0xcf, 0x73, 0x0b, 0x80, 0x4d, 0x95, 0x04, 0xf1, 0x77, 0x74, //* v......s..M...wt */ 
+    /* 0x00002720 */ 0x03, 0x90, 0x0c, 0x20, 0x4b, 0x37, 0xe1, 0xbf, 0xe5, 0x95, 0x0b, 0x04, 0x80, 0x0d, 0x80, 0x7a, //* ... K7.........z */ 
+    /* 0x00002730 */ 0xff, 0x87, 0x77, 0x3c, 0xd9, 0x03, 0x58, 0xa9, 0xa7, 0x8f, 0x81, 0x41, 0x81, 0x57, 0xd0, 0xbf, //* ..w<..X....A.W.. */ 
+    /* 0x00002740 */ 0x7f, 0x7f, 0x64, 0xc9, 0xb2, 0xf0, 0x95, 0xd3, 0x54, 0x74, 0xea, 0xdc, 0x19, 0x29, 0xc9, 0xc9, //* ..d.....Tt...).. */ 
+    /* 0x00002750 */ 0x08, 0xbb, 0x76, 0x1d, 0x6e, 0x6b, 0xd6, 0x20, 0xe9, 0x59, 0x12, 0xe4, 0x39, 0x39, 0x98, 0x33, //* ..v.nk. .Y..99.3 */ 
+    /* 0x00002760 */ 0xe7, 0x3b, 0xb4, 0x6c, 0xd9, 0x52, 0x2c, 0x20, 0x23, 0x23, 0x03, 0xc7, 0x8e, 0x1d, 0xc3, 0xef, //* .;.l.R, ##...... */ 
+    /* 0x00002770 */ 0x7f, 0xec, 0xc2, 0xcf, 0x3f, 0x2d, 0xc1, 0xe8, 0xd1, 0xa3, 0x50, 0xb7, 0x6e, 0x5d, 0x08, 0x82, //* ....?-....P.n].. */ 
+    /* 0x00002780 */ 0x20, 0xaa, 0xc2, 0xd9, 0xd9, 0x32, 0x9c, 0x3b, 0x77, 0x16, 0x37, 0x6f, 0x44, 0xe2, 0xee, 0xbd, //*  ....2.;w.7oD... */ 
+    /* 0x00002790 */ 0x18, 0x84, 0x87, 0xdf, 0xc0, 0xae, 0xdd, 0xbb, 0xf1, 0xfc, 0xd9, 0x33, 0x0c, 0x72, 0x1c, 0x84, //* ...........3.r.. */ 
+    /* 0x000027a0 */ 0xd0, 0xb0, 0x10, 0xd4, 0xaf, 0x5f, 0x1f, 0x73, 0xe6, 0xcc, 0xbd, 0xa4, 0xb5, 0x42, 0xd1, 0x2c, //* ....._.s.....B., */ 
+    /* 0x000027b0 */ 0x1b, 0xfc, 0x0f, 0x33, 0xce, 0x50, 0xdf, 0xe8, 0xd1, 0xee, 0x5d, 0xbb, 0x79, 0x37, 0x26, 0x86, //* ...3.P....].y7&. */ 
+    /* 0x000027c0 */ 0xae, 0xae, 0xae, 0xf4, 0xf6, 0xf6, 0x66, 0xaf, 0x5e, 0xbd, 0xd8, 0xb0, 0x51, 0x63, 0xf6, 0xec, //* ......f.^...Qc.. */ 
+    /* 0x000027d0 */ 0xf9, 0x11, 0xcf, 0x9c, 0x39, 0xc3, 0xe2, 0xe2, 0x12, 0x0a, 0x82, 0x20, 0xfa, 0xa6, 0x57, 0xcc, //* ....9...... ..W. */ 
+    /* 0x000027e0 */ 0xfa, 0xd5, 0x6a, 0x35, 0xb3, 0xb3, 0xb3, 0xc5, 0xef, 0x15, 0x0b, 0x81, 0x9a, 0xb5, 0x28, 0x4d, //* ..j5..........(M */ 
+    /* 0x000027f0 */ 0xbc, 0xac, 0x5c, 0xb9, 0x9c, 0xf3, 0xe6, 0xce, 0xe3, 0x07, 0x2d, 0x3e, 0xe0, 0xc4, 0x49, 0x53, //* ..\.......->..IS */ 
+    /* 0x00002800 */ 0x78, 0xf2, 0xe4, 0x09, 0x6e, 0xdd, 0xba, 0xa5, 0x62, 0x43, 0x2b, 0x17, 0xc0, 0x22, 0xdd, 0x9b, //* x...n...bC+..".. */ 
+    /* 0x00002810 */ 0xfa, 0xa7, 0x78, 0x1d, 0x2d, 0xe4, 0x3f, 0xc1, 0x08, 0xc0, 0x62, 0x00, 0xce, 0x47, 0x8e, 0x1c, //* ..x.-.?...b..G.. */ 
+    /* 0x00002820 */ 0x31, 0x28, 0x29, 0x2e, 0x86, 0xaa, 0xac, 0x1c, 0x8f, 0x93, 0x9e, 0x42, 0xa9, 0x54, 0xc2, 0xa6, //* 1()........B.T.. */ 
+    /* 0x00002830 */ 0xa9, 0x0d, 0x26, 0x4c, 0x98, 0x80, 0xa6, 0x4d, 0x35, 0x6f, 0x60, 0xab, 0xbc, 0x36, 0xa6, 0x3b, //* ..&L...M5o`..6.; */ 
+    /* 0x00002840 */ 0x29, 0xac, 0x40, 0x2a, 0x95, 0xa2, 0xbc, 0x4c, 0x89, 0xb0, 0x6b, 0xd7, 0xb1, 0x73, 0xe7, 0x6e, //* ).@*...L..k..s.n */ 
+    /* 0x00002850 */ 0x4c, 0x9b, 0x3a, 0x0d, 0xb5, 0xea, 0xd4, 0xc2, 0xa5, 0xa0, 0x20, 0x18, 0x1b, 0x1b, 0xe3, 0xa3, //* L.:....... ..... */ 
+    /* 0x00002860 */ 0x8f, 0x7a, 0xe0, 0xe0, 0x41, 0xef, 0x9c, 0x43, 0x87, 0xbc, 0xa7, 0x01, 0x38, 0x53, 0xe5, 0xe2, //* .z..A..C....8S.. */ 
+    /* 0x00002870 */ 0x7f, 0x90, 0xd7, 0x31, 0xa8, 0xff, 0x27, 0x58, 0x8e, 0x19, 0x33, 0xe6, 0xb3, 0xe5, 0xcb, 0x57, //* ...1..'X..3....W */ 
+    /* 0x00002880 */ 0x74, 0x55, 0xab, 0xd5, 0x52, 0x2f, 0x2f, 0x2f, 0x34, 0x6a, 0xdc, 0x18, 0x3d, 0x7a, 0xf6, 0xc4, //* tU..R///4j..=z.. */ 
+    /* 0x00002890 */ 0xb7, 0xdf, 0x7c, 0x8b, 0x1c, 0x79, 0x36, 0x5c, 0x57, 0xb9, 0xc2, 0xd4, 0xd4, 0x14, 0xef, 0xbd, //* ..|..y6\W....... */ 
+    /* 0x000028a0 */ 0xf7, 0x1e, 0x0c, 0x0c, 0x0c, 0xfe, 0xb2, 0x60, 0x09, 0xed, 0x60, 0x25, 0x95, 0x6a, 0x16, 0x02, //* .......`..`%.j.. */ 
+    /* 0x000028b0 */ 0x53, 0x52, 0x52, 0xb0, 0x79, 0xf3, 0x16, 0x24, 0x24, 0x24, 0x60, 0xe9, 0xd2, 0x9f, 0xd1, 0xa3, //* SRR.y..$$$`..... */ 
+    /* 0x000028c0 */ 0x67, 0x77, 0x28, 0x14, 0x0a, 0xac, 0x59, 0xe3, 0x8a, 0x63, 0xc7, 0x7c, 0xb2, 0x2c, 0x2c, 0x2c, //* gw(...Y..c.|.,,, */ 
+    /* 0x000028d0 */ 0xa2, 0x87, 0x0c, 0x1d, 0xdc, 0x62, 0x90, 0xe3, 0xe0, 0xd1, 0x25, 0x25, 0xa5, 0x66, 0x89, 0x89, //* .....b....%%.f.. */ 
+    /* 0x000028e0 */ 0x4f, 0x23, 0x00, 0xbc, 0x7c, 0x6f, 0xdf, 0xff, 0x30, 0xc3, 0x5d, 0x5d, 0xd7, 0xa4, 0xed, 0xde, //* O#..|o..0.]].... */ 
+    /* 0x000028f0 */ 0xed, 0xc1, 0xc5, 0x4b, 0x7e, 0x8a, 0x06, 0xd0, 0x07, 0x80, 0x13, 0x80, 0xdc, 0x6d, 0xdb, 0xb6, //* ...K~........m.. */ 
+    /* 0x00002900 */ 0x8b, 0x21, 0x01, 0x33, 0x32, 0x32, 0xb8, 0x61, 0xc3, 0x06, 0xce, 0x9a, 0x35, 0x8b, 0x77, 0xef, //* .!.322.a....5.w. */ 
+    /* 0x00002910 */ 0xde, 0xad, 0xd2, 0x65, 0xa9, 0xd4, 0x6a, 0xaa, 0xb4, 0x9b, 0x48, 0xf9, 0xf9, 0xf9, 0x3c, 0x74, //* ...e..j...H...<t */ 
+    /* 0x00002920 */ 0xe8, 0x30, 0x27, 0x4c, 0x98, 0xc0, 0xab, 0x57, 0xaf, 0x88, 0x6b, 0x68, 0x0f, 0x1f, 0xc6, 0x57, //* .0'L...W..kh...W */ 
+    /* 0x00002930 */ 0x98, 0x06, 0x1d, 0x01, 0x50, 0xf1, 0x0a, 0x8a, 0xfe, 0xee, 0xee, 0xeb, 0x1e, 0x1f, 0x3e, 0xfc, //* ....P.........>. */ 
+    /* 0x00002940 */ 0x27, 0x9d, 0x9d, 0x57, 0x3d, 0xd1, 0xbe, 0x4d, 0xfa, 0x7f, 0x9a, 0xb5, 0x6b, 0xdd, 0xd7, 0x73, //* '..W=..M....k..s */ 
+    /* 0x00002950 */ 0xc3, 0x2f, 0x1b, 0x8b, 0xed, 0x9a, 0x7f, 0xb0, 0xa0, 0xc2, 0x3a, 0x5d, 0x8b, 0x1d, 0x80, 0x43, //* ./........:]...C */ 
+    /* 0x00002960 */ 0x33, 0xbe, 0x9e, 0xc1, 0xa8, 0x68, 0xcd, 0xdb, 0x70, 0x48, 0xf2, 0xe6, 0xcd, 0x9b, 0x9c, 0x34, //* 3....h..pH.....4 */ 
+    /* 0x00002970 */ 0xe9, 0x4b, 0x6e, 0xda, 0xb4, 0x89, 0x2f, 0x5e, 0xbc, 0x10, 0xcf, 0x0b, 0x82, 0xc0, 0x98, 0x98, //* .Kn.../^........ */ 
+    /* 0x00002980 */ 0x18, 0x4e, 0x9e, 0x3c, 0x99, 0x3b, 0x76, 0xec, 0x60, 0x76, 0xb6, 0x4c, 0x2b, 0x20, 0xcd, 0x2e, //* .N.<.;v.`v.L+ .. */ 
+    /* 0x00002990 */ 0x9f, 0x95, 0x55, 0x83, 0x27, 0x00, 0xc6, 0x54, 0x2a, 0xbf, 0x02, 0xb3, 0x7e, 0xfd, 0xfa, 0x6f, //* ..U.'..T*...~..o */ 
+    /* 0x000029a0 */ 0x76, 0x75, 0x5d, 0xc3, 0xae, 0x5d, 0xbb, 0xbe, 0x95, 0xaf, 0x63, 0x7d, 0x63, 0xd8, 0xd8, 0xda, //* vu]..]....c}c... */ 
+    /* 0x000029b0 */ 0x7e, 0xf3, 0x51, 0xaf, 0xde, 0x41, 0x00, 0x3a, 0xe8, 0xa6, 0x55, 0xa2, 0x1f, 0x80, 0xb0, 0xad, //* ~.Q..A.:..U..... */ 
+    /* 0x000029c0 */ 0x5b, 0xb7, 0x8a, 0x71, 0xd9, 0x8b, 0x8a, 0x8a, 0xe8, 0xeb, 0x7b, 0x82, 0xc3, 0x87, 0x7f, 0xc6, //* [..q......{..... */ 
+    /* 0x000029d0 */ 0xf3, 0xe7, 0xcf, 0x31, 0x25, 0xe5, 0x39, 0xb7, 0x6f, 0xdf, 0xce, 0xaf, 0xa6, 0x4e, 0xe3, 0xed, //* ...1%.9.o....N.. */ 
+    /* 0x000029e0 */ 0xdb, 0x15, 0xa1, 0x5f, 0xd5, 0x8c, 0x8a, 0x8a, 0xe2, 0x57, 0x5f, 0x4d, 0x2d, 0x01, 0xb0, 0x4e, //* ..._.....W_M-..N */ 
+    /* 0x000029f0 */ 0xab, 0xf9, 0xfd, 0xff, 0x68, 0x05, 0x40, 0xe3, 0x27, 0x57, 0xc3, 0xbf, 0x45, 0x0a, 0x60, 0x7e, //* ....h.@.'W..E.`~ */ 
+    /* 0x00002a00 */ 0xcf, 0x9e, 0x3d, 0x73, 0x02, 0x02, 0x02, 0xc4, 0x90, 0x4c, 0xc9, 0xc9, 0xcf, 0xe9, 0xe2, 0xe2, //* ..=s.....L...... */ 
+    /* 0x00002a10 */ 0x4c, 0x1b, 0xdb, 0xf7, 0xe8, 0xe5, 0xe5, 0x2d, 0x06, 0xb6, 0xcc, 0xcc, 0x7c, 0xc1, 0xcd, 0x9b, //* L......-....|... */ 
+    /* 0x00002a20 */ 0x37, 0x11, 0xc0, 0x55, 0x00, 0x9a, 0xd7, 0x7f, 0xd6, 0xf0, 0x5a, 0xb0, 0x03, 0xb0, 0x7f, 0xc9, //* 7..U......Z..... */ 
+    /* 0x00002a30 */ 0x92, 0x25, 0x8c, 0x8d, 0x8d, 0x25, 0x49, 0xca, 0xe5, 0x39, 0x5c, 0xed, 0xba, 0x86, 0xca, 0xb2, //* .%...%I..9\..... */ 
+    /* 0x00002a40 */ 0x32, 0x96, 0x96, 0x96, 0xf2, 0xfc, 0xf9, 0xf3, 0x1c, 0x38, 0x70, 0x60, 0x91, 0xd6, 0xf7, 0xe3, //* 2........8p`.... */ 
+    /* 0x00002a50 */ 0x6d, 0x51, 0x5a, 0xde, 0x79, 0xfa, 0x00, 0x08, 0xf7, 0xf4, 0xdc, 0xcb, 0x84, 0x87, 0x09, 0xdc, //* mQZ.y........... */ 
+    /* 0x00002a60 */ 0xb8, 0x69, 0x13, 0xe3, 0xe2, 0xe3, 0x2a, 0xe6, 0x15, 0x3e, 0xff, 0xa6, 0x0b, 0xac, 0xe1, 0x35, //* .i....*..>.....5 */ 
+    /* 0x00002a70 */ 0xa1, 0x0f, 0x60, 0x85, 0xbd, 0x7d, 0x7f, 0x45, 0xef, 0xde, 0x7d, 0x68, 0xd7, 0xbc, 0xf9, 0x53, //* ..`..}.E..}h...S */ 
+    /* 0x00002a80 */ 0x00, 0x43, 0x75, 0x33, 0xd5, 0xf0, 0xe6, 0xe9, 0xa8, 0x9d, 0x54, 0xfe, 0xbb, 0x41, 0xbb, 0x86, //* .Cu3......T..A.. */ 
+    /* 0x00002a90 */ 0x1a, 0x6a, 0xa8, 0xa1, 0x86, 0x57, 0xcb, 0xff, 0x03, 0xe2, 0x43, 0x25, 0x36, 0xf6, 0x4b, 0xb6, //* .j...W....C%6.K. */ 
+    /* 0x00002aa0 */ 0xff, 0x00, 0x00, 0x00, 0x00, 0x49, 0x45, 0x4e, 0x44, 0xae, 0x42, 0x60, 0x82, 0x03, 0x04, 0x03, //* .....IEND.B`.... */ 
+    /* 0x00002ab0 */ 0x04, 0x00, 0xbe, 0x93, 0x3b, 0xf7, 0x05, 0x01, 0x00, 0x0c, 0x01, 0x04, 0x00, 0xdd, 0x25, 0x00, //* ....;.........%. */ 
+    /* 0x00002ac0 */ 0x00, 0x02, 0x04, 0x00, 0x32, 0xc9, 0x18, 0x69, 0x00, 0x00, 0x00, 0x00, 0x01, 0x0a, 0x66, 0x69, //* ....2..i......fi */ 
+    /* 0x00002ad0 */ 0x6c, 0x65, 0x31, 0x2e, 0x74, 0x78, 0x74, 0x00, 0x15, 0x00, 0x00, 0x00, 0x4f, 0x16, 0x4e, 0x21, //* le1.txt.....O.N! */ 
+    /* 0x00002ae0 */ 0x48, 0x65, 0x6c, 0x6c, 0x6f, 0x2c, 0x20, 0x74, 0x68, 0x69, 0x73, 0x20, 0x69, 0x73, 0x20, 0x66, //* Hello, this is f */ 
+    /* 0x00002af0 */ 0x69, 0x6c, 0x65, 0x31, 0x2e, 0x00, 0x02, 0x01, 0x04, 0x00, 0x15, 0x00, 0x00, 0x00, 0x02, 0x04, //* ile1............ */ 
+    /* 0x00002b00 */ 0x00, 0x32, 0xc9, 0x18, 0x69, 0x00, 0x00, 0x00, 0x00, //* .2..i.... */ 
+};
+
+const size_t mock_test_lz4_data_len = 11017;
+const uint32_t mock_test_lz4_data_crc32 = 0xe4b47d93;
+
+const char mock_test_lz4_data_binary_modified_date[] = "2026-10-19 00:45:12";
+const char mock_test_lz4_data_c_generated_date[] = "2026-10-19 00:45:12";
+const char mock_test_lz4_data_c_compiled_date[] = __DATE__ " " __TIME__;
@@ -0,0 +1,678 @@
+#include "mock_test_merkle_data.h"
+
+const unsigned char mock_test_merkle_data[] = {
+    /* 0x00000000 */ 0x44, 0x52, 0x4f, 0x46, 0x53, 0x71, 0x00, 0xab, 0xfb, 0x02, 0x0a, 0x74, 0x65, 0x73, 0x74, 0x5f, //* DROFSq.....test_ */ 
+    /* 0x00000010 */ 0x64, 0x61, 0x74, 0x61, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x02, //* data............ */ 
+    /* 0x00000020 */ 0x04, 0x00, 0x6c, 0x5b, 0xd5, 0x6a, 0x05, 0x01, 0x00, 0x0f, 0x04, 0x04, 0x00, 0x1a, 0x29, 0x00, //* ..l[.j........). */ 
+    /* 0x00000030 */ 0x00, 0x09, 0x04, 0x00, 0x01, 0x9f, 0x9a, 0x1d, 0x08, 0x10, 0x00, 0x8d, 0x11, 0xd2, 0x0b, 0xcd, //* ................ */ 
+    /* 0x00000040 */ 0x3f, 0xdb, 0x8f, 0x32, 0xc9, 0x78, 0x62, 0xa4, 0x00, 0xe9, 0xe2, 0x04, 0x00, 0x00, 0x00, 0x56, //* ?..2.xb........V */ 
+    /* 0x00000050 */ 0x00, 0x00, 0x00, 0xc7, 0x00, 0x00, 0x00, 0x6e, 0x03, 0x00, 0x00, 0xdd, 0x28, 0x00, 0x00, 0x02, //* .......n....(... */ 
+    /* 0x00000060 */ 0x0a, 0x73, 0x75, 0x62, 0x66, 0x6f, 0x6c, 0x64, 0x65, 0x72, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, //* .subfolder...... */ 
+    /* 0x00000070 */ 0x00, 0x00, 0x00, 0x00, 0x02, 0x02, 0x04, 0x00, 0x6c, 0x5b, 0xd5, 0x6a, 0x08, 0x04, 0x00, 0x99, //* ........l[.j.... */ 
+    /* 0x00000080 */ 0x37, 0x04, 0x97, 0x01, 0x00, 0x00, 0x00, 0x82, 0x00, 0x00, 0x00, 0x01, 0x0a, 0x66, 0x69, 0x6c, //* 7............fil */ 
+    /* 0x00000090 */ 0x65, 0x32, 0x2e, 0x74, 0x78, 0x74, 0x00, 0x1d, 0x00, 0x00, 0x00, 0x93, 0x23, 0x7a, 0x1e, 0x54, //* e2.txt......#z.T */ 
+    /* 0x000000a0 */ 0x68, 0x69, 0x73, 0x20, 0x69, 0x73, 0x20, 0x66, 0x69, 0x6c, 0x65, 0x32, 0x20, 0x69, 0x6e, 0x20, //* his is file2 in  */ 
+    /* 0x000000b0 */ 0x61, 0x20, 0x73, 0x75, 0x62, 0x66, 0x6f, 0x6c, 0x64, 0x65, 0x72, 0x2e, 0x00, 0x02, 0x01, 0x04, //* a subfolder..... */ 
+    /* 0x000000c0 */ 0x00, 0x1d, 0x00, 0x00, 0x00, 0x02, 0x04, 0x00, 0x32, 0xc9, 0x18, 0x69, 0x00, 0x00, 0x00, 0x00, //* ........2..i.... */ 
+    /* 0x000000d0 */ 0x01, 0x0e, 0x6c, 0x6f, 0x6e, 0x67, 0x5f, 0x66, 0x69, 0x6c, 0x65, 0x2e, 0x74, 0x78, 0x74, 0x00, //* ..long_file.txt. */ 
+    /* 0x000000e0 */ 0x74, 0x02, 0x00, 0x00, 0x6c, 0x78, 0x21, 0xc8, 0x78, 0xda, 0x7d, 0x94, 0x4d, 0x6e, 0x1b, 0x31, //* t...lx!.x.}.Mn.1 */ 
+    /* 0x000000f0 */ 0x0c, 0x85, 0xf7, 0x06, 0x7c, 0x07, 0x1e, 0xc0, 0xf0, 0x15, 0xba, 0x69, 0x77, 0x45, 0x80, 0xa2, //* ....|......iwE.. */ 
+    /* 0x00000100 */ 0xe8, 0x01, 0x18, 0x89, 0x49, 0x08, 0xe8, 0x2f, 0x92, 0x18, 0xe4, 0xf8, 0x7d, 0xd4, 0x8c, 0x93, //* ....I../....}... */ 
+    /* 0x00000110 */ 0x71, 0x50, 0x74, 0x63, 0x78, 0xc6, 0x12, 0xc9, 0xf7, 0xf8, 0x3e, 0xff, 0xac, 0x5d, 0x32, 0x69, //* qPtcx.....>..]2i */ 
+    /* 0x00000120 */ 0x1b, 0x96, 0x29, 0xd6, 0x54, 0x3b, 0x0d, 0x9d, 0xc4, 0x59, 0xe6, 0x85, 0x42, 0x2d, 0x43, 0xc2, //* ..).T;...Y..B-C. */ 
+    /* 0x00000130 */ 0x94, 0x69, 0x9d, 0x38, 0x6a, 0xd3, 0x11, 0xb4, 0x3c, 0x93, 0x24, 0xc5, 0x8f, 0x43, 0x22, 0x2e, //* .i.8j...<.$..C". */ 
+    /* 0x00000140 */ 0x90, 0xa8, 0x8d, 0x5c, 0x23, 0x4d, 0xc9, 0x0d, 0x97, 0xb5, 0x04, 0x8d, 0x1a, 0xad, 0x4c, 0xb2, //* ...\#M........L. */ 
+    /* 0x00000150 */ 0x49, 0x89, 0x1f, 0x51, 0x9e, 0x64, 0x6e, 0xa5, 0x85, 0x32, 0x3f, 0x17, 0x26, 0x4e, 0xfa, 0x6a, //* I..Q.dn..2?.&N.j */ 
+    /* 0x00000160 */ 0x7c, 0xa5, 0xf3, 0xe9, 0xcf, 0x24, 0x29, 0x9a, 0x51, 0x9d, 0xb2, 0xfa, 0x97, 0x37, 0x3c, 0x72, //* |....$).Q....7<r */ 
+    /* 0x00000170 */ 0xbe, 0xd0, 0xab, 0xe9, 0xa0, 0x52, 0xc7, 0xec, 0x16, 0x49, 0xde, 0xa5, 0x07, 0x9d, 0x3c, 0xb5, //* .....R...I....<. */ 
+    /* 0x00000180 */ 0x16, 0xb2, 0x94, 0x38, 0x87, 0xba, 0xd5, 0xf6, 0x43, 0x3a, 0xd4, 0x7b, 0xad, 0xa2, 0xda, 0x70, //* ...8....C:.{...p */ 
+    /* 0x00000190 */ 0x98, 0x84, 0x31, 0x7a, 0xc6, 0x54, 0x75, 0x93, 0x80, 0x66, 0xd3, 0xbb, 0x7d, 0xf7, 0xa2, 0x6c, //* ..1z.Tu..f..}..l */ 
+    /* 0x000001a0 */ 0x53, 0x48, 0xbb, 0x61, 0x9a, 0x4d, 0xaf, 0x16, 0xea, 0xd2, 0xba, 0xbc, 0x48, 0x89, 0xd2, 0x21, //* SH.a.M......H..! */ 
+    /* 0x000001b0 */ 0x1e, 0x2f, 0xde, 0x6a, 0xb2, 0x86, 0x86, 0x82, 0x81, 0xa0, 0x96, 0x64, 0x0c, 0xa1, 0xa0, 0x29, //* ./.j.......d...) */ 
+    /* 0x000001c0 */ 0xdd, 0x5c, 0x82, 0x28, 0xa3, 0x27, 0x7b, 0x56, 0x9e, 0x54, 0x7c, 0x24, 0x6a, 0xdc, 0xf1, 0x60, //* .\.(.'{V.T|$j..` */ 
+    /* 0x000001d0 */ 0xdd, 0x1b, 0xfd, 0x78, 0x0f, 0xd2, 0xa6, 0x98, 0x9b, 0x09, 0x27, 0x6a, 0x08, 0x2c, 0x01, 0x27, //* ...x......'j.,.' */ 
+    /* 0x000001e0 */ 0x83, 0x35, 0x8d, 0x3c, 0xfd, 0x0e, 0x94, 0xb4, 0x5e, 0x35, 0x4a, 0x71, 0x2f, 0xdd, 0x2f, 0xb4, //* .5.<....^5Jq/./. */ 
+    /* 0x000001f0 */ 0x0d, 0x96, 0x1a, 0xbb, 0x76, 0xaa, 0x4f, 0x4f, 0x1a, 0x94, 0x29, 0xca, 0x90, 0xee, 0xbf, 0xe6, //* ....v.OO..)..... */ 
+    /* 0x00000200 */ 0x9a, 0x7c, 0x10, 0x76, 0x93, 0x14, 0x96, 0x8c, 0xdd, 0x5d, 0xcb, 0xd7, 0xf3, 0xe9, 0x7c, 0xfa, //* .|.v.....]....|. */ 
+    /* 0x00000210 */ 0x8d, 0x6d, 0xc0, 0x84, 0x26, 0x7d, 0x34, 0xbf, 0x38, 0xa1, 0xd4, 0xa0, 0x87, 0x6a, 0x86, 0x41, //* .m..&}4.8....j.A */ 
+    /* 0x00000220 */ 0xa4, 0x03, 0x52, 0x0a, 0xc6, 0x1b, 0x24, 0xbd, 0xef, 0x4b, 0xfe, 0x10, 0x09, 0xff, 0x43, 0xb0, //* ..R...$..K....C. */ 
+    /* 0x00000230 */ 0xc1, 0x65, 0xea, 0x87, 0xbe, 0xfc, 0x6a, 0x82, 0x0e, 0x16, 0xb7, 0xb7, 0x17, 0x9a, 0x75, 0x72, //* .e....j.......ur */ 
+    /* 0x00000240 */ 0x26, 0x0f, 0xcb, 0xf9, 0xc4, 0xe8, 0xb3, 0xd6, 0x24, 0xec, 0xc7, 0x90, 0x1e, 0x9f, 0x9a, 0x85, //* &.......$....... */ 
+    /* 0x00000250 */ 0xf8, 0x91, 0x60, 0x52, 0x85, 0x16, 0x2c, 0x72, 0xba, 0x4d, 0x6f, 0x6e, 0xe9, 0x1a, 0x07, 0x29, //* ..`R..,r.Mon...) */ 
+    /* 0x00000260 */ 0xc0, 0x19, 0x2c, 0x8b, 0x7b, 0x78, 0xd1, 0x89, 0x60, 0x55, 0x7a, 0x14, 0xb8, 0x81, 0x43, 0xea, //* ..,.{x..`Uz...C. */ 
+    /* 0x00000270 */ 0x9f, 0x51, 0xc3, 0xe4, 0xcd, 0x0b, 0x79, 0x6f, 0x49, 0x03, 0xf4, 0xb9, 0x9b, 0x0f, 0x92, 0xeb, //* .Q....yoI....... */ 
+    /* 0x00000280 */ 0x16, 0x13, 0x6f, 0x94, 0x8f, 0x73, 0xc3, 0x2a, 0xbe, 0x3d, 0x8f, 0x2d, 0xb9, 0x03, 0xb3, 0xb9, //* ..o..s.*.=.-.... */ 
+    /* 0x00000290 */ 0xd2, 0xee, 0x9b, 0xa6, 0x1a, 0xfd, 0x1d, 0xbe, 0xf8, 0xae, 0xf6, 0xd4, 0xae, 0x4b, 0x7b, 0x30, //* .............K{0 */ 
+    /* 0x000002a0 */ 0xd0, 0x0c, 0x27, 0x3d, 0x96, 0xba, 0x0b, 0x1f, 0xe8, 0x28, 0x75, 0xac, 0x2d, 0xf4, 0x15, 0x39, //* ..'=.....(u.-..9 */ 
+    /* 0x000002b0 */ 0x39, 0x76, 0xf4, 0x4b, 0x4a, 0x45, 0x80, 0x02, 0xee, 0x5e, 0xe9, 0x41, 0xdc, 0x01, 0x44, 0xbf, //* 9v.KJE...^.A..D. */ 
+    /* 0x000002c0 */ 0xd7, 0x15, 0x5a, 0x48, 0xcc, 0xbe, 0x9d, 0x15, 0xe1, 0x9b, 0x97, 0x3b, 0x5f, 0xab, 0xf1, 0x27, //* ..ZH.......;_..' */ 
+    /* 0x000002d0 */ 0x64, 0xf0, 0xf1, 0x2b, 0x66, 0x97, 0x0f, 0xce, 0xb6, 0xe0, 0x1d, 0x06, 0xf6, 0xc4, 0x14, 0xcb, //* d..+f........... */ 
+    /* 0x000002e0 */ 0x5b, 0x7d, 0x40, 0x87, 0x44, 0x44, 0xdd, 0xb1, 0xe3, 0x8d, 0xbb, 0xff, 0x52, 0xb7, 0xf6, 0xb6, //* [}@.DD......R... */ 
+    /* 0x000002f0 */ 0xc0, 0xcb, 0x6b, 0x57, 0xd0, 0x76, 0xd0, 0x75, 0xa5, 0xaf, 0x28, 0xf2, 0xbf, 0x58, 0xcc, 0x77, //* ..kW.v.u..(..X.w */ 
+    /* 0x00000300 */ 0x2c, 0x42, 0xd8, 0xa2, 0x11, 0x0a, 0x7a, 0x5b, 0x30, 0x0e, 0xc3, 0xe8, 0x6d, 0x69, 0xdb, 0xf8, //* ,B....z[0...mi.. */ 
+    /* 0x00000310 */ 0xac, 0xc3, 0x2b, 0xdc, 0x33, 0x1a, 0xef, 0x18, 0xd5, 0x4f, 0x46, 0xad, 0x7f, 0xa3, 0x5f, 0x37, //* ..+.3....OF..._7 */ 
+    /* 0x00000320 */ 0x46, 0xfd, 0xbf, 0x20, 0x81, 0x32, 0x98, 0xe7, 0xac, 0xde, 0x23, 0xea, 0xde, 0x82, 0x17, 0xe1, //* F.. .2....#..... */ 
+    /* 0x00000330 */ 0x03, 0xa9, 0xe7, 0xd3, 0x81, 0xd5, 0x25, 0xb3, 0xe8, 0x8b, 0x26, 0x27, 0x07, 0xfb, 0x50, 0x04, //* ......%...&'..P. */ 
+    /* 0x00000340 */ 0xec, 0xd0, 0xe8, 0xb2, 0xaa, 0x6f, 0x40, 0x1f, 0x17, 0xe5, 0xfd, 0x76, 0xac, 0x5f, 0xad, 0x7e, //* .....o@....v._.~ */ 
+    /* 0x00000350 */ 0x46, 0xeb, 0x9e, 0xf1, 0x6f, 0xe7, 0xd3, 0x5f, 0x76, 0x44, 0xea, 0x8e, 0x01, 0x03, 0x03, 0x04, //* F...o.._vD...... */ 
+    /* 0x00000360 */ 0x00, 0x59, 0x01, 0x89, 0x71, 0x01, 0x04, 0x00, 0x38, 0x05, 0x00, 0x00, 0x02, 0x04, 0x00, 0x32, //* .Y..q...8......2 */ 
+    /* 0x00000370 */ 0xc9, 0x18, 0x69, 0x00, 0x00, 0x00, 0x00, 0x01, 0x0c, 0x64, 0x72, 0x6f, 0x66, 0x73, 0x32, 0x73, //* ..i......drofs2s */ 
+    /* 0x00000380 */ 0x2e, 0x70, 0x6e, 0x67, 0x00, 0x3e, 0x25, 0x00, 0x00, 0x58, 0x5f, 0x60, 0xe4, 0x78, 0xda, 0x5d, //* .png.>%..X_`.x.] */ 
+    /* 0x00000390 */ 0x9a, 0x05, 0x50, 0x1c, 0xd1, 0xd6, 0xad, 0x7b, 0x70, 0x77, 0xf7, 0xe0, 0x10, 0x82, 0x06, 0x27, //* ..P....{pw.....' */ 
+    /* 0x000003a0 */ 0x68, 0x0c, 0x77, 0x77, 0x08, 0x12, 0x12, 0xdc, 0x82, 0x0f, 0xee, 0x92, 0x90, 0xc1, 0xdd, 0x3d, //* h.ww...........= */ 
+    /* 0x000003b0 */ 0xb8, 0xbb, 0xbb, 0x5b, 0xb0, 0xe0, 0x12, 0xdc, 0x1d, 0xfe, 0xce, 0xbd, 0xb7, 0xea, 0x55, 0xbd, //* ...[..........U. */ 
+    /* 0x000003c0 */ 0xa9, 0x3a, 0xb4, 0x4c, 0x4f, 0xf7, 0xf4, 0xd9, 0x7b, 0xaf, 0xfd, 0xad, 0x1e, 0x42, 0x95, 0x14, //* .:.LO...{....B.. */ 
+    /* 0x000003d0 */ 0x3e, 0x60, 0xa2, 0x91, 0xa1, 0x01, 0x00, 0x80, 0x29, 0xfd, 0xf1, 0xad, 0x0a, 0xb8, 0xfc, 0xf4, //* >`......)....... */ 
+    /* 0x000003e0 */ 0x6f, 0xa0, 0x20, 0x81, 0x7f, 0xed, 0xd6, 0x61, 0x6a, 0xe0, 0x02, 0xe2, 0xa8, 0xf2, 0x41, 0x12, //* o. ....aj.....A. */ 
+    /* 0x000003f0 */ 0x28, 0x1b, 0xa5, 0xd8, 0x03, 0x37, 0x10, 0x2c, 0x24, 0xe4, 0x25, 0x00, 0xa0, 0x22, 0x1a, 0xfd, //* (....7.,$.%..".. */ 
+    /* 0x00000400 */ 0xc1, 0x18, 0x11, 0xdc, 0x46, 0xb5, 0xfb, 0xa8, 0xed, 0x08, 0x00, 0x58, 0x9d, 0xff, 0x06, 0x84, //* ....F......X.... */ 
+    /* 0x00000410 */ 0x90, 0x59, 0x06, 0x0a, 0xee, 0x24, 0x71, 0x7a, 0xa7, 0xe5, 0xa4, 0x6a, 0x6b, 0xee, 0xe4, 0x6a, //* .Y...$qz...jk..j */ 
+    /* 0x00000420 */ 0xec, 0x60, 0x06, 0x28, 0x19, 0x7f, 0xb6, 0x71, 0x62, 0x57, 0x78, 0xa7, 0x46, 0xc3, 0xcb, 0xce, //* .`.(...qbWx.F... */ 
+    /* 0x00000430 */ 0xc5, 0x2e, 0x40, 0xfe, 0xf9, 0x6f, 0x01, 0x78, 0x4c, 0xad, 0x99, 0x96, 0xb4, 0xb9, 0xb4, 0x34, //* ..@..o.xL......4 */ 
+    /* 0x00000440 */ 0x2b, 0x80, 0x02, 0x6e, 0x20, 0x02, 0x64, 0x10, 0x44, 0x00, 0x02, 0xae, 0xc9, 0x80, 0x83, 0xfc, //* +..n .d.D....... */ 
+    /* 0x00000450 */ 0x7f, 0xeb, 0xff, 0xbe, 0x0d, 0x33, 0x04, 0xfe, 0x3f, 0xeb, 0x70, 0xe0, 0xe0, 0x82, 0xc0, 0x01, //* .....3..?.p..... */ 
+    /* 0x00000460 */ 0x38, 0xe0, 0x52, 0x07, 0x1c, 0x9f, 0x83, 0x11, 0xfe, 0xb3, 0xdf, 0x0a, 0xf8, 0xef, 0xeb, 0xcc, //* 8.R............. */ 
+    /* 0x00000470 */ 0x05, 0x02, 0xec, 0xc2, 0xff, 0xbf, 0xe5, 0xff, 0x77, 0x51, 0x00, 0xdc, 0x15, 0x83, 0x0c, 0x20, //* ........wQ.....  */ 
+    /* 0x00000480 */ 0x80, 0x47, 0x72, 0x72, 0xf3, 0x70, 0x42, 0x32, 0xfe, 0x7b, 0xd6, 0x7f, 0x03, 0x31, 0xe3, 0xbf, //* .Grr.pB2.{...1.. */ 
+    /* 0x00000490 */ 0x67, 0xfa, 0xf9, 0xbf, 0x33, 0xc1, 0x81, 0x5b, 0x70, 0xff, 0x39, 0x52, 0x45, 0x50, 0x00, 0x5c, //* g...3..[p.9REP.\ */ 
+    /* 0x000004a0 */ 0xfb, 0xdf, 0xa7, 0xb8, 0x38, 0x39, 0xff, 0xbd, 0x3b, 0x6c, 0x43, 0xe4, 0x29, 0xa3, 0xba, 0x4b, //* ....89..;lC.)..K */ 
+    /* 0x000004b0 */ 0x01, 0x00, 0xf4, 0x11, 0xd2, 0x6f, 0x25, 0xd4, 0xbe, 0x19, 0x1c, 0xa6, 0xba, 0x6a, 0xa9, 0xcd, //* .....o%......j.. */ 
+    /* 0x000004c0 */ 0x5d, 0x5d, 0xb7, 0xf1, 0x38, 0xc1, 0xb2, 0xfc, 0x30, 0x3b, 0x10, 0x4c, 0x8f, 0x2b, 0xde, 0x45, //* ]]..8...0;.L.+.E */ 
+    /* 0x000004d0 */ 0x76, 0xe0, 0x95, 0xf7, 0x52, 0x65, 0xbf, 0x0f, 0x65, 0x48, 0x22, 0x91, 0xc5, 0xd3, 0x35, 0x81, //* v...Re..eH"...5. */ 
+    /* 0x000004e0 */ 0x7f, 0xf7, 0x36, 0x92, 0x21, 0x8e, 0x9e, 0xa8, 0x1b, 0x8e, 0xec, 0x1d, 0x5b, 0x48, 0x18, 0x1a, //* ..6.!.......[H.. */ 
+    /* 0x000004f0 */ 0x51, 0x98, 0x1f, 0x1c, 0x2b, 0xab, 0x9f, 0x96, 0x78, 0x61, 0x67, 0xfb, 0x78, 0x10, 0x37, 0xa7, //* Q...+...xag.x.7. */ 
+    /* 0x00000500 */ 0x63, 0xeb, 0x31, 0x35, 0x0f, 0x85, 0xf1, 0x8f, 0xfb, 0x95, 0x3f, 0x8e, 0xbf, 0xc8, 0x4e, 0xcf, //* c.15......?...N. */ 
+    /* 0x00000510 */ 0xdc, 0xd2, 0xce, 0x45, 0x78, 0x2c, 0x8e, 0xab, 0x76, 0x86, 0x0d, 0x2c, 0x8e, 0x5b, 0xae, 0x56, //* ...Ex,..v..,.[.V */ 
+    /* 0x00000520 */ 0xbe, 0x94, 0xc2, 0x4f, 0x2b, 0x49, 0x61, 0xf2, 0x4e, 0x9f, 0xe4, 0x91, 0x70, 0x77, 0x2b, 0x9b, //* ...O+Ia.N...pw+. */ 
+    /* 0x00000530 */ 0xd8, 0xd8, 0x98, 0x9b, 0x99, 0x9a, 0x9a, 0x16, 0x24, 0x6b, 0x74, 0x91, 0x6f, 0x7a, 0x35, 0x6d, //* ........$kt.oz5m */ 
+    /* 0x00000540 */ 0x13, 0x01, 0xde, 0x48, 0x38, 0x88, 0x34, 0xc8, 0xe2, 0x25, 0xb9, 0xb9, 0x66, 0x1c, 0xcb, 0x9e, //* ...H8.4..%..f... */ 
+    /* 0x00000550 */ 0xbc, 0xcd, 0xa4, 0x48, 0xf0, 0xdf, 0xb8, 0xed, 0x32, 0xe0, 0xdf, 0xbc, 0xb9, 0x3e, 0xed, 0x0c, //* ...H....2....>.. */ 
+    /* 0x00000560 */ 0x14, 0x1f, 0x4d, 0xe6, 0x4f, 0x07, 0x1c, 0xfe, 0xce, 0x96, 0xde, 0x7f, 0xb7, 0xd9, 0x26, 0x33, //* ..M.O.........&3 */ 
+    /* 0x00000570 */ 0xe0, 0x88, 0x05, 0x50, 0x9a, 0x5c, 0x0e, 0x4d, 0x5c, 0x5c, 0xb0, 0x5e, 0x32, 0xb3, 0xb1, 0xe5, //* ...P.\.M\\.^2... */ 
+    /* 0x00000580 */ 0x84, 0x87, 0xa3, 0x43, 0xfa, 0x4b, 0x4a, 0x4b, 0x0f, 0x9d, 0x38, 0x8a, 0xd6, 0x2e, 0xc7, 0x09, //* ...C.KJK..8..... */ 
+    /* 0x00000590 */ 0xa1, 0x93, 0x63, 0xc7, 0xaf, 0x67, 0xac, 0x7c, 0xe9, 0x0b, 0xf1, 0xa6, 0xd9, 0x34, 0x8b, 0xa5, //* ..c..g.|.....4.. */ 
+    /* 0x000005a0 */ 0x7f, 0xb8, 0xb9, 0xb9, 0xa5, 0xbc, 0xb6, 0xa7, 0x85, 0xdc, 0xec, 0x1b, 0x68, 0x75, 0xed, 0xbf, //* ............hu.. */ 
+    /* 0x000005b0 */ 0xb8, 0x58, 0xed, 0xf0, 0x27, 0x40, 0xf0, 0xb5, 0xaa, 0x49, 0xf2, 0xa3, 0xe1, 0x64, 0x62, 0x0a, //* .X..'@...I...db. */ 
+    /* 0x000005c0 */ 0x4e, 0xd4, 0xd6, 0x26, 0x40, 0x88, 0x84, 0xda, 0xac, 0x34, 0x4b, 0x03, 0x08, 0x9c, 0x6a, 0xd7, //* N..&@....4K...j. */ 
+    /* 0x000005d0 */ 0xeb, 0x64, 0x06, 0xaf, 0xe8, 0x82, 0x7c, 0xf8, 0xfc, 0xdc, 0xdc, 0x6e, 0xe9, 0xa5, 0x6b, 0x6a, //* .d....|....n..kj */ 
+    /* 0x000005e0 */ 0xd5, 0x97, 0x5a, 0xbd, 0x92, 0x07, 0x58, 0x58, 0xe8, 0xa5, 0x25, 0x70, 0xb4, 0xd4, 0xd4, 0xba, //* ..Z...XX..%p.... */ 
+    /* 0x000005f0 */ 0x4f, 0x37, 0xfa, 0xf0, 0xdb, 0x23, 0xb7, 0x47, 0x92, 0xf7, 0xf7, 0x89, 0xce, 0x6a, 0xe9, 0x66, //* O7...#.G.....j.f */ 
+    /* 0x00000600 */ 0xde, 0x9c, 0x2a, 0x4e, 0x55, 0x9a, 0xc9, 0x4a, 0x01, 0x74, 0x10, 0xb9, 0xb9, 0xb9, 0xb9, 0xe7, //* ..*NU..J.t...... */ 
+    /* 0x00000610 */ 0x72, 0xe9, 0xd8, 0xde, 0x1a, 0x36, 0xf0, 0x05, 0xb0, 0xed, 0x5b, 0xd8, 0x62, 0x3b, 0x3a, 0xf2, //* r....6....[.b;:. */ 
+    /* 0x00000620 */ 0xa0, 0xf8, 0xd1, 0x6c, 0x2b, 0x4a, 0x4b, 0xfb, 0x56, 0x54, 0x54, 0xdc, 0x2c, 0xcf, 0xcf, 0x93, //* ...l+JK.VTT.,... */ 
+    /* 0x00000630 */ 0x1c, 0x2e, 0xd4, 0xc0, 0x43, 0xd3, 0xf6, 0xf6, 0xf6, 0xde, 0xf4, 0x04, 0x58, 0x75, 0xea, 0x32, //* ....C.......Xu.2 */ 
+    /* 0x00000640 */ 0xc4, 0x6c, 0x8f, 0x88, 0x95, 0x7b, 0x5f, 0xec, 0x4e, 0x20, 0x02, 0xde, 0xd6, 0x8b, 0xb5, 0xe7, //* .l...{_.N ...... */ 
+    /* 0x00000650 */ 0x6a, 0x85, 0x6a, 0xca, 0x7b, 0x7b, 0xa4, 0xf6, 0x0c, 0x0c, 0x0c, 0xa7, 0x80, 0x7b, 0x52, 0x72, //* j.j.{{.......{Rr */ 
+    /* 0x00000660 */ 0xb2, 0xfa, 0xc0, 0x2f, 0x8d, 0xe2, 0xef, 0xc9, 0xc9, 0xe8, 0xf8, 0xa6, 0xa6, 0x38, 0x00, 0x3d, //* .../.........8.= */ 
+    /* 0x00000670 */ 0x20, 0xfd, 0x33, 0x3e, 0x1e, 0x1e, 0x18, 0x1c, 0x1c, 0xc4, 0x80, 0xb4, 0x77, 0x76, 0x66, 0x15, //*  .3>........wvf. */ 
+    /* 0x00000680 */ 0xb6, 0xb6, 0x3e, 0x19, 0x01, 0x86, 0x10, 0xbb, 0xca, 0xf2, 0x72, 0x4b, 0x83, 0xdc, 0x0c, 0xb2, //* ..>.......rK.... */ 
+    /* 0x00000690 */ 0x27, 0x06, 0x5f, 0xba, 0x0f, 0x51, 0x9b, 0xfe, 0xc8, 0xd8, 0x09, 0x89, 0xb0, 0x9e, 0x21, 0xcd, //* '._..Q........!. */ 
+    /* 0x000006a0 */ 0x32, 0xbb, 0xf6, 0x76, 0x08, 0xa1, 0x29, 0xdc, 0x5c, 0x99, 0xbe, 0xac, 0x04, 0x4e, 0x77, 0x76, //* 2..v..).\....Nwv */ 
+    /* 0x000006b0 */ 0x7d, 0x7d, 0x82, 0xcf, 0xc3, 0x29, 0x32, 0x4c, 0x86, 0x81, 0x97, 0x0e, 0xa5, 0x50, 0x89, 0x59, //* }}...)2L.....P.Y */ 
+    /* 0x000006c0 */ 0xc0, 0x66, 0x49, 0x00, 0x2e, 0x43, 0x8d, 0xf5, 0x12, 0xd1, 0x0e, 0x22, 0xce, 0x0e, 0xf0, 0xd9, //* .fI..C.....".... */ 
+    /* 0x000006d0 */ 0x4c, 0x07, 0xcc, 0xca, 0x27, 0xe1, 0x89, 0x1b, 0xb4, 0xdc, 0x5d, 0xba, 0xef, 0x3f, 0x7d, 0xc3, //* L...'.....]..?}. */ 
+    /* 0x000006e0 */ 0x54, 0xb7, 0xe7, 0x7e, 0xfd, 0xda, 0x44, 0x4f, 0xaf, 0xd9, 0x5c, 0x64, 0x5c, 0xe3, 0xa4, 0x6a, //* T..~..DO..\d\..j */ 
+    /* 0x000006f0 */ 0x67, 0x4c, 0xc0, 0xa9, 0x1f, 0x07, 0x6e, 0x35, 0xe6, 0x85, 0x54, 0x42, 0x7a, 0x3a, 0x47, 0xde, //* gL....n5..TBz:G. */ 
+    /* 0x00000700 */ 0xd6, 0xe6, 0xa6, 0xdd, 0xdc, 0xd1, 0xb2, 0x5a, 0xf1, 0x8c, 0x1a, 0x7a, 0x12, 0xd7, 0x56, 0x87, //* .......Z...z..V. */ 
+    /* 0x00000710 */ 0x3f, 0x72, 0x16, 0x00, 0xb1, 0xbb, 0xd8, 0xe5, 0xba, 0xb8, 0xb8, 0xd8, 0x2c, 0xd5, 0xad, 0x4b, //* ?r..........,..K */ 
+    /* 0x00000720 */ 0x4c, 0x3b, 0xf5, 0x0b, 0x95, 0x1e, 0x13, 0xb0, 0x3c, 0x31, 0x82, 0x13, 0x28, 0xf1, 0x80, 0xe7, //* L;......<1..(... */ 
+    /* 0x00000730 */ 0xb5, 0xfc, 0xbc, 0x58, 0x5b, 0x4a, 0xd0, 0x7e, 0x88, 0x49, 0xce, 0xa7, 0x84, 0x83, 0x50, 0x34, //* ...X[J.~.I....P4 */ 
+    /* 0x00000740 */ 0x6d, 0xc5, 0x3a, 0x34, 0x58, 0x30, 0x6b, 0xa5, 0x50, 0x97, 0x95, 0xdd, 0x83, 0xd6, 0xea, 0xf2, //* m.:4X0k.P....... */ 
+    /* 0x00000750 */ 0x98, 0xa4, 0x41, 0xf1, 0x49, 0x46, 0x06, 0xad, 0x05, 0x9b, 0x92, 0xb6, 0x06, 0xbe, 0x51, 0xa7, //* ..A.IF........Q. */ 
+    /* 0x00000760 */ 0x34, 0xaf, 0xb8, 0xb8, 0x78, 0x3e, 0x29, 0x2b, 0xdb, 0xb6, 0x22, 0x23, 0x43, 0x7c, 0x58, 0xf1, //* 4...x>)+.."#C|X. */ 
+    /* 0x00000770 */ 0x87, 0x95, 0xc4, 0x6a, 0xb4, 0xd8, 0xd3, 0x47, 0xc0, 0xb7, 0xf1, 0x5a, 0xd9, 0x3f, 0x4e, 0xa7, //* ...j...G...Z.?N. */ 
+    /* 0x00000780 */ 0xc6, 0xaa, 0x06, 0x50, 0x22, 0x23, 0x21, 0x61, 0xd6, 0x58, 0x2a, 0x5d, 0xac, 0xd3, 0x52, 0xd1, //* ...P"#!a.X*]..R. */ 
+    /* 0x00000790 */ 0x91, 0xf1, 0xcd, 0x51, 0x29, 0xdc, 0x6c, 0x76, 0x3b, 0x47, 0x81, 0xe2, 0x33, 0xca, 0x19, 0x29, //* ...Q).lv;G..3..) */ 
+    /* 0x000007a0 */ 0xb8, 0xf0, 0x15, 0x5a, 0x63, 0x5a, 0x8c, 0xa5, 0xd2, 0xd5, 0xc0, 0x9d, 0x5e, 0x5e, 0xe6, 0x66, //* ...ZcZ......^^.f */ 
+    /* 0x000007b0 */ 0x67, 0xc3, 0x1f, 0x2f, 0x37, 0x7d, 0x80, 0x15, 0x3d, 0xe4, 0xe2, 0x4c, 0x5b, 0x29, 0xcb, 0x6b, //* g../7}..=..L[).k */ 
+    /* 0x000007c0 */ 0xc4, 0xc5, 0x39, 0x6c, 0xcf, 0x19, 0xaa, 0x2e, 0xc2, 0x5a, 0x9c, 0x9b, 0x09, 0xfd, 0x1b, 0x69, //* ..9l.....Z.....i */ 
+    /* 0x000007d0 */ 0x50, 0x5e, 0x41, 0x48, 0x12, 0x93, 0x92, 0xc2, 0x76, 0xb8, 0x79, 0xaa, 0x94, 0x94, 0x94, 0x00, //* P^AH....v.y..... */ 
+    /* 0x000007e0 */ 0x54, 0x40, 0x4a, 0x4a, 0xaa, 0xda, 0x7a, 0x91, 0x08, 0x00, 0xef, 0x4a, 0xf9, 0xeb, 0x4a, 0x25, //* T@JJ..z....J..J% */ 
+    /* 0x000007f0 */ 0x62, 0x60, 0x60, 0x20, 0x33, 0xcb, 0xab, 0x77, 0x5d, 0x41, 0x98, 0x31, 0x74, 0x63, 0x1d, 0xb6, //* b`` 3..w]A.1tc.. */ 
+    /* 0x00000800 */ 0x6d, 0xcf, 0x41, 0xb0, 0x51, 0xf6, 0xf9, 0x26, 0x57, 0x6a, 0x21, 0xa7, 0x5d, 0xa0, 0x50, 0xcd, //* m.A.Q..&Wj!.].P. */ 
+    /* 0x00000810 */ 0xef, 0xec, 0x8c, 0x9b, 0x80, 0x80, 0x20, 0xc4, 0x4c, 0x86, 0x1e, 0x8f, 0x39, 0x2c, 0x0c, 0xe7, //* ...... .L...9,.. */ 
+    /* 0x00000820 */ 0x7e, 0x15, 0x02, 0xd0, 0x87, 0xa1, 0xda, 0xe2, 0x3e, 0xe7, 0x88, 0x0b, 0x41, 0x2c, 0xa7, 0xaa, //* ~.......>...A,.. */ 
+    /* 0x00000830 */ 0x3f, 0x4f, 0x09, 0xe9, 0xf0, 0x6a, 0x4e, 0x47, 0x01, 0x50, 0x3f, 0xe0, 0x9d, 0x71, 0xe6, 0x8d, //* ?O...jNG.P?..q.. */ 
+    /* 0x00000840 */ 0x7e, 0xa1, 0x1a, 0x1c, 0x70, 0x71, 0x79, 0xb9, 0x76, 0x74, 0x14, 0x95, 0x3b, 0x14, 0x47, 0xab, //* ~...pqy.vt..;.G. */ 
+    /* 0x00000850 */ 0xcb, 0xd8, 0x35, 0x10, 0xcb, 0x74, 0xda, 0x43, 0x6c, 0x68, 0xf4, 0xd4, 0x7c, 0x7b, 0xe3, 0x3c, //* ..5..t.Clh..|{.< */ 
+    /* 0x00000860 */ 0x44, 0x34, 0x3f, 0xff, 0x1a, 0x51, 0xfa, 0x23, 0xbd, 0x7b, 0xbd, 0xe7, 0x2d, 0x1a, 0x37, 0x0f, //* D4?..Q.#.{..-.7. */ 
+    /* 0x00000870 */ 0xcf, 0x8b, 0xef, 0x1f, 0xbb, 0x1d, 0x26, 0xa7, 0xa6, 0x70, 0x71, 0x71, 0x21, 0x80, 0x6b, 0x4f, //* ......&..pqq!.kO */ 
+    /* 0x00000880 */ 0x2c, 0x78, 0xea, 0x9f, 0xe2, 0x7c, 0xf0, 0x21, 0x10, 0x3b, 0x26, 0x5e, 0x5e, 0xde, 0xc2, 0xea, //* ,x...|.!.;&^^... */ 
+    /* 0x00000890 */ 0x6a, 0x27, 0xc6, 0x6a, 0xc7, 0x30, 0x34, 0x04, 0x09, 0x9c, 0x40, 0x25, 0x2d, 0xad, 0x90, 0x98, //* j'.j.04...@%-... */ 
+    /* 0x000008a0 */ 0x18, 0x1c, 0xf1, 0xe2, 0xbf, 0x70, 0xed, 0xa9, 0x8b, 0xae, 0x19, 0x4a, 0xcc, 0xe5, 0xa3, 0x5e, //* .....p.....J...^ */ 
+    /* 0x000008b0 */ 0x94, 0xec, 0x86, 0x8d, 0x11, 0xd8, 0x62, 0x07, 0x7e, 0xec, 0xfa, 0x8d, 0xc0, 0x42, 0x9c, 0xdd, //* ......b.~....B.. */ 
+    /* 0x000008c0 */ 0xd6, 0x20, 0x21, 0x33, 0x01, 0xda, 0x6b, 0xdb, 0x15, 0x0a, 0xfa, 0x1e, 0x07, 0xdb, 0x95, 0x66, //* . !3..k........f */ 
+    /* 0x000008d0 */ 0x54, 0x20, 0xd7, 0xdc, 0xdc, 0xbc, 0x63, 0x7d, 0xa0, 0x2e, 0xc4, 0x47, 0x92, 0x66, 0x19, 0xc2, //* T ....c}...G.f.. */ 
+    /* 0x000008e0 */ 0x26, 0x40, 0x6e, 0x87, 0xa5, 0x88, 0x97, 0x4e, 0x76, 0x7b, 0x73, 0xa3, 0xe5, 0xfd, 0x60, 0x6f, //* &@n....Nv{s...`o */ 
+    /* 0x000008f0 */ 0x08, 0xb4, 0x0f, 0xa8, 0xe6, 0x77, 0xb3, 0xe7, 0x95, 0x94, 0x60, 0xb0, 0xc2, 0xd0, 0x00, 0xbb, //* .....w....`..... */ 
+    /* 0x00000900 */ 0xc3, 0x05, 0xde, 0x14, 0x21, 0x67, 0x34, 0xa8, 0x79, 0x1a, 0x04, 0x78, 0xff, 0x3e, 0x88, 0x93, //* ....!g4.y..x.>.. */ 
+    /* 0x00000910 */ 0x9b, 0x1b, 0x0f, 0xfd, 0x71, 0x13, 0xdf, 0x43, 0x4b, 0x2b, 0x01, 0x1e, 0x38, 0x5a, 0x69, 0x09, //* ....q..CK+..8Zi. */ 
+    /* 0x00000920 */ 0x2e, 0x28, 0xb0, 0xf4, 0xbc, 0xfa, 0x6d, 0x61, 0xb2, 0x1f, 0x23, 0x93, 0x1b, 0x33, 0xf0, 0x09, //* .(....ma..#..3.. */ 
+    /* 0x00000930 */ 0x9c, 0x2c, 0x0e, 0x20, 0x07, 0x9c, 0x24, 0x7a, 0x40, 0x7c, 0xa3, 0x37, 0x72, 0x1f, 0xb0, 0x44, //* .,. ..$z@|.7r..D */ 
+    /* 0x00000940 */ 0x37, 0x22, 0x80, 0xb2, 0xe4, 0xe5, 0xe5, 0x1d, 0x87, 0x07, 0x3e, 0x45, 0xaf, 0xb6, 0x1a, 0x75, //* 7"........>E...u */ 
+    /* 0x00000950 */ 0xc0, 0xc5, 0x15, 0xab, 0xad, 0x67, 0x24, 0xc3, 0x18, 0x36, 0x82, 0x2e, 0xdb, 0x70, 0x80, 0xeb, //* .....g$..6...p.. */ 
+    /* 0x00000960 */ 0xc3, 0x45, 0x26, 0xac, 0x71, 0xc5, 0x34, 0x11, 0xe3, 0xaf, 0x5f, 0xbf, 0x12, 0xf2, 0x6a, 0xd0, //* .E&.q.4..._...j. */ 
+    /* 0x00000970 */ 0x7e, 0xc7, 0x01, 0x0e, 0x0f, 0x0f, 0x49, 0xc9, 0xc8, 0x3a, 0x7b, 0x23, 0xc9, 0xf1, 0x01, 0xfe, //* ~.....I..:{#.... */ 
+    /* 0x00000980 */ 0xaf, 0xf3, 0xe2, 0x3f, 0x86, 0x87, 0x87, 0x37, 0xd7, 0x7b, 0x64, 0x13, 0x60, 0x30, 0x06, 0xac, //* ...?...7.{d.`0.. */ 
+    /* 0x00000990 */ 0x5d, 0xc2, 0x7d, 0x3d, 0x64, 0x2c, 0x0a, 0x1a, 0xe0, 0xef, 0xfe, 0x7e, 0x3c, 0x29, 0x09, 0x09, //* ].}=d,.....~<).. */ 
+    /* 0x000009a0 */ 0xc5, 0xdc, 0xd4, 0x94, 0x30, 0xea, 0x2a, 0x29, 0xb4, 0x72, 0x34, 0x55, 0xb8, 0x4a, 0xbb, 0xca, //* ....0.*).r4U.J.. */ 
+    /* 0x000009b0 */ 0x1c, 0x21, 0x66, 0xa2, 0xde, 0x7e, 0xe3, 0xda, 0xc9, 0xf6, 0x4e, 0x7f, 0x7b, 0xb3, 0xd5, 0xeb, //* .!f..~....N.{... */ 
+    /* 0x000009c0 */ 0xfe, 0x49, 0x45, 0xdb, 0xcc, 0xcc, 0x6c, 0xa9, 0xd6, 0x99, 0x1c, 0x62, 0xb7, 0x91, 0x27, 0xef, //* .IE...l....b..'. */ 
+    /* 0x000009d0 */ 0x64, 0x6f, 0xbf, 0x16, 0x45, 0x29, 0x2c, 0xb0, 0xb1, 0x4f, 0x7a, 0x21, 0xb8, 0xdd, 0xb5, 0xc7, //* do..E),..Oz!.... */ 
+    /* 0x000009e0 */ 0x63, 0xae, 0x86, 0x3b, 0xdc, 0xee, 0x0b, 0xff, 0xed, 0x78, 0xe5, 0x8d, 0xf7, 0xc5, 0xc4, 0x07, //* c..;.....x...... */ 
+    /* 0x000009f0 */ 0x04, 0x71, 0x7e, 0x7e, 0x7e, 0x79, 0xd2, 0xc5, 0x5a, 0x2e, 0x76, 0xf6, 0x28, 0xfa, 0x42, 0x95, //* .q~~~y..Z.v.(.B. */ 
+    /* 0x00000a00 */ 0xcf, 0xdb, 0x8c, 0xf4, 0xa4, 0xfa, 0xd2, 0xce, 0x71, 0x32, 0xb9, 0xeb, 0x16, 0xe0, 0x5b, 0xbd, //* ........q2....[. */ 
+    /* 0x00000a10 */ 0xbd, 0xbd, 0x2a, 0x8c, 0xb1, 0x5c, 0x5c, 0x5c, 0xdf, 0xc1, 0x3c, 0xa1, 0x83, 0xce, 0x34, 0xf2, //* ..*..\\\..<...4. */ 
+    /* 0x00000a20 */ 0x3f, 0xb2, 0xe3, 0x7b, 0x7f, 0x14, 0x76, 0x55, 0x2a, 0x9e, 0x19, 0x1e, 0x19, 0xc9, 0xae, 0x2c, //* ?..{..vU*......, */ 
+    /* 0x00000a30 */ 0x89, 0xa0, 0x4f, 0x4c, 0x4f, 0x1f, 0x43, 0xc5, 0x67, 0x0c, 0x81, 0xd5, 0x38, 0xfd, 0xe6, 0x36, //* ..OLO.C.g...8..6 */ 
+    /* 0x00000a40 */ 0xff, 0x64, 0x7e, 0xf6, 0xfb, 0xdc, 0x02, 0xa3, 0xc9, 0x25, 0x12, 0x97, 0x9f, 0x56, 0x60, 0xa7, //* .d~......%...V`. */ 
+    /* 0x00000a50 */ 0xe9, 0x18, 0x05, 0x1a, 0x15, 0x15, 0xe5, 0x79, 0x77, 0x81, 0xfa, 0x21, 0x92, 0xec, 0x1d, 0x40, //* .......yw..!...@ */ 
+    /* 0x00000a60 */ 0x21, 0xf2, 0x8d, 0x33, 0x9a, 0x52, 0xb8, 0x57, 0xd8, 0xd5, 0xe4, 0xe3, 0x0f, 0x1d, 0xc1, 0xaa, //* !..3.R.W........ */ 
+    /* 0x00000a70 */ 0x9c, 0x9c, 0x84, 0x78, 0x76, 0xfd, 0xac, 0x9a, 0x1a, 0x5e, 0x88, 0x92, 0xa2, 0xa2, 0x22, 0xdb, //* ...xv....^....". */ 
+    /* 0x00000a80 */ 0xf3, 0x98, 0xd8, 0xf3, 0x27, 0xb7, 0x5b, 0xd9, 0xcb, 0x04, 0x7a, 0xcd, 0x32, 0x3d, 0x69, 0x60, //* ....'.[...z.2=i` */ 
+    /* 0x00000a90 */ 0xce, 0xd9, 0xf6, 0x4e, 0xfe, 0x54, 0x31, 0xe2, 0x45, 0xf4, 0xd9, 0xf9, 0x39, 0xc4, 0xba, 0x2d, //* ...N.T1.E...9..- */ 
+    /* 0x00000aa0 */ 0x2d, 0x36, 0x36, 0x72, 0xa3, 0x2f, 0x9a, 0xae, 0x8d, 0x86, 0x1a, 0x0c, 0x6e, 0x02, 0x9f, 0x75, //* -66r./......n..u */ 
+    /* 0x00000ab0 */ 0x52, 0x82, 0x7d, 0xb7, 0x05, 0x9d, 0xb8, 0xef, 0x47, 0xef, 0xb4, 0x88, 0xf7, 0x98, 0xe4, 0xed, //* R.}.....G....... */ 
+    /* 0x00000ac0 */ 0x83, 0x83, 0x68, 0x5f, 0x66, 0xcb, 0x7a, 0x6e, 0x50, 0x0d, 0x69, 0xc4, 0xc4, 0xa8, 0xef, 0xee, //* ..h_f.znP.i..... */ 
+    /* 0x00000ad0 */ 0xdc, 0x39, 0x79, 0xa6, 0x0a, 0x06, 0xb7, 0xb7, 0xb7, 0x0b, 0xd4, 0x8b, 0x89, 0xfe, 0xce, 0xd6, //* .9y............. */ 
+    /* 0x00000ae0 */ 0x40, 0xe5, 0x18, 0xbb, 0xaa, 0x2c, 0xa4, 0x05, 0x1c, 0xb7, 0x31, 0xb6, 0xc7, 0x9e, 0xa9, 0xd2, //* @....,....1..... */ 
+    /* 0x00000af0 */ 0xbd, 0xef, 0x58, 0x26, 0x27, 0x27, 0x33, 0xf2, 0xf3, 0x99, 0xd8, 0xe5, 0xca, 0xf4, 0x1a, 0xf0, //* ..X&''3......... */ 
+    /* 0x00000b00 */ 0x4c, 0x7b, 0x23, 0x7c, 0x5b, 0x5b, 0x45, 0xc1, 0xab, 0x65, 0x2a, 0x31, 0x03, 0x19, 0x26, 0x7a, //* L{#|[[E..e*1..&z */ 
+    /* 0x00000b10 */ 0xee, 0x82, 0x02, 0x2d, 0xe1, 0x09, 0x89, 0x89, 0xda, 0x70, 0xe5, 0xc8, 0x9c, 0x88, 0xed, 0xf0, //* ...-.....p...... */ 
+    /* 0x00000b20 */ 0x4c, 0x4c, 0x4c, 0x44, 0xc4, 0xc4, 0xe1, 0x8a, 0x5b, 0x53, 0xf9, 0x8a, 0x0d, 0xd6, 0x8b, 0x7c, //* LLLD....[S.....| */ 
+    /* 0x00000b30 */ 0xdb, 0x3b, 0x3b, 0x3c, 0x74, 0x74, 0x52, 0x9e, 0x49, 0xa6, 0xd4, 0xdd, 0x67, 0x56, 0x76, 0x9c, //* .;;<ttR.I...gVv. */ 
+    /* 0x00000b40 */ 0xc7, 0xcb, 0xe1, 0xc6, 0x32, 0x67, 0x3c, 0x2b, 0xad, 0x8e, 0xc1, 0xf4, 0xa4, 0xf8, 0xf8, 0x5d, //* ....2g<+.......] */ 
+    /* 0x00000b50 */ 0xec, 0xfa, 0xa2, 0x9b, 0x55, 0x3b, 0xd2, 0x14, 0xcf, 0x3d, 0xdf, 0xc0, 0x3e, 0x10, 0xef, 0x7a, //* ....U;...=..>..z */ 
+    /* 0x00000b60 */ 0xb4, 0xb4, 0x8d, 0x61, 0x5d, 0x37, 0x5b, 0xa8, 0xca, 0x54, 0x41, 0xf8, 0x50, 0x4c, 0xc7, 0xca, //* ...a]7[..TA.PL.. */ 
+    /* 0x00000b70 */ 0x1a, 0x36, 0xed, 0x02, 0xb3, 0x18, 0x4b, 0x33, 0x53, 0x56, 0xc6, 0x55, 0x67, 0x25, 0x8c, 0x67, //* .6....K3SV.Ug%.g */ 
+    /* 0x00000b80 */ 0xd3, 0x96, 0x3c, 0x14, 0x7d, 0x14, 0xeb, 0xfc, 0x62, 0xfb, 0x22, 0x2e, 0x2e, 0x0e, 0x0b, 0x11, //* ..<.}...b."..... */ 
+    /* 0x00000b90 */ 0x11, 0x11, 0x9b, 0xe6, 0x3b, 0xd2, 0x5c, 0xa1, 0xe9, 0x5f, 0xc4, 0x8c, 0xd2, 0xf8, 0x78, 0x62, //* ....;.\.._....xb */ 
+    /* 0x00000ba0 */ 0x30, 0xdb, 0x11, 0xc4, 0xb3, 0x79, 0x7f, 0xff, 0xfe, 0xdd, 0x31, 0x31, 0x51, 0x21, 0x09, 0x2f, //* 0....y....11Q!./ */ 
+    /* 0x00000bb0 */ 0xb9, 0x33, 0x9a, 0x0a, 0x01, 0x2a, 0x4b, 0xd8, 0x3e, 0xe5, 0xe4, 0x77, 0x81, 0x77, 0x0f, 0x16, //* .3...*K.>..w.w.. */ 
+    /* 0x00000bc0 */ 0xf6, 0xb7, 0x87, 0x5d, 0x2e, 0x20, 0xc3, 0x39, 0x79, 0xf6, 0x66, 0x7a, 0x4d, 0x95, 0x19, 0x66, //* ...]. .9y.fzM..f */ 
+    /* 0x00000bd0 */ 0xb6, 0x3b, 0xd5, 0x44, 0xbc, 0x3d, 0x9c, 0x0a, 0x6f, 0x7b, 0x2c, 0x75, 0x72, 0x71, 0x81, 0x00, //* .;.D.=..o{,urq.. */ 
+    /* 0x00000be0 */ 0x2c, 0xb5, 0x14, 0x27, 0x9a, 0x7c, 0xcc, 0xe5, 0xd8, 0xa1, 0x86, 0xed, 0xad, 0xb4, 0x08, 0x7f, //* ,..'.|.......... */ 
+    /* 0x00000bf0 */ 0x4d, 0xe6, 0x85, 0x07, 0x96, 0x22, 0x9a, 0x51, 0xd1, 0xd1, 0xd1, 0xa7, 0x8b, 0xd4, 0xd1, 0xc1, //* M....".Q........ */ 
+    /* 0x00000c00 */ 0x4b, 0x86, 0x84, 0x85, 0xc1, 0x41, 0xe3, 0xf7, 0xef, 0x6d, 0x13, 0xe6, 0xd8, 0x63, 0x0e, 0x0e, //* K....A...m...c.. */ 
+    /* 0x00000c10 */ 0x0e, 0x08, 0x5f, 0x6a, 0x94, 0x58, 0xc6, 0xa4, 0x3c, 0x50, 0x9c, 0x9e, 0xda, 0xd7, 0x3b, 0xee, //* .._j.X..<P....;. */ 
+    /* 0x00000c20 */ 0x60, 0x89, 0xbc, 0x79, 0x53, 0xe1, 0xb4, 0xa7, 0x72, 0x73, 0x73, 0x93, 0x91, 0x93, 0x83, 0x00, //* `..yS...rss..... */ 
+    /* 0x00000c30 */ 0x8c, 0x37, 0x3a, 0x7f, 0xf1, 0x3c, 0x1b, 0x60, 0x3a, 0xb9, 0xba, 0x7a, 0x6f, 0x6e, 0xce, 0x08, //* .7:..<.`:..zon.. */ 
+    /* 0x00000c40 */ 0xac, 0x76, 0x06, 0x86, 0x7f, 0x94, 0x96, 0x86, 0xa0, 0x2e, 0xd5, 0xe3, 0x86, 0x7e, 0x88, 0xc6, //* .v...........~.. */ 
+    /* 0x00000c50 */ 0xc7, 0x21, 0x25, 0x44, 0xa5, 0x93, 0xa2, 0xab, 0xb6, 0x9e, 0x42, 0x0a, 0x42, 0x0a, 0x4a, 0xe0, //* .!%D......B.B.J. */ 
+    /* 0x00000c60 */ 0xda, 0xf8, 0x82, 0x60, 0x88, 0xd9, 0x1b, 0xf7, 0x4a, 0xf7, 0xdf, 0xbc, 0x3f, 0x95, 0xa9, 0xb1, //* ...`....J...?... */ 
+    /* 0x00000c70 */ 0x06, 0xd2, 0xe0, 0x00, 0xe5, 0x96, 0x13, 0xb4, 0x7a, 0x0d, 0x0e, 0x88, 0x2b, 0x2b, 0x2b, 0x00, //* ........z...+++. */ 
+    /* 0x00000c80 */ 0xd4, 0x7c, 0x24, 0x29, 0xd3, 0xe5, 0x70, 0x81, 0x99, 0x95, 0x55, 0xd2, 0xe9, 0xe2, 0xd5, 0x29, //* .|$)..p...U....) */ 
+    /* 0x00000c90 */ 0xa4, 0xde, 0xf5, 0x98, 0xaa, 0xcc, 0xa0, 0x05, 0xad, 0x50, 0x6d, 0xe1, 0x2d, 0xed, 0xf7, 0x08, //* .........Pm.-... */ 
+    /* 0x00000ca0 */ 0x24, 0xce, 0xfe, 0xe9, 0xe9, 0x8b, 0x54, 0xdd, 0xa2, 0x36, 0xe7, 0xb5, 0x4e, 0xc4, 0x0a, 0x8f, //* $.....T..6..N... */ 
+    /* 0x00000cb0 */ 0x22, 0x1a, 0x5e, 0x5e, 0x98, 0xd8, 0xd3, 0x0d, 0x1d, 0x93, 0x42, 0x4a, 0xff, 0xf9, 0xce, 0x18, //* ".^^......BJ.... */ 
+    /* 0x00000cc0 */ 0xcf, 0x8b, 0x17, 0xbe, 0xa1, 0xa1, 0x8a, 0xf5, 0x76, 0x6b, 0x7e, 0x68, 0x97, 0xb1, 0xc0, 0x7c, //* ........vk~h...| */ 
+    /* 0x00000cd0 */ 0xae, 0x2c, 0xf1, 0x68, 0xda, 0x9b, 0x64, 0x09, 0x09, 0x5f, 0x36, 0x76, 0x96, 0xbc, 0xe4, 0x45, //* .,.h..d.._6v...E */ 
+    /* 0x00000ce0 */ 0x32, 0x73, 0x73, 0xb3, 0xb3, 0xf6, 0x0e, 0xff, 0x9f, 0x03, 0x9f, 0x3c, 0xaf, 0x0e, 0xb4, 0x61, //* 2ss........<...a */ 
+    /* 0x00000cf0 */ 0x65, 0x1f, 0x59, 0x61, 0x61, 0x45, 0x5c, 0x40, 0x9a, 0x98, 0x4f, 0xda, 0xd6, 0xd6, 0xd6, 0x4f, //* e.YaaE\@..O....O */ 
+    /* 0x00000d00 */ 0xb3, 0x81, 0x84, 0xd8, 0xd8, 0x2e, 0x08, 0x3c, 0xd2, 0xf8, 0xc4, 0xc4, 0xf7, 0x77, 0x3d, 0xef, //* .......<.....w=. */ 
+    /* 0x00000d10 */ 0x30, 0xd0, 0xd1, 0x4d, 0xe7, 0x79, 0x47, 0x4c, 0xcc, 0x24, 0x24, 0x20, 0x6d, 0x0f, 0x67, 0x43, //* 0..M.yGL.$$ m.gC */ 
+    /* 0x00000d20 */ 0x6d, 0x4e, 0xd6, 0x80, 0x0c, 0x58, 0xa8, 0x58, 0x5a, 0xba, 0xba, 0x9a, 0x4d, 0xcb, 0x7d, 0x3e, //* mN...X.XZ...M.}> */ 
+    /* 0x00000d30 */ 0xef, 0xa6, 0x1b, 0x1c, 0x21, 0x39, 0xb3, 0xdc, 0xf4, 0x0c, 0x0c, 0x30, 0xd6, 0xc3, 0xab, 0x2f, //* ....!9.....0.../ */ 
+    /* 0x00000d40 */ 0xc6, 0xc6, 0x2f, 0x2c, 0xbc, 0x78, 0x64, 0xeb, 0xe0, 0x6e, 0x1e, 0xaf, 0xff, 0x4c, 0xad, 0x3c, //* ../,.xd..n...L.< */ 
+    /* 0x00000d50 */ 0xe1, 0xc3, 0x65, 0x34, 0x04, 0x0a, 0x5a, 0x8c, 0xde, 0x05, 0x29, 0xe2, 0xc7, 0x26, 0xc4, 0x1b, //* ..e4..Z...)..&.. */ 
+    /* 0x00000d60 */ 0xb6, 0xe7, 0xe4, 0xd0, 0x37, 0xfe, 0xd2, 0xed, 0x03, 0x95, 0x52, 0x39, 0x53, 0x29, 0xc4, 0x11, //* ....7.....R9S).. */ 
+    /* 0x00000d70 */ 0xbd, 0xf0, 0xad, 0xa4, 0x94, 0x54, 0x97, 0xc7, 0xe5, 0xdf, 0x99, 0x2a, 0xb0, 0x07, 0x47, 0xc3, //* .....T.....*..G. */ 
+    /* 0x00000d80 */ 0xb7, 0xab, 0xe6, 0x3f, 0x7c, 0xfc, 0xd1, 0xd0, 0xd0, 0x70, 0x21, 0xb6, 0xa1, 0x08, 0x93, 0xe9, //* ...?|....p!..... */ 
+    /* 0x00000d90 */ 0xd9, 0x1a, 0x8a, 0xc7, 0x07, 0x6c, 0xff, 0x34, 0x74, 0x3d, 0x22, 0x5f, 0xa9, 0x16, 0xaa, 0x55, //* .....l.4t="_...U */ 
+    /* 0x00000da0 */ 0xe6, 0xe4, 0x04, 0x24, 0xf3, 0xdb, 0x32, 0x02, 0x57, 0x47, 0x53, 0xc9, 0x06, 0x06, 0x2b, 0xcd, //* ...$..2.WGS...+. */ 
+    /* 0x00000db0 */ 0x5e, 0xf7, 0x7c, 0xc7, 0x7f, 0xda, 0x14, 0x89, 0xe3, 0xd5, 0x11, 0xc4, 0x41, 0x38, 0x91, 0xe7, //* ^.|.........A8.. */ 
+    /* 0x00000dc0 */ 0x71, 0x1f, 0x69, 0xbe, 0x62, 0x47, 0x17, 0x5f, 0xca, 0xfe, 0x10, 0x0d, 0x1c, 0x5e, 0x59, 0x59, //* q.i.bG._.....^YY */ 
+    /* 0x00000dd0 */ 0x59, 0xa1, 0x61, 0xb9, 0x79, 0x6c, 0xec, 0x4d, 0xe5, 0x17, 0xa8, 0xe6, 0x63, 0x79, 0xdf, 0x3c, //* Y.a.yl.M....cy.< */ 
+    /* 0x00000de0 */ 0x21, 0x2f, 0x3f, 0xd4, 0x7b, 0xf0, 0x23, 0x19, 0x7a, 0x9e, 0x22, 0x02, 0x46, 0x17, 0x05, 0x13, //* !/?.{.#.z.".F... */ 
+    /* 0x00000df0 */ 0xbb, 0x97, 0xca, 0x8a, 0xaf, 0x3f, 0x2f, 0x21, 0x5c, 0x1f, 0xf5, 0xae, 0x9a, 0x18, 0xd1, 0xb8, //* .....?/!\....... */ 
+    /* 0x00000e00 */ 0x1c, 0x2e, 0x85, 0x4e, 0x4e, 0xaa, 0x80, 0x9d, 0x9f, 0xbd, 0xf0, 0x63, 0xce, 0x24, 0x1b, 0x1d, //* ...NN......c.$.. */ 
+    /* 0x00000e10 */ 0x5d, 0xf6, 0x9a, 0x43, 0x83, 0xc8, 0xdb, 0x5c, 0x95, 0x3d, 0x4c, 0x52, 0x6e, 0x84, 0xc7, 0xbb, //* ]..C...\.=LRn... */ 
+    /* 0x00000e20 */ 0x4b, 0x78, 0xe0, 0xed, 0xfb, 0xf7, 0x59, 0xca, 0xd9, 0xef, 0xc7, 0xa7, 0xa6, 0xf0, 0x2d, 0xae, //* Kx....Y.......-. */ 
+    /* 0x00000e30 */ 0xc5, 0x9e, 0x4e, 0xe0, 0x31, 0x2e, 0x30, 0x4f, 0x2f, 0xf6, 0x54, 0x4b, 0xb4, 0x2a, 0xe0, 0xd0, //* ..N.1.0O/.TK.*.. */ 
+    /* 0x00000e40 */ 0x89, 0xd9, 0xbb, 0xd7, 0x19, 0x64, 0xed, 0x36, 0xfb, 0x71, 0x2f, 0xf6, 0xe7, 0xb0, 0x41, 0x21, //* .....d.6.q/...A! */ 
+    /* 0x00000e50 */ 0xb1, 0xfc, 0xd3, 0xfa, 0x86, 0x8c, 0xd7, 0x0a, 0x05, 0x60, 0xb8, 0xbb, 0xbb, 0xe3, 0xd0, 0x64, //* .........`.....d */ 
+    /* 0x00000e60 */ 0x29, 0x16, 0x34, 0x5d, 0xac, 0x3b, 0x06, 0xe3, 0x38, 0xcd, 0xba, 0x0c, 0x0b, 0x0e, 0x46, 0x8e, //* ).4].;..8.....F. */ 
+    /* 0x00000e70 */ 0xa6, 0x7a, 0x33, 0x78, 0x71, 0xe1, 0xe4, 0x5d, 0xaa, 0x8d, 0x95, 0xff, 0x96, 0x16, 0x97, 0xc9, //* .z3xq..]........ */ 
+    /* 0x00000e80 */ 0x9a, 0x9c, 0xdf, 0x26, 0xa7, 0xaa, 0x8a, 0x27, 0xfe, 0xd5, 0x7d, 0x62, 0x30, 0x36, 0x75, 0x96, //* ...&...'..}b06u. */ 
+    /* 0x00000e90 */ 0x4c, 0x6e, 0x96, 0x4e, 0xa9, 0xb9, 0x86, 0x06, 0x11, 0x36, 0x85, 0x40, 0x7b, 0x64, 0x32, 0x1f, //* Ln.N.....6.@{d2. */ 
+    /* 0x00000ea0 */ 0x17, 0x1d, 0x9d, 0x7f, 0x6d, 0x6d, 0x2d, 0xa1, 0xe2, 0xc9, 0x57, 0xa0, 0x40, 0xbf, 0xa9, 0x16, //* ....mm-...W.@... */ 
+    /* 0x00000eb0 */ 0x15, 0xfa, 0x56, 0x53, 0x53, 0x13, 0x8d, 0x9e, 0xb0, 0xe7, 0x9d, 0x93, 0xb3, 0x7e, 0xd7, 0x43, //* ..VSS........~.C */ 
+    /* 0x00000ec0 */ 0xa7, 0x24, 0x11, 0x01, 0x01, 0x78, 0xfd, 0xef, 0x26, 0xb2, 0x5f, 0xff, 0xb4, 0x4a, 0xc1, 0xe2, //* .$...x..&._..J.. */ 
+    /* 0x00000ed0 */ 0x1a, 0x6c, 0x9f, 0xbd, 0x8f, 0xc4, 0xec, 0xa0, 0x7d, 0x9e, 0x9e, 0x2c, 0xf1, 0x3b, 0xdc, 0x60, //* .l......}..,.;.` */ 
+    /* 0x00000ee0 */ 0x8a, 0x44, 0x92, 0xf3, 0xbf, 0x80, 0xd2, 0x35, 0xfa, 0x14, 0x2d, 0x4c, 0xe6, 0xc9, 0x83, 0xfa, //* .D.....5..-L.... */ 
+    /* 0x00000ef0 */ 0x8b, 0x1d, 0xcf, 0x61, 0x38, 0x9a, 0x95, 0x45, 0xab, 0xcc, 0x0c, 0x92, 0x95, 0xa8, 0x68, 0x9a, //* ...a8..E......h. */ 
+    /* 0x00000f00 */ 0xb0, 0xcb, 0xc1, 0xea, 0x78, 0xa6, 0x54, 0xb1, 0x1a, 0x06, 0x40, 0x46, 0x4a, 0xca, 0xc5, 0x79, //* ....x.T...@FJ..y */ 
+    /* 0x00000f10 */ 0x42, 0x2b, 0x25, 0xe5, 0x2f, 0xf8, 0x75, 0x9e, 0x33, 0x4d, 0x70, 0x43, 0x31, 0x50, 0x52, 0xe2, //* B+%./.u.3MpC1PR. */ 
+    /* 0x00000f20 */ 0x47, 0xf3, 0xb7, 0x53, 0x5a, 0x6c, 0x77, 0x8f, 0xd3, 0xb5, 0xae, 0x60, 0x42, 0xbf, 0xe1, 0x02, //* G..SZlw....`B... */ 
+    /* 0x00000f30 */ 0xc3, 0xb6, 0x56, 0x44, 0xe0, 0xb5, 0xe5, 0x78, 0x3b, 0x4e, 0x7b, 0x57, 0x7a, 0x3c, 0x3b, 0x83, //* ..VD...x;N{Wz<;. */ 
+    /* 0x00000f40 */ 0xb4, 0x41, 0x9b, 0x77, 0xaa, 0x45, 0x8d, 0xfe, 0x36, 0xd7, 0x1f, 0x53, 0x93, 0xdb, 0xd1, 0xd1, //* .A.w.E..6..S.... */ 
+    /* 0x00000f50 */ 0x51, 0x0a, 0x01, 0xbb, 0x8c, 0x1b, 0xaf, 0xb3, 0x9f, 0x2c, 0x22, 0xa0, 0xfe, 0x4c, 0x4d, 0x4d, //* Q........,"..LMM */ 
+    /* 0x00000f60 */ 0x55, 0x63, 0xcb, 0xeb, 0xf4, 0x68, 0xd8, 0x25, 0xe6, 0xe6, 0x6e, 0x91, 0xef, 0x95, 0xad, 0x90, //* Uc...h.%..n..... */ 
+    /* 0x00000f70 */ 0x10, 0x11, 0x11, 0x65, 0x03, 0x76, 0x33, 0x45, 0xea, 0x72, 0xf2, 0xb2, 0x84, 0xae, 0x70, 0x33, //* ...e.v3E.r....p3 */ 
+    /* 0x00000f80 */ 0x7e, 0xe2, 0x3e, 0x3e, 0x3e, 0x70, 0x19, 0xe0, 0xec, 0xf8, 0x4b, 0xf9, 0x35, 0x38, 0xee, 0x28, //* ~.>>>p....K.58.( */ 
+    /* 0x00000f90 */ 0xd8, 0x53, 0x55, 0xda, 0x3e, 0x8b, 0xa6, 0xcd, 0xe6, 0xc1, 0xaf, 0x4e, 0x17, 0xaa, 0xee, 0x6d, //* .SU.>......N...m */ 
+    /* 0x00000fa0 */ 0x6f, 0xf7, 0xf2, 0x95, 0x2e, 0x9e, 0x4c, 0x6e, 0x0d, 0x35, 0xdb, 0x6f, 0x20, 0x41, 0xc6, 0xdb, //* o.....Ln.5.o A.. */ 
+    /* 0x00000fb0 */ 0xdb, 0xc5, 0x5d, 0x57, 0xec, 0xda, 0xcb, 0x1a, 0x28, 0xbb, 0xe8, 0x68, 0x77, 0xd7, 0xd6, 0x3a, //* ..]W....(..hw..: */ 
+    /* 0x00000fc0 */ 0x88, 0x13, 0x13, 0x45, 0x0e, 0x7d, 0xde, 0xb3, 0xe5, 0x9b, 0x0d, 0xc5, 0x3d, 0x9c, 0x8f, 0x89, //* ...E.}......=... */ 
+    /* 0x00000fd0 */ 0xa1, 0x42, 0x37, 0xfa, 0x7c, 0x3a, 0x66, 0x4b, 0x17, 0xed, 0xf6, 0x6b, 0x0f, 0x7f, 0x0e, 0x39, //* .B7.|:fK...k...9 */ 
+    /* 0x00000fe0 */ 0xb2, 0xc4, 0x0f, 0x91, 0x52, 0x51, 0x8d, 0xbe, 0x58, 0xb0, 0x36, 0x75, 0x74, 0x3c, 0xe7, 0x15, //* ....RQ..X.6ut<.. */ 
+    /* 0x00000ff0 */ 0x32, 0x6b, 0xd3, 0x78, 0x32, 0x50, 0xf6, 0xc1, 0xd4, 0xd2, 0xd2, 0x92, 0x1b, 0x1c, 0x1a, 0x3a, //* 2k.x2P.........: */ 
+    /* 0x00001000 */ 0x3f, 0x5a, 0xa8, 0x29, 0x76, 0x9a, 0xcc, 0x91, 0xe6, 0xe4, 0xe5, 0x7d, 0xf7, 0xd0, 0xf5, 0xed, //* ?Z.)v......}.... */ 
+    /* 0x00001010 */ 0xa1, 0x71, 0x4b, 0x33, 0x45, 0xc0, 0x1e, 0x8e, 0x91, 0x91, 0x11, 0x6c, 0x8f, 0x92, 0xe9, 0xa2, //* .qK3E......l.... */ 
+    /* 0x00001020 */ 0x5e, 0x31, 0x09, 0x09, 0x21, 0xb5, 0xd6, 0x8b, 0x26, 0x35, 0xfb, 0x56, 0x4b, 0x6d, 0xd4, 0xe1, //* ^1..!...&5.VKm.. */ 
+    /* 0x00001030 */ 0x1b, 0xad, 0xad, 0x8d, 0x3d, 0x2f, 0xb6, 0x6d, 0x30, 0x2a, 0x2b, 0x3f, 0xd9, 0x39, 0xd9, 0x41, //* ....=/.m0*+?.9.A */ 
+    /* 0x00001040 */ 0xbf, 0x7f, 0x57, 0xae, 0x56, 0x29, 0x3c, 0x30, 0xf8, 0xae, 0xd1, 0xe6, 0xfd, 0x18, 0x25, 0x28, //* ..W.V)<0......%( */ 
+    /* 0x00001050 */ 0x28, 0xc8, 0x0f, 0x24, 0xc8, 0xa5, 0x08, 0xe0, 0x32, 0x32, 0xf6, 0xa2, 0xa0, 0x37, 0x45, 0xcd, //* (..$....22...7E. */ 
+    /* 0x00001060 */ 0x96, 0xea, 0xae, 0x0d, 0x27, 0xf2, 0xdc, 0x3c, 0xdd, 0x1f, 0x1b, 0x5b, 0x58, 0x04, 0x3f, 0x34, //* ....'..<...[X.?4 */ 
+    /* 0x00001070 */ 0x7b, 0xfe, 0xfc, 0xc9, 0x5a, 0x61, 0xb3, 0xac, 0x03, 0x40, 0x53, 0x97, 0x91, 0x2d, 0x27, 0x73, //* {...Za...@S..-'s */ 
+    /* 0x00001080 */ 0x70, 0xcb, 0xf4, 0x9b, 0x90, 0x40, 0x03, 0xc0, 0x15, 0x5a, 0xa2, 0x5b, 0x77, 0xc4, 0x04, 0x22, //* p....@...Z.[w.." */ 
+    /* 0x00001090 */ 0x67, 0x92, 0x17, 0xd4, 0x15, 0x13, 0x1d, 0x3d, 0xbc, 0x90, 0x50, 0xf1, 0xf3, 0x56, 0xd7, 0xe2, //* g......=..P..V.. */ 
+    /* 0x000010a0 */ 0x62, 0x32, 0xc8, 0xc1, 0x73, 0x65, 0x81, 0xf6, 0x60, 0x07, 0x06, 0x27, 0x6d, 0x0b, 0xf6, 0x52, //* b2..se..`..'m..R */ 
+    /* 0x000010b0 */ 0xb3, 0xde, 0xec, 0x9c, 0x48, 0x39, 0x10, 0xf6, 0x91, 0x5e, 0x7d, 0xfa, 0x37, 0x28, 0xac, 0xa1, //* ....H9...^}.7(.. */ 
+    /* 0x000010c0 */ 0xa5, 0x43, 0xf3, 0xf3, 0x5a, 0x75, 0x81, 0x19, 0xa0, 0x9e, 0xfc, 0xd1, 0xd8, 0xb4, 0x9e, 0x2f, //* .C..Zu........./ */ 
+    /* 0x000010d0 */ 0x7f, 0x31, 0x96, 0x2a, 0xdc, 0x57, 0x61, 0xda, 0x87, 0x07, 0xfc, 0xcb, 0xb9, 0x98, 0x71, 0x9c, //* .1.*.Wa.......q. */ 
+    /* 0x000010e0 */ 0x27, 0x70, 0x6a, 0x10, 0xda, 0x43, 0xf1, 0x99, 0xec, 0xcf, 0xb7, 0x47, 0x9c, 0x1c, 0x1d, 0x37, //* 'pj..C.....G...7 */ 
+    /* 0x000010f0 */ 0x8c, 0x22, 0x21, 0x08, 0x90, 0xf1, 0xce, 0x4e, 0x13, 0x5f, 0x9b, 0x86, 0x63, 0x02, 0x50, 0x87, //* ."!....N._..c.P. */ 
+    /* 0x00001100 */ 0xe5, 0x2f, 0x2e, 0x72, 0xd0, 0xf4, 0x7d, 0x9b, 0x9f, 0x5b, 0x29, 0x37, 0xd6, 0x79, 0x5f, 0x56, //* ./.r..}..[)7.y_V */ 
+    /* 0x00001110 */ 0x73, 0x6b, 0x13, 0x81, 0xcd, 0xbc, 0x6f, 0x77, 0xd7, 0x32, 0x4d, 0xc8, 0xb9, 0x28, 0x8c, 0x93, //* sk....ow.2M..(.. */ 
+    /* 0x00001120 */ 0x15, 0x61, 0xb2, 0x4c, 0x5f, 0x78, 0x70, 0xcb, 0x21, 0x4d, 0xc4, 0xed, 0x07, 0x60, 0x69, 0x62, //* .a.L_xp.!M...`ib */ 
+    /* 0x00001130 */ 0x72, 0x46, 0xec, 0xab, 0xc5, 0xff, 0xd9, 0x24, 0xd3, 0x59, 0xd5, 0xc8, 0xd2, 0x92, 0xf9, 0xfa, //* rF.....$.Y...... */ 
+    /* 0x00001140 */ 0xe0, 0xb7, 0x14, 0x90, 0xc2, 0xfb, 0x85, 0x08, 0x2c, 0xcd, 0x86, 0xcd, 0x9d, 0x74, 0x14, 0x28, //* ........,....t.( */ 
+    /* 0x00001150 */ 0x31, 0x87, 0x01, 0x41, 0x1f, 0x9f, 0x04, 0x4e, 0x42, 0x7a, 0x7c, 0xdf, 0xea, 0xaa, 0x11, 0x16, //* 1..A...NBz|..... */ 
+    /* 0x00001160 */ 0x09, 0x27, 0x14, 0x48, 0xd3, 0xd2, 0xd1, 0xe1, 0x9b, 0x7c, 0x75, 0x9f, 0x2a, 0xa1, 0xa8, 0xd8, //* .'.H.....|u.*... */ 
+    /* 0x00001170 */ 0x88, 0x09, 0xec, 0x8c, 0x24, 0x8f, 0x39, 0xee, 0x8c, 0x72, 0xd1, 0xd3, 0x07, 0x08, 0xbb, 0x1e, //* ....$.9..r...... */ 
+    /* 0x00001180 */ 0xae, 0x7b, 0x1c, 0xb7, 0x29, 0x6e, 0x2c, 0xd4, 0xb8, 0xad, 0xb6, 0x8b, 0xae, 0xb4, 0x90, 0x77, //* .{..)n,........w */ 
+    /* 0x00001190 */ 0x15, 0x14, 0x7c, 0x6c, 0x6c, 0x6a, 0x3a, 0x3f, 0xf8, 0x5d, 0x95, 0x25, 0x0e, 0xb2, 0xa2, 0x9c, //* ..|llj:?.].%.... */ 
+    /* 0x000011a0 */ 0xa2, 0x22, 0x07, 0x31, 0xf0, 0x21, 0x82, 0xa4, 0xe3, 0xc7, 0x0f, 0x3c, 0x2a, 0xe1, 0x3c, 0xd2, //* .".1.!.....<*.<. */ 
+    /* 0x000011b0 */ 0x9c, 0xe7, 0xb2, 0x40, 0x20, 0x01, 0x09, 0xfa, 0xf4, 0xf4, 0x94, 0xd5, 0xf2, 0xab, 0xb8, 0xf8, //* ...@ ........... */ 
+    /* 0x000011c0 */ 0xa5, 0xbf, 0x9f, 0x5f, 0x77, 0x9c, 0xc3, 0x87, 0x26, 0x3e, 0x46, 0x94, 0x4f, 0xf6, 0xf6, 0x5c, //* ..._w...&>F.O..\ */ 
+    /* 0x000011d0 */ 0x84, 0x68, 0x81, 0xf5, 0x94, 0x76, 0xcf, 0x4f, 0x8f, 0x61, 0xc8, 0xe6, 0x61, 0x36, 0x1d, 0xc7, //* .h...v.O.a..a6.. */ 
+    /* 0x000011e0 */ 0x08, 0x41, 0x41, 0x41, 0x2d, 0x90, 0xf1, 0xa1, 0xa1, 0x64, 0x86, 0xdc, 0xdc, 0x12, 0x39, 0x50, //* .AAA-....d....9P */ 
+    /* 0x000011f0 */ 0x2f, 0x7c, 0xee, 0xa4, 0xcf, 0xbb, 0x35, 0x28, 0x40, 0x08, 0x5f, 0x8f, 0x24, 0xc7, 0x45, 0xc8, //* /|....5(@._.$.E. */ 
+    /* 0x00001200 */ 0x41, 0x50, 0xd2, 0x00, 0x6d, 0x4b, 0x14, 0xd8, 0x4b, 0x29, 0x21, 0x04, 0x8a, 0x89, 0xdc, 0x81, //* AP..mK..K)!..... */ 
+    /* 0x00001210 */ 0x20, 0x69, 0x80, 0xc0, 0xc7, 0x00, 0x90, 0x91, 0x91, 0x69, 0xe0, 0x7e, 0xa4, 0x54, 0x3d, 0x8f, //*  i.......i.~.T=. */ 
+    /* 0x00001220 */ 0x06, 0x36, 0x8f, 0x7e, 0x57, 0x05, 0xbf, 0x63, 0xe8, 0x59, 0xda, 0x6f, 0x88, 0xce, 0x57, 0xb8, //* .6.~W..c.Y.o..W. */ 
+    /* 0x00001230 */ 0x9d, 0x98, 0x9b, 0x8b, 0x2f, 0xd5, 0xa9, 0xa1, 0x05, 0x1a, 0x4b, 0x9d, 0x2d, 0xd4, 0x2e, 0xac, //* ..../.....K.-... */ 
+    /* 0x00001240 */ 0xa9, 0xc4, 0xbc, 0xfd, 0x0c, 0x0c, 0x82, 0xbf, 0xdd, 0x5d, 0x90, 0x8a, 0xba, 0xfd, 0x60, 0x66, //* .........]....`f */ 
+    /* 0x00001250 */ 0xa5, 0x60, 0x61, 0x61, 0x21, 0xbc, 0xce, 0x4a, 0xc4, 0x69, 0xf1, 0x3f, 0x48, 0xe0, 0x34, 0xa6, //* .`aa!..J.i.?H.4. */ 
+    /* 0x00001260 */ 0x45, 0xaf, 0x29, 0xfa, 0xb2, 0x35, 0xc2, 0xf2, 0x43, 0x8d, 0x75, 0xa8, 0xde, 0xfb, 0x31, 0x88, //* E.)..5..C.u...1. */ 
+    /* 0x00001270 */ 0x55, 0x12, 0x15, 0x15, 0x75, 0xad, 0xd1, 0x79, 0x1f, 0x05, 0x0a, 0x52, 0x95, 0x6c, 0x49, 0x49, //* U...u..y...R.lII */ 
+    /* 0x00001280 */ 0xc9, 0x02, 0xa4, 0xff, 0xe9, 0x6a, 0xd1, 0xb6, 0x50, 0xa3, 0xd8, 0xed, 0xe9, 0xc1, 0x4d, 0xb2, //* .....j..P.....M. */ 
+    /* 0x00001290 */ 0x0a, 0x9e, 0x19, 0x2d, 0xc7, 0x7e, 0x83, 0x31, 0x15, 0xf8, 0x54, 0x66, 0xd8, 0xe6, 0x6b, 0xb6, //* ...-.~.1..Tf..k. */ 
+    /* 0x000012a0 */ 0xe0, 0x45, 0xd4, 0x20, 0x12, 0x1f, 0x1a, 0x2a, 0x0d, 0xd6, 0x17, 0x1b, 0x36, 0xf5, 0x53, 0x2c, //* .E. ...*....6.S, */ 
+    /* 0x000012b0 */ 0xd8, 0x0b, 0xf2, 0x93, 0x93, 0xc9, 0xe1, 0xe1, 0xe0, 0x6e, 0x68, 0xd8, 0xa3, 0xce, 0x96, 0xf4, //* .........nh..... */ 
+    /* 0x000012c0 */ 0xec, 0x91, 0xab, 0x3a, 0x43, 0x84, 0x69, 0x68, 0xa0, 0x40, 0x65, 0x64, 0x64, 0x64, 0xb2, 0xda, //* ...:C.ih.@eddd.. */ 
+    /* 0x000012d0 */ 0x23, 0xf9, 0x31, 0x56, 0x07, 0x18, 0xf5, 0x7c, 0x15, 0xed, 0xbc, 0x8a, 0x68, 0xd6, 0x97, 0xa6, //* #.1V...|....h... */ 
+    /* 0x000012e0 */ 0x17, 0xa5, 0x8b, 0xcd, 0x4e, 0x7b, 0xdc, 0xb6, 0x4b, 0xf5, 0x03, 0x01, 0x01, 0x1f, 0x40, 0x90, //* ....N{..K.....@. */ 
+    /* 0x000012f0 */ 0x49, 0x7d, 0xa5, 0x5b, 0xb3, 0xf9, 0x77, 0xa6, 0xd8, 0xed, 0x6c, 0x93, 0xa5, 0xb7, 0x7b, 0xc9, //* I}.[..w...l...{. */ 
+    /* 0x00001300 */ 0xd8, 0xa5, 0xb6, 0xe4, 0xcc, 0xc6, 0x98, 0x05, 0x30, 0xee, 0xf0, 0x43, 0xa4, 0x1f, 0xe8, 0xef, //* ........0..C.... */ 
+    /* 0x00001310 */ 0xff, 0x28, 0x59, 0xe5, 0x9d, 0x0b, 0xd6, 0x87, 0x73, 0x79, 0x75, 0xf5, 0x01, 0xf2, 0x6a, 0x4f, //* .(Y.....syu...jO */ 
+    /* 0x00001320 */ 0x8a, 0xa0, 0xa3, 0xb6, 0x9a, 0x9a, 0x5c, 0x83, 0xde, 0xa8, 0x7e, 0x93, 0x8b, 0x7d, 0x3b, 0xd4, //* ......\...~..};. */ 
+    /* 0x00001330 */ 0xf7, 0xeb, 0xd5, 0x8a, 0xc7, 0xc1, 0x44, 0x36, 0xf2, 0xfd, 0xd5, 0x63, 0x80, 0x82, 0x82, 0xc2, //* ......D6...c.... */ 
+    /* 0x00001340 */ 0xf0, 0xd8, 0x9c, 0xd6, 0x04, 0x3a, 0xfd, 0x0c, 0x41, 0x01, 0xde, 0xeb, 0x5a, 0x5d, 0xfa, 0xc4, //* .....:..A...Z].. */ 
+    /* 0x00001350 */ 0xef, 0xdf, 0x25, 0x90, 0x91, 0x91, 0xe1, 0xbe, 0x65, 0xb3, 0x1e, 0x27, 0xf7, 0xc2, 0x03, 0xa6, //* ..%.....e..'.... */ 
+    /* 0x00001360 */ 0x26, 0x47, 0xa1, 0x84, 0xca, 0x3a, 0x45, 0x9b, 0x5d, 0xc1, 0xa8, 0x22, 0xae, 0xec, 0xd0, 0x0f, //* &G...:E.]..".... */ 
+    /* 0x00001370 */ 0x51, 0x14, 0x99, 0x6d, 0x6d, 0x62, 0xcb, 0x4b, 0x4b, 0xf5, 0x9f, 0x06, 0xf0, 0xca, 0x74, 0x6a, //* Q..mmb.KK.....tj */ 
+    /* 0x00001380 */ 0xc2, 0x8e, 0x8e, 0x8e, 0x30, 0xb0, 0xb1, 0x2d, 0x0c, 0x0c, 0xd8, 0xeb, 0x6c, 0x96, 0x59, 0x6b, //* ....0..-....l.Yk */ 
+    /* 0x00001390 */ 0x53, 0x02, 0xd1, 0x89, 0x55, 0x70, 0x10, 0x18, 0xe9, 0xe9, 0x43, 0x76, 0x30, 0x30, 0x30, 0xd4, //* S...Up....Cv000. */ 
+    /* 0x000013a0 */ 0x00, 0x35, 0xb0, 0x14, 0x4c, 0x41, 0x9d, 0x9c, 0x9a, 0x9c, 0x14, 0x78, 0x2f, 0xac, 0x61, 0x89, //* .5..LA.....x/.a. */ 
+    /* 0x000013b0 */ 0xa8, 0x9d, 0x7b, 0x19, 0x18, 0x1c, 0xfc, 0xe5, 0x48, 0x6a, 0x1c, 0x63, 0x9b, 0x30, 0x27, 0x3f, //* ..{.....Hj.c.0'? */ 
+    /* 0x000013c0 */ 0xdf, 0xf1, 0xee, 0x62, 0x0f, 0x01, 0x67, 0x02, 0xd4, 0x13, 0x9d, 0x46, 0x9f, 0xf5, 0xd4, 0x4c, //* ...b..g....F...L */ 
+    /* 0x000013d0 */ 0x50, 0xc3, 0xf9, 0x00, 0xaa, 0x8b, 0xa3, 0xe5, 0xe0, 0x53, 0x6c, 0xea, 0x30, 0x42, 0x25, 0x52, //* P........Sl.0B%R */ 
+    /* 0x000013e0 */ 0xd0, 0x62, 0xf5, 0x88, 0x01, 0xac, 0x40, 0x1d, 0x84, 0xe0, 0x9f, 0xd2, 0xc1, 0x8a, 0x52, 0x24, //* .b....@.......R$ */ 
+    /* 0x000013f0 */ 0x24, 0x24, 0x10, 0xda, 0x41, 0xe3, 0x08, 0xb6, 0x1e, 0x10, 0x08, 0xc1, 0xda, 0x89, 0x32, 0x61, //* $$..A.........2a */ 
+    /* 0x00001400 */ 0x70, 0x3d, 0x5e, 0x89, 0x1c, 0x18, 0x18, 0x4b, 0x4c, 0x4d, 0xd5, 0xe7, 0x1a, 0x8a, 0xaa, 0x28, //* p=^....KLM.....( */ 
+    /* 0x00001410 */ 0x2f, 0x27, 0xb1, 0x55, 0x29, 0xd6, 0x38, 0x5f, 0xa8, 0xf9, 0xe2, 0x63, 0x62, 0x64, 0x84, 0xa3, //* /'.U).8_...cbd.. */ 
+    /* 0x00001420 */ 0x5d, 0xf1, 0x7a, 0x0a, 0xa4, 0x1c, 0x83, 0x06, 0x87, 0x40, 0x87, 0x86, 0x14, 0xb4, 0x40, 0x3f, //* ].z......@....@? */ 
+    /* 0x00001430 */ 0x0e, 0x83, 0x66, 0x23, 0xf1, 0x76, 0xb7, 0x85, 0xc5, 0x6b, 0x26, 0xe8, 0xce, 0x48, 0x12, 0xaf, //* ..f#.v...k&..H.. */ 
+    /* 0x00001440 */ 0xc7, 0xf5, 0xf2, 0xfa, 0x57, 0x6b, 0x6b, 0x6b, 0xe0, 0xed, 0xfc, 0xfc, 0x3c, 0xf7, 0xae, 0x0a, //* ....Wkkk....<... */ 
+    /* 0x00001450 */ 0x8e, 0xac, 0x8c, 0x01, 0xd6, 0x91, 0x4c, 0xee, 0x8f, 0xbe, 0x68, 0x6a, 0x26, 0x40, 0x86, 0xde, //* ......L...hj&@.. */ 
+    /* 0x00001460 */ 0x3d, 0xfa, 0xef, 0x74, 0xa1, 0xe9, 0xaf, 0x96, 0x12, 0x64, 0x68, 0x44, 0x97, 0x0f, 0x55, 0x16, //* =..t.....dhD..U. */ 
+    /* 0x00001470 */ 0x4d, 0x01, 0x29, 0x31, 0x71, 0xdf, 0xe7, 0xa9, 0x3c, 0xee, 0x37, 0x6f, 0x52, 0xc1, 0xaa, 0x17, //* M.)1q...<.7oR... */ 
+    /* 0x00001480 */ 0x7b, 0x38, 0xf1, 0x67, 0x8e, 0x69, 0x72, 0x3d, 0xae, 0xa8, 0xaf, 0xaf, 0xef, 0x74, 0xe1, 0xaf, //* {8.g.ir=.....t.. */ 
+    /* 0x00001490 */ 0x05, 0x35, 0x2e, 0x0e, 0xe6, 0xf3, 0x67, 0x70, 0xb2, 0x28, 0x2e, 0x33, 0x73, 0x4d, 0x02, 0x1e, //* .5....gp.(.3sM.. */ 
+    /* 0x000014a0 */ 0x1e, 0xfe, 0x34, 0x49, 0x51, 0xf4, 0x36, 0x00, 0xb4, 0x92, 0x9f, 0xc2, 0x89, 0x5e, 0xbd, 0x1c, //* ..4IQ.6......^.. */ 
+    /* 0x000014b0 */ 0xd5, 0x2f, 0xaf, 0xb1, 0x36, 0x57, 0xbd, 0x6d, 0x74, 0x4d, 0x3a, 0x5a, 0x6e, 0x22, 0x87, 0xd7, //* ./..6W.mtM:Zn".. */ 
+    /* 0x000014c0 */ 0xc2, 0xce, 0xb0, 0xdb, 0x1e, 0xb6, 0xdd, 0xdd, 0xf7, 0x48, 0xc9, 0x57, 0xbc, 0x77, 0xec, 0xf0, //* .........H.W.w.. */ 
+    /* 0x000014d0 */ 0x0b, 0x24, 0x24, 0x3c, 0xcb, 0xb0, 0x59, 0xbe, 0x6b, 0x24, 0x9c, 0x24, 0x16, 0x3f, 0x05, 0xc1, //* .$$<..Y.k$.$.?.. */ 
+    /* 0x000014e0 */ 0xb9, 0x40, 0xa3, 0x18, 0x54, 0x48, 0x96, 0xf8, 0x2f, 0x14, 0xa2, 0xd8, 0x54, 0x22, 0x1f, 0x81, //* .@..TH../...T".. */ 
+    /* 0x000014f0 */ 0x66, 0xe7, 0x7d, 0x22, 0x69, 0x87, 0x5f, 0xf9, 0x4c, 0x90, 0x82, 0xfd, 0x99, 0xe2, 0xeb, 0x0a, //* f.}"i._.L....... */ 
+    /* 0x00001500 */ 0x05, 0x52, 0xda, 0xde, 0x1a, 0xb9, 0x3c, 0x12, 0x12, 0x32, 0x3d, 0x48, 0x4c, 0x46, 0x6a, 0x71, //* .R....<..2=HLFjq */ 
+    /* 0x00001510 */ 0x37, 0x64, 0xde, 0x56, 0x6f, 0xe8, 0x93, 0xd6, 0x71, 0x6b, 0xcb, 0x9f, 0x6e, 0xb4, 0x1b, 0xdd, //* 7d.Vo...qk..n... */ 
+    /* 0x00001520 */ 0x81, 0x7b, 0xa0, 0x16, 0xa8, 0x47, 0xa6, 0x41, 0x15, 0x2f, 0x01, 0xbf, 0xd1, 0xec, 0x9d, 0xc6, //* .{...G.A./...... */ 
+    /* 0x00001530 */ 0xe5, 0x33, 0x4c, 0x83, 0x07, 0x0e, 0xf0, 0x79, 0x7e, 0x74, 0x2d, 0x9a, 0x61, 0x9d, 0x30, 0x5e, //* .3L....y~t-.a.0^ */ 
+    /* 0x00001540 */ 0xeb, 0x09, 0x27, 0xf6, 0x4c, 0x4b, 0x91, 0xfb, 0x81, 0x11, 0x1d, 0x52, 0x80, 0xf3, 0x17, 0x6b, //* ..'.LK.....R...k */ 
+    /* 0x00001550 */ 0x39, 0xfc, 0x39, 0x2a, 0x08, 0x93, 0x8c, 0x4c, 0x57, 0x5b, 0x5b, 0xbb, 0xc5, 0x62, 0xb1, 0x84, //* 9.9*...LW[[..b.. */ 
+    /* 0x00001560 */ 0x71, 0x57, 0x1c, 0xf1, 0x98, 0xd7, 0xc7, 0x70, 0x2c, 0x27, 0x4e, 0xfa, 0x95, 0xae, 0xae, 0x2e, //* qW.....p,'N..... */ 
+    /* 0x00001570 */ 0xfc, 0xf2, 0x6b, 0x7d, 0x7a, 0xbc, 0x01, 0x38, 0x40, 0xc4, 0xf9, 0x2f, 0x7d, 0xe1, 0x4c, 0xd0, //* ..k}z..8@../}.L. */ 
+    /* 0x00001580 */ 0x4f, 0x19, 0x06, 0xe9, 0xb3, 0xcf, 0xeb, 0xaa, 0x2e, 0xbb, 0xe3, 0xbe, 0xc0, 0x24, 0xd8, 0x5e, //* O............$.^ */ 
+    /* 0x00001590 */ 0xa7, 0xb5, 0xae, 0x17, 0xc8, 0x0c, 0xa8, 0x2d, 0x20, 0xa0, 0x66, 0x2a, 0x2f, 0xd1, 0x29, 0x33, //* .......- .f*/.)3 */ 
+    /* 0x000015a0 */ 0x13, 0x3c, 0x6c, 0x27, 0xdb, 0xa2, 0x8c, 0x78, 0x6e, 0x7d, 0x59, 0x46, 0xb7, 0xfa, 0x16, 0x39, //* .<l'...xn}YF...9 */ 
+    /* 0x000015b0 */ 0x0d, 0xba, 0x59, 0x6c, 0x80, 0x4a, 0xf8, 0xa8, 0x58, 0x1d, 0xb9, 0x5b, 0x9a, 0x02, 0x13, 0x03, //* ..Yl.J..X..[.... */ 
+    /* 0x000015c0 */ 0x23, 0x4d, 0x47, 0x47, 0x47, 0xe3, 0x8b, 0x7a, 0xcd, 0x02, 0xa6, 0x91, 0x7c, 0x32, 0x5f, 0x24, //* #MGGG..z....|2_$ */ 
+    /* 0x000015d0 */ 0x60, 0xb7, 0x63, 0x30, 0xfc, 0x66, 0x42, 0x72, 0x65, 0x6c, 0xec, 0x17, 0xed, 0xad, 0xbb, 0x8b, //* `.c0.fBrel...... */ 
+    /* 0x000015e0 */ 0x8b, 0x8b, 0xfd, 0xcc, 0x4b, 0xab, 0x6f, 0xf8, 0x0f, 0x5c, 0x6e, 0x67, 0x04, 0xac, 0x30, 0x33, //* ....K.o..\ng..03 */ 
+    /* 0x000015f0 */ 0x39, 0x05, 0x05, 0x22, 0x75, 0xad, 0x42, 0x35, 0x9d, 0xc3, 0xf8, 0xa1, 0x62, 0x7d, 0xf4, 0x09, //* 9.."u.B5....b}.. */ 
+    /* 0x00001600 */ 0x87, 0xfc, 0xf2, 0x72, 0x1c, 0xab, 0x1a, 0x34, 0x19, 0xb3, 0xc2, 0x6f, 0x2a, 0x86, 0x86, 0x7f, //* ...r...4...o*... */ 
+    /* 0x00001610 */ 0x8a, 0x64, 0xca, 0xac, 0x3e, 0x3a, 0x13, 0x7e, 0xac, 0xa0, 0x29, 0x90, 0xc0, 0x43, 0x0a, 0xe2, //* .d..>:.~..)..C.. */ 
+    /* 0x00001620 */ 0xe0, 0xd5, 0xf8, 0x71, 0x58, 0xb4, 0x59, 0x14, 0xa4, 0xa6, 0xe9, 0x4b, 0x42, 0x4e, 0x4a, 0x2a, //* ...qX.Y....KBNJ* */ 
+    /* 0x00001630 */ 0x41, 0x0b, 0xcb, 0x50, 0xa0, 0x54, 0x75, 0x3a, 0x9a, 0x46, 0x1d, 0x47, 0xc9, 0xc9, 0x86, 0xc1, //* A..P.Tu:.F.G.... */ 
+    /* 0x00001640 */ 0xd4, 0x29, 0x97, 0x87, 0x67, 0x42, 0xff, 0xb2, 0xc6, 0x68, 0x80, 0x40, 0x1f, 0x63, 0x75, 0x58, //* .)..gB...h.@.cuX */ 
+    /* 0x00001650 */ 0x52, 0x52, 0x5a, 0x0a, 0x89, 0x14, 0x2f, 0x09, 0x0f, 0x0f, 0x2f, 0xae, 0xa9, 0x92, 0x77, 0x26, //* RRZ.../.../...w& */ 
+    /* 0x00001660 */ 0x44, 0x01, 0x6b, 0x0f, 0xd9, 0xeb, 0x8d, 0x17, 0xc9, 0xee, 0x7e, 0x76, 0x6b, 0xae, 0xf9, 0x40, //* D.k.......~vk..@ */ 
+    /* 0x00001670 */ 0x58, 0x4e, 0x2b, 0x0d, 0x4a, 0xa9, 0xf3, 0xb9, 0x06, 0x53, 0x51, 0xb1, 0xb8, 0x95, 0xb6, 0x8e, //* XN+.J....SQ..... */ 
+    /* 0x00001680 */ 0x8e, 0xa4, 0x22, 0x6b, 0x20, 0x08, 0x0c, 0xa5, 0xb8, 0xd2, 0x7e, 0x9f, 0x6a, 0x0c, 0x72, 0x4b, //* .."k .....~.j.rK */ 
+    /* 0x00001690 */ 0xcb, 0xe0, 0x3e, 0xaf, 0x64, 0x48, 0xc0, 0x8b, 0xef, 0xdb, 0xeb, 0xfe, 0xfe, 0xdb, 0x52, 0x52, //* ..>.dH........RR */ 
+    /* 0x000016a0 */ 0x22, 0xe7, 0x6a, 0x5c, 0xa9, 0xa3, 0xac, 0x8f, 0x28, 0x29, 0xfb, 0xb2, 0x22, 0x19, 0xef, 0x71, //* ".j\....().."..q */ 
+    /* 0x000016b0 */ 0x91, 0x01, 0x0f, 0x15, 0x41, 0x22, 0x01, 0x6d, 0x35, 0xff, 0xef, 0x5f, 0x44, 0x75, 0x4a, 0x44, //* ....A".m5.._DuJD */ 
+    /* 0x000016c0 */ 0x6e, 0xa0, 0x3d, 0x78, 0x9b, 0x88, 0x08, 0x00, 0x60, 0x32, 0x81, 0x68, 0xc4, 0x82, 0x12, 0x38, //* n.=x....`2.h...8 */ 
+    /* 0x000016d0 */ 0xab, 0xeb, 0xeb, 0x7a, 0x3b, 0x37, 0xf6, 0x7f, 0x2e, 0xc1, 0x1c, 0x8d, 0x44, 0xe0, 0x7c, 0xbb, //* ...z;7......D.|. */ 
+    /* 0x000016e0 */ 0xb3, 0xd0, 0xb6, 0x51, 0xea, 0xc0, 0xf3, 0x2d, 0x19, 0x61, 0x32, 0x43, 0x35, 0x5f, 0xc1, 0x07, //* ...Q...-.a2C5_.. */ 
+    /* 0x000016f0 */ 0x2e, 0xa1, 0x20, 0x39, 0xa3, 0x07, 0xa3, 0x7d, 0x1b, 0xf4, 0x2a, 0x22, 0xfd, 0x4b, 0xd3, 0x25, //* .. 9...}..*".K.% */ 
+    /* 0x00001700 */ 0x99, 0x81, 0x0d, 0xef, 0x69, 0x40, 0x6c, 0x04, 0x3d, 0xa1, 0x49, 0x9e, 0x9f, 0x9f, 0x24, 0x06, //* ....i@l.=.I...$. */ 
+    /* 0x00001710 */ 0xb5, 0x28, 0x45, 0x66, 0xe6, 0x9c, 0x50, 0x99, 0x56, 0x05, 0x78, 0x72, 0xfb, 0x43, 0x95, 0x36, //* .(Ef..P.V.xr.C.6 */ 
+    /* 0x00001720 */ 0x76, 0x3e, 0xd3, 0x3e, 0xaf, 0xa3, 0x8d, 0xd5, 0xd5, 0x6f, 0xe8, 0xe2, 0x35, 0xe9, 0x4a, 0xad, //* v>.>.....o..5.J. */ 
+    /* 0x00001730 */ 0x58, 0x42, 0x63, 0x20, 0x8e, 0x82, 0xa9, 0xbb, 0x1d, 0x6f, 0xe8, 0xed, 0x86, 0x23, 0x6e, 0x06, //* XBc .....o...#n. */ 
+    /* 0x00001740 */ 0x5f, 0x63, 0x4f, 0x29, 0xe4, 0xf4, 0xcd, 0xe9, 0x68, 0x49, 0x30, 0x2f, 0x27, 0xe7, 0x1f, 0x75, //* _cO)....hI0/'..u */ 
+    /* 0x00001750 */ 0x46, 0x53, 0x89, 0xd1, 0xd6, 0x78, 0xef, 0xbd, 0xd2, 0xa9, 0x2e, 0xd0, 0x12, 0x7a, 0x01, 0xfc, //* FS...x.......z.. */ 
+    /* 0x00001760 */ 0xf3, 0x0e, 0xd2, 0xd2, 0xa1, 0x6a, 0xac, 0xb0, 0x66, 0xf7, 0x4b, 0xd6, 0x60, 0x4c, 0xf2, 0x34, //* .....j..f.K.`L.4 */ 
+    /* 0x00001770 */ 0xe4, 0x55, 0x0f, 0x20, 0x68, 0x9c, 0xe4, 0x40, 0xde, 0xd1, 0xd1, 0x71, 0x6c, 0xbe, 0xd1, 0x59, //* .U. h..@...ql..Y */ 
+    /* 0x00001780 */ 0x18, 0x84, 0x24, 0x6f, 0x42, 0xf1, 0x65, 0x99, 0x36, 0x75, 0x29, 0x86, 0x20, 0xef, 0xfb, 0x11, //* ..$oB.e.6u). ... */ 
+    /* 0x00001790 */ 0x7e, 0x54, 0x50, 0xae, 0xd7, 0xef, 0x30, 0xc9, 0xb9, 0x6b, 0x7c, 0x7f, 0x28, 0x82, 0xfa, 0x98, //* ~TP...0..k|.(... */ 
+    /* 0x000017a0 */ 0x56, 0x58, 0x58, 0x38, 0x3c, 0xf8, 0xc3, 0xfe, 0x70, 0xa1, 0x66, 0x9a, 0xff, 0xb5, 0x51, 0xd1, //* VXX8<...p.f...Q. */ 
+    /* 0x000017b0 */ 0xac, 0x8c, 0xfe, 0x9c, 0xbf, 0x55, 0x3b, 0x14, 0xb2, 0x5e, 0x7b, 0x64, 0xa0, 0xa8, 0xf8, 0xcf, //* .....U;..^{d.... */ 
+    /* 0x000017c0 */ 0xc9, 0x08, 0x0b, 0x27, 0x7b, 0xb8, 0x1c, 0x33, 0x42, 0x91, 0x67, 0xf9, 0x46, 0x3a, 0xbd, 0xef, //* ...'{..3B.g.F:.. */ 
+    /* 0x000017d0 */ 0x0f, 0xb1, 0x85, 0x7e, 0x39, 0x29, 0x5b, 0x05, 0xaa, 0x75, 0x3d, 0xfb, 0x5e, 0x4e, 0x59, 0xc8, //* ...~9)[..u=.^NY. */ 
+    /* 0x000017e0 */ 0xed, 0xdc, 0x9c, 0x6e, 0xb8, 0x3d, 0x2e, 0x38, 0xb3, 0x12, 0xa0, 0x19, 0x34, 0x93, 0xf4, 0xdb, //* ...n.=.8....4... */ 
+    /* 0x000017f0 */ 0x2c, 0x37, 0x3a, 0x0e, 0x27, 0x70, 0x39, 0x39, 0x39, 0x7d, 0xb2, 0x31, 0xa0, 0x92, 0xd6, 0xa8, //* ,7:.'p999}.1.... */ 
+    /* 0x00001800 */ 0x10, 0x81, 0xb4, 0x8b, 0x7a, 0xdd, 0x9d, 0xdc, 0x9e, 0x5b, 0x34, 0x13, 0x52, 0xf6, 0x88, 0x7a, //* ....z....[4.R..z */ 
+    /* 0x00001810 */ 0x89, 0x9a, 0xa7, 0x8b, 0x52, 0xf3, 0xd0, 0xd2, 0xfa, 0x6d, 0x99, 0xc9, 0xf4, 0xf6, 0xf5, 0xd9, //* ....R....m...... */ 
+    /* 0x00001820 */ 0x9f, 0xae, 0xf7, 0x54, 0xd7, 0x78, 0xa5, 0x03, 0x79, 0x7f, 0x9f, 0x2c, 0x31, 0x7d, 0xc6, 0x8c, //* ...T.x..y..,1}.. */ 
+    /* 0x00001830 */ 0x80, 0x8a, 0xb4, 0xb4, 0xb4, 0x9f, 0x3b, 0x83, 0xa4, 0xcf, 0x27, 0x2f, 0x52, 0x53, 0xf2, 0xce, //* ......;...'/RS.. */ 
+    /* 0x00001840 */ 0x86, 0x38, 0xda, 0x36, 0xfd, 0xeb, 0x91, 0x31, 0x30, 0x51, 0x33, 0x63, 0x63, 0x63, 0x2d, 0x1f, //* .8.6...10Q3ccc-. */ 
+    /* 0x00001850 */ 0xb5, 0x04, 0x2f, 0xde, 0x07, 0x1e, 0x1e, 0x47, 0x90, 0x4e, 0x91, 0x7a, 0x3c, 0x8b, 0x56, 0x55, //* ../....G.N.z<.VU */ 
+    /* 0x00001860 */ 0x99, 0x2d, 0xed, 0xec, 0x49, 0x00, 0x4e, 0x2e, 0xf6, 0xe6, 0x32, 0x32, 0x68, 0xb2, 0x61, 0xe1, //* .-..I.N...22h.a. */ 
+    /* 0x00001870 */ 0x24, 0x24, 0xdf, 0x7c, 0xb1, 0xb0, 0xa2, 0x12, 0x67, 0xb4, 0xc9, 0x3d, 0xf0, 0xb5, 0xe0, 0xe6, //* $$.|....g..=.... */ 
+    /* 0x00001880 */ 0x45, 0x7d, 0x56, 0x3c, 0x7b, 0xdf, 0x84, 0x98, 0x96, 0x89, 0xc4, 0x7b, 0x88, 0x88, 0xcc, 0xcf, //* E}V<{......{.... */ 
+    /* 0x00001890 */ 0x37, 0x72, 0x3d, 0x3e, 0x2a, 0xf2, 0xf0, 0xf3, 0xc7, 0xaf, 0xad, 0xad, 0x1d, 0x2c, 0x37, 0xf1, //* 7r=>*........,7. */ 
+    /* 0x000018a0 */ 0xd7, 0x7d, 0xfd, 0x4d, 0x9b, 0xe4, 0xf9, 0x37, 0xe8, 0x62, 0x6a, 0x6e, 0x8e, 0x58, 0xec, 0x78, //* .}.M...7.bjn.X.x */ 
+    /* 0x000018b0 */ 0xa5, 0x25, 0x3c, 0x31, 0x71, 0x2f, 0x22, 0x3a, 0x3a, 0x37, 0x36, 0x16, 0x1f, 0x72, 0x72, 0xf1, //* .%<1q/"::76..rr. */ 
+    /* 0x000018c0 */ 0x59, 0x2c, 0x2e, 0x8e, 0x48, 0x95, 0x71, 0x68, 0x3d, 0xea, 0x50, 0xb8, 0x60, 0x79, 0x8a, 0xba, //* Y,..H.qh=.P.`y.. */ 
+    /* 0x000018d0 */ 0xc4, 0x83, 0xe7, 0x79, 0xdf, 0x73, 0x31, 0x53, 0xea, 0x3e, 0xc2, 0xd1, 0x62, 0xac, 0xb2, 0x40, //* ...y.s1S.>..b..@ */ 
+    /* 0x000018e0 */ 0xa9, 0xa3, 0x3f, 0xf9, 0xfb, 0xc1, 0xc4, 0x06, 0x1d, 0xbb, 0xc1, 0x03, 0x7e, 0xec, 0x8f, 0x34, //* ..?.........~..4 */ 
+    /* 0x000018f0 */ 0x2e, 0x06, 0x06, 0x75, 0x8c, 0x65, 0x64, 0x28, 0xa8, 0x8e, 0xeb, 0x36, 0x99, 0x47, 0x24, 0x2a, //* ...u.ed(...6.G$* */ 
+    /* 0x00001900 */ 0x82, 0x4e, 0x48, 0x00, 0x16, 0xd5, 0x41, 0xff, 0xfe, 0x9c, 0x64, 0x62, 0x6c, 0x6c, 0x0f, 0x14, //* .NH...A...dbll.. */ 
+    /* 0x00001910 */ 0xea, 0x58, 0x62, 0x58, 0x47, 0xc5, 0xa4, 0x90, 0xd4, 0x3f, 0x8f, 0x7c, 0x2d, 0x5d, 0xaa, 0x7c, //* .XbXG....?.|-].| */ 
+    /* 0x00001920 */ 0x39, 0x9c, 0x68, 0x58, 0x0c, 0x39, 0x80, 0x3b, 0xe1, 0xf6, 0x5b, 0x30, 0xdc, 0xcb, 0xe3, 0xad, //* 9.hX.9.;..[0.... */ 
+    /* 0x00001930 */ 0x2e, 0x98, 0x9d, 0x9f, 0x5f, 0x5c, 0x0c, 0x76, 0x3d, 0x5c, 0x98, 0x41, 0x84, 0x86, 0xda, 0xd0, //* ...._\.v=\.A.... */ 
+    /* 0x00001940 */ 0x42, 0xb1, 0x21, 0x37, 0x20, 0xa1, 0xf8, 0x0e, 0x8c, 0xa5, 0xf3, 0x30, 0x30, 0x04, 0x16, 0x6b, //* B.!7 ......00..k */ 
+    /* 0x00001950 */ 0xfe, 0x32, 0x07, 0x19, 0x85, 0x04, 0x8f, 0x4c, 0xd2, 0xcd, 0x80, 0x6a, 0x2c, 0x45, 0x70, 0x08, //* .2.....L...j,Ep. */ 
+    /* 0x00001960 */ 0x5b, 0x74, 0xdc, 0x52, 0x19, 0x10, 0xb0, 0x9a, 0x66, 0x06, 0x61, 0x43, 0x99, 0x06, 0xf4, 0x6a, //* [t.R....f.aC...j */ 
+    /* 0x00001970 */ 0xea, 0x9e, 0x42, 0x80, 0xdd, 0xee, 0x78, 0x26, 0x0c, 0xf3, 0x08, 0x05, 0x0a, 0xca, 0xdc, 0x6a, //* ..B...x&.......j */ 
+    /* 0x00001980 */ 0x6c, 0x1f, 0xea, 0x70, 0xdc, 0xc0, 0xcd, 0xfd, 0x71, 0x1b, 0x3e, 0xc0, 0x6f, 0xbd, 0xd2, 0x7d, //* l..p....q.>.o..} */ 
+    /* 0x00001990 */ 0x70, 0xf0, 0x15, 0x74, 0xac, 0x13, 0x7f, 0xfe, 0xa4, 0x2f, 0x37, 0x3a, 0xfb, 0x3c, 0xf0, 0xcf, //* p..t...../7:.<.. */ 
+    /* 0x000019a0 */ 0x1e, 0xbd, 0xbf, 0x7a, 0xbc, 0xe3, 0xf8, 0x5d, 0xbe, 0x46, 0xdc, 0xb1, 0xd2, 0x6a, 0xb8, 0xd2, //* ...z...].F...j.. */ 
+    /* 0x000019b0 */ 0x86, 0xbb, 0xa0, 0x1b, 0x3d, 0xa3, 0x69, 0xe8, 0x05, 0x6b, 0xb6, 0x18, 0xa3, 0x1a, 0x4d, 0x15, //* ....=.i..k....M. */ 
+    /* 0x000019c0 */ 0xe6, 0x2f, 0x53, 0x99, 0x53, 0x42, 0x86, 0x0e, 0xe5, 0x70, 0x30, 0xc5, 0x2d, 0x35, 0xbb, 0xc5, //* ./S.SB...p0.-5.. */ 
+    /* 0x000019d0 */ 0x82, 0xda, 0x0d, 0x81, 0x40, 0xaa, 0xab, 0x2b, 0x37, 0xf3, 0xe4, 0xdb, 0x38, 0x79, 0x78, 0xfc, //* ....@..+7...8yx. */ 
+    /* 0x000019e0 */ 0xc1, 0x36, 0xe1, 0x70, 0x45, 0x21, 0x9f, 0x91, 0x18, 0x66, 0x0a, 0x36, 0x41, 0x39, 0x19, 0x19, //* .6.pE!...f.6A9.. */ 
+    /* 0x000019f0 */ 0x13, 0xd0, 0xef, 0x80, 0x38, 0xfb, 0x2e, 0xf3, 0x60, 0xd6, 0x52, 0xc9, 0x64, 0xdf, 0x72, 0xae, //* ....8...`.R.d.r. */ 
+    /* 0x00001a00 */ 0x8c, 0x12, 0x1f, 0x8f, 0x8a, 0x9b, 0x9d, 0x3d, 0xaa, 0x58, 0xe3, 0xf3, 0x52, 0xd2, 0xcb, 0x28, //* .......=.X..R..( */ 
+    /* 0x00001a10 */ 0x7f, 0x03, 0x83, 0x9f, 0x03, 0x95, 0x24, 0xc4, 0xc4, 0x43, 0xc7, 0xe6, 0x63, 0x79, 0xb9, 0x66, //* ......$..C..cy.f */ 
+    /* 0x00001a20 */ 0x52, 0x06, 0xad, 0x9e, 0x89, 0xac, 0x35, 0x61, 0xa4, 0xa4, 0xa4, 0x4b, 0xf5, 0xf6, 0x74, 0x90, //* R.....5a...K..t. */ 
+    /* 0x00001a30 */ 0x00, 0x60, 0x17, 0xd1, 0x68, 0x77, 0x32, 0x77, 0xe8, 0xd8, 0xfd, 0x68, 0x71, 0x8c, 0xf0, 0x65, //* .`..hw2w...hq..e */ 
+    /* 0x00001a40 */ 0x0a, 0xcf, 0xb0, 0xdc, 0x88, 0xc5, 0xee, 0x43, 0x9b, 0x55, 0xe8, 0xe1, 0xc9, 0x5a, 0x17, 0xf6, //* .......C.U...Z.. */ 
+    /* 0x00001a50 */ 0xf1, 0x52, 0x83, 0xea, 0x7c, 0xb3, 0x5b, 0x15, 0x1a, 0x34, 0xbd, 0x22, 0x54, 0xd9, 0x2f, 0x3e, //* .R..|.[..4."T./> */ 
+    /* 0x00001a60 */ 0x9e, 0x1f, 0xc4, 0xd5, 0x9b, 0x5d, 0x65, 0x38, 0x8b, 0xd1, 0x94, 0x01, 0x2e, 0xd3, 0xf7, 0xe7, //* .....]e8........ */ 
+    /* 0x00001a70 */ 0x47, 0x2d, 0x24, 0x83, 0x9f, 0xb4, 0x45, 0x3c, 0x77, 0x63, 0xb4, 0x7c, 0x65, 0xbd, 0x75, 0x3a, //* G-$...E<wc.|e.u: */ 
+    /* 0x00001a80 */ 0x41, 0x12, 0x16, 0xf5, 0x4a, 0xea, 0xaf, 0xac, 0x74, 0x88, 0x8b, 0x63, 0x69, 0xe8, 0x33, 0xc5, //* A...J...t..ci.3. */ 
+    /* 0x00001a90 */ 0x4e, 0x17, 0x71, 0xa3, 0x45, 0xa3, 0x07, 0x3b, 0x87, 0xd7, 0xfd, 0x55, 0xa9, 0xca, 0xe9, 0x3f, //* N.q.E..;...U...? */ 
+    /* 0x00001aa0 */ 0x30, 0xd0, 0x4b, 0x93, 0x92, 0x50, 0xe2, 0xe1, 0xbb, 0xa2, 0xda, 0x19, 0x4e, 0xa5, 0xcb, 0x8b, //* 0.K..P......N... */ 
+    /* 0x00001ab0 */ 0x24, 0xe5, 0x09, 0xc2, 0xc5, 0x5d, 0x63, 0x53, 0x21, 0x38, 0x3b, 0xcb, 0x95, 0x45, 0xb8, 0x10, //* $....]cS!8;..E.. */ 
+    /* 0x00001ac0 */ 0xb4, 0x38, 0xd2, 0x13, 0xf5, 0x3e, 0x4b, 0xf0, 0xa3, 0x39, 0x99, 0x3d, 0x5c, 0x4c, 0x11, 0x71, //* .8...>K..9.=\L.q */ 
+    /* 0x00001ad0 */ 0x0b, 0x6b, 0xb4, 0xbe, 0xc7, 0xd2, 0xab, 0x7b, 0x22, 0xc6, 0x22, 0x15, 0xfa, 0xda, 0xe6, 0x12, //* .k.....{"."..... */ 
+    /* 0x00001ae0 */ 0xe1, 0x91, 0x7f, 0xd3, 0x70, 0xcc, 0xe4, 0xb5, 0xf7, 0xb7, 0x31, 0x48, 0x31, 0x8d, 0x9e, 0x8b, //* ....p.....1H1... */ 
+    /* 0x00001af0 */ 0x47, 0xb5, 0x57, 0xec, 0x69, 0x5e, 0x1a, 0x10, 0x71, 0xe8, 0x0e, 0x76, 0x73, 0x73, 0x8b, 0x88, //* G.W.i^..q..vss.. */ 
+    /* 0x00001b00 */ 0x88, 0xd8, 0x9c, 0xaf, 0x48, 0xa2, 0xe9, 0x3f, 0x6e, 0xb9, 0x16, 0xe5, 0x30, 0x6c, 0xe8, 0xf4, //* ....H..?n...0l.. */ 
+    /* 0x00001b10 */ 0xb8, 0x3e, 0x9e, 0x9a, 0x72, 0xa4, 0x3e, 0x3f, 0x47, 0x4f, 0x48, 0x49, 0xe9, 0xa4, 0x26, 0x66, //* .>..r.>?GOHI..&f */ 
+    /* 0x00001b20 */ 0xcf, 0x39, 0x3e, 0xc5, 0x27, 0x2b, 0x76, 0x96, 0xc0, 0xd9, 0xb8, 0xcc, 0xcb, 0xcd, 0x55, 0x0f, //* .9>.'+v.......U. */ 
+    /* 0x00001b30 */ 0xd0, 0xc0, 0x8b, 0x06, 0x7d, 0xc4, 0x54, 0x57, 0x97, 0xff, 0x8b, 0x17, 0x2f, 0x22, 0x5a, 0x09, //* ....}.TW..../"Z. */ 
+    /* 0x00001b40 */ 0x47, 0xf0, 0x99, 0x14, 0x4f, 0xc2, 0x39, 0x5a, 0x71, 0xa6, 0x34, 0xcb, 0xf4, 0x3a, 0xa6, 0xa7, //* G...O.9Zq.4..:.. */ 
+    /* 0x00001b50 */ 0x09, 0xcc, 0xcd, 0xcc, 0x42, 0x6d, 0xb0, 0xa9, 0x3c, 0xae, 0xb9, 0x85, 0x99, 0x82, 0x19, 0x7a, //* ....Bm..<......z */ 
+    /* 0x00001b60 */ 0x18, 0x2e, 0xc4, 0x0e, 0xc7, 0xf2, 0xf8, 0x6a, 0x1b, 0x8e, 0xb3, 0xa2, 0xfb, 0x9b, 0x7d, 0xd3, //* .......j......}. */ 
+    /* 0x00001b70 */ 0xbd, 0x93, 0x1c, 0xb7, 0xfe, 0x12, 0xc6, 0xfd, 0xfc, 0xc9, 0x4d, 0x2f, 0x10, 0x91, 0x2a, 0xec, //* ..........M/..*. */ 
+    /* 0x00001b80 */ 0xba, 0x76, 0xb1, 0x37, 0x75, 0xc3, 0xb6, 0x47, 0x5a, 0x55, 0xf9, 0x69, 0xa9, 0x72, 0x2b, 0xd7, //* .v.7u..GZU.i.r+. */ 
+    /* 0x00001b90 */ 0xb9, 0x29, 0x30, 0x10, 0x51, 0x31, 0x45, 0x40, 0x42, 0x4c, 0xcc, 0x27, 0x8a, 0x94, 0x27, 0x2a, //* .)0.Q1E@BL.'..'* */ 
+    /* 0x00001ba0 */ 0x33, 0x33, 0x13, 0x03, 0x0b, 0xcb, 0x3c, 0x7e, 0x54, 0x9f, 0x84, 0x8c, 0x6c, 0xf0, 0xe1, 0x01, //* 33....<~T...l... */ 
+    /* 0x00001bb0 */ 0x2e, 0xc8, 0x10, 0xdb, 0xa2, 0x81, 0x8f, 0xe0, 0xab, 0x9a, 0x1a, 0x81, 0xaa, 0x8a, 0x0a, 0x33, //* ...............3 */ 
+    /* 0x00001bc0 */ 0x0a, 0x1c, 0x75, 0x77, 0x8f, 0xfd, 0xd0, 0xf6, 0xab, 0x83, 0x89, 0x96, 0x0f, 0x84, 0x6b, 0xe2, //* ..uw..........k. */ 
+    /* 0x00001bd0 */ 0xe4, 0xaa, 0xb2, 0xfb, 0xe6, 0x4a, 0x5b, 0xf5, 0x4e, 0x2c, 0x21, 0x39, 0xed, 0x19, 0x19, 0xe1, //* .....J[.N,!9.... */ 
+    /* 0x00001be0 */ 0x08, 0xed, 0xd8, 0x62, 0x0f, 0x31, 0x6b, 0x73, 0xbc, 0xb3, 0xa7, 0x2c, 0x85, 0x85, 0x60, 0x14, //* ...b.1ks...,..`. */ 
+    /* 0x00001bf0 */ 0x79, 0x20, 0x7a, 0xb3, 0x2e, 0xa6, 0x33, 0x49, 0x06, 0x80, 0x5f, 0xad, 0xf5, 0x9f, 0x51, 0x62, //* y z...3I.._...Qb */ 
+    /* 0x00001c00 */ 0x0e, 0x6e, 0xe9, 0x1f, 0x9a, 0xbf, 0x90, 0xc2, 0x09, 0xd7, 0x40, 0x9b, 0xe2, 0xf7, 0x20, 0xd2, //* .n........@... . */ 
+    /* 0x00001c10 */ 0xdb, 0x27, 0x66, 0xf4, 0xec, 0x9d, 0xa4, 0x44, 0x06, 0x58, 0x9a, 0x9a, 0x76, 0x81, 0x1d, 0x18, //* .'f....D.X..v... */ 
+    /* 0x00001c20 */ 0x1f, 0x98, 0xab, 0x6f, 0xb0, 0x1f, 0xc0, 0x8b, 0x74, 0x9d, 0x99, 0x59, 0x2d, 0x1e, 0x1e, 0x1c, //* ...o....t..Y-... */ 
+    /* 0x00001c30 */ 0xdc, 0xec, 0x0c, 0x0c, 0x17, 0x70, 0xdc, 0x96, 0x53, 0xa6, 0x89, 0x4e, 0x17, 0xc9, 0xf4, 0xf7, //* .....p..S..N.... */ 
+    /* 0x00001c40 */ 0x87, 0xe7, 0x40, 0x32, 0xf8, 0xe4, 0xe2, 0xc2, 0x27, 0x2b, 0x2b, 0x9b, 0xc8, 0x30, 0x64, 0xa2, //* ..@2....'++..0d. */ 
+    /* 0x00001c50 */ 0xa5, 0xc5, 0x3c, 0xf7, 0xcb, 0x70, 0x8c, 0x5d, 0xbf, 0x51, 0x0d, 0x57, 0xdc, 0x6c, 0x66, 0x7e, //* ..<..p.].Q.W.lf~ */ 
+    /* 0x00001c60 */ 0xe0, 0x33, 0xda, 0x71, 0xef, 0x92, 0x99, 0x8c, 0x03, 0xb7, 0x66, 0xa9, 0x03, 0xee, 0x18, 0x08, //* .3.q......f..... */ 
+    /* 0x00001c70 */ 0xe4, 0xf1, 0x81, 0x81, 0x81, 0xf4, 0xd2, 0x30, 0x9d, 0x91, 0xfe, 0x7e, 0x66, 0x85, 0x64, 0x3e, //* .......0...~f.d> */ 
+    /* 0x00001c80 */ 0x79, 0x4c, 0x23, 0x5d, 0x67, 0x8a, 0xf9, 0x64, 0x60, 0xfe, 0x7a, 0xd9, 0xd5, 0xf1, 0xdb, 0x8e, //* yL#]g..d`.z..... */ 
+    /* 0x00001c90 */ 0x42, 0x84, 0x80, 0x05, 0xcd, 0x40, 0x95, 0xc5, 0x98, 0x7a, 0x61, 0xca, 0xf7, 0xec, 0xf7, 0xdc, //* B....@...za..... */ 
+    /* 0x00001ca0 */ 0xac, 0x67, 0x8c, 0x55, 0x55, 0xaf, 0x47, 0xd3, 0x60, 0x53, 0x60, 0xb4, 0x50, 0xa0, 0xa0, 0x46, //* .g.UU.G.`S`.P..F */ 
+    /* 0x00001cb0 */ 0x8f, 0x92, 0x7f, 0x57, 0x8e, 0xa8, 0x77, 0xf3, 0x87, 0x47, 0xb2, 0x4c, 0x79, 0xf4, 0xf2, 0xf2, //* ...W..w..G.Ly... */ 
+    /* 0x00001cc0 */ 0xd2, 0x36, 0x30, 0x18, 0x95, 0x2c, 0x35, 0xcc, 0x68, 0x6a, 0x12, 0x86, 0x94, 0xeb, 0xdf, 0xbb, //* .60..,5.hj...... */ 
+    /* 0x00001cd0 */ 0x3c, 0x6c, 0x2f, 0xda, 0xd6, 0x3b, 0xdf, 0xf3, 0xdd, 0x51, 0x9c, 0x83, 0x54, 0xd6, 0x36, 0x4f, //* <l/..;...Q..T.6O */ 
+    /* 0x00001ce0 */ 0x99, 0x39, 0xb9, 0x59, 0x91, 0x15, 0x31, 0x3c, 0x8c, 0xf1, 0xef, 0xd1, 0x41, 0x2d, 0x1f, 0x07, //* .9.Y..1<....A-.. */ 
+    /* 0x00001cf0 */ 0xfc, 0x0a, 0xb0, 0xea, 0x0b, 0x8f, 0xac, 0x65, 0x60, 0xa0, 0xa0, 0x9e, 0xcb, 0xb9, 0x0d, 0xd6, //* .......e`....... */ 
+    /* 0x00001d00 */ 0xa7, 0x88, 0xe7, 0x0d, 0x67, 0x69, 0x69, 0x29, 0x35, 0x7c, 0x02, 0x05, 0x05, 0xc5, 0x43, 0xef, //* ....gii)5|....C. */ 
+    /* 0x00001d10 */ 0xd2, 0xe0, 0x33, 0x9d, 0xfb, 0xd5, 0x41, 0x26, 0xb6, 0x91, 0x4c, 0x9d, 0x8d, 0xfe, 0x94, 0x42, //* ..3...A&..L....B */ 
+    /* 0x00001d20 */ 0x8a, 0xc0, 0x8b, 0xf7, 0x06, 0x05, 0x14, 0xda, 0x8d, 0xa0, 0xa3, 0x17, 0x15, 0x15, 0x7d, 0xcd, //* ..............}. */ 
+    /* 0x00001d30 */ 0xcb, 0xfb, 0x4b, 0x05, 0xa2, 0xcb, 0x67, 0x6b, 0xae, 0xa3, 0xc3, 0x4a, 0x2d, 0x1a, 0xb1, 0xe3, //* ..K...gk...J-... */ 
+    /* 0x00001d40 */ 0x87, 0x88, 0xde, 0x7d, 0x6e, 0xda, 0x17, 0x99, 0xdb, 0x67, 0xa0, 0x58, 0xa6, 0xb7, 0xc7, 0x96, //* ...}n....g.X.... */ 
+    /* 0x00001d50 */ 0xe6, 0x68, 0x67, 0x67, 0xe4, 0xee, 0x2e, 0xf4, 0xcf, 0xba, 0xcc, 0x7c, 0xd1, 0x2b, 0x54, 0x29, //* .hgg.......|.+T) */ 
+    /* 0x00001d60 */ 0x7e, 0x47, 0xbc, 0xe7, 0xe3, 0xac, 0xe6, 0x22, 0xa1, 0xd5, 0xe8, 0xc4, 0x82, 0x8f, 0x8f, 0x7f, //* ~G....."........ */ 
+    /* 0x00001d70 */ 0x0b, 0x6a, 0x34, 0xeb, 0x11, 0x06, 0x20, 0x60, 0xbf, 0xfe, 0x36, 0x28, 0x38, 0xb8, 0xaa, 0xb9, //* .j4... `..6(8... */ 
+    /* 0x00001d80 */ 0x39, 0x05, 0x84, 0x25, 0xd6, 0x1a, 0x19, 0x3a, 0x82, 0x52, 0x57, 0x42, 0x69, 0xd0, 0xba, 0x39, //* 9..%...:.RWBi..9 */ 
+    /* 0x00001d90 */ 0x9c, 0x6d, 0x0e, 0x20, 0x94, 0x1b, 0xd6, 0x61, 0xad, 0xf0, 0x11, 0xfd, 0x5e, 0xbc, 0xf6, 0x20, //* .m. ...a....^..  */ 
+    /* 0x00001da0 */ 0x55, 0x32, 0x24, 0x8f, 0x6e, 0x39, 0x7b, 0x81, 0x42, 0xd6, 0x41, 0xcf, 0xc0, 0x70, 0x2a, 0x6c, //* U2$.n9{.B.A..p*l */ 
+    /* 0x00001db0 */ 0xfd, 0xd0, 0x1d, 0x96, 0xfd, 0x21, 0x9a, 0x0a, 0xa4, 0xc9, 0x4f, 0x0a, 0x0a, 0x58, 0x60, 0xab, //* .....!....O..X`. */ 
+    /* 0x00001dc0 */ 0xd2, 0x35, 0x16, 0xd1, 0xdf, 0x22, 0xe1, 0x71, 0x61, 0x7b, 0x7c, 0x50, 0xb0, 0x5f, 0xe4, 0x93, //* .5...".qa{|P._.. */ 
+    /* 0x00001dd0 */ 0x6f, 0x97, 0x03, 0x9a, 0x5d, 0x9f, 0x45, 0xf5, 0xe7, 0x4a, 0x6e, 0x65, 0x0d, 0x76, 0x11, 0x9a, //* o...].E..Jne.v.. */ 
+    /* 0x00001de0 */ 0x0f, 0x96, 0x1a, 0x78, 0x40, 0xbc, 0xeb, 0x1f, 0x1e, 0x96, 0x03, 0x11, 0xff, 0x81, 0x23, 0xb6, //* ...x@.........#. */ 
+    /* 0x00001df0 */ 0x9f, 0xf7, 0xcb, 0xec, 0xc9, 0x93, 0xd7, 0x48, 0x80, 0x72, 0xa9, 0x86, 0x6a, 0xe9, 0xe4, 0x52, //* .......H.r..j..R */ 
+    /* 0x00001e00 */ 0xd5, 0x7b, 0x1a, 0xb2, 0x70, 0x8f, 0xc0, 0x2c, 0x28, 0x68, 0xc8, 0xfe, 0x89, 0xed, 0x62, 0xf5, //* .{..p..,(h....b. */ 
+    /* 0x00001e10 */ 0x67, 0xfc, 0x6c, 0x5d, 0xc8, 0xf3, 0x2b, 0x8e, 0x6b, 0x51, 0x43, 0xcc, 0x8d, 0x83, 0x83, 0x03, //* g.l]..+.kQC..... */ 
+    /* 0x00001e20 */ 0xf7, 0xad, 0x9d, 0x9d, 0xae, 0x85, 0x05, 0xb2, 0xcb, 0x7d, 0x5d, 0x49, 0x56, 0x98, 0x1a, 0xea, //* .........}]IV... */ 
+    /* 0x00001e30 */ 0xa7, 0x92, 0x50, 0x21, 0x79, 0x02, 0x22, 0x22, 0x1a, 0x76, 0x76, 0x2a, 0xd0, 0x42, 0x74, 0x1e, //* ..P!y."".vv*.Bt. */ 
+    /* 0x00001e40 */ 0x2e, 0xd6, 0x41, 0x80, 0xcf, 0x9f, 0x3f, 0x9f, 0x5c, 0x5d, 0x05, 0x49, 0x2a, 0x07, 0x64, 0x4a, //* ..A...?.\].I*.dJ */ 
+    /* 0x00001e50 */ 0x05, 0x9b, 0xf4, 0x46, 0xec, 0x59, 0x8e, 0x67, 0x64, 0x92, 0x78, 0x61, 0x01, 0x7f, 0x67, 0x7e, //* ...F.Y.gd.xa..g~ */ 
+    /* 0x00001e60 */ 0x05, 0xcb, 0x4a, 0xc4, 0x97, 0xfb, 0xb4, 0x6d, 0xaf, 0x39, 0x39, 0xea, 0xfa, 0x67, 0xd1, 0x22, //* ..J....m.99..g." */ 
+    /* 0x00001e70 */ 0xb6, 0x3e, 0x3f, 0xdd, 0xb3, 0xe2, 0x96, 0x40, 0xd4, 0x42, 0x2b, 0x6e, 0xc0, 0xbe, 0xd2, 0xbe, //* .>?....@.B+n.... */ 
+    /* 0x00001e80 */ 0xbc, 0x4c, 0x09, 0xac, 0x1e, 0x1c, 0x60, 0x58, 0x58, 0x58, 0x9c, 0xb6, 0xf6, 0x46, 0x53, 0x47, //* .L....`XXX...FSG */ 
+    /* 0x00001e90 */ 0x83, 0x4a, 0x27, 0x55, 0xa8, 0xe6, 0x47, 0x30, 0x9e, 0x1b, 0xce, 0x57, 0x1d, 0x1a, 0x40, 0x03, //* .J'U..G0...W..@. */ 
+    /* 0x00001ea0 */ 0x14, 0xbe, 0x45, 0x2b, 0x7c, 0xeb, 0x07, 0x2a, 0xf5, 0xda, 0xc1, 0x7a, 0x84, 0x0e, 0x63, 0x5e, //* ..E+|..*...z..c^ */ 
+    /* 0x00001eb0 */ 0x82, 0xa8, 0x97, 0x90, 0x89, 0x89, 0x89, 0xca, 0xc6, 0xc6, 0xc6, 0x1b, 0x83, 0xa7, 0xf5, 0xc5, //* ................ */ 
+    /* 0x00001ec0 */ 0xbe, 0xf7, 0x91, 0xf8, 0x3b, 0x98, 0x20, 0x16, 0xc6, 0x51, 0x51, 0x79, 0x24, 0x24, 0x27, 0xeb, //* ....;. ..QQy$$'. */ 
+    /* 0x00001ed0 */ 0xe6, 0xd6, 0x58, 0xb6, 0x16, 0xb8, 0xd1, 0xd1, 0xa6, 0xfc, 0x19, 0x79, 0x8a, 0xfa, 0xf7, 0x83, //* ..X........y.... */ 
+    /* 0x00001ee0 */ 0x45, 0x87, 0x3f, 0xf2, 0xed, 0x61, 0xdd, 0x9f, 0xa7, 0xad, 0x3d, 0xd1, 0x6f, 0x27, 0x34, 0x66, //* E.?..a....=.o'4f */ 
+    /* 0x00001ef0 */ 0x95, 0x6c, 0x2b, 0xf5, 0xb8, 0x1d, 0x6b, 0x5d, 0x4f, 0x64, 0x19, 0xbd, 0x9d, 0x9d, 0x7e, 0x60, //* .l+...k]Od....~` */ 
+    /* 0x00001f00 */ 0x78, 0x41, 0xbb, 0x66, 0x01, 0x3b, 0x87, 0xe9, 0xf6, 0x84, 0xe0, 0xd2, 0x91, 0xe0, 0xe2, 0x76, //* xA.f.;.........v */ 
+    /* 0x00001f10 */ 0xfc, 0xfc, 0x49, 0x70, 0x34, 0x5f, 0xb1, 0xc1, 0x61, 0x06, 0x22, 0xec, 0x49, 0xf1, 0xaf, 0xbc, //* ..Ip4_..a.".I... */ 
+    /* 0x00001f20 */ 0xc9, 0xb1, 0xb1, 0xe8, 0xb6, 0xe7, 0x27, 0xe1, 0x3e, 0x9f, 0x27, 0x41, 0x7f, 0x3f, 0x38, 0x6d, //* ......'.>.'A.?8m */ 
+    /* 0x00001f30 */ 0x95, 0x3b, 0x6e, 0xc6, 0x7f, 0x31, 0x70, 0x3d, 0x5a, 0x1a, 0xf8, 0x95, 0xa7, 0xb0, 0x51, 0x6a, //* .;n..1p=Z.....Qj */ 
+    /* 0x00001f40 */ 0x19, 0x69, 0xeb, 0xa1, 0x10, 0x95, 0x72, 0x75, 0x75, 0xf5, 0xab, 0x39, 0xb0, 0xd9, 0xaa, 0x16, //* .i....ruu..9.... */ 
+    /* 0x00001f50 */ 0x09, 0xc1, 0x72, 0x45, 0x23, 0x26, 0x39, 0x79, 0x08, 0xd4, 0x9e, 0x9e, 0x31, 0x31, 0xea, 0xb1, //* ..rE#&9y....11.. */ 
+    /* 0x00001f60 */ 0xfd, 0xb9, 0x2e, 0x6d, 0x8d, 0xbc, 0x89, 0x90, 0x1f, 0xb1, 0xb1, 0x0d, 0xa6, 0xf7, 0x2e, 0xde, //* ...m............ */ 
+    /* 0x00001f70 */ 0x42, 0x76, 0x34, 0xf1, 0x1c, 0x86, 0x1d, 0xc9, 0xfc, 0x74, 0x6e, 0x47, 0x7a, 0x80, 0xc7, 0xc5, //* Bv4......tnGz... */ 
+    /* 0x00001f80 */ 0xee, 0x40, 0x24, 0x39, 0xdf, 0xf8, 0xc4, 0xda, 0x14, 0x2b, 0x21, 0x9f, 0xf9, 0x30, 0xc9, 0xfb, //* .@$9.....+!..0.. */ 
+    /* 0x00001f90 */ 0xf7, 0x2b, 0x9f, 0x7a, 0xc3, 0x9d, 0xdc, 0xbf, 0x59, 0x66, 0x71, 0xa9, 0x51, 0x80, 0xc4, 0x83, //* .+.z....Yfq.Q... */ 
+    /* 0x00001fa0 */ 0xef, 0xdf, 0xad, 0x86, 0x92, 0x59, 0xc9, 0x79, 0x75, 0xfc, 0x67, 0xec, 0xe2, 0xc2, 0x29, 0x28, //* .....Y.yu.g...)( */ 
+    /* 0x00001fb0 */ 0x30, 0xf0, 0xd1, 0x6c, 0x5d, 0xc0, 0x66, 0x49, 0x8b, 0xdd, 0xa0, 0x39, 0xc4, 0xc0, 0x00, 0xf9, //* 0..l].fI...9.... */ 
+    /* 0x00001fc0 */ 0xdf, 0xc3, 0x6a, 0x6a, 0x1f, 0xbd, 0x76, 0xc2, 0x97, 0x1a, 0x67, 0x09, 0xd1, 0xd8, 0xfa, 0x7a, //* ..jj..v...g....z */ 
+    /* 0x00001fd0 */ 0x7a, 0xf5, 0x4e, 0xb7, 0xdc, 0xa2, 0x21, 0xe1, 0x1b, 0x97, 0xfb, 0x6b, 0x14, 0xc2, 0xe6, 0x6c, //* z.N...!....k...l */ 
+    /* 0x00001fe0 */ 0x2d, 0xcd, 0x2d, 0x89, 0xf9, 0x5e, 0x97, 0xef, 0xdc, 0x75, 0xc8, 0xf8, 0x6d, 0x16, 0xfa, 0xe7, //* -.-..^...u..m... */ 
+    /* 0x00001ff0 */ 0x70, 0x6b, 0xf7, 0xd4, 0xbf, 0xa0, 0x76, 0x21, 0x61, 0x1d, 0xf8, 0xdc, 0xf4, 0x51, 0x13, 0x27, //* pk....v!a....Q.' */ 
+    /* 0x00002000 */ 0x60, 0x93, 0x70, 0xe2, 0x80, 0x49, 0x18, 0x12, 0x1d, 0xdd, 0xf5, 0xab, 0xcd, 0xe6, 0xdd, 0x54, //* `.p..I.........T */ 
+    /* 0x00002010 */ 0x9e, 0xfc, 0x44, 0x49, 0xe2, 0x2b, 0x5a, 0xba, 0xec, 0x71, 0x10, 0xda, 0xaa, 0xad, 0x66, 0xd0, //* ..DI.+Z..q....f. */ 
+    /* 0x00002020 */ 0xdc, 0xdd, 0xef, 0x4e, 0xce, 0xcf, 0xa5, 0xec, 0x3f, 0x73, 0x11, 0x71, 0xe8, 0x04, 0xfc, 0xc8, //* ...N....?s.q.... */ 
+    /* 0x00002030 */ 0x32, 0x39, 0x38, 0x3d, 0x11, 0x6f, 0xba, 0x3a, 0x5c, 0x5b, 0x3f, 0xd0, 0xcb, 0x5d, 0x8d, 0x4c, //* 298=.o.:\[?..].L */ 
+    /* 0x00002040 */ 0xe6, 0x33, 0xee, 0x0c, 0x38, 0x65, 0xee, 0x1f, 0xeb, 0x03, 0x3f, 0xde, 0xb3, 0xd2, 0x92, 0x04, //* .3..8e....?..... */ 
+    /* 0x00002050 */ 0x8d, 0x1f, 0x27, 0xe3, 0xb7, 0xc4, 0xa4, 0x00, 0x00, 0xb0, 0xb2, 0x7b, 0x97, 0x1a, 0xce, 0x8d, //* ..'........{.... */ 
+    /* 0x00002060 */ 0xbe, 0x7e, 0x0d, 0x80, 0x47, 0xc6, 0x32, 0x1a, 0x49, 0x2a, 0x5a, 0x19, 0xa1, 0xf2, 0x78, 0x83, //* .~..G.2.I*Z...x. */ 
+    /* 0x00002070 */ 0xe3, 0xb8, 0x83, 0x05, 0x66, 0x18, 0x4d, 0xac, 0x19, 0x9d, 0x98, 0x18, 0x76, 0xba, 0xd7, 0x15, //* ....f.M.....v... */ 
+    /* 0x00002080 */ 0xa9, 0x8c, 0x4c, 0x98, 0xfd, 0x5d, 0xb5, 0x98, 0x90, 0xd3, 0x41, 0x80, 0xc6, 0x82, 0x38, 0x2f, //* ..L..]....A...8/ */ 
+    /* 0x00002090 */ 0xc7, 0x64, 0x55, 0xb9, 0xdb, 0xd4, 0xfb, 0x6a, 0xcb, 0x5b, 0xc8, 0xe0, 0xe0, 0x20, 0x0e, 0x05, //* .dU....j.[... .. */ 
+    /* 0x000020a0 */ 0x05, 0xc6, 0xb5, 0xf3, 0x51, 0xc3, 0x8b, 0x8e, 0x17, 0x36, 0xce, 0xfb, 0x33, 0x8b, 0x69, 0x2f, //* ....Q....6..3.i/ */ 
+    /* 0x000020b0 */ 0xe3, 0xbf, 0xac, 0x67, 0xb6, 0xd1, 0x1a, 0xd4, 0x88, 0x03, 0xed, 0x44, 0xed, 0x77, 0x82, 0xa0, //* ...g.......D.w.. */ 
+    /* 0x000020c0 */ 0x42, 0x81, 0x5e, 0x9e, 0x51, 0xc8, 0xe5, 0x20, 0xe0, 0xec, 0x8c, 0xbb, 0x44, 0xb7, 0x8e, 0xca, //* B.^.Q.. ....D... */ 
+    /* 0x000020d0 */ 0xd8, 0xd8, 0x78, 0x77, 0xa1, 0xe6, 0x25, 0x41, 0x20, 0x1a, 0x02, 0x12, 0xe2, 0x3a, 0xe8, 0x93, //* ..xw..%A ....:.. */ 
+    /* 0x000020e0 */ 0xe6, 0xdb, 0x6c, 0xa9, 0x17, 0x6a, 0x6d, 0xc3, 0xdb, 0xc3, 0x25, 0x3e, 0x4a, 0x2b, 0xf4, 0x4e, //* ..l..jm...%>J+.N */ 
+    /* 0x000020f0 */ 0x93, 0x4e, 0x7d, 0x8f, 0x39, 0x41, 0xd1, 0x64, 0xd7, 0xf7, 0x2b, 0x2c, 0x24, 0x7d, 0xba, 0xd9, //* .N}.9A.d..+,$}.. */ 
+    /* 0x00002100 */ 0x70, 0xad, 0x58, 0xbd, 0x3a, 0x5c, 0x34, 0x06, 0x6f, 0x7e, 0x77, 0xa5, 0x05, 0x99, 0x96, 0x8e, //* p.X.:\4.o~w..... */ 
+    /* 0x00002110 */ 0x8e, 0xcb, 0xf9, 0xaf, 0x1a, 0x97, 0x11, 0x23, 0x30, 0x5d, 0xa4, 0x8e, 0x2c, 0x2a, 0xfa, 0x61, //* .......#0]..,*.a */ 
+    /* 0x00002120 */ 0xbc, 0xca, 0x42, 0xf1, 0xed, 0xdb, 0xb7, 0x46, 0xa0, 0x53, 0xeb, 0x1f, 0x18, 0xc0, 0x9d, 0xd2, //* ..B....F.S...... */ 
+    /* 0x00002130 */ 0x2c, 0xd5, 0x41, 0x4c, 0x64, 0x23, 0xc7, 0x24, 0xe7, 0x6b, 0xcf, 0xe8, 0xf0, 0xc7, 0xf1, 0x10, //* ,.ALd#.$.k...... */ 
+    /* 0x00002140 */ 0x23, 0x02, 0x99, 0x03, 0xe4, 0xcd, 0x7a, 0xcf, 0x5b, 0xee, 0xd9, 0x12, 0xed, 0x40, 0x51, 0xea, //* #.....z.[....@Q. */ 
+    /* 0x00002150 */ 0xeb, 0x1e, 0xdb, 0xb6, 0xc3, 0x80, 0xc4, 0x44, 0x96, 0xf7, 0x51, 0x14, 0x10, 0xb3, 0x42, 0xbc, //* .......D..Q...B. */ 
+    /* 0x00002160 */ 0x37, 0xee, 0x4e, 0x52, 0x6e, 0x6e, 0x82, 0x58, 0x14, 0x27, 0x9d, 0xa0, 0x81, 0x1e, 0x05, 0x6e, //* 7.NRnn.X.'.....n */ 
+    /* 0x00002170 */ 0x70, 0xdb, 0x55, 0x2b, 0x56, 0x35, 0xfb, 0x8b, 0xa9, 0xa6, 0x21, 0x34, 0xd4, 0xed, 0xa1, 0x05, //* p.U+V5....!4.... */ 
+    /* 0x00002180 */ 0x05, 0x05, 0x27, 0xa0, 0x41, 0xad, 0xb1, 0x9e, 0xcf, 0x90, 0x88, 0x9d, 0x9c, 0xc4, 0x7b, 0x5d, //* ..'.A.........{] */ 
+    /* 0x00002190 */ 0x51, 0x1b, 0xd4, 0xd0, 0x20, 0xa8, 0xa2, 0xa2, 0x82, 0x4b, 0x48, 0x18, 0x98, 0x27, 0x5f, 0xba, //* Q... ....KH..'_. */ 
+    /* 0x000021a0 */ 0x76, 0x78, 0x18, 0x08, 0xb6, 0x4f, 0xb9, 0x44, 0x11, 0xd4, 0xab, 0x47, 0xa4, 0x2c, 0xd7, 0x5f, //* vx...O.D...G.,._ */ 
+    /* 0x000021b0 */ 0x2b, 0x27, 0x82, 0xee, 0x04, 0x83, 0x93, 0x2a, 0x18, 0x94, 0x42, 0x18, 0xd2, 0xd2, 0xd2, 0x24, //* +'.....*..B....$ */ 
+    /* 0x000021c0 */ 0xbc, 0x0e, 0x08, 0xa0, 0xfd, 0x00, 0xf3, 0xec, 0x3b, 0x8c, 0xa1, 0x0b, 0xac, 0x47, 0x65, 0x1d, //* ........;....Ge. */ 
+    /* 0x000021d0 */ 0x9d, 0x30, 0xb0, 0x00, 0x8c, 0xaf, 0x0e, 0x6c, 0x8d, 0xad, 0xac, 0x82, 0xc6, 0xc7, 0x71, 0xd8, //* .0.....l......q. */ 
+    /* 0x000021e0 */ 0x0c, 0x9a, 0x51, 0xee, 0xaf, 0x0e, 0x03, 0x0b, 0x0b, 0x59, 0xf8, 0x6c, 0x1e, 0x10, 0xd1, 0x89, //* ..Q......Y.l.... */ 
+    /* 0x000021f0 */ 0xd9, 0x09, 0xe8, 0xd2, 0xae, 0xa8, 0x39, 0x71, 0xc2, 0x89, 0xd8, 0xbb, 0xc1, 0x60, 0x71, 0x79, //* ......9q.....`qy */ 
+    /* 0x00002200 */ 0xde, 0xa0, 0x14, 0x20, 0x42, 0x84, 0x5d, 0x8f, 0xde, 0x26, 0x6b, 0x94, 0x8e, 0x5f, 0x6f, 0x44, //* ... B.]..&k.._oD */ 
+    /* 0x00002210 */ 0x2b, 0x17, 0x2b, 0x58, 0x6b, 0xcd, 0xd6, 0x75, 0x46, 0x51, 0xb6, 0xad, 0xad, 0x75, 0x7d, 0xd8, //* +.+Xk..uFQ...u}. */ 
+    /* 0x00002220 */ 0x9d, 0xad, 0x21, 0x37, 0x1f, 0x49, 0x0a, 0xad, 0x9e, 0x7e, 0xfd, 0x29, 0x27, 0x3f, 0xb3, 0xb9, //* ..!7.I...~.)'?.. */ 
+    /* 0x00002230 */ 0x84, 0xa2, 0xb5, 0x95, 0x29, 0x00, 0xb4, 0x29, 0x23, 0x73, 0x68, 0x74, 0x9a, 0xd7, 0x8a, 0x6d, //* ....)..)#sht...m */ 
+    /* 0x00002240 */ 0xac, 0x06, 0x1f, 0xd0, 0x0b, 0x87, 0x6f, 0xc0, 0x90, 0xdc, 0x5d, 0x1c, 0xde, 0x73, 0xe1, 0xc5, //* ......o...]..s.. */ 
+    /* 0x00002250 */ 0xe2, 0x4d, 0x64, 0x4a, 0x21, 0x57, 0xdb, 0xcc, 0x90, 0x81, 0x2e, 0xb9, 0x40, 0xb7, 0x8e, 0x7d, //* .MdJ!W......@..} */ 
+    /* 0x00002260 */ 0x7d, 0x7d, 0x5d, 0x1c, 0xaf, 0xb6, 0xb6, 0x36, 0x24, 0x3c, 0x3c, 0xd8, 0xd7, 0x17, 0xc2, 0x28, //* }}]....6$<<....( */ 
+    /* 0x00002270 */ 0x9f, 0x14, 0x52, 0x52, 0xc2, 0xc6, 0x8c, 0x46, 0x78, 0xe3, 0xf9, 0xb0, 0xd3, 0x3f, 0x34, 0xd2, //* ..RR...Fx....?4. */ 
+    /* 0x00002280 */ 0x53, 0x62, 0x6b, 0x6e, 0xdc, 0x1d, 0xf2, 0x1d, 0x05, 0x05, 0x45, 0x5c, 0x52, 0xd2, 0x4f, 0xeb, //* Sbkn......E\R.O. */ 
+    /* 0x00002290 */ 0x06, 0xf4, 0xb6, 0xe3, 0x6d, 0x3e, 0x3e, 0xfd, 0x8e, 0x8e, 0xc6, 0x26, 0x26, 0x7e, 0x31, 0xab, //* ....m>>....&&~1. */ 
+    /* 0x000022a0 */ 0xc5, 0x09, 0xdc, 0x3d, 0x85, 0x83, 0x98, 0xf5, 0xa5, 0xf6, 0xef, 0x3a, 0xb3, 0x3f, 0x90, 0x9c, //* ...=.......:.?.. */ 
+    /* 0x000022b0 */ 0xfe, 0xfe, 0x08, 0xba, 0xd5, 0xd5, 0xee, 0xd0, 0x0d, 0x4b, 0xab, 0x2f, 0xe1, 0x0a, 0x94, 0xc2, //* .........K./.... */ 
+    /* 0x000022c0 */ 0xeb, 0x67, 0x5b, 0xb2, 0xf5, 0x5e, 0xf7, 0x7c, 0x8c, 0x8a, 0x69, 0x7e, 0x01, 0x01, 0x08, 0x04, //* .g[..^.|..i~.... */ 
+    /* 0x000022d0 */ 0x9b, 0xc4, 0x19, 0xcd, 0xcd, 0x18, 0xd6, 0x0b, 0xb5, 0x5d, 0xf9, 0x58, 0xf0, 0xdf, 0x13, 0x12, //* .........].X.... */ 
+    /* 0x000022e0 */ 0x42, 0x3a, 0xfc, 0x91, 0x76, 0x22, 0x28, 0x85, 0xf9, 0x3e, 0x4f, 0x17, 0x28, 0x2f, 0x23, 0xf0, //* B:..v"(..>O.(/#. */ 
+    /* 0x000022f0 */ 0x9e, 0x7b, 0x46, 0xdd, 0x52, 0xa0, 0xa0, 0x08, 0xd4, 0x51, 0xb5, 0x0f, 0xe5, 0xdd, 0xa2, 0xb9, //* .{F.R....Q...... */ 
+    /* 0x00002300 */ 0xe9, 0xc3, 0x7d, 0x16, 0x32, 0xd9, 0xec, 0x9f, 0x31, 0x7d, 0x1f, 0x9d, 0x88, 0x05, 0xe4, 0x2b, //* ..}.2...1}.....+ */ 
+    /* 0x00002310 */ 0xa4, 0x9d, 0x88, 0x1c, 0x1e, 0x1b, 0x1e, 0xef, 0xa4, 0xfb, 0x50, 0x2d, 0xe7, 0xc9, 0x93, 0x27, //* ..........P-...' */ 
+    /* 0x00002320 */ 0x24, 0x24, 0x64, 0xd8, 0xc7, 0x32, 0x0a, 0x7c, 0x33, 0x12, 0x1b, 0x1e, 0x1e, 0x3e, 0x59, 0xed, //* $$d..2.|3....>Y. */ 
+    /* 0x00002330 */ 0x80, 0x07, 0x7d, 0x3a, 0xf2, 0x2b, 0xdd, 0x5a, 0xc9, 0xd5, 0x1e, 0x74, 0x12, 0x7e, 0x1b, 0x0a, //* ..}:.+.Z...t.~.. */ 
+    /* 0x00002340 */ 0xd0, 0x41, 0xaf, 0x6e, 0x38, 0x62, 0xf0, 0xdb, 0xbc, 0x37, 0xde, 0x1a, 0x84, 0x29, 0x15, 0x0f, //* .A.n8b...7...).. */ 
+    /* 0x00002350 */ 0x9d, 0x4e, 0x29, 0x8a, 0x75, 0x8c, 0x96, 0x09, 0x7a, 0x7a, 0x46, 0x85, 0x89, 0x6d, 0x6e, 0xbe, //* .N).u...zzF..mn. */ 
+    /* 0x00002360 */ 0x46, 0xcc, 0x7e, 0x1f, 0xdd, 0xfb, 0xef, 0xd9, 0xd6, 0xcd, 0xf8, 0x8b, 0x53, 0xcf, 0x74, 0x51, //* F.~.........S.tQ */ 
+    /* 0x00002370 */ 0x2f, 0x4e, 0xb0, 0x31, 0xe4, 0xe4, 0xe6, 0x65, 0x78, 0x5c, 0x53, 0x85, 0x44, 0xb5, 0x22, 0xc2, //* /N.1...ex\S.D.". */ 
+    /* 0x00002380 */ 0x8a, 0x28, 0xe8, 0x3e, 0x44, 0xbc, 0xb5, 0x72, 0x27, 0xf3, 0xf3, 0xff, 0xb5, 0x5e, 0x35, 0x16, //* .(.>D..r'....^5. */ 
+    /* 0x00002390 */ 0xb4, 0x61, 0x23, 0x87, 0x11, 0xc7, 0xae, 0xeb, 0x8b, 0x4e, 0x3c, 0x9a, 0xad, 0x78, 0x2c, 0x3a, //* .a#......N<..x,: */ 
+    /* 0x000023a0 */ 0xdf, 0xea, 0x25, 0x2c, 0x03, 0x93, 0xe9, 0x16, 0xf3, 0x0c, 0xd9, 0x68, 0x6d, 0xed, 0x83, 0xb0, //* ..%,.......hm... */ 
+    /* 0x000023b0 */ 0x21, 0x9e, 0x20, 0xb4, 0x07, 0x6c, 0x0d, 0x69, 0xb0, 0x7d, 0x99, 0xa8, 0x34, 0x0b, 0xce, 0xb1, //* !. ..l.i.}..4... */ 
+    /* 0x000023c0 */ 0x08, 0xad, 0x9c, 0x29, 0xd6, 0xf0, 0x7a, 0x16, 0x42, 0xba, 0x9c, 0x9b, 0x30, 0x93, 0x77, 0xb1, //* ...)..z.B...0.w. */ 
+    /* 0x000023d0 */ 0xd7, 0x76, 0xce, 0x9b, 0xfb, 0xd0, 0xe2, 0xfe, 0xc6, 0xed, 0x8c, 0xde, 0x61, 0xad, 0x13, 0xb1, //* .v..........a... */ 
+    /* 0x000023e0 */ 0x0a, 0x0f, 0x0f, 0x8f, 0x0f, 0xfe, 0xa4, 0xc1, 0xe5, 0x70, 0x41, 0x55, 0x4c, 0xac, 0xcd, 0x26, //* .........pAUL..& */ 
+    /* 0x000023f0 */ 0x55, 0xc8, 0x95, 0x2f, 0x18, 0x61, 0x77, 0x31, 0x9f, 0x1f, 0x34, 0x76, 0xc1, 0x25, 0x25, 0x5f, //* U../.aw1..4v.%%_ */ 
+    /* 0x00002400 */ 0x0b, 0xd4, 0x58, 0xb5, 0x12, 0x74, 0x8d, 0xc0, 0xa6, 0x14, 0x33, 0xe4, 0xc8, 0x65, 0xbd, 0xa0, //* ..X..t....3..e.. */ 
+    /* 0x00002410 */ 0x86, 0xe1, 0x64, 0xd7, 0x1e, 0x1f, 0xdb, 0xda, 0x7d, 0xb9, 0x3f, 0x07, 0x56, 0x29, 0xf5, 0xf6, //* ..d.....}.?.V).. */ 
+    /* 0x00002420 */ 0x70, 0x2a, 0xb6, 0xa9, 0xa9, 0xe9, 0xe6, 0xce, 0x0e, 0xdd, 0xab, 0x57, 0x98, 0xe3, 0xad, 0x2f, //* p*.........W.../ */ 
+    /* 0x00002430 */ 0xbb, 0xfb, 0xfa, 0x90, 0xaf, 0x8f, 0x97, 0xf1, 0x6d, 0x8d, 0x76, 0x46, 0x53, 0x2d, 0x27, 0xb2, //* ........m.vFS-'. */ 
+    /* 0x00002440 */ 0x10, 0xd1, 0x08, 0xdf, 0xdd, 0xac, 0xfa, 0x13, 0xa1, 0x44, 0x87, 0x40, 0xdf, 0xd2, 0x4a, 0x34, //* .........D.@..J4 */ 
+    /* 0x00002450 */ 0x14, 0x61, 0x84, 0x13, 0x71, 0xbc, 0xfd, 0x65, 0xd0, 0x32, 0xd1, 0xe4, 0xca, 0x81, 0x41, 0xca, //* .a..q..e.2....A. */ 
+    /* 0x00002460 */ 0x8d, 0xe1, 0xe2, 0x32, 0xb2, 0xe6, 0x7a, 0x46, 0x2f, 0x7a, 0xb0, 0x80, 0xd9, 0xc3, 0xc0, 0x20, //* ...2..zF/z.....  */ 
+    /* 0x00002470 */ 0xf0, 0xb0, 0x83, 0xfb, 0xf5, 0x4f, 0xeb, 0x1b, 0x2e, 0x76, 0xf6, 0x51, 0xd4, 0x76, 0x1d, 0xc0, //* .....O...v.Q.v.. */ 
+    /* 0x00002480 */ 0xc1, 0xba, 0xa2, 0xc2, 0xd8, 0x38, 0x33, 0xcd, 0xa1, 0x41, 0xcf, 0xc4, 0xda, 0xfa, 0xcd, 0x5b, //* .....83..A.....[ */ 
+    /* 0x00002490 */ 0xf6, 0x31, 0xdc, 0x4f, 0xdc, 0xbf, 0x0d, 0xa5, 0x96, 0x1f, 0xe3, 0x9b, 0xcf, 0x88, 0x26, 0x73, //* .1.O..........&s */ 
+    /* 0x000024a0 */ 0x65, 0x89, 0xdb, 0x24, 0xfc, 0x91, 0xa2, 0x41, 0x58, 0x7a, 0xda, 0xeb, 0x8d, 0x0c, 0x89, 0xd4, //* e..$...AXz...... */ 
+    /* 0x000024b0 */ 0xe1, 0x55, 0xed, 0x5e, 0x58, 0x68, 0x94, 0xd0, 0xd1, 0x59, 0x70, 0x00, 0x1c, 0xb1, 0xa8, 0x44, //* .U.^Xh...Yp....D */ 
+    /* 0x000024c0 */ 0x32, 0x34, 0xf3, 0xd8, 0xa4, 0xd2, 0xa3, 0xc5, 0x82, 0xde, 0xd2, 0x76, 0xa4, 0xb5, 0x50, 0xc5, //* 24.........v..P. */ 
+    /* 0x000024d0 */ 0x98, 0x99, 0xd3, 0xb1, 0xb0, 0xe0, 0x82, 0xec, 0x2e, 0x09, 0xf6, 0x69, 0x91, 0x2b, 0x77, 0x93, //* ...........i.+w. */ 
+    /* 0x000024e0 */ 0x8b, 0x5d, 0x65, 0xcb, 0xa5, 0x7a, 0x5c, 0x76, 0xc3, 0x46, 0x34, 0x64, 0x64, 0x64, 0x01, 0x21, //* .]e..z\v.F4ddd.! */ 
+    /* 0x000024f0 */ 0x21, 0x1a, 0xee, 0x33, 0xc6, 0xb8, 0x57, 0xba, 0x51, 0xba, 0x75, 0x59, 0x3d, 0x95, 0x60, 0xa7, //* !..3..W.Q.uY=.`. */ 
+    /* 0x00002500 */ 0x8d, 0xcc, 0x95, 0x8d, 0xcf, 0xf2, 0xb8, 0x3e, 0x52, 0x2a, 0x9e, 0x41, 0x41, 0x47, 0xf7, 0xaf, //* .......>R*.AAG.. */ 
+    /* 0x00002510 */ 0xbb, 0x7e, 0x51, 0x6d, 0xb3, 0x4c, 0x86, 0x87, 0xba, 0xba, 0xe5, 0x0c, 0xf8, 0x23, 0x61, 0x4a, //* .~Qm.L.......#aJ */ 
+    /* 0x00002520 */ 0xb8, 0xbb, 0x93, 0xad, 0x53, 0xf7, 0x9a, 0x6e, 0xcf, 0x19, 0x76, 0xf5, 0xf7, 0x93, 0x4c, 0xe5, //* ....S..n..v...L. */ 
+    /* 0x00002530 */ 0x8f, 0x89, 0x3b, 0x39, 0xbd, 0x76, 0x39, 0x5a, 0xca, 0x5d, 0xaa, 0x1b, 0x73, 0x44, 0x87, 0xca, //* ..;9.v9Z.]..sD.. */ 
+    /* 0x00002540 */ 0xc3, 0x10, 0x4e, 0x5d, 0x9d, 0xe0, 0x63, 0x30, 0x68, 0x64, 0xf9, 0xd7, 0xda, 0xb6, 0x60, 0xe8, //* ..N]..c0hd....`. */ 
+    /* 0x00002550 */ 0x08, 0x50, 0x4c, 0xa8, 0xfb, 0x73, 0xb0, 0xab, 0xc8, 0x6f, 0x78, 0xad, 0xc2, 0xfc, 0x68, 0x5f, //* .PL..s...ox...h_ */ 
+    /* 0x00002560 */ 0x09, 0x5f, 0xcd, 0x7f, 0x49, 0xfd, 0x69, 0xa0, 0xf2, 0x04, 0x36, 0xa5, 0xe6, 0xf4, 0x77, 0x89, //* ._..I.i...6...w. */ 
+    /* 0x00002570 */ 0x94, 0x65, 0x60, 0x00, 0xa5, 0xc9, 0x85, 0xd2, 0xe6, 0xcb, 0x2c, 0xcd, 0x9e, 0x36, 0xde, 0xa6, //* .e`.......,..6.. */ 
+    /* 0x00002580 */ 0xa0, 0x60, 0x02, 0xcf, 0x8e, 0x70, 0xf5, 0xd7, 0xdf, 0x2a, 0x6c, 0x34, 0x74, 0x74, 0xf0, 0x7d, //* .`...p...*l4tt.} */ 
+    /* 0x00002590 */ 0x51, 0x94, 0x5d, 0xc7, 0x3e, 0x07, 0x9d, 0x63, 0x62, 0xaf, 0x3a, 0x76, 0x27, 0xb2, 0x95, 0x40, //* Q.].>..cb.:v'..@ */ 
+    /* 0x000025a0 */ 0x52, 0x41, 0xf1, 0xa3, 0x29, 0xea, 0xfc, 0xfd, 0x9b, 0x3b, 0x45, 0xd8, 0x95, 0x88, 0xdf, 0xf6, //* RA..)....;E..... */ 
+    /* 0x000025b0 */ 0xed, 0x3a, 0x08, 0xdc, 0x01, 0xc1, 0x7f, 0xda, 0xcb, 0x96, 0x9b, 0x4e, 0x1f, 0x7e, 0xf3, 0x60, //* .:.........N.~.` */ 
+    /* 0x000025c0 */ 0x38, 0x50, 0x04, 0x8c, 0x97, 0xe3, 0x4c, 0xff, 0x32, 0xa4, 0x76, 0xdc, 0x1e, 0x6e, 0xc9, 0xa9, //* 8P....L.2.v..n.. */ 
+    /* 0x000025d0 */ 0x91, 0x9c, 0x60, 0x23, 0x7f, 0xc0, 0xe6, 0x19, 0x55, 0xfa, 0xb3, 0x3b, 0x71, 0xa4, 0xdf, 0xe4, //* ..`#....U..;q... */ 
+    /* 0x000025e0 */ 0xc6, 0xcf, 0x18, 0x54, 0x56, 0x56, 0x76, 0x71, 0x75, 0x65, 0x0e, 0xc6, 0x65, 0xbe, 0x5c, 0xd9, //* ...TVVvque..e.\. */ 
+    /* 0x000025f0 */ 0xf4, 0xea, 0xe0, 0x16, 0x17, 0x34, 0x34, 0x5d, 0xeb, 0xeb, 0x78, 0x68, 0x7e, 0x34, 0x77, 0x79, //* .....44]..xh~4wy */ 
+    /* 0x00002600 */ 0x9a, 0xc3, 0x77, 0x33, 0x56, 0xbc, 0x55, 0x55, 0x55, 0x3d, 0xc7, 0x84, 0xe8, 0xbe, 0x49, 0x35, //* ..w3V.UUU=....I5 */ 
+    /* 0x00002610 */ 0xcc, 0xf2, 0xcd, 0x25, 0x7a, 0x0d, 0x29, 0xe7, 0xdb, 0xa3, 0x1b, 0xc8, 0xaf, 0x44, 0x57, 0xbb, //* ...%z.)......DW. */ 
+    /* 0x00002620 */ 0xa5, 0x55, 0xbf, 0x9d, 0x6d, 0xa2, 0x82, 0x8e, 0x33, 0xd7, 0x44, 0xea, 0x25, 0x71, 0x3b, 0xed, //* .U..m...3.D.%q;. */ 
+    /* 0x00002630 */ 0x72, 0xf2, 0x5d, 0xfe, 0x37, 0xca, 0x57, 0x9b, 0x62, 0x1d, 0x28, 0xed, 0x26, 0xc0, 0xe8, 0x87, //* r.].7.W.b.(.&... */ 
+    /* 0x00002640 */ 0x28, 0x0a, 0x2e, 0x66, 0x16, 0xf6, 0xa0, 0xa2, 0x12, 0x8a, 0xe8, 0xd8, 0x34, 0xc9, 0x42, 0xb5, //* (..f........4.B. */ 
+    /* 0x00002650 */ 0xce, 0xbc, 0x42, 0x4c, 0x46, 0xb9, 0x04, 0x68, 0x9e, 0x3c, 0xaf, 0xad, 0x51, 0x71, 0x33, 0x5f, //* ..BLF..h.<..Qq3_ */ 
+    /* 0x00002660 */ 0x9e, 0x30, 0x4b, 0x89, 0x38, 0x2b, 0x2c, 0xab, 0x59, 0x2e, 0xb4, 0xfc, 0xcb, 0x5c, 0x85, 0xe3, //* .0K.8+,.Y....\.. */ 
+    /* 0x00002670 */ 0x8e, 0x8d, 0x5c, 0xb2, 0x10, 0x66, 0xcd, 0xdf, 0xe9, 0xce, 0xdc, 0x0c, 0x1a, 0x12, 0x72, 0xf2, //* ..\..f........r. */ 
+    /* 0x00002680 */ 0x8d, 0xec, 0x68, 0xf7, 0xd5, 0x55, 0x89, 0xe3, 0x14, 0xa9, 0xe0, 0xe6, 0x7c, 0x88, 0x80, 0xea, //* ..h..U......|... */ 
+    /* 0x00002690 */ 0xd6, 0xba, 0x4f, 0xcc, 0x1c, 0x57, 0xc1, 0x33, 0x93, 0x16, 0x08, 0xcb, 0xdb, 0x55, 0x5b, 0x43, //* ..O..W.3.....U[C */ 
+    /* 0x000026a0 */ 0x9a, 0x4e, 0xea, 0xc5, 0x33, 0x2a, 0x1c, 0x1c, 0x1c, 0xaf, 0xad, 0x96, 0x48, 0xde, 0xb8, 0x5f, //* .N..3*......H.._ */ 
+    /* 0x000026b0 */ 0x75, 0xd7, 0xfd, 0xf1, 0x0c, 0xa7, 0x70, 0xe3, 0xd3, 0xd3, 0x6c, 0xe8, 0x04, 0xe1, 0x1c, 0xc4, //* u.....p...l..... */ 
+    /* 0x000026c0 */ 0xfc, 0x7f, 0xc0, 0xf4, 0x54, 0x69, 0x84, 0x7a, 0x68, 0xc4, 0x00, 0xb3, 0x22, 0x82, 0x03, 0x21, //* ....Ti.zh..."..! */ 
+    /* 0x000026d0 */ 0xba, 0xdc, 0xed, 0x9c, 0x88, 0x9e, 0x9e, 0xde, 0x68, 0x6f, 0x32, 0x7d, 0x22, 0xdb, 0xc2, 0x95, //* ........ho2}"... */ 
+    /* 0x000026e0 */ 0x99, 0x00, 0xad, 0x44, 0x7b, 0x23, 0xcc, 0xb4, 0xcf, 0xb3, 0x92, 0x8d, 0x8d, 0x2d, 0x2b, 0x18, //* ...D{#.......-+. */ 
+    /* 0x000026f0 */ 0x83, 0x72, 0xc9, 0x24, 0x66, 0x63, 0x75, 0x82, 0x81, 0x21, 0xd7, 0x3c, 0x34, 0x54, 0x91, 0x0e, //* .r.$fcu..!.<4T.. */ 
+    /* 0x00002700 */ 0x68, 0xf6, 0xb4, 0xfd, 0xf3, 0xcc, 0xd9, 0xa5, 0xaf, 0x3f, 0x97, 0x73, 0xb8, 0x72, 0xd8, 0xd1, //* h........?.s.r.. */ 
+    /* 0x00002710 */ 0x23, 0xeb, 0x1d, 0x86, 0x34, 0x8e, 0x0c, 0xc5, 0x87, 0x2e, 0x59, 0x2f, 0xd6, 0x86, 0xbf, 0x80, //* #...4.....Y/.... */ 
+    /* 0x00002720 */ 0xf0, 0x70, 0x73, 0xd7, 0x1b, 0x77, 0x21, 0x8d, 0x26, 0xf1, 0x86, 0xbb, 0x1e, 0xaf, 0x94, 0x4e, //* .ps..w!.&......N */ 
+    /* 0x00002730 */ 0x9a, 0x15, 0x4e, 0x5b, 0x15, 0x55, 0x27, 0x7f, 0xbc, 0xbd, 0xbd, 0x15, 0x71, 0xda, 0xe5, 0x64, //* ..N[.U'.....q..d */ 
+    /* 0x00002740 */ 0x92, 0x4b, 0x68, 0x07, 0xd3, 0x2e, 0xe4, 0x8b, 0x25, 0x36, 0x75, 0xaf, 0x66, 0x02, 0x12, 0x25, //* .Kh.....%6u.f..% */ 
+    /* 0x00002750 */ 0x44, 0xe9, 0x14, 0x2d, 0xec, 0xe9, 0xe8, 0x68, 0x9f, 0x8a, 0x5a, 0xf4, 0x81, 0x29, 0x35, 0x55, //* D..-...h..Z..)5U */ 
+    /* 0x00002760 */ 0xf3, 0xcd, 0x44, 0xab, 0xfc, 0x9d, 0x4f, 0x52, 0xcd, 0x97, 0xe5, 0x39, 0xc7, 0x2e, 0x0e, 0xf2, //* ..D...OR...9.... */ 
+    /* 0x00002770 */ 0xf0, 0xc3, 0x24, 0x9f, 0xf2, 0x8c, 0x4e, 0x21, 0xfd, 0x70, 0x4a, 0xa8, 0x14, 0x4f, 0x6b, 0x5a, //* ..$...N!.pJ..OkZ */ 
+    /* 0x00002780 */ 0x47, 0x81, 0xe5, 0xc8, 0xa2, 0xdd, 0xc7, 0xb3, 0xed, 0x91, 0xe4, 0x94, 0xd7, 0x7b, 0xb2, 0x36, //* G............{.6 */ 
+    /* 0x00002790 */ 0x0b, 0xd5, 0xa1, 0x20, 0xd6, 0xe1, 0x8c, 0xa1, 0xfb, 0xb5, 0x27, 0x24, 0x90, 0x28, 0xa4, 0x89, //* ... ......'$.(.. */ 
+    /* 0x000027a0 */ 0x24, 0x0a, 0xbb, 0x1c, 0x18, 0xb9, 0xd4, 0xca, 0xbd, 0xa4, 0x19, 0x61, 0x4f, 0x87, 0xa9, 0xfb, //* $..........aO... */ 
+    /* 0x000027b0 */ 0x33, 0x01, 0xbd, 0x6a, 0xac, 0x6d, 0x70, 0x55, 0xde, 0x8f, 0x77, 0xb6, 0x2e, 0xce, 0xfa, 0x5d, //* 3..j.mpU..w....] */ 
+    /* 0x000027c0 */ 0x65, 0xfa, 0x4d, 0xad, 0xb0, 0x5f, 0xa6, 0x5e, 0xa6, 0xf3, 0xf3, 0x0b, 0xde, 0xe7, 0xca, 0xbf, //* e.M.._.^........ */ 
+    /* 0x000027d0 */ 0x56, 0x24, 0x00, 0xa1, 0xdd, 0x3c, 0xf5, 0x2c, 0x6a, 0x68, 0x79, 0xa9, 0x6e, 0x5d, 0x98, 0xfd, //* V$...<.,jhy.n].. */ 
+    /* 0x000027e0 */ 0xef, 0xf0, 0xb0, 0xb0, 0xdd, 0x7d, 0x0f, 0xbf, 0xae, 0x60, 0x9f, 0x5e, 0xd0, 0x82, 0x71, 0x31, //* .....}...`.^..q1 */ 
+    /* 0x000027f0 */ 0x6c, 0x09, 0xd6, 0xd9, 0xfe, 0x19, 0xfd, 0x87, 0x36, 0x87, 0x8b, 0x84, 0x99, 0x86, 0x33, 0x11, //* l.......6.....3. */ 
+    /* 0x00002800 */ 0x61, 0x61, 0xeb, 0x9a, 0x86, 0xf2, 0xaf, 0x20, 0xe5, 0x0a, 0xc5, 0xb7, 0x8f, 0xcf, 0x96, 0x88, //* aa..... ........ */ 
+    /* 0x00002810 */ 0xe2, 0x1b, 0x4c, 0x9a, 0x5d, 0x6d, 0xef, 0xd0, 0x8c, 0xbc, 0x41, 0x0e, 0x75, 0x84, 0x83, 0x83, //* ..L.]m....A.u... */ 
+    /* 0x00002820 */ 0xeb, 0x8e, 0x91, 0x1b, 0x18, 0x18, 0xdb, 0x5b, 0x5f, 0x97, 0x23, 0x5f, 0xbc, 0xde, 0xdd, 0xda, //* .......[_.#_.... */ 
+    /* 0x00002830 */ 0x7a, 0x85, 0x54, 0x3b, 0x3c, 0xec, 0xd9, 0x31, 0x92, 0xcc, 0x8f, 0xdb, 0xae, 0x0e, 0x24, 0xcd, //* z.T;<..1......$. */ 
+    /* 0x00002840 */ 0xf9, 0xcc, 0x9e, 0xe8, 0x94, 0xc3, 0x97, 0xfb, 0x0c, 0xfc, 0x60, 0x88, 0x88, 0x8c, 0x64, 0x90, //* ..........`...d. */ 
+    /* 0x00002850 */ 0x1e, 0xdc, 0x12, 0xd4, 0x3b, 0x6c, 0x0c, 0x1a, 0xac, 0xe4, 0x8e, 0x8b, 0x8b, 0x3b, 0x7b, 0xb8, //* ....;l.......;{. */ 
+    /* 0x00002860 */ 0x3d, 0xa7, 0x10, 0xb0, 0x33, 0xfa, 0x3e, 0x7b, 0xbd, 0x61, 0xad, 0xac, 0xb3, 0xe2, 0x76, 0x07, //* =...3.>{.a....v. */ 
+    /* 0x00002870 */ 0xa0, 0x5c, 0x5f, 0x2c, 0x0d, 0x05, 0x04, 0xa3, 0x2e, 0xd5, 0x7f, 0xc6, 0xdf, 0x58, 0xdf, 0x60, //* .\_,.........X.` */ 
+    /* 0x00002880 */ 0xdd, 0x26, 0x14, 0x7d, 0xce, 0x43, 0x2f, 0x59, 0xe3, 0x05, 0x11, 0x3d, 0xb0, 0xc5, 0xcb, 0xe7, //* .&.}.C/Y...=.... */ 
+    /* 0x00002890 */ 0xdd, 0xf1, 0x8a, 0x97, 0xe5, 0x5c, 0xf3, 0xad, 0x2a, 0x20, 0xe5, 0xcc, 0x33, 0x73, 0xb2, 0xbd, //* .....\..* ..3s.. */ 
+    /* 0x000028a0 */ 0x57, 0x90, 0xaa, 0xf6, 0xd4, 0x24, 0xd1, 0x14, 0x44, 0x66, 0x55, 0x90, 0x19, 0xa4, 0x39, 0xf4, //* W....$..DfU...9. */ 
+    /* 0x000028b0 */ 0x0c, 0xbf, 0x2e, 0xc5, 0xc0, 0x77, 0x25, 0x5b, 0xfb, 0xfc, 0xef, 0x7f, 0x94, 0xa4, 0xdf, 0x29, //* .....w%[.......) */ 
+    /* 0x000028c0 */ 0xbc, 0x2d, 0x93, 0x34, 0xf2, 0xfb, 0x3f, 0x2f, 0xca, 0x6a, 0xa3, 0x01, 0x03, 0x03, 0x04, 0x00, //* .-.4..?/.j...... */ 
+    /* 0x000028d0 */ 0xbe, 0x93, 0x3b, 0xf7, 0x01, 0x04, 0x00, 0xdd, 0x25, 0x00, 0x00, 0x02, 0x04, 0x00, 0x32, 0xc9, //* ..;.....%.....2. */ 
+    /* 0x000028e0 */ 0x18, 0x69, 0x00, 0x00, 0x00, 0x00, 0x01, 0x0a, 0x66, 0x69, 0x6c, 0x65, 0x31, 0x2e, 0x74, 0x78, //* .i......file1.tx */ 
+    /* 0x000028f0 */ 0x74, 0x00, 0x15, 0x00, 0x00, 0x00, 0x4f, 0x16, 0x4e, 0x21, 0x48, 0x65, 0x6c, 0x6c, 0x6f, 0x2c, //* t.....O.N!Hello, */ 
+    /* 0x00002900 */ 0x20, 0x74, 0x68, 0x69, 0x73, 0x20, 0x69, 0x73, 0x20, 0x66, 0x69, 0x6c, 0x65, 0x31, 0x2e, 0x00, //*  this is file1.. */ 
+    /* 0x00002910 */ 0x02, 0x01, 0x04, 0x00, 0x15, 0x00, 0x00, 0x00, 0x02, 0x04, 0x00, 0x32, 0xc9, 0x18, 0x69, 0x00, //* ...........2..i. */ 
+    /* 0x00002920 */ 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0xf0, 0xd2, 0xb4, 0x3d, 0xdd, //* ..............=. */ 
+    /* 0x00002930 */ 0x28, 0x00, 0x00, 0x90, 0xda, 0x43, 0x41, 0x82, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xff, //* (....CA......... */ 
+    /* 0x00002940 */ 0xff, 0xff, 0xff, 0x00, 0x00, 0x00, 0x00, 0xff, 0xff, 0xff, 0xff, 0x34, 0xaf, 0x39, 0x6f, 0xc7, //* ...........4.9o. */ 
+    /* 0x00002950 */ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xff, 0xff, 0xff, 0xff, 0x00, 0x00, 0x00, 0x00, 0xff, //* ................ */ 
+    /* 0x00002960 */ 0xff, 0xff, 0xff, 0x00, 0x00, 0x00, 0x00, 0xff, 0xff, 0xff, 0xff, 0x00, 0x00, 0x00, 0x00, 0xff, //* ................ */ 
+    /* 0x00002970 */ 0xff, 0xff, 0xff, 0x19, 0x57, 0x90, 0xd6, 0x6e, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xff, //* ....W..n........ */ 
+    /* 0x00002980 */ 0xff, 0xff, 0xff, 0x00, 0x00, 0x00, 0x00, 0xff, 0xff, 0xff, 0xff, 0x00, 0x00, 0x00, 0x00, 0xff, //* ................ */ 
+    /* 0x00002990 */ 0xff, 0xff, 0xff, 0x4d, 0xb7, 0xe0, 0x55, 0x56, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xff, //* ...M..UV........ */ 
+    /* 0x000029a0 */ 0xff, 0xff, 0xff, 0x00, 0x00, 0x00, 0x00, 0xff, 0xff, 0xff, 0xff, //* ........... */ 
+};
+
+const size_t mock_test_merkle_data_len = 10667;
+const uint32_t mock_test_merkle_data_crc32 = 0x12faea70;
+
+const char mock_test_merkle_data_binary_modified_date[] = "2026-10-19 00:25:41";
+const char mock_test_merkle_data_c_generated_date[] = "2026-10-19 00:25:41";
+const char mock_test_merkle_data_c_compiled_date[] = __DATE__ " " __TIME__;
@@ -0,0 +1,676 @@
+#include "mock_test_window_data.h"
+
+const unsigned char mock_test_window_data[] = {
+    /* 0x00000000 */ 0x44, 0x52, 0x4f, 0x46, 0x53, 0x73, 0x45, 0x6f, 0xf3, 0x02, 0x0a, 0x74, 0x65, 0x73, 0x74, 0x5f, //* DROFSsEo...test_ */ 
+    /* 0x00000010 */ 0x64, 0x61, 0x74, 0x61, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x02, //* data............ */ 
+    /* 0x00000020 */ 0x04, 0x00, 0x6c, 0x5b, 0xd5, 0x6a, 0x05, 0x01, 0x00, 0x0a, 0x04, 0x00, 0x00, 0x00, 0x35, 0x00, //* ..l[.j........5. */ 
+    /* 0x00000030 */ 0x00, 0x00, 0x9f, 0x00, 0x00, 0x00, 0x77, 0x03, 0x00, 0x00, 0x41, 0x29, 0x00, 0x00, 0x02, 0x0a, //* ......w...A).... */ 
+    /* 0x00000040 */ 0x73, 0x75, 0x62, 0x66, 0x6f, 0x6c, 0x64, 0x65, 0x72, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, //* subfolder....... */ 
+    /* 0x00000050 */ 0x00, 0x00, 0x00, 0x01, 0x02, 0x04, 0x00, 0x6c, 0x5b, 0xd5, 0x6a, 0x01, 0x00, 0x00, 0x00, 0x5a, //* .......l[.j....Z */ 
+    /* 0x00000060 */ 0x00, 0x00, 0x00, 0x01, 0x0a, 0x66, 0x69, 0x6c, 0x65, 0x32, 0x2e, 0x74, 0x78, 0x74, 0x00, 0x1d, //* .....file2.txt.. */ 
+    /* 0x00000070 */ 0x00, 0x00, 0x00, 0x93, 0x23, 0x7a, 0x1e, 0x54, 0x68, 0x69, 0x73, 0x20, 0x69, 0x73, 0x20, 0x66, //* ....#z.This is f */ 
+    /* 0x00000080 */ 0x69, 0x6c, 0x65, 0x32, 0x20, 0x69, 0x6e, 0x20, 0x61, 0x20, 0x73, 0x75, 0x62, 0x66, 0x6f, 0x6c, //* ile2 in a subfol */ 
+    /* 0x00000090 */ 0x64, 0x65, 0x72, 0x2e, 0x00, 0x02, 0x01, 0x04, 0x00, 0x1d, 0x00, 0x00, 0x00, 0x02, 0x04, 0x00, //* der............. */ 
+    /* 0x000000a0 */ 0x32, 0xc9, 0x18, 0x69, 0x00, 0x00, 0x00, 0x00, 0x01, 0x0e, 0x6c, 0x6f, 0x6e, 0x67, 0x5f, 0x66, //* 2..i......long_f */ 
+    /* 0x000000b0 */ 0x69, 0x6c, 0x65, 0x2e, 0x74, 0x78, 0x74, 0x00, 0xa5, 0x02, 0x00, 0x00, 0x31, 0x97, 0x6b, 0x41, //* ile.txt.....1.kA */ 
+    /* 0x000000c0 */ 0x28, 0xcf, 0x4d, 0x52, 0x4b, 0x6e, 0x1b, 0x31, 0x0c, 0xdd, 0x1b, 0xf0, 0x1d, 0x78, 0x00, 0xc3, //* (.MRKn.1.....x.. */ 
+    /* 0x000000d0 */ 0x57, 0xe8, 0xa6, 0xdd, 0x15, 0x01, 0x8a, 0x22, 0x07, 0x60, 0x24, 0x26, 0x26, 0xa0, 0x5f, 0x24, //* W......".`$&&._$ */ 
+    /* 0x000000e0 */ 0x31, 0xf0, 0xf1, 0xfb, 0x28, 0x4d, 0x5c, 0x6f, 0x8c, 0x99, 0x31, 0xc9, 0xf7, 0xfd, 0x5d, 0xbb, //* 1...(M\o..1...]. */ 
+    /* 0x000000f0 */ 0x64, 0xd2, 0x36, 0x2c, 0x53, 0xac, 0xa9, 0x76, 0x1a, 0x3a, 0x89, 0xb3, 0xcc, 0x0b, 0x85, 0x5a, //* d.6,S..v.:.....Z */ 
+    /* 0x00000100 */ 0x86, 0x84, 0x29, 0xd3, 0x3a, 0x71, 0xd4, 0xa6, 0x23, 0x68, 0xf9, 0x20, 0x49, 0x8a, 0x3f, 0x87, //* ..).:q..#h. I.?. */ 
+    /* 0x00000110 */ 0x44, 0x2c, 0x90, 0xa8, 0x8d, 0x5c, 0x23, 0x4d, 0xc9, 0x0d, 0xcb, 0x5a, 0x82, 0x46, 0x8d, 0x56, //* D,...\#M...Z.F.V */ 
+    /* 0x00000120 */ 0x26, 0xd9, 0xa4, 0xc4, 0x6f, 0x38, 0x4f, 0x32, 0xf7, 0x69, 0xa1, 0xcc, 0x1f, 0x85, 0x89, 0x93, //* &...o8O2.i...... */ 
+    /* 0x00000130 */ 0x7e, 0x1a, 0x5f, 0xe9, 0x7c, 0x7a, 0x9d, 0x24, 0x45, 0x33, 0xae, 0x53, 0x56, 0x7f, 0xf8, 0xc2, //* ~._.|z.$E3.SV... */ 
+    /* 0x00000140 */ 0x2b, 0xe7, 0x0b, 0x7d, 0x9a, 0x0e, 0x2a, 0x75, 0xcc, 0x6e, 0x91, 0xe4, 0x2e, 0x3d, 0xe8, 0xe4, //* +..}..*u.n...=.. */ 
+    /* 0x00000150 */ 0xa9, 0xb5, 0x90, 0xa5, 0xc4, 0x39, 0xd4, 0x7d, 0xdb, 0x87, 0x74, 0xa8, 0x63, 0xad, 0xa3, 0xda, //* .....9.}..t.c... */ 
+    /* 0x00000160 */ 0x30, 0x4c, 0xc2, 0xa0, 0x9e, 0xc1, 0xaa, 0x6e, 0x09, 0x00, 0x9b, 0x8e, 0xf6, 0xd3, 0x8f, 0xb2, //* 0L.....n........ */ 
+    /* 0x00000170 */ 0x4d, 0x21, 0xed, 0x06, 0x36, 0x5b, 0xaf, 0x16, 0xea, 0xd2, 0xba, 0xdc, 0xa4, 0x44, 0xe9, 0x10, //* M!..6[.......D.. */ 
+    /* 0x00000180 */ 0x8f, 0x0f, 0x5f, 0x35, 0x59, 0x03, 0xa0, 0x80, 0x10, 0xd4, 0x92, 0x8c, 0x21, 0x14, 0x34, 0xa5, //* .._5Y.......!.4. */ 
+    /* 0x00000190 */ 0x6f, 0x97, 0x20, 0xca, 0xe8, 0xdd, 0x3e, 0x94, 0x27, 0x15, 0xa7, 0x44, 0x8d, 0x3b, 0x5e, 0xac, //* o. ...>.'..D.;^. */ 
+    /* 0x000001a0 */ 0x3b, 0xd0, 0xaf, 0x7b, 0x90, 0x36, 0xc5, 0xdc, 0x4c, 0x38, 0x51, 0x43, 0x60, 0x09, 0x98, 0x0c, //* ;..{.6..L8QC`... */ 
+    /* 0x000001b0 */ 0xd6, 0x34, 0xf2, 0xf4, 0x1d, 0x28, 0x69, 0xbd, 0x6a, 0x94, 0xe2, 0x5e, 0xba, 0x5f, 0x80, 0x0d, //* .4...(i.j..^._.. */ 
+    /* 0x000001c0 */ 0x96, 0x1a, 0xbb, 0x76, 0xaa, 0xef, 0xef, 0x1a, 0x94, 0x29, 0xca, 0x90, 0xee, 0xff, 0xe6, 0x9a, //* ...v.....)...... */ 
+    /* 0x000001d0 */ 0x9c, 0x08, 0xbb, 0x49, 0x0a, 0x4b, 0xc6, 0xe1, 0xae, 0xe5, 0xeb, 0xf9, 0x74, 0x3e, 0xfd, 0x45, //* ...I.K......t>.E */ 
+    /* 0x000001e0 */ 0x1a, 0x30, 0xa1, 0x49, 0x1f, 0xcd, 0x17, 0x27, 0x94, 0x1a, 0xf4, 0x50, 0xcd, 0x30, 0x88, 0x74, //* .0.I...'...P.0.t */ 
+    /* 0x000001f0 */ 0x40, 0x4a, 0x01, 0xbd, 0x41, 0xd2, 0xfb, 0x11, 0xf2, 0x43, 0x24, 0xfc, 0x0f, 0xc1, 0x06, 0x97, //* @J..A....C$..... */ 
+    /* 0x00000200 */ 0xa9, 0x0f, 0x7d, 0xf9, 0xd3, 0x04, 0x08, 0x16, 0xf7, 0xd7, 0x0b, 0xcd, 0x3a, 0x39, 0x93, 0x97, //* ..}.........:9.. */ 
+    /* 0x00000210 */ 0xe5, 0x7c, 0x62, 0xe0, 0xac, 0x98, 0x84, 0x7d, 0x0c, 0xed, 0x71, 0xd6, 0x2c, 0xc4, 0x6f, 0x04, //* .|b....}..q.,.o. */ 
+    /* 0x00000220 */ 0x93, 0x2a, 0xb4, 0x20, 0xc8, 0xe9, 0x36, 0x7d, 0xb9, 0xa5, 0x8b, 0x0e, 0x5a, 0x80, 0x19, 0x84, //* .*. ..6}....Z... */ 
+    /* 0x00000230 */ 0xc5, 0x3d, 0xdc, 0x74, 0xa2, 0x58, 0x95, 0xde, 0x04, 0x6e, 0x60, 0x48, 0xfd, 0x37, 0x6a, 0x98, //* .=.t.X...n`H.7j. */ 
+    /* 0x00000240 */ 0xbc, 0xbd, 0x90, 0x7b, 0x4b, 0x1a, 0xa0, 0xcf, 0xdd, 0x7c, 0x91, 0x5c, 0x77, 0x4d, 0x1c, 0x28, //* ...{K....|.\wM.( */ 
+    /* 0x00000250 */ 0x3f, 0xf3, 0x86, 0x55, 0xfc, 0xfd, 0x3e, 0x76, 0x73, 0x07, 0xb8, 0xb9, 0xd2, 0xee, 0x49, 0x53, //* ?..U..>vs.....IS */ 
+    /* 0x00000260 */ 0x8d, 0xfe, 0x0d, 0x0f, 0x9e, 0xd5, 0xd1, 0xda, 0xb5, 0x74, 0x14, 0x03, 0x60, 0x98, 0xf4, 0x5a, //* .........t..`..Z */ 
+    /* 0x00000270 */ 0xea, 0x21, 0x7c, 0x00, 0x51, 0xea, 0x58, 0x29, 0xf4, 0x55, 0x39, 0x79, 0x46, 0xf4, 0x25, 0xa5, //* .!|.Q.X).U9yF.%. */ 
+    /* 0x00000280 */ 0x22, 0x23, 0x28, 0x76, 0xaf, 0xf4, 0x22, 0xee, 0x40, 0xab, 0x70, 0x75, 0x95, 0x16, 0x12, 0xb3, //* "#(v..".@.pu.... */ 
+    /* 0x00000290 */ 0xa7, 0xb3, 0x2a, 0xfc, 0xed, 0xa5, 0x13, 0xb7, 0x83, 0xed, 0x2e, 0x9d, 0x53, 0x85, 0x8f, 0x59, //* ..*.........S..Y */ 
+    /* 0x000002a0 */ 0x30, 0xb8, 0xa8, 0x84, 0x29, 0x60, 0x72, 0x21, 0x8e, 0xda, 0x14, 0xc7, 0x77, 0xf1, 0x9e, 0x08, //* 0...)`r!....w... */ 
+    /* 0x000002b0 */ 0x7b, 0x63, 0x8a, 0xe5, 0x7d, 0x5f, 0x11, 0x24, 0xfa, 0xad, 0x04, 0x4a, 0xc0, 0x66, 0x18, 0x1e, //* {c..}_.$...J.f.. */ 
+    /* 0x000002c0 */ 0x34, 0xba, 0x73, 0x76, 0xf4, 0x42, 0xdc, 0xef, 0xa3, 0xaa, 0x2e, 0x8f, 0x57, 0x6e, 0x49, 0xd7, //* 4.sv.B......WnI. */ 
+    /* 0x000002d0 */ 0xbe, 0x67, 0x05, 0x6d, 0x4f, 0xba, 0xae, 0xf4, 0x3a, 0xb7, 0xc7, 0x1c, 0x29, 0x2b, 0x1e, 0xe0, //* .g.mO...:...)+.. */ 
+    /* 0x000002e0 */ 0x2b, 0xde, 0x3d, 0x64, 0x97, 0x05, 0xf8, 0x31, 0x51, 0x36, 0x24, 0x23, 0x3d, 0xac, 0x44, 0x61, //* +.=d...1Q6$#=.Da */ 
+    /* 0x000002f0 */ 0x4c, 0x26, 0x4b, 0x09, 0xf7, 0x42, 0xed, 0x60, 0x81, 0xa9, 0x61, 0xa0, 0xde, 0x96, 0xb6, 0xc5, //* L&K..B.`..a..... */ 
+    /* 0x00000300 */ 0x42, 0xeb, 0xf0, 0x0b, 0xa8, 0xa0, 0x3a, 0xb3, 0x85, 0xef, 0xed, 0xbd, 0xa3, 0x39, 0xd8, 0xca, //* B.....:......9.. */ 
+    /* 0x00000310 */ 0x4b, 0xc3, 0x11, 0x85, 0x67, 0xf6, 0x83, 0xfe, 0x38, 0x18, 0x02, 0xc3, 0x6d, 0x38, 0x40, 0x02, //* K...g...8...m8@. */ 
+    /* 0x00000320 */ 0x48, 0x35, 0x68, 0xe8, 0xd2, 0xba, 0xdc, 0x04, 0x95, 0x46, 0x9f, 0x96, 0xb7, 0x5a, 0xfc, 0xc8, //* H5h......F...Z.. */ 
+    /* 0x00000330 */ 0x43, 0x02, 0x20, 0x97, 0x65, 0x30, 0x7f, 0x08, 0x2d, 0x99, 0x45, 0x6f, 0x9a, 0xe0, 0x53, 0x42, //* C. .e0..-.Eo..SB */ 
+    /* 0x00000340 */ 0x1e, 0x8a, 0x82, 0x3d, 0x01, 0x5d, 0xd6, 0x75, 0x74, 0x75, 0xc7, 0xf2, 0x08, 0xca, 0xf1, 0xbc, //* ...=.].utu...... */ 
+    /* 0x00000350 */ 0x2a, 0xec, 0x18, 0xf5, 0x7f, 0xb5, 0x8a, 0x0b, 0xa5, 0xc6, 0xa8, 0xbd, 0xd3, 0x3c, 0x9f, 0xfe, //* *............<.. */ 
+    /* 0x00000360 */ 0x01, 0x76, 0x44, 0xea, 0x8e, 0x01, 0x03, 0x03, 0x04, 0x00, 0x59, 0x01, 0x89, 0x71, 0x01, 0x04, //* .vD.......Y..q.. */ 
+    /* 0x00000370 */ 0x00, 0x38, 0x05, 0x00, 0x00, 0x02, 0x04, 0x00, 0x32, 0xc9, 0x18, 0x69, 0x00, 0x00, 0x00, 0x00, //* .8......2..i.... */ 
+    /* 0x00000380 */ 0x01, 0x0c, 0x64, 0x72, 0x6f, 0x66, 0x73, 0x32, 0x73, 0x2e, 0x70, 0x6e, 0x67, 0x00, 0x99, 0x25, //* ..drofs2s.png..% */ 
+    /* 0x00000390 */ 0x00, 0x00, 0x24, 0x9a, 0xc9, 0x68, 0x28, 0xcf, 0x5d, 0xb2, 0x05, 0x50, 0x9c, 0x4d, 0xb0, 0x35, //* ..$..h(.]..P.M.5 */ 
+    /* 0x000003a0 */ 0xfc, 0x2c, 0xee, 0xee, 0x1e, 0x1c, 0x42, 0xd0, 0xe0, 0x2e, 0x21, 0xc1, 0xdd, 0xdd, 0x09, 0x09, //* .,....B...!..... */ 
+    /* 0x000003b0 */ 0x6e, 0xc1, 0x17, 0x77, 0x49, 0x08, 0xee, 0xee, 0x04, 0x77, 0x77, 0x5f, 0x1c, 0x82, 0x05, 0x97, //* n..wI....ww_.... */ 
+    /* 0x000003c0 */ 0xc0, 0xe2, 0x1e, 0xe4, 0xdb, 0xf7, 0xde, 0x5b, 0xf5, 0x57, 0xfd, 0x53, 0xd5, 0xd3, 0x32, 0x33, //* .......[.W.S..23 */ 
+    /* 0x000003d0 */ 0xdd, 0xd3, 0x7d, 0x4e, 0xa4, 0xaa, 0xf2, 0x47, 0x4c, 0x34, 0x32, 0x34, 0x00, 0x00, 0x30, 0xe5, //* ..}N...GL424..0. */ 
+    /* 0x000003e0 */ 0x3e, 0xc9, 0xa8, 0xc3, 0xb4, 0xe5, 0x7f, 0x82, 0x82, 0x04, 0xdb, 0x9d, 0xb6, 0x93, 0x34, 0x61, //* >.............4a */ 
+    /* 0x000003f0 */ 0x0a, 0xe4, 0xaa, 0xfe, 0x51, 0x0a, 0xa8, 0x9e, 0xa2, 0x38, 0x82, 0x39, 0x08, 0x36, 0x92, 0x4a, //* ....Q....8.9.6.J */ 
+    /* 0x00000400 */ 0x92, 0x00, 0x50, 0x1b, 0x8f, 0xfe, 0x64, 0x86, 0x08, 0xf3, 0x51, 0x9d, 0x3e, 0xe9, 0xb9, 0x02, //* ..P...d...Q.>... */ 
+    /* 0x00000410 */ 0x00, 0x56, 0xdf, 0x7f, 0x02, 0x22, 0x64, 0x96, 0x07, 0xc3, 0x82, 0x24, 0x6e, 0x1f, 0x74, 0xdd, //* .V..."d....$n.t. */ 
+    /* 0x00000420 */ 0x34, 0x1c, 0xad, 0xdd, 0x3c, 0xcd, 0x5c, 0xac, 0x00, 0x55, 0xb3, 0xcf, 0x0e, 0x6e, 0xec, 0xca, //* 4...<.\..U...n.. */ 
+    /* 0x00000430 */ 0x1f, 0x34, 0x69, 0x78, 0xd9, 0xb9, 0xd8, 0x05, 0xc8, 0x3f, 0xff, 0x2d, 0x85, 0xdd, 0x69, 0xb2, //* .4ix.....?.-..i. */ 
+    /* 0x00000440 */ 0xd2, 0x95, 0xb3, 0x96, 0x93, 0x63, 0x05, 0x50, 0x60, 0x0e, 0x22, 0x40, 0x06, 0x42, 0x04, 0x40, //* .....c.P`."@.B.@ */ 
+    /* 0x00000450 */ 0x30, 0x4b, 0x1e, 0x26, 0xe4, 0xff, 0x67, 0xff, 0xf7, 0x1b, 0x66, 0x10, 0xfc, 0xff, 0xd8, 0x70, //* 0K.&..g...f....p */ 
+    /* 0x00000460 */ 0x30, 0xe1, 0x02, 0xc1, 0x01, 0x38, 0x30, 0xad, 0x0f, 0x93, 0xcf, 0xe1, 0x08, 0xff, 0x13, 0xb7, //* 0....80......... */ 
+    /* 0x00000470 */ 0x03, 0xfe, 0x77, 0x5d, 0x7a, 0x80, 0x80, 0x43, 0xf8, 0xff, 0x4f, 0xff, 0xff, 0x8a, 0x02, 0xb0, //* ..w]z..C..O..... */ 
+    /* 0x00000480 */ 0x50, 0x02, 0x32, 0x80, 0x00, 0xbb, 0xc9, 0xc9, 0xcd, 0xc3, 0x09, 0xca, 0xfd, 0xdf, 0xac, 0xff, //* P.2............. */ 
+    /* 0x00000490 */ 0x09, 0x62, 0xee, 0xff, 0x66, 0xfa, 0xf9, 0x7f, 0x99, 0xe0, 0x60, 0x1e, 0xdc, 0xff, 0xdc, 0x54, //* .b..f.....`....T */ 
+    /* 0x000004a0 */ 0x17, 0x14, 0x80, 0x59, 0xff, 0xf7, 0x8a, 0x8b, 0x93, 0xf3, 0xbf, 0xd3, 0x09, 0x07, 0x22, 0x5f, //* ...Y.........."_ */ 
+    /* 0x000004b0 */ 0x79, 0x8d, 0x43, 0x0a, 0x00, 0xa0, 0x8f, 0x91, 0x93, 0x91, 0xd4, 0xfc, 0x66, 0x0c, 0xcd, 0xf2, //* y.C.........f... */ 
+    /* 0x000004c0 */ 0xd4, 0xd5, 0x5c, 0xba, 0xbd, 0xeb, 0xe6, 0x71, 0x4b, 0xca, 0x0f, 0xc2, 0xec, 0x45, 0xb0, 0x38, //* ..\....qK....E.8 */ 
+    /* 0x000004d0 */ 0xab, 0xfd, 0x10, 0xdb, 0x8b, 0x57, 0x33, 0x44, 0x55, 0x20, 0x1b, 0xc9, 0x90, 0x4e, 0xa2, 0x80, //* .....W3DU ...N.. */ 
+    /* 0x000004e0 */ 0x67, 0x60, 0x0e, 0xff, 0x41, 0x26, 0x96, 0x21, 0x99, 0x9e, 0x68, 0x00, 0x8e, 0xec, 0x03, 0x5b, //* g`..A&.!..h....[ */ 
+    /* 0x000004f0 */ 0x44, 0x14, 0x1a, 0x51, 0x54, 0x10, 0x1c, 0x2b, 0x6b, 0x90, 0xae, 0x44, 0x59, 0x5f, 0xcf, 0x74, //* D..QT..+k..DY_.t */ 
+    /* 0x00000500 */ 0x18, 0x37, 0xa7, 0x6b, 0xd7, 0x19, 0x35, 0x0f, 0x85, 0xd9, 0x8f, 0x7f, 0x1b, 0x7f, 0x5c, 0x7f, //* .7.k..5.......\. */ 
+    /* 0x00000510 */ 0x91, 0x5d, 0x5c, 0x7a, 0x65, 0x5f, 0x89, 0xf0, 0xd8, 0x9c, 0xd5, 0x1f, 0x4c, 0x18, 0xdb, 0x9c, //* .]\ze_......L... */ 
+    /* 0x00000520 */ 0x75, 0xde, 0x6e, 0x7c, 0xa9, 0x82, 0x9f, 0x57, 0x95, 0xc6, 0xe4, 0x9d, 0x3f, 0x2f, 0x26, 0xe1, //* u.n|...W....?/&. */ 
+    /* 0x00000530 */ 0x1e, 0x50, 0x33, 0x77, 0x70, 0xb0, 0xb6, 0xb2, 0xb0, 0xb0, 0x28, 0xcd, 0xd0, 0xee, 0x27, 0xdf, //* .P3wp.....(...'. */ 
+    /* 0x00000540 */ 0xf5, 0x6b, 0xdf, 0x27, 0x02, 0xfc, 0x91, 0x70, 0x10, 0x69, 0x90, 0x25, 0x2a, 0x8b, 0x8a, 0xac, //* .k.'...p.i.%*... */ 
+    /* 0x00000550 */ 0x38, 0xd6, 0x7d, 0x79, 0x3b, 0x48, 0x91, 0xe0, 0xbf, 0x71, 0x3b, 0xe5, 0xc2, 0x8b, 0x8a, 0xde, //* 8.}y;H...q;..... */ 
+    /* 0x00000560 */ 0x5d, 0xf4, 0x85, 0x4a, 0x4c, 0x65, 0xf0, 0xe7, 0x00, 0x2e, 0x7f, 0x17, 0xab, 0xfe, 0x7d, 0x77, //* ]..JLe........}w */ 
+    /* 0x00000570 */ 0xd8, 0x27, 0x33, 0xe6, 0x48, 0x04, 0x50, 0xda, 0x3d, 0xa0, 0xe6, 0x1e, 0x1e, 0x58, 0x6f, 0x99, //* .'3.H.P.=....Xo. */ 
+    /* 0x00000580 */ 0xd9, 0xd8, 0x0a, 0xa3, 0xa3, 0xd1, 0x41, 0x23, 0x95, 0x55, 0x55, 0x50, 0x37, 0x8e, 0xf2, 0xad, //* ......A#.UUP7... */ 
+    /* 0x00000590 */ 0x9b, 0x69, 0x42, 0xf0, 0x2c, 0xe4, 0xec, 0xfd, 0x82, 0x5d, 0x20, 0x7d, 0x19, 0xde, 0x3c, 0x9b, //* .iB.,....] }..<. */ 
+    /* 0x000005a0 */ 0x4e, 0x85, 0xdc, 0x0f, 0x2f, 0x2f, 0xaf, 0xcc, 0xf7, 0xce, 0xb4, 0xa0, 0xfb, 0x63, 0x63, 0xdd, //* N...//.......cc. */ 
+    /* 0x000005b0 */ 0xfe, 0xe3, 0x37, 0xd7, 0x9b, 0xbd, 0xc1, 0x04, 0x08, 0x81, 0x76, 0x8d, 0xe9, 0x41, 0x34, 0x9c, //* ..7.......v..A4. */ 
+    /* 0x000005c0 */ 0x4c, 0x4c, 0xe1, 0x69, 0x7a, 0x7a, 0x04, 0x08, 0xb1, 0x60, 0x87, 0x8d, 0x0e, 0x39, 0x00, 0x81, //* LL.izz...`...9.. */ 
+    /* 0x000005d0 */ 0x53, 0xf3, 0x6e, 0x9b, 0xcc, 0xf8, 0x1d, 0x5d, 0x58, 0x00, 0x5f, 0x90, 0x97, 0xd7, 0x03, 0xbd, //* S.n....]X._..... */ 
+    /* 0x000005e0 */ 0x5c, 0x63, 0x93, 0xd6, 0x5a, 0x97, 0x5f, 0xc6, 0x28, 0x0b, 0x0b, 0xbd, 0x9c, 0x24, 0x8e, 0xae, //* \c..Z._.(....$.. */ 
+    /* 0x000005f0 */ 0xa6, 0xe6, 0xc0, 0xc5, 0xce, 0x30, 0x7e, 0x4f, 0xec, 0xfe, 0x64, 0xc6, 0xf1, 0x31, 0xd1, 0x65, //* .....0~O..d..1.e */ 
+    /* 0x00000600 */ 0x13, 0xdd, 0x82, 0xe8, 0x85, 0xca, 0x5c, 0x9d, 0x95, 0x82, 0x34, 0x40, 0x07, 0x52, 0x5c, 0x5a, //* ......\...4@.R\Z */ 
+    /* 0x00000610 */ 0x5a, 0x7a, 0xad, 0x91, 0x4b, 0x1c, 0x6a, 0x64, 0x83, 0x2d, 0x80, 0xed, 0xd8, 0xc6, 0x11, 0xdb, //* Zz..K.jd.-...... */ 
+    /* 0x00000620 */ 0xd5, 0x95, 0x07, 0x25, 0x88, 0x66, 0x5f, 0x45, 0x4e, 0x2e, 0xb0, 0xb6, 0xb6, 0xf6, 0x7e, 0x7d, //* ...%.f_EN.....~} */ 
+    /* 0x00000630 */ 0x79, 0x99, 0x04, 0xba, 0xd2, 0x08, 0x0f, 0xce, 0x3e, 0x3a, 0x3a, 0x12, 0x1d, 0x0c, 0xb1, 0xeb, //* y.......>::..... */ 
+    /* 0x00000640 */ 0x33, 0x60, 0x48, 0xd8, 0x9f, 0x14, 0xaf, 0xf1, 0xbf, 0x3e, 0x9c, 0x41, 0x04, 0xfc, 0xed, 0x57, //* 3`H......>.A...W */ 
+    /* 0x00000650 */ 0x9b, 0xae, 0x34, 0xcb, 0x34, 0xd5, 0x8e, 0x8e, 0x48, 0x9d, 0x19, 0x18, 0x18, 0x2e, 0x00, 0xef, //* ..4.4...H....... */ 
+    /* 0x00000660 */ 0xf4, 0x8c, 0x0c, 0xad, 0xd1, 0x5f, 0xda, 0x15, 0xdf, 0x33, 0x32, 0xd0, 0xf1, 0x2d, 0x2c, 0x70, //* ....._...32..-,p */ 
+    /* 0x00000670 */ 0x00, 0x7a, 0x40, 0xee, 0x67, 0x4a, 0x0a, 0x3c, 0x30, 0x36, 0x36, 0x86, 0x01, 0xea, 0xe9, 0xeb, //* .z@.gJ.<066..... */ 
+    /* 0x00000680 */ 0xcb, 0x2f, 0xeb, 0xea, 0x7a, 0x31, 0x05, 0x4c, 0x40, 0x4e, 0x75, 0x35, 0x35, 0xb6, 0xc6, 0x45, //* ./..z1.L@Nu55..E */ 
+    /* 0x00000690 */ 0xb9, 0x64, 0x2f, 0x0c, 0x81, 0x74, 0x1f, 0xe3, 0x76, 0x83, 0x91, 0xb1, 0x53, 0xd3, 0x92, 0x06, //* .d/..t..v...S... */ 
+    /* 0x000006a0 */ 0xc7, 0x75, 0xaa, 0x9d, 0x7a, 0x7a, 0x40, 0x84, 0x16, 0x70, 0x4b, 0xd5, 0x46, 0x0a, 0x92, 0x38, //* .u..zz@..pK.F..8 */ 
+    /* 0x000006b0 */ 0x03, 0x05, 0x2d, 0x2d, 0xa9, 0x01, 0x4f, 0x17, 0xc8, 0x49, 0xf2, 0x0c, 0xbc, 0x74, 0x28, 0x65, //* ..--..O..I...t(e */ 
+    /* 0x000006c0 */ 0xaa, 0xcc, 0x02, 0x0e, 0x6b, 0x02, 0x70, 0xb9, 0x9a, 0xac, 0x37, 0x88, 0x4e, 0x20, 0x09, 0x76, //* ....k.p...7.N .v */ 
+    /* 0x000006d0 */ 0x80, 0xcf, 0x61, 0x3e, 0x64, 0x51, 0x29, 0x1d, 0x4f, 0xc2, 0xb8, 0xf3, 0xf1, 0xc6, 0xfb, 0xf8, //* ..a>dQ).O....... */ 
+    /* 0x000006e0 */ 0xe5, 0x1b, 0xa6, 0x96, 0x33, 0xf7, 0xfb, 0xf7, 0xe6, 0x86, 0x86, 0x1d, 0xd6, 0x22, 0xd3, 0xda, //* ....3........".. */ 
+    /* 0x000006f0 */ 0xe7, 0xf5, 0x07, 0x10, 0x01, 0xb7, 0x11, 0x1c, 0xb8, 0xcd, 0x84, 0x37, 0xd2, 0xa9, 0x39, 0x39, //* ...........7..99 */ 
+    /* 0x00000700 */ 0x1c, 0xc5, 0x7b, 0xbb, 0xbb, 0x4e, 0x4b, 0xa7, 0xeb, 0x9a, 0x15, 0x0b, 0x9a, 0xe8, 0xe9, 0x5c, //* ..{..NK........\ */ 
+    /* 0x00000710 */ 0x7b, 0xbd, 0xc1, 0xc8, 0xf9, 0x00, 0xc8, 0xe9, 0xfa, 0x90, 0xeb, 0xfa, 0xfa, 0x7a, 0xb7, 0xca, //* {............z.. */ 
+    /* 0x00000720 */ 0xa0, 0x39, 0x2d, 0xfb, 0x22, 0x28, 0x52, 0x0e, 0x22, 0x60, 0x7b, 0x6e, 0x0a, 0x27, 0x50, 0xe9, //* .9-."(R."`{n.'P. */ 
+    /* 0x00000730 */ 0x03, 0xcf, 0x6b, 0xfb, 0x79, 0xb5, 0xa9, 0x8a, 0xa0, 0x07, 0x8a, 0x49, 0xce, 0xa7, 0x8a, 0x83, //* ..k.y......I.... */ 
+    /* 0x00000740 */ 0x50, 0x3e, 0x6f, 0xc7, 0x3a, 0x3e, 0x56, 0xba, 0x68, 0xa7, 0xdc, 0x9c, 0x5f, 0x30, 0x88, 0xd6, //* P>o.:>V.h..._0.. */ 
+    /* 0x00000750 */ 0xe5, 0xf1, 0x9c, 0xae, 0x4d, 0x61, 0x29, 0x2f, 0x8f, 0xd6, 0x89, 0x4d, 0x49, 0xdb, 0x08, 0xdf, //* ....Ma)/...MI... */ 
+    /* 0x00000760 */ 0xa6, 0x5f, 0x55, 0x5c, 0x51, 0x51, 0xb1, 0x9c, 0x9e, 0x5f, 0xe0, 0x58, 0x9b, 0x9b, 0x2b, 0x31, //* ._U\QQ..._.X..+1 */ 
+    /* 0x00000770 */ 0xa1, 0xf2, 0xc3, 0x4e, 0x72, 0x33, 0x5e, 0xfc, 0xe5, 0x13, 0x10, 0xd8, 0x76, 0xa7, 0x16, 0x9c, //* ...Nr3^.....v... */ 
+    /* 0x00000780 */ 0xac, 0xdf, 0x68, 0xd7, 0x08, 0xa8, 0x92, 0x91, 0x90, 0x30, 0x6b, 0xaf, 0x55, 0xad, 0x36, 0xeb, //* ..h......0k.U.6. */ 
+    /* 0x00000790 */ 0xaa, 0xeb, 0xcb, 0x07, 0x16, 0xaa, 0x97, 0xed, 0x76, 0x78, 0x5d, 0xa1, 0x80, 0xf1, 0x19, 0x15, //* ........vx]..... */ 
+    /* 0x000007a0 */ 0x4d, 0x95, 0x3d, 0xf8, 0xca, 0xec, 0x31, 0x6d, 0x20, 0x59, 0x74, 0x8d, 0x70, 0x17, 0x37, 0x37, //* M.=...1m Yt.p.77 */ 
+    /* 0x000007b0 */ 0x45, 0x05, 0x05, 0xf0, 0x67, 0xeb, 0xed, 0x1f, 0x93, 0xca, 0x9f, 0x8a, 0x70, 0xe6, 0xed, 0xd4, //* E...g.......p... */ 
+    /* 0x000007c0 */ 0x94, 0xb4, 0x93, 0x93, 0x5d, 0xf6, 0x97, 0x4c, 0x34, 0x56, 0x93, 0x3a, 0xdd, 0x3b, 0x08, 0x83, //* ....]..L4V.:.;.. */ 
+    /* 0x000007d0 */ 0xdb, 0x68, 0x50, 0xde, 0x81, 0x48, 0xd2, 0xd2, 0xd3, 0xa3, 0x0e, 0xb8, 0x79, 0xea, 0x55, 0x55, //* .hP..H......y.UU */ 
+    /* 0x000007e0 */ 0x55, 0x01, 0x54, 0x40, 0x5a, 0x5a, 0xba, 0xc1, 0x7e, 0x95, 0x08, 0x80, 0x75, 0xa5, 0xf6, 0x75, //* U.T@ZZ..~...u..u */ 
+    /* 0x000007f0 */ 0xa3, 0x0e, 0x31, 0x34, 0x34, 0x94, 0x99, 0xe5, 0xdd, 0x87, 0xfe, 0x30, 0xcc, 0x04, 0x3a, 0x48, //* ..144......0..:H */ 
+    /* 0x00000800 */ 0xaf, 0x63, 0xf7, 0x6b, 0x58, 0xd2, 0x14, 0xfb, 0x72, 0xbb, 0x27, 0xb5, 0x90, 0xdb, 0x21, 0x50, //* .c.kX...r.'...!P */ 
+    /* 0x00000810 */ 0xa6, 0x19, 0x74, 0x79, 0xc9, 0x4d, 0x40, 0x40, 0x10, 0x61, 0x25, 0x4f, 0x8f, 0xc7, 0x1c, 0x15, //* ..ty.M@@.a%O.... */ 
+    /* 0x00000820 */ 0x85, 0xf3, 0x6f, 0x13, 0x04, 0xd0, 0x47, 0xa1, 0x3a, 0xe2, 0xbe, 0x16, 0x4a, 0x08, 0x81, 0x6c, //* ..o...G.:...J..l */ 
+    /* 0x00000830 */ 0xe7, 0x1a, 0x3e, 0xcf, 0x09, 0xe9, 0xf3, 0xea, 0xcc, 0xc7, 0x01, 0xe0, 0x20, 0xe0, 0x83, 0x59, //* ..>......... ..Y */ 
+    /* 0x00000840 */ 0xde, 0xbd, 0x51, 0x99, 0x26, 0x1c, 0x70, 0x7d, 0x73, 0xb3, 0x75, 0x7a, 0x1a, 0x57, 0x34, 0x9e, //* ..Q.&.p}s.uz.W4. */ 
+    /* 0x00000850 */ 0x4c, 0x6b, 0xc0, 0xd8, 0x3f, 0x9a, 0xc8, 0x74, 0x31, 0x48, 0x6c, 0x62, 0xfa, 0xd2, 0xf1, 0x70, //* Lk..?..t1Hlb...p */ 
+    /* 0x00000860 */ 0xef, 0x3e, 0x4e, 0xb4, 0xbc, 0xfc, 0x1e, 0x51, 0xee, 0x13, 0xbd, 0x77, 0x8b, 0xef, 0x03, 0x1a, //* .>N....Q...w.... */ 
+    /* 0x00000870 */ 0x37, 0x0f, 0xcf, 0x9b, 0xef, 0x9f, 0x06, 0x5c, 0x66, 0xe7, 0xe6, 0x70, 0x71, 0x71, 0x41, 0x80, //* 7......\f..pqqA. */ 
+    /* 0x00000880 */ 0xe7, 0x60, 0x22, 0x2c, 0xf5, 0x4f, 0x09, 0x3e, 0xf8, 0x08, 0x90, 0x13, 0x13, 0x2f, 0x2f, 0x6f, //* .`",.O.>.....//o */ 
+    /* 0x00000890 */ 0x59, 0x43, 0x83, 0x1b, 0x63, 0x83, 0x6b, 0x14, 0x1a, 0x82, 0x24, 0x4e, 0xa8, 0xaa, 0xae, 0x6e, //* YC..c.k...$N...n */ 
+    /* 0x000008a0 */ 0x44, 0x42, 0x02, 0x8e, 0x44, 0xc5, 0x5f, 0xb8, 0x9e, 0xac, 0x55, 0xcf, 0x5c, 0x55, 0xe6, 0x9a, //* DB..D._...U.\U.. */ 
+    /* 0x000008b0 */ 0x29, 0x3f, 0x4a, 0x76, 0x93, 0xb6, 0x18, 0x6c, 0xf1, 0x93, 0x20, 0x76, 0xa3, 0x36, 0x60, 0x25, //* )?Jv...l.. v.6`% */ 
+    /* 0x000008c0 */ 0xd9, 0x69, 0x6f, 0x8c, 0x90, 0x99, 0x00, 0xed, 0xbd, 0xe3, 0x06, 0x05, 0xfd, 0xa0, 0x8b, 0xe3, //* .io............. */ 
+    /* 0x000008d0 */ 0x46, 0x07, 0x2a, 0x50, 0x64, 0x6d, 0x6d, 0xdd, 0xbb, 0x3d, 0xda, 0x1c, 0x11, 0x20, 0x45, 0xb3, //* F.*Pdmm..=... E. */ 
+    /* 0x000008e0 */ 0x0e, 0x62, 0x13, 0x20, 0x77, 0xc2, 0x52, 0xc1, 0xcb, 0x21, 0x7b, 0xb8, 0xbf, 0xd7, 0xf5, 0x7f, //* .b. w.R..!{..... */ 
+    /* 0x000008f0 */ 0x72, 0x36, 0x01, 0x7a, 0x46, 0x35, 0x4a, 0x06, 0xd8, 0x8b, 0x2b, 0x2b, 0x31, 0x58, 0x93, 0xd0, //* r6.zF5J...++1X.. */ 
+    /* 0x00000900 */ 0x00, 0x27, 0xe8, 0x0a, 0x6f, 0xa6, 0x90, 0x3b, 0x1a, 0xd8, 0x3a, 0x1b, 0x04, 0xc8, 0xca, 0x86, //* .'..o..;..:..... */ 
+    /* 0x00000910 */ 0x71, 0x72, 0x73, 0xe3, 0xa1, 0x3f, 0xef, 0xe2, 0xfb, 0xe8, 0xea, 0xa6, 0xc2, 0x03, 0xa7, 0x1b, //* qrs..?.......... */ 
+    /* 0x00000920 */ 0x9d, 0xe1, 0xa5, 0xa5, 0xb6, 0xbe, 0xb7, 0xbf, 0x6d, 0xcc, 0x8f, 0x13, 0xe4, 0x8b, 0x12, 0x46, //* ........m......F */ 
+    /* 0x00000930 */ 0x2d, 0x61, 0xc3, 0xe2, 0x00, 0x0a, 0x61, 0x43, 0xa2, 0x07, 0x24, 0x76, 0x86, 0x62, 0x8f, 0x01, //* -a....aC..$v.b.. */ 
+    /* 0x00000940 */ 0x5b, 0x74, 0x53, 0x02, 0x30, 0x4b, 0x71, 0x71, 0xf1, 0x59, 0x74, 0xe8, 0x4b, 0xfc, 0x66, 0x97, //* [tS.0Kqq.Yt.K.f. */ 
+    /* 0x00000950 */ 0x69, 0x2f, 0x5c, 0x72, 0x85, 0xe6, 0x76, 0x6e, 0x46, 0x12, 0xc3, 0x4e, 0xd8, 0x4d, 0x37, 0x0e, //* i/\r..vnF..N.M7. */ 
+    /* 0x00000960 */ 0x70, 0x07, 0x5d, 0x65, 0xc2, 0x9a, 0x56, 0xc9, 0x16, 0x31, 0xfb, 0xfa, 0xf5, 0x2b, 0x21, 0xaf, //* p.]e..V..1...+!. */ 
+    /* 0x00000970 */ 0x36, 0xed, 0x77, 0x1c, 0x00, 0x0a, 0x85, 0x92, 0x92, 0x91, 0xf5, 0x0d, 0xc5, 0x92, 0xe3, 0x03, //* 6.w............. */ 
+    /* 0x00000980 */ 0xfc, 0x5f, 0x97, 0x25, 0x7e, 0x4c, 0x4c, 0x4c, 0xec, 0x6e, 0x0f, 0x2a, 0xa4, 0x26, 0x25, 0x31, //* ._.%~LLL.n.*.&%1 */ 
+    /* 0x00000990 */ 0x60, 0x1d, 0x12, 0x1e, 0x1b, 0x22, 0x63, 0x51, 0xd0, 0x00, 0x7f, 0x8f, 0x8f, 0x53, 0x48, 0x49, //* `...."cQ.....SHI */ 
+    /* 0x000009a0 */ 0x48, 0x28, 0x96, 0xe6, 0xe6, 0x84, 0x51, 0x37, 0x49, 0xc1, 0x75, 0x53, 0x59, 0xc2, 0xf5, 0x7a, //* H(....Q7I.uSY..z */ 
+    /* 0x000009b0 */ 0xf5, 0xd6, 0x08, 0x09, 0x33, 0x2d, 0xce, 0x3b, 0x77, 0x6e, 0x8e, 0x8f, 0x46, 0xfb, 0xbb, 0x5d, //* ....3-.;wn..F..] */ 
+    /* 0x000009c0 */ 0x7e, 0xff, 0x5e, 0xd4, 0xf5, 0xac, 0xac, 0xac, 0xd6, 0x9a, 0xdc, 0xc9, 0x41, 0x4e, 0x3b, 0xc5, //* ~.^.........AN;. */ 
+    /* 0x000009d0 */ 0x4a, 0x6e, 0xce, 0xce, 0x5b, 0x71, 0x94, 0xc2, 0x02, 0x3b, 0xc7, 0xa4, 0xd7, 0x82, 0xfb, 0xfd, //* Jn..[q...;...... */ 
+    /* 0x000009e0 */ 0x47, 0x3c, 0xd6, 0x9a, 0xb8, 0x13, 0x3d, 0x81, 0xf0, 0xdf, 0xce, 0x36, 0x44, 0xfd, 0xaf, 0x67, //* G<....=....6D..g */ 
+    /* 0x000009f0 */ 0x3e, 0x22, 0x48, 0xf0, 0xf3, 0xf3, 0x2b, 0x91, 0xae, 0x36, 0x71, 0xb1, 0xb3, 0xc7, 0xd1, 0x97, //* >"H...+..6q..... */ 
+    /* 0x00000a00 */ 0xa9, 0x7f, 0xde, 0x67, 0xa4, 0x27, 0x35, 0x92, 0x73, 0x4f, 0x96, 0x2f, 0xda, 0xb6, 0x81, 0x1d, //* ...g.'5.sO./.... */ 
+    /* 0x00000a10 */ 0x0d, 0x0d, 0x0d, 0xa9, 0x33, 0x26, 0x72, 0x71, 0x71, 0x7d, 0x87, 0xf1, 0x84, 0x0e, 0xbc, 0xd0, //* ....3&rqq}...... */ 
+    /* 0x00000a20 */ 0xc6, 0xff, 0xcc, 0x8e, 0xef, 0xff, 0x49, 0xd8, 0x53, 0xb5, 0x62, 0x61, 0x62, 0x72, 0xb2, 0xa0, //* ......I.S.babr.. */ 
+    /* 0x00000a30 */ 0xae, 0x32, 0x86, 0x3e, 0x2d, 0x27, 0x07, 0x82, 0x8a, 0xcf, 0x18, 0x91, 0xd4, 0xe8, 0xf6, 0x9b, //* .2.>-'.......... */ 
+    /* 0x00000a40 */ 0xdb, 0xda, 0xd2, 0xfa, 0xf2, 0xf7, 0x95, 0x0d, 0x46, 0xbb, 0x47, 0x2c, 0x2e, 0x3f, 0xad, 0xc0, //* ........F.G,.?.. */ 
+    /* 0x00000a50 */ 0x41, 0xfb, 0x19, 0x0a, 0x38, 0x2e, 0x2e, 0xce, 0xf7, 0xf1, 0x1a, 0xf5, 0x63, 0x2c, 0xd9, 0x07, //* A...8.......c,.. */ 
+    /* 0x00000a60 */ 0x80, 0x42, 0xe4, 0x1b, 0x67, 0x3c, 0xa5, 0xf0, 0x90, 0xb0, 0xa7, 0xf9, 0xa7, 0x1f, 0xfa, 0x82, //* .B..g<.......... */ 
+    /* 0x00000a70 */ 0xf5, 0x85, 0x85, 0xa9, 0x29, 0xec, 0x46, 0xf9, 0x8d, 0x8d, 0xbc, 0x20, 0x55, 0x15, 0x15, 0x15, //* ....).F.... U... */ 
+    /* 0x00000a80 */ 0xb6, 0x57, 0x88, 0xf8, 0xab, 0xa5, 0xd7, 0x83, 0xc2, 0x4d, 0x2a, 0xbd, 0x4e, 0xb5, 0xa1, 0x1c, //* .W.......M*.N... */ 
+    /* 0x00000a90 */ 0xb0, 0xe4, 0xee, 0xf8, 0xa8, 0x74, 0xa1, 0x12, 0xf3, 0x26, 0xfe, 0xf2, 0xea, 0x0a, 0x64, 0xdf, //* .....t...&....d. */ 
+    /* 0x00000aa0 */ 0x9d, 0x9d, 0x98, 0x18, 0xbb, 0x33, 0x1c, 0x4f, 0xd7, 0x4d, 0x43, 0x0d, 0x03, 0x37, 0x95, 0xcf, //* .....3.O.MC..7.. */ 
+    /* 0x00000ab0 */ 0x3e, 0x3d, 0xd5, 0x79, 0xc0, 0x86, 0x4e, 0x22, 0xf0, 0x93, 0x7f, 0x76, 0x8c, 0x2c, 0x26, 0x79, //* >=.y..N"...v.,&y */ 
+    /* 0x00000ac0 */ 0xcf, 0xd8, 0x18, 0xda, 0x97, 0xc5, 0xea, 0xc1, 0x7b, 0x54, 0x13, 0x1a, 0x71, 0x71, 0xea, 0xc7, //* ........{T..qq.. */ 
+    /* 0x00000ad0 */ 0x47, 0x6f, 0x4e, 0x9e, 0xb9, 0xd2, 0xb1, 0xfd, 0xfd, 0xfd, 0x52, 0xad, 0x0a, 0xa2, 0xbf, 0x8b, //* GoN.......R..... */ 
+    /* 0x00000ae0 */ 0x8d, 0x60, 0x45, 0xc6, 0xfe, 0x7a, 0x1b, 0x39, 0x01, 0xd7, 0x7d, 0x8c, 0x7d, 0xc8, 0x2b, 0x55, //* .`E..z.9..}.}.+U */ 
+    /* 0x00000af0 */ 0x8e, 0xff, 0x23, 0xcb, 0xec, 0xec, 0x6c, 0x6e, 0x49, 0x09, 0x13, 0xbb, 0x62, 0xb5, 0x61, 0x2b, //* ..#...lnI...b.a+ */ 
+    /* 0x00000b00 */ 0x9e, 0xc5, 0x50, 0x4c, 0x60, 0x57, 0x97, 0x18, 0xac, 0x5a, 0x9e, 0x2a, 0x33, 0x90, 0x6b, 0x6e, //* ..PL`W...Z.*3.kn */ 
+    /* 0x00000b10 */ 0xe8, 0x2d, 0x28, 0xd0, 0x19, 0x9d, 0x9a, 0x96, 0xa6, 0x07, 0x57, 0x83, 0xcc, 0x89, 0xd8, 0x03, //* .-(.......W..... */ 
+    /* 0x00000b20 */ 0xcf, 0xc4, 0xc4, 0x44, 0x44, 0x4c, 0x1c, 0xad, 0xb2, 0x37, 0x57, 0xa2, 0xd2, 0x6a, 0xbf, 0xca, //* ...DDL...7W..j.. */ 
+    /* 0x00000b30 */ 0xb7, 0x7f, 0x70, 0xc0, 0x43, 0x47, 0x27, 0xed, 0x9b, 0x6e, 0x41, 0x3d, 0x70, 0x69, 0xe7, 0xc4, //* ..p.CG'..nA=pi.. */ 
+    /* 0x00000b40 */ 0x79, 0xb6, 0x1e, 0x6d, 0x26, 0x7f, 0xc9, 0xb3, 0xd1, 0xe5, 0x1a, 0x4e, 0x4f, 0x8a, 0x8f, 0xdf, //* y..m&......NO... */ 
+    /* 0x00000b50 */ 0xcf, 0x6e, 0x24, 0xb6, 0x5b, 0x7f, 0x20, 0x47, 0xf1, 0x3a, 0xf8, 0x6d, 0x2a, 0x83, 0x3f, 0xc5, //* .n$.[. G.:.m*.?. */ 
+    /* 0x00000b60 */ 0xf3, 0x74, 0x6d, 0x1f, 0xc3, 0xbe, 0x79, 0xb1, 0x4c, 0x83, 0xa9, 0x96, 0xf0, 0xa9, 0x82, 0x8e, //* .tm...y.L....... */ 
+    /* 0x00000b70 */ 0x95, 0x35, 0x6a, 0xde, 0x23, 0xc9, 0x06, 0x92, 0x6d, 0xa5, 0xa6, 0x86, 0xab, 0xc5, 0x4a, 0x98, //* .5j.#...m.....J. */ 
+    /* 0x00000b80 */ 0xc2, 0xa6, 0x27, 0x05, 0x15, 0x7b, 0x16, 0xef, 0xfb, 0xe2, 0xf8, 0x26, 0x39, 0x39, 0x19, 0x0b, //* ..'..{.....&99.. */ 
+    /* 0x00000b90 */ 0x11, 0x11, 0x11, 0x9b, 0xe6, 0x3b, 0xd2, 0x52, 0x99, 0xc5, 0x5f, 0xc4, 0xdc, 0xaa, 0x94, 0x14, //* .....;.R.._..... */ 
+    /* 0x00000ba0 */ 0x62, 0x18, 0xdb, 0x11, 0x24, 0x0a, 0x78, 0x7f, 0xff, 0xfe, 0xdd, 0x3b, 0x33, 0x53, 0x2b, 0x05, //* b...$.x....;3S+. */ 
+    /* 0x00000bb0 */ 0x2f, 0x75, 0x30, 0x95, 0x05, 0x02, 0xea, 0x2a, 0xd9, 0x2c, 0x0b, 0x4b, 0xfa, 0x61, 0xdd, 0x23, //* /u0....*.,.K.a.# */ 
+    /* 0x00000bc0 */ 0x86, 0x86, 0x7e, 0x7b, 0x3a, 0xe4, 0x02, 0x72, 0xdd, 0x33, 0x16, 0xef, 0xe7, 0xb7, 0x34, 0x98, //* ..~{:..r.3....4. */ 
+    /* 0x00000bd0 */ 0x93, 0xac, 0x0e, 0xe7, 0xda, 0x89, 0xf7, 0x27, 0xb2, 0xe0, 0x1d, 0xcf, 0xa4, 0xcf, 0xaf, 0xaf, //* .......'........ */ 
+    /* 0x00000be0 */ 0x11, 0x80, 0xb5, 0xce, 0x8a, 0x34, 0xf3, 0x4f, 0x45, 0x1c, 0x07, 0xd4, 0x49, 0x47, 0x1b, 0x9d, //* .....4.OE...IG.. */ 
+    /* 0x00000bf0 */ 0xc2, 0x5f, 0x33, 0x78, 0xe1, 0x81, 0xb5, 0x98, 0x0e, 0x54, 0x74, 0x74, 0xf4, 0xf9, 0x72, 0x2d, //* ._3x.....Ttt..r- */ 
+    /* 0x00000c00 */ 0x74, 0x58, 0xc9, 0x88, 0xa8, 0x28, 0x38, 0x70, 0xca, 0xf1, 0x3f, 0xc7, 0xd4, 0x25, 0xf6, 0x84, //* tX...(8p..?..%.. */ 
+    /* 0x00000c10 */ 0x93, 0x93, 0x13, 0xc2, 0xb7, 0xda, 0x95, 0xb6, 0x09, 0x99, 0x4f, 0x14, 0x17, 0x17, 0xce, 0x2d, //* ..........O....- */ 
+    /* 0x00000c20 */ 0xae, 0x07, 0x58, 0x22, 0xa2, 0xa2, 0xb5, 0x6e, 0x47, 0xea, 0xf7, 0xf7, 0xf7, 0xb9, 0x85, 0x85, //* ..X"...nG....... */ 
+    /* 0x00000c30 */ 0x08, 0xc0, 0x74, 0x9b, 0xfb, 0x17, 0xdf, 0xcb, 0x51, 0xa6, 0xf3, 0xdb, 0x5b, 0x59, 0x6b, 0x6b, //* ..t.....Q...[Ykk */ 
+    /* 0x00000c40 */ 0x46, 0x60, 0xb3, 0x2f, 0x34, 0xfa, 0x93, 0x9c, 0x1c, 0x08, 0x75, 0xad, 0x05, 0x37, 0xf2, 0x63, //* F`./4.....u..7.c */ 
+    /* 0x00000c50 */ 0x3c, 0x3e, 0x0e, 0x29, 0x21, 0x2a, 0x9d, 0x34, 0x5d, 0x83, 0xfd, 0x1c, 0x52, 0x18, 0x52, 0x58, //* <>.)!*.4]...R.RX */ 
+    /* 0x00000c60 */ 0x2a, 0xd7, 0xce, 0x17, 0x04, 0x13, 0xcc, 0xa1, 0xe4, 0x77, 0x06, 0xff, 0xcd, 0xfd, 0xa5, 0x5a, //* *........w.....Z */ 
+    /* 0x00000c70 */ 0x93, 0x35, 0x94, 0x06, 0x07, 0xa8, 0xb1, 0x9d, 0xa1, 0x35, 0x6c, 0x75, 0x41, 0xdc, 0xd8, 0xd8, //* .5.......5luA... */ 
+    /* 0x00000c80 */ 0x00, 0xc0, 0xd6, 0x93, 0xe9, 0x79, 0x1e, 0xd0, 0x15, 0x66, 0x56, 0x56, 0x29, 0xb7, 0xeb, 0x77, //* .....y...fVV)..w */ 
+    /* 0x00000c90 */ 0x17, 0xa0, 0x16, 0xcf, 0x33, 0xaa, 0x6a, 0xe3, 0x4e, 0xb4, 0x32, 0xcd, 0x15, 0x19, 0xda, 0xef, //* ....3.j.N.2..... */ 
+    /* 0x00000ca0 */ 0x31, 0x48, 0x9c, 0x23, 0xf3, 0xf3, 0xd7, 0x59, 0x06, 0xe5, 0xdd, 0xee, 0x5b, 0x7d, 0x88, 0xb5, //* 1H.#...Y....[}.. */ 
+    /* 0x00000cb0 */ 0x3e, 0xe5, 0x34, 0xbc, 0xbc, 0x49, 0xe2, 0x2f, 0xf7, 0x74, 0x4c, 0xca, 0x99, 0x23, 0x57, 0x07, //* >.4..I./.tL..#W. */ 
+    /* 0x00000cc0 */ 0x10, 0x9e, 0x37, 0x6f, 0x02, 0x23, 0x23, 0x55, 0x5a, 0x9c, 0xb6, 0x82, 0xd0, 0x6e, 0x12, 0x81, //* ..7o.##UZ....n.. */ 
+    /* 0x00000cd0 */ 0xe5, 0x22, 0x05, 0xe2, 0xa9, 0x6c, 0xd1, 0x0c, 0x49, 0xc9, 0x40, 0x36, 0x76, 0x96, 0xe2, 0x8c, //* ."...l..I.@6v... */ 
+    /* 0x00000ce0 */ 0x55, 0x32, 0x6b, 0x6b, 0xab, 0xcb, 0x9e, 0xde, 0xe0, 0x9f, 0xa3, 0x96, 0xbe, 0xb7, 0x27, 0x7a, //* U2kk..........'z */ 
+    /* 0x00000cf0 */ 0x49, 0xd5, 0x9f, 0x58, 0x93, 0xa2, 0xca, 0xb9, 0x80, 0x6c, 0xf1, 0x80, 0xec, 0xbd, 0xbd, 0xbd, //* I..X.....l...... */ 
+    /* 0x00000d00 */ 0x9f, 0x56, 0xa3, 0xa9, 0x89, 0x89, 0xfd, 0x20, 0x78, 0xa4, 0xe9, 0x99, 0x99, 0xef, 0x1f, 0x06, //* .V..... x....... */ 
+    /* 0x00000d10 */ 0x3f, 0x60, 0xa0, 0xa3, 0x5b, 0x2c, 0xf3, 0x4e, 0x9a, 0x5b, 0x49, 0x4a, 0x82, 0xba, 0x9f, 0x2e, //* ?`..[,.N.[IJ.... */ 
+    /* 0x00000d20 */ 0xc7, 0xbb, 0xdd, 0xec, 0x01, 0xf9, 0x89, 0x89, 0x09, 0x2c, 0x5d, 0x03, 0x03, 0x9d, 0xf6, 0xf5, //* .........,]..... */ 
+    /* 0x00000d30 */ 0xe1, 0x80, 0x0f, 0xf3, 0xad, 0xae, 0xa0, 0xc2, 0x45, 0x6e, 0x7a, 0x06, 0x86, 0x24, 0x56, 0xe8, //* ........Enz..$V. */ 
+    /* 0x00000d40 */ 0xed, 0x17, 0x33, 0xb3, 0x37, 0x36, 0x7e, 0x3c, 0x0a, 0xcd, 0x70, 0xf7, 0xcf, 0x77, 0x7f, 0xe6, //* ..3.76~<..p..w.. */ 
+    /* 0x00000d50 */ 0x36, 0x5e, 0xf0, 0xe1, 0x72, 0x5b, 0x43, 0x05, 0x6d, 0xa6, 0x1e, 0xc3, 0x54, 0xf0, 0x13, 0x53, //* 6^..r[C.m...T..S */ 
+    /* 0x00000d60 */ 0x53, 0x4c, 0x7a, 0x0a, 0x0b, 0xe9, 0xdb, 0x7e, 0x19, 0x0c, 0x17, 0x8d, 0x27, 0xab, 0xe5, 0xa9, //* SLz....~....'... */ 
+    /* 0x00000d70 */ 0x46, 0xb8, 0xa2, 0x97, 0xc9, 0x48, 0x49, 0x4b, 0xf7, 0xfb, 0xdc, 0xfc, 0x5d, 0xa8, 0x5f, 0x5a, //* F....HIK....]._Z */ 
+    /* 0x00000d80 */ 0x5a, 0x8a, 0x87, 0xef, 0xd1, 0x28, 0x79, 0xfa, 0xf4, 0xa3, 0xb5, 0xb5, 0xf5, 0x5a, 0x7c, 0x47, //* Z....(y......Z|G */ 
+    /* 0x00000d90 */ 0x25, 0x49, 0x7e, 0x70, 0x6f, 0x3c, 0x05, 0x1f, 0x70, 0xfc, 0xd3, 0xda, 0xff, 0x8c, 0x7c, 0xab, //* %I~po<..p.....|. */ 
+    /* 0x00000da0 */ 0x51, 0xa6, 0x59, 0x57, 0x58, 0x18, 0x92, 0xc1, 0xef, 0xc8, 0x08, 0xdc, 0x9e, 0xce, 0x65, 0x18, //* Q.YWX.........e. */ 
+    /* 0x00000db0 */ 0x1b, 0x6f, 0x74, 0xf8, 0xfd, 0xe3, 0x3b, 0xfb, 0xd3, 0xad, 0x42, 0x9c, 0xa2, 0x85, 0x20, 0x61, //* .ot...;...B... a */ 
+    /* 0x00000dc0 */ 0x61, 0x61, 0xa1, 0xc4, 0xe3, 0x3d, 0xd9, 0x71, 0xcb, 0x8e, 0x2e, 0xb1, 0x56, 0xf0, 0x31, 0x1e, //* aa...=.q....V.1. */ 
+    /* 0x00000dd0 */ 0x80, 0xde, 0xda, 0xd9, 0xd9, 0xa1, 0x61, 0x79, 0xf9, 0xec, 0x1c, 0xcd, 0x95, 0x94, 0x6a, 0x94, //* ......ay......j. */ 
+    /* 0x00000de0 */ 0x60, 0xf9, 0xdf, 0xbf, 0x20, 0xaf, 0x3f, 0xb5, 0xf8, 0xf0, 0x23, 0x99, 0xf8, 0x5e, 0x20, 0x02, //* `... .?...#..^ . */ 
+    /* 0x00000df0 */ 0xa6, 0xd7, 0xa5, 0x33, 0x87, 0x37, 0x6a, 0x2a, 0xef, 0x3f, 0xaf, 0x21, 0xdc, 0x9d, 0x0e, 0x6d, //* ...3.7j*.?.!...m */ 
+    /* 0x00000e00 */ 0x9a, 0x9b, 0xd2, 0x78, 0x40, 0xd7, 0x22, 0x67, 0x67, 0xd5, 0x51, 0x82, 0x68, 0xd8, 0xcb, 0x3e, //* ...x@."gg.Q.h..> */ 
+    /* 0x00000e10 */ 0x15, 0xce, 0xb2, 0xd1, 0xd1, 0x15, 0x6c, 0xb9, 0xb4, 0x8a, 0xc8, 0x14, 0xa9, 0x1f, 0x61, 0x92, //* ......l.......a. */ 
+    /* 0x00000e20 */ 0x72, 0x23, 0x3c, 0x3f, 0xde, 0xc0, 0x03, 0x32, 0xb2, 0xb2, 0xf9, 0x6a, 0x05, 0xb2, 0xd3, 0x73, //* r#<?...2...j...s */ 
+    /* 0x00000e30 */ 0x73, 0xf8, 0x36, 0x77, 0xe2, 0x2f, 0xe7, 0xf0, 0x18, 0xd7, 0x98, 0x17, 0xd7, 0x47, 0x1a, 0x95, //* s.6w./.......G.. */ 
+    /* 0x00000e40 */ 0xba, 0xb5, 0x70, 0xe8, 0xc4, 0xec, 0x03, 0xdb, 0x0c, 0x0a, 0x4e, 0xbb, 0x23, 0xb8, 0xd7, 0xc7, //* ..p.......N.#... */ 
+    /* 0x00000e50 */ 0x4b, 0xd8, 0x43, 0x43, 0x43, 0xb6, 0x7f, 0xba, 0x44, 0xc9, 0x78, 0xed, 0x50, 0x00, 0x86, 0xc7, //* K.CCC...D.x.P... */ 
+    /* 0x00000e60 */ 0xc7, 0x47, 0x0e, 0x1d, 0x96, 0x0a, 0x41, 0x8b, 0xd5, 0xe6, 0x33, 0x18, 0x8e, 0xf3, 0xac, 0xeb, //* .G....A...3..... */ 
+    /* 0x00000e70 */ 0x49, 0xe1, 0xe1, 0xc8, 0xf1, 0x54, 0xa2, 0x63, 0xd7, 0xd7, 0x6e, 0xfe, 0x55, 0x7a, 0x58, 0x25, //* I....T.c..n.UzX% */ 
+    /* 0x00000e80 */ 0x32, 0xb4, 0xb8, 0x4c, 0xf6, 0xe4, 0xfc, 0x0e, 0x85, 0xf5, 0xf5, 0x3c, 0x29, 0xef, 0xfe, 0xa5, //* 2..L.......<)... */ 
+    /* 0x00000e90 */ 0x85, 0x63, 0x53, 0xe7, 0xcb, 0x17, 0xe5, 0xeb, 0x57, 0x59, 0x6b, 0x6b, 0x13, 0x61, 0x53, 0x08, //* .cS.....WYkk.aS. */ 
+    /* 0x00000ea0 */ 0xf4, 0xc4, 0x66, 0xf0, 0x71, 0xd1, 0xd1, 0x05, 0x37, 0x35, 0x35, 0x11, 0xaa, 0x9c, 0x7f, 0x05, //* ..f.q...755..... */ 
+    /* 0x00000eb0 */ 0x4a, 0x8d, 0xda, 0x9b, 0x50, 0xc1, 0x32, 0x3a, 0x3a, 0x3a, 0x68, 0xf4, 0x84, 0x83, 0x1f, 0xdc, //* J...P.2:::h..... */ 
+    /* 0x00000ec0 */ 0xdc, 0x8d, 0xfa, 0x9f, 0xfa, 0xa4, 0x88, 0x08, 0x08, 0x60, 0xf5, 0xbf, 0x9b, 0x2b, 0x7c, 0xfd, //* .........`...+|. */ 
+    /* 0x00000ed0 */ 0xd3, 0x25, 0x9d, 0x94, 0xdc, 0xea, 0xf8, 0xea, 0x7f, 0x2a, 0xee, 0x04, 0x1e, 0xf6, 0xf5, 0x65, //* .%.......*.....e */ 
+    /* 0x00000ee0 */ 0x49, 0x39, 0xe0, 0x86, 0x51, 0x24, 0x96, 0x9c, 0xff, 0x0d, 0x98, 0xae, 0x2d, 0xa0, 0x7c, 0x65, //* I9..Q$......-.|e */ 
+    /* 0x00000ef0 */ 0xb6, 0x58, 0x89, 0x1c, 0x1f, 0xc0, 0x4e, 0xe1, 0x30, 0x99, 0xca, 0xcf, 0xa7, 0x55, 0x63, 0x0e, //* .X....N.0....Uc. */ 
+    /* 0x00000f00 */ 0xa2, 0xe1, 0x14, 0x13, 0xcb, 0x16, 0xf6, 0x38, 0xd9, 0x9c, 0xce, 0x93, 0xae, 0xd0, 0xc4, 0x00, //* .......8........ */ 
+    /* 0x00000f10 */ 0xc8, 0x48, 0x49, 0xb9, 0x38, 0xcf, 0x69, 0xa5, 0xa5, 0x83, 0x05, 0xbf, 0x2e, 0x73, 0x66, 0x0b, //* .HI.8.i......sf. */ 
+    /* 0x00000f20 */ 0xee, 0xa8, 0x84, 0x4a, 0x49, 0xfe, 0xe8, 0xf8, 0x76, 0x41, 0x8b, 0xed, 0xed, 0x73, 0xb1, 0xd5, //* ...JI...vA...s.. */ 
+    /* 0x00000f30 */ 0x1f, 0x4e, 0x18, 0x34, 0x51, 0x6a, 0xd2, 0xdd, 0x85, 0x08, 0xbc, 0xb7, 0x9d, 0xee, 0xc1, 0xe9, //* .N.4Qj.......... */ 
+    /* 0x00000f40 */ 0xe9, 0xcf, 0x49, 0x61, 0x67, 0x90, 0x33, 0xee, 0xf6, 0xcf, 0xb2, 0x69, 0x34, 0xda, 0xe7, 0xfa, //* ..Iag.3....i4... */ 
+    /* 0x00000f50 */ 0x63, 0x61, 0xfe, 0x30, 0x35, 0x35, 0x45, 0x21, 0xe0, 0x94, 0x7b, 0xef, 0x77, 0xf9, 0x93, 0x45, //* ca.055E!..{.w..E */ 
+    /* 0x00000f60 */ 0xc4, 0x75, 0x1f, 0x63, 0x6e, 0x6e, 0xae, 0x01, 0x5b, 0x49, 0x7f, 0x50, 0xdb, 0x29, 0xad, 0xa8, //* .u.cnn..[I.P.).. */ 
+    /* 0x00000f70 */ 0x68, 0x8f, 0xfc, 0xa8, 0x7a, 0x83, 0x84, 0x88, 0x88, 0xa8, 0x00, 0x70, 0x5a, 0x28, 0xd7, 0x52, //* h...z......pZ(.R */ 
+    /* 0x00000f80 */ 0x54, 0x52, 0x20, 0xf4, 0x84, 0x5b, 0x08, 0x92, 0x08, 0x08, 0x08, 0x80, 0xcb, 0x85, 0x4d, 0x27, //* TR ..[........M' */ 
+    /* 0x00000f90 */ 0x58, 0x3a, 0xa8, 0xd5, 0xf5, 0x40, 0xd9, 0x99, 0xaa, 0xce, 0xf1, 0x55, 0x2c, 0x7b, 0xb1, 0x18, //* X:...@.....U,{.. */ 
+    /* 0x00000fa0 */ 0x7e, 0x73, 0xbe, 0x4c, 0xe3, 0x68, 0x7f, 0x7f, 0x88, 0xaf, 0x6a, 0xf5, 0x7c, 0x76, 0x6f, 0xbc, //* ~s.L.h....j.|vo. */ 
+    /* 0x00000fb0 */ 0xc3, 0x79, 0x07, 0x09, 0x34, 0xdd, 0xd3, 0x23, 0xe1, 0xb9, 0xe1, 0xd4, 0x53, 0xdd, 0x4a, 0xd9, //* .y..4..#....S.J. */ 
+    /* 0x00000fc0 */ 0x4f, 0x47, 0x7b, 0xb8, 0xb5, 0xd5, 0x4b, 0x9c, 0x96, 0x26, 0x02, 0x0d, 0x90, 0x65, 0x2b, 0xb1, //* OG{...K..&...e+. */ 
+    /* 0x00000fd0 */ 0x1a, 0x4f, 0x7e, 0xba, 0x82, 0x88, 0xa3, 0x82, 0x77, 0x86, 0x03, 0x7a, 0x17, 0xab, 0x56, 0x9d, //* .O~.....w..z..V. */ 
+    /* 0x00000fe0 */ 0x8e, 0x9b, 0xa0, 0x3f, 0xc7, 0x5d, 0x59, 0x52, 0xc6, 0x49, 0xa9, 0xa8, 0xa6, 0xde, 0xac, 0xd8, //* ...?.]YR.I...... */ 
+    /* 0x00000ff0 */ 0x5b, 0xb8, 0xba, 0x5e, 0xf1, 0x0a, 0x59, 0x75, 0x6b, 0xbf, 0x18, 0xab, 0x05, 0x60, 0xea, 0xea, //* [..^..Yuk....`.. */ 
+    /* 0x00001000 */ 0xea, 0x2a, 0x8e, 0x8d, 0x8f, 0x5f, 0x9d, 0xae, 0x34, 0x56, 0xb8, 0xcd, 0x16, 0xca, 0x71, 0xf2, //* .*..._..4V....q. */ 
+    /* 0x00001010 */ 0xf2, 0x7e, 0x78, 0xea, 0xff, 0xf6, 0xd4, 0xb6, 0xa7, 0x93, 0x29, 0xe0, 0x0c, 0xc7, 0xc8, 0xc8, //* .~x.......)..... */ 
+    /* 0x00001020 */ 0xc8, 0xc9, 0xcd, 0x2d, 0x95, 0x23, 0xe6, 0x97, 0x90, 0x9a, 0x1a, 0xd1, 0x64, 0xbf, 0x6a, 0xde, //* ...-.#......d.j. */ 
+    /* 0x00001030 */ 0x78, 0x6c, 0xb7, 0xd6, 0x4d, 0x1d, 0xbd, 0xd3, 0xd5, 0xd5, 0x36, 0xf8, 0x66, 0xdf, 0x01, 0xa3, //* xl..M.....6.f... */ 
+    /* 0x00001040 */ 0xae, 0xce, 0xd2, 0xc9, 0xcd, 0x09, 0xfc, 0xfd, 0xbb, 0x5a, 0x83, 0x7a, 0xd9, 0x89, 0xf1, 0x77, //* .........Z.z...w */ 
+    /* 0x00001050 */ 0xed, 0x6e, 0xff, 0xe7, 0x38, 0x41, 0x41, 0x41, 0x7e, 0x20, 0x55, 0x31, 0x53, 0x00, 0x97, 0x91, //* .n..8AAA~ U1S... */ 
+    /* 0x00001060 */ 0x71, 0x08, 0x05, 0xbd, 0x3d, 0x6e, 0xb1, 0xca, 0x60, 0x6b, 0x22, 0x8d, 0xe7, 0xfe, 0xe5, 0xdf, //* q...=n..`k"..... */ 
+    /* 0x00001070 */ 0x99, 0x99, 0x8d, 0x4d, 0xf8, 0x53, 0x87, 0xef, 0xcf, 0x9f, 0xac, 0xb5, 0x0e, 0xeb, 0xfa, 0x00, //* ...M.S.......... */ 
+    /* 0x00001080 */ 0x38, 0x6b, 0x1d, 0xd9, 0x76, 0xb6, 0x10, 0xb7, 0xda, 0xa8, 0x1d, 0x09, 0xe0, 0xe4, 0xe2, 0x8a, //* 8k..v........... */ 
+    /* 0x00001090 */ 0xac, 0x34, 0x68, 0x3e, 0x65, 0x3a, 0x3a, 0x3a, 0x4a, 0xf7, 0x03, 0x7b, 0x62, 0xa2, 0xa3, 0x47, //* .4h>e:::J..{b..G */ 
+    /* 0x000010a0 */ 0x97, 0x11, 0xaa, 0x7c, 0xde, 0xeb, 0x5f, 0x5d, 0xcd, 0xb0, 0x6b, 0x4c, 0x5f, 0xaa, 0x0e, 0x75, //* ...|.._]..kL_..u */ 
+    /* 0x000010b0 */ 0xde, 0x19, 0x8a, 0x85, 0x0d, 0x6d, 0x2f, 0xe9, 0xad, 0x4e, 0x8b, 0xd5, 0x15, 0x91, 0x5a, 0x68, //* .....m/..N....Zh */ 
+    /* 0x000010c0 */ 0xd2, 0x27, 0x7a, 0xad, 0xf9, 0xdf, 0x36, 0x90, 0xec, 0xc8, 0xaa, 0xf1, 0xe5, 0x65, 0xdd, 0xe6, //* .'z...6......e.. */ 
+    /* 0x000010d0 */ 0xd0, 0x5c, 0x0f, 0xe8, 0xca, 0x1f, 0xed, 0x5d, 0xfb, 0xe5, 0x9a, 0x37, 0x90, 0x2c, 0xe1, 0xe1, //* .\.....]...7.,.. */ 
+    /* 0x000010e0 */ 0x5a, 0x8b, 0x61, 0x3c, 0xe0, 0x3f, 0xce, 0x25, 0x4c, 0xe3, 0xbc, 0xc0, 0x46, 0x83, 0xd0, 0x13, //* Z.a<.?.%L...F... */ 
+    /* 0x000010f0 */ 0x89, 0xcf, 0xe4, 0x7c, 0xb5, 0x3f, 0xe9, 0xe6, 0xea, 0xba, 0x63, 0x1a, 0x0b, 0x42, 0x00, 0x4d, //* ...|.?....c..B.M */ 
+    /* 0x00001100 */ 0xf7, 0xf5, 0x99, 0x07, 0x3a, 0xb4, 0x9e, 0x11, 0x24, 0x27, 0x27, 0x2b, 0x5d, 0x5f, 0x17, 0xa2, //* ....:...$''+]_.. */ 
+    /* 0x00001110 */ 0x19, 0x05, 0x76, 0xbc, 0x76, 0x51, 0xee, 0x6c, 0xf3, 0xbe, 0x6d, 0xe0, 0xd6, 0x23, 0xba, 0x83, //* ..v.vQ.l..m..#.. */ 
+    /* 0x00001120 */ 0xae, 0x0e, 0x1f, 0x1e, 0xda, 0x66, 0x0b, 0xb9, 0x97, 0x47, 0x71, 0xb2, 0x22, 0xcc, 0x56, 0x1b, //* .....f...Gq.".V. */ 
+    /* 0x00001130 */ 0x09, 0x8f, 0xed, 0xb9, 0x64, 0x8b, 0x78, 0xfd, 0x00, 0x6c, 0xcd, 0xcd, 0x2f, 0x89, 0x03, 0x75, //* ....d.x..l../..u */ 
+    /* 0x00001140 */ 0xf9, 0x3f, 0x9b, 0xe7, 0xb9, 0x6b, 0x98, 0xda, 0xda, 0x32, 0xdf, 0x9d, 0xfc, 0x96, 0x06, 0x32, //* .?...k...2.....2 */ 
+    /* 0x00001150 */ 0x79, 0xbf, 0x10, 0x59, 0x58, 0x58, 0xb4, 0xee, 0x1e, 0xe4, 0xa0, 0x80, 0x89, 0x39, 0x8c, 0x09, //* y..YXX.......9.. */ 
+    /* 0x00001160 */ 0x86, 0xf9, 0x24, 0x71, 0x52, 0x73, 0x52, 0x86, 0x37, 0x37, 0x4d, 0xb1, 0x48, 0x38, 0xc1, 0x40, //* ..$qRsR.77M.H8.@ */ 
+    /* 0x00001170 */ 0xb6, 0xae, 0xbe, 0x3e, 0xdf, 0xec, 0xbb, 0x7f, 0x59, 0x92, 0x2a, 0x2a, 0x6d, 0x98, 0xc0, 0xc1, //* ...>....Y.**m... */ 
+    /* 0x00001180 */ 0x64, 0x06, 0xc4, 0xf5, 0x60, 0x8a, 0x8b, 0x9e, 0x3e, 0x44, 0xd8, 0x13, 0xba, 0xed, 0x73, 0xd6, //* d...`...>D....s. */ 
+    /* 0x00001190 */ 0xad, 0xb2, 0xb3, 0xd2, 0xe8, 0xb5, 0xd9, 0x23, 0xb6, 0xd1, 0x49, 0xde, 0x5f, 0x5a, 0xfa, 0xa9, //* .......#..I._Z.. */ 
+    /* 0x000011a0 */ 0xad, 0xbd, 0xfd, 0xea, 0xe4, 0x77, 0x7d, 0xbe, 0x44, 0xa1, 0x7a, 0x99, 0xa2, 0x8a, 0x0a, 0x07, //* .....w}.D.z..... */ 
+    /* 0x000011b0 */ 0x31, 0xf0, 0x31, 0x86, 0xa4, 0xf7, 0xc7, 0x0f, 0x3c, 0x2a, 0xe1, 0x62, 0xd2, 0xc2, 0xd7, 0xea, //* 1.1.....<*.b.... */ 
+    /* 0x000011c0 */ 0x50, 0x20, 0x15, 0x09, 0xfc, 0xf2, 0xf2, 0x92, 0xdf, 0xf9, 0xab, 0xa2, 0xe2, 0x6d, 0x70, 0x50, //* P ...........mpP */ 
+    /* 0x000011d0 */ 0xd0, 0x40, 0xb2, 0xcb, 0xc7, 0x76, 0x3e, 0x46, 0x14, 0x4b, 0x67, 0x67, 0x2e, 0x42, 0xb4, 0xd0, //* .@...v>F.Kgg.B.. */ 
+    /* 0x000011e0 */ 0x16, 0x4a, 0xa7, 0xd7, 0x97, 0xe7, 0x28, 0x64, 0xeb, 0x28, 0x87, 0xde, 0x33, 0x84, 0xb0, 0xb0, //* .J....(d.(..3... */ 
+    /* 0x000011f0 */ 0xb0, 0x4e, 0xd0, 0xf4, 0xf8, 0x78, 0x06, 0x43, 0x51, 0x51, 0xa5, 0xa2, 0x9d, 0x1d, 0x5a, 0xc0, //* .N...x.CQQ....Z. */ 
+    /* 0x00001200 */ 0xa3, 0xdc, 0xd5, 0x80, 0x36, 0x45, 0x30, 0x32, 0xf6, 0x76, 0x2c, 0x39, 0x2e, 0x42, 0x21, 0x82, //* ....6E02.v,9.B!. */ 
+    /* 0x00001210 */ 0xaa, 0x76, 0xbb, 0x07, 0x34, 0x6e, 0x7f, 0x7f, 0x9f, 0x12, 0x44, 0xa0, 0x92, 0xc6, 0x1d, 0x6a, //* .v..4n....D....j */ 
+    /* 0x00001220 */ 0x65, 0x65, 0x75, 0x7d, 0x73, 0xc3, 0x00, 0x90, 0x91, 0x91, 0x69, 0xe3, 0x7e, 0xa2, 0xd4, 0xb8, //* eeu}s.....i.~... */ 
+    /* 0x00001230 */ 0x8a, 0x07, 0x76, 0x4f, 0x7f, 0xd7, 0x87, 0x7f, 0x60, 0x18, 0x5c, 0x3b, 0x6e, 0x8d, 0x2f, 0x51, //* ..vO....`.\;n./Q */ 
+    /* 0x00001240 */ 0x7e, 0x98, 0x59, 0x5a, 0x4a, 0xa9, 0xd2, 0x6f, 0xa4, 0x05, 0xda, 0xaa, 0xdc, 0x6d, 0x34, 0xaf, //* ~.YZJ..o.....m4. */ 
+    /* 0x00001250 */ 0xed, 0xa9, 0xc4, 0xfd, 0x83, 0x8c, 0x8d, 0xc3, 0xbf, 0x3d, 0x5e, 0x93, 0x8a, 0x79, 0xfd, 0x60, //* .........=^..y.` */ 
+    /* 0x00001260 */ 0x66, 0xa5, 0x60, 0x61, 0x61, 0x21, 0xbc, 0xcb, 0x4f, 0xc3, 0xe9, 0x0c, 0x3e, 0x49, 0xe5, 0x34, //* f.`aa!..O...>I.4 */ 
+    /* 0x00001270 */ 0xa3, 0x45, 0x6f, 0x2c, 0xff, 0xb2, 0x37, 0xc9, 0xf2, 0x43, 0x93, 0x75, 0xbc, 0xc5, 0xff, 0x39, //* .Eo,..7..C.u...9 */ 
+    /* 0x00001280 */ 0x8c, 0x55, 0x0a, 0x15, 0x15, 0x75, 0xab, 0xcd, 0xfd, 0x18, 0x05, 0x5c, 0x5c, 0x5c, 0xac, 0x50, //* .U...u.....\\\.P */ 
+    /* 0x00001290 */ 0x59, 0x59, 0xb9, 0x02, 0x1a, 0x79, 0xb9, 0x5d, 0x75, 0x2c, 0xd3, 0xae, 0xf0, 0x7a, 0x79, 0xf2, //* YY...y.]u,...zy. */ 
+    /* 0x000012a0 */ 0x92, 0xaa, 0x87, 0x67, 0x46, 0x2b, 0x74, 0xde, 0x61, 0xcc, 0x02, 0x2c, 0xab, 0x4d, 0xba, 0x03, //* ...gF+t.a..,.M.. */ 
+    /* 0x000012b0 */ 0xad, 0x56, 0xfc, 0x88, 0x5a, 0x45, 0x52, 0x22, 0x23, 0xe5, 0x44, 0x5c, 0xf7, 0xd9, 0xb0, 0xa9, //* .V..ZER"#.D\.... */ 
+    /* 0x000012c0 */ 0x5f, 0x12, 0xaf, 0x0e, 0x20, 0x25, 0x19, 0x19, 0xe4, 0xf0, 0x70, 0x70, 0xf7, 0x34, 0xec, 0x71, //* _... %....pp.4.q */ 
+    /* 0x000012d0 */ 0x97, 0x6b, 0x86, 0xce, 0xc8, 0xf5, 0x7d, 0x11, 0xc2, 0x34, 0x34, 0x60, 0xa0, 0x2e, 0x36, 0x36, //* .k....}..44`..66 */ 
+    /* 0x000012e0 */ 0x36, 0x43, 0xf3, 0x99, 0xfc, 0x0c, 0xab, 0x17, 0x86, 0x7a, 0x89, 0xba, 0x5e, 0x71, 0x6d, 0x3c, //* 6C.......z..^qm< */ 
+    /* 0x000012f0 */ 0xeb, 0x5b, 0x8b, 0xeb, 0xaa, 0xd5, 0x0e, 0xb7, 0x23, 0x6e, 0xc7, 0xb5, 0x96, 0xd1, 0x90, 0x90, //* .[......#n...... */ 
+    /* 0x00001300 */ 0x8f, 0x18, 0xed, 0x1e, 0x59, 0xef, 0x0c, 0x1a, 0x77, 0xff, 0x2e, 0x54, 0x78, 0x5d, 0xee, 0xb2, //* ....Y...w..Tx].. */ 
+    /* 0x00001310 */ 0x0c, 0x0d, 0xac, 0x99, 0x79, 0x34, 0x55, 0x5e, 0x3a, 0x98, 0xb1, 0x00, 0x66, 0xbd, 0x41, 0x88, //* ....y4U^:...f.A. */ 
+    /* 0x00001320 */ 0xf4, 0xa3, 0x23, 0x23, 0x9f, 0xa4, 0xea, 0xfd, 0x8b, 0x38, 0x79, 0x79, 0xdd, 0x6b, 0x1a, 0x1a, //* ..##.....8yy.k.. */ 
+    /* 0x00001330 */ 0x4e, 0x90, 0x37, 0x07, 0x33, 0x05, 0x5d, 0xf5, 0x34, 0x35, 0x15, 0x5b, 0x0d, 0xa7, 0x8c, 0xda, //* N.7.3.].45.[.... */ 
+    /* 0x00001340 */ 0x3d, 0x9c, 0x7b, 0xc0, 0x81, 0x5f, 0x6f, 0x37, 0x7c, 0x4e, 0x66, 0x0a, 0x90, 0xff, 0xdd, 0x3e, //* =.{.._o7|Nf....> */ 
+    /* 0x00001350 */ 0x87, 0x28, 0x2b, 0x2b, 0x4f, 0x40, 0x96, 0x74, 0x67, 0xd0, 0xe9, 0x17, 0x08, 0x4a, 0xf1, 0xde, //* .(++O@.tg....J.. */ 
+    /* 0x00001360 */ 0x37, 0x19, 0xd0, 0xa7, 0x7d, 0xff, 0x2e, 0x89, 0x8c, 0x8c, 0x0c, 0xf7, 0xad, 0x80, 0xf5, 0x2c, //* 7...}.........., */ 
+    /* 0x00001370 */ 0x63, 0x08, 0x1e, 0xb0, 0x30, 0x3f, 0x8d, 0x24, 0x54, 0xd3, 0x2f, 0xdf, 0xed, 0x0f, 0x47, 0x15, //* c...0?.$T./...G. */ 
+    /* 0x00001380 */ 0xf1, 0x64, 0x07, 0x7f, 0x8c, 0xa3, 0xc8, 0xeb, 0xee, 0x16, 0x5f, 0x5f, 0x5b, 0x6b, 0xb1, 0x1c, //* .d........__[k.. */ 
+    /* 0x00001390 */ 0xc5, 0xab, 0xd6, 0x6f, 0x8c, 0x3a, 0x3d, 0x3d, 0xc5, 0xc0, 0xc6, 0xb6, 0x31, 0x36, 0x66, 0x6f, //* ...o.:==....16fo */ 
+    /* 0x000013a0 */ 0x76, 0x58, 0x67, 0x6d, 0xca, 0x0c, 0x45, 0x27, 0x56, 0xc7, 0x41, 0x60, 0xa4, 0xa7, 0x8f, 0x38, //* vXgm..E'V.A`...8 */ 
+    /* 0x000013b0 */ 0xc0, 0xc0, 0xc0, 0xd0, 0x04, 0x34, 0x77, 0x86, 0x62, 0x2d, 0xb4, 0xb5, 0x89, 0xe6, 0x66, 0x67, //* .....4w.b-....fg */ 
+    /* 0x000013c0 */ 0x05, 0x64, 0x85, 0xb5, 0x6d, 0x11, 0xf5, 0x8a, 0x6e, 0x42, 0xc3, 0xc3, 0xbf, 0x9c, 0x4a, 0x4f, //* .d..m...nB....JO */ 
+    /* 0x000013d0 */ 0x63, 0xec, 0x13, 0x16, 0x96, 0x94, 0xb8, 0x3e, 0x5e, 0x1f, 0x21, 0xe0, 0xcc, 0xb4, 0xba, 0x1e, //* c......>^.!..... */ 
+    /* 0x000013e0 */ 0xe8, 0xb7, 0x05, 0x6c, 0x67, 0xe5, 0xa9, 0x15, 0xc8, 0xf2, 0x01, 0x54, 0xd7, 0xa7, 0xeb, 0xe1, //* ...lg......T.... */ 
+    /* 0x000013f0 */ 0x17, 0xd8, 0xd4, 0x51, 0x84, 0xaa, 0xa4, 0x92, 0x38, 0x03, 0x83, 0xe2, 0x00, 0x2b, 0xd0, 0x0c, //* ...Q....8....+.. */ 
+    /* 0x00001400 */ 0x22, 0xc8, 0x16, 0xdc, 0x51, 0x49, 0x2a, 0xcf, 0x94, 0x94, 0x94, 0x44, 0xe8, 0xb9, 0xd8, 0x19, //* "...QI*....D.... */ 
+    /* 0x00001410 */ 0xd6, 0x28, 0xd3, 0x54, 0x67, 0x4c, 0xac, 0xb5, 0x18, 0x8e, 0x33, 0x67, 0xf0, 0x3c, 0xdb, 0x88, //* .(.TgL....3g.<.. */ 
+    /* 0x00001420 */ 0x1d, 0x1d, 0x85, 0xa4, 0x65, 0x65, 0x19, 0x71, 0x8d, 0xc7, 0xd5, 0xd6, 0xd4, 0x90, 0x38, 0xaa, //* ....ee.q......8. */ 
+    /* 0x00001430 */ 0x57, 0x68, 0x5f, 0xad, 0x34, 0x7e, 0x09, 0x30, 0x37, 0x35, 0xc5, 0xd1, 0xab, 0x7d, 0x3f, 0x57, //* Wh_.4~.075...}?W */ 
+    /* 0x00001440 */ 0xa6, 0xc1, 0x64, 0xdc, 0xea, 0x12, 0xea, 0xd2, 0x9a, 0x89, 0x16, 0x1a, 0xc4, 0x61, 0xdc, 0x61, //* ..d..........a.a */ 
+    /* 0x00001450 */ 0x2a, 0xd1, 0xe3, 0xb5, 0xb2, 0x7a, 0xc7, 0x04, 0x3e, 0x98, 0x4c, 0xe7, 0xf5, 0xb9, 0x5b, 0xdf, //* *....z..>.L...[. */ 
+    /* 0x00001460 */ 0xfe, 0x6a, 0x6f, 0x6f, 0x0f, 0xc8, 0x2c, 0x2f, 0x2f, 0x73, 0x1f, 0xaa, 0xe3, 0x28, 0xc8, 0x1b, //* .joo..,//s...(.. */ 
+    /* 0x00001470 */ 0x63, 0x9d, 0xca, 0x17, 0xfd, 0x18, 0x8e, 0xa7, 0x66, 0x02, 0xe4, 0xe9, 0xbd, 0xe3, 0xff, 0xce, //* c.......f....... */ 
+    /* 0x00001480 */ 0x97, 0x59, 0xfc, 0xea, 0xac, 0x44, 0x06, 0xc7, 0xf4, 0x07, 0x50, 0xe5, 0xd3, 0x94, 0x92, 0x12, //* .Y...D....P..... */ 
+    /* 0x00001490 */ 0x13, 0x0f, 0x7f, 0x9e, 0x2b, 0xe6, 0x16, 0x15, 0xcd, 0xb2, 0x6b, 0x4c, 0x17, 0x7f, 0x3a, 0x0f, //* ....+.....kL..:. */ 
+    /* 0x000014a0 */ 0x66, 0x4e, 0x68, 0xf7, 0x3c, 0xab, 0x6d, 0x69, 0x69, 0xe9, 0xf3, 0xe0, 0x6f, 0xb2, 0x1a, 0x4f, //* fNh.<.mii...o..O */ 
+    /* 0x000014b0 */ 0x4e, 0x4e, 0x0a, 0xf8, 0x33, 0x36, 0x5b, 0x9e, 0x9c, 0x97, 0xb7, 0x25, 0x09, 0x0f, 0x0f, 0x7f, //* NN..36[....%.... */ 
+    /* 0x000014c0 */ 0x91, 0xae, 0x22, 0xf6, 0x10, 0x42, 0xf7, 0x31, 0xce, 0x32, 0x9a, 0xe8, 0xdd, 0xdb, 0x29, 0xa3, //* .."..B.1.2....). */ 
+    /* 0x000014d0 */ 0x9a, 0x46, 0x7b, 0x6b, 0x8d, 0x87, 0x36, 0xcf, 0xf4, 0xd3, 0xf5, 0x76, 0x72, 0x78, 0x5d, 0xec, //* .F{k..6....vrx]. */ 
+    /* 0x000014e0 */ 0x5c, 0xa7, 0xfd, 0x09, 0xc7, 0xc3, 0x63, 0x9f, 0xcc, 0x12, 0x95, 0x7f, 0xae, 0xbd, 0x41, 0xa1, //* \.....c.......A. */ 
+    /* 0x000014f0 */ 0x84, 0x84, 0x97, 0xb9, 0x0e, 0xeb, 0x8f, 0x6d, 0x84, 0xb3, 0xc4, 0x12, 0x17, 0x71, 0x94, 0xc2, //* .......m.....q.. */ 
+    /* 0x00001500 */ 0xa5, 0xda, 0x15, 0x2c, 0x29, 0xe3, 0x2c, 0x29, 0x5f, 0x28, 0xc4, 0xb0, 0xa9, 0x44, 0x3e, 0x01, //* ...,).,)_(...D>. */ 
+    /* 0x00001510 */ 0x1d, 0xee, 0xc7, 0x44, 0x72, 0x2e, 0xbf, 0x4a, 0x98, 0x40, 0xa5, 0xc7, 0x0b, 0x15, 0x77, 0xb5, //* ...Dr..J.@....w. */ 
+    /* 0x00001520 */ 0xca, 0xa4, 0xb4, 0x43, 0x8d, 0x8a, 0xc5, 0x24, 0x24, 0x64, 0x86, 0xa0, 0x84, 0xdc, 0xac, 0x8a, //* ...C...$$d...... */ 
+    /* 0x00001530 */ 0x01, 0xd0, 0xb2, 0xa3, 0xe1, 0xb8, 0xa5, 0xee, 0x59, 0x57, 0xe7, 0x9f, 0x01, 0xb4, 0x7b, 0x83, //* ........YW....{. */ 
+    /* 0x00001540 */ 0xd1, 0x7f, 0x40, 0x13, 0xd0, 0x82, 0x4c, 0x83, 0x2a, 0x51, 0x09, 0xfb, 0xd1, 0xe2, 0xa3, 0xf6, //* ..@...L.*Q...... */ 
+    /* 0x00001550 */ 0xcd, 0x6b, 0x92, 0x36, 0x0f, 0x1c, 0x10, 0xf0, 0xfa, 0xec, 0x59, 0xbe, 0xc0, 0x3a, 0x63, 0xb6, //* .k.6......Y..:c. */ 
+    /* 0x00001560 */ 0x35, 0x18, 0x4d, 0xec, 0x9b, 0x9d, 0xa9, 0xf8, 0x03, 0x23, 0x3e, 0xa2, 0x14, 0xe7, 0x2f, 0xd6, //* 5.M......#>.../. */ 
+    /* 0x00001570 */ 0x7a, 0xf4, 0x6b, 0x5c, 0x18, 0x26, 0x19, 0x99, 0x81, 0x9e, 0x9e, 0x5e, 0xa7, 0xcd, 0x6a, 0x25, //* z.k\.&.....^..j% */ 
+    /* 0x00001580 */ 0xe3, 0xa1, 0x04, 0xe2, 0x19, 0x6f, 0x80, 0x09, 0xa4, 0x30, 0x59, 0xee, 0x9d, 0x81, 0x81, 0x01, //* .....o...0Y..... */ 
+    /* 0x00001590 */ 0xfc, 0xfa, 0x7b, 0x23, 0x7a, 0xbc, 0x51, 0x38, 0x40, 0xc4, 0xfd, 0x2f, 0x7d, 0xd9, 0x42, 0xd8, //* ..{#z.Q8@../}.B. */ 
+    /* 0x000015a0 */ 0x4f, 0x79, 0x06, 0xb9, 0xcb, 0xcf, 0xdb, 0x1a, 0x1e, 0x87, 0xd3, 0x81, 0xc0, 0x2c, 0x19, 0xaf, //* Oy...........,.. */ 
+    /* 0x000015b0 */ 0xdd, 0xbc, 0xee, 0xdd, 0x0a, 0x99, 0x31, 0xb5, 0x0d, 0x88, 0x93, 0x8b, 0x4b, 0x6d, 0x8d, 0x4e, //* ......1.....Km.N */ 
+    /* 0x000015c0 */ 0x8d, 0x99, 0xe0, 0x69, 0x3f, 0xc3, 0x11, 0x65, 0xd2, 0x77, 0xef, 0xcb, 0x3a, 0xba, 0xdd, 0xb7, //* ...i?..e.w..:... */ 
+    /* 0x000015d0 */ 0xd8, 0xf9, 0x2a, 0x83, 0x66, 0x6c, 0x80, 0x4a, 0xf8, 0xb4, 0x42, 0x0b, 0x79, 0x40, 0x8e, 0x02, //* ..*.fl.J..B.y@.. */ 
+    /* 0x000015e0 */ 0x13, 0x03, 0x23, 0x5b, 0x5f, 0x5f, 0x5f, 0xfb, 0x8b, 0x56, 0xe3, 0x0a, 0xa6, 0xa9, 0x52, 0x06, //* ..#[___..V....R. */ 
+    /* 0x000015f0 */ 0x5f, 0x2c, 0xe0, 0x74, 0x60, 0x3c, 0x21, 0x3a, 0x23, 0xb5, 0x01, 0x81, 0xfc, 0xa2, 0x7d, 0xf0, //* _,.t`<!:#.....}. */ 
+    /* 0x00001600 */ 0xf6, 0xf0, 0xf0, 0x70, 0x5e, 0x78, 0x6b, 0xf7, 0x0d, 0xff, 0x89, 0xcb, 0xeb, 0x92, 0x80, 0x35, //* ...p^xk........5 */ 
+    /* 0x00001610 */ 0xc9, 0x4a, 0x51, 0x59, 0x99, 0x48, 0x4b, 0xb7, 0x4c, 0x53, 0x1f, 0x9a, 0x32, 0x5e, 0x61, 0x84, //* .JQY.HK.LS..2^a. */ 
+    /* 0x00001620 */ 0x3e, 0xe3, 0x52, 0x52, 0x53, 0x83, 0x63, 0xd7, 0x88, 0x26, 0x6f, 0x55, 0xf6, 0x4d, 0xdd, 0xc4, //* >.RRS.c..&oU.M.. */ 
+    /* 0x00001630 */ 0xe4, 0x4f, 0xb9, 0x7c, 0xb5, 0xdd, 0x27, 0x77, 0xc2, 0x4f, 0xb5, 0x34, 0xa5, 0x92, 0x78, 0x48, //* .O.|..'w.O.4..xH */ 
+    /* 0x00001640 */ 0x61, 0x1c, 0xbc, 0xda, 0x3f, 0xa0, 0xe5, 0xbb, 0xe5, 0x61, 0x9a, 0x3a, 0x81, 0x24, 0xe4, 0xa4, //* a...?....a.:.$.. */ 
+    /* 0x00001650 */ 0xa4, 0x92, 0xb4, 0x49, 0xb9, 0xca, 0x94, 0x1a, 0x6e, 0xa7, 0xf3, 0xa8, 0xd3, 0x28, 0x85, 0x05, //* ...I....n....(.. */ 
+    /* 0x00001660 */ 0x49, 0x49, 0x5a, 0x94, 0xeb, 0x13, 0x0b, 0x91, 0x7f, 0x59, 0x13, 0xb4, 0xad, 0xad, 0xad, 0x13, //* IIZ......Y...... */ 
+    /* 0x00001670 */ 0xec, 0xa0, 0x95, 0x95, 0x55, 0x55, 0xa0, 0x58, 0x89, 0xca, 0xe8, 0xe8, 0xe8, 0x8a, 0xc6, 0x7a, //* ....UU.X.......z */ 
+    /* 0x00001680 */ 0x25, 0x77, 0x42, 0x94, 0xbf, 0x0b, 0x15, 0xc8, 0x7e, 0xa2, 0x7e, 0x24, 0x87, 0xc7, 0x05, 0x5d, //* %wB.....~.~$...] */ 
+    /* 0x00001690 */ 0x45, 0xd6, 0xa3, 0x51, 0x85, 0x5d, 0x34, 0x28, 0x55, 0xee, 0x57, 0xda, 0x4c, 0xe5, 0x15, 0x12, //* E..Q.]4(U.W.L... */ 
+    /* 0x000016a0 */ 0x76, 0x7a, 0xfa, 0xfa, 0x52, 0x2a, 0xac, 0xa1, 0x32, 0xb4, 0xb8, 0x55, 0xb8, 0x72, 0x41, 0x96, //* vz..R*..2..U.rA. */ 
+    /* 0x000016b0 */ 0x8d, 0xc6, 0x45, 0x55, 0xd5, 0x70, 0x9f, 0x37, 0x72, 0x25, 0xe1, 0x25, 0x8e, 0x9d, 0x0d, 0x7e, //* ..EU.p.7r%.%...~ */ 
+    /* 0x000016c0 */ 0xff, 0xed, 0xac, 0xac, 0x54, 0xf4, 0x34, 0xab, 0xd3, 0x57, 0x33, 0x42, 0x94, 0x52, 0x78, 0x5b, //* ....T.4..W3B.Rx[ */ 
+    /* 0x000016d0 */ 0x9b, 0x81, 0xf7, 0xbc, 0xca, 0x80, 0x87, 0x8a, 0x20, 0x99, 0x8a, 0xb6, 0x59, 0xf2, 0xf7, 0x2f, //* ........ ...Y../ */ 
+    /* 0x000016e0 */ 0xa2, 0x16, 0x25, 0x22, 0x37, 0xd0, 0x13, 0xbe, 0x4f, 0x44, 0x04, 0x00, 0x49, 0xf2, 0xa1, 0x68, //* ..%"7...OD..I..h */ 
+    /* 0x000016f0 */ 0xc4, 0x82, 0x92, 0x38, 0x9b, 0xdb, 0xdb, 0x86, 0x07, 0xf7, 0xce, 0x7f, 0x6e, 0x60, 0x1c, 0x8d, //* ...8........n`.. */ 
+    /* 0x00001700 */ 0x45, 0xe0, 0x94, 0x39, 0x58, 0xe9, 0xde, 0xa9, 0x72, 0xe1, 0xf9, 0x96, 0x81, 0x30, 0x9b, 0xab, //* E..9X...r....0.. */ 
+    /* 0x00001710 */ 0x51, 0xa2, 0x1c, 0x00, 0x97, 0x5a, 0x9a, 0x91, 0x3b, 0x88, 0xd1, 0xb3, 0x0f, 0x11, 0x7f, 0x15, //* Q....Z..;....... */ 
+    /* 0x00001720 */ 0x19, 0x59, 0x9b, 0xaf, 0xcc, 0x0b, 0x6d, 0x95, 0xa5, 0xd9, 0xdb, 0xdb, 0x4b, 0x18, 0xb5, 0x34, //* .Y....m.....K..4 */ 
+    /* 0x00001730 */ 0x2f, 0x0e, 0x0a, 0x92, 0xc2, 0xa0, 0x16, 0xa3, 0xc8, 0xcb, 0x5b, 0x12, 0xaa, 0xd6, 0xad, 0x85, //* /.........[..... */ 
+    /* 0x00001740 */ 0x25, 0x77, 0x86, 0xaa, 0x77, 0xb3, 0xf3, 0x59, 0x0c, 0xfb, 0x9d, 0xee, 0x6c, 0x6e, 0x7e, 0x43, //* %w..w..Y....ln~C */ 
+    /* 0x00001750 */ 0x97, 0x68, 0xcc, 0x51, 0xed, 0xc2, 0x12, 0x82, 0x64, 0x8b, 0x66, 0xc0, 0xa8, 0xbb, 0x9f, 0x62, //* .h.Q....d.f....b */ 
+    /* 0x00001760 */ 0xe2, 0xef, 0x85, 0x23, 0x61, 0x05, 0xdf, 0xe8, 0x4c, 0x29, 0xe4, 0xf6, 0xcd, 0xed, 0x74, 0x4d, //* ...#a...L)....tM */ 
+    /* 0x00001770 */ 0xb0, 0xb8, 0xb0, 0x70, 0x7a, 0x66, 0xe6, 0x7b, 0x3c, 0x95, 0x38, 0x6d, 0xa3, 0xff, 0xd1, 0x3b, //* ...pzf.{<.8m...; */ 
+    /* 0x00001780 */ 0xfd, 0x86, 0x52, 0x5d, 0xa1, 0x37, 0xc0, 0x54, 0x06, 0x7f, 0x8a, 0x9c, 0x5c, 0xa4, 0x26, 0x6b, //* ..R].7.T....\.&k */ 
+    /* 0x00001790 */ 0x52, 0x87, 0xf7, 0x0d, 0x6b, 0x38, 0x26, 0x79, 0x36, 0xf2, 0xa6, 0x0f, 0x10, 0x36, 0x4d, 0x72, //* R...k8&y6....6Mr */ 
+    /* 0x000017a0 */ 0xa2, 0xe4, 0xea, 0xea, 0x0a, 0x59, 0x6e, 0x73, 0x17, 0x0e, 0xc7, 0xa6, 0xf6, 0x27, 0x94, 0x58, //* .....Yns.....'.X */ 
+    /* 0x000017b0 */ 0x97, 0xef, 0xd6, 0x92, 0x66, 0x08, 0xf3, 0xff, 0x37, 0xc9, 0x8f, 0xda, 0xee, 0x01, 0xdd, 0x7e, //* ....f...7......~ */ 
+    /* 0x000017c0 */ 0xc4, 0x24, 0xe7, 0x6e, 0x0c, 0xfc, 0xa1, 0x52, 0x6d, 0xd2, 0x9d, 0x5d, 0x56, 0x56, 0x36, 0x31, //* .$.n...Rm..]VV61 */ 
+    /* 0x000017d0 */ 0xf6, 0xc3, 0x19, 0xba, 0xd2, 0x38, 0xcf, 0xff, 0xde, 0xb4, 0x7c, 0x51, 0xde, 0x68, 0x29, 0xd8, //* .....8....|Q.h). */ 
+    /* 0x000017e0 */ 0xae, 0x07, 0x0c, 0xda, 0x6e, 0x3a, 0x35, 0x56, 0x51, 0xd9, 0x3f, 0x38, 0xe0, 0x11, 0x16, 0xce, //* ....n:5VQ.?8.... */ 
+    /* 0x000017f0 */ 0xf0, 0xf1, 0x38, 0x63, 0x04, 0x23, 0x2f, 0xf2, 0x4d, 0xf6, 0xf9, 0xff, 0x83, 0x62, 0x0b, 0xfd, //* ..8c.#/.M....b.. */ 
+    /* 0x00001800 */ 0x72, 0x53, 0xb3, 0x0b, 0xd5, 0xec, 0x7f, 0x0d, 0xbc, 0x99, 0xb3, 0x51, 0x3c, 0xb8, 0xbf, 0xd8, //* rS.........Q<... */ 
+    /* 0x00001810 */ 0xf1, 0x7a, 0x5e, 0x71, 0x67, 0x25, 0x40, 0x33, 0xee, 0x20, 0x19, 0x71, 0x58, 0x6f, 0x73, 0x9d, //* .z^qg%@3. .qXos. */ 
+    /* 0x00001820 */ 0x48, 0xe5, 0x72, 0x73, 0x73, 0xb3, 0x74, 0x30, 0xa6, 0x92, 0xd3, 0xae, 0x15, 0x01, 0xf5, 0x88, //* H.rss.t0........ */ 
+    /* 0x00001830 */ 0xf9, 0x3d, 0x9e, 0x3f, 0x5c, 0xd9, 0x74, 0x10, 0x52, 0x0e, 0x8a, 0xf9, 0x89, 0x59, 0xe7, 0x88, //* .=.?\.t.R....Y.. */ 
+    /* 0x00001840 */ 0x51, 0xf3, 0xd0, 0xd2, 0x06, 0xed, 0x59, 0xc9, 0x0f, 0x0d, 0x0f, 0x3b, 0x5f, 0x6c, 0x0f, 0x36, //* Q.....Y....;_l.6 */ 
+    /* 0x00001850 */ 0x34, 0xfa, 0xe5, 0x00, 0xc5, 0x7f, 0x5f, 0x6c, 0x31, 0x03, 0x20, 0xa6, 0x40, 0x6d, 0x76, 0x76, //* 4....._l1. .@mvv */ 
+    /* 0x00001860 */ 0xf6, 0xcf, 0x83, 0x31, 0xd2, 0xd7, 0xf3, 0x37, 0x59, 0x99, 0xc5, 0x97, 0xe3, 0x1c, 0xdd, 0xbb, //* ...1...7Y....... */ 
+    /* 0x00001870 */ 0xc1, 0x2d, 0xc8, 0x18, 0x98, 0xa8, 0x79, 0x89, 0x89, 0x89, 0xb6, 0xcf, 0xba, 0x82, 0xd7, 0xb2, //* .-....y......... */ 
+    /* 0x00001880 */ 0xa1, 0xd0, 0xb3, 0x18, 0xd2, 0x39, 0x52, 0x9f, 0x57, 0xb1, 0xfa, 0x7a, 0xab, 0xb5, 0x83, 0x23, //* .....9R.W..z...# */ 
+    /* 0x00001890 */ 0x49, 0xc0, 0xcd, 0xc3, 0xd9, 0x5a, 0x5e, 0x1e, 0x4d, 0x21, 0x2a, 0x9a, 0x84, 0xe4, 0x5b, 0x20, //* I....Z^.M!*...[  */ 
+    /* 0x000018a0 */ 0x16, 0x56, 0x5c, 0xda, 0x82, 0x1e, 0xb9, 0x0f, 0xbe, 0x2e, 0xdc, 0xb2, 0x58, 0xc0, 0x86, 0xef, //* .V\.........X... */ 
+    /* 0x000018b0 */ 0x90, 0x68, 0x84, 0x45, 0xb5, 0x48, 0x8a, 0x8f, 0x88, 0xc8, 0xf2, 0x72, 0x1b, 0xd7, 0xf3, 0xb3, //* .h.E.H.....r.... */ 
+    /* 0x000018c0 */ 0x0a, 0x0f, 0x3f, 0x7f, 0xca, 0xd6, 0xd6, 0xd6, 0xc9, 0x7a, 0x3b, 0x7f, 0xf3, 0xd7, 0xdf, 0xb4, //* ..?......z;..... */ 
+    /* 0x000018d0 */ 0xe9, 0xbe, 0x7f, 0xc3, 0xae, 0xe7, 0x96, 0x96, 0x88, 0xc5, 0xcf, 0x36, 0x3a, 0xa3, 0xd3, 0xd2, //* ...........6:... */ 
+    /* 0x000018e0 */ 0x8e, 0x62, 0xe2, 0xe3, 0x8b, 0x12, 0x13, 0xf1, 0x41, 0xe7, 0xd7, 0x9f, 0xc5, 0x93, 0x93, 0x89, //* .b......A....... */ 
+    /* 0x000018f0 */ 0x34, 0x18, 0xc7, 0xb7, 0xe3, 0xa0, 0xc2, 0xa5, 0xeb, 0x73, 0xd4, 0x95, 0x3e, 0x3c, 0xaf, 0xc7, //* 4........s..><.. */ 
+    /* 0x00001900 */ 0xbe, 0xab, 0x79, 0xd2, 0xff, 0x62, 0x5c, 0x6d, 0x20, 0x75, 0xa5, 0xaa, 0xbd, 0x23, 0x19, 0xdf, //* ..y..b\m u...#.. */ 
+    /* 0x00001910 */ 0x4f, 0x66, 0x76, 0xe8, 0xd8, 0x8d, 0x9f, 0xf0, 0x13, 0x7f, 0x64, 0x73, 0x31, 0x30, 0x68, 0x61, //* Ofv.......ds10ha */ 
+    /* 0x00001920 */ 0xac, 0x23, 0x83, 0x25, 0x25, 0x25, 0xb7, 0x1d, 0xf2, 0x4e, 0x49, 0xd4, 0x05, 0xdd, 0x90, 0x00, //* .#.%%%...NI..... */ 
+    /* 0x00001930 */ 0x2c, 0xaa, 0x93, 0x91, 0xe3, 0x25, 0xa9, 0xb4, 0xc4, 0xc4, 0x41, 0x30, 0xd8, 0xb5, 0xd2, 0xa4, //* ,....%....A0.... */ 
+    /* 0x00001940 */ 0x99, 0x8a, 0x49, 0x39, 0x7d, 0x64, 0x19, 0xf9, 0x4e, 0xae, 0x4a, 0xed, 0x66, 0x22, 0xcd, 0xa4, //* ..I9}d..N.J.f".. */ 
+    /* 0x00001950 */ 0x02, 0x74, 0x02, 0x77, 0xce, 0x1d, 0xb4, 0x62, 0x72, 0x54, 0xcc, 0xdb, 0x50, 0xba, 0xb8, 0xbc, //* .t.w...brT..P... */ 
+    /* 0x00001960 */ 0xbc, 0xba, 0x1a, 0xee, 0x09, 0x5d, 0x59, 0x40, 0x04, 0x47, 0x3a, 0xd0, 0x82, 0xb1, 0x41, 0xf7, //* .....]Y@.G:...A. */ 
+    /* 0x00001970 */ 0xf6, 0xcb, 0x35, 0x81, 0xa3, 0x90, 0x1c, 0x1e, 0x06, 0x86, 0xd0, 0x0a, 0x9d, 0x5f, 0xd6, 0xf1, //* ..5.........._.. */ 
+    /* 0x00001980 */ 0x54, 0xa2, 0x24, 0x78, 0x64, 0x52, 0x5e, 0xc6, 0x54, 0x90, 0x4c, 0xc1, 0x71, 0x6c, 0xb1, 0x69, //* T.$xdR^.T.L.ql.i */ 
+    /* 0x00001990 */ 0x5b, 0x35, 0x40, 0xc0, 0x6e, 0x9e, 0x79, 0x6c, 0xcf, 0x45, 0x8d, 0x06, 0x11, 0x11, 0x51, 0xcb, //* [5@.n.yl.E....Q. */ 
+    /* 0x000019a0 */ 0x57, 0x08, 0x70, 0x3a, 0x9c, 0xce, 0x4b, 0xc2, 0x3c, 0x45, 0x01, 0x47, 0x13, 0xbd, 0xdb, 0x4c, //* W.p:..K.<E.G...L */ 
+    /* 0x000019b0 */ 0x1c, 0x46, 0x9d, 0x48, 0x1e, 0xbd, 0xff, 0x77, 0xd6, 0x8d, 0x0f, 0xf0, 0xdb, 0x6f, 0x0c, 0x9c, //* .F.H...w.....o.. */ 
+    /* 0x000019c0 */ 0x9c, 0x7c, 0x25, 0x22, 0x26, 0x9e, 0xf9, 0xf3, 0x27, 0x67, 0xbd, 0xcd, 0x3d, 0xe0, 0x89, 0x7f, //* .|%"&...'g..=... */ 
+    /* 0x000019d0 */ 0xf1, 0x54, 0xf6, 0xf6, 0xf9, 0x91, 0xe3, 0x77, 0xcd, 0x16, 0x71, 0xef, 0x46, 0x97, 0xc9, 0x46, //* .T.....w..q.F..F */ 
+    /* 0x000019e0 */ 0x37, 0xee, 0x8a, 0x41, 0xfc, 0x82, 0x8e, 0x89, 0x5f, 0x52, 0x87, 0x0d, 0x84, 0x6a, 0x2a, 0x4b, //* 7..A...._R...j*K */ 
+    /* 0x000019f0 */ 0x98, 0xbf, 0x5a, 0x7d, 0x49, 0x15, 0x19, 0x3c, 0x5e, 0xc8, 0xc1, 0x94, 0xbc, 0xd6, 0xe1, 0x95, //* ..Z}I..<^....... */ 
+    /* 0x00001a00 */ 0x88, 0x16, 0x1a, 0x04, 0x02, 0x81, 0x1a, 0x1a, 0xea, 0x76, 0x8b, 0x95, 0xba, 0x39, 0x79, 0x78, //* .........v...9yx */ 
+    /* 0x00001a10 */ 0x82, 0x2f, 0xb0, 0xa9, 0x5d, 0x6e, 0x29, 0x94, 0x72, 0xd3, 0xa2, 0x2c, 0x7a, 0x83, 0x10, 0x15, //* ./..]n).r..,z... */ 
+    /* 0x00001a20 */ 0xe5, 0xe5, 0xcd, 0xcd, 0xcc, 0xde, 0xcc, 0xcd, 0xcd, 0x7d, 0xc8, 0x3b, 0x59, 0xb4, 0x55, 0x35, //* .........}.;Y.U5 */ 
+    /* 0x00001a30 */ 0x3f, 0xb6, 0x5d, 0xaa, 0xa6, 0xc4, 0xc7, 0xa3, 0xe2, 0x66, 0x67, 0x8f, 0xab, 0xd0, 0xfe, 0xbc, //* ?.]......fg..... */ 
+    /* 0x00001a40 */ 0x96, 0xfe, 0x36, 0x2e, 0xd8, 0xd8, 0xf8, 0xe7, 0x68, 0x1d, 0x09, 0x31, 0xf1, 0xf8, 0x99, 0x35, //* ..6.....h..1...5 */ 
+    /* 0x00001a50 */ 0xa4, 0xb8, 0xc8, 0x4a, 0xda, 0xb8, 0xcb, 0x37, 0x8d, 0xb5, 0x31, 0x8a, 0x94, 0x94, 0x74, 0xad, //* ...J...7..1...t. */ 
+    /* 0x00001a60 */ 0xc5, 0x99, 0x0e, 0x14, 0x02, 0x1c, 0x22, 0x9a, 0x1e, 0xce, 0x16, 0x8d, 0x9f, 0x79, 0x9f, 0xae, //* ......"......y.. */ 
+    /* 0x00001a70 */ 0x42, 0x08, 0xdf, 0x66, 0xf2, 0x4c, 0x28, 0x4e, 0xda, 0x1c, 0x3e, 0x75, 0xdb, 0x45, 0x42, 0xcf, //* B..f.L(N..>u.EB. */ 
+    /* 0x00001a80 */ 0xb7, 0xfa, 0xb1, 0xcf, 0xd6, 0x5a, 0x35, 0x96, 0x3b, 0xbc, 0xea, 0xd1, 0xc0, 0x39, 0xb5, 0x91, //* .....Z5.;....9.. */ 
+    /* 0x00001a90 */ 0x6a, 0x41, 0x29, 0x29, 0xfc, 0xae, 0xae, 0x57, 0xf7, 0x87, 0x6a, 0x70, 0x36, 0x53, 0x99, 0xa3, //* jA))...W..jp6S.. */ 
+    /* 0x00001aa0 */ 0x5c, 0x16, 0xb2, 0x57, 0xa7, 0x9d, 0x24, 0x63, 0x96, 0x7a, 0x22, 0xbe, 0x87, 0x09, 0xba, 0x81, //* \..W..$c.z"..... */ 
+    /* 0x00001ab0 */ 0x0a, 0xfe, 0xfa, 0x7d, 0x3d, 0x3d, 0x12, 0x62, 0x7e, 0xe9, 0x23, 0x75, 0x75, 0x2e, 0xc9, 0xc9, //* ...}==.b~.#uu... */ 
+    /* 0x00001ac0 */ 0x2c, 0xad, 0xc3, 0x16, 0xd8, 0x39, 0x22, 0x5e, 0xb4, 0x68, 0xf4, 0xa2, 0xa2, 0x59, 0x7e, 0xff, //* ,....9"^.h...Y~. */ 
+    /* 0x00001ad0 */ 0x6e, 0xab, 0xd4, 0x2f, 0xae, 0x0e, 0x20, 0x25, 0x86, 0xd9, 0xd2, 0x92, 0xaa, 0x3c, 0x7c, 0xb7, //* n../.. %.....<|. */ 
+    /* 0x00001ae0 */ 0x54, 0x07, 0x13, 0x59, 0x74, 0xc5, 0xb1, 0xa4, 0x3c, 0x61, 0xb8, 0xb8, 0x5b, 0x6c, 0xea, 0x04, //* T..Yt...<a..[l.. */ 
+    /* 0x00001af0 */ 0x97, 0x97, 0x45, 0x0a, 0x08, 0xd7, 0x82, 0x36, 0xa7, 0x86, 0x62, 0xfe, 0x97, 0xa9, 0x41, 0x34, //* ..E....6..b...A4 */ 
+    /* 0x00001b00 */ 0xe7, 0x8b, 0xd0, 0xd5, 0x4c, 0x11, 0xaf, 0xa8, 0x36, 0xfb, 0x7f, 0x58, 0x86, 0xcd, 0x2f, 0xc4, //* ....L...6..X../. */ 
+    /* 0x00001b10 */ 0x58, 0xa4, 0x42, 0x5f, 0xbb, 0x3d, 0x62, 0x7c, 0x4a, 0xee, 0x5b, 0xcf, 0x98, 0xfc, 0x8e, 0xfe, //* X.B_.=b|J.[..... */ 
+    /* 0x00001b20 */ 0xb6, 0x85, 0xa9, 0x64, 0xd3, 0x73, 0xf1, 0x68, 0x0c, 0x89, 0xbf, 0x2c, 0xcb, 0x01, 0x22, 0x2e, //* ...d.s.h...,..". */ 
+    /* 0x00001b30 */ 0x03, 0xe1, 0x5e, 0x5e, 0x5e, 0x31, 0x31, 0x31, 0xbb, 0xcb, 0xb5, 0xe9, 0x34, 0x23, 0x67, 0x9d, //* ..^^^111....4#g. */ 
+    /* 0x00001b40 */ 0x77, 0x62, 0x1c, 0x26, 0xad, 0x7d, 0x3e, 0x77, 0x67, 0x73, 0x73, 0xae, 0xd4, 0x57, 0x57, 0xe8, //* wb.&.}>wgss..WW. */ 
+    /* 0x00001b50 */ 0xa9, 0x99, 0x99, 0x7d, 0xd4, 0xc4, 0xec, 0x85, 0x67, 0x17, 0xf8, 0x64, 0x15, 0xee, 0x92, 0x38, //* ...}....g..d...8 */ 
+    /* 0x00001b60 */ 0x3b, 0x37, 0xc5, 0x45, 0x45, 0x5a, 0x21, 0xda, 0x78, 0xf1, 0x5b, 0xfd, 0xe1, 0x73, 0xfd, 0xfd, //* ;7.EEZ!.x.[..s.. */ 
+    /* 0x00001b70 */ 0xc1, 0x6f, 0xde, 0xbc, 0x89, 0xe9, 0x22, 0x9c, 0xc4, 0x67, 0x52, 0x39, 0x8f, 0xe6, 0xe8, 0xc2, //* .o...."..gR9.... */ 
+    /* 0x00001b80 */ 0x99, 0xd3, 0xa9, 0x36, 0xec, 0x9d, 0x9f, 0x27, 0xb0, 0xb6, 0xb2, 0x8a, 0x74, 0xc0, 0xa6, 0xf2, //* ...6...'....t... */ 
+    /* 0x00001b90 */ 0xb9, 0xe3, 0x16, 0x66, 0x0a, 0x67, 0x18, 0x64, 0xb8, 0x16, 0x87, 0x42, 0x8a, 0xf9, 0x9a, 0x5a, //* ...f.g.d...B...Z */ 
+    /* 0x00001ba0 */ 0xcf, 0xf2, 0xe3, 0x47, 0x3a, 0x02, 0x73, 0xfc, 0xd3, 0x5d, 0xf7, 0xfe, 0x12, 0x26, 0xff, 0xfc, //* ...G:.s..]...&.. */ 
+    /* 0x00001bb0 */ 0xc9, 0x4d, 0x2f, 0x10, 0x93, 0x25, 0xec, 0xb9, 0x75, 0x7d, 0x34, 0x77, 0xcf, 0x76, 0x44, 0x5a, //* .M/..%..u}4w.vDZ */ 
+    /* 0x00001bc0 */ 0x5f, 0x67, 0xb9, 0x56, 0xb7, 0x57, 0xe4, 0xde, 0x1e, 0x1a, 0x8a, 0xa8, 0x92, 0x29, 0x20, 0x29, //* _g.V.W.......) ) */ 
+    /* 0x00001bd0 */ 0x2e, 0x1e, 0x10, 0x47, 0xca, 0x13, 0x97, 0x97, 0x97, 0x87, 0x81, 0x85, 0x65, 0x9d, 0x32, 0x65, //* ...G........e.2e */ 
+    /* 0x00001be0 */ 0x44, 0x42, 0x46, 0x36, 0xf6, 0xf4, 0x04, 0x17, 0x66, 0x82, 0x6d, 0xd3, 0xca, 0x47, 0xf0, 0x55, //* DBF6....f.m..G.U */ 
+    /* 0x00001bf0 */ 0x53, 0x93, 0x40, 0x43, 0x5d, 0x9d, 0x19, 0x05, 0x8e, 0x7a, 0x60, 0xd0, 0x79, 0x7c, 0xff, 0xdd, //* S.@C]....z`.y|.. */ 
+    /* 0x00001c00 */ 0xc9, 0x4c, 0xe7, 0x47, 0xc2, 0x2d, 0x09, 0x72, 0x0d, 0x85, 0x63, 0x6b, 0xd5, 0xbd, 0x16, 0x37, //* .L.G.-.r..ck...7 */ 
+    /* 0x00001c10 */ 0x96, 0x88, 0xc2, 0x9e, 0xdc, 0xdc, 0x68, 0x84, 0x1e, 0x6c, 0xf1, 0xa7, 0x84, 0xad, 0x25, 0xde, //* ......h..l....%. */ 
+    /* 0x00001c20 */ 0xc5, 0x0b, 0x96, 0xb2, 0x32, 0x18, 0x8a, 0x3c, 0x20, 0xc3, 0x45, 0x0f, 0x8b, 0x85, 0x74, 0x63, //* ....2..< .E...tc */ 
+    /* 0x00001c30 */ 0x20, 0xa8, 0xc9, 0xfe, 0xcf, 0x14, 0x31, 0x07, 0xb7, 0xdc, 0x0f, 0x9d, 0x5f, 0x48, 0xd1, 0x84, //*  .....1....._H.. */ 
+    /* 0x00001c40 */ 0x5b, 0xfb, 0xfb, 0x43, 0x41, 0x4f, 0x22, 0x43, 0xc3, 0xe2, 0xa6, 0xaf, 0xfe, 0xe9, 0xaa, 0x64, //* [..CAO"C.......d */ 
+    /* 0x00001c50 */ 0x80, 0xad, 0x85, 0x45, 0xff, 0xe9, 0x7a, 0x3b, 0x3e, 0xb0, 0xd4, 0xd2, 0xea, 0x3c, 0x8a, 0x17, //* ...E..z;>....<.. */ 
+    /* 0x00001c60 */ 0xeb, 0xb9, 0xb0, 0xb0, 0x59, 0x31, 0x31, 0x36, 0xb6, 0xdb, 0x17, 0x1a, 0x2d, 0xe0, 0xba, 0xaf, //* ....Y116....-... */ 
+    /* 0x00001c70 */ 0xa8, 0x46, 0x13, 0x9f, 0x23, 0x92, 0x17, 0x1c, 0x0c, 0xcf, 0x81, 0x64, 0x6c, 0xe9, 0xe1, 0xc1, //* .F..#......dl... */ 
+    /* 0x00001c80 */ 0xa7, 0xa0, 0xa0, 0x90, 0xc6, 0x30, 0x6e, 0xae, 0xab, 0xcb, 0xbc, 0xf4, 0xcb, 0x04, 0xc2, 0x6e, //* .....0n........n */ 
+    /* 0x00001c90 */ 0xd4, 0xa6, 0x89, 0x2b, 0x61, 0xb5, 0xb0, 0x3c, 0xfa, 0x19, 0xed, 0x6c, 0x68, 0xcd, 0x4a, 0xde, //* ...+a..<...lh.J. */ 
+    /* 0x00001ca0 */ 0x85, 0x5b, 0xa7, 0xca, 0x05, 0x17, 0x72, 0x07, 0x5d, 0x4d, 0x09, 0x0d, 0x0d, 0xa5, 0x97, 0x4b, //* .[....r.]M.....K */ 
+    /* 0x00001cb0 */ 0xd2, 0x9f, 0x1c, 0x19, 0x61, 0x56, 0xce, 0xe0, 0x53, 0xc2, 0x34, 0x35, 0x70, 0xa7, 0x58, 0xce, //* ....aV..S.45p.X. */ 
+    /* 0x00001cc0 */ 0x00, 0x96, 0xef, 0xd6, 0x3d, 0x5d, 0xbf, 0x1d, 0x28, 0xc7, 0x08, 0xd8, 0xd0, 0x8c, 0xd6, 0xdb, //* ....=]..(....... */ 
+    /* 0x00001cd0 */ 0x40, 0xb4, 0xca, 0x32, 0xbf, 0x17, 0xc8, 0x72, 0xb3, 0x5e, 0x32, 0xd6, 0xd7, 0xbf, 0x9f, 0xca, //* @..2...r.^2..... */ 
+    /* 0x00001ce0 */ 0x4e, 0x9a, 0x83, 0xa1, 0x85, 0x02, 0xb6, 0x18, 0xf6, 0x9b, 0x22, 0xff, 0xae, 0x16, 0xd3, 0xe2, //* N........."..... */ 
+    /* 0x00001cf0 */ 0x15, 0x0c, 0x8f, 0x64, 0x9b, 0xf9, 0xec, 0xe7, 0xe7, 0xa7, 0x67, 0x6c, 0x3c, 0x25, 0x55, 0x65, //* ...d......gl<%Ue */ 
+    /* 0x00001d00 */ 0x92, 0xdb, 0xde, 0x2e, 0x0c, 0xaa, 0x31, 0xfa, 0xe7, 0xf1, 0xb4, 0xbf, 0xea, 0xd8, 0xe2, 0xfe, //* ......1......... */ 
+    /* 0x00001d10 */ 0x8f, 0xef, 0x91, 0xe2, 0x2a, 0xaf, 0xbb, 0xbb, 0x7b, 0x99, 0x32, 0x6f, 0x76, 0xb7, 0x36, 0x3f, //* ....*...{.2ov.6? */ 
+    /* 0x00001d20 */ 0x66, 0x62, 0x02, 0x23, 0x5b, 0x3c, 0x20, 0xbb, 0x89, 0x8f, 0x03, 0x7e, 0x03, 0xd8, 0x0c, 0x84, //* fb.#[< ....~.... */ 
+    /* 0x00001d30 */ 0x47, 0xd6, 0x35, 0x36, 0x56, 0xd6, 0x2a, 0xe2, 0xdc, 0x47, 0x44, 0x44, 0x14, 0xf1, 0xbd, 0xe7, //* G.56V.*..GDD.... */ 
+    /* 0x00001d40 */ 0xac, 0xaa, 0xaa, 0xa2, 0x86, 0x4f, 0xa5, 0xa0, 0xa0, 0x78, 0x1a, 0x5a, 0x1b, 0x7b, 0xa5, 0xf3, //* .....O...x.Z.{.. */ 
+    /* 0x00001d50 */ 0xbe, 0x3d, 0xc9, 0xc3, 0x36, 0x95, 0x6f, 0x76, 0x30, 0x9a, 0x53, 0xce, 0x14, 0x78, 0x23, 0x6b, //* .=..6.ov0.S..x#k */ 
+    /* 0x00001d60 */ 0x5c, 0x4a, 0xa1, 0xd7, 0x56, 0x58, 0x18, 0x22, 0x26, 0x26, 0xf6, 0x9e, 0x97, 0xf7, 0x97, 0x3a, //* \J..VX."&&.....: */ 
+    /* 0x00001d70 */ 0xc8, 0x80, 0xcf, 0xd1, 0x5a, 0x5f, 0x9f, 0x95, 0x5a, 0x2c, 0xe6, 0x20, 0x08, 0x11, 0x7d, 0xe0, //* ....Z_..Z,. ..}. */ 
+    /* 0x00001d80 */ 0xca, 0x62, 0x38, 0xb6, 0x68, 0xd8, 0x58, 0xa5, 0xda, 0xf0, 0x88, 0x2d, 0xdb, 0xd5, 0xc9, 0xc9, //* .b8.h.X....-.... */ 
+    /* 0x00001d90 */ 0xd4, 0xdb, 0x5b, 0x28, 0x9e, 0x4a, 0x74, 0x6c, 0xe1, 0x8b, 0x61, 0x99, 0x7a, 0xc5, 0x07, 0xe2, //* ..[(.Jtl..a.z... */ 
+    /* 0x00001da0 */ 0xa3, 0x00, 0x77, 0x4d, 0x0f, 0x49, 0xdd, 0x36, 0x37, 0x16, 0x7c, 0x7c, 0xfc, 0x87, 0xfb, 0x8b, //* ..wM.I.67.||.... */ 
+    /* 0x00001db0 */ 0x1d, 0xd6, 0x53, 0x0c, 0x40, 0xc0, 0x79, 0x5b, 0x26, 0x2c, 0x3c, 0xbc, 0xbe, 0xa3, 0x23, 0xd3, //* ..S.@.y[&,<...#. */ 
+    /* 0x00001dc0 */ 0xae, 0x31, 0x9d, 0xb5, 0x51, 0x9e, 0x8e, 0xa0, 0xca, 0x93, 0x50, 0x8e, 0x91, 0x91, 0xd1, 0xe5, //* .1..Q.....P..... */ 
+    /* 0x00001dd0 */ 0x72, 0x77, 0x14, 0xa1, 0xc6, 0xa4, 0x19, 0x6b, 0x83, 0x8f, 0xe8, 0xf7, 0xea, 0x9d, 0x0f, 0xa9, //* rw.....k........ */ 
+    /* 0x00001de0 */ 0xaa, 0x09, 0x79, 0x7c, 0xe7, 0xe5, 0x1b, 0x14, 0xb2, 0x5e, 0x7a, 0x06, 0x86, 0x0b, 0x61, 0xfb, //* ..y|.....^z...a. */ 
+    /* 0x00001df0 */ 0xa7, 0x81, 0xa8, 0x82, 0x8f, 0xf1, 0x54, 0x18, 0x18, 0x18, 0x96, 0xca, 0xca, 0x58, 0x90, 0x6c, //* ......T......X.l */ 
+    /* 0x00001e00 */ 0x51, 0x03, 0x33, 0x11, 0xa3, 0x3d, 0x12, 0x1e, 0x0f, 0xb6, 0xe7, 0x27, 0x65, 0xe7, 0x55, 0x3e, //* Q.3..=.....'e.U> */ 
+    /* 0x00001e10 */ 0xa5, 0x1e, 0x45, 0xa0, 0xc3, 0xf3, 0x55, 0xcc, 0x68, 0xa9, 0xf2, 0x41, 0xc1, 0xf8, 0x10, 0xa1, //* ..E...U.h..A.... */ 
+    /* 0x00001e20 */ 0xe3, 0x64, 0xad, 0x95, 0x87, 0xc3, 0xb8, 0x63, 0x64, 0x62, 0x42, 0x91, 0x4a, 0xdc, 0xff, 0x89, //* .d.....cdbB.J... */ 
+    /* 0x00001e30 */ 0x23, 0x71, 0x84, 0xf7, 0xcb, 0xe2, 0xf9, 0x8b, 0xdf, 0x64, 0x88, 0x5a, 0x95, 0xb6, 0x46, 0xd5, //* #q.......d.Z..F. */ 
+    /* 0x00001e40 */ 0xec, 0x5a, 0xbd, 0x2c, 0x0d, 0x59, 0xb4, 0x4f, 0x68, 0x3e, 0xd8, 0x06, 0x92, 0x5d, 0x94, 0x98, //* .Z.,.Y.Oh>...].. */ 
+    /* 0x00001e50 */ 0x88, 0xbf, 0xda, 0xf0, 0x19, 0xbf, 0xc0, 0x00, 0xf4, 0xfa, 0x8e, 0xe3, 0x4e, 0xcc, 0x04, 0x73, //* ............N..s */ 
+    /* 0x00001e60 */ 0xe7, 0xe4, 0xe4, 0xc4, 0x7b, 0xef, 0xe0, 0xa0, 0x7f, 0x65, 0x85, 0xec, 0xe6, 0xd8, 0x40, 0x8a, //* ....{....e....@. */ 
+    /* 0x00001e70 */ 0x35, 0x49, 0x13, 0xd5, 0xb2, 0x32, 0x52, 0x48, 0x89, 0x80, 0x88, 0x88, 0x86, 0x9d, 0x9d, 0xaa, //* 5I...2RH........ */ 
+    /* 0x00001e80 */ 0x4a, 0xbf, 0xb1, 0x0f, 0xba, 0xda, 0x0c, 0x02, 0x3e, 0x7f, 0xfe, 0x7c, 0x7e, 0x7b, 0x1b, 0x26, //* J.......>..|~{.& */ 
+    /* 0x00001e90 */ 0xa5, 0x16, 0x92, 0x27, 0x1d, 0x6e, 0x3e, 0x14, 0x73, 0x64, 0x3b, 0x9d, 0x9b, 0x47, 0xe2, 0x87, //* ...'.n>.sd;..G.. */ 
+    /* 0x00001ea0 */ 0x05, 0xfc, 0x5d, 0xf8, 0x15, 0xae, 0x20, 0x99, 0x52, 0x13, 0xd0, 0xbd, 0xbf, 0xe5, 0xe6, 0x6a, //* ..]... .R......j */ 
+    /* 0x00001eb0 */ 0x10, 0x9c, 0x4f, 0x8b, 0xd8, 0xf5, 0xfa, 0xf2, 0x8f, 0x15, 0xb7, 0x12, 0xa4, 0x19, 0x59, 0x7b, //* ..O...........Y{ */ 
+    /* 0x00001ec0 */ 0x3f, 0xce, 0xd1, 0xdd, 0xb3, 0xbe, 0x4e, 0x09, 0x6c, 0x9e, 0x9c, 0x60, 0xd8, 0xd8, 0xd8, 0x5c, //* ?.....N.l..`...\ */ 
+    /* 0x00001ed0 */ 0x74, 0x0d, 0xc5, 0x53, 0xc7, 0x4f, 0x65, 0x09, 0x4b, 0x97, 0x69, 0x06, 0x11, 0x4c, 0x17, 0x45, //* t..S.Oe.K.i..L.E */ 
+    /* 0x00001ee0 */ 0xf3, 0x35, 0x44, 0x86, 0xd0, 0x00, 0x65, 0x32, 0x68, 0x65, 0x32, 0x41, 0xcb, 0xc8, 0x77, 0x5b, //* .5D...e2he2A..w[ */ 
+    /* 0x00001ef0 */ 0x27, 0xdb, 0x31, 0xfa, 0x8c, 0xc5, 0xa9, 0x62, 0x7e, 0x42, 0xe6, 0xe6, 0xe6, 0xea, 0x3b, 0x3b, //* '.1....b~B....;; */ 
+    /* 0x00001f00 */ 0x3b, 0xa2, 0xc6, 0x2f, 0xdb, 0xab, 0xc3, 0xb2, 0xb1, 0xf8, 0x07, 0x98, 0x71, 0x94, 0xc2, 0xc9, //* ;../........q... */ 
+    /* 0x00001f10 */ 0x54, 0x54, 0x3e, 0xa9, 0x19, 0x19, 0x06, 0x45, 0x8d, 0xb6, 0x5d, 0xa5, 0x5e, 0x74, 0xb4, 0x99, //* TT>....E..].^t.. */ 
+    /* 0x00001f20 */ 0x7f, 0x26, 0x5f, 0xe2, 0xe8, 0x3e, 0xc6, 0xed, 0xf6, 0x06, 0x23, 0x3f, 0x40, 0x9b, 0xff, 0xbc, //* .&_..>....#?@... */ 
+    /* 0x00001f30 */ 0xec, 0x1d, 0x89, 0x7d, 0x3b, 0xa7, 0xb1, 0xaa, 0x63, 0xdb, 0x68, 0xc1, 0xed, 0xdd, 0xea, 0x7f, //* ...};...c.h..... */ 
+    /* 0x00001f40 */ 0x21, 0xcb, 0x1d, 0xea, 0xeb, 0x0b, 0x82, 0xc1, 0x7b, 0xf2, 0xbb, 0xde, 0x26, 0xe9, 0x2a, 0xc9, //* !.......{...&.*. */ 
+    /* 0x00001f50 */ 0x60, 0x30, 0x02, 0x97, 0x8e, 0x04, 0x17, 0xb7, 0xf7, 0xe7, 0x4f, 0x82, 0xd3, 0xe5, 0xda, 0x1d, //* `0........O..... */ 
+    /* 0x00001f60 */ 0x0e, 0xab, 0x96, 0x96, 0x96, 0xf3, 0x8a, 0x5f, 0xc5, 0xb3, 0x10, 0x48, 0x7c, 0xf7, 0xeb, 0x8b, //* ......._...H|... */ 
+    /* 0x00001f70 */ 0xf0, 0x70, 0xc0, 0x8b, 0x60, 0x70, 0x10, 0x9c, 0x9e, 0xfa, 0x23, 0x37, 0xe3, 0x7f, 0x18, 0x78, //* .p..`p....#7...x */ 
+    /* 0x00001f80 */ 0x9e, 0xae, 0x8d, 0xfe, 0x2a, 0x56, 0xde, 0xa9, 0xb2, 0x8d, 0x75, 0xf4, 0x51, 0x8e, 0xcb, 0xbc, //* ....*V....u.Q... */ 
+    /* 0x00001f90 */ 0xbd, 0xbd, 0xfd, 0xd5, 0x11, 0xda, 0x61, 0xd7, 0x84, 0x84, 0x60, 0xbb, 0xa1, 0x9d, 0x90, 0x91, //* ......a...`..... */ 
+    /* 0x00001fa0 */ 0x31, 0x2e, 0xfe, 0xb2, 0x3c, 0x08, 0x11, 0xa7, 0x86, 0x1c, 0x2f, 0xf5, 0xeb, 0x69, 0x17, 0xcf, //* 1...<...../..i.. */ 
+    /* 0x00001fb0 */ 0x44, 0xfc, 0x48, 0x4c, 0x6c, 0xb5, 0xf8, 0xe7, 0xe1, 0x2f, 0xe4, 0x44, 0x93, 0xc2, 0x61, 0xd2, //* D.HLl..../.D..a. */ 
+    /* 0x00001fc0 */ 0x9b, 0xc1, 0x4f, 0xe7, 0x75, 0x6a, 0x08, 0xf8, 0x5c, 0x1f, 0x8e, 0xc6, 0x92, 0xf3, 0x4d, 0xcf, //* ..O.uj..\.....M. */ 
+    /* 0x00001fd0 */ 0x6c, 0xcd, 0xb1, 0x12, 0xf2, 0x59, 0x4f, 0x90, 0xc8, 0xca, 0x6e, 0x58, 0x0e, 0x45, 0xbb, 0x79, //* l....YO...nX.E.y */ 
+    /* 0x00001fe0 */ 0x7f, 0xb3, 0xcd, 0xe7, 0xd2, 0xa4, 0x98, 0x4c, 0xe7, 0xc5, 0x0f, 0x1e, 0xd0, 0x44, 0xc9, 0xab, //* .......L.....D.. */ 
+    /* 0x00001ff0 */ 0xe3, 0xbc, 0x3d, 0xfb, 0x03, 0xb9, 0xbe, 0x76, 0x0b, 0x0b, 0x0d, 0x7d, 0xb6, 0xda, 0x16, 0x70, //* ..=....v...}...p */ 
+    /* 0x00002000 */ 0x58, 0xd3, 0x65, 0x37, 0xee, 0x88, 0x30, 0x36, 0x46, 0x26, 0x25, 0x23, 0xeb, 0xa3, 0x0e, 0x30, //* X.e7..06F&%#...0 */ 
+    /* 0x00002010 */ 0xec, 0x21, 0x7c, 0xab, 0x7d, 0x99, 0x1a, 0x8f, 0x6d, 0x64, 0x68, 0xd8, 0xe2, 0xf6, 0xc0, 0x2d, //* .!|.}...mdh....- */ 
+    /* 0x00002020 */ 0x16, 0x11, 0xbd, 0x73, 0x73, 0xbc, 0x45, 0x21, 0x6c, 0xcd, 0xd6, 0xd9, 0xd1, 0x99, 0x56, 0xe2, //* ...ss.E!l.....V. */ 
+    /* 0x00002030 */ 0x77, 0xf3, 0xc1, 0x5b, 0x9f, 0x8c, 0xdf, 0x61, 0x65, 0x64, 0x09, 0xb7, 0xe9, 0x48, 0xeb, 0x0b, //* w..[...aed...H.. */ 
+    /* 0x00002040 */ 0x6a, 0x3f, 0x12, 0xd6, 0x49, 0xc0, 0xfd, 0x30, 0x35, 0x71, 0x2a, 0x36, 0x09, 0x27, 0x0e, 0x8c, //* j?..I..05q*6.'.. */ 
+    /* 0x00002050 */ 0x84, 0x11, 0xf1, 0xf1, 0xfd, 0xbf, 0xba, 0x1d, 0x3e, 0xcc, 0x15, 0x2b, 0xcd, 0x54, 0xa6, 0xbd, //* ........>..+.T.. */ 
+    /* 0x00002060 */ 0xa3, 0xa5, 0x2b, 0x98, 0xce, 0x95, 0x84, 0x6f, 0xb0, 0x5b, 0x40, 0xf3, 0xf6, 0x7e, 0x3c, 0xbf, //* ..+....o.[@..~<. */ 
+    /* 0x00002070 */ 0xba, 0x92, 0x76, 0xfe, 0xcc, 0x45, 0xc4, 0xa1, 0x1f, 0xf2, 0x23, 0xdf, 0xfc, 0xe4, 0xe2, 0x5c, //* ..v..E....#....\ */ 
+    /* 0x00002080 */ 0xa2, 0xfd, 0x16, 0xba, 0xb5, 0x7d, 0x62, 0x58, 0xb4, 0x19, 0x9b, 0xc1, 0x67, 0xd6, 0x17, 0x72, //* .....}bX....g..r */ 
+    /* 0x00002090 */ 0xc1, 0x3c, 0x02, 0x19, 0x86, 0x3d, 0x1f, 0xdc, 0xe8, 0x4c, 0x07, 0xa7, 0x4c, 0x93, 0xf1, 0xdb, //* .<...=...L..L... */ 
+    /* 0x000020a0 */ 0x62, 0x52, 0x00, 0x40, 0xbd, 0x0d, 0x64, 0x68, 0xad, 0xf5, 0xca, 0xf4, 0xeb, 0xd7, 0x10, 0x78, //* bR.@..dh.......x */ 
+    /* 0x000020b0 */ 0x64, 0x2c, 0xd3, 0xc9, 0xf4, 0xf2, 0x8d, 0x49, 0x2a, 0x1f, 0x51, 0x1c, 0xd7, 0x03, 0x2c, 0x18, //* d,.....I*.Q...,. */ 
+    /* 0x000020c0 */ 0xc3, 0x68, 0x12, 0xad, 0xe8, 0xc4, 0xc5, 0xb1, 0x73, 0xfc, 0x6e, 0x49, 0xe5, 0xe5, 0xa3, 0x9c, //* .h......s.nI.... */ 
+    /* 0x000020d0 */ 0x1f, 0x1b, 0xc4, 0x85, 0xdc, 0x4e, 0x42, 0xb4, 0x57, 0x24, 0x78, 0x39, 0x66, 0xeb, 0x6b, 0xbc, //* .....NB.W$x9f.k. */ 
+    /* 0x000020e0 */ 0xe6, 0x64, 0x1b, 0x6c, 0x1f, 0x40, 0x63, 0x63, 0x63, 0x38, 0x14, 0x14, 0x18, 0x77, 0xee, 0xa7, //* .d.l.@ccc8...w.. */ 
+    /* 0x000020f0 */ 0xad, 0x6f, 0x7a, 0xdf, 0x38, 0xb8, 0x1f, 0x2f, 0xac, 0x66, 0xbf, 0x4d, 0xf9, 0xb2, 0x9d, 0xd7, //* .oz.8../.f.M.... */ 
+    /* 0x00002100 */ 0x4d, 0x6b, 0xdc, 0x28, 0x01, 0xf4, 0x10, 0xf5, 0x3c, 0x0a, 0xba, 0xee, 0x2b, 0x66, 0xf2, 0x7e, //* Mk.(....<...+f.~ */ 
+    /* 0x00002110 */ 0x61, 0x14, 0xf2, 0x38, 0x09, 0xb9, 0xbc, 0xe4, 0xae, 0x34, 0x68, 0xa6, 0x32, 0x33, 0x33, 0x3b, //* a..8.....4h.233; */ 
+    /* 0x00002120 */ 0x5c, 0x69, 0x7c, 0x4b, 0x10, 0x8a, 0x86, 0x80, 0x84, 0xb8, 0x7d, 0xb1, 0x33, 0xbc, 0xdc, 0xed, //* \i|K......}.3... */ 
+    /* 0x00002130 */ 0x48, 0xbd, 0xd2, 0xe4, 0x18, 0xdd, 0x13, 0x2d, 0xf9, 0x49, 0x4e, 0x79, 0x68, 0x9e, 0x74, 0xee, //* H......-.INyh.t. */ 
+    /* 0x00002140 */ 0x7b, 0xc2, 0x39, 0x8a, 0x0e, 0xbb, 0x51, 0x50, 0x59, 0x19, 0xe9, 0xcb, 0xfd, 0x8e, 0x67, 0xed, //* {.9...QPY.....g. */ 
+    /* 0x00002150 */ 0xe6, 0x2d, 0x74, 0xd5, 0x0c, 0xd6, 0xfc, 0xe1, 0x46, 0x27, 0x32, 0x2d, 0x1d, 0x1d, 0x97, 0xfb, //* .-t.....F'2-.... */ 
+    /* 0x00002160 */ 0x5f, 0x4d, 0x2e, 0x53, 0x46, 0x60, 0xbe, 0x5c, 0x0b, 0x59, 0x4c, 0xec, 0xe3, 0x74, 0xbd, 0x8d, //* _M.SF`.\.YL..t.. */ 
+    /* 0x00002170 */ 0x8a, 0x8c, 0x8c, 0x8c, 0xe9, 0xe3, 0xf5, 0xd1, 0xc8, 0xe8, 0x28, 0xee, 0x9c, 0x4e, 0x95, 0x3e, //* ..........(..N.> */ 
+    /* 0x00002180 */ 0x62, 0x1a, 0x1b, 0x39, 0x26, 0x39, 0x5f, 0x4f, 0x6e, 0x6f, 0x30, 0x8e, 0x8f, 0x38, 0x91, 0xa4, //* b..9&9_Ono0..8.. */ 
+    /* 0x00002190 */ 0xa4, 0x64, 0xc2, 0xa8, 0x65, 0x8b, 0xef, 0x03, 0xf7, 0x62, 0xa5, 0x5e, 0xa8, 0x18, 0xf5, 0xdd, //* .d..e....b.^.... */ 
+    /* 0x000021a0 */ 0xa0, 0x63, 0x37, 0x34, 0x24, 0x2d, 0x8d, 0x45, 0x36, 0x8e, 0x02, 0x64, 0x55, 0x86, 0x27, 0xea, //* .c74$-.E6..dU.'. */ 
+    /* 0x000021b0 */ 0xed, 0x26, 0xed, 0xe5, 0x25, 0x88, 0x45, 0x71, 0xde, 0xd7, 0xe6, 0x7e, 0x3c, 0x05, 0xdc, 0xe3, //* .&..%.Eq...~<... */ 
+    /* 0x000021c0 */ 0xf6, 0x68, 0xd4, 0x6e, 0xea, 0x8c, 0x54, 0x50, 0xcd, 0x83, 0x68, 0xa8, 0x7b, 0x22, 0x4b, 0x4b, //* .h.n..TP..h.{"KK */ 
+    /* 0x000021d0 */ 0x4b, 0xcf, 0x8d, 0xda, 0x3d, 0x1a, 0xed, 0x97, 0x73, 0x25, 0x13, 0x67, 0x67, 0xf1, 0xde, 0xd7, //* K...=...s%.gg... */ 
+    /* 0x000021e0 */ 0x36, 0x85, 0xb5, 0xb6, 0x0a, 0xaa, 0xab, 0xab, 0xe3, 0x12, 0x12, 0x86, 0x16, 0x2b, 0x55, 0x6d, //* 6............+Um */ 
+    /* 0x000021f0 */ 0x41, 0xa1, 0xa1, 0x75, 0x75, 0x2e, 0x8a, 0x69, 0x22, 0xa8, 0xb7, 0xcf, 0x48, 0xf9, 0x9e, 0xbf, //* A..uu..i"...H... */ 
+    /* 0x00002200 */ 0x36, 0xce, 0x05, 0xbd, 0x09, 0xc6, 0x66, 0xd5, 0x31, 0x28, 0x85, 0x30, 0xe4, 0xe4, 0xe4, 0x48, //* 6.....f.1(.0...H */ 
+    /* 0x00002210 */ 0x78, 0x5d, 0x10, 0x7e, 0xca, 0x33, 0xc0, 0x78, 0xf6, 0x3d, 0x89, 0xa1, 0x3f, 0x4f, 0x3a, 0x5c, //* x].~.3.x.=..?O:\ */ 
+    /* 0x00002220 */ 0x4d, 0x5f, 0x3f, 0xaa, 0x37, 0x18, 0xd9, 0xec, 0xf6, 0xc4, 0xd1, 0xcc, 0xce, 0x2e, 0x6c, 0x7a, //* M_?.7.........lz */ 
+    /* 0x00002230 */ 0x1a, 0x87, 0xcd, 0xb8, 0x03, 0xe5, 0xdf, 0x2d, 0x34, 0xb4, 0xac, 0x8c, 0x85, 0xcf, 0xe1, 0x09, //* .......-4....... */ 
+    /* 0x00002240 */ 0x11, 0x9d, 0x98, 0x9d, 0x80, 0x2e, 0xfb, 0x96, 0x9a, 0x13, 0x27, 0x9a, 0x88, 0x7d, 0x00, 0x06, //* ..........'..}.. */ 
+    /* 0x00002250 */ 0x16, 0x97, 0xef, 0x3d, 0x4a, 0x29, 0x22, 0x48, 0xd8, 0xf3, 0x54, 0x26, 0x43, 0xbb, 0x6a, 0xfa, //* ...=J)"H..T&C.j. */ 
+    /* 0x00002260 */ 0x6e, 0x27, 0x5e, 0xad, 0x42, 0xd9, 0x5e, 0x77, 0xb1, 0xb9, 0x2f, 0x8e, 0xb2, 0x7b, 0x6b, 0xab, //* n'^.B.^w../..{k. */ 
+    /* 0x00002270 */ 0xff, 0xe3, 0xe1, 0x62, 0x23, 0xb9, 0xf5, 0x64, 0x7a, 0x64, 0xc3, 0xfc, 0x7b, 0xcb, 0xc2, 0x92, //* ...b#..dzd..{... */ 
+    /* 0x00002280 */ 0xbc, 0x8e, 0x4a, 0x8a, 0xae, 0x2e, 0xa6, 0x10, 0xa5, 0x0c, 0xbe, 0xc9, 0x25, 0x34, 0x3a, 0x9d, //* ..J.........%4:. */ 
+    /* 0x00002290 */ 0x3b, 0x95, 0x6e, 0x56, 0xe3, 0x8f, 0xe8, 0x65, 0x13, 0xf7, 0x30, 0x48, 0x1e, 0xaf, 0xa1, 0xff, //* ;.nV...e..0H.... */ 
+    /* 0x000022a0 */ 0xb8, 0xf0, 0x12, 0xf1, 0x66, 0xf2, 0xa4, 0x91, 0x1b, 0x1c, 0x16, 0xc8, 0x4e, 0x4f, 0x4f, 0x4b, //* ....f.......NOOK */ 
+    /* 0x000022b0 */ 0x0d, 0x9a, 0xd9, 0xb7, 0xb7, 0xb7, 0x25, 0xf0, 0x9a, 0x9a, 0x9a, 0x22, 0xa2, 0xa3, 0xc3, 0x03, //* ......%....".... */ 
+    /* 0x000022c0 */ 0x03, 0x41, 0x8c, 0x4a, 0xe9, 0x11, 0x95, 0x95, 0x6c, 0xcc, 0x68, 0x84, 0xf7, 0xbe, 0x4f, 0x07, //* .A.J....l.h...O. */ 
+    /* 0x000022d0 */ 0x23, 0xe3, 0x93, 0x83, 0x95, 0x8e, 0xd6, 0x66, 0x03, 0x11, 0xdf, 0x51, 0x50, 0x50, 0x24, 0xa4, //* #......f...QPP$. */ 
+    /* 0x000022e0 */ 0xa4, 0x82, 0x74, 0xef, 0x6b, 0x2d, 0x86, 0xa7, 0xbb, 0x03, 0x02, 0x46, 0x5c, 0x5d, 0xcd, 0xcc, //* ..t.k-.....F\].. */ 
+    /* 0x000022f0 */ 0xcd, 0x83, 0x12, 0x36, 0x2b, 0x52, 0xb9, 0x07, 0xcb, 0xc6, 0x30, 0x5b, 0xaa, 0x9c, 0x3f, 0xf4, //* ...6+R....0[..?. */ 
+    /* 0x00002300 */ 0x15, 0x7c, 0x24, 0xb9, 0xf8, 0xfd, 0x69, 0x79, 0x79, 0x79, 0x73, 0x20, 0x72, 0xc7, 0xd6, 0xee, //* .|$...iyyys r... */ 
+    /* 0x00002310 */ 0x4b, 0xb4, 0x32, 0xa5, 0xf0, 0xf6, 0xe5, 0x9e, 0x42, 0x8b, 0xdf, 0x3f, 0x3e, 0x46, 0x95, 0xec, //* K.2.....B..?>F.. */ 
+    /* 0x00002320 */ 0xa0, 0x90, 0x10, 0x04, 0x82, 0x5d, 0xe2, 0xdc, 0x8e, 0x0e, 0x0c, 0xfb, 0x95, 0xa6, 0xfe, 0x12, //* .....].......... */ 
+    /* 0x00002330 */ 0x2c, 0xf8, 0xef, 0xa9, 0xa9, 0x11, 0xbd, 0xc1, 0x48, 0x07, 0x31, 0x94, 0xc2, 0x7c, 0x9f, 0xe7, //* ,.......H.1..|.. */ 
+    /* 0x00002340 */ 0x4b, 0xd5, 0xd6, 0x11, 0x78, 0xaf, 0x7c, 0xe3, 0x1e, 0x28, 0x50, 0x50, 0x04, 0x9a, 0xa9, 0x7a, //* K...x.|..(PP...z */ 
+    /* 0x00002350 */ 0xc6, 0x8b, 0x1f, 0xd0, 0xbc, 0x8c, 0xe0, 0x3e, 0x0b, 0x99, 0xef, 0x8e, 0x2c, 0x58, 0xc8, 0xc6, //* .......>....,X.. */ 
+    /* 0x00002360 */ 0xa7, 0x61, 0x01, 0x25, 0xca, 0xd9, 0xe7, 0x22, 0xd0, 0x33, 0x93, 0xb3, 0x83, 0x9c, 0x00, 0xaa, //* .a.%...".3...... */ 
+    /* 0x00002370 */ 0xf5, 0x62, 0x25, 0xf2, 0xd4, 0xd4, 0xd4, 0x5c, 0xe7, 0x44, 0x46, 0x81, 0x6f, 0xa6, 0xe2, 0x13, //* .b%....\.DF.o... */ 
+    /* 0x00002380 */ 0x13, 0x13, 0xe7, 0x9b, 0xbd, 0xf0, 0xd7, 0xa7, 0xeb, 0xc8, 0xef, 0x0c, 0x9a, 0xa4, 0x36, 0x07, //* ..............6. */ 
+    /* 0x00002390 */ 0xd1, 0x49, 0xf8, 0x1d, 0x28, 0xbe, 0xda, 0xdb, 0x6f, 0xee, 0xb8, 0x62, 0xf0, 0x3b, 0xc8, 0x9a, //* .I..(...o..b.;.. */ 
+    /* 0x000023a0 */ 0xed, 0x8d, 0x25, 0xa9, 0x56, 0x8c, 0x5f, 0xcc, 0xa9, 0x88, 0xf7, 0x4e, 0x55, 0x0b, 0xfa, 0xfa, //* ..%.V._....NU... */ 
+    /* 0x000023b0 */ 0xc6, 0x45, 0x89, 0xef, 0xee, 0xbe, 0x47, 0x2c, 0x90, 0x8d, 0x1f, 0x8a, 0xc4, 0x67, 0x72, 0xbe, //* .E....G,.....gr. */ 
+    /* 0x000023c0 */ 0x9f, 0x7e, 0x73, 0xe1, 0x9b, 0x23, 0xe6, 0xc7, 0xe9, 0xbc, 0x2d, 0x53, 0x58, 0x54, 0x9c, 0xeb, //* .~s..#....-SXT.. */ 
+    /* 0x000023d0 */ 0x73, 0x47, 0x15, 0x11, 0xd7, 0x85, 0x98, 0x54, 0x4e, 0x41, 0xf7, 0x31, 0x46, 0xc6, 0xce, 0x9b, //* sG.....TNA.1F... */ 
+    /* 0x000023e0 */ 0x2c, 0x28, 0xf8, 0xd7, 0x76, 0x3d, 0x24, 0x6c, 0xc7, 0x41, 0x11, 0x23, 0x99, 0xdd, 0x20, 0x10, //* ,(..v=$l.A.#.. . */ 
+    /* 0x000023f0 */ 0x9d, 0x78, 0xaa, 0x40, 0xe5, 0x4c, 0x6c, 0xb9, 0xcb, 0x4f, 0x58, 0x3e, 0x49, 0x7e, 0x40, 0xdc, //* .x.@.Ll..OX>I~@. */ 
+    /* 0x00002400 */ 0x37, 0x62, 0xa7, 0xab, 0x6b, 0x18, 0xc4, 0x86, 0x78, 0x8e, 0xd0, 0x13, 0xb2, 0x37, 0xae, 0xcd, //* 7b..k...x....7.. */ 
+    /* 0x00002410 */ 0xf6, 0x65, 0xa6, 0xce, 0x2a, 0xbc, 0xd0, 0x26, 0xb2, 0x6e, 0xa1, 0x42, 0xdb, 0xef, 0x55, 0x08, //* .e..*..&.n.B..U. */ 
+    /* 0x00002420 */ 0xe9, 0x66, 0x69, 0xc6, 0x4a, 0xc9, 0xc3, 0x59, 0xcf, 0xbd, 0x78, 0xe9, 0x63, 0xa7, 0xb7, 0xa8, //* .fi.J..Y..x.c... */ 
+    /* 0x00002430 */ 0xd7, 0x25, 0xbd, 0xcb, 0x56, 0x1f, 0x62, 0x3d, 0x1e, 0x1e, 0x1e, 0x1f, 0xfc, 0x79, 0xab, 0x07, //* .%..V.b=.....y.. */ 
+    /* 0x00002440 */ 0x74, 0x45, 0x43, 0x5c, 0xbc, 0xdb, 0x21, 0x4b, 0xc8, 0x93, 0x2f, 0x1c, 0xe1, 0x70, 0xb5, 0x84, //* tEC\..!K../..p.. */ 
+    /* 0x00002450 */ 0xff, 0xef, 0x42, 0x45, 0x78, 0x65, 0xe5, 0xd7, 0x52, 0x4d, 0x56, 0xdd, 0x54, 0x03, 0xd3, 0xcb, //* ..BExe..RMV.T... */ 
+    /* 0x00002460 */ 0xdd, 0xd1, 0x84, 0x71, 0x57, 0x2e, 0xfb, 0x15, 0x4d, 0x0c, 0x37, 0xa7, 0x9e, 0x94, 0xc4, 0xae, //* ...qW...M.7..... */ 
+    /* 0x00002470 */ 0x81, 0x9b, 0xe3, 0x25, 0xe7, 0xc7, 0x06, 0xea, 0xfd, 0x89, 0x2c, 0x6c, 0x0b, 0x0b, 0x8b, 0xdd, //* ...%......,l.... */ 
+    /* 0x00002480 */ 0x83, 0x03, 0xba, 0x77, 0xef, 0x30, 0xa7, 0xbb, 0xde, 0x0e, 0x0c, 0x0f, 0x23, 0xdf, 0x9d, 0xad, //* ...w.0......#... */ 
+    /* 0x00002490 */ 0xe3, 0x3b, 0x9a, 0x1e, 0x4c, 0x65, 0xd9, 0xce, 0xe4, 0x23, 0xa2, 0x11, 0x7e, 0xb8, 0xdf, 0x0c, //* .;..Le...#..~... */ 
+    /* 0x000024a0 */ 0x26, 0x42, 0x89, 0x8f, 0x00, 0xcb, 0xd0, 0x4a, 0xb6, 0x96, 0x63, 0x44, 0x13, 0x71, 0xc8, 0xfc, //* &B.....J..cD.q.. */ 
+    /* 0x000024b0 */ 0x32, 0xee, 0x9c, 0x69, 0xf7, 0xe4, 0xc0, 0x20, 0xe5, 0xc6, 0xf0, 0xf0, 0x98, 0xdc, 0xf2, 0xbc, //* 2..i... ........ */ 
+    /* 0x000024c0 */ 0xa4, 0x17, 0x3b, 0x59, 0xc1, 0x1c, 0x64, 0x60, 0x10, 0x78, 0x3a, 0xc0, 0xfd, 0xfa, 0xa7, 0x4b, //* ..;Y..d`.x:....K */ 
+    /* 0x000024d0 */ 0x94, 0x8b, 0x9d, 0x7d, 0x0a, 0xb5, 0x47, 0x1f, 0x70, 0xb1, 0xaf, 0xad, 0x35, 0x33, 0xcb, 0xcb, //* ...}..G.p...53.. */ 
+    /* 0x000024e0 */ 0x76, 0x69, 0x35, 0x34, 0xb7, 0xb7, 0x17, 0x95, 0x61, 0x87, 0xe0, 0x5a, 0x72, 0xff, 0x36, 0x91, //* vi54....a..Zr.6. */ 
+    /* 0x000024f0 */ 0x5e, 0x7f, 0x4e, 0xe9, 0xb8, 0x24, 0x9a, 0x2d, 0x52, 0x20, 0xee, 0x96, 0x0c, 0x46, 0x8a, 0xc7, //* ^.N..$.-R ...F.. */ 
+    /* 0x00002500 */ 0xc0, 0xc2, 0x7a, 0x39, 0x1a, 0x8a, 0x8d, 0x88, 0xd5, 0xe7, 0xd5, 0x18, 0x58, 0x59, 0x69, 0x93, //* ..z9........XYi. */ 
+    /* 0x00002510 */ 0xd4, 0xd7, 0x5f, 0x71, 0x01, 0x5c, 0xb1, 0xa8, 0x44, 0x72, 0x75, 0x8a, 0xd9, 0xa4, 0x73, 0xe2, //* .._q.\..Dru...s. */ 
+    /* 0x00002520 */ 0xc5, 0xc3, 0x64, 0x68, 0x7b, 0xb3, 0x3b, 0xa9, 0x12, 0xac, 0xac, 0xe9, 0x58, 0x58, 0x70, 0x2b, //* ..dh{.;.....XXp+ */ 
+    /* 0x00002530 */ 0x74, 0x7e, 0x49, 0x79, 0x7b, 0x0b, 0x89, 0xdc, 0x7a, 0x9b, 0x5f, 0x1f, 0xaa, 0xd9, 0xae, 0xb5, //* t~Iy{...z._..... */ 
+    /* 0x00002540 */ 0xe0, 0xb2, 0x9b, 0xb4, 0xa1, 0x21, 0x23, 0x23, 0x0b, 0x08, 0x09, 0xd1, 0x70, 0x5f, 0x32, 0x26, //* .....!##....p_2& */ 
+    /* 0x00002550 */ 0xbf, 0x33, 0x88, 0x33, 0x68, 0xce, 0x1f, 0xac, 0xfb, 0x18, 0x4f, 0x15, 0x5b, 0xa4, 0x90, 0x92, //* .3.3h.....O.[... */ 
+    /* 0x00002560 */ 0xef, 0x73, 0x77, 0xaa, 0x5a, 0xb1, 0x80, 0x82, 0x8e, 0x1e, 0xdc, 0x7c, 0xf7, 0xa6, 0xc1, 0x61, //* .sw.Z......|...a */ 
+    /* 0x00002570 */ 0x9d, 0x0c, 0x0f, 0x75, 0x73, 0xcf, 0x1d, 0x08, 0x46, 0xc2, 0x94, 0xf4, 0xf6, 0x26, 0xdb, 0xa6, //* ...us...F....&.. */ 
+    /* 0x00002580 */ 0x1e, 0xb2, 0xd8, 0x5f, 0x32, 0xe9, 0x1f, 0x19, 0x21, 0x99, 0x2b, 0x81, 0x48, 0xb8, 0xb9, 0xbd, //* ..._2...!.+.H... */ 
+    /* 0x00002590 */ 0xf7, 0x38, 0x5d, 0x2b, 0x5a, 0x6b, 0x86, 0xb8, 0xa2, 0x83, 0x95, 0x92, 0x10, 0x2e, 0x3c, 0xdd, //* .8]+Zk........<. */ 
+    /* 0x000025a0 */ 0xe0, 0x13, 0x30, 0x68, 0x14, 0xf8, 0xb7, 0xba, 0xf7, 0x92, 0xd0, 0x11, 0xc0, 0x98, 0x60, 0xef, //* ..0h..........`. */ 
+    /* 0x000025b0 */ 0xd7, 0x70, 0x4f, 0x91, 0xdf, 0xf0, 0xba, 0x65, 0x25, 0xf1, 0x81, 0x92, 0x81, 0x3a, 0xff, 0x91, //* .pO....e%....:.. */ 
+    /* 0x000025c0 */ 0xda, 0x72, 0xb4, 0xee, 0x3c, 0x69, 0x4e, 0xd3, 0xed, 0xef, 0x1a, 0x29, 0xcb, 0xe8, 0x28, 0x4a, //* .r..<iN....)..(J */ 
+    /* 0x000025d0 */ 0xbb, 0x07, 0xa5, 0xc3, 0x97, 0x45, 0x9a, 0x23, 0x3d, 0xbc, 0x5d, 0x41, 0xc1, 0x54, 0x9e, 0x03, //* .....E.#=.]A.T.. */ 
+    /* 0x000025e0 */ 0xe1, 0x86, 0xaf, 0xbf, 0xd5, 0xd9, 0x68, 0xe8, 0xe8, 0xe0, 0x87, 0xe3, 0x28, 0xfb, 0xcf, 0x02, //* ......h.....(... */ 
+    /* 0x000025f0 */ 0x4e, 0xfa, 0x20, 0xe2, 0xef, 0x7a, 0x0f, 0x67, 0x0a, 0x54, 0x9b, 0x1d, 0x8c, 0x50, 0x82, 0x68, //* N. ..z.g.T...P.h */ 
+    /* 0x00002600 */ 0xca, 0xfb, 0x7e, 0xff, 0xe6, 0xce, 0x14, 0xf6, 0x24, 0xe2, 0x77, 0x94, 0xd9, 0x3e, 0xed, 0x24, //* ..~.....$.w..>.$ */ 
+    /* 0x00002610 */ 0x09, 0x09, 0xff, 0xd3, 0x53, 0xbd, 0xde, 0x7e, 0xf1, 0xf4, 0x9b, 0x07, 0xc3, 0x85, 0x22, 0x64, //* ....S..~......"d */ 
+    /* 0x00002620 */ 0xba, 0x06, 0x67, 0xfe, 0x97, 0x09, 0xb5, 0xeb, 0xfe, 0x44, 0x67, 0x61, 0xa3, 0xd4, 0x0c, 0x1b, //* ..g......Dga.... */ 
+    /* 0x00002630 */ 0xf9, 0x13, 0x36, 0xcf, 0x94, 0xea, 0x9f, 0xc3, 0x99, 0x53, 0xa3, 0x76, 0x2f, 0x7e, 0xc6, 0xb0, //* ..6......S.v/~.. */ 
+    /* 0x00002640 */ 0xea, 0xea, 0xea, 0xeb, 0xdb, 0x5b, 0x6b, 0x18, 0x2e, 0xcb, 0x35, 0x6a, 0x16, 0xb7, 0x27, 0x0f, //* .....[k...5j..'. */ 
+    /* 0x00002650 */ 0xb8, 0x90, 0x4c, 0xc1, 0xfe, 0xed, 0x6d, 0x3c, 0xb4, 0x20, 0x9a, 0xc7, 0x62, 0x9d, 0x89, 0xc7, //* ..L...m<. ..b... */ 
+    /* 0x00002660 */ 0x05, 0x3b, 0xde, 0xfa, 0xfa, 0xfa, 0xc1, 0x33, 0x42, 0xf4, 0xc0, 0xf4, 0x46, 0x66, 0xa5, 0x8e, //* .;.....3B...Ff.. */ 
+    /* 0x00002670 */ 0x4a, 0xc3, 0xd6, 0xcc, 0xab, 0xfd, 0xa9, 0x1d, 0xe4, 0x77, 0x62, 0x9b, 0x03, 0x72, 0x1a, 0xdf, //* J........wb..r.. */ 
+    /* 0x00002680 */ 0x2e, 0x77, 0x51, 0x1d, 0xd6, 0xdb, 0x8a, 0xcc, 0xa5, 0xdf, 0x12, 0xf7, 0xd0, 0xae, 0x67, 0x3c, //* .wQ...........g< */ 
+    /* 0x00002690 */ 0x96, 0x7c, 0xa3, 0x7c, 0xb7, 0x2b, 0xde, 0x8b, 0xd2, 0x63, 0x0e, 0x4c, 0x7d, 0x8c, 0xa3, 0xe0, //* .|.|.+...c.L}... */ 
+    /* 0x000026a0 */ 0x62, 0x66, 0x61, 0x0f, 0x2b, 0xaf, 0xa4, 0x88, 0x4f, 0xcc, 0x96, 0x2a, 0xd3, 0xec, 0x2b, 0x2e, //* bfa.+...O..*..+. */ 
+    /* 0x000026b0 */ 0xc3, 0x64, 0x54, 0x4c, 0x05, 0x17, 0x2b, 0xf1, 0x3a, 0x9a, 0x56, 0x74, 0xf0, 0x15, 0x0b, 0xb3, //* .dTL..+.:.Vt.... */ 
+    /* 0x000026c0 */ 0x54, 0x4a, 0xb0, 0x26, 0xe5, 0x77, 0x28, 0x46, 0xd6, 0x7c, 0x59, 0xaa, 0x75, 0x3d, 0x70, 0x50, //* TJ.&.w(F.|Y.u=pP */ 
+    /* 0x000026d0 */ 0xcc, 0x10, 0xc2, 0x6c, 0xfc, 0x3b, 0xdf, 0x57, 0x94, 0x4b, 0x43, 0x42, 0x4e, 0xbe, 0x53, 0x10, //* ...l.;.W.KCBN.S. */ 
+    /* 0x000026e0 */ 0xef, 0xbd, 0xb9, 0x29, 0x79, 0x96, 0x29, 0x1d, 0xde, 0x51, 0x02, 0x12, 0xd0, 0xd8, 0xdb, 0x0e, //* ...)y.)..Q...... */ 
+    /* 0x000026f0 */ 0x48, 0x58, 0xe2, 0x2a, 0x7d, 0x65, 0xd2, 0x8d, 0x23, 0xe5, 0xd9, 0xaf, 0xdf, 0x1b, 0xd7, 0x71, //* HX.*}e..#......q */ 
+    /* 0x00002700 */ 0xd3, 0xaa, 0x58, 0x50, 0xe7, 0xe0, 0xe0, 0x78, 0x6f, 0xb7, 0x46, 0x22, 0xea, 0x7d, 0x3b, 0xd0, //* ..XP...xo.F".};. */ 
+    /* 0x00002710 */ 0xfc, 0xc7, 0x37, 0x9a, 0xc2, 0x8b, 0xcf, 0x50, 0xa7, 0xb5, 0x6f, 0x7e, 0x9e, 0xe0, 0xac, 0xf3, //* ..7....P..o~.... */ 
+    /* 0x00002720 */ 0x8e, 0x0a, 0x03, 0x03, 0xe3, 0xa5, 0xce, 0x14, 0x15, 0x6a, 0xca, 0x90, 0x64, 0x47, 0x04, 0xa7, //* .........j..dG.. */ 
+    /* 0x00002730 */ 0xa1, 0xae, 0x5e, 0xe3, 0x75, 0x45, 0x44, 0x4f, 0x4f, 0x6f, 0x7a, 0x34, 0x9b, 0x33, 0x53, 0x60, //* ..^.uEDOOoz4.3S` */ 
+    /* 0x00002740 */ 0xe3, 0xc9, 0x4c, 0x80, 0x56, 0xa9, 0xb7, 0x13, 0x65, 0x31, 0xec, 0x5b, 0xc7, 0xc6, 0xc6, 0x96, //* ..L.V...e1.[.... */ 
+    /* 0x00002750 */ 0x1f, 0x8e, 0x41, 0xb9, 0x66, 0x9e, 0xb0, 0xb3, 0x39, 0xc3, 0xc0, 0x50, 0x64, 0x1d, 0x19, 0xa9, //* ..A.f...9..Pd... */ 
+    /* 0x00002760 */ 0x42, 0x07, 0x74, 0xf8, 0x3a, 0xfe, 0x79, 0xe5, 0xec, 0x37, 0x32, 0x5a, 0x2a, 0x84, 0x6e, 0x40, //* B.t.:.y..72Z*.n@ */ 
+    /* 0x00002770 */ 0x7b, 0x07, 0x15, 0xfc, 0xa3, 0x90, 0xa6, 0x91, 0xc1, 0xf8, 0xe0, 0x35, 0xfb, 0xd5, 0xa6, 0xe8, //* {..........5.... */ 
+    /* 0x00002780 */ 0x37, 0x20, 0x1e, 0x6e, 0xee, 0x16, 0xb3, 0x7e, 0xa4, 0xa9, 0x74, 0xde, 0x68, 0xcf, 0xb3, 0x8d, //* 7 .n...~..t.h... */ 
+    /* 0x00002790 */ 0xaa, 0x59, 0xab, 0xb2, 0x79, 0xbb, 0xf2, 0x86, 0x8c, 0x4f, 0x0f, 0x0f, 0x0f, 0x22, 0x6e, 0x87, //* .Y..y....O..."n. */ 
+    /* 0x000027a0 */ 0x9c, 0x4c, 0x8a, 0xa9, 0x3d, 0x30, 0xda, 0x45, 0x7c, 0xb1, 0xc5, 0xa6, 0x1e, 0xd2, 0x49, 0x45, //* .L..=0.E|.....IE */ 
+    /* 0x000027b0 */ 0xa2, 0x04, 0xa9, 0x5e, 0xa0, 0x45, 0xbd, 0x9c, 0x9e, 0x1e, 0x53, 0x51, 0x8b, 0x3d, 0x31, 0x65, //* ...^.E....SQ.=1e */ 
+    /* 0x000027c0 */ 0x65, 0xe9, 0x88, 0xce, 0x74, 0x29, 0x3d, 0x06, 0xa4, 0x37, 0x7e, 0x59, 0x5f, 0x72, 0xed, 0xe7, //* e...t)=..7~Y_r.. */ 
+    /* 0x000027d0 */ 0x20, 0x8f, 0x86, 0xa6, 0x07, 0xd4, 0xe4, 0xf6, 0x09, 0x19, 0x45, 0x53, 0x82, 0xa5, 0x79, 0xba, //*  .........ES..y. */ 
+    /* 0x000027e0 */ 0xb2, 0x7b, 0x4b, 0x6d, 0x27, 0x57, 0x9d, 0x3e, 0x5d, 0xee, 0x4f, 0x66, 0x64, 0xbe, 0x3f, 0x52, //* .{Km'W.>].Ofd.?R */ 
+    /* 0x000027f0 */ 0x70, 0x58, 0x69, 0x88, 0xe4, 0x30, 0xee, 0xc0, 0x81, 0xa0, 0x07, 0xf5, 0xa4, 0xa6, 0x92, 0x28, //* pXi..0.........( */ 
+    /* 0x00002800 */ 0x67, 0x8b, 0xa4, 0x09, 0x7b, 0x9c, 0x98, 0x7a, 0x34, 0x29, 0xbe, 0xa5, 0x99, 0x64, 0xcf, 0x49, //* g...{..z4)...d.I */ 
+    /* 0x00002810 */ 0xd2, 0x0a, 0x66, 0x02, 0x86, 0x34, 0x59, 0xbb, 0xe1, 0xea, 0xfd, 0x9f, 0x1f, 0x1d, 0x3d, 0xdc, //* ..f..4Y.......=. */ 
+    /* 0x00002820 */ 0x8d, 0xfa, 0xab, 0x8d, 0xda, 0xbb, 0x92, 0x7e, 0x59, 0xf8, 0x59, 0x2c, 0x2f, 0xaf, 0xf8, 0x5f, //* .......~Y.Y,/.._ */ 
+    /* 0x00002830 */ 0xa9, 0xfd, 0xda, 0x90, 0x04, 0x84, 0x0e, 0x8b, 0xb5, 0xf2, 0xa9, 0xc1, 0x35, 0x55, 0x06, 0xcd, //* ............5U.. */ 
+    /* 0x00002840 */ 0x51, 0xce, 0xbf, 0xa3, 0xa3, 0xa2, 0x0e, 0x8f, 0x7d, 0x82, 0xfa, 0xc3, 0x03, 0x86, 0xae, 0x0e, //* Q.......}....... */ 
+    /* 0x00002850 */ 0x20, 0x5c, 0x0c, 0x7b, 0x82, 0xcd, 0x8e, 0x7f, 0xa6, 0x7e, 0x15, 0x2b, 0xef, 0x40, 0x57, 0x09, //*  \.{.....~.+.@W. */ 
+    /* 0x00002860 */ 0xf3, 0x4c, 0x16, 0x62, 0xa2, 0xa2, 0xb6, 0x75, 0x4c, 0x94, 0xde, 0x81, 0x6a, 0x94, 0x2b, 0x1e, //* .L.b...uL...j.+. */ 
+    /* 0x00002870 */ 0x9e, 0x5f, 0x6d, 0x11, 0x25, 0x76, 0x98, 0x74, 0xfa, 0xbb, 0x3f, 0xa0, 0x99, 0xfa, 0x43, 0xb2, //* ._m.%v.t..?...C. */ 
+    /* 0x00002880 */ 0x45, 0x5d, 0xe1, 0xe0, 0xe0, 0x06, 0x12, 0x14, 0x47, 0x47, 0x21, 0x47, 0xdb, 0xdb, 0x8a, 0xe4, //* E]......GG!G.... */ 
+    /* 0x00002890 */ 0xab, 0x77, 0x87, 0x7b, 0x7b, 0xef, 0x90, 0x9a, 0x26, 0x26, 0x7c, 0x7b, 0x27, 0x33, 0xf8, 0x71, //* .w.{{...&&|{'3.q */ 
+    /* 0x000028a0 */ 0x7b, 0xb4, 0x80, 0xf4, 0xa5, 0x80, 0xc5, 0x73, 0xfd, 0x1a, 0xf8, 0x9a, 0x80, 0xd1, 0x1f, 0x0c, //* {......s........ */ 
+    /* 0x000028b0 */ 0x31, 0xb1, 0xb1, 0x0c, 0x72, 0x63, 0x7b, 0x82, 0x86, 0xd0, 0xb6, 0xb0, 0xb1, 0x3a, 0xee, 0xe4, //* 1...rc{......:.. */ 
+    /* 0x000028c0 */ 0xe4, 0xe4, 0xcb, 0xa7, 0x87, 0x2b, 0x0a, 0x01, 0x27, 0xd3, 0xef, 0x8b, 0x77, 0x3b, 0xf6, 0x6a, //* .....+..'...w;.j */ 
+    /* 0x000028d0 */ 0xfa, 0x1b, 0x5e, 0x8f, 0x00, 0xca, 0xdd, 0xf5, 0xda, 0x78, 0x48, 0x38, 0xea, 0x5a, 0xcb, 0x67, //* ..^......xH8.Z.g */ 
+    /* 0x000028e0 */ 0xfc, 0x9d, 0xed, 0x1d, 0xd6, 0x7d, 0x42, 0xb1, 0xd7, 0x62, 0xf4, 0xca, 0x2d, 0xde, 0x3c, 0x6c, //* .....}B..b..-.<l */ 
+    /* 0x000028f0 */ 0xd3, 0xd0, 0x4e, 0xbf, 0x80, 0x0f, 0x67, 0x1b, 0x7e, 0xb6, 0x4b, 0x1d, 0x0f, 0x1a, 0x80, 0xb4, //* ..N...g.~.K..... */ 
+    /* 0x00002900 */ 0x3b, 0xcf, 0xc2, 0xf9, 0xfe, 0x51, 0x69, 0x96, 0xe6, 0x4b, 0xbb, 0x64, 0x7b, 0x18, 0x99, 0x5d, //* ;....Qi..K.d{..] */ 
+    /* 0x00002910 */ 0x69, 0x5e, 0x98, 0xce, 0xf8, 0x2b, 0xfc, 0xb6, 0x34, 0x03, 0xdf, 0xad, 0x42, 0xd3, 0x2b, 0x00, //* i^...+..4...B.+. */ 
+    /* 0x00002920 */ 0x5b, 0x72, 0x1f, 0x94, 0x65, 0xaa, 0xa5, 0x4c, 0x83, 0xfe, 0x1f, 0x2f, 0xca, 0x6a, 0xa3, 0x01, //* [r..e..L.../.j.. */ 
+    /* 0x00002930 */ 0x03, 0x03, 0x04, 0x00, 0xbe, 0x93, 0x3b, 0xf7, 0x01, 0x04, 0x00, 0xdd, 0x25, 0x00, 0x00, 0x02, //* ......;.....%... */ 
+    /* 0x00002940 */ 0x04, 0x00, 0x32, 0xc9, 0x18, 0x69, 0x00, 0x00, 0x00, 0x00, 0x01, 0x0a, 0x66, 0x69, 0x6c, 0x65, //* ..2..i......file */ 
+    /* 0x00002950 */ 0x31, 0x2e, 0x74, 0x78, 0x74, 0x00, 0x15, 0x00, 0x00, 0x00, 0x4f, 0x16, 0x4e, 0x21, 0x48, 0x65, //* 1.txt.....O.N!He */ 
+    /* 0x00002960 */ 0x6c, 0x6c, 0x6f, 0x2c, 0x20, 0x74, 0x68, 0x69, 0x73, 0x20, 0x69, 0x73, 0x20, 0x66, 0x69, 0x6c, //* llo, this is fil */ 
+    /* 0x00002970 */ 0x65, 0x31, 0x2e, 0x00, 0x02, 0x01, 0x04, 0x00, 0x15, 0x00, 0x00, 0x00, 0x02, 0x04, 0x00, 0x32, //* e1.............2 */ 
+    /* 0x00002980 */ 0xc9, 0x18, 0x69, 0x00, 0x00, 0x00, 0x00, //* ..i.... */ 
+};
+
+const size_t mock_test_window_data_len = 10631;
+const uint32_t mock_test_window_data_crc32 = 0xf5ff9860;
+
+const char mock_test_window_data_binary_modified_date[] = "2026-10-19 00:12:09";
+const char mock_test_window_data_c_generated_date[] = "2026-10-19 00:12:12";
+const char mock_test_window_data_c_compiled_date[] = __DATE__ " " __TIME__;
@@ -2,6 +2,11 @@
 
 #include "mock_test_data.h"
 #include "mock_test_compressed_data.h"
+#include "mock_test_indexed_data.h"
+#include "mock_test_window_data.h"
+#include "mock_test_split_data.h"
+#include "mock_test_merkle_data.h"
+#include "mock_test_lz4_data.h"
 
 #include "mock_test_compressor_compressed_data.h"
 #include "mock_test_compressor_uncompressed_data.h"
@@ -13,6 +18,16 @@
 
 #include "drofs_timestamp_helper.h"
 #include "drofs_compression_helper.h"
+#include "drofs_file_helper.h"
+#include "drofs_cache_helper.h"
+
+#if defined(__unix__) || defined(__APPLE__)
+#include <pthread.h>
+#define DROFS_TEST_THREADS
+#endif
+
+// "DROFS" signature and image CRC32, entry and payload offsets are relative to the first entry
+#define IMAGE_HEADER_SIZE 9
 
 void setUp(){}
 void tearDown(){}
@@ -52,6 +67,62 @@ void when_verifying_bad_crc_return_false(){
     TEST_ASSERT_FALSE(is_valid);
 }
 
+static bool verify_in_slices(const uint8_t * data, size_t data_length, size_t max_bytes){
+    struct drofs_verify_context_t ctx;
+    if (drofs_verify_begin(&ctx, data, data_length)){
+        size_t steps = 0;
+        while (!drofs_verify_step(&ctx, max_bytes)){
+            steps++;
+            TEST_ASSERT_EQUAL(IMAGE_HEADER_SIZE + steps * max_bytes, ctx.position);
+        }
+    }
+    return drofs_verify_end(&ctx);
+}
+
+void when_verifying_in_slices_return_same_result_as_verify(){
+    const uint8_t * images[] = {mock_test_data, mock_test_compressed_data, mock_test_indexed_data, mock_test_split_data, mock_test_merkle_data};
+    size_t images_length[] = {mock_test_data_len, mock_test_compressed_data_len, mock_test_indexed_data_len, mock_test_split_data_len, mock_test_merkle_data_len};
+    size_t slices[] = {1, 7, 64, 4096, SIZE_MAX};
+
+    for (size_t i = 0; i < sizeof(images) / sizeof(images[0]); i++){
+        uint8_t * bad_data = malloc(images_length[i]);
+        memcpy(bad_data, images[i], images_length[i]);
+        bad_data[images_length[i] - 1] ^= 0xFF;
+
+        for (size_t j = 0; j < sizeof(slices) / sizeof(slices[0]); j++){
+            TEST_ASSERT_TRUE(drofs_verify(images[i], images_length[i]));
+            TEST_ASSERT_TRUE(verify_in_slices(images[i], images_length[i], slices[j]));
+            TEST_ASSERT_FALSE(drofs_verify(bad_data, images_length[i]));
+            TEST_ASSERT_FALSE(verify_in_slices(bad_data, images_length[i], slices[j]));
+        }
+        free(bad_data);
+    }
+}
+
+void when_verifying_in_slices_with_bad_header_fail(){
+    size_t bad_data_length = mock_test_data_len;
+    uint8_t * bad_data = malloc(bad_data_length);
+    memcpy(bad_data, mock_test_data, bad_data_length);
+    memcpy(bad_data, "BADHD", 5);
+
+    struct drofs_verify_context_t ctx;
+    TEST_ASSERT_FALSE(drofs_verify_begin(&ctx, bad_data, bad_data_length));
+    TEST_ASSERT_TRUE(drofs_verify_step(&ctx, 16));
+    TEST_ASSERT_FALSE(drofs_verify_end(&ctx));
+    free(bad_data);
+
+    TEST_ASSERT_FALSE(drofs_verify_begin(&ctx, mock_test_data, 4));
+    TEST_ASSERT_FALSE(drofs_verify_end(&ctx));
+}
+
+void when_ending_incomplete_verification_fail(){
+    struct drofs_verify_context_t ctx;
+    TEST_ASSERT_TRUE(drofs_verify_begin(&ctx, mock_test_data, mock_test_data_len));
+    TEST_ASSERT_FALSE(drofs_verify_step(&ctx, 0));
+    TEST_ASSERT_FALSE(drofs_verify_step(&ctx, 16));
+    TEST_ASSERT_FALSE(drofs_verify_end(&ctx));
+}
+
 void when_parsing_root_return_root_directory(){
     struct drofs_entry_t entry;
     bool found = drofs_get_entry(mock_test_data, mock_test_data_len, "/",&entry );
@@ -182,6 +253,25 @@ void when_uncompressing_data_in_chunks_validate_output(){
     drofs_decompress_free(ctx);
 }
 
+void when_uncompressing_data_in_small_chunks_report_done_after_last_chunk(){
+    drofs_decompression_context_t * ctx = drofs_decompress_create(mock_test_compressor_compressed_data, mock_test_compressor_compressed_data_len);
+
+    size_t input_index = 0;
+    tinfl_status status;
+    do {
+        uint8_t buf[64];
+        size_t buf_len = sizeof(buf);
+        status = drofs_decompress_chunk(ctx, buf, &buf_len);
+        TEST_ASSERT_TRUE(input_index + buf_len <= mock_test_compressor_uncompressed_data_len);
+        TEST_ASSERT_EQUAL_UINT8_ARRAY(&mock_test_compressor_uncompressed_data[input_index], buf, buf_len);
+        input_index += buf_len;
+    } while (status == TINFL_STATUS_HAS_MORE_OUTPUT);
+
+    TEST_ASSERT_EQUAL(TINFL_STATUS_DONE, status);
+    TEST_ASSERT_EQUAL(mock_test_compressor_uncompressed_data_len, input_index);
+    drofs_decompress_free(ctx);
+}
+
 void when_reading_file2_txt_verify_contents_using_original_crc32(){
     struct drofs_entry_t entry;
     bool found = drofs_get_entry(mock_test_compressed_data, mock_test_compressed_data_len, "/drofs2s.png",&entry );
@@ -232,11 +322,1007 @@ void when_reading_file2_txt_verify_contents_using_original_crc32(){
 
 }
 
+void when_hashing_paths_ignore_redundant_separators(){
+    TEST_ASSERT_EQUAL_HEX32(0x811c9dc5, drofs_path_hash("/"));
+    TEST_ASSERT_EQUAL_HEX32(drofs_path_hash("subdir/file2.txt"), drofs_path_hash("/subdir//file2.txt/"));
+    TEST_ASSERT_NOT_EQUAL(drofs_path_hash("subdir/file2.txt"), drofs_path_hash("subdirfile2.txt"));
+}
+
+void when_reading_cached_entries_return_same_entries_as_uncached(){
+    struct drofs_lookup_cache_slot_t slots[8];
+    struct drofs_lookup_cache_t cache;
+    drofs_lookup_cache_init(&cache, slots, sizeof(slots) / sizeof(slots[0]));
+
+    const char * paths[] = {"/", "/file1.txt", "/subdir", "/subdir/file2.txt", "/long_file.txt"};
+    for (size_t round = 0; round < 2; round++){
+        for (size_t i = 0; i < sizeof(paths) / sizeof(paths[0]); i++){
+            struct drofs_entry_t expected;
+            struct drofs_entry_t actual;
+            TEST_ASSERT_TRUE(drofs_get_entry(mock_test_data, mock_test_data_len, paths[i], &expected));
+            TEST_ASSERT_TRUE(drofs_get_entry_cached(mock_test_data, mock_test_data_len, paths[i], &actual, &cache));
+            TEST_ASSERT_EQUAL(expected.offset, actual.offset);
+            TEST_ASSERT_EQUAL(expected.type, actual.type);
+            TEST_ASSERT_EQUAL_STRING(expected.name, actual.name);
+        }
+    }
+
+    // the second round is served from the cache
+    TEST_ASSERT_EQUAL(4, cache.hits);
+    TEST_ASSERT_EQUAL(4, cache.misses);
+}
+
+void when_reading_missing_cached_entry_return_false(){
+    struct drofs_lookup_cache_slot_t slots[4];
+    struct drofs_lookup_cache_t cache;
+    drofs_lookup_cache_init(&cache, slots, sizeof(slots) / sizeof(slots[0]));
+
+    struct drofs_entry_t entry;
+    TEST_ASSERT_FALSE(drofs_get_entry_cached(mock_test_data, mock_test_data_len, "/subdir/missing.txt", &entry, &cache));
+    TEST_ASSERT_FALSE(drofs_get_entry_cached(mock_test_data, mock_test_data_len, "/subdir/missing.txt", &entry, &cache));
+    TEST_ASSERT_TRUE(drofs_get_entry_cached(mock_test_data, mock_test_data_len, "/subdir/file2.txt", &entry, &cache));
+    TEST_ASSERT_EQUAL_STRING("file2.txt", entry.name);
+    TEST_ASSERT_EQUAL(0, cache.hits);
+}
+
+void when_cache_is_full_evict_least_recently_used(){
+    struct drofs_lookup_cache_slot_t slots[2];
+    struct drofs_lookup_cache_t cache;
+    drofs_lookup_cache_init(&cache, slots, sizeof(slots) / sizeof(slots[0]));
+
+    struct drofs_entry_t entry;
+    TEST_ASSERT_TRUE(drofs_get_entry_cached(mock_test_data, mock_test_data_len, "/file1.txt", &entry, &cache));
+    TEST_ASSERT_TRUE(drofs_get_entry_cached(mock_test_data, mock_test_data_len, "/long_file.txt", &entry, &cache));
+    TEST_ASSERT_TRUE(drofs_get_entry_cached(mock_test_data, mock_test_data_len, "/file1.txt", &entry, &cache));
+    TEST_ASSERT_EQUAL(1, cache.hits);
+
+    // evicts long_file.txt, the least recently used slot
+    TEST_ASSERT_TRUE(drofs_get_entry_cached(mock_test_data, mock_test_data_len, "/subdir", &entry, &cache));
+    TEST_ASSERT_TRUE(drofs_get_entry_cached(mock_test_data, mock_test_data_len, "/file1.txt", &entry, &cache));
+    TEST_ASSERT_EQUAL(2, cache.hits);
+    TEST_ASSERT_TRUE(drofs_get_entry_cached(mock_test_data, mock_test_data_len, "/long_file.txt", &entry, &cache));
+    TEST_ASSERT_EQUAL(2, cache.hits);
+    TEST_ASSERT_EQUAL_STRING("long_file.txt", entry.name);
+}
+
+void when_cached_path_hashes_collide_do_not_return_other_entry(){
+    struct drofs_lookup_cache_slot_t slots[4];
+    struct drofs_lookup_cache_t cache;
+    drofs_lookup_cache_init(&cache, slots, sizeof(slots) / sizeof(slots[0]));
+
+    struct drofs_entry_t entry;
+    TEST_ASSERT_TRUE(drofs_get_entry_cached(mock_test_data, mock_test_data_len, "/subdir/file2.txt", &entry, &cache));
+
+    // "/file2.txt" shares the name of the cached entry, give it the same path hash as if FNV-1a collided
+    uint32_t cached_hash = drofs_path_hash("/subdir/file2.txt");
+    for (size_t i = 0; i < sizeof(slots) / sizeof(slots[0]); i++){
+        if (slots[i].last_used != 0 && slots[i].path_hash == cached_hash){
+            slots[i].path_hash = drofs_path_hash("/file2.txt");
+        }
+    }
+    TEST_ASSERT_FALSE(drofs_get_entry_cached(mock_test_data, mock_test_data_len, "/file2.txt", &entry, &cache));
+    TEST_ASSERT_EQUAL(ENTRY_TYPE_DIRECTORY, entry.type);
+    TEST_ASSERT_EQUAL(0, cache.hits);
+}
+
+void when_cache_is_used_with_another_image_clear_it(){
+    struct drofs_lookup_cache_slot_t slots[4];
+    struct drofs_lookup_cache_t cache;
+    drofs_lookup_cache_init(&cache, slots, sizeof(slots) / sizeof(slots[0]));
+
+    struct drofs_entry_t entry;
+    TEST_ASSERT_TRUE(drofs_get_entry_cached(mock_test_data, mock_test_data_len, "/file1.txt", &entry, &cache));
+    TEST_ASSERT_TRUE(drofs_get_entry_cached(mock_test_compressed_data, mock_test_compressed_data_len, "/file1.txt", &entry, &cache));
+    TEST_ASSERT_EQUAL(0, cache.hits);
+    TEST_ASSERT_EQUAL(1, cache.misses);
+    TEST_ASSERT_TRUE(cache.data == mock_test_compressed_data);
+}
+
+void when_reading_indexed_image_resolve_every_path(){
+    TEST_ASSERT_TRUE(drofs_verify(mock_test_indexed_data, mock_test_indexed_data_len));
+
+    struct drofs_entry_t root;
+    TEST_ASSERT_TRUE(drofs_get_entry(mock_test_indexed_data, mock_test_indexed_data_len, "/", &root));
+    struct drofs_metadata_t path_index_metadata;
+    TEST_ASSERT_TRUE(drofs_get_type_metadata(&root, METADATA_TYPE_PATH_INDEX, &path_index_metadata));
+
+    const char * paths[] = {"/file1.txt", "/long_file.txt", "/drofs2s.png", "/subfolder", "/subfolder/file2.txt"};
+    const char * names[] = {"file1.txt", "long_file.txt", "drofs2s.png", "subfolder", "file2.txt"};
+    for (size_t i = 0; i < sizeof(paths) / sizeof(paths[0]); i++){
+        struct drofs_entry_t entry;
+        TEST_ASSERT_TRUE(drofs_get_entry(mock_test_indexed_data, mock_test_indexed_data_len, paths[i], &entry));
+        TEST_ASSERT_EQUAL_STRING(names[i], entry.name);
+        TEST_ASSERT_TRUE(drofs_verify_entry(&entry));
+    }
+}
+
+void when_reading_missing_entry_from_indexed_image_return_false(){
+    struct drofs_entry_t entry;
+    TEST_ASSERT_FALSE(drofs_get_entry(mock_test_indexed_data, mock_test_indexed_data_len, "/subfolder/missing.txt", &entry));
+    TEST_ASSERT_FALSE(drofs_get_entry(mock_test_indexed_data, mock_test_indexed_data_len, "/file2.txt", &entry));
+}
+
+void when_reading_cached_entries_from_indexed_image_use_index_on_miss(){
+    struct drofs_lookup_cache_slot_t slots[4];
+    struct drofs_lookup_cache_t cache;
+    drofs_lookup_cache_init(&cache, slots, sizeof(slots) / sizeof(slots[0]));
+
+    struct drofs_entry_t entry;
+    TEST_ASSERT_TRUE(drofs_get_entry_cached(mock_test_indexed_data, mock_test_indexed_data_len, "/subfolder/file2.txt", &entry, &cache));
+    TEST_ASSERT_EQUAL_STRING("file2.txt", entry.name);
+    TEST_ASSERT_TRUE(drofs_get_entry_cached(mock_test_indexed_data, mock_test_indexed_data_len, "/subfolder/file2.txt", &entry, &cache));
+    TEST_ASSERT_EQUAL_STRING("file2.txt", entry.name);
+    TEST_ASSERT_FALSE(drofs_get_entry_cached(mock_test_indexed_data, mock_test_indexed_data_len, "/subfolder/missing.txt", &entry, &cache));
+    TEST_ASSERT_EQUAL(1, cache.hits);
+    TEST_ASSERT_EQUAL(2, cache.misses);
+}
+
+static uint32_t decompress_chunks_crc32(drofs_decompression_context_t * ctx){
+    crc32_context_t crc32_ctx;
+    crc32_init(&crc32_ctx);
+    while (true){
+        uint8_t buf[1024];
+        size_t buf_len = sizeof(buf);
+        drofs_decompress_chunk(ctx, buf, &buf_len);
+        if (buf_len == 0){
+            break;
+        }
+        crc32_update(&crc32_ctx, buf, buf_len);
+    }
+    return crc32_get(&crc32_ctx);
+}
+
+void when_resetting_decompression_context_decompress_again(){
+    drofs_decompression_context_t * ctx = drofs_decompress_create(mock_test_compressor_compressed_data, mock_test_compressor_compressed_data_len);
+    TEST_ASSERT_NOT_NULL(ctx);
+    TEST_ASSERT_EQUAL_HEX32(mock_test_compressor_uncompressed_data_crc32, decompress_chunks_crc32(ctx));
+
+    drofs_decompress_reset(ctx, mock_test_compressor_compressed_data, mock_test_compressor_compressed_data_len);
+    TEST_ASSERT_EQUAL_HEX32(mock_test_compressor_uncompressed_data_crc32, decompress_chunks_crc32(ctx));
+
+    drofs_decompress_free(ctx);
+}
+
+void when_decompressing_with_static_context_buffer_validate_crc32(){
+    static uint64_t context_buffer[(48 * 1024) / sizeof(uint64_t)];
+    TEST_ASSERT_LESS_OR_EQUAL(sizeof(context_buffer), drofs_decompress_context_size());
+
+    TEST_ASSERT_NULL(drofs_decompress_init(context_buffer, 16, mock_test_compressor_compressed_data, mock_test_compressor_compressed_data_len));
+
+    drofs_decompression_context_t * ctx = drofs_decompress_init(context_buffer, sizeof(context_buffer), mock_test_compressor_compressed_data, mock_test_compressor_compressed_data_len);
+    TEST_ASSERT_NOT_NULL(ctx);
+    TEST_ASSERT_EQUAL_HEX32(mock_test_compressor_uncompressed_data_crc32, decompress_chunks_crc32(ctx));
+
+    // does not free the caller-supplied buffer
+    drofs_decompress_free(ctx);
+}
+
+void when_decompressing_entry_to_buffer_verify_original_crc32(){
+    struct drofs_entry_t entry;
+    TEST_ASSERT_TRUE(drofs_get_entry(mock_test_compressed_data, mock_test_compressed_data_len, "/drofs2s.png", &entry));
+    TEST_ASSERT_TRUE(entry.flags & COMPRESSED);
+
+    struct drofs_metadata_t original_size_metadata;
+    TEST_ASSERT_TRUE(drofs_get_type_metadata(&entry, METADATA_TYPE_ORIGINAL_SIZE, &original_size_metadata));
+    uint32_t original_size_value = (uint32_t)(*((uint32_t*)original_size_metadata.data));
+    struct drofs_metadata_t original_crc32;
+    TEST_ASSERT_TRUE(drofs_get_type_metadata(&entry, METADATA_TYPE_ORIGINAL_CRC32, &original_crc32));
+    uint32_t original_crc32_value = (uint32_t)(*((uint32_t*)original_crc32.data));
+
+    drofs_decompression_context_t * ctx = drofs_decompress_create(NULL, 0);
+    uint8_t * buffer = malloc(original_size_value);
+
+    size_t buffer_len = original_size_value;
+    TEST_ASSERT_EQUAL(TINFL_STATUS_DONE, drofs_decompress_entry_to_buffer(ctx, &entry, buffer, &buffer_len));
+    TEST_ASSERT_EQUAL(original_size_value, buffer_len);
+
+    crc32_context_t crc32_ctx;
+    crc32_init(&crc32_ctx);
+    crc32_update(&crc32_ctx, buffer, buffer_len);
+    TEST_ASSERT_EQUAL_HEX32(original_crc32_value, crc32_get(&crc32_ctx));
+
+    // too small a buffer reports more output instead of overflowing
+    buffer_len = original_size_value / 2;
+    TEST_ASSERT_EQUAL(TINFL_STATUS_HAS_MORE_OUTPUT, drofs_decompress_entry_to_buffer(ctx, &entry, buffer, &buffer_len));
+    TEST_ASSERT_LESS_OR_EQUAL(original_size_value / 2, buffer_len);
+
+    free(buffer);
+    drofs_decompress_free(ctx);
+}
+
+void when_decompressing_stored_entry_to_buffer_copy_data(){
+    struct drofs_entry_t entry;
+    TEST_ASSERT_TRUE(drofs_get_entry(mock_test_data, mock_test_data_len, "/file1.txt", &entry));
+
+    uint8_t buffer[64];
+    size_t buffer_len = sizeof(buffer);
+    TEST_ASSERT_EQUAL(TINFL_STATUS_DONE, drofs_decompress_entry_to_buffer(NULL, &entry, buffer, &buffer_len));
+    TEST_ASSERT_EQUAL(21, buffer_len);
+    TEST_ASSERT_EQUAL_STRING_LEN("Hello, this is file1.", buffer, buffer_len);
+}
+
+void when_reading_window_bits_return_image_and_stream_windows(){
+    TEST_ASSERT_EQUAL(10, drofs_get_window_bits(mock_test_window_data, mock_test_window_data_len));
+    // images without METADATA_TYPE_WINDOW_BITS may use any window
+    TEST_ASSERT_EQUAL(DROFS_MAX_WINDOW_BITS, drofs_get_window_bits(mock_test_compressed_data, mock_test_compressed_data_len));
+
+    struct drofs_entry_t entry;
+    TEST_ASSERT_TRUE(drofs_get_entry(mock_test_window_data, mock_test_window_data_len, "/long_file.txt", &entry));
+    TEST_ASSERT_EQUAL(10, drofs_decompress_window_bits(entry.data, entry.data_length));
+    TEST_ASSERT_EQUAL(15, drofs_decompress_window_bits(mock_test_compressor_compressed_data, mock_test_compressor_compressed_data_len));
+
+    const uint8_t invalid_header[] = {0x12, 0x34};
+    TEST_ASSERT_EQUAL(DROFS_MAX_WINDOW_BITS, drofs_decompress_window_bits(invalid_header, sizeof(invalid_header)));
+    TEST_ASSERT_EQUAL(DROFS_MAX_WINDOW_BITS, drofs_decompress_window_bits(NULL, 0));
+}
+
+static void assert_decompressed_entry_original_crc32(drofs_decompression_context_t * ctx, const char * path){
+    struct drofs_entry_t entry;
+    TEST_ASSERT_TRUE(drofs_get_entry(mock_test_window_data, mock_test_window_data_len, path, &entry));
+    TEST_ASSERT_TRUE(entry.flags & COMPRESSED);
+
+    struct drofs_metadata_t original_crc32;
+    TEST_ASSERT_TRUE(drofs_get_type_metadata(&entry, METADATA_TYPE_ORIGINAL_CRC32, &original_crc32));
+
+    drofs_decompress_reset(ctx, entry.data, entry.data_length);
+    TEST_ASSERT_EQUAL_HEX32((uint32_t)(*((uint32_t*)original_crc32.data)), decompress_chunks_crc32(ctx));
+}
+
+void when_decompressing_reduced_window_entries_validate_original_crc32(){
+    uint8_t window_bits = drofs_get_window_bits(mock_test_window_data, mock_test_window_data_len);
+    TEST_ASSERT_LESS_THAN(drofs_decompress_context_size(), drofs_decompress_context_size_for_window(window_bits));
+
+    drofs_decompression_context_t * ctx = drofs_decompress_create_with_window(window_bits, NULL, 0);
+    TEST_ASSERT_NOT_NULL(ctx);
+    assert_decompressed_entry_original_crc32(ctx, "/long_file.txt");
+    assert_decompressed_entry_original_crc32(ctx, "/drofs2s.png");
+    drofs_decompress_free(ctx);
+
+    // a caller buffer sized for the image window is enough
+    size_t context_buffer_len = drofs_decompress_context_size_for_window(window_bits);
+    void * context_buffer = malloc(context_buffer_len);
+    ctx = drofs_decompress_init(context_buffer, context_buffer_len, NULL, 0);
+    TEST_ASSERT_NOT_NULL(ctx);
+    assert_decompressed_entry_original_crc32(ctx, "/long_file.txt");
+    assert_decompressed_entry_original_crc32(ctx, "/drofs2s.png");
+    drofs_decompress_free(ctx);
+    free(context_buffer);
+}
+
+void when_stream_window_exceeds_context_window_fail(){
+    drofs_decompression_context_t * ctx = drofs_decompress_create_with_window(10, mock_test_compressor_compressed_data, mock_test_compressor_compressed_data_len);
+    TEST_ASSERT_NOT_NULL(ctx);
+
+    uint8_t buf[1024];
+    size_t buf_len = sizeof(buf);
+    TEST_ASSERT_LESS_THAN(0, drofs_decompress_chunk(ctx, buf, &buf_len));
+    TEST_ASSERT_EQUAL(0, buf_len);
+
+    drofs_decompress_free(ctx);
+}
+
+void when_decompressing_lz4_entries_validate_original_crc32(){
+    TEST_ASSERT_TRUE(drofs_verify(mock_test_lz4_data, mock_test_lz4_data_len));
+    TEST_ASSERT_EQUAL(12, drofs_get_window_bits(mock_test_lz4_data, mock_test_lz4_data_len));
+    // LZ4 contexts need no zlib decompressor
+    TEST_ASSERT_LESS_THAN(drofs_decompress_context_size_for_window(12), drofs_decompress_lz4_context_size_for_window(12));
+
+    size_t context_buffer_len = drofs_decompress_lz4_context_size_for_window(12);
+    void * context_buffer = malloc(context_buffer_len);
+    const char * paths[] = {"/long_file.txt", "/drofs2s.png"};
+    for (size_t i = 0; i < sizeof(paths) / sizeof(paths[0]); i++){
+        struct drofs_entry_t entry;
+        TEST_ASSERT_TRUE(drofs_get_entry(mock_test_lz4_data, mock_test_lz4_data_len, paths[i], &entry));
+        TEST_ASSERT_EQUAL(COMPRESSED | LZ4, entry.flags);
+        TEST_ASSERT_EQUAL(12, drofs_decompress_entry_window_bits(&entry));
+
+        struct drofs_metadata_t original_crc32;
+        struct drofs_metadata_t original_size;
+        TEST_ASSERT_TRUE(drofs_get_type_metadata(&entry, METADATA_TYPE_ORIGINAL_CRC32, &original_crc32));
+        TEST_ASSERT_TRUE(drofs_get_type_metadata(&entry, METADATA_TYPE_ORIGINAL_SIZE, &original_size));
+
+        // in chunks through the dictionary
+        drofs_decompression_context_t * ctx = drofs_decompress_init_entry(context_buffer, context_buffer_len, &entry);
+        TEST_ASSERT_NOT_NULL(ctx);
+        TEST_ASSERT_EQUAL_HEX32((uint32_t)(*((uint32_t*)original_crc32.data)), decompress_chunks_crc32(ctx));
+        drofs_decompress_reset_entry(ctx, &entry);
+        TEST_ASSERT_EQUAL_HEX32((uint32_t)(*((uint32_t*)original_crc32.data)), decompress_chunks_crc32(ctx));
+
+        // in one pass, without a context
+        size_t output_length = *(uint32_t *)original_size.data;
+        uint8_t * output = malloc(output_length);
+        TEST_ASSERT_EQUAL(TINFL_STATUS_DONE, drofs_decompress_entry_to_buffer(NULL, &entry, output, &output_length));
+        TEST_ASSERT_EQUAL(*(uint32_t *)original_size.data, output_length);
+        crc32_context_t crc32_ctx;
+        crc32_init(&crc32_ctx);
+        crc32_update(&crc32_ctx, output, output_length);
+        TEST_ASSERT_EQUAL_HEX32((uint32_t)(*((uint32_t*)original_crc32.data)), crc32_get(&crc32_ctx));
+
+        output_length--;
+        TEST_ASSERT_EQUAL(TINFL_STATUS_HAS_MORE_OUTPUT, drofs_decompress_entry_to_buffer(NULL, &entry, output, &output_length));
+        free(output);
+    }
+    free(context_buffer);
+}
+
+void when_decompressing_invalid_lz4_entries_fail(){
+    struct drofs_entry_t entry;
+    TEST_ASSERT_TRUE(drofs_get_entry(mock_test_lz4_data, mock_test_lz4_data_len, "/drofs2s.png", &entry));
+    uint8_t * output = malloc(16 * 1024);
+
+    // a truncated block
+    struct drofs_entry_t truncated = entry;
+    truncated.data_length -= 3;
+    size_t output_length = 16 * 1024;
+    TEST_ASSERT_LESS_THAN(0, drofs_decompress_entry_to_buffer(NULL, &truncated, output, &output_length));
+    drofs_decompression_context_t * ctx = drofs_decompress_create_with_window(12, NULL, 0);
+    drofs_decompress_reset_entry(ctx, &truncated);
+    tinfl_status status;
+    do {
+        output_length = 1000;
+        status = drofs_decompress_chunk(ctx, output, &output_length);
+    } while (status == TINFL_STATUS_HAS_MORE_OUTPUT);
+    TEST_ASSERT_LESS_THAN(0, status);
+    drofs_decompress_free(ctx);
+
+    // a match 600 bytes back, beyond a 512 byte window: 600 literals, offset 600, then an empty last sequence
+    static uint8_t far_match[4 + 600 + 2 + 1] = {0xF0, 255, 255, 75};
+    far_match[4 + 600] = 600 & 0xFF;
+    far_match[4 + 601] = 600 >> 8;
+    struct drofs_entry_t far_match_entry = {.data = far_match, .data_length = sizeof(far_match), .flags = COMPRESSED | LZ4};
+    for (uint8_t window_bits = DROFS_MIN_WINDOW_BITS; window_bits <= DROFS_MIN_WINDOW_BITS + 1; window_bits++){
+        ctx = drofs_decompress_create_with_window(window_bits, NULL, 0);
+        drofs_decompress_reset_entry(ctx, &far_match_entry);
+        size_t decompressed_length = 0;
+        do {
+            output_length = 100;
+            status = drofs_decompress_chunk(ctx, output, &output_length);
+            decompressed_length += output_length;
+        } while (status == TINFL_STATUS_HAS_MORE_OUTPUT);
+        TEST_ASSERT_EQUAL(window_bits == DROFS_MIN_WINDOW_BITS ? TINFL_STATUS_FAILED : TINFL_STATUS_DONE, status);
+        if (status == TINFL_STATUS_DONE){
+            TEST_ASSERT_EQUAL(604, decompressed_length);
+        }
+        drofs_decompress_free(ctx);
+    }
+
+    // zlib entries in a context without a zlib decompressor
+    void * context_buffer = malloc(drofs_decompress_lz4_context_size_for_window(12));
+    ctx = drofs_decompress_init_entry(context_buffer, drofs_decompress_lz4_context_size_for_window(12), &entry);
+    TEST_ASSERT_NOT_NULL(ctx);
+    TEST_ASSERT_TRUE(drofs_get_entry(mock_test_compressed_data, mock_test_compressed_data_len, "/long_file.txt", &entry));
+    drofs_decompress_reset_entry(ctx, &entry);
+    output_length = 1000;
+    TEST_ASSERT_EQUAL(TINFL_STATUS_BAD_PARAM, drofs_decompress_chunk(ctx, output, &output_length));
+    TEST_ASSERT_EQUAL(0, output_length);
+    free(context_buffer);
+    free(output);
+}
+
+void when_reading_split_image_resolve_every_path_to_payload_region(){
+    TEST_ASSERT_TRUE(drofs_verify(mock_test_split_data, mock_test_split_data_len));
+
+    size_t payload_offset;
+    size_t payload_length;
+    TEST_ASSERT_TRUE(drofs_get_payload_region(mock_test_split_data, mock_test_split_data_len, &payload_offset, &payload_length));
+    TEST_ASSERT_EQUAL(mock_test_split_data_len - IMAGE_HEADER_SIZE, payload_offset + payload_length);
+    TEST_ASSERT_FALSE(drofs_get_payload_region(mock_test_data, mock_test_data_len, &payload_offset, &payload_length));
+
+    const char * paths[] = {"/file1.txt", "/long_file.txt", "/drofs2s.png", "/subfolder", "/subfolder/file2.txt"};
+    const char * names[] = {"file1.txt", "long_file.txt", "drofs2s.png", "subfolder", "file2.txt"};
+    for (size_t i = 0; i < sizeof(paths) / sizeof(paths[0]); i++){
+        struct drofs_entry_t entry;
+        TEST_ASSERT_TRUE(drofs_get_entry(mock_test_split_data, mock_test_split_data_len, paths[i], &entry));
+        TEST_ASSERT_EQUAL_STRING(names[i], entry.name);
+        // every header is in front of the payload region
+        TEST_ASSERT_LESS_THAN(payload_offset, entry.offset);
+        TEST_ASSERT_TRUE(drofs_verify_entry(&entry));
+        if (entry.type == ENTRY_TYPE_FILE){
+            const uint8_t * payload_region = mock_test_split_data + IMAGE_HEADER_SIZE + payload_offset;
+            TEST_ASSERT_TRUE(entry.data >= payload_region);
+            TEST_ASSERT_TRUE(entry.data + entry.data_length <= payload_region + payload_length);
+        }
+    }
+}
+
+void when_decompressing_split_image_entry_verify_original_crc32(){
+    struct drofs_entry_t entry;
+    TEST_ASSERT_TRUE(drofs_get_entry(mock_test_split_data, mock_test_split_data_len, "/long_file.txt", &entry));
+    TEST_ASSERT_TRUE(entry.flags & COMPRESSED);
+
+    struct drofs_metadata_t original_crc32;
+    TEST_ASSERT_TRUE(drofs_get_type_metadata(&entry, METADATA_TYPE_ORIGINAL_CRC32, &original_crc32));
+
+    drofs_decompression_context_t * ctx = drofs_decompress_create(entry.data, entry.data_length);
+    TEST_ASSERT_NOT_NULL(ctx);
+    TEST_ASSERT_EQUAL_HEX32((uint32_t)(*((uint32_t*)original_crc32.data)), decompress_chunks_crc32(ctx));
+    drofs_decompress_free(ctx);
+}
+
+void when_reading_verified_entries_check_only_the_path(){
+    const char * paths[] = {"/", "/file1.txt", "/long_file.txt", "/drofs2s.png", "/subfolder", "/subfolder/file2.txt"};
+    for (size_t i = 0; i < sizeof(paths) / sizeof(paths[0]); i++){
+        struct drofs_entry_t expected;
+        struct drofs_entry_t entry;
+        TEST_ASSERT_TRUE(drofs_get_entry(mock_test_merkle_data, mock_test_merkle_data_len, paths[i], &expected));
+        TEST_ASSERT_TRUE(drofs_get_entry_verified(mock_test_merkle_data, mock_test_merkle_data_len, paths[i], &entry));
+        TEST_ASSERT_EQUAL(expected.offset, entry.offset);
+    }
+
+    struct drofs_entry_t entry;
+    TEST_ASSERT_FALSE(drofs_get_entry_verified(mock_test_merkle_data, mock_test_merkle_data_len, "/subfolder/missing.txt", &entry));
+    // images without digests cannot be verified by path
+    TEST_ASSERT_FALSE(drofs_get_entry_verified(mock_test_data, mock_test_data_len, "/file1.txt", &entry));
+}
+
+void when_verified_entry_is_corrupted_fail_only_its_path(){
+    uint8_t * image = malloc(mock_test_merkle_data_len);
+    memcpy(image, mock_test_merkle_data, mock_test_merkle_data_len);
+
+    // corrupt the data CRC32 field of file1.txt, it precedes the inline data
+    struct drofs_entry_t entry;
+    TEST_ASSERT_TRUE(drofs_get_entry(image, mock_test_merkle_data_len, "/file1.txt", &entry));
+    image[entry.data - image - 1] ^= 0xFF;
+
+    TEST_ASSERT_FALSE(drofs_verify(image, mock_test_merkle_data_len));
+    TEST_ASSERT_FALSE(drofs_get_entry_verified(image, mock_test_merkle_data_len, "/file1.txt", &entry));
+    TEST_ASSERT_TRUE(drofs_get_entry_verified(image, mock_test_merkle_data_len, "/subfolder/file2.txt", &entry));
+    TEST_ASSERT_EQUAL_STRING("file2.txt", entry.name);
+
+    free(image);
+}
+
+// Returns the original data of a file entry in a heap buffer
+static uint8_t * read_original_data(const uint8_t * data, size_t data_length, const char * path, size_t * original_length){
+    struct drofs_entry_t entry;
+    TEST_ASSERT_TRUE(drofs_get_entry(data, data_length, path, &entry));
+    *original_length = entry.data_length;
+    struct drofs_metadata_t original_size;
+    if (drofs_get_type_metadata(&entry, METADATA_TYPE_ORIGINAL_SIZE, &original_size)){
+        *original_length = *(uint32_t *)original_size.data;
+    }
+
+    uint8_t * original = malloc(*original_length + 1);
+    drofs_decompression_context_t * ctx = drofs_decompress_create(entry.data, entry.data_length);
+    size_t output_length = *original_length;
+    TEST_ASSERT_EQUAL(TINFL_STATUS_DONE, drofs_decompress_entry_to_buffer(ctx, &entry, original, &output_length));
+    TEST_ASSERT_EQUAL(*original_length, output_length);
+    drofs_decompress_free(ctx);
+    return original;
+}
+
+void when_reading_files_through_handles_return_original_data(){
+    const uint8_t * images[] = {mock_test_data, mock_test_compressed_data, mock_test_window_data, mock_test_split_data, mock_test_merkle_data, mock_test_lz4_data};
+    size_t images_length[] = {mock_test_data_len, mock_test_compressed_data_len, mock_test_window_data_len, mock_test_split_data_len, mock_test_merkle_data_len, mock_test_lz4_data_len};
+    const char * paths[][4] = {
+        {"/file1.txt", "/long_file.txt", "/subdir/file2.txt", NULL},
+        {"/file1.txt", "/long_file.txt", "/subdir/file2.txt", "/drofs2s.png"},
+        {"/file1.txt", "/long_file.txt", "/subfolder/file2.txt", "/drofs2s.png"},
+        {"/file1.txt", "/long_file.txt", "/subfolder/file2.txt", "/drofs2s.png"},
+        {"/file1.txt", "/long_file.txt", "/subfolder/file2.txt", "/drofs2s.png"},
+        {"/file1.txt", "/long_file.txt", "/subfolder/file2.txt", "/drofs2s.png"},
+    };
+
+    static uint8_t buffers[2 * 44 * 1024];
+    struct drofs_file_t files[2];
+    struct drofs_file_pool_t pool;
+    drofs_file_pool_init(&pool, files, 2, buffers, sizeof(buffers) / 2);
+
+    for (size_t i = 0; i < sizeof(images) / sizeof(images[0]); i++){
+        for (const char ** path = paths[i]; path < paths[i] + 4 && *path != NULL; path++){
+            size_t original_length;
+            uint8_t * original = read_original_data(images[i], images_length[i], *path, &original_length);
+
+            struct drofs_file_t * file = drofs_file_open(&pool, images[i], images_length[i], *path, DROFS_FILE_VERIFY_CRC32);
+            TEST_ASSERT_NOT_NULL(file);
+            TEST_ASSERT_EQUAL(original_length, drofs_file_size(file));
+
+            uint8_t * content = malloc(original_length + 1);
+            size_t content_length = 0;
+            while (true){
+                // An odd chunk size so reads straddle the decompression dictionary
+                size_t chunk_length = 333;
+                TEST_ASSERT_TRUE(drofs_file_read(file, content + content_length, &chunk_length));
+                if (chunk_length == 0){
+                    break;
+                }
+                content_length += chunk_length;
+                TEST_ASSERT_EQUAL(content_length, drofs_file_tell(file));
+            }
+            TEST_ASSERT_EQUAL(original_length, content_length);
+            TEST_ASSERT_EQUAL_MEMORY(original, content, original_length);
+
+            drofs_file_close(file);
+            free(content);
+            free(original);
+        }
+    }
+}
+
+void when_seeking_in_file_handles_read_from_new_position(){
+    const uint8_t * images[] = {mock_test_compressed_data, mock_test_split_data, mock_test_lz4_data};
+    size_t images_length[] = {mock_test_compressed_data_len, mock_test_split_data_len, mock_test_lz4_data_len};
+
+    static uint8_t buffer[44 * 1024];
+    struct drofs_file_t files[1];
+    struct drofs_file_pool_t pool;
+    drofs_file_pool_init(&pool, files, 1, buffer, sizeof(buffer));
+
+    for (size_t i = 0; i < sizeof(images) / sizeof(images[0]); i++){
+        size_t original_length;
+        uint8_t * original = read_original_data(images[i], images_length[i], "/drofs2s.png", &original_length);
+
+        struct drofs_file_t * file = drofs_file_open(&pool, images[i], images_length[i], "/drofs2s.png", 0);
+        TEST_ASSERT_NOT_NULL(file);
+
+        // forward, backward, relative and from the end
+        long positions[][2] = {{100, SEEK_SET}, {5000, SEEK_SET}, {10, SEEK_SET}, {-5, SEEK_CUR}, {-20, SEEK_END}, {4000, SEEK_SET}, {3000, SEEK_CUR}};
+        for (size_t j = 0; j < sizeof(positions) / sizeof(positions[0]); j++){
+            TEST_ASSERT_TRUE(drofs_file_seek(file, positions[j][0], (int)positions[j][1]));
+            size_t position = drofs_file_tell(file);
+
+            uint8_t content[16];
+            size_t content_length = sizeof(content);
+            TEST_ASSERT_TRUE(drofs_file_read(file, content, &content_length));
+            size_t expected_length = original_length - position < sizeof(content) ? original_length - position : sizeof(content);
+            TEST_ASSERT_EQUAL(expected_length, content_length);
+            TEST_ASSERT_EQUAL_MEMORY(original + position, content, content_length);
+        }
+
+        TEST_ASSERT_FALSE(drofs_file_seek(file, -1, SEEK_SET));
+        TEST_ASSERT_FALSE(drofs_file_seek(file, 1, SEEK_END));
+        TEST_ASSERT_TRUE(drofs_file_seek(file, 0, SEEK_END));
+        size_t content_length = 16;
+        uint8_t content[16];
+        TEST_ASSERT_TRUE(drofs_file_read(file, content, &content_length));
+        TEST_ASSERT_EQUAL(0, content_length);
+
+        drofs_file_close(file);
+        free(original);
+    }
+}
+
+void when_reading_corrupted_file_handle_with_crc32_check_fail(){
+    const uint8_t * images[] = {mock_test_data, mock_test_compressed_data};
+    size_t images_length[] = {mock_test_data_len, mock_test_compressed_data_len};
+    const char * paths[] = {"/file1.txt", "/long_file.txt"};
+
+    static uint8_t buffer[44 * 1024];
+    struct drofs_file_t files[1];
+    struct drofs_file_pool_t pool;
+    drofs_file_pool_init(&pool, files, 1, buffer, sizeof(buffer));
+
+    for (size_t i = 0; i < sizeof(images) / sizeof(images[0]); i++){
+        uint8_t * image = malloc(images_length[i]);
+        memcpy(image, images[i], images_length[i]);
+        struct drofs_entry_t entry;
+        TEST_ASSERT_TRUE(drofs_get_entry(image, images_length[i], paths[i], &entry));
+        ((uint8_t *)entry.data)[entry.data_length - 1] ^= 0xFF;
+
+        uint8_t content[2048];
+        for (uint8_t flags = 0; flags <= DROFS_FILE_VERIFY_CRC32; flags++){
+            struct drofs_file_t * file = drofs_file_open(&pool, image, images_length[i], paths[i], flags);
+            TEST_ASSERT_NOT_NULL(file);
+            size_t content_length = sizeof(content);
+            bool read = drofs_file_read(file, content, &content_length);
+            // Stored data is only checked against its CRC32, compressed streams are also checked by their Adler-32
+            TEST_ASSERT_EQUAL(flags == 0 && !(entry.flags & COMPRESSED), read);
+            drofs_file_close(file);
+        }
+        free(image);
+    }
+}
+
+void when_file_handle_pool_is_exhausted_fail_open(){
+    struct drofs_file_t files[2];
+    struct drofs_file_pool_t pool;
+    drofs_file_pool_init(&pool, files, 2, NULL, 0);
+
+    struct drofs_file_t * file1 = drofs_file_open(&pool, mock_test_data, mock_test_data_len, "/file1.txt", 0);
+    struct drofs_file_t * file2 = drofs_file_open(&pool, mock_test_data, mock_test_data_len, "/subdir/file2.txt", 0);
+    TEST_ASSERT_NOT_NULL(file1);
+    TEST_ASSERT_NOT_NULL(file2);
+    TEST_ASSERT_NULL(drofs_file_open(&pool, mock_test_data, mock_test_data_len, "/file1.txt", 0));
+    drofs_file_close(file1);
+    TEST_ASSERT_NOT_NULL(drofs_file_open(&pool, mock_test_data, mock_test_data_len, "/file1.txt", 0));
+
+    drofs_file_close(file2);
+    // Directories, missing paths and compressed entries without a context buffer
+    TEST_ASSERT_NULL(drofs_file_open(&pool, mock_test_data, mock_test_data_len, "/subdir", 0));
+    TEST_ASSERT_NULL(drofs_file_open(&pool, mock_test_data, mock_test_data_len, "/missing.txt", 0));
+    TEST_ASSERT_NULL(drofs_file_open(&pool, mock_test_compressed_data, mock_test_compressed_data_len, "/long_file.txt", 0));
+}
+
+void when_loading_entries_through_payload_cache_serve_repeated_reads_from_arena(){
+    const uint8_t * images[] = {mock_test_compressed_data, mock_test_lz4_data};
+    size_t images_length[] = {mock_test_compressed_data_len, mock_test_lz4_data_len};
+    const char * paths[] = {"/long_file.txt", "/drofs2s.png"};
+
+    static uint8_t arena[16 * 1024];
+    struct drofs_payload_cache_slot_t slots[4];
+    struct drofs_payload_cache_t cache;
+    drofs_payload_cache_init(&cache, slots, 4, arena, sizeof(arena));
+    drofs_decompression_context_t * ctx = drofs_decompress_create_with_window(DROFS_MAX_WINDOW_BITS, NULL, 0);
+
+    for (size_t i = 0; i < sizeof(images) / sizeof(images[0]); i++){
+        drofs_payload_cache_clear(&cache);
+        for (size_t round = 0; round < 2; round++){
+            for (size_t j = 0; j < sizeof(paths) / sizeof(paths[0]); j++){
+                size_t original_length;
+                uint8_t * original = read_original_data(images[i], images_length[i], paths[j], &original_length);
+                struct drofs_entry_t entry;
+                TEST_ASSERT_TRUE(drofs_get_entry(images[i], images_length[i], paths[j], &entry));
+
+                const uint8_t * data;
+                size_t length;
+                TEST_ASSERT_EQUAL(TINFL_STATUS_DONE, drofs_payload_cache_load(&cache, ctx, &entry, &data, &length));
+                TEST_ASSERT_EQUAL(original_length, length);
+                TEST_ASSERT_EQUAL_MEMORY(original, data, length);
+                free(original);
+            }
+            // every entry is decompressed once, then served from the arena
+            TEST_ASSERT_EQUAL(2, cache.misses);
+            TEST_ASSERT_EQUAL(round * 2, cache.hits);
+        }
+        TEST_ASSERT_EQUAL(0, cache.evictions);
+    }
+
+    // stored entries are returned in place and never cached
+    struct drofs_entry_t stored_entry;
+    TEST_ASSERT_TRUE(drofs_get_entry(mock_test_lz4_data, mock_test_lz4_data_len, "/file1.txt", &stored_entry));
+    const uint8_t * data;
+    size_t length;
+    size_t used = cache.used;
+    TEST_ASSERT_EQUAL(TINFL_STATUS_DONE, drofs_payload_cache_load(&cache, NULL, &stored_entry, &data, &length));
+    TEST_ASSERT_TRUE(data == stored_entry.data);
+    TEST_ASSERT_EQUAL(stored_entry.data_length, length);
+    TEST_ASSERT_EQUAL(used, cache.used);
+    TEST_ASSERT_NULL(drofs_payload_cache_get(&cache, &stored_entry, &length));
+
+    drofs_decompress_free(ctx);
+}
+
+static tinfl_status load_payload_cache_entry(struct drofs_payload_cache_t * cache, drofs_decompression_context_t * ctx, const uint8_t * image, size_t image_length, const char * path){
+    struct drofs_entry_t entry;
+    TEST_ASSERT_TRUE(drofs_get_entry(image, image_length, path, &entry));
+    const uint8_t * data;
+    size_t length;
+    return drofs_payload_cache_load(cache, ctx, &entry, &data, &length);
+}
+
+static void assert_payload_cache_entry(struct drofs_payload_cache_t * cache, const uint8_t * image, size_t image_length, const char * path, bool cached){
+    struct drofs_entry_t entry;
+    TEST_ASSERT_TRUE(drofs_get_entry(image, image_length, path, &entry));
+    size_t length;
+    const uint8_t * data = drofs_payload_cache_get(cache, &entry, &length);
+    TEST_ASSERT_EQUAL(cached, data != NULL);
+    if (cached){
+        size_t original_length;
+        uint8_t * original = read_original_data(image, image_length, path, &original_length);
+        TEST_ASSERT_EQUAL(original_length, length);
+        TEST_ASSERT_EQUAL_MEMORY(original, data, length);
+        free(original);
+    }
+}
+
+void when_payload_cache_is_full_evict_least_recently_used(){
+    // the same paths in two images are different entries
+    const uint8_t * zlib_image = mock_test_compressed_data;
+    size_t zlib_image_length = mock_test_compressed_data_len;
+    const uint8_t * lz4_image = mock_test_lz4_data;
+    size_t lz4_image_length = mock_test_lz4_data_len;
+    drofs_decompression_context_t * ctx = drofs_decompress_create_with_window(DROFS_MAX_WINDOW_BITS, NULL, 0);
+
+    // room for the png (9693 bytes) and long_file.txt (1336 bytes) with 11 bytes to spare
+    static uint8_t arena[9693 + 1336 + 11];
+    struct drofs_payload_cache_slot_t slots[3];
+    struct drofs_payload_cache_t cache;
+    drofs_payload_cache_init(&cache, slots, 3, arena, sizeof(arena));
+
+    TEST_ASSERT_EQUAL(TINFL_STATUS_DONE, load_payload_cache_entry(&cache, ctx, zlib_image, zlib_image_length, "/long_file.txt"));
+    TEST_ASSERT_EQUAL(TINFL_STATUS_DONE, load_payload_cache_entry(&cache, ctx, lz4_image, lz4_image_length, "/long_file.txt"));
+    assert_payload_cache_entry(&cache, lz4_image, lz4_image_length, "/long_file.txt", true);
+
+    // the zlib long_file.txt is evicted and the LZ4 one moved to the start of the arena to make room
+    TEST_ASSERT_EQUAL(TINFL_STATUS_DONE, load_payload_cache_entry(&cache, ctx, lz4_image, lz4_image_length, "/drofs2s.png"));
+    TEST_ASSERT_EQUAL(1, cache.evictions);
+    TEST_ASSERT_EQUAL(9693 + 1336, cache.used);
+    assert_payload_cache_entry(&cache, zlib_image, zlib_image_length, "/long_file.txt", false);
+    assert_payload_cache_entry(&cache, lz4_image, lz4_image_length, "/drofs2s.png", true);
+    assert_payload_cache_entry(&cache, lz4_image, lz4_image_length, "/long_file.txt", true);
+
+    // the png is now the least recently used
+    TEST_ASSERT_EQUAL(TINFL_STATUS_DONE, load_payload_cache_entry(&cache, ctx, zlib_image, zlib_image_length, "/long_file.txt"));
+    TEST_ASSERT_EQUAL(2, cache.evictions);
+    assert_payload_cache_entry(&cache, lz4_image, lz4_image_length, "/drofs2s.png", false);
+    assert_payload_cache_entry(&cache, lz4_image, lz4_image_length, "/long_file.txt", true);
+    assert_payload_cache_entry(&cache, zlib_image, zlib_image_length, "/long_file.txt", true);
+
+    // out of slots, the least recently used slot is reused even though the data fits
+    drofs_payload_cache_init(&cache, slots, 1, arena, sizeof(arena));
+    TEST_ASSERT_EQUAL(TINFL_STATUS_DONE, load_payload_cache_entry(&cache, ctx, zlib_image, zlib_image_length, "/long_file.txt"));
+    TEST_ASSERT_EQUAL(TINFL_STATUS_DONE, load_payload_cache_entry(&cache, ctx, lz4_image, lz4_image_length, "/long_file.txt"));
+    TEST_ASSERT_EQUAL(1, cache.evictions);
+    assert_payload_cache_entry(&cache, zlib_image, zlib_image_length, "/long_file.txt", false);
+    assert_payload_cache_entry(&cache, lz4_image, lz4_image_length, "/long_file.txt", true);
+
+    // entries larger than the arena are not cached and evict nothing
+    drofs_payload_cache_init(&cache, slots, 3, arena, 2048);
+    TEST_ASSERT_EQUAL(TINFL_STATUS_DONE, load_payload_cache_entry(&cache, ctx, lz4_image, lz4_image_length, "/long_file.txt"));
+    TEST_ASSERT_EQUAL(TINFL_STATUS_HAS_MORE_OUTPUT, load_payload_cache_entry(&cache, ctx, lz4_image, lz4_image_length, "/drofs2s.png"));
+    TEST_ASSERT_EQUAL(0, cache.evictions);
+    assert_payload_cache_entry(&cache, lz4_image, lz4_image_length, "/long_file.txt", true);
+
+    drofs_decompress_free(ctx);
+}
+
+void when_loading_corrupted_entry_into_payload_cache_fail(){
+    uint8_t * image = malloc(mock_test_compressed_data_len);
+    memcpy(image, mock_test_compressed_data, mock_test_compressed_data_len);
+    struct drofs_entry_t entry;
+    TEST_ASSERT_TRUE(drofs_get_entry(image, mock_test_compressed_data_len, "/long_file.txt", &entry));
+    ((uint8_t *)entry.data)[entry.data_length / 2] ^= 0xFF;
+
+    static uint8_t arena[4096];
+    struct drofs_payload_cache_slot_t slots[2];
+    struct drofs_payload_cache_t cache;
+    drofs_payload_cache_init(&cache, slots, 2, arena, sizeof(arena));
+    drofs_decompression_context_t * ctx = drofs_decompress_create_with_window(DROFS_MAX_WINDOW_BITS, NULL, 0);
+
+    const uint8_t * data;
+    size_t length;
+    TEST_ASSERT_TRUE(drofs_payload_cache_load(&cache, ctx, &entry, &data, &length) < 0);
+    TEST_ASSERT_EQUAL(0, cache.used);
+    TEST_ASSERT_NULL(drofs_payload_cache_get(&cache, &entry, &length));
+
+    drofs_decompress_free(ctx);
+    free(image);
+}
+
+void when_reading_file_handles_with_payload_cache_return_original_data(){
+    const uint8_t * images[] = {mock_test_compressed_data, mock_test_lz4_data};
+    size_t images_length[] = {mock_test_compressed_data_len, mock_test_lz4_data_len};
+
+    static uint8_t buffer[44 * 1024];
+    struct drofs_file_t files[1];
+    struct drofs_file_pool_t pool;
+    drofs_file_pool_init(&pool, files, 1, buffer, sizeof(buffer));
+
+    static uint8_t arena[16 * 1024];
+    struct drofs_payload_cache_slot_t slots[4];
+    struct drofs_payload_cache_t cache;
+    drofs_payload_cache_init(&cache, slots, 4, arena, sizeof(arena));
+    drofs_file_pool_set_cache(&pool, &cache);
+
+    for (size_t i = 0; i < sizeof(images) / sizeof(images[0]); i++){
+        size_t original_length;
+        uint8_t * original = read_original_data(images[i], images_length[i], "/drofs2s.png", &original_length);
+        uint8_t * content = malloc(original_length);
+
+        for (size_t round = 0; round < 2; round++){
+            drofs_payload_cache_clear(&cache);
+            struct drofs_file_t * file = drofs_file_open(&pool, images[i], images_length[i], "/drofs2s.png", DROFS_FILE_VERIFY_CRC32);
+            TEST_ASSERT_NOT_NULL(file);
+            TEST_ASSERT_EQUAL(1, cache.misses);
+
+            // reads are counted once per open, not per chunk, and do not reorder the cache
+            uint32_t tick = cache.tick;
+            size_t content_length;
+            for (size_t offset = 0; offset < 1000; offset += content_length){
+                content_length = 10;
+                TEST_ASSERT_TRUE(drofs_file_read(file, content + offset, &content_length));
+            }
+            TEST_ASSERT_EQUAL(0, cache.hits);
+            TEST_ASSERT_EQUAL(1, cache.misses);
+            TEST_ASSERT_EQUAL(tick, cache.tick);
+            if (round == 1){
+                // once evicted, reads inflate the entry from the current position
+                drofs_payload_cache_clear(&cache);
+            }
+            TEST_ASSERT_TRUE(drofs_file_seek(file, 5000, SEEK_SET));
+            content_length = original_length - 5000;
+            TEST_ASSERT_TRUE(drofs_file_read(file, content + 5000, &content_length));
+            TEST_ASSERT_TRUE(drofs_file_seek(file, 1000, SEEK_SET));
+            content_length = 4000;
+            TEST_ASSERT_TRUE(drofs_file_read(file, content + 1000, &content_length));
+            TEST_ASSERT_EQUAL_MEMORY(original, content, original_length);
+            TEST_ASSERT_EQUAL(0, cache.hits);
+            TEST_ASSERT_EQUAL(round == 0 ? 1 : 0, cache.misses);
+            drofs_file_close(file);
+        }
+
+        // reopening a cached entry inflates nothing
+        drofs_payload_cache_clear(&cache);
+        struct drofs_file_t * file = drofs_file_open(&pool, images[i], images_length[i], "/drofs2s.png", 0);
+        drofs_file_close(file);
+        file = drofs_file_open(&pool, images[i], images_length[i], "/drofs2s.png", 0);
+        TEST_ASSERT_EQUAL(1, cache.misses);
+        TEST_ASSERT_EQUAL(1, cache.hits);
+        drofs_file_close(file);
+
+        free(content);
+        free(original);
+    }
+}
+
+void when_resolving_path_longer_than_256_characters_find_entry(){
+    char path[512];
+    size_t length = 0;
+    length += (size_t)sprintf(path + length, "/subdir");
+    memset(path + length, '/', 300);
+    length += 300;
+    sprintf(path + length, "file2.txt");
+    TEST_ASSERT_GREATER_THAN(256, strlen(path));
+
+    struct drofs_entry_t entry;
+    TEST_ASSERT_TRUE(drofs_get_entry(mock_test_data, mock_test_data_len, path, &entry));
+    TEST_ASSERT_EQUAL_STRING("file2.txt", entry.name);
+
+    // a missing component leaves the deepest entry resolved
+    TEST_ASSERT_FALSE(drofs_get_entry(mock_test_data, mock_test_data_len, "/subdir/missing.txt/file2.txt", &entry));
+    TEST_ASSERT_EQUAL_STRING("subdir", entry.name);
+}
+
+void when_resolving_child_of_file_or_empty_path_return_false(){
+    struct drofs_entry_t entry;
+    TEST_ASSERT_FALSE(drofs_get_entry(mock_test_data, mock_test_data_len, "/file1.txt/file2.txt", &entry));
+    TEST_ASSERT_TRUE(drofs_get_entry(mock_test_data, mock_test_data_len, "", &entry));
+    TEST_ASSERT_EQUAL(ENTRY_TYPE_DIRECTORY, entry.type);
+}
+
+static const char * batch_paths[] = {"/", "/file1.txt", "/long_file.txt", "/missing.txt", "/drofs2s.png", "/subfolder", "/subfolder/file2.txt", "/subfolder/missing.txt", "/missing/file2.txt", "//subfolder//file2.txt"};
+#define BATCH_PATHS_LENGTH (sizeof(batch_paths) / sizeof(batch_paths[0]))
+
+static void assert_batch_matches_single_lookups(const uint8_t * image, size_t image_length){
+    struct drofs_entry_t entries[BATCH_PATHS_LENGTH];
+    bool found[BATCH_PATHS_LENGTH];
+    size_t found_count = drofs_get_entries(image, image_length, batch_paths, BATCH_PATHS_LENGTH, entries, found);
+
+    size_t expected_found_count = 0;
+    for (size_t i = 0; i < BATCH_PATHS_LENGTH; i++){
+        struct drofs_entry_t entry;
+        bool expected_found = drofs_get_entry(image, image_length, batch_paths[i], &entry);
+        TEST_ASSERT_EQUAL_MESSAGE(expected_found, found[i], batch_paths[i]);
+        if (expected_found){
+            TEST_ASSERT_EQUAL_MESSAGE(entry.offset, entries[i].offset, batch_paths[i]);
+            expected_found_count++;
+        }
+    }
+    TEST_ASSERT_EQUAL(7, expected_found_count);
+    TEST_ASSERT_EQUAL(expected_found_count, found_count);
+    TEST_ASSERT_EQUAL(found_count, drofs_get_entries(image, image_length, batch_paths, BATCH_PATHS_LENGTH, entries, NULL));
+}
+
+void when_resolving_batch_of_paths_return_same_entries_as_single_lookups(){
+    assert_batch_matches_single_lookups(mock_test_merkle_data, mock_test_merkle_data_len);
+    assert_batch_matches_single_lookups(mock_test_indexed_data, mock_test_indexed_data_len);
+    assert_batch_matches_single_lookups(mock_test_lz4_data, mock_test_lz4_data_len);
+}
+
+void when_reading_entry_ranges_return_spans_of_original_data(){
+    const uint8_t * images[] = {mock_test_data, mock_test_compressed_data, mock_test_window_data, mock_test_split_data, mock_test_lz4_data};
+    size_t images_length[] = {mock_test_data_len, mock_test_compressed_data_len, mock_test_window_data_len, mock_test_split_data_len, mock_test_lz4_data_len};
+    const char * paths[] = {"/file1.txt", "/long_file.txt", "/drofs2s.png"};
+
+    for (size_t i = 0; i < sizeof(images) / sizeof(images[0]); i++){
+        for (size_t j = 0; j < sizeof(paths) / sizeof(paths[0]); j++){
+            struct drofs_entry_t entry;
+            if (!drofs_get_entry(images[i], images_length[i], paths[j], &entry)){
+                continue; // mock_test_data has no image
+            }
+            size_t original_length;
+            uint8_t * original = read_original_data(images[i], images_length[i], paths[j], &original_length);
+            drofs_decompression_context_t * ctx = drofs_decompress_create(entry.data, entry.data_length);
+
+            size_t ranges[][2] = {{0, 0}, {0, 10}, {7, 1000}, {1000, 333}, {original_length - 5, 50}, {original_length + 5, 10}};
+            for (size_t k = 0; k < sizeof(ranges) / sizeof(ranges[0]); k++){
+                size_t offset = ranges[k][0];
+                size_t expected_length = offset >= original_length ? 0 : original_length - offset;
+                expected_length = ranges[k][1] < expected_length ? ranges[k][1] : expected_length;
+
+                uint8_t buffer[1000];
+                size_t length = ranges[k][1];
+                TEST_ASSERT_EQUAL(TINFL_STATUS_DONE, drofs_decompress_entry_range(ctx, &entry, offset, buffer, &length));
+                TEST_ASSERT_EQUAL(expected_length, length);
+                if (length > 0){
+                    TEST_ASSERT_EQUAL_MEMORY(original + offset, buffer, length);
+                }
+
+                // stored data is read in place
+                length = ranges[k][1];
+                const uint8_t * range = drofs_get_entry_range(&entry, offset, &length);
+                if (entry.flags & COMPRESSED){
+                    TEST_ASSERT_NULL(range);
+                }else{
+                    TEST_ASSERT_TRUE(range == entry.data + (offset < entry.data_length ? offset : entry.data_length));
+                    TEST_ASSERT_EQUAL(expected_length, length);
+                }
+            }
+
+            drofs_decompress_free(ctx);
+            free(original);
+        }
+    }
+
+    struct drofs_entry_t entry;
+    TEST_ASSERT_TRUE(drofs_get_entry(mock_test_compressed_data, mock_test_compressed_data_len, "/drofs2s.png", &entry));
+    uint8_t buffer[16];
+    size_t length = sizeof(buffer);
+    TEST_ASSERT_EQUAL(TINFL_STATUS_BAD_PARAM, drofs_decompress_entry_range(NULL, &entry, 0, buffer, &length));
+    TEST_ASSERT_EQUAL(0, length);
+}
+
+#ifdef DROFS_TEST_THREADS
+#define STRESS_THREADS 8
+#define STRESS_ITERATIONS 500
+
+struct path_stress_image_t{
+    const uint8_t * data;
+    size_t data_length;
+    uint32_t offsets[BATCH_PATHS_LENGTH];
+    bool found[BATCH_PATHS_LENGTH];
+};
+
+static struct path_stress_image_t stress_images[3];
+
+static void * resolve_paths_concurrently(void * argument){
+    size_t * mismatches = (size_t *)argument;
+    for (size_t iteration = 0; iteration < STRESS_ITERATIONS; iteration++){
+        for (size_t image = 0; image < sizeof(stress_images) / sizeof(stress_images[0]); image++){
+            struct path_stress_image_t * expected = &stress_images[image];
+            for (size_t i = 0; i < BATCH_PATHS_LENGTH; i++){
+                struct drofs_entry_t entry;
+                bool found = drofs_get_entry(expected->data, expected->data_length, batch_paths[i], &entry);
+                if (found != expected->found[i] || (found && entry.offset != expected->offsets[i])){
+                    (*mismatches)++;
+                }
+            }
+
+            struct drofs_entry_t entries[BATCH_PATHS_LENGTH];
+            bool found[BATCH_PATHS_LENGTH];
+            drofs_get_entries(expected->data, expected->data_length, batch_paths, BATCH_PATHS_LENGTH, entries, found);
+            for (size_t i = 0; i < BATCH_PATHS_LENGTH; i++){
+                if (found[i] != expected->found[i] || (found[i] && entries[i].offset != expected->offsets[i])){
+                    (*mismatches)++;
+                }
+            }
+        }
+    }
+    return NULL;
+}
+
+void when_resolving_paths_from_several_threads_return_same_entries(){
+    const uint8_t * images[] = {mock_test_merkle_data, mock_test_indexed_data, mock_test_lz4_data};
+    size_t images_length[] = {mock_test_merkle_data_len, mock_test_indexed_data_len, mock_test_lz4_data_len};
+    for (size_t image = 0; image < sizeof(images) / sizeof(images[0]); image++){
+        stress_images[image].data = images[image];
+        stress_images[image].data_length = images_length[image];
+        for (size_t i = 0; i < BATCH_PATHS_LENGTH; i++){
+            struct drofs_entry_t entry;
+            stress_images[image].found[i] = drofs_get_entry(images[image], images_length[image], batch_paths[i], &entry);
+            stress_images[image].offsets[i] = entry.offset;
+        }
+    }
+
+    pthread_t threads[STRESS_THREADS];
+    size_t mismatches[STRESS_THREADS] = {0};
+    for (size_t i = 0; i < STRESS_THREADS; i++){
+        TEST_ASSERT_EQUAL(0, pthread_create(&threads[i], NULL, resolve_paths_concurrently, &mismatches[i]));
+    }
+    for (size_t i = 0; i < STRESS_THREADS; i++){
+        TEST_ASSERT_EQUAL(0, pthread_join(threads[i], NULL));
+        TEST_ASSERT_EQUAL(0, mismatches[i]);
+    }
+}
+#endif
+
 int main(void) {
     UNITY_BEGIN(); // Start Unity test framework
     RUN_TEST(when_verifying_valid_data_return_true);
     RUN_TEST(when_verifying_bad_header_return_false);
     RUN_TEST(when_verifying_bad_crc_return_false);
+    RUN_TEST(when_verifying_in_slices_return_same_result_as_verify);
+    RUN_TEST(when_verifying_in_slices_with_bad_header_fail);
+    RUN_TEST(when_ending_incomplete_verification_fail);
     RUN_TEST(when_parsing_root_return_root_directory);
     RUN_TEST(when_reading_file1_txt_verify_contents);
     RUN_TEST(when_reading_file2_txt_verify_contents);
@@ -246,7 +1332,45 @@ int main(void) {
     RUN_TEST(verify_mock_test_uncompressed_crc32);
     RUN_TEST(when_uncompressing_data_crc32_should_be_equal_to_uncompressed_crc32);
     RUN_TEST(when_uncompressing_data_in_chunks_validate_output);
+    RUN_TEST(when_uncompressing_data_in_small_chunks_report_done_after_last_chunk);
     RUN_TEST(when_reading_file2_txt_verify_contents_using_original_crc32);
+    RUN_TEST(when_hashing_paths_ignore_redundant_separators);
+    RUN_TEST(when_reading_cached_entries_return_same_entries_as_uncached);
+    RUN_TEST(when_reading_missing_cached_entry_return_false);
+    RUN_TEST(when_cache_is_full_evict_least_recently_used);
+    RUN_TEST(when_cached_path_hashes_collide_do_not_return_other_entry);
+    RUN_TEST(when_cache_is_used_with_another_image_clear_it);
+    RUN_TEST(when_reading_indexed_image_resolve_every_path);
+    RUN_TEST(when_reading_missing_entry_from_indexed_image_return_false);
+    RUN_TEST(when_reading_cached_entries_from_indexed_image_use_index_on_miss);
+    RUN_TEST(when_resetting_decompression_context_decompress_again);
+    RUN_TEST(when_decompressing_with_static_context_buffer_validate_crc32);
+    RUN_TEST(when_decompressing_entry_to_buffer_verify_original_crc32);
+    RUN_TEST(when_decompressing_stored_entry_to_buffer_copy_data);
+    RUN_TEST(when_reading_window_bits_return_image_and_stream_windows);
+    RUN_TEST(when_decompressing_reduced_window_entries_validate_original_crc32);
+    RUN_TEST(when_stream_window_exceeds_context_window_fail);
+    RUN_TEST(when_decompressing_lz4_entries_validate_original_crc32);
+    RUN_TEST(when_decompressing_invalid_lz4_entries_fail);
+    RUN_TEST(when_reading_split_image_resolve_every_path_to_payload_region);
+    RUN_TEST(when_decompressing_split_image_entry_verify_original_crc32);
+    RUN_TEST(when_reading_verified_entries_check_only_the_path);
+    RUN_TEST(when_verified_entry_is_corrupted_fail_only_its_path);
+    RUN_TEST(when_reading_files_through_handles_return_original_data);
+    RUN_TEST(when_seeking_in_file_handles_read_from_new_position);
+    RUN_TEST(when_reading_corrupted_file_handle_with_crc32_check_fail);
+    RUN_TEST(when_file_handle_pool_is_exhausted_fail_open);
+    RUN_TEST(when_loading_entries_through_payload_cache_serve_repeated_reads_from_arena);
+    RUN_TEST(when_payload_cache_is_full_evict_least_recently_used);
+    RUN_TEST(when_loading_corrupted_entry_into_payload_cache_fail);
+    RUN_TEST(when_reading_file_handles_with_payload_cache_return_original_data);
+    RUN_TEST(when_resolving_path_longer_than_256_characters_find_entry);
+    RUN_TEST(when_resolving_child_of_file_or_empty_path_return_false);
+    RUN_TEST(when_resolving_batch_of_paths_return_same_entries_as_single_lookups);
+    RUN_TEST(when_reading_entry_ranges_return_spans_of_original_data);
+#ifdef DROFS_TEST_THREADS
+    RUN_TEST(when_resolving_paths_from_several_threads_return_same_entries);
+#endif
     return UNITY_END(); // End Unity test framework
 }
 
@@ -0,0 +1,549 @@
+#include "unity.h"
+#include <drofs.h>
+#include <crc32.h>
+#include <miniz.h>
+#include "drofs_compression_helper.h"
+#include "drofs_cache_helper.h"
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+// Results are written as JSON to the file named by DROFS_BENCHMARK_OUTPUT, by default to drofs_benchmark.json
+// next to the test program in the env's build directory, or to stdout where files cannot be written.
+// An existing image is benchmarked as well when DROFS_BENCHMARK_IMAGE names it.
+
+// Every measurement is repeated until it took at least this long
+#ifndef BENCHMARK_MIN_SECONDS
+#define BENCHMARK_MIN_SECONDS 0.2
+#endif
+
+// Payload verified, hashed and inflated, small enough for targets without PSRAM
+#ifndef BENCHMARK_PAYLOAD_LENGTH
+#define BENCHMARK_PAYLOAD_LENGTH (256 * 1024)
+#endif
+
+// Bytes of data per generated file
+#ifndef BENCHMARK_FILE_LENGTH
+#define BENCHMARK_FILE_LENGTH 16
+#endif
+
+// Generated tree shapes, every directory has width children and the files are at the given depth
+#ifndef BENCHMARK_SHAPES
+#define BENCHMARK_SHAPES {{8, 1}, {64, 1}, {256, 1}, {8, 2}, {8, 3}, {4, 6}}
+#endif
+
+// Chunk sizes drofs_decompress_chunk is benchmarked with
+#ifndef BENCHMARK_CHUNK_SIZES
+#define BENCHMARK_CHUNK_SIZES {64, 256, 1024, 4096, 16384}
+#endif
+
+// "DROFS" signature and image CRC32, entry offsets are relative to the first entry
+#define IMAGE_HEADER_SIZE 9
+#define MAX_PATH_LENGTH 256
+
+struct benchmark_shape_t {
+    size_t width;
+    size_t depth;
+};
+
+struct image_builder_t {
+    uint8_t * data;
+    size_t length;
+    size_t capacity;
+};
+
+static FILE * output = NULL;
+static bool first_section = true;
+static uint8_t * payload = NULL;
+
+static void builder_append(struct image_builder_t * builder, const void * data, size_t length){
+    if (length == 0){
+        return;
+    }
+    if (builder->length + length > builder->capacity){
+        builder->capacity = (builder->length + length) * 2;
+        builder->data = realloc(builder->data, builder->capacity);
+        TEST_ASSERT_NOT_NULL(builder->data);
+    }
+    memcpy(builder->data + builder->length, data, length);
+    builder->length += length;
+}
+
+static void builder_append_uint32(struct image_builder_t * builder, uint32_t value){
+    builder_append(builder, &value, sizeof(value));
+}
+
+// Writes an entry record without metadata, returns the offset of its children table
+static size_t builder_append_entry(struct image_builder_t * builder, enum drofs_entry_type type, const char * name,
+                                   const uint8_t * data, size_t data_length, size_t children_length){
+    uint8_t type_value = (uint8_t)type;
+    uint8_t name_length = (uint8_t)(strlen(name) + 1);
+    builder_append(builder, &type_value, 1);
+    builder_append(builder, &name_length, 1);
+    builder_append(builder, name, name_length);
+    builder_append_uint32(builder, (uint32_t)data_length);
+    crc32_context_t crc32_ctx;
+    crc32_init(&crc32_ctx);
+    crc32_update(&crc32_ctx, data, data_length);
+    builder_append_uint32(builder, crc32_get(&crc32_ctx));
+    builder_append(builder, data, data_length);
+    uint8_t flags_and_metadata[2] = {0, 0};
+    builder_append(builder, flags_and_metadata, sizeof(flags_and_metadata));
+    builder_append_uint32(builder, (uint32_t)children_length);
+    size_t children_table = builder->length;
+    for (size_t i = 0; i < children_length; i++){
+        builder_append_uint32(builder, 0);
+    }
+    return children_table;
+}
+
+static void builder_append_tree(struct image_builder_t * builder, const char * name, size_t width, size_t depth, size_t file_length){
+    if (depth == 0){
+        builder_append_entry(builder, ENTRY_TYPE_FILE, name, payload, file_length, 0);
+        return;
+    }
+    size_t children_table = builder_append_entry(builder, ENTRY_TYPE_DIRECTORY, name, NULL, 0, width);
+    for (size_t i = 0; i < width; i++){
+        uint32_t child_offset = (uint32_t)(builder->length - IMAGE_HEADER_SIZE);
+        memcpy(builder->data + children_table + i * sizeof(uint32_t), &child_offset, sizeof(child_offset));
+        char child_name[16];
+        snprintf(child_name, sizeof(child_name), "%c%zu", depth == 1 ? 'f' : 'd', i);
+        builder_append_tree(builder, child_name, width, depth - 1, file_length);
+    }
+}
+
+// Builds an uncompressed image of a full tree, the caller frees the returned data
+static uint8_t * build_image(size_t width, size_t depth, size_t file_length, size_t * image_length){
+    struct image_builder_t builder = {NULL, 0, 0};
+    builder_append(&builder, "DROFS", 5);
+    builder_append_uint32(&builder, 0);
+    builder_append_tree(&builder, "", width, depth, file_length);
+
+    crc32_context_t crc32_ctx;
+    crc32_init(&crc32_ctx);
+    crc32_update(&crc32_ctx, builder.data + IMAGE_HEADER_SIZE, builder.length - IMAGE_HEADER_SIZE);
+    uint32_t image_crc32 = crc32_get(&crc32_ctx);
+    memcpy(builder.data + 5, &image_crc32, sizeof(image_crc32));
+
+    *image_length = builder.length;
+    return builder.data;
+}
+
+static double elapsed_seconds(clock_t start){
+    return (double)(clock() - start) / CLOCKS_PER_SEC;
+}
+
+static double megabytes_per_second(size_t bytes, size_t iterations, double seconds){
+    return seconds > 0 ? (double)bytes * iterations / (1024.0 * 1024.0) / seconds : 0.0;
+}
+
+static void json_section(const char * name){
+    fprintf(output, "%s\n  \"%s\": ", first_section ? "" : ",", name);
+    first_section = false;
+}
+
+// Collects the path of every file in the tree below entry, depth first
+// Opens DROFS_BENCHMARK_OUTPUT, or drofs_benchmark.json in the directory of the program, NULL if neither can be written
+static FILE * open_output(const char * program_path){
+    const char * output_path = getenv("DROFS_BENCHMARK_OUTPUT");
+    if (output_path != NULL){
+        return fopen(output_path, "w");
+    }
+
+    const char * separator = NULL;
+    for (const char * c = program_path; c != NULL && *c != '\0'; c++){
+        if (*c == '/' || *c == '\\'){
+            separator = c;
+        }
+    }
+    if (separator == NULL){
+        return NULL;
+    }
+    static const char output_name[] = "drofs_benchmark.json";
+    size_t directory_length = (size_t)(separator - program_path) + 1;
+    char * default_path = malloc(directory_length + sizeof(output_name));
+    memcpy(default_path, program_path, directory_length);
+    memcpy(default_path + directory_length, output_name, sizeof(output_name));
+    FILE * f = fopen(default_path, "w");
+    free(default_path);
+    return f;
+}
+
+static size_t collect_file_paths(const uint8_t * data, size_t data_length, struct drofs_entry_t * entry, const char * path,
+                                 char (* paths)[MAX_PATH_LENGTH], size_t paths_length, size_t count, size_t * max_width){
+    if (entry->children_length > *max_width){
+        *max_width = entry->children_length;
+    }
+    for (size_t i = 0; i < entry->children_length && count < paths_length; i++){
+        struct drofs_entry_t child;
+        TEST_ASSERT_TRUE(drofs_get_nth_child(data, data_length, i, entry, &child));
+        char child_path[MAX_PATH_LENGTH];
+        snprintf(child_path, sizeof(child_path), "%s/%s", path, child.name);
+        if (child.type == ENTRY_TYPE_FILE){
+            memcpy(paths[count++], child_path, MAX_PATH_LENGTH);
+        } else {
+            count = collect_file_paths(data, data_length, &child, child_path, paths, paths_length, count, max_width);
+        }
+    }
+    return count;
+}
+
+static size_t path_depth(const char * path){
+    size_t depth = 0;
+    for (; *path != '\0'; path++){
+        depth += *path == '/';
+    }
+    return depth;
+}
+
+// Looks up every file of the image, reports the mean latency per file depth
+static void benchmark_image_lookups(const char * source, const uint8_t * data, size_t data_length){
+    // Bounded so images of any size are sampled with a fixed amount of memory
+    const size_t max_paths = 4096;
+    char (* paths)[MAX_PATH_LENGTH] = malloc(max_paths * MAX_PATH_LENGTH);
+    TEST_ASSERT_NOT_NULL(paths);
+
+    struct drofs_entry_t root;
+    TEST_ASSERT_TRUE(drofs_get_entry(data, data_length, "/", &root));
+    size_t max_width = 0;
+    size_t paths_length = collect_file_paths(data, data_length, &root, "", paths, max_paths, 0, &max_width);
+    TEST_ASSERT_TRUE(paths_length > 0);
+
+    size_t max_depth = 0;
+    for (size_t i = 0; i < paths_length; i++){
+        size_t depth = path_depth(paths[i]);
+        max_depth = depth > max_depth ? depth : max_depth;
+    }
+
+    for (size_t depth = 1; depth <= max_depth; depth++){
+        size_t lookups = 0;
+        clock_t start = clock();
+        do {
+            for (size_t i = 0; i < paths_length; i++){
+                if (path_depth(paths[i]) != depth){
+                    continue;
+                }
+                struct drofs_entry_t entry;
+                TEST_ASSERT_TRUE(drofs_get_entry(data, data_length, paths[i], &entry));
+                lookups++;
+            }
+        } while (lookups > 0 && elapsed_seconds(start) < BENCHMARK_MIN_SECONDS);
+        double seconds = elapsed_seconds(start);
+        if (lookups == 0){
+            continue;
+        }
+
+        static bool first_lookup = true;
+        fprintf(output, "%s\n    {\"source\": \"%s\", \"max_width\": %zu, \"depth\": %zu, \"files\": %zu, \"lookups\": %zu, \"ns_per_lookup\": %.1f}",
+                first_lookup ? "" : ",", source, max_width, depth, paths_length, lookups, seconds * 1e9 / lookups);
+        first_lookup = false;
+        printf("get_entry %-16s width %4zu depth %2zu %10.1f ns\n", source, max_width, depth, seconds * 1e9 / lookups);
+    }
+    free(paths);
+}
+
+void setUp(void) {}
+
+void tearDown(void) {}
+
+void benchmark_get_entry_by_depth_and_width(){
+    struct benchmark_shape_t shapes[] = BENCHMARK_SHAPES;
+
+    json_section("get_entry");
+    fprintf(output, "[");
+    for (size_t i = 0; i < sizeof(shapes) / sizeof(shapes[0]); i++){
+        size_t image_length;
+        uint8_t * image = build_image(shapes[i].width, shapes[i].depth, BENCHMARK_FILE_LENGTH, &image_length);
+        TEST_ASSERT_TRUE(drofs_verify(image, image_length));
+
+        char source[32];
+        snprintf(source, sizeof(source), "generated_%zux%zu", shapes[i].width, shapes[i].depth);
+        benchmark_image_lookups(source, image, image_length);
+        free(image);
+    }
+
+    const char * image_path = getenv("DROFS_BENCHMARK_IMAGE");
+    if (image_path != NULL){
+        FILE * f = fopen(image_path, "rb");
+        TEST_ASSERT_NOT_NULL_MESSAGE(f, image_path);
+        fseek(f, 0, SEEK_END);
+        size_t image_length = (size_t)ftell(f);
+        fseek(f, 0, SEEK_SET);
+        uint8_t * image = malloc(image_length);
+        TEST_ASSERT_NOT_NULL(image);
+        TEST_ASSERT_EQUAL(image_length, fread(image, 1, image_length, f));
+        fclose(f);
+
+        benchmark_image_lookups("loaded", image, image_length);
+        free(image);
+    }
+    fprintf(output, "\n  ]");
+}
+
+void benchmark_get_nth_child_iteration(){
+    struct benchmark_shape_t shapes[] = BENCHMARK_SHAPES;
+
+    json_section("get_nth_child");
+    fprintf(output, "[");
+    bool first_width = true;
+    for (size_t i = 0; i < sizeof(shapes) / sizeof(shapes[0]); i++){
+        if (shapes[i].depth != 1){
+            continue;
+        }
+        size_t image_length;
+        uint8_t * image = build_image(shapes[i].width, 1, BENCHMARK_FILE_LENGTH, &image_length);
+        struct drofs_entry_t root;
+        TEST_ASSERT_TRUE(drofs_get_entry(image, image_length, "/", &root));
+
+        size_t children = 0;
+        clock_t start = clock();
+        do {
+            for (size_t nth = 0; nth < root.children_length; nth++){
+                struct drofs_entry_t child;
+                TEST_ASSERT_TRUE(drofs_get_nth_child(image, image_length, nth, &root, &child));
+                children++;
+            }
+        } while (elapsed_seconds(start) < BENCHMARK_MIN_SECONDS);
+        double seconds = elapsed_seconds(start);
+        free(image);
+
+        fprintf(output, "%s\n    {\"width\": %zu, \"children\": %zu, \"children_per_second\": %.0f}",
+                first_width ? "" : ",", shapes[i].width, children, children / seconds);
+        first_width = false;
+        printf("get_nth_child width %4zu %14.0f children/s\n", shapes[i].width, children / seconds);
+    }
+    fprintf(output, "\n  ]");
+}
+
+void benchmark_verify_and_crc32(){
+    // One directory of files holding the whole payload
+    size_t files = BENCHMARK_PAYLOAD_LENGTH / 4096;
+    size_t image_length;
+    uint8_t * image = build_image(files, 1, 4096, &image_length);
+
+    size_t iterations = 0;
+    clock_t start = clock();
+    do {
+        TEST_ASSERT_TRUE(drofs_verify(image, image_length));
+        iterations++;
+    } while (elapsed_seconds(start) < BENCHMARK_MIN_SECONDS);
+    double verify_mbps = megabytes_per_second(image_length, iterations, elapsed_seconds(start));
+
+    iterations = 0;
+    crc32_context_t crc32_ctx;
+    crc32_init(&crc32_ctx);
+    start = clock();
+    do {
+        crc32_update(&crc32_ctx, payload, BENCHMARK_PAYLOAD_LENGTH);
+        iterations++;
+    } while (elapsed_seconds(start) < BENCHMARK_MIN_SECONDS);
+    double crc32_mbps = megabytes_per_second(BENCHMARK_PAYLOAD_LENGTH, iterations, elapsed_seconds(start));
+    free(image);
+
+    json_section("verify");
+    fprintf(output, "{\"bytes\": %zu, \"mb_per_second\": %.2f}", image_length, verify_mbps);
+    json_section("crc32_update");
+    fprintf(output, "{\"bytes\": %d, \"mb_per_second\": %.2f}", BENCHMARK_PAYLOAD_LENGTH, crc32_mbps);
+    printf("drofs_verify %10.2f MB/s\ncrc32_update %10.2f MB/s\n", verify_mbps, crc32_mbps);
+}
+
+static uint8_t * lz4_write_length(uint8_t * out, size_t length){
+    for (; length >= 255; length -= 255){
+        *out++ = 255;
+    }
+    *out++ = (uint8_t)length;
+    return out;
+}
+
+static uint8_t * lz4_write_sequence(uint8_t * out, const uint8_t * literals, size_t literals_length, size_t offset, size_t match_length){
+    match_length -= 4;
+    *out++ = (uint8_t)(((literals_length < 15 ? literals_length : 15) << 4) | (offset == 0 ? 0 : match_length < 15 ? match_length : 15));
+    if (literals_length >= 15){
+        out = lz4_write_length(out, literals_length - 15);
+    }
+    memcpy(out, literals, literals_length);
+    out += literals_length;
+    if (offset != 0){
+        *out++ = (uint8_t)offset;
+        *out++ = (uint8_t)(offset >> 8);
+        if (match_length >= 15){
+            out = lz4_write_length(out, match_length - 15);
+        }
+    }
+    return out;
+}
+
+// A minimal greedy LZ4 block encoder, the library only decodes LZ4, images are encoded by drofs_cli.py
+static size_t lz4_compress(const uint8_t * input, size_t input_length, uint8_t * output, size_t max_offset){
+    static uint32_t table[1 << 12]; // Position + 1 of the last sequence of each hash
+    memset(table, 0, sizeof(table));
+    uint8_t * out = output;
+    size_t anchor = 0;
+    size_t position = 0;
+    while (position + 12 <= input_length){
+        uint32_t sequence;
+        memcpy(&sequence, input + position, sizeof(sequence));
+        uint32_t hash = (sequence * 2654435761u) >> 20;
+        size_t candidate = table[hash];
+        table[hash] = (uint32_t)position + 1;
+        if (candidate == 0 || position - (candidate - 1) > max_offset || memcmp(input + candidate - 1, input + position, 4) != 0){
+            position++;
+            continue;
+        }
+        candidate--;
+        size_t length = 4;
+        while (position + length < input_length - 5 && input[candidate + length] == input[position + length]){
+            length++;
+        }
+        out = lz4_write_sequence(out, input + anchor, position - anchor, position - candidate, length);
+        position += length;
+        anchor = position;
+    }
+    out = lz4_write_sequence(out, input + anchor, input_length - anchor, 0, 4);
+    return (size_t)(out - output);
+}
+
+void benchmark_decompress_chunk_by_chunk_size(){
+    size_t chunk_sizes[] = BENCHMARK_CHUNK_SIZES;
+    const char * codecs[] = {"zlib", "lz4"};
+
+    struct drofs_entry_t entries[2] = {{.flags = COMPRESSED}, {.flags = COMPRESSED | LZ4}};
+    int flags = (int)tdefl_create_comp_flags_from_zip_params(6, DROFS_MAX_WINDOW_BITS, MZ_DEFAULT_STRATEGY);
+    entries[0].data = tdefl_compress_mem_to_heap(payload, BENCHMARK_PAYLOAD_LENGTH, &entries[0].data_length, flags);
+    TEST_ASSERT_NOT_NULL(entries[0].data);
+    uint8_t * lz4_compressed = malloc(BENCHMARK_PAYLOAD_LENGTH + BENCHMARK_PAYLOAD_LENGTH / 255 + 16);
+    entries[1].data = lz4_compressed;
+    entries[1].data_length = lz4_compress(payload, BENCHMARK_PAYLOAD_LENGTH, lz4_compressed, (size_t)1 << DROFS_MAX_WINDOW_BITS);
+    uint8_t * chunk = malloc(chunk_sizes[sizeof(chunk_sizes) / sizeof(chunk_sizes[0]) - 1]);
+    drofs_decompression_context_t * ctx = drofs_decompress_create(NULL, 0);
+    TEST_ASSERT_NOT_NULL(ctx);
+
+    json_section("decompress_chunk");
+    fprintf(output, "[");
+    for (size_t codec = 0; codec < sizeof(codecs) / sizeof(codecs[0]); codec++){
+        for (size_t i = 0; i < sizeof(chunk_sizes) / sizeof(chunk_sizes[0]); i++){
+            size_t iterations = 0;
+            clock_t start = clock();
+            do {
+                drofs_decompress_reset_entry(ctx, &entries[codec]);
+                size_t decompressed = 0;
+                tinfl_status status;
+                do {
+                    size_t chunk_length = chunk_sizes[i];
+                    status = drofs_decompress_chunk(ctx, chunk, &chunk_length);
+                    TEST_ASSERT_TRUE(status >= 0);
+                    decompressed += chunk_length;
+                } while (status == TINFL_STATUS_HAS_MORE_OUTPUT);
+                TEST_ASSERT_EQUAL(BENCHMARK_PAYLOAD_LENGTH, decompressed);
+                iterations++;
+            } while (elapsed_seconds(start) < BENCHMARK_MIN_SECONDS);
+            double mbps = megabytes_per_second(BENCHMARK_PAYLOAD_LENGTH, iterations, elapsed_seconds(start));
+
+            fprintf(output, "%s\n    {\"codec\": \"%s\", \"chunk_size\": %zu, \"compressed_bytes\": %zu, \"original_bytes\": %d, \"mb_per_second\": %.2f}",
+                    codec == 0 && i == 0 ? "" : ",", codecs[codec], chunk_sizes[i], entries[codec].data_length, BENCHMARK_PAYLOAD_LENGTH, mbps);
+            printf("decompress_chunk %-4s %6zu bytes %10.2f MB/s\n", codecs[codec], chunk_sizes[i], mbps);
+        }
+    }
+    fprintf(output, "\n  ]");
+
+    drofs_decompress_free(ctx);
+    free(chunk);
+    free(lz4_compressed);
+    mz_free((void *)entries[0].data);
+}
+
+void benchmark_payload_cache_load(){
+    const char * codecs[] = {"zlib", "lz4"};
+
+    // ORIGINAL_SIZE metadata, the cache sizes the decompressed data from it
+    uint8_t metadata[] = {METADATA_TYPE_ORIGINAL_SIZE, sizeof(uint32_t), 0, 0, 0, 0, 0};
+    uint32_t original_size = BENCHMARK_PAYLOAD_LENGTH;
+    memcpy(metadata + 3, &original_size, sizeof(original_size));
+    struct drofs_entry_t entries[2] = {
+        {.flags = COMPRESSED, .metadata_length = 1, .metadata_start_ptr = metadata},
+        {.flags = COMPRESSED | LZ4, .metadata_length = 1, .metadata_start_ptr = metadata, .offset = 1}
+    };
+    int flags = (int)tdefl_create_comp_flags_from_zip_params(6, DROFS_MAX_WINDOW_BITS, MZ_DEFAULT_STRATEGY);
+    entries[0].data = tdefl_compress_mem_to_heap(payload, BENCHMARK_PAYLOAD_LENGTH, &entries[0].data_length, flags);
+    TEST_ASSERT_NOT_NULL(entries[0].data);
+    uint8_t * lz4_compressed = malloc(BENCHMARK_PAYLOAD_LENGTH + BENCHMARK_PAYLOAD_LENGTH / 255 + 16);
+    entries[1].data = lz4_compressed;
+    entries[1].data_length = lz4_compress(payload, BENCHMARK_PAYLOAD_LENGTH, lz4_compressed, (size_t)1 << DROFS_MAX_WINDOW_BITS);
+    drofs_decompression_context_t * ctx = drofs_decompress_create(NULL, 0);
+    TEST_ASSERT_NOT_NULL(ctx);
+
+    uint8_t * arena = malloc(BENCHMARK_PAYLOAD_LENGTH);
+    struct drofs_payload_cache_slot_t slots[1];
+    struct drofs_payload_cache_t cache;
+    drofs_payload_cache_init(&cache, slots, 1, arena, BENCHMARK_PAYLOAD_LENGTH);
+
+    // A miss inflates the entry into the arena, a hit only looks it up, each followed by copying the data out as a read would
+    uint8_t * copy = malloc(BENCHMARK_PAYLOAD_LENGTH);
+    json_section("payload_cache_load");
+    fprintf(output, "[");
+    for (size_t codec = 0; codec < sizeof(codecs) / sizeof(codecs[0]); codec++){
+        for (int cached = 0; cached <= 1; cached++){
+            size_t iterations = 0;
+            clock_t start = clock();
+            do {
+                if (!cached){
+                    drofs_payload_cache_clear(&cache);
+                }
+                const uint8_t * data;
+                size_t length;
+                TEST_ASSERT_EQUAL(TINFL_STATUS_DONE, drofs_payload_cache_load(&cache, ctx, &entries[codec], &data, &length));
+                TEST_ASSERT_EQUAL(BENCHMARK_PAYLOAD_LENGTH, length);
+                memcpy(copy, data, length);
+                iterations++;
+            } while (elapsed_seconds(start) < BENCHMARK_MIN_SECONDS);
+            double mbps = megabytes_per_second(BENCHMARK_PAYLOAD_LENGTH, iterations, elapsed_seconds(start));
+
+            fprintf(output, "%s\n    {\"codec\": \"%s\", \"cached\": %s, \"original_bytes\": %d, \"mb_per_second\": %.2f}",
+                    codec == 0 && cached == 0 ? "" : ",", codecs[codec], cached ? "true" : "false", BENCHMARK_PAYLOAD_LENGTH, mbps);
+            printf("payload_cache_load %-4s %-6s %10.2f MB/s\n", codecs[codec], cached ? "hit" : "miss", mbps);
+        }
+    }
+    fprintf(output, "\n  ]");
+
+    free(copy);
+    free(arena);
+    drofs_decompress_free(ctx);
+    free(lz4_compressed);
+    mz_free((void *)entries[0].data);
+}
+
+int main(int argc, char ** argv) {
+    // Text-like payload, so inflate measures a realistic mix of literals and matches
+    payload = malloc(BENCHMARK_PAYLOAD_LENGTH);
+    srand(0);
+    for (size_t i = 0; i < BENCHMARK_PAYLOAD_LENGTH; i++){
+        payload[i] = (uint8_t)("drofs entry data offset crc32 "[rand() % 30]);
+    }
+
+    output = open_output(argc > 0 ? argv[0] : NULL);
+    if (output == NULL){
+        output = stdout;
+    }
+    fprintf(output, "{");
+
+    UNITY_BEGIN();
+    RUN_TEST(benchmark_get_entry_by_depth_and_width);
+    RUN_TEST(benchmark_get_nth_child_iteration);
+    RUN_TEST(benchmark_verify_and_crc32);
+    RUN_TEST(benchmark_decompress_chunk_by_chunk_size);
+    RUN_TEST(benchmark_payload_cache_load);
+    int result = UNITY_END();
+
+    fprintf(output, "\n}\n");
+    if (output != stdout){
+        fclose(output);
+    }
+    free(payload);
+    return result;
+}
+
+void app_main() {
+    main(0, NULL);
+}